@@ -0,0 +1,11 @@
+"""
+DB Manager 벤치마크 모음
+
+    python benchmarks/run_benchmarks.py --scale small
+    python benchmarks/run_benchmarks.py --scale medium --only load,pivot,diff
+
+- generators: 고정 시드 합성 데이터 (N파일 × M파라미터 덤프, K개 Check list, T대 출고 장비)
+- harness: 반복 측정 (백분위 시간, tracemalloc 최대 메모리), JSON 이력, 회귀 판정
+- suite: 측정 항목 (파일 로드, Pivot, 차이, Check list 검증, qc_inspection_v2,
+  출고 장비 일괄 임포트, Equipment Hierarchy 조회, 검색)
+"""
@@ -0,0 +1,241 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+시드가 같으면 항상 같은 파일 / 항목을 만들므로 실행 간 결과를 비교할 수 있습니다.
+
+- write_dump_files(): N개 파일 × M개 파라미터 DB 덤프 (Module\\tPart\\tItemName\\tItemType\\tItemValue\\tItemDescription)
+  첫 파일이 기준, 나머지 파일은 diff_rate 비율의 값이 다름
+- checklist_items(): qc_inspection_v2용 Phase 1.5 Check list K개 (범위 / 기대값)
+- checklist_patterns(): ChecklistService용 정규식 패턴 K개 (범위 검증 규칙)
+- write_shipped_fleet(): 출고 장비 T대 파일 ({Serial}_{Customer}_{Model}.txt)
+- BenchSchema / populate_hierarchy(): Model → Type → Configuration → Default DB 값 DB
+"""
+
+import json
+import os
+import random
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+DUMP_HEADER = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
+
+MODULES = ['PM1', 'PM2', 'PM3', 'PM4', 'TM', 'EFEM', 'LL1', 'LL2']
+PARTS = ['Heater', 'Chamber', 'Robot', 'Gas', 'Valve', 'Pump', 'RF', 'Chuck', 'Aligner', 'Door']
+ATTRIBUTES = ['Temp', 'Pressure', 'Flow', 'Speed', 'Offset', 'Gain', 'Limit', 'Delay', 'Mode', 'Enable']
+ITEM_TYPES = ['double', 'double', 'double', 'int', 'int', 'string', 'bool']
+MODES = ['AUTO', 'MANUAL', 'REMOTE', 'LOCAL']
+CUSTOMERS = ['Samsung', 'SK Hynix', 'Intel Hillsboro', 'TSMC', 'Micron']
+MODELS = ['NX-Mask', 'NX-Hybrid WLI', 'SX-100', 'AE-Integrated']
+
+DEFAULT_SEED = 20240601
+
+
+def parameter_table(parameters: int, seed: int = DEFAULT_SEED) -> List[Tuple[str, str, str, str, str]]:
+    """기준 파라미터 M개 [(Module, Part, ItemName, ItemType, 기준 값)]"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(parameters):
+        module = MODULES[i % len(MODULES)]
+        part = PARTS[(i // len(MODULES)) % len(PARTS)]
+        attribute = ATTRIBUTES[rng.randrange(len(ATTRIBUTES))]
+        item_type = ITEM_TYPES[rng.randrange(len(ITEM_TYPES))]
+        rows.append((module, part, f"{part}_{attribute}_{i:06d}", item_type, _value(rng, item_type)))
+    return rows
+
+
+def _value(rng: random.Random, item_type: str) -> str:
+    if item_type == 'double':
+        return f"{rng.uniform(0, 1000):.3f}"
+    if item_type == 'int':
+        return str(rng.randrange(0, 10000))
+    if item_type == 'bool':
+        return 'ON' if rng.random() < 0.5 else 'OFF'
+    return MODES[rng.randrange(len(MODES))]
+
+
+def _write_rows(path: str, rows) -> str:
+    with open(path, 'w', encoding='utf-8', newline='') as handle:
+        handle.write('\t'.join(DUMP_HEADER) + '\n')
+        handle.writelines(f"{module}\t{part}\t{name}\t{item_type}\t{value}\t{name} 설명\n"
+                          for module, part, name, item_type, value in rows)
+    return path
+
+
+def _varied(rows, rng: random.Random, diff_rate: float):
+    """기준 행에서 diff_rate 비율의 값만 바꾼 행"""
+    for module, part, name, item_type, value in rows:
+        if rng.random() < diff_rate:
+            value = _value(rng, item_type)
+        yield module, part, name, item_type, value
+
+
+def write_dump_files(directory: str, files: int, parameters: int, seed: int = DEFAULT_SEED,
+                     diff_rate: float = 0.02) -> List[str]:
+    """N개 파일 × M개 파라미터 덤프 → 경로 목록 (DUMP_000.txt ...)"""
+    os.makedirs(directory, exist_ok=True)
+    rows = parameter_table(parameters, seed)
+    rng = random.Random(seed + 1)
+    paths = []
+    for f in range(files):
+        file_rows = rows if f == 0 else _varied(rows, rng, diff_rate)
+        paths.append(_write_rows(os.path.join(directory, f"DUMP_{f:03d}.txt"), file_rows))
+    return paths
+
+
+def checklist_items(parameters: int, count: int, seed: int = DEFAULT_SEED):
+    """
+    qc_inspection_v2용 Check list K개 (ChecklistItem)
+
+    숫자 파라미터는 기준 값 ±10% 범위, 나머지는 기준 값을 기대값으로 사용합니다.
+    """
+    from app.qc.qc_inspection_v2 import ChecklistItem
+
+    rows = parameter_table(parameters, seed)
+    rng = random.Random(seed + 2)
+    picked = sorted(rng.sample(range(len(rows)), min(count, len(rows))))
+    items = []
+    for item_id, index in enumerate(picked, 1):
+        _, part, name, item_type, value = rows[index]
+        spec_min = spec_max = expected = None
+        if item_type in ('double', 'int'):
+            number = float(value)
+            spec_min, spec_max = f"{number * 0.9:.3f}", f"{number * 1.1:.3f}"
+        else:
+            expected = value
+        items.append(ChecklistItem(item_id, name, spec_min, spec_max, expected, part, None, True))
+    return items
+
+
+def checklist_patterns(count: int, seed: int = DEFAULT_SEED) -> List[Dict[str, str]]:
+    """
+    ChecklistService용 Check list K개 (정규식 parameter_pattern + 범위 검증 규칙)
+
+    패턴은 '{Part}_{Attribute}_...{끝자리 숫자}' 형태라 파라미터 일부에만 매칭됩니다.
+    """
+    rng = random.Random(seed + 3)
+    severities = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
+    patterns = []
+    for i in range(count):
+        part = PARTS[i % len(PARTS)]
+        attribute = ATTRIBUTES[(i // len(PARTS)) % len(ATTRIBUTES)]
+        suffix = i % 7
+        low = rng.uniform(0, 400)
+        patterns.append({
+            'item_name': f"CHK_{i:05d}",
+            'parameter_pattern': f"^{part}_{attribute}_\\d*{suffix}$",
+            'severity_level': severities[i % len(severities)],
+            'validation_rule': json.dumps({'type': 'range', 'min': round(low, 3), 'max': round(low + 500, 3)}),
+        })
+    return patterns
+
+
+def write_shipped_fleet(directory: str, tools: int, parameters: int, seed: int = DEFAULT_SEED,
+                        diff_rate: float = 0.01) -> List[str]:
+    """출고 장비 T대 파일 ({Serial}_{Customer}_{Model}.txt) → 경로 목록"""
+    os.makedirs(directory, exist_ok=True)
+    rows = parameter_table(parameters, seed)
+    rng = random.Random(seed + 4)
+    paths = []
+    for t in range(tools):
+        customer = CUSTOMERS[t % len(CUSTOMERS)]
+        model = MODELS[t % len(MODELS)]
+        name = f"D{27000 + t:05d}-{t % 28 + 1:02d}1124_{customer}_{model}.txt"
+        paths.append(_write_rows(os.path.join(directory, name), _varied(rows, rng, diff_rate)))
+    return paths
+
+
+# ==================== Phase 1.5 DB ====================
+
+class _Row(sqlite3.Row):
+    """인덱스 / 컬럼명 / get() 접근을 모두 지원하는 행"""
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys() else default
+
+
+class BenchSchema:
+    """
+    벤치마크용 Phase 1.5 스키마 (계층 / Default DB / 출고 장비 테이블)
+
+    DBSchema와 같은 get_connection() 인터페이스만 제공합니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS Equipment_Models (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_name TEXT NOT NULL UNIQUE,
+                    model_code TEXT, description TEXT, display_order INTEGER DEFAULT 999,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE IF NOT EXISTS Equipment_Types (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_id INTEGER NOT NULL, type_name TEXT NOT NULL,
+                    description TEXT, is_default INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE IF NOT EXISTS Equipment_Configurations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER NOT NULL, equipment_type_id INTEGER,
+                    configuration_name TEXT NOT NULL, port_count INTEGER, wafer_count INTEGER,
+                    custom_options TEXT, is_customer_specific INTEGER DEFAULT 0, customer_name TEXT,
+                    description TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE IF NOT EXISTS Default_DB_Values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER,
+                    parameter_name TEXT NOT NULL, default_value TEXT NOT NULL, is_type_common INTEGER DEFAULT 0,
+                    notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE IF NOT EXISTS Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER NOT NULL,
+                    configuration_id INTEGER NOT NULL, serial_number TEXT NOT NULL UNIQUE,
+                    customer_name TEXT NOT NULL, ship_date DATE, is_refit INTEGER DEFAULT 0,
+                    original_serial_number TEXT, notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE IF NOT EXISTS Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER NOT NULL,
+                    parameter_name TEXT NOT NULL, parameter_value TEXT NOT NULL,
+                    module TEXT, part TEXT, data_type TEXT,
+                    UNIQUE (shipped_equipment_id, parameter_name));
+                CREATE INDEX IF NOT EXISTS idx_shipped_params_equipment
+                    ON Shipped_Equipment_Parameters(shipped_equipment_id);
+            """)
+
+    @contextmanager
+    def get_connection(self, conn_override=None):
+        if conn_override is not None:
+            yield conn_override
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = _Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def populate_hierarchy(db_schema, models: int, types: int, configurations: int, values: int,
+                       seed: int = DEFAULT_SEED) -> List[int]:
+    """Model → Type → Configuration 계층 + Configuration별 Default DB 값 → Configuration ID 목록"""
+    rows = parameter_table(values, seed)
+    config_ids = []
+    with db_schema.get_connection() as conn:
+        for m in range(models):
+            model_id = conn.execute(
+                "INSERT INTO Equipment_Models (model_name, display_order) VALUES (?, ?)",
+                (f"MODEL_{m:03d}", models - m)).lastrowid
+            for t in range(types):
+                type_id = conn.execute(
+                    "INSERT INTO Equipment_Types (model_id, type_name, is_default) VALUES (?, ?, ?)",
+                    (model_id, f"TYPE_{t:02d}", int(t == 0))).lastrowid
+                for c in range(configurations):
+                    config_id = conn.execute(
+                        "INSERT INTO Equipment_Configurations (type_id, equipment_type_id, configuration_name, "
+                        "port_count, wafer_count, customer_name) VALUES (?, ?, ?, ?, ?, ?)",
+                        (type_id, type_id, f"CFG_{c:02d}", c % 4 + 1, 25,
+                         CUSTOMERS[c % len(CUSTOMERS)] if c % 3 == 0 else None)).lastrowid
+                    conn.executemany(
+                        "INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value, "
+                        "is_type_common) VALUES (?, ?, ?, ?)",
+                        [(config_id, name, value, int(i % 2 == 0))
+                         for i, (_, _, name, _, value) in enumerate(rows)])
+                    config_ids.append(config_id)
+        conn.commit()
+    return config_ids
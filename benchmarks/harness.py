@@ -0,0 +1,190 @@
+"""
+벤치마크 측정 / 이력 / 회귀 판정
+
+- measure(): 준비(setup) 후 본 작업만 perf_counter로 반복 측정 → 백분위 시간,
+  tracemalloc으로 한 번 더 실행해서 최대 할당 메모리 (시간 측정에는 tracemalloc 미사용)
+- 이력: 실행마다 한 항목(시각, 커밋, Python / 플랫폼, 규모, 항목별 결과)을 JSON 파일에 추가
+- 회귀: 같은 환경 / 같은 규모의 최근 실행 window개의 p50 / 최대 메모리 중앙값을 기준으로
+  threshold 비율과 최소 차이를 모두 넘으면 회귀
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+HISTORY_VERSION = 1
+
+# 회귀 기준 (현재 / 기준 - 1)
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.30
+
+# 이보다 작은 차이는 측정 잡음으로 보고 회귀로 판정하지 않음
+MIN_TIME_DELTA_MS = 2.0
+MIN_MEMORY_DELTA_KB = 512
+
+# 기준 계산에 사용하는 최근 실행 수
+DEFAULT_WINDOW = 5
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class Case:
+    """
+    측정 항목
+
+    setup()은 매 반복 전에 실행되고 반환값이 run()의 인자가 됩니다 (측정 제외).
+    run()의 반환값은 결과 확인용 숫자(처리 행 수 등)로 기록됩니다.
+    """
+    name: str
+    run: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None
+    description: str = ''
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """선형 보간 백분위 (q: 0~100)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(case: Case, repeat: int = 5, warmup: int = 1, trace_memory: bool = True) -> Dict[str, Any]:
+    """항목 하나 측정 → {'samples_ms', 'p50_ms', ..., 'peak_kb', 'result'}"""
+    samples = []
+    result = None
+    for i in range(warmup + repeat):
+        state = case.setup() if case.setup else None
+        start = time.perf_counter()
+        result = case.run(state)
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+
+    stats = {
+        'repeat': repeat,
+        'samples_ms': [round(sample, 3) for sample in samples],
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'result': result if isinstance(result, (int, float, str, type(None))) else str(result),
+    }
+    for q in PERCENTILES:
+        stats[f"p{q}_ms"] = round(percentile(samples, q), 3)
+
+    if trace_memory:
+        state = case.setup() if case.setup else None
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            case.run(state)
+            stats['peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+    return stats
+
+
+# ==================== 이력 ====================
+
+def environment() -> Dict[str, str]:
+    """실행 환경 (같은 환경끼리만 비교)"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(terse=True),
+        'machine': platform.machine(),
+        'node': platform.node(),
+        'cpu_count': str(os.cpu_count()),
+    }
+
+
+def _environment_key(env: Dict[str, str]) -> tuple:
+    python_minor = '.'.join(env.get('python', '').split('.')[:2])
+    return (python_minor, env.get('platform'), env.get('machine'), env.get('node'), env.get('cpu_count'))
+
+
+def git_commit(repo_dir: str) -> Optional[str]:
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=repo_dir,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    return data.get('runs', [])
+
+
+def append_history(path: str, run: Dict[str, Any]):
+    runs = load_history(path)
+    runs.append(run)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 쓰는 도중 중단되어도 이전 이력이 남도록 임시 파일 → 교체
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump({'version': HISTORY_VERSION, 'runs': runs}, handle, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
+
+
+# ==================== 회귀 판정 ====================
+
+def baseline(history: List[Dict[str, Any]], scale: Dict[str, int], env: Dict[str, str],
+             window: int = DEFAULT_WINDOW) -> Dict[str, Dict[str, float]]:
+    """같은 환경 / 규모의 최근 실행 window개 → 항목별 {'p50_ms', 'peak_kb', 'runs'} 중앙값"""
+    key = _environment_key(env)
+    comparable = [run for run in history
+                  if run.get('scale') == scale and _environment_key(run.get('environment', {})) == key]
+    reference: Dict[str, Dict[str, List[float]]] = {}
+    for run in comparable[-window:]:
+        for name, stats in run.get('results', {}).items():
+            values = reference.setdefault(name, {'p50_ms': [], 'peak_kb': []})
+            values['p50_ms'].append(stats['p50_ms'])
+            if 'peak_kb' in stats:
+                values['peak_kb'].append(stats['peak_kb'])
+    return {
+        name: {
+            'p50_ms': statistics.median(values['p50_ms']),
+            'peak_kb': statistics.median(values['peak_kb']) if values['peak_kb'] else None,
+            'runs': len(values['p50_ms']),
+        }
+        for name, values in reference.items()
+    }
+
+
+def find_regressions(results: Dict[str, Dict[str, Any]], reference: Dict[str, Dict[str, float]],
+                     time_threshold: float = DEFAULT_TIME_THRESHOLD,
+                     memory_threshold: float = DEFAULT_MEMORY_THRESHOLD) -> List[Dict[str, Any]]:
+    """기준 대비 회귀 목록 [{'case', 'metric', 'baseline', 'current', 'ratio'}]"""
+    regressions = []
+    for name, stats in results.items():
+        base = reference.get(name)
+        if not base:
+            continue
+        checks = [('p50_ms', time_threshold, MIN_TIME_DELTA_MS),
+                  ('peak_kb', memory_threshold, MIN_MEMORY_DELTA_KB)]
+        for metric, threshold, min_delta in checks:
+            before, current = base.get(metric), stats.get(metric)
+            if before is None or current is None:
+                continue
+            if current > before * (1 + threshold) and current - before > min_delta:
+                regressions.append({
+                    'case': name, 'metric': metric, 'baseline': before, 'current': current,
+                    'ratio': round(current / before, 3) if before else None,
+                })
+    return regressions
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DB Manager 벤치마크 실행
+
+고정 시드 합성 데이터로 주요 작업을 반복 측정하고 결과를 JSON 이력에 추가합니다.
+같은 환경 / 같은 규모의 최근 실행과 비교해서 회귀가 있으면 종료 코드 1.
+
+사용법:
+    python benchmarks/run_benchmarks.py                        # small 규모, 전체 항목
+    python benchmarks/run_benchmarks.py --scale medium --repeat 7
+    python benchmarks/run_benchmarks.py --only load,pivot,diff --parameters 50000
+    python benchmarks/run_benchmarks.py --threshold 0.15 --history ci/bench_history.json
+
+종료 코드: 0 정상, 1 회귀, 2 실행 오류
+"""
+
+import sys
+import os
+import argparse
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from benchmarks import harness
+from benchmarks.generators import DEFAULT_SEED
+from benchmarks.suite import CASE_NAMES, SCALES, Workload, build_cases
+
+DEFAULT_HISTORY = os.path.join(ROOT_DIR, 'benchmarks', 'results', 'history.json')
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="DB Manager 벤치마크")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small', help="데이터 규모 (기본: small)")
+    for field in SCALES['small'].to_dict():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, dest=field,
+                            help=f"규모 값 덮어쓰기 ({field})")
+    parser.add_argument('--only', help=f"측정 항목 (쉼표 구분: {','.join(CASE_NAMES)})")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 수 (기본: 5)")
+    parser.add_argument('--warmup', type=int, default=1, help="측정 전 실행 수 (기본: 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="합성 데이터 시드")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSON 이력 파일")
+    parser.add_argument('--no-record', action='store_true', help="이력에 추가하지 않음")
+    parser.add_argument('--threshold', type=float, default=harness.DEFAULT_TIME_THRESHOLD,
+                        help="p50 회귀 기준 비율 (기본: 0.25 = 25%% 느려지면 실패)")
+    parser.add_argument('--memory-threshold', type=float, default=harness.DEFAULT_MEMORY_THRESHOLD,
+                        help="최대 메모리 회귀 기준 비율 (기본: 0.30)")
+    parser.add_argument('--window', type=int, default=harness.DEFAULT_WINDOW,
+                        help="기준으로 사용할 최근 실행 수")
+    parser.add_argument('--no-fail', action='store_true', help="회귀가 있어도 종료 코드 0")
+    parser.add_argument('--workdir', help="합성 데이터 디렉토리 (기본: 임시 디렉토리, 실행 후 삭제)")
+    return parser
+
+
+def _print_results(results, reference):
+    print(f"\n{'항목':<18}{'p50(ms)':>11}{'p90(ms)':>11}{'p99(ms)':>11}{'최대 메모리(KB)':>16}{'기준 p50':>11}  결과")
+    print('-' * 92)
+    for name, stats in results.items():
+        base = reference.get(name, {})
+        base_text = f"{base['p50_ms']:.1f}" if base else '-'
+        peak = stats.get('peak_kb')
+        print(f"{name:<18}{stats['p50_ms']:>11.1f}{stats['p90_ms']:>11.1f}{stats['p99_ms']:>11.1f}"
+              f"{(f'{peak:,.0f}' if peak is not None else '-'):>16}{base_text:>11}  {stats['result']}")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    overrides = {field: getattr(args, field) for field in SCALES[args.scale].to_dict()
+                 if getattr(args, field) is not None}
+    scale = SCALES[args.scale].__class__(**dict(SCALES[args.scale].to_dict(), **overrides))
+    names = [name.strip() for name in args.only.split(',')] if args.only else CASE_NAMES
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='dbm_bench_')
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        start = time.perf_counter()
+        workload = Workload(workdir, scale, args.seed)
+        cases = build_cases(workload, names)
+        print(f"[준비] {args.scale} {scale.to_dict()} ({time.perf_counter() - start:.1f}s)")
+
+        results = {}
+        for case in cases:
+            stats = harness.measure(case, repeat=args.repeat, warmup=args.warmup,
+                                    trace_memory=not args.no_memory)
+            results[case.name] = stats
+            print(f"[측정] {case.name}: p50 {stats['p50_ms']:.1f}ms ({case.description})")
+    except ValueError as e:
+        print(f"[오류] {e}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    env = harness.environment()
+    scale_key = dict(scale.to_dict(), seed=args.seed)
+    history = harness.load_history(args.history)
+    reference = harness.baseline(history, scale_key, env, args.window)
+    regressions = harness.find_regressions(results, reference, args.threshold, args.memory_threshold)
+    _print_results(results, reference)
+
+    if not args.no_record:
+        harness.append_history(args.history, {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': harness.git_commit(ROOT_DIR),
+            'environment': env,
+            'scale_name': args.scale,
+            'scale': scale_key,
+            'repeat': args.repeat,
+            'results': results,
+            'regressions': regressions,
+        })
+        print(f"\n[이력] {args.history}")
+
+    if not reference:
+        print("[기준] 같은 환경 / 규모의 이전 실행이 없어 회귀 판정을 건너뜁니다.")
+    for regression in regressions:
+        unit = 'ms' if regression['metric'] == 'p50_ms' else 'KB'
+        print(f"[회귀] {regression['case']} {regression['metric']}: {regression['baseline']:.1f}{unit} → "
+              f"{regression['current']:.1f}{unit} (x{regression['ratio']})")
+    if regressions and not args.no_fail:
+        return EXIT_REGRESSION
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+벤치마크 측정 항목
+
+Workload가 규모(Scale)에 맞는 합성 데이터를 한 번 만들고 (측정 제외),
+build_cases()가 항목 목록을 돌려줍니다.
+
+    load             덤프 N개 읽기 (read_comparison_file)
+    pivot            ComparisonDataset에 N개 추가 (Pivot 증분 갱신)
+    diff             값이 다른 항목만 표 모델 → 행 dict
+    checklist        ChecklistValidator (정규식 패턴 K개, ChecklistService)
+    qc_inspection_v2 파일 N개 QC 검수 (Check list K개, 규칙 한 번 컴파일)
+    bulk_import      출고 장비 T대 파일 파싱 + 임포트 (매 반복 새 DB)
+    hierarchy        Model → Type → Configuration 전체 계층 조회 (빈 캐시)
+    search           Default DB 값 / 출고 파라미터 이름 검색 (FTS5)
+"""
+
+import itertools
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+from . import generators
+from .harness import Case
+
+
+@dataclass(frozen=True)
+class Scale:
+    """데이터 규모 (이력은 같은 규모끼리 비교)"""
+    files: int
+    parameters: int
+    checklist: int
+    tools: int
+    tool_parameters: int
+    models: int
+    types: int
+    configurations: int
+    values: int
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+SCALES = {
+    'small': Scale(files=3, parameters=2000, checklist=50, tools=10, tool_parameters=500,
+                   models=2, types=2, configurations=4, values=200),
+    'medium': Scale(files=5, parameters=20000, checklist=200, tools=50, tool_parameters=2000,
+                    models=4, types=3, configurations=6, values=1000),
+    'large': Scale(files=10, parameters=100000, checklist=500, tools=200, tool_parameters=5000,
+                   models=8, types=4, configurations=8, values=2000),
+}
+
+CASE_NAMES = ['load', 'pivot', 'diff', 'checklist', 'qc_inspection_v2', 'bulk_import', 'hierarchy', 'search']
+
+# 검색 항목의 고정 검색어
+SEARCH_QUERIES = ['heater temp', 'gas flow', 'robot speed', 'chuck', 'valve delay 0001', 'rf gain']
+
+
+class Workload:
+    """규모별 합성 데이터 (파일 / DB)를 workdir에 한 번 생성"""
+
+    def __init__(self, workdir: str, scale: Scale, seed: int = generators.DEFAULT_SEED):
+        self.workdir = workdir
+        self.scale = scale
+        self.seed = seed
+        self._frames = None
+        self._dataset = None
+        self._import_counter = itertools.count()
+
+        self.dump_paths = generators.write_dump_files(
+            os.path.join(workdir, 'dumps'), scale.files, scale.parameters, seed)
+        self.fleet_paths = generators.write_shipped_fleet(
+            os.path.join(workdir, 'fleet'), scale.tools, scale.tool_parameters, seed)
+
+    # ==================== 공용 준비 데이터 ====================
+
+    def frames(self):
+        """읽은 덤프 [(이름, DataFrame)]"""
+        if self._frames is None:
+            from app.file_reader import read_comparison_file
+            self._frames = [read_comparison_file(path) for path in self.dump_paths]
+        return self._frames
+
+    def dataset(self):
+        if self._dataset is None:
+            self._dataset = self.build_dataset()
+        return self._dataset
+
+    def build_dataset(self):
+        from app.dataset import ComparisonDataset
+
+        dataset = ComparisonDataset()
+        for name, frame in self.frames():
+            dataset.add_file(name, frame)
+        return dataset
+
+    def new_import_db(self):
+        """출고 장비 임포트용 새 DB (Configuration 하나) → (스키마, configuration_id)"""
+        path = os.path.join(self.workdir, f"import_{next(self._import_counter):03d}.sqlite")
+        if os.path.exists(path):
+            os.remove(path)
+        schema = generators.BenchSchema(path)
+        config_id = generators.populate_hierarchy(schema, 1, 1, 1, 0, self.seed)[0]
+        return schema, config_id
+
+    def hierarchy_db(self):
+        """계층 + Default DB 값 + 출고 장비가 들어간 DB (조회 / 검색 항목 공용)"""
+        path = os.path.join(self.workdir, 'hierarchy.sqlite')
+        if not os.path.exists(path):
+            from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+            schema = generators.BenchSchema(path)
+            scale = self.scale
+            config_ids = generators.populate_hierarchy(schema, scale.models, scale.types, scale.configurations,
+                                                       scale.values, self.seed)
+            service = ShippedEquipmentService(schema)
+            for path_, config_id in zip(self.fleet_paths, itertools.cycle(config_ids)):
+                service.import_from_file(path_, configuration_id=config_id)
+            return schema
+        return generators.BenchSchema(path)
+
+
+# ==================== 항목 ====================
+
+def _case_load(workload: Workload) -> Case:
+    from app.file_reader import read_comparison_file
+
+    def run(_):
+        return sum(len(read_comparison_file(path)[1]) for path in workload.dump_paths)
+    return Case('load', run, description=f"덤프 {len(workload.dump_paths)}개 읽기")
+
+
+def _case_pivot(workload: Workload) -> Case:
+    workload.frames()
+
+    def run(_):
+        return len(workload.build_dataset().pivot)
+    return Case('pivot', run, description="ComparisonDataset / Pivot 생성")
+
+
+def _case_diff(workload: Workload) -> Case:
+    dataset = workload.dataset()
+
+    def run(_):
+        pivot = dataset.pivot
+        visible_keys = {key for key, diff in zip(pivot.keys, pivot.diff) if diff}
+        return len(pivot.table_model(dataset.file_names, visible_keys=visible_keys).records())
+    return Case('diff', run, description="차이 항목 표 모델")
+
+
+def _case_checklist(workload: Workload) -> Case:
+    import pandas as pd
+    from app.schema import DBSchema
+    from app.services.common.cache_service import CacheService
+    from app.services.checklist.checklist_service import ChecklistService
+    from app.qc.checklist_validator import ChecklistValidator
+
+    db_schema = DBSchema(os.path.join(workload.workdir, 'checklist.sqlite'))
+    with db_schema.get_connection() as conn:
+        existing = conn.execute("SELECT COUNT(*) FROM QC_Checklist_Items").fetchone()[0]
+    if not existing:
+        for pattern in generators.checklist_patterns(workload.scale.checklist, workload.seed):
+            db_schema.add_checklist_item(pattern['item_name'], pattern['parameter_pattern'], is_common=True,
+                                         severity_level=pattern['severity_level'],
+                                         validation_rule=pattern['validation_rule'])
+    service = ChecklistService(db_schema, CacheService())
+    _, frame = workload.frames()[0]
+    df = pd.DataFrame({'ItemName': frame['ItemName'], 'Value1': frame['ItemValue']})
+
+    def run(_):
+        return ChecklistValidator(service, 1).validate_parameters(df)['checklist_params']
+    return Case('checklist', run, description=f"Check list 패턴 {workload.scale.checklist}개 검증")
+
+
+def _case_qc(workload: Workload) -> Case:
+    from app.qc.qc_inspection_v2 import compile_checklist_rules, qc_inspection_v2
+
+    items = generators.checklist_items(workload.scale.parameters, workload.scale.checklist, workload.seed)
+    file_data = [dict(zip(frame['ItemName'], frame['ItemValue'])) for _, frame in workload.frames()]
+
+    def run(_):
+        rules = compile_checklist_rules(items)
+        return sum(qc_inspection_v2(data, None, checklist_items=items, exception_item_ids=[],
+                                    compiled_rules=rules)['failed_count'] for data in file_data)
+    return Case('qc_inspection_v2', run, description=f"파일 {len(file_data)}개 × Check list {len(items)}개")
+
+
+def _case_bulk_import(workload: Workload) -> Case:
+    from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+    def run(state):
+        schema, config_id = state
+        service = ShippedEquipmentService(schema)
+        imported = 0
+        for path in workload.fleet_paths:
+            success, message, _ = service.import_from_file(path, configuration_id=config_id)
+            if not success:
+                raise RuntimeError(message)
+            imported += 1
+        return imported
+    return Case('bulk_import', run, setup=workload.new_import_db,
+                description=f"출고 장비 {workload.scale.tools}대 × 파라미터 {workload.scale.tool_parameters}개")
+
+
+def _case_hierarchy(workload: Workload) -> Case:
+    from app.services.common.cache_service import CacheService
+    from app.services.configuration.configuration_service import ConfigurationService
+
+    schema = workload.hierarchy_db()
+
+    def run(_):
+        hierarchy = ConfigurationService(schema, CacheService()).get_full_hierarchy()
+        return sum(len(t['configurations']) for m in hierarchy for t in m['types'])
+    return Case('hierarchy', run, description="전체 계층 조회 (빈 캐시)")
+
+
+def _case_search(workload: Workload) -> Case:
+    from app.services.common.cache_service import CacheService
+    from app.services.configuration.configuration_service import ConfigurationService
+    from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+    schema = workload.hierarchy_db()
+    configuration = ConfigurationService(schema, CacheService())
+    shipped = ShippedEquipmentService(schema)
+    # 색인 생성 / 채우기는 측정 전에
+    configuration.search_default_values(SEARCH_QUERIES[0])
+    shipped.search_parameter_names(SEARCH_QUERIES[0])
+
+    def run(_):
+        found = 0
+        for query in SEARCH_QUERIES:
+            found += len(configuration.search_default_values(query, limit=200))
+            found += len(shipped.search_parameter_names(query, limit=50))
+        return found
+    return Case('search', run, description=f"검색어 {len(SEARCH_QUERIES)}개 × 2")
+
+
+_BUILDERS = {
+    'load': _case_load,
+    'pivot': _case_pivot,
+    'diff': _case_diff,
+    'checklist': _case_checklist,
+    'qc_inspection_v2': _case_qc,
+    'bulk_import': _case_bulk_import,
+    'hierarchy': _case_hierarchy,
+    'search': _case_search,
+}
+
+
+def build_cases(workload: Workload, names: List[str] = None) -> List[Case]:
+    """이름 순서대로 측정 항목 준비 (없는 이름은 ValueError)"""
+    names = names or CASE_NAMES
+    unknown = [name for name in names if name not in _BUILDERS]
+    if unknown:
+        raise ValueError(f"알 수 없는 항목: {', '.join(unknown)} (가능: {', '.join(CASE_NAMES)})")
+    return [_BUILDERS[name](workload) for name in names]
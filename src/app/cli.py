@@ -0,0 +1,446 @@
+"""
+DB Manager 명령줄 도구 (Tk 없이 실행)
+
+    python -m app.cli compare A.txt B.txt -o diff.xlsx
+    python -m app.cli compare dumps/ --store mmap -o diff.xlsx
+    python -m app.cli qc dumps/*.txt --configuration 3 --json qc.json --excel qc.xlsx
+    python -m app.cli import-shipped ./shipped --configuration 3
+    python -m app.cli export-defaultdb --type NX-Mask -o default.txt
+    python -m app.cli serve --port 8765 --max-concurrency 4
+
+(src 디렉토리에서 실행하거나 PYTHONPATH에 src를 추가)
+
+- GUI와 같은 서비스 사용: 파일 읽기(file_reader), 비교 데이터셋(Pivot), QC 검수(qc_inspection_v2),
+  출고 장비 서비스, 내보내기 엔진(export_service)
+- tkinter를 import하지 않으므로 빌드 서버 / 스케줄러에서 실행 가능
+- 파일 읽기 / 파싱 / QC 평가는 프로세스 풀에서 병렬로 실행하고, 결과는 끝나는 대로 한 줄씩 출력
+  (QC는 JSON Lines, 나머지는 TSV). 진행 메시지는 stderr
+- DB 쓰기(import-shipped)는 SQLite 단일 쓰기에 맞춰 메인 프로세스에서 순서대로 처리
+- serve: 같은 서비스를 로컬 HTTP/JSON API로 제공 (app.server)
+
+종료 코드: 0 성공 (QC 전체 Pass), 1 QC Fail 파일 있음, 2 실행 오류 (파일 / DB 오류 포함)
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+EXIT_OK = 0
+EXIT_QC_FAILED = 1
+EXIT_ERROR = 2
+
+# QC 작업 프로세스 공용 데이터 (initializer로 한 번 전달)
+_qc_context: Dict[str, Any] = {}
+
+
+# ==================== 공통 ====================
+
+def _log(message: str):
+    """진행 메시지 (stderr)"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def _emit(line: str):
+    """결과 한 줄 (stdout, 바로 내보냄)"""
+    print(line, flush=True)
+
+
+def _default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def map_files(func: Callable[[str], Any], paths: Sequence[str], workers: int,
+              initializer: Optional[Callable] = None, initargs: tuple = ()) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+    """
+    파일마다 func(path) 실행, 끝나는 순서대로 (path, 결과, 예외) 반환
+
+    workers가 1 이하이거나 파일이 하나면 현재 프로세스에서 실행합니다.
+    func / initializer는 모듈 최상위 함수여야 합니다 (작업 프로세스로 전달).
+    """
+    if workers <= 1 or len(paths) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for path in paths:
+            try:
+                yield path, func(path), None
+            except Exception as e:
+                yield path, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths)),
+                             initializer=initializer, initargs=initargs) as executor:
+        futures = {executor.submit(func, path): path for path in paths}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], (None if error else future.result()), error
+
+
+def _expand_paths(patterns: Sequence[str]) -> List[str]:
+    """인자 목록 → 파일 경로 (디렉토리는 안의 .txt / .csv / .db, 셸이 풀지 않은 와일드카드 처리)"""
+    import glob
+
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(
+                os.path.join(pattern, name) for name in os.listdir(pattern)
+                if os.path.splitext(name)[1].lower() in ('.txt', '.csv', '.db')
+            ))
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def _open_db(db_path: Optional[str]):
+    from app.schema import DBSchema
+
+    return DBSchema(db_path)
+
+
+def _resolve_type_id(db_schema, type_arg: str) -> int:
+    """장비 유형 이름 또는 ID → ID"""
+    if type_arg.isdigit():
+        return int(type_arg)
+    row = db_schema.get_equipment_type_by_name(type_arg)
+    if row is None:
+        raise ValueError(f"장비 유형을 찾을 수 없습니다: {type_arg}")
+    return row[0]
+
+
+# ==================== compare ====================
+
+def _read_file(path: str):
+    from app.file_reader import read_comparison_file
+
+    return read_comparison_file(path)
+
+
+def run_compare(args) -> int:
+    """파일 비교 → 차이 리포트 (기본: 차이 있는 행만)"""
+    from app.dataset import create_comparison_dataset
+    from app.value_table import NormalizeOptions
+
+    try:
+        options = NormalizeOptions.parse(args.normalize)
+    except ValueError as e:
+        _log(str(e))
+        return EXIT_ERROR
+    paths = _expand_paths(args.files)
+    if len(paths) < 2:
+        _log("비교할 파일이 2개 이상 필요합니다.")
+        return EXIT_ERROR
+
+    # 읽기는 병렬, 데이터셋에는 인자 순서대로 추가 (컬럼 순서 고정)
+    frames = {}
+    failed = 0
+    for path, result, error in map_files(_read_file, paths, args.workers):
+        if error is not None:
+            failed += 1
+            _log(f"[실패] {path}: {error}")
+            continue
+        frames[path] = result
+        _log(f"[읽기] {result[0]}: {len(result[1])}행")
+
+    dataset = create_comparison_dataset(args.store, args.store_dir, options)
+    for path in paths:
+        if path in frames:
+            name, frame = frames.pop(path)
+            dataset.add_file(name, frame, path)
+    if len(dataset) < 2:
+        _log("읽은 파일이 2개 미만이라 비교할 수 없습니다.")
+        return EXIT_ERROR
+
+    pivot = dataset.pivot
+    visible_keys = None if args.all else {key for key, diff in zip(pivot.keys, pivot.diff) if diff}
+    model = pivot.table_model(dataset.file_names, visible_keys=visible_keys)
+
+    if args.output:
+        from app.services.common.export_service import write_export
+
+        written = write_export(args.output, [model.export_sheet("비교" if args.all else "차이점")])
+        _log(f"[저장] {', '.join(written)}")
+    else:
+        _emit('\t'.join(model.column_names))
+        for record in model.records():
+            _emit('\t'.join('' if value is None else str(value) for value in record.values()))
+
+    summary = pivot.summary()
+    _log(f"[완료] 파일 {len(dataset)}개, 항목 {summary['total']}개 (모듈 {summary['modules']}, "
+         f"파트 {summary['parts']}), 값이 다른 항목 {summary['diff']}개")
+    return EXIT_ERROR if failed else EXIT_OK
+
+
+# ==================== qc ====================
+
+def _init_qc_worker(checklist_items, exception_item_ids, configuration_id):
+    from app.qc.qc_inspection_v2 import compile_checklist_rules
+
+    # 규칙은 작업 프로세스마다 한 번 컴파일
+    _qc_context.update(checklist_items=checklist_items, exception_item_ids=exception_item_ids,
+                       configuration_id=configuration_id,
+                       compiled_rules=compile_checklist_rules(checklist_items))
+
+
+def _qc_file(path: str) -> Dict[str, Any]:
+    """파일 하나 QC 검수 (ItemName → ItemValue)"""
+    from app.file_reader import read_comparison_file
+    from app.qc.qc_inspection_v2 import qc_inspection_v2
+
+    name, frame = read_comparison_file(path)
+    file_data = dict(zip(frame['ItemName'], frame['ItemValue']))
+    result = qc_inspection_v2(file_data, _qc_context['configuration_id'],
+                              checklist_items=_qc_context['checklist_items'],
+                              exception_item_ids=_qc_context['exception_item_ids'],
+                              compiled_rules=_qc_context['compiled_rules'])
+    result['file'] = name
+    result['path'] = path
+    return result
+
+
+def _qc_line(result: Dict[str, Any]) -> str:
+    """파일 결과 한 줄 (JSON Lines, 실패 항목 이름만)"""
+    return json.dumps({
+        'file': result['file'],
+        'is_pass': result['is_pass'],
+        'total_count': result['total_count'],
+        'failed_count': result['failed_count'],
+        'matched_count': result['matched_count'],
+        'exception_count': result['exception_count'],
+        'failed_items': [r['item_name'] for r in result['results'] if not r['is_valid']],
+    }, ensure_ascii=False)
+
+
+def _qc_sheets(results: List[Dict[str, Any]]):
+    """QC 결과 Excel 시트 (파일별 요약 + 항목별 결과)"""
+    from app.services.common.export_service import ExportSheet
+
+    summary = {
+        "파일": [r['file'] for r in results],
+        "판정": ["PASS" if r['is_pass'] else "FAIL" for r in results],
+        "검증 항목 수": [r['total_count'] for r in results],
+        "실패 항목 수": [r['failed_count'] for r in results],
+        "예외 항목 수": [r['exception_count'] for r in results],
+    }
+    items = [dict(item, file=r['file']) for r in results for item in r['results']]
+    fields = {"파일": 'file', "항목": 'item_name', "파일 값": 'file_value', "Spec": 'spec',
+              "카테고리": 'category', "결과": 'result'}
+    for item in items:
+        item['result'] = "PASS" if item['is_valid'] else "FAIL"
+    return [ExportSheet("QC 요약", summary),
+            ExportSheet.from_records("검수 결과", items, fields, empty_message={"결과": "검수 항목이 없습니다."})]
+
+
+def run_qc(args) -> int:
+    """파일별 QC 검수 → 결과 JSON Lines / JSON / Excel, 종료 코드로 Pass/Fail"""
+    from app.qc.qc_inspection_v2 import get_active_checklist_items, get_exception_item_ids
+
+    paths = _expand_paths(args.files)
+    if not paths:
+        _log("검수할 파일이 없습니다.")
+        return EXIT_ERROR
+
+    db_schema = _open_db(args.db)
+    type_id = _resolve_type_id(db_schema, args.type) if args.type else None
+    # Check list / 예외 항목은 한 번만 조회해서 작업 프로세스에 전달
+    checklist_items = get_active_checklist_items(db_schema)
+    exception_item_ids = get_exception_item_ids(args.configuration, db_schema)
+    _log(f"[QC] 파일 {len(paths)}개, Check list {len(checklist_items)}개, "
+         f"Configuration {args.configuration if args.configuration is not None else 'Type Common'}")
+
+    results, errors = [], []
+    for path, result, error in map_files(_qc_file, paths, args.workers, _init_qc_worker,
+                                         (checklist_items, exception_item_ids, args.configuration)):
+        if error is not None:
+            errors.append({'path': path, 'error': str(error)})
+            _emit(json.dumps({'file': os.path.basename(path), 'error': str(error)}, ensure_ascii=False))
+            continue
+        results.append(result)
+        _emit(_qc_line(result))
+
+    # 보고서는 인자 순서로
+    order = {path: i for i, path in enumerate(paths)}
+    results.sort(key=lambda r: order[r['path']])
+    failed = [r['file'] for r in results if not r['is_pass']]
+    report = {
+        'equipment_type_id': type_id,
+        'configuration_id': args.configuration,
+        'is_pass': not failed and not errors,
+        'file_count': len(paths),
+        'passed_count': len(results) - len(failed),
+        'failed_files': failed,
+        'errors': errors,
+        'files': results,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2, default=str)
+        _log(f"[저장] {args.json}")
+    if args.excel:
+        from app.services.common.export_service import write_export
+
+        _log(f"[저장] {', '.join(write_export(args.excel, _qc_sheets(results)))}")
+
+    _log(f"[완료] PASS {report['passed_count']} / FAIL {len(failed)} / 오류 {len(errors)}")
+    if errors:
+        return EXIT_ERROR
+    return EXIT_QC_FAILED if failed else EXIT_OK
+
+
+# ==================== import-shipped ====================
+
+def _parse_shipped(path: str):
+    from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+    return ShippedEquipmentService.parse_equipment_file(path)
+
+
+def run_import_shipped(args) -> int:
+    """디렉토리의 출고 장비 파일 → DB (파싱은 병렬, 저장은 순서대로)"""
+    from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+    if not os.path.isdir(args.directory):
+        _log(f"디렉토리가 없습니다: {args.directory}")
+        return EXIT_ERROR
+    paths = sorted(os.path.join(args.directory, name) for name in os.listdir(args.directory)
+                   if fnmatch.fnmatch(name, args.pattern))
+    if not paths:
+        _log(f"가져올 파일이 없습니다: {args.directory} ({args.pattern})")
+        return EXIT_ERROR
+
+    service = ShippedEquipmentService(_open_db(args.db))
+    imported = failed = 0
+    for path, parse_result, error in map_files(_parse_shipped, paths, args.workers):
+        name = os.path.basename(path)
+        if error is not None:
+            success, message = False, str(error)
+        else:
+            success, message, _ = service.import_parsed(parse_result, args.configuration,
+                                                       not args.no_auto_match, name)
+        if success:
+            imported += 1
+        else:
+            failed += 1
+        _emit(f"{'OK' if success else 'FAIL'}\t{name}\t{message}")
+
+    _log(f"[완료] 가져옴 {imported} / 실패 {failed}")
+    return EXIT_ERROR if failed else EXIT_OK
+
+
+# ==================== export-defaultdb ====================
+
+# get_default_values 행 위치 → 내보내기 컬럼
+DEFAULT_DB_EXPORT_COLUMNS = [
+    ("Module", 11), ("Part", 12), ("ItemName", 1), ("ItemType", 13), ("ItemValue", 2),
+    ("ItemDescription", 10), ("Min Spec", 3), ("Max Spec", 4), ("Check list", 14),
+]
+
+
+def run_export_defaultdb(args) -> int:
+    """장비 유형의 Default DB → 텍스트(.txt, 원본 형식) / Excel / CSV / TSV"""
+    db_schema = _open_db(args.db)
+    type_id = _resolve_type_id(db_schema, args.type)
+
+    if os.path.splitext(args.output)[1].lower() == '.txt':
+        from app.text_file_handler import TextFileHandler
+
+        success, message = TextFileHandler(db_schema).export_to_text_file(type_id, args.output)
+        _log(message)
+        return EXIT_OK if success else EXIT_ERROR
+
+    from app.services.common.export_service import ExportSheet, write_export
+
+    rows = db_schema.get_default_values(type_id, checklist_only=args.checklist_only)
+    if not rows:
+        _log("Export할 데이터가 없습니다.")
+        return EXIT_ERROR
+    columns = {name: [row[pos] for row in rows] for name, pos in DEFAULT_DB_EXPORT_COLUMNS}
+    written = write_export(args.output, [ExportSheet("Default DB", columns)])
+    _log(f"[저장] {', '.join(written)} ({len(rows)}개 파라미터)")
+    return EXIT_OK
+
+
+# ==================== serve ====================
+
+def run_serve(args) -> int:
+    """로컬 HTTP/JSON 서비스 실행 (Ctrl+C로 종료)"""
+    from app.server import serve
+
+    def on_started(app, host, port):
+        _log(f"[serve] http://{host}:{port} (동시 실행 {app.max_concurrency}개, "
+             f"Check list {app.status()['checklist_items']}개)")
+
+    serve(args.db, args.host, args.port, args.max_concurrency, args.queue_timeout, on_started)
+    return EXIT_OK
+
+
+# ==================== 진입점 ====================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m app.cli', description="DB Manager 명령줄 도구 (GUI 없이 실행)")
+    parser.add_argument('--db', help="로컬 DB 경로 (기본: 프로그램과 같은 data/local_db.sqlite)")
+    parser.add_argument('--workers', type=int, default=_default_workers(),
+                        help="파일 처리 프로세스 수 (1이면 현재 프로세스)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    compare = commands.add_parser('compare', help="파일 비교 → 차이 리포트")
+    compare.add_argument('files', nargs='+', help="비교할 파일 (.txt / .csv / .db, 디렉토리 / 와일드카드 가능)")
+    compare.add_argument('-o', '--output', help="저장 경로 (.xlsx / .csv / .tsv). 없으면 stdout에 TSV")
+    compare.add_argument('--all', action='store_true', help="값이 같은 항목도 포함")
+    compare.add_argument('--store', choices=['memory', 'mmap'], default='memory',
+                         help="데이터셋 보관 방식 (mmap: 값 코드 행렬을 매핑 파일에 보관, 대용량 비교 세트용)")
+    compare.add_argument('--store-dir', help="mmap 매핑 파일 디렉토리 (기본: 시스템 임시 디렉토리)")
+    compare.add_argument('--normalize', metavar='OPTIONS',
+                         help="값 비교 정규화 (쉼표 구분: trim=앞뒤 공백, case=대소문자, numeric=숫자 표기 \"1.0\"==\"1\")")
+    compare.set_defaults(func=run_compare)
+
+    qc = commands.add_parser('qc', help="QC 검수 → Pass/Fail (종료 코드 0 / 1)")
+    qc.add_argument('files', nargs='+', help="검수할 파일 (디렉토리 / 와일드카드 가능)")
+    qc.add_argument('--type', help="장비 유형 이름 또는 ID (보고서 기록용)")
+    qc.add_argument('--configuration', type=int, help="Configuration ID (예외 항목 적용, 없으면 Type Common)")
+    qc.add_argument('--json', help="전체 결과 JSON 저장 경로")
+    qc.add_argument('--excel', help="결과 Excel 저장 경로 (.xlsx / .csv / .tsv)")
+    qc.set_defaults(func=run_qc)
+
+    shipped = commands.add_parser('import-shipped', help="출고 장비 파일 디렉토리 → DB")
+    shipped.add_argument('directory', help="{Serial}_{Customer}_{Model}.txt 파일 디렉토리")
+    shipped.add_argument('--configuration', type=int, help="Configuration ID (없으면 모델명으로 자동 매칭)")
+    shipped.add_argument('--no-auto-match', action='store_true', help="Configuration 자동 매칭 사용 안 함")
+    shipped.add_argument('--pattern', default='*.txt', help="파일 이름 패턴 (기본: *.txt)")
+    shipped.set_defaults(func=run_import_shipped)
+
+    export = commands.add_parser('export-defaultdb', help="Default DB 내보내기")
+    export.add_argument('--type', required=True, help="장비 유형 이름 또는 ID")
+    export.add_argument('-o', '--output', required=True, help="저장 경로 (.txt 원본 형식 / .xlsx / .csv / .tsv)")
+    export.add_argument('--checklist-only', action='store_true', help="Check list 항목만 (.txt 제외)")
+    export.set_defaults(func=run_export_defaultdb)
+
+    from app.server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_MAX_CONCURRENCY, DEFAULT_QUEUE_TIMEOUT
+
+    server = commands.add_parser('serve', help="로컬 HTTP/JSON 서비스 (QC / 비교 / Default DB 조회)")
+    server.add_argument('--host', default=DEFAULT_HOST, help=f"수신 주소 (기본: {DEFAULT_HOST})")
+    server.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    server.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="동시에 실행하는 요청 수 (나머지는 대기)")
+    server.add_argument('--queue-timeout', type=float, default=DEFAULT_QUEUE_TIMEOUT,
+                        help="실행 대기 최대 시간 (초, 넘으면 503)")
+    server.set_defaults(func=run_serve)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as e:
+        _log(f"[오류] {e}")
+        return EXIT_ERROR
+
+
+if __name__ == '__main__':
+    sys.exit(main())
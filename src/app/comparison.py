@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from app.widgets import CheckboxTreeview
 from app.utils import create_treeview_with_scrollbar, format_num_value
+from app.view_model import TableModel
 
 def add_comparison_functions_to_class(cls):
     """
@@ -588,26 +589,30 @@ def add_comparison_functions_to_class(cls):
             if not hasattr(self, 'merged_df') or self.merged_df is None:
                 return
                 
-            # 원본 데이터 복사
-            filtered_df = self.merged_df.copy()
+            # 원본 데이터는 복사하지 않고 표시 행 마스크만 계산
+            df = self.merged_df
+            mask = pd.Series(True, index=df.index)
             
             # 1. 검색 필터
             search_text = self.grid_search_var.get().lower().strip()
             if search_text:
-                mask = filtered_df.astype(str).apply(lambda x: x.str.lower().str.contains(search_text, na=False)).any(axis=1)
-                filtered_df = filtered_df[mask]
+                mask &= df.astype(str).apply(lambda x: x.str.lower().str.contains(search_text, na=False)).any(axis=1)
             
             # 2. Module 필터
             if hasattr(self, 'grid_module_filter_var'):
                 module_filter = self.grid_module_filter_var.get()
-                if module_filter and module_filter != "All" and 'Module' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['Module'] == module_filter]
+                if module_filter and module_filter != "All" and 'Module' in df.columns:
+                    mask &= df['Module'] == module_filter
             
             # 3. Part 필터
             if hasattr(self, 'grid_part_filter_var'):
                 part_filter = self.grid_part_filter_var.get()
-                if part_filter and part_filter != "All" and 'Part' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['Part'] == part_filter]
+                if part_filter and part_filter != "All" and 'Part' in df.columns:
+                    mask &= df['Part'] == part_filter
+            
+            # 뷰 모델 (병합 데이터 + 필터 마스크) - 내보내기는 이 모델 사용
+            self._grid_filter_model = TableModel.from_mask(df, mask.to_numpy())
+            filtered_df = df[mask]
             
             # 그리드 뷰 업데이트
             self._update_grid_view_with_filtered_data(filtered_df)
@@ -623,9 +628,12 @@ def add_comparison_functions_to_class(cls):
     def _update_grid_view_with_filtered_data(self, filtered_df):
         """필터링된 데이터로 그리드 뷰 업데이트"""
         try:
-            # 기존 데이터 제거
+            # 기존 데이터 제거 (증분 갱신용 행 맵도 함께 비움 - 삭제된 항목을 가리키지 않도록)
             for item in self.grid_tree.get_children():
                 self.grid_tree.delete(item)
+            self._grid_modules = {}
+            self._grid_parts = {}
+            self._grid_rows = {}
             
             # 컬럼 설정
             columns = list(filtered_df.columns)
@@ -766,13 +774,19 @@ def add_comparison_functions_to_class(cls):
             messagebox.showerror("오류", f"중요 항목 관리 중 오류 발생: {e}")
 
     def _export_selected_items(self):
-        """선택 항목 내보내기 (엔지니어 기능)"""
+        """메인 비교 탭에 표시 중인 항목 내보내기 (엔지니어 기능, 뷰 모델에서 저장)"""
         try:
             if not hasattr(self, 'merged_df') or self.merged_df is None:
                 messagebox.showinfo("정보", "내보낼 데이터가 없습니다.")
                 return
             
+            model = self.view_model('grid')
+            if not len(model):
+                messagebox.showinfo("정보", "내보낼 데이터가 없습니다.")
+                return
+            
             from tkinter import filedialog
+            from .file_service import export_sheets_in_background
             
             # 파일 저장 대화상자
             filename = filedialog.asksaveasfilename(
@@ -781,17 +795,16 @@ def add_comparison_functions_to_class(cls):
                 filetypes=[
                     ("Excel files", "*.xlsx"),
                     ("CSV files", "*.csv"),
+                    ("TSV files", "*.tsv"),
                     ("All files", "*.*")
                 ]
             )
             
             if filename:
-                if filename.endswith('.xlsx'):
-                    self.merged_df.to_excel(filename, index=False)
-                else:
-                    self.merged_df.to_csv(filename, index=False, encoding='utf-8-sig')
-                
-                messagebox.showinfo("완료", f"데이터가 성공적으로 내보내졌습니다:\n{filename}")
+                export_sheets_in_background(
+                    self.window, filename, [model.export_sheet("비교 데이터")], "비교 데이터 내보내기",
+                    on_done=lambda paths: self.update_log(f"📤 비교 데이터 내보내기: {filename} ({len(model)}개 항목)")
+                )
                 
         except Exception as e:
             messagebox.showerror("오류", f"데이터 내보내기 중 오류 발생: {e}")
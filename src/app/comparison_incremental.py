@@ -0,0 +1,543 @@
+"""
+비교 탭 점진적 갱신 모듈
+
+로드된 데이터셋에 파일을 하나씩 추가/제거하고, Pivot 변경 내역(PivotDelta)만
+비교 뷰(메인 비교 / 전체 목록 / 차이점 분석 / QC 보고서)에 반영합니다.
+
+- 파일 추가: 파일 컬럼 추가 + 새 행 삽입 + 차이 여부가 바뀐 행 태그 갱신
+- 파일 제거: 파일 컬럼 제거 + 빈 행 삭제 + 차이 여부가 바뀐 행 태그 갱신
+
+탭 전체를 다시 만드는 update_all_tabs()는 최초 로드와 뷰가 아직 없는 경우에만 사용합니다.
+뷰에 표시 중인 표는 view_model()로 얻으며 내보내기는 트리 항목 대신 이 모델을 사용합니다.
+"""
+
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from .file_service import read_comparison_file
+from .instrumentation import span
+from .loading import LoadingDialog
+
+
+FILE_TYPES = [
+    ("DB 파일", "*.txt;*.db;*.csv"),
+    ("텍스트 파일", "*.txt"),
+    ("CSV 파일", "*.csv"),
+    ("DB 파일", "*.db"),
+    ("모든 파일", "*.*")
+]
+
+
+# 뷰 이름 → 뷰에 표시 중인 Pivot 행 (키 → 트리 항목) 속성
+VIEW_ROWS = {
+    'grid': '_grid_rows',
+    'comparison': '_comparison_rows',
+    'diff_only': '_diff_only_rows',
+    'qc_report': '_qc_report_rows',
+    'report': '_report_rows',
+}
+
+
+def grid_module_label(module_name, total, diff):
+    """메인 비교 탭 모듈 노드 텍스트"""
+    if diff == 0:
+        return f"📁 {module_name} ({total})"
+    return f"📁 {module_name} ({total}) Diff: {diff}"
+
+
+def grid_part_label(part_name, total, diff):
+    """메인 비교 탭 파트 노드 (텍스트, 태그)"""
+    if diff == 0:
+        return f"📂 {part_name} ({total})", "part_clean"
+    return f"📂 {part_name} ({total}) Diff: {diff}", "part_diff"
+
+
+def _insert_position(order, key):
+    """정렬 목록에 key를 추가하고 삽입 위치 반환"""
+    index = bisect_left(order, key)
+    order.insert(index, key)
+    return index
+
+
+def add_incremental_comparison_functions_to_class(cls):
+    """
+    DBManager 클래스에 비교 탭 점진적 갱신 기능을 추가합니다.
+    """
+
+    # ==================== 메뉴 명령 ====================
+
+    def append_files(self, event=None):
+        """로드된 데이터셋에 파일 추가"""
+        files = filedialog.askopenfilenames(
+            title="➕ 추가할 DB 파일을 선택하세요",
+            filetypes=FILE_TYPES,
+            initialdir=self.folder_path if self.folder_path else None
+        )
+        if not files:
+            self.status_bar.config(text="파일 선택이 취소되었습니다.")
+            return
+
+        loading_dialog = LoadingDialog(self.window)
+        try:
+            added = []
+            total_files = len(files)
+            for idx, file in enumerate(files, 1):
+                file_name = os.path.basename(file)
+                loading_dialog.update_progress(
+                    (idx / total_files) * 90,
+                    f"파일 추가 중... ({idx}/{total_files})"
+                )
+                try:
+                    base_name, df = read_comparison_file(file)
+                except Exception as e:
+                    messagebox.showwarning(
+                        "경고",
+                        f"'{file_name}' 파일 로드 중 오류 발생:\n{str(e)}"
+                    )
+                    continue
+                self._append_loaded_file(base_name, df, file)
+                added.append(base_name)
+
+            loading_dialog.update_progress(100, "완료!")
+            loading_dialog.close()
+
+            if added:
+                if not self.folder_path:
+                    self.folder_path = os.path.dirname(files[0])
+                self.update_log(f"[파일 추가] {', '.join(added)} (전체 {len(self.file_names)}개)")
+                self.status_bar.config(
+                    text=f"{len(added)}개 파일을 추가했습니다. (전체 {len(self.file_names)}개)"
+                )
+            else:
+                messagebox.showerror("오류", "파일을 추가할 수 없습니다.")
+                self.status_bar.config(text="파일 추가 실패")
+        except Exception as e:
+            loading_dialog.close()
+            messagebox.showerror("오류", f"예기치 않은 오류가 발생했습니다:\n{str(e)}")
+
+    def remove_loaded_file(self):
+        """로드된 파일 선택 후 제거"""
+        if not self.file_names:
+            messagebox.showinfo("알림", "로드된 파일이 없습니다.")
+            return
+
+        dialog = tk.Toplevel(self.window)
+        dialog.title("파일 제거")
+        dialog.transient(self.window)
+        dialog.grab_set()
+
+        ttk.Label(dialog, text="비교에서 제거할 파일을 선택하세요:").pack(anchor="w", padx=10, pady=(10, 5))
+
+        listbox = tk.Listbox(dialog, selectmode=tk.EXTENDED, height=min(len(self.file_names), 12), width=40)
+        for name in self.file_names:
+            listbox.insert(tk.END, name)
+        listbox.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def on_remove():
+            names = [listbox.get(i) for i in listbox.curselection()]
+            dialog.destroy()
+            for name in names:
+                self._remove_loaded_file(name)
+            if names:
+                self.update_log(f"[파일 제거] {', '.join(names)} (전체 {len(self.file_names)}개)")
+                self.status_bar.config(
+                    text=f"{len(names)}개 파일을 제거했습니다. (전체 {len(self.file_names)}개)"
+                )
+
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="제거", command=on_remove).pack(side=tk.RIGHT, padx=5)
+
+    # ==================== 데이터셋 변경 ====================
+
+    def _append_loaded_file(self, name, df, path=None):
+        """파일 하나 추가 (같은 이름의 파일은 교체)"""
+        if name in self.dataset:
+            self._remove_loaded_file(name)
+        delta = self.dataset.append_file(name, df, path)
+        self.file_names.append(name)
+        if path:
+            self.uploaded_files[os.path.basename(path)] = path
+        self.merged_df = self.dataset.merged_df
+        self._release_comparison_caches()
+        self._apply_pivot_delta(delta)
+        return delta
+
+    def _remove_loaded_file(self, name):
+        """파일 하나 제거"""
+        loaded = self.dataset.get_file(name)
+        if loaded is None:
+            return None
+        delta = self.dataset.remove_file(name)
+        self.file_names.remove(name)
+        if loaded.path:
+            self.uploaded_files.pop(os.path.basename(loaded.path), None)
+        self.merged_df = self.dataset.merged_df
+        self._release_comparison_caches()
+        self._apply_pivot_delta(delta)
+        return delta
+
+    def _release_comparison_caches(self):
+        """이전 병합 데이터 기준 계산 결과 해제 (리포트 통계 / 리포트 차트 PNG)"""
+        self._report_statistics_cache = None
+        chart_service = sys.modules.get('app.services.common.chart_service')
+        if chart_service is not None:
+            chart_service.chart_renderer.invalidate(lambda key: isinstance(key, tuple) and key[:1] == ('report',))
+
+    @span('view.apply_pivot_delta', 'ui')
+    def _apply_pivot_delta(self, delta):
+        """Pivot 변경 내역을 비교 뷰에 반영"""
+        # 뷰가 없거나 데이터셋이 비어 있거나 그리드 필터 결과를 표시 중이면 전체 갱신
+        if not self.file_names or not len(self.dataset.pivot) or not hasattr(self, '_grid_rows') or \
+                getattr(self, '_grid_filter_model', None) is not None or \
+                (delta.added and len(self.file_names) == 1):
+            self.update_all_tabs()
+            return
+
+        self._sync_grid_view(delta)
+        self._sync_comparison_view(delta)
+        self._sync_diff_only_view(delta)
+        if hasattr(self, '_qc_report_rows'):
+            self._sync_qc_report_view(delta)
+        if hasattr(self, '_report_rows'):
+            self._sync_report_view(delta)
+
+    # ==================== 공통 ====================
+
+    def _configure_file_columns(self, tree, prefix_columns):
+        """
+        트리뷰 컬럼을 prefix + 파일 컬럼으로 재설정
+
+        컬럼 목록을 바꾸면 헤딩/폭이 초기화되므로 다시 지정합니다.
+        """
+        columns = list(prefix_columns) + list(self.file_names)
+        tree["columns"] = columns
+        return columns
+
+    def _sync_file_column(self, tree, rows, delta, prefix_values):
+        """
+        기존 행의 파일 컬럼 값 갱신
+
+        - 추가: 새 컬럼 값만 설정
+        - 제거: 트리뷰 값은 컬럼 위치 기준이므로 행 값 전체를 다시 설정
+        """
+        pivot = self.dataset.pivot
+        column = pivot.columns.get(delta.column) if delta.added else None
+        for key, iid in rows.items():
+            if delta.added:
+                value = column[pivot.key_pos[key]]
+                tree.set(iid, delta.column, "-" if value is None else value)
+            else:
+                tree.item(iid, values=prefix_values(key) + pivot.row_values(key, self.file_names))
+
+    def _sync_flat_rows(self, tree, rows, delta, prefix_values, visible, tags=None):
+        """
+        평면 트리뷰(Module/Part/ItemName + 파일 컬럼) 변경 반영
+
+        Args:
+            tree: 트리뷰
+            rows: Pivot 행 키 → 트리 항목
+            delta: PivotDelta
+            prefix_values: 키 → 파일 컬럼 앞의 값 목록
+            visible: 키 → 표시 여부
+            tags: 키 → 태그 튜플 (없으면 태그 미사용)
+        """
+        pivot = self.dataset.pivot
+
+        # 1. 사라진 행 / 더 이상 표시하지 않는 행 삭제
+        stale = [key for key in delta.removed_keys if key in rows]
+        stale += [key for key in delta.diff_changed_keys if key in rows and not visible(key)]
+        for key in stale:
+            tree.delete(rows.pop(key))
+
+        # 2. 기존 행 파일 컬럼 갱신
+        self._sync_file_column(tree, rows, delta, prefix_values)
+
+        # 3. 차이 여부가 바뀐 기존 행 태그 갱신
+        if tags is not None:
+            for key in delta.diff_changed_keys:
+                if key in rows:
+                    tree.item(rows[key], tags=tags(key))
+
+        # 4. 새로 표시할 행을 정렬 위치에 삽입
+        new_keys = [key for key in delta.added_keys if visible(key)]
+        new_keys += [key for key in delta.diff_changed_keys if key not in rows and visible(key)]
+        if new_keys:
+            order = sorted(rows)
+            for key in sorted(new_keys):
+                index = _insert_position(order, key)
+                values = prefix_values(key) + pivot.row_values(key, self.file_names)
+                options = {"tags": tags(key)} if tags is not None else {}
+                rows[key] = tree.insert("", index, values=values, **options)
+
+    # ==================== 메인 비교 (격자뷰) ====================
+
+    def _update_grid_counters(self, summary):
+        """메인 비교 탭 통계 라벨 갱신"""
+        if hasattr(self, 'grid_total_label'):
+            self.grid_total_label.config(text=f"총 파라미터: {summary['total']}")
+            self.grid_modules_label.config(text=f"모듈 수: {summary['modules']}")
+            self.grid_parts_label.config(text=f"파트 수: {summary['parts']}")
+
+            # 차이점 개수도 표시
+            if hasattr(self, 'grid_diff_label'):
+                self.grid_diff_label.config(text=f"값이 다른 항목: {summary['diff']}")
+
+    def _sync_grid_view(self, delta):
+        """메인 비교 탭에 Pivot 변경 반영"""
+        if not hasattr(self, 'grid_tree'):
+            return
+        tree = self.grid_tree
+        pivot = self.dataset.pivot
+
+        columns = self._configure_file_columns(tree, [])
+        for col in columns:
+            tree.heading(col, text=col, anchor="center")
+            tree.column(col, width=150, anchor="center")
+
+        # 1. 사라진 행 삭제
+        for key in delta.removed_keys:
+            iid = self._grid_rows.pop(key, None)
+            if iid is not None:
+                tree.delete(iid)
+
+        # 2. 기존 행 파일 컬럼 갱신 (모듈/파트 노드는 빈 값)
+        self._sync_file_column(tree, self._grid_rows, delta, lambda key: [])
+        if not delta.added:
+            blank = [""] * len(columns)
+            for iid in list(self._grid_modules.values()) + list(self._grid_parts.values()):
+                tree.item(iid, values=blank)
+
+        # 3. 차이 여부가 바뀐 행 태그 갱신
+        for key in delta.diff_changed_keys:
+            tag = "parameter_different" if pivot.has_difference(key) else "parameter_same"
+            tree.item(self._grid_rows[key], tags=(tag,))
+
+        # 4. 새 행을 모듈/파트 노드 아래 정렬 위치에 삽입
+        if delta.added_keys:
+            part_orders = defaultdict(list)
+            new_parts = {key[:2] for key in delta.added_keys}
+            for key in self._grid_rows:
+                if key[:2] in new_parts:
+                    part_orders[key[:2]].append(key[2])
+            for order in part_orders.values():
+                order.sort()
+
+            module_order = sorted(self._grid_modules)
+            for key in sorted(delta.added_keys):
+                module_name, part_name, item_name = key
+                module_node = self._grid_modules.get(module_name)
+                if module_node is None:
+                    index = _insert_position(module_order, module_name)
+                    module_node = tree.insert("", index, text="", values=[""] * len(columns),
+                                              open=True, tags=("module",))
+                    self._grid_modules[module_name] = module_node
+                part_node = self._grid_parts.get(key[:2])
+                if part_node is None:
+                    part_order = sorted(part for mod, part in self._grid_parts if mod == module_name)
+                    index = _insert_position(part_order, part_name)
+                    part_node = tree.insert(module_node, index, text="", values=[""] * len(columns),
+                                            open=True)
+                    self._grid_parts[key[:2]] = part_node
+                index = _insert_position(part_orders[key[:2]], item_name)
+                tag = "parameter_different" if pivot.has_difference(key) else "parameter_same"
+                self._grid_rows[key] = tree.insert(part_node, index, text=item_name,
+                                                   values=pivot.row_values(key, self.file_names),
+                                                   tags=(tag,))
+
+        # 5. 영향 받은 모듈/파트 노드 라벨 갱신 (빈 노드 삭제)
+        touched_parts = {key[:2] for key in delta.added_keys + delta.removed_keys + delta.diff_changed_keys}
+        for part_key in touched_parts:
+            part_node = self._grid_parts.get(part_key)
+            if part_node is None:
+                continue
+            counts = pivot.part_counts.get(part_key)
+            if counts is None:
+                tree.delete(self._grid_parts.pop(part_key))
+                continue
+            text, tag = grid_part_label(part_key[1], *counts)
+            tree.item(part_node, text=text, tags=(tag,))
+        for module_name in {part_key[0] for part_key in touched_parts}:
+            module_node = self._grid_modules.get(module_name)
+            if module_node is None:
+                continue
+            total, diff = pivot.module_counts(module_name)
+            if total == 0:
+                tree.delete(self._grid_modules.pop(module_name))
+                continue
+            tree.item(module_node, text=grid_module_label(module_name, total, diff))
+
+        self._update_grid_counters(pivot.summary())
+
+    # ==================== 전체 목록 ====================
+
+    def _comparison_row_visible(self, key, search_filter=""):
+        """전체 목록 탭 검색 / Module / Part 필터 적용 여부"""
+        module, part, item_name = key
+        if search_filter and search_filter not in item_name.lower():
+            return False
+        if hasattr(self, 'comparison_module_filter_var'):
+            module_filter = self.comparison_module_filter_var.get()
+            if module_filter and module_filter != "All" and module != module_filter:
+                return False
+        if hasattr(self, 'comparison_part_filter_var'):
+            part_filter = self.comparison_part_filter_var.get()
+            if part_filter and part_filter != "All" and part != part_filter:
+                return False
+        return True
+
+    def _comparison_row_tags(self, key):
+        """전체 목록 탭 행 태그 (차이점 / Default DB 존재)"""
+        tags = []
+        if self.dataset.pivot.has_difference(key):
+            tags.append("different")
+        if self.check_if_parameter_exists(*key):
+            tags.append("existing")
+        return tuple(tags)
+
+    def _sync_comparison_view(self, delta):
+        """전체 목록 탭에 Pivot 변경 반영"""
+        if not hasattr(self, 'comparison_tree') or not hasattr(self, '_comparison_rows'):
+            return
+        tree = self.comparison_tree
+        pivot = self.dataset.pivot
+        search_filter = getattr(self, '_comparison_search_filter', "")
+        has_checkbox = "Checkbox" in tree["columns"]
+
+        # 제거된 행의 체크 상태 정리
+        if has_checkbox:
+            for module, part, item_name in delta.removed_keys:
+                self.item_checkboxes.pop(f"{module}_{part}_{item_name}", None)
+
+        def prefix_values(key):
+            module, part, item_name = key
+            if not has_checkbox:
+                return [module, part, item_name]
+            item_key = f"{module}_{part}_{item_name}"
+            checked = self.item_checkboxes.setdefault(item_key, False)
+            return ["☑" if checked else "☐", module, part, item_name]
+
+        columns = self._configure_file_columns(
+            tree, (["Checkbox"] if has_checkbox else []) + ["Module", "Part", "ItemName"]
+        )
+        for col in columns:
+            if col == "Checkbox":
+                tree.heading(col, text="선택")
+                tree.column(col, width=50, anchor="center")
+            elif col in ("Module", "Part", "ItemName"):
+                tree.heading(col, text=col, anchor="w")
+                tree.column(col, width=100)
+            else:
+                tree.heading(col, text=col, anchor="w")
+                tree.column(col, width=150)
+
+        self._sync_flat_rows(
+            tree, self._comparison_rows, delta, prefix_values,
+            visible=lambda key: self._comparison_row_visible(key, search_filter),
+            tags=self._comparison_row_tags
+        )
+
+        # 카운터 갱신
+        diff_count = sum(1 for key in self._comparison_rows if pivot.has_difference(key))
+        filtered_items = len(self._comparison_rows)
+        total_items = len(pivot)
+        if not self.maint_mode and hasattr(self, 'diff_count_label'):
+            self.diff_count_label.config(text=f"값이 다른 항목: {diff_count}개")
+        if hasattr(self, 'search_result_label') and search_filter:
+            self.search_result_label.config(text=f"검색 결과: {filtered_items}개 (전체: {total_items}개)")
+        if hasattr(self, '_update_comparison_filter_options'):
+            self._update_comparison_filter_options()
+        if hasattr(self, 'comparison_filter_result_label'):
+            module_filter = getattr(self, 'comparison_module_filter_var', tk.StringVar()).get()
+            part_filter = getattr(self, 'comparison_part_filter_var', tk.StringVar()).get()
+            if (module_filter and module_filter != "All") or (part_filter and part_filter != "All"):
+                self.comparison_filter_result_label.config(text=f"필터 결과: {filtered_items}/{total_items} 항목")
+        if self.maint_mode:
+            self.update_selected_count(None)
+
+    # ==================== 차이점 분석 / QC 보고서 ====================
+
+    def _sync_diff_only_view(self, delta):
+        """차이점 분석 탭에 Pivot 변경 반영"""
+        if not hasattr(self, 'diff_only_tree') or not hasattr(self, '_diff_only_rows'):
+            return
+        tree = self.diff_only_tree
+        pivot = self.dataset.pivot
+
+        columns = self._configure_file_columns(tree, ["Module", "Part", "ItemName"])
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120 if col in ("Module", "Part", "ItemName") else 150)
+
+        self._sync_flat_rows(tree, self._diff_only_rows, delta, list,
+                             visible=pivot.has_difference)
+
+        if hasattr(self, 'diff_only_count_label'):
+            self.diff_only_count_label.config(text=f"값이 다른 항목: {len(self._diff_only_rows)}개")
+
+    def _sync_qc_report_view(self, delta):
+        """QC 보고서 탭에 Pivot 변경 반영"""
+        if not hasattr(self, 'qc_report_tree'):
+            return
+        self._sync_full_table_view(self.qc_report_tree, self._qc_report_rows, delta)
+
+    def _sync_report_view(self, delta):
+        """보고서 탭에 Pivot 변경 반영"""
+        if not hasattr(self, 'report_tree'):
+            return
+        self._sync_full_table_view(self.report_tree, self._report_rows, delta)
+
+    def _sync_full_table_view(self, tree, rows, delta):
+        """전체 행을 표시하는 평면 트리뷰 (필터 없음)"""
+        columns = self._configure_file_columns(tree, ["Module", "Part", "ItemName"])
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120)
+
+        self._sync_flat_rows(tree, rows, delta, list, visible=lambda key: True)
+
+    # ==================== 뷰 모델 ====================
+
+    def view_model(self, view):
+        """
+        비교 뷰에 표시 중인 표의 모델 (TableModel)
+
+        트리 항목 값을 읽지 않고 Pivot 배열 + 뷰가 표시 중인 행 키로 만들므로
+        행 수와 무관하게 Tk 호출이 없습니다. 값 없음은 None.
+
+        Args:
+            view: 'grid' / 'comparison' / 'diff_only' / 'qc_report' / 'report'
+                  (뷰가 아직 없으면 전체 행)
+        """
+        if view == 'grid' and getattr(self, '_grid_filter_model', None) is not None:
+            # 메인 비교 탭 고급 필터 결과 (병합 데이터 행)
+            return self._grid_filter_model
+        rows = getattr(self, VIEW_ROWS[view], None)
+        return self.dataset.pivot.table_model(self.file_names, rows)
+
+    # 클래스에 함수 추가
+    cls.append_files = append_files
+    cls.remove_loaded_file = remove_loaded_file
+    cls._append_loaded_file = _append_loaded_file
+    cls._remove_loaded_file = _remove_loaded_file
+    cls._apply_pivot_delta = _apply_pivot_delta
+    cls._release_comparison_caches = _release_comparison_caches
+    cls._configure_file_columns = _configure_file_columns
+    cls._sync_file_column = _sync_file_column
+    cls._sync_flat_rows = _sync_flat_rows
+    cls._update_grid_counters = _update_grid_counters
+    cls._sync_grid_view = _sync_grid_view
+    cls._comparison_row_visible = _comparison_row_visible
+    cls._comparison_row_tags = _comparison_row_tags
+    cls._sync_comparison_view = _sync_comparison_view
+    cls._sync_diff_only_view = _sync_diff_only_view
+    cls._sync_qc_report_view = _sync_qc_report_view
+    cls._sync_report_view = _sync_report_view
+    cls._sync_full_table_view = _sync_full_table_view
+    cls.view_model = view_model
@@ -0,0 +1,554 @@
+"""
+비교 데이터셋 - 로드된 DB 파일 관리
+
+load_folder로 로드된 파일들을 파일 단위로 보관합니다.
+각 파일은 값 컬럼(ItemValue)의 Typed Shadow를 지연 계산하여 보유하며,
+데이터셋 해제 시 Shadow 메모리도 함께 반환됩니다.
+
+비교 뷰에서 사용하는 (Module, Part, ItemName) × 파일 Pivot과 차이 마스크는
+파일 추가/제거 시 해당 컬럼만 반영하여 점진적으로 갱신됩니다.
+Pivot 값은 로드할 때 int32 코드로 바꿔 보관하므로(app.value_table) 차이 판정은 정수 비교입니다.
+
+대용량 비교 세트는 create_comparison_dataset('mmap')으로 같은 인터페이스의
+메모리 매핑 백엔드(app.mapped_dataset)를 사용할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # pandas는 파일 로드 시점에 사용 (시작 시 import 생략)
+    import pandas as pd
+
+from app.instrumentation import span
+from app.memory_tracker import track
+from app.qc.typed_shadow import TypedShadow
+from app.value_table import CODE_DTYPE, MISSING_CODE, NormalizeOptions, ValueTable
+from app.view_model import TableModel
+
+
+VALUE_COLUMN = 'ItemValue'
+KEY_COLUMN = 'ItemName'
+PIVOT_KEY_COLUMNS = ['Module', 'Part', 'ItemName']
+MISSING_VALUE = '-'
+DECODE_CHUNK = 65536
+_MAX_CODE = np.iinfo(CODE_DTYPE).max
+
+PivotKey = Tuple[str, str, str]
+
+
+@dataclass
+class PivotDelta:
+    """Pivot 변경 내역 (뷰에 반영할 최소 단위)"""
+    column: str                                             # 추가/제거된 파일 컬럼
+    added: bool                                             # True: 추가, False: 제거
+    added_keys: List[PivotKey] = field(default_factory=list)    # 새로 생긴 행
+    removed_keys: List[PivotKey] = field(default_factory=list)  # 사라진 행
+    diff_changed_keys: List[PivotKey] = field(default_factory=list)  # 차이 여부가 바뀐 행
+    column_keys: List[PivotKey] = field(default_factory=list)   # 해당 파일에 값이 있는 행
+
+
+class CodeColumn:
+    """
+    코드 배열을 값으로 읽는 컬럼 (값 없음은 None)
+
+    TableModel / comparison_incremental이 사용하는 인덱싱, take, 반복만 지원하며
+    요청한 행의 코드만 디코드합니다. 값 코드 테이블은 추가만 되므로 코드 배열을
+    바꾸지 않는 한 같은 값을 돌려줍니다.
+    """
+
+    __slots__ = ('_codes', '_table')
+
+    def __init__(self, codes: Optional[np.ndarray], table: ValueTable):
+        self._codes = codes
+        self._table = table
+
+    def codes(self) -> np.ndarray:
+        return self._codes
+
+    def __len__(self) -> int:
+        return len(self.codes())
+
+    def __getitem__(self, pos):
+        return self._table.value(int(self.codes()[pos]))
+
+    def take(self, rows) -> np.ndarray:
+        return self._table.decode(self.codes()[np.asarray(rows, dtype=np.intp)])
+
+    def __iter__(self):
+        codes = self.codes()
+        for start in range(0, len(codes), DECODE_CHUNK):
+            yield from self._table.decode(np.array(codes[start:start + DECODE_CHUNK]))
+
+
+class DecodedColumn(CodeColumn):
+    """Pivot의 현재 파일 컬럼 (코드 배열은 파일 추가 / 제거 시 교체되므로 접근할 때마다 조회)"""
+
+    __slots__ = ('_pivot', '_name')
+
+    def __init__(self, pivot: 'ComparisonPivot', name: str):
+        super().__init__(None, pivot.values)
+        self._pivot = pivot
+        self._name = name
+
+    def codes(self) -> np.ndarray:
+        return self._pivot.column_codes(self._name)
+
+
+class ComparisonPivot:
+    """
+    (Module, Part, ItemName) × 파일 값 Pivot
+
+    - values: 값 코드 테이블 (로드한 모든 파일 공용, 파일을 추가해도 기존 코드 유지)
+    - 파일별 값 컬럼: int32 코드 배열 (0 = 값 없음), columns는 값으로 읽는 보기
+    - present: 행별 값이 있는 파일 수
+    - ref: 행의 대표 값 정규화 코드 (차이가 없으면 모든 값의 정규화 코드가 ref와 같음)
+    - diff: 행별 차이 여부 (값이 있는 파일 간 정규화 코드 최소 != 최대)
+
+    파일 추가는 새 컬럼과 대표 코드 비교만으로, 파일 제거는 제거된 파일에
+    값이 있던 행만 남은 코드의 최소 / 최대로 다시 계산하여 갱신합니다.
+    코드 배열 보관 방식(_store_column, _grow, _drop_column, _compact)은
+    메모리 매핑 백엔드(app.mapped_dataset)가 재정의합니다.
+    """
+
+    def __init__(self, options: Optional[NormalizeOptions] = None):
+        """
+        Args:
+            options: 값 비교 정규화 옵션 (None이면 문자열이 같아야 같은 값)
+        """
+        self.keys: List[PivotKey] = []
+        self.key_pos: Dict[PivotKey, int] = {}
+        self.values = ValueTable(options)
+        self.columns: 'OrderedDict[str, DecodedColumn]' = OrderedDict()
+        self._codes: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self.present = np.zeros(0, dtype=np.int32)
+        self.ref = np.zeros(0, dtype=CODE_DTYPE)
+        self.diff = np.zeros(0, dtype=bool)
+        # (Module, Part) → [전체 행 수, 차이 행 수]
+        self.part_counts: Dict[Tuple[str, str], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def file_names(self) -> List[str]:
+        return list(self.columns.keys())
+
+    @property
+    def diff_count(self) -> int:
+        return int(self.diff.sum())
+
+    def _count(self, keys: List[PivotKey], total: int = 0, diff: int = 0):
+        """파트별 카운터 갱신"""
+        for key in keys:
+            counts = self.part_counts.setdefault(key[:2], [0, 0])
+            counts[0] += total
+            counts[1] += diff
+            if total and counts[0] <= 0:
+                del self.part_counts[key[:2]]
+
+    @staticmethod
+    def _file_entries(frame: pd.DataFrame) -> Tuple[List[PivotKey], List[str]]:
+        """파일의 (키, 값) 목록 (키별 첫 값, 키에 NaN이 있는 행 제외 - groupby와 동일)"""
+        if not all(col in frame.columns for col in PIVOT_KEY_COLUMNS) or VALUE_COLUMN not in frame.columns:
+            return [], []
+        subset = frame[PIVOT_KEY_COLUMNS + [VALUE_COLUMN]].dropna(subset=PIVOT_KEY_COLUMNS)
+        subset = subset.drop_duplicates(subset=PIVOT_KEY_COLUMNS, keep='first')
+        keys = list(zip(subset['Module'].tolist(), subset['Part'].tolist(), subset['ItemName'].tolist()))
+        values = [str(v) for v in subset[VALUE_COLUMN].tolist()]
+        return keys, values
+
+    # ------------------------------------------------------------------
+    # 코드 배열 보관 (메모리 백엔드)
+    # ------------------------------------------------------------------
+
+    def column_codes(self, name: str) -> np.ndarray:
+        """파일 값 컬럼의 행별 코드 (길이 = 행 수)"""
+        return self._codes[name]
+
+    def _model_codes(self, name: str) -> np.ndarray:
+        """표 모델용 코드 배열 (메모리 백엔드는 배열을 교체만 하므로 복사하지 않음)"""
+        return self._codes[name]
+
+    def _file_records(self, frame: pd.DataFrame) -> Tuple[List[PivotKey], Dict[str, List]]:
+        """파일의 키 목록 + {컬럼: 값 목록} (보관할 컬럼, VALUE_COLUMN 필수)"""
+        keys, values = self._file_entries(frame)
+        return keys, {VALUE_COLUMN: values}
+
+    def _store_column(self, name: str, positions: np.ndarray, records: Dict[str, List]):
+        codes = np.zeros(len(self.keys), dtype=CODE_DTYPE)
+        codes[positions] = self.values.encode(records[VALUE_COLUMN])
+        self._codes[name] = codes
+
+    def _grow(self, grow: int):
+        """행 추가 (기존 컬럼은 값 없음으로 채움)"""
+        for name, codes in self._codes.items():
+            self._codes[name] = np.concatenate([codes, np.zeros(grow, dtype=CODE_DTYPE)])
+
+    def _drop_column(self, name: str):
+        del self._codes[name]
+
+    def _compact(self, keep: np.ndarray):
+        """keep 행만 남김"""
+        for name, codes in self._codes.items():
+            self._codes[name] = codes[keep]
+
+    def _row_range(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """행별 (최소, 최대) 정규화 코드 (값 없음 제외)"""
+        low = np.full(len(rows), _MAX_CODE, dtype=CODE_DTYPE)
+        high = np.zeros(len(rows), dtype=CODE_DTYPE)
+        for name in self.columns:
+            codes = self.values.canonical(self.column_codes(name)[rows])
+            np.maximum(high, codes, out=high)
+            np.minimum(low, np.where(codes == MISSING_CODE, _MAX_CODE, codes), out=low)
+        return low, high
+
+    # ------------------------------------------------------------------
+    # 추가 / 제거
+    # ------------------------------------------------------------------
+
+    @span('pivot.add_column', 'pivot')
+    def add_column(self, name: str, frame: pd.DataFrame) -> PivotDelta:
+        """파일 컬럼 추가"""
+        if name in self.columns:
+            raise ValueError(f"이미 Pivot에 존재하는 파일입니다: {name}")
+
+        keys, records = self._file_records(frame)
+        delta = PivotDelta(column=name, added=True, column_keys=keys)
+
+        # 1. 새 키 → 행 추가
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self.key_pos]
+        if new_keys:
+            start = len(self.keys)
+            for offset, key in enumerate(new_keys):
+                self.key_pos[key] = start + offset
+            self.keys.extend(new_keys)
+            grow = len(new_keys)
+            self._grow(grow)
+            self.present = np.concatenate([self.present, np.zeros(grow, dtype=np.int32)])
+            self.ref = np.concatenate([self.ref, np.zeros(grow, dtype=CODE_DTYPE)])
+            self.diff = np.concatenate([self.diff, np.zeros(grow, dtype=bool)])
+            delta.added_keys = new_keys
+            self._count(new_keys, total=1)
+
+        # 2. 컬럼 채우기 (값 → 코드)
+        positions = np.fromiter((self.key_pos[key] for key in keys), dtype=np.intp, count=len(keys))
+        self._store_column(name, positions, records)
+        self.columns[name] = DecodedColumn(self, name)
+
+        # 3. 대표 코드 / 차이 마스크 갱신 (대표 코드와 다르면 차이 발생)
+        if positions.size:
+            codes = self.values.canonical(self.column_codes(name)[positions])
+            no_ref = self.present[positions] == 0
+            self.ref[positions[no_ref]] = codes[no_ref]
+            newly_diff = ~no_ref & ~self.diff[positions] & (codes != self.ref[positions])
+            changed = positions[newly_diff]
+            self.diff[changed] = True
+            self.present[positions] += 1
+            added = set(delta.added_keys)
+            delta.diff_changed_keys = [self.keys[i] for i in changed if self.keys[i] not in added]
+            self._count([self.keys[i] for i in changed], diff=1)
+
+        return delta
+
+    @span('pivot.remove_column', 'pivot')
+    def remove_column(self, name: str) -> PivotDelta:
+        """파일 컬럼 제거"""
+        positions = np.flatnonzero(self.column_codes(name))
+        del self.columns[name]
+        self._drop_column(name)
+        delta = PivotDelta(column=name, added=False,
+                           column_keys=[self.keys[i] for i in positions])
+        if not positions.size:
+            return delta
+
+        self.present[positions] -= 1
+        empty = positions[self.present[positions] == 0]
+        touched = positions[self.present[positions] > 0]
+
+        # 1. 영향 받은 행: 남은 파일의 정규화 코드 최소 == 최대이면 차이 없음
+        before = self.diff[touched].copy()
+        if touched.size:
+            low, high = self._row_range(touched)
+            self.ref[touched] = high
+            self.diff[touched] = low != high
+        changed = touched[before != self.diff[touched]]
+        delta.diff_changed_keys = [self.keys[i] for i in changed]
+        for i in changed:
+            self._count([self.keys[i]], diff=1 if self.diff[i] else -1)
+
+        # 2. 값이 모두 사라진 행 제거
+        if empty.size:
+            delta.removed_keys = [self.keys[i] for i in empty]
+            self._count(delta.removed_keys, total=-1)
+            keep = np.ones(len(self.keys), dtype=bool)
+            keep[empty] = False
+            self.keys = [key for key, k in zip(self.keys, keep) if k]
+            self.key_pos = {key: i for i, key in enumerate(self.keys)}
+            self._compact(keep)
+            self.present = self.present[keep]
+            self.ref = self.ref[keep]
+            self.diff = self.diff[keep]
+
+        return delta
+
+    def row_values(self, key: PivotKey, file_names: Optional[List[str]] = None) -> List[str]:
+        """행의 파일별 표시 값 (값 없음은 '-')"""
+        pos = self.key_pos[key]
+        names = file_names if file_names is not None else self.columns.keys()
+        values = []
+        for name in names:
+            code = int(self.column_codes(name)[pos])
+            values.append(MISSING_VALUE if code == MISSING_CODE else self.values.value(code))
+        return values
+
+    def has_difference(self, key: PivotKey) -> bool:
+        return bool(self.diff[self.key_pos[key]])
+
+    def sorted_keys(self) -> List[PivotKey]:
+        """정렬된 행 키 (groupby 순서와 동일)"""
+        return sorted(self.keys)
+
+    def table_model(self, file_names: Optional[List[str]] = None,
+                    visible_keys: Optional[Collection[PivotKey]] = None) -> TableModel:
+        """
+        뷰용 표 모델 (Module, Part, ItemName + 파일별 값, 값 없음은 None)
+
+        Args:
+            file_names: 파일 컬럼 순서 (None이면 Pivot 순서)
+            visible_keys: 뷰에 표시 중인 행 키 (None이면 전체). 행 순서는 sorted_keys()와 동일
+        """
+        names = file_names if file_names is not None else list(self.columns.keys())
+        columns = {
+            'Module': [key[0] for key in self.keys],
+            'Part': [key[1] for key in self.keys],
+            'ItemName': [key[2] for key in self.keys],
+        }
+        for name in names:
+            columns[name] = CodeColumn(self._model_codes(name), self.values)
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        if visible_keys is not None:
+            keys = self.keys
+            order = [i for i in order if keys[i] in visible_keys]
+        return TableModel(columns, order)
+
+    def module_counts(self, module: str) -> Tuple[int, int]:
+        """모듈의 (전체 행 수, 차이 행 수)"""
+        total = diff = 0
+        for (mod, _), counts in self.part_counts.items():
+            if mod == module:
+                total += counts[0]
+                diff += counts[1]
+        return total, diff
+
+    def summary(self) -> Dict[str, int]:
+        """전체/차이/모듈/파트 개수"""
+        return {
+            'total': len(self.keys),
+            'diff': self.diff_count,
+            'modules': len({part[0] for part in self.part_counts}),
+            'parts': len(self.part_counts),
+        }
+
+    def clear(self):
+        self.__init__(self.values.options)
+
+
+class LoadedFile:
+    """로드된 단일 파일"""
+
+    def __init__(self, name: str, frame: pd.DataFrame, path: Optional[str] = None):
+        """
+        Args:
+            name: 파일 이름 (확장자 제외, Model 컬럼 값)
+            frame: 파일 데이터프레임
+            path: 원본 파일 경로
+        """
+        self.name = name
+        self.frame = frame
+        self.path = path
+        self._shadow: Optional[TypedShadow] = None
+        track('LoadedFile', self)
+
+    @property
+    def shadow(self) -> TypedShadow:
+        """값 컬럼의 Typed Shadow (처음 접근 시 생성)"""
+        if self._shadow is None:
+            values = self.frame[VALUE_COLUMN].tolist() if VALUE_COLUMN in self.frame.columns else []
+            self._shadow = TypedShadow(values)
+        return self._shadow
+
+    def file_data(self) -> Dict[str, Any]:
+        """ItemName → Value 매핑 (qc_inspection_v2 입력 형식, 중복 ItemName은 첫 값)"""
+        if KEY_COLUMN not in self.frame.columns or VALUE_COLUMN not in self.frame.columns:
+            return {}
+        data = {}
+        for key, value in zip(self.frame[KEY_COLUMN].tolist(), self.frame[VALUE_COLUMN].tolist()):
+            data.setdefault(key, value)
+        return data
+
+    def file_data_with_shadow(self):
+        """
+        file_data()와 그 값 순서에 맞춘 Typed Shadow 반환
+
+        Returns:
+            (file_data, shadow) 튜플
+        """
+        data = {}
+        positions = []
+        if KEY_COLUMN in self.frame.columns and VALUE_COLUMN in self.frame.columns:
+            for pos, (key, value) in enumerate(zip(self.frame[KEY_COLUMN].tolist(),
+                                                   self.frame[VALUE_COLUMN].tolist())):
+                if key not in data:
+                    data[key] = value
+                    positions.append(pos)
+        return data, self.shadow.take(positions)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """메모리 사용량 (bytes)"""
+        frame_bytes = int(self.frame.memory_usage(index=True, deep=True).sum())
+        shadow_bytes = self._shadow.nbytes if self._shadow is not None else 0
+        return {'frame': frame_bytes, 'shadow': shadow_bytes}
+
+    def release(self):
+        """Shadow 해제"""
+        if self._shadow is not None:
+            self._shadow.release()
+            self._shadow = None
+
+
+class ComparisonDataset:
+    """로드된 파일 집합 (파일 순서 유지)"""
+
+    def __init__(self, options: Optional[NormalizeOptions] = None):
+        """
+        Args:
+            options: 값 비교 정규화 옵션 (값 코드를 부여할 때 한 번 적용)
+        """
+        self._files: 'OrderedDict[str, LoadedFile]' = OrderedDict()
+        self._merged: Optional[pd.DataFrame] = None
+        self.pivot = ComparisonPivot(options)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._files
+
+    @property
+    def file_names(self) -> List[str]:
+        """파일 이름 목록 (로드 순서)"""
+        return list(self._files.keys())
+
+    @property
+    def files(self) -> List[LoadedFile]:
+        """LoadedFile 목록 (로드 순서)"""
+        return list(self._files.values())
+
+    def get_file(self, name: str) -> Optional[LoadedFile]:
+        """이름으로 파일 조회"""
+        return self._files.get(name)
+
+    def add_file(self, name: str, frame: pd.DataFrame, path: Optional[str] = None) -> LoadedFile:
+        """
+        파일 추가 (Model 컬럼이 없으면 파일 이름으로 채움)
+
+        동일 이름의 파일이 있으면 교체합니다.
+        """
+        return self._add(name, frame, path)[0]
+
+    def append_file(self, name: str, frame: pd.DataFrame, path: Optional[str] = None) -> PivotDelta:
+        """
+        파일 추가 후 Pivot 변경 내역 반환
+
+        동일 이름의 파일을 교체하려면 먼저 remove_file()로 제거해야 합니다.
+        """
+        if name in self._files:
+            raise ValueError(f"이미 로드된 파일입니다: {name}")
+        return self._add(name, frame, path)[1]
+
+    def _add(self, name: str, frame: pd.DataFrame, path: Optional[str]):
+        if 'Model' not in frame.columns:
+            frame = frame.assign(Model=name)
+        if name in self._files:
+            self.remove_file(name)
+        loaded = LoadedFile(name, frame, path)
+        self._files[name] = loaded
+        delta = self.pivot.add_column(name, frame)
+        # 병합 프레임이 이미 있으면 새 파일만 이어 붙임
+        if self._merged is not None:
+            import pandas as pd
+            self._merged = track('merged_df', pd.concat([self._merged, frame], ignore_index=True))
+        return loaded, delta
+
+    def remove_file(self, name: str) -> PivotDelta:
+        """파일 제거 후 Pivot 변경 내역 반환"""
+        loaded = self._files.pop(name)
+        loaded.release()
+        delta = self.pivot.remove_column(name)
+        if self._merged is not None:
+            if self._files:
+                self._merged = track('merged_df',
+                                     self._merged[self._merged['Model'] != name].reset_index(drop=True))
+            else:
+                self._merged = None
+        return delta
+
+    @property
+    def merged_df(self) -> Optional[pd.DataFrame]:
+        """전체 파일 병합 데이터프레임 (캐시)"""
+        if self._merged is None and self._files:
+            import pandas as pd
+            self._merged = track('merged_df', pd.concat([f.frame for f in self._files.values()], ignore_index=True))
+        return self._merged
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        데이터셋 메모리 사용량 (bytes)
+
+        Returns:
+            {'frames': 파일 프레임, 'shadows': Typed Shadow, 'merged': 병합 프레임, 'total': 합계}
+        """
+        frames = shadows = 0
+        for loaded in self._files.values():
+            usage = loaded.memory_usage()
+            frames += usage['frame']
+            shadows += usage['shadow']
+        merged = int(self._merged.memory_usage(index=True, deep=True).sum()) if self._merged is not None else 0
+        return {'frames': frames, 'shadows': shadows, 'merged': merged,
+                'total': frames + shadows + merged}
+
+    def clear(self):
+        """모든 파일 및 Shadow 해제"""
+        for loaded in self._files.values():
+            loaded.release()
+        self._files.clear()
+        self._merged = None
+        self.pivot.clear()
+
+
+DATASET_BACKENDS = ('memory', 'mmap')
+
+
+def create_comparison_dataset(backend: str = 'memory', directory: Optional[str] = None,
+                              options: Optional[NormalizeOptions] = None) -> ComparisonDataset:
+    """
+    비교 데이터셋 생성
+
+    Args:
+        backend: 'memory' (파일 프레임을 메모리에 보관) 또는
+                 'mmap' (값 코드 행렬을 매핑 파일에 보관, 대용량 비교 세트용)
+        directory: mmap 백엔드의 매핑 파일 디렉토리 (None이면 시스템 임시 디렉토리)
+        options: 값 비교 정규화 옵션 (공백 / 대소문자 / 숫자 표기)
+    """
+    if backend == 'memory':
+        return ComparisonDataset(options)
+    if backend == 'mmap':
+        from app.mapped_dataset import MappedComparisonDataset
+        return MappedComparisonDataset(directory, options)
+    raise ValueError(f"알 수 없는 데이터셋 백엔드: {backend} (사용 가능: {', '.join(DATASET_BACKENDS)})")
@@ -20,14 +20,19 @@ import csv
 class ChecklistManagerDialog:
     """QC Checklist Management Dialog (관리자 전용)"""
 
-    def __init__(self, parent, db_schema):
+    def __init__(self, parent, db_schema, submit_write=None):
         """
         Args:
             parent: 부모 윈도우
             db_schema: DBSchema 인스턴스
+            submit_write: 쓰기 작업 제출 함수 (DBManager.submit_write, None이면 바로 실행)
         """
         self.parent = parent
         self.db_schema = db_schema
+        if submit_write is None:
+            from app.services.common.write_queue import run_write_now
+            submit_write = run_write_now
+        self.submit_write = submit_write
 
         # 다이얼로그 생성
         self.dialog = tk.Toplevel(parent)
@@ -341,11 +346,13 @@ class ChecklistManagerDialog:
 
     def _add_checklist_item(self):
         """Checklist 항목 추가"""
-        dialog = ChecklistItemDialog(self.dialog, self.db_schema, mode="add")
+        dialog = ChecklistItemDialog(self.dialog, self.db_schema, mode="add",
+                                     submit_write=self.submit_write)
         self.dialog.wait_window(dialog.dialog)
 
         if dialog.result:
             self._refresh_checklist()
+            self._refresh_audit_log()
             messagebox.showinfo("성공", "Checklist 항목이 추가되었습니다.")
 
     def _edit_checklist_item(self):
@@ -372,11 +379,13 @@ class ChecklistManagerDialog:
                 item_data = cursor.fetchone()
 
             if item_data:
-                dialog = ChecklistItemDialog(self.dialog, self.db_schema, mode="edit", item_data=item_data)
+                dialog = ChecklistItemDialog(self.dialog, self.db_schema, mode="edit", item_data=item_data,
+                                             submit_write=self.submit_write)
                 self.dialog.wait_window(dialog.dialog)
 
                 if dialog.result:
                     self._refresh_checklist()
+                    self._refresh_audit_log()
                     messagebox.showinfo("성공", "Checklist 항목이 수정되었습니다.")
 
         except Exception as e:
@@ -398,7 +407,7 @@ class ChecklistManagerDialog:
         item_id = int(item_values[0])
         item_name = item_values[1]
 
-        try:
+        def delete_item():
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -415,12 +424,24 @@ class ChecklistManagerDialog:
 
                 conn.commit()
 
-            self._refresh_checklist()
-            self._refresh_audit_log()
-            messagebox.showinfo("성공", "Checklist 항목이 삭제되었습니다.")
+        self.submit_write(
+            delete_item,
+            callback=lambda _: self._on_write_done("Checklist 항목이 삭제되었습니다."),
+            error_callback=lambda e: self._on_write_failed("삭제 실패", e)
+        )
 
-        except Exception as e:
-            messagebox.showerror("오류", f"삭제 실패:\n{str(e)}")
+    def _on_write_done(self, message):
+        """쓰기 작업 완료 (Tk 메인 스레드) - 목록 / 변경 이력 새로고침"""
+        if not self.dialog.winfo_exists():
+            return
+        self._refresh_checklist()
+        self._refresh_audit_log()
+        messagebox.showinfo("성공", message)
+
+    def _on_write_failed(self, title, error):
+        """쓰기 작업 실패 (Tk 메인 스레드)"""
+        if self.dialog.winfo_exists():
+            messagebox.showerror("오류", f"{title}:\n{str(error)}")
 
     def _activate_item(self):
         """항목 활성화"""
@@ -444,7 +465,7 @@ class ChecklistManagerDialog:
 
         action_text = "활성화" if is_active else "비활성화"
 
-        try:
+        def update_active():
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -465,12 +486,11 @@ class ChecklistManagerDialog:
 
                 conn.commit()
 
-            self._refresh_checklist()
-            self._refresh_audit_log()
-            messagebox.showinfo("성공", f"항목이 {action_text}되었습니다.")
-
-        except Exception as e:
-            messagebox.showerror("오류", f"{action_text} 실패:\n{str(e)}")
+        self.submit_write(
+            update_active,
+            callback=lambda _: self._on_write_done(f"항목이 {action_text}되었습니다."),
+            error_callback=lambda e: self._on_write_failed(f"{action_text} 실패", e)
+        )
 
     def _import_from_csv(self):
         """CSV 파일에서 Checklist 항목 가져오기"""
@@ -484,8 +504,7 @@ class ChecklistManagerDialog:
             return
 
         try:
-            imported_count = 0
-            error_count = 0
+            rows = []
             errors = []
 
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -497,87 +516,119 @@ class ChecklistManagerDialog:
                     messagebox.showerror("오류", f"CSV 파일에 필수 컬럼이 없습니다.\n필수: {', '.join(required_columns)}")
                     return
 
-                with self.db_schema.get_connection() as conn:
-                    cursor = conn.cursor()
+                for row_num, row in enumerate(reader, start=2):
+                    try:
+                        item_name = row['item_name'].strip()
+                        if not item_name:
+                            continue
 
-                    for row_num, row in enumerate(reader, start=2):
-                        try:
-                            item_name = row['item_name'].strip()
-                            if not item_name:
-                                continue
-
-                            spec_min = row.get('spec_min', '').strip() or None
-                            spec_max = row.get('spec_max', '').strip() or None
-                            expected_value = row.get('expected_value', '').strip() or None
-                            category = row.get('category', '').strip() or None
-                            description = row.get('description', '').strip() or None
-                            is_active = row.get('is_active', '1').strip()
-
-                            # is_active 변환
-                            is_active = 1 if is_active in ['1', 'true', 'True', 'TRUE', 'yes'] else 0
-
-                            # 중복 체크
-                            cursor.execute("SELECT id FROM QC_Checklist_Items WHERE item_name = ?", (item_name,))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 업데이트
-                                cursor.execute("""
-                                    UPDATE QC_Checklist_Items
-                                    SET spec_min = ?, spec_max = ?, expected_value = ?,
-                                        category = ?, description = ?, is_active = ?
-                                    WHERE item_name = ?
-                                """, (spec_min, spec_max, expected_value, category, description, is_active, item_name))
-                            else:
-                                # 삽입
-                                cursor.execute("""
-                                    INSERT INTO QC_Checklist_Items
-                                    (item_name, spec_min, spec_max, expected_value, category, description, is_active)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                                """, (item_name, spec_min, spec_max, expected_value, category, description, is_active))
+                        spec_min = row.get('spec_min', '').strip() or None
+                        spec_max = row.get('spec_max', '').strip() or None
+                        expected_value = row.get('expected_value', '').strip() or None
+                        category = row.get('category', '').strip() or None
+                        description = row.get('description', '').strip() or None
+                        is_active = row.get('is_active', '1').strip()
 
-                            imported_count += 1
+                        # is_active 변환
+                        is_active = 1 if is_active in ['1', 'true', 'True', 'TRUE', 'yes'] else 0
 
-                        except Exception as e:
-                            error_count += 1
-                            errors.append(f"행 {row_num}: {str(e)}")
+                        rows.append((row_num, (spec_min, spec_max, expected_value, category,
+                                               description, is_active, item_name)))
 
-                    # Audit Log 기록
-                    cursor.execute("""
-                        INSERT INTO Checklist_Audit_Log
-                        (action, target_table, reason, user, timestamp)
-                        VALUES (?, ?, ?, ?, datetime('now'))
-                    """, ("ADD", "QC_Checklist_Items", f"CSV Import: {imported_count}개 항목", "Admin"))
+                    except Exception as e:
+                        errors.append((row_num, str(e)))
 
-                    conn.commit()
+        except Exception as e:
+            messagebox.showerror("오류", f"CSV Import 실패:\n{str(e)}")
+            return
+
+        def import_rows():
+            imported_count = 0
+            row_errors = []
+
+            with self.db_schema.get_connection() as conn:
+                cursor = conn.cursor()
+
+                for row_num, values in rows:
+                    try:
+                        # 중복 체크
+                        cursor.execute("SELECT id FROM QC_Checklist_Items WHERE item_name = ?", (values[-1],))
+                        existing = cursor.fetchone()
+
+                        if existing:
+                            # 업데이트
+                            cursor.execute("""
+                                UPDATE QC_Checklist_Items
+                                SET spec_min = ?, spec_max = ?, expected_value = ?,
+                                    category = ?, description = ?, is_active = ?
+                                WHERE item_name = ?
+                            """, values)
+                        else:
+                            # 삽입
+                            cursor.execute("""
+                                INSERT INTO QC_Checklist_Items
+                                (spec_min, spec_max, expected_value, category, description, is_active, item_name)
+                                VALUES (?, ?, ?, ?, ?, ?, ?)
+                            """, values)
+
+                        imported_count += 1
+
+                    except Exception as e:
+                        row_errors.append((row_num, str(e)))
+
+                # Audit Log 기록
+                cursor.execute("""
+                    INSERT INTO Checklist_Audit_Log
+                    (action, target_table, reason, user, timestamp)
+                    VALUES (?, ?, ?, ?, datetime('now'))
+                """, ("ADD", "QC_Checklist_Items", f"CSV Import: {imported_count}개 항목", "Admin"))
+
+                conn.commit()
+
+            return imported_count, row_errors
+
+        def on_imported(result):
+            if not self.dialog.winfo_exists():
+                return
+            imported_count, row_errors = result
+            all_errors = sorted(errors + row_errors)
 
             self._refresh_checklist()
             self._refresh_audit_log()
 
             # 결과 메시지
-            result_msg = f"Import 완료:\n\n성공: {imported_count}개\n실패: {error_count}개"
-            if errors:
-                result_msg += f"\n\n오류 내역 (최대 5개):\n" + "\n".join(errors[:5])
+            result_msg = f"Import 완료:\n\n성공: {imported_count}개\n실패: {len(all_errors)}개"
+            if all_errors:
+                result_msg += f"\n\n오류 내역 (최대 5개):\n" + "\n".join(
+                    f"행 {row_num}: {message}" for row_num, message in all_errors[:5])
 
             messagebox.showinfo("Import 완료", result_msg)
 
-        except Exception as e:
-            messagebox.showerror("오류", f"CSV Import 실패:\n{str(e)}")
+        self.submit_write(
+            import_rows,
+            callback=on_imported,
+            error_callback=lambda e: self._on_write_failed("CSV Import 실패", e)
+        )
 
 
 class ChecklistItemDialog:
     """Checklist 항목 추가/수정 다이얼로그"""
 
-    def __init__(self, parent, db_schema, mode="add", item_data=None):
+    def __init__(self, parent, db_schema, mode="add", item_data=None, submit_write=None):
         """
         Args:
             parent: 부모 윈도우
             db_schema: DBSchema 인스턴스
             mode: "add" 또는 "edit"
             item_data: 수정 모드일 때 기존 데이터 (tuple)
+            submit_write: 쓰기 작업 제출 함수 (None이면 바로 실행)
         """
         self.parent = parent
         self.db_schema = db_schema
+        if submit_write is None:
+            from app.services.common.write_queue import run_write_now
+            submit_write = run_write_now
+        self.submit_write = submit_write
         self.mode = mode
         self.item_data = item_data
         self.result = None
@@ -657,12 +708,13 @@ class ChecklistItemDialog:
         btn_frame = ttk.Frame(main_frame)
         btn_frame.grid(row=8, column=0, columnspan=2, pady=(20, 0))
 
-        ttk.Button(
+        self.save_button = ttk.Button(
             btn_frame,
             text="저장",
             command=self._save,
             width=15
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.save_button.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
             btn_frame,
@@ -726,24 +778,33 @@ class ChecklistItemDialog:
                 # JSON이 아니면 단순 문자열로 처리 (오류 아님)
                 pass
 
-        # 저장
-        try:
+        # 중복 체크 (추가 모드)
+        if self.mode == "add":
+            try:
+                with self.db_schema.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT id FROM QC_Checklist_Items WHERE item_name = ?", (item_name,))
+                    exists = cursor.fetchone() is not None
+            except Exception as e:
+                messagebox.showerror("오류", f"저장 실패:\n{str(e)}")
+                return
+            if exists:
+                messagebox.showerror("오류", f"'{item_name}' 항목이 이미 존재합니다.")
+                return
+
+        values = (spec_min, spec_max, expected_value, category, description, is_active)
+
+        def save_item():
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
                 if self.mode == "add":
-                    # 중복 체크
-                    cursor.execute("SELECT id FROM QC_Checklist_Items WHERE item_name = ?", (item_name,))
-                    if cursor.fetchone():
-                        messagebox.showerror("오류", f"'{item_name}' 항목이 이미 존재합니다.")
-                        return
-
                     # 삽입
                     cursor.execute("""
                         INSERT INTO QC_Checklist_Items
                         (item_name, spec_min, spec_max, expected_value, category, description, is_active)
                         VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (item_name, spec_min, spec_max, expected_value, category, description, is_active))
+                    """, (item_name,) + values)
 
                     new_id = cursor.lastrowid
 
@@ -763,7 +824,7 @@ class ChecklistItemDialog:
                         SET spec_min = ?, spec_max = ?, expected_value = ?,
                             category = ?, description = ?, is_active = ?
                         WHERE id = ?
-                    """, (spec_min, spec_max, expected_value, category, description, is_active, item_id))
+                    """, values + (item_id,))
 
                     # Audit Log 기록
                     cursor.execute("""
@@ -774,8 +835,19 @@ class ChecklistItemDialog:
 
                 conn.commit()
 
-            self.result = True
+        # 저장 중 중복 제출 방지 (완료 시 다이얼로그 닫힘)
+        self.save_button.config(state=tk.DISABLED)
+        self.submit_write(save_item, callback=self._on_saved, error_callback=self._on_save_failed)
+
+    def _on_saved(self, _):
+        """저장 완료 (Tk 메인 스레드)"""
+        self.result = True
+        if self.dialog.winfo_exists():
             self.dialog.destroy()
 
-        except Exception as e:
-            messagebox.showerror("오류", f"저장 실패:\n{str(e)}")
+    def _on_save_failed(self, error):
+        """저장 실패 (Tk 메인 스레드)"""
+        if not self.dialog.winfo_exists():
+            return
+        self.save_button.config(state=tk.NORMAL)
+        messagebox.showerror("오류", f"저장 실패:\n{str(error)}")
@@ -19,15 +19,22 @@ from datetime import datetime
 class ConfigurationExceptionsDialog:
     """Configuration별 Checklist 예외 관리 Dialog"""
 
-    def __init__(self, parent, db_schema):
+    def __init__(self, parent, db_schema, submit_write=None):
         """
         Args:
             parent: 부모 윈도우
             db_schema: DBSchema 인스턴스
+            submit_write: 쓰기 작업 제출 함수 (DBManager.submit_write, None이면 바로 실행)
         """
         self.parent = parent
         self.db_schema = db_schema
+        if submit_write is None:
+            from app.services.common.write_queue import run_write_now
+            submit_write = run_write_now
+        self.submit_write = submit_write
         self.current_configuration_id = None
+        self._types_by_model = {}
+        self._configs_by_type = {}
 
         # 다이얼로그 생성
         self.dialog = tk.Toplevel(parent)
@@ -164,7 +171,7 @@ class ConfigurationExceptionsDialog:
         ).pack()
 
     def _load_configurations(self):
-        """Equipment Models 로드"""
+        """Equipment Models / Types / Configurations 로드 (쿼리 3회, 선택 변경은 메모리에서 처리)"""
         try:
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
@@ -177,86 +184,75 @@ class ConfigurationExceptionsDialog:
                 """)
                 models = cursor.fetchall()
 
-                self.model_combo['values'] = [f"{m[0]}: {m[1]}" for m in models]
-                if models:
-                    self.model_combo.current(0)
-                    self._on_model_selected()
+                # Equipment Types 로드 (Model별로 묶음)
+                cursor.execute("""
+                    SELECT id, type_name, model_id
+                    FROM Equipment_Types
+                    ORDER BY type_name
+                """)
+                self._types_by_model = {}
+                for type_id, type_name, model_id in cursor.fetchall():
+                    self._types_by_model.setdefault(model_id, []).append((type_id, type_name))
+
+                # Equipment Configurations 로드 (Type별로 묶음)
+                cursor.execute("""
+                    SELECT id, config_name, customer_name, equipment_type_id
+                    FROM Equipment_Configurations
+                    ORDER BY config_name
+                """)
+                self._configs_by_type = {}
+                for config_id, config_name, customer_name, type_id in cursor.fetchall():
+                    self._configs_by_type.setdefault(type_id, []).append((config_id, config_name, customer_name))
+
+            self.model_combo['values'] = [f"{m[0]}: {m[1]}" for m in models]
+            if models:
+                self.model_combo.current(0)
+                self._on_model_selected()
 
         except Exception as e:
             messagebox.showerror("오류", f"Configuration 로드 실패:\n{str(e)}")
 
     def _on_model_selected(self):
-        """Model 선택 시 Types 로드"""
+        """Model 선택 시 Types 표시"""
         selected = self.model_combo.get()
         if not selected:
             return
 
         model_id = int(selected.split(":")[0])
+        types = self._types_by_model.get(model_id, [])
 
-        try:
-            with self.db_schema.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Equipment Types 로드
-                cursor.execute("""
-                    SELECT id, type_name
-                    FROM Equipment_Types
-                    WHERE model_id = ?
-                    ORDER BY type_name
-                """, (model_id,))
-                types = cursor.fetchall()
-
-                self.type_combo['values'] = [f"{t[0]}: {t[1]}" for t in types]
-                if types:
-                    self.type_combo.current(0)
-                    self._on_type_selected()
-                else:
-                    self.type_combo['values'] = []
-                    self.config_combo['values'] = []
-
-        except Exception as e:
-            messagebox.showerror("오류", f"Equipment Type 로드 실패:\n{str(e)}")
+        self.type_combo['values'] = [f"{t[0]}: {t[1]}" for t in types]
+        if types:
+            self.type_combo.current(0)
+            self._on_type_selected()
+        else:
+            self.type_combo['values'] = []
+            self.config_combo['values'] = []
 
     def _on_type_selected(self):
-        """Type 선택 시 Configurations 로드"""
+        """Type 선택 시 Configurations 표시"""
         selected = self.type_combo.get()
         if not selected:
             return
 
         type_id = int(selected.split(":")[0])
-
-        try:
-            with self.db_schema.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Equipment Configurations 로드
-                cursor.execute("""
-                    SELECT id, config_name, port_type, wafer_sizes, customer_name
-                    FROM Equipment_Configurations
-                    WHERE equipment_type_id = ?
-                    ORDER BY config_name
-                """, (type_id,))
-                configs = cursor.fetchall()
-
-                config_values = []
-                for c in configs:
-                    config_id, config_name, port_type, wafer_sizes, customer_name = c
-                    display = f"{config_id}: {config_name}"
-                    if customer_name:
-                        display += f" (Customer: {customer_name})"
-                    config_values.append(display)
-
-                self.config_combo['values'] = config_values
-                if configs:
-                    self.config_combo.current(0)
-                    self._on_configuration_selected()
-                else:
-                    self.config_combo['values'] = []
-                    self.current_configuration_id = None
-                    self._refresh_exceptions()
-
-        except Exception as e:
-            messagebox.showerror("오류", f"Configuration 로드 실패:\n{str(e)}")
+        configs = self._configs_by_type.get(type_id, [])
+
+        config_values = []
+        for config_id, config_name, customer_name in configs:
+            display = f"{config_id}: {config_name}"
+            if customer_name:
+                display += f" (Customer: {customer_name})"
+            config_values.append(display)
+
+        self.config_combo['values'] = config_values
+        if configs:
+            self.config_combo.current(0)
+            self._on_configuration_selected()
+        else:
+            self.config_combo['values'] = []
+            self.current_configuration_id = None
+            self._refresh_exceptions()
 
     def _on_configuration_selected(self):
         """Configuration 선택 시 예외 목록 로드"""
@@ -319,7 +315,8 @@ class ConfigurationExceptionsDialog:
             return
 
         # 예외 추가 Dialog 열기
-        dialog = AddExceptionDialog(self.dialog, self.db_schema, self.current_configuration_id)
+        dialog = AddExceptionDialog(self.dialog, self.db_schema, self.current_configuration_id,
+                                    submit_write=self.submit_write)
         self.dialog.wait_window(dialog.dialog)
 
         if dialog.result:
@@ -342,7 +339,7 @@ class ConfigurationExceptionsDialog:
         exception_id = int(item_values[0])
         item_name = item_values[1]
 
-        try:
+        def remove_exception():
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -359,25 +356,38 @@ class ConfigurationExceptionsDialog:
 
                 conn.commit()
 
-            self._refresh_exceptions()
-            messagebox.showinfo("성공", "예외가 제거되었습니다.")
+        self.submit_write(remove_exception, callback=self._on_removed, error_callback=self._on_remove_failed)
 
-        except Exception as e:
-            messagebox.showerror("오류", f"예외 제거 실패:\n{str(e)}")
+    def _on_removed(self, _):
+        """예외 제거 완료 (Tk 메인 스레드)"""
+        if not self.dialog.winfo_exists():
+            return
+        self._refresh_exceptions()
+        messagebox.showinfo("성공", "예외가 제거되었습니다.")
+
+    def _on_remove_failed(self, error):
+        """예외 제거 실패 (Tk 메인 스레드)"""
+        if self.dialog.winfo_exists():
+            messagebox.showerror("오류", f"예외 제거 실패:\n{str(error)}")
 
 
 class AddExceptionDialog:
     """예외 추가 다이얼로그"""
 
-    def __init__(self, parent, db_schema, configuration_id):
+    def __init__(self, parent, db_schema, configuration_id, submit_write=None):
         """
         Args:
             parent: 부모 윈도우
             db_schema: DBSchema 인스턴스
             configuration_id: Configuration ID
+            submit_write: 쓰기 작업 제출 함수 (None이면 바로 실행)
         """
         self.parent = parent
         self.db_schema = db_schema
+        if submit_write is None:
+            from app.services.common.write_queue import run_write_now
+            submit_write = run_write_now
+        self.submit_write = submit_write
         self.configuration_id = configuration_id
         self.result = None
 
@@ -430,12 +440,13 @@ class AddExceptionDialog:
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(pady=(10, 0))
 
-        ttk.Button(
+        self.add_button = ttk.Button(
             btn_frame,
             text="추가",
             command=self._add,
             width=15
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.add_button.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
             btn_frame,
@@ -495,8 +506,9 @@ class AddExceptionDialog:
         # 승인일 (현재 시각)
         approved_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # 추가
-        try:
+        configuration_id = self.configuration_id
+
+        def add_exception():
             with self.db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -505,7 +517,7 @@ class AddExceptionDialog:
                     INSERT INTO Equipment_Checklist_Exceptions
                     (configuration_id, checklist_item_id, reason, approved_by, approved_date)
                     VALUES (?, ?, ?, ?, ?)
-                """, (self.configuration_id, checklist_item_id, reason, approver, approved_date))
+                """, (configuration_id, checklist_item_id, reason, approver, approved_date))
 
                 exception_id = cursor.lastrowid
 
@@ -515,13 +527,24 @@ class AddExceptionDialog:
                     (action, target_table, target_id, new_value, reason, user, timestamp)
                     VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
                 """, ("ADD", "Equipment_Checklist_Exceptions", exception_id,
-                      f"config_id={self.configuration_id}, item_id={checklist_item_id}",
+                      f"config_id={configuration_id}, item_id={checklist_item_id}",
                       reason, approver))
 
                 conn.commit()
 
-            self.result = True
+        # 추가 중 중복 제출 방지 (완료 시 다이얼로그 닫힘)
+        self.add_button.config(state=tk.DISABLED)
+        self.submit_write(add_exception, callback=self._on_added, error_callback=self._on_add_failed)
+
+    def _on_added(self, _):
+        """예외 추가 완료 (Tk 메인 스레드)"""
+        self.result = True
+        if self.dialog.winfo_exists():
             self.dialog.destroy()
 
-        except Exception as e:
-            messagebox.showerror("오류", f"예외 추가 실패:\n{str(e)}")
+    def _on_add_failed(self, error):
+        """예외 추가 실패 (Tk 메인 스레드)"""
+        if not self.dialog.winfo_exists():
+            return
+        self.add_button.config(state=tk.NORMAL)
+        messagebox.showerror("오류", f"예외 추가 실패:\n{str(error)}")
@@ -0,0 +1,200 @@
+"""
+Memory Report Dialog
+
+메모리 리포트 UI (관리자 전용)
+- 분류별 현재 개수 / 크기와 첫 스냅샷 대비 증가량
+  (데이터셋, 병합 프레임, 뷰 행, 캐시 항목, Tk 위젯 / 트리 항목 / 변수 / 콜백)
+- 스냅샷 목록 (주기 스냅샷 + 수동 스냅샷)
+- tracemalloc 할당 위치 상위 목록 (켰을 때만)
+- JSON 내보내기
+
+파일 세트를 로드 → 해제한 뒤 "GC 후 스냅샷"을 찍어 증가량이 0으로 돌아오는지 확인합니다.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime
+
+from app.memory_tracker import memory_tracker
+
+
+def _format_kb(value):
+    return "-" if value is None else f"{value:,.0f}"
+
+
+def _format_bytes(value):
+    return "-" if value is None else f"{value / 1024:,.1f}"
+
+
+def _format_delta(value, scale=1):
+    if value is None:
+        return "-"
+    value = value / scale
+    return f"+{value:,.0f}" if value > 0 else f"{value:,.0f}"
+
+
+class MemoryReportDialog:
+    """메모리 리포트 Dialog"""
+
+    def __init__(self, parent, tracker=None):
+        """
+        Args:
+            parent: 부모 윈도우
+            tracker: MemoryTracker 인스턴스 (기본: 전역 기록기)
+        """
+        self.parent = parent
+        self.tracker = tracker or memory_tracker
+
+        # 다이얼로그 생성 (로드 / 해제를 반복하며 볼 수 있도록 모달로 만들지 않음)
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("메모리 리포트 (관리자 전용)")
+        self.dialog.geometry("1000x680")
+        self.dialog.transient(parent)
+
+        self._create_ui()
+        self.take_snapshot("리포트 열기")
+
+    def _create_ui(self):
+        """UI 생성"""
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 상단: 프로세스 메모리 / tracemalloc
+        status_frame = ttk.Frame(main_frame)
+        status_frame.pack(fill=tk.X, pady=(0, 10))
+
+        self.tracing_var = tk.BooleanVar(value=self.tracker.tracing())
+        ttk.Checkbutton(status_frame, text="할당 위치 추적 (tracemalloc, 느려짐)", variable=self.tracing_var,
+                        command=self._toggle_tracing).pack(side=tk.LEFT)
+        self.status_label = ttk.Label(status_frame, text="", foreground="gray")
+        self.status_label.pack(side=tk.LEFT, padx=(15, 0))
+
+        paned = ttk.PanedWindow(main_frame, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        # 분류별 현재 값
+        category_frame = ttk.LabelFrame(paned, text="분류별 (첫 스냅샷 대비)", padding="5")
+        columns = ("category", "count", "size_kb", "count_delta", "size_delta")
+        headings = ("분류", "개수", "크기(KB)", "개수 증가", "크기 증가(KB)")
+        widths = (300, 110, 130, 110, 130)
+        self.category_tree = self._create_tree(category_frame, columns, headings, widths)
+        self.category_tree.tag_configure('growing', foreground='red')
+        paned.add(category_frame, weight=2)
+
+        # 스냅샷 목록
+        snapshot_frame = ttk.LabelFrame(
+            paned, text=f"스냅샷 (최근 {self.tracker.capacity}개 보관)", padding="5")
+        columns = ("time", "label", "rss_kb", "traced_kb", "growing")
+        headings = ("시각", "설명", "RSS(KB)", "추적 할당(KB)", "증가 분류 (이전 대비)")
+        widths = (140, 140, 110, 120, 450)
+        self.snapshot_tree = self._create_tree(snapshot_frame, columns, headings, widths)
+        paned.add(snapshot_frame, weight=1)
+
+        # 할당 위치
+        allocation_frame = ttk.LabelFrame(paned, text="할당 위치 상위 (tracemalloc)", padding="5")
+        columns = ("location", "size_kb", "count")
+        headings = ("위치", "크기(KB)", "블록 수")
+        widths = (650, 120, 100)
+        self.allocation_tree = self._create_tree(allocation_frame, columns, headings, widths)
+        paned.add(allocation_frame, weight=1)
+
+        # 버튼
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+
+        ttk.Button(btn_frame, text="📸 스냅샷", command=lambda: self.take_snapshot("수동")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="🧹 GC 후 스냅샷",
+                   command=lambda: self.take_snapshot("GC 후", collect_garbage=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="🗑️ 초기화", command=self._clear).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="닫기", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="📄 JSON 내보내기", command=self._export_json).pack(side=tk.RIGHT, padx=5)
+
+    def _create_tree(self, parent, columns, headings, widths):
+        """스크롤바 포함 트리뷰 생성"""
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=8)
+        for column, heading, width in zip(columns, headings, widths):
+            tree.heading(column, text=heading)
+            anchor = "w" if column in ("category", "label", "growing", "location", "time") else "e"
+            tree.column(column, width=width, anchor=anchor)
+
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return tree
+
+    def take_snapshot(self, label, collect_garbage=False):
+        self.tracker.snapshot(label, collect_garbage=collect_garbage)
+        self.refresh()
+
+    def refresh(self):
+        """기록 내용 다시 표시"""
+        snapshots = self.tracker.snapshots()
+
+        self.category_tree.delete(*self.category_tree.get_children())
+        if snapshots:
+            first, last = snapshots[0], snapshots[-1]
+            for name, current in sorted(last.categories.items()):
+                previous = first.categories.get(name, {})
+                count_delta = self._delta(previous.get('count'), current.get('count'))
+                size_delta = self._delta(previous.get('bytes'), current.get('bytes'))
+                growing = (count_delta or 0) > 0 or (size_delta or 0) > 0
+                count = current.get('error') or current.get('count')
+                self.category_tree.insert("", "end", tags=('growing',) if growing else (), values=(
+                    name, "-" if count is None else count, _format_bytes(current.get('bytes')),
+                    _format_delta(count_delta), _format_delta(size_delta, 1024)
+                ))
+
+        self.snapshot_tree.delete(*self.snapshot_tree.get_children())
+        previous = None
+        for record in snapshots:
+            growing = ""
+            if previous is not None:
+                growing = ", ".join(
+                    f"{entry['category']} {_format_delta(entry['count_delta'])}"
+                    for entry in self.tracker.growth(previous, record)[:5]
+                )
+            self.snapshot_tree.insert("", 0, values=(
+                datetime.fromtimestamp(record.timestamp).strftime("%m-%d %H:%M:%S"), record.label,
+                _format_kb(record.rss_kb), _format_kb(record.traced_kb), growing
+            ))
+            previous = record
+
+        self.allocation_tree.delete(*self.allocation_tree.get_children())
+        for entry in self.tracker.top_allocations():
+            self.allocation_tree.insert("", "end", values=(
+                entry['location'], f"{entry['size_kb']:,.1f}", entry['count']
+            ))
+
+        rss = snapshots[-1].rss_kb if snapshots else None
+        self.status_label.config(text=f"RSS {_format_kb(rss)} KB · 스냅샷 {len(snapshots)}개")
+
+    @staticmethod
+    def _delta(before, after):
+        if after is None:
+            return None
+        return after - (before or 0)
+
+    def _toggle_tracing(self):
+        self.tracker.set_tracing(self.tracing_var.get())
+        self.refresh()
+
+    def _clear(self):
+        self.tracker.clear()
+        self.take_snapshot("초기화")
+
+    def _export_json(self):
+        file_path = filedialog.asksaveasfilename(
+            parent=self.dialog,
+            title="메모리 리포트 JSON 내보내기",
+            defaultextension=".json",
+            initialfile=f"memory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        try:
+            self.tracker.export_json(file_path)
+            messagebox.showinfo("완료", f"내보내기 완료:\n{file_path}", parent=self.dialog)
+        except Exception as e:
+            messagebox.showerror("오류", f"내보내기 실패:\n{str(e)}", parent=self.dialog)
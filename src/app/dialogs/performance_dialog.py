@@ -0,0 +1,165 @@
+"""
+Performance Dialog
+
+성능 진단 UI (관리자 전용)
+- 구간별 집계 (횟수, 총/평균/최대 시간)
+- 최근 구간 목록 (SQL 쿼리, 행 수 등 속성 포함)
+- 카운터 (캐시 적중/실패 등)
+- JSON / Chrome trace 내보내기
+
+"느리다"는 문의가 오면 문제 상황을 재현한 뒤 Chrome trace로 내보내
+chrome://tracing 또는 ui.perfetto.dev 에서 확인합니다.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime
+
+from app.instrumentation import instrumentation
+
+
+RECENT_LIMIT = 300
+
+
+class PerformanceDialog:
+    """성능 진단 Dialog"""
+
+    def __init__(self, parent, recorder=None):
+        """
+        Args:
+            parent: 부모 윈도우
+            recorder: Instrumentation 인스턴스 (기본: 전역 기록기)
+        """
+        self.parent = parent
+        self.recorder = recorder or instrumentation
+
+        # 다이얼로그 생성 (문제 상황을 재현할 수 있도록 모달로 만들지 않음)
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Performance 진단 (관리자 전용)")
+        self.dialog.geometry("1000x650")
+        self.dialog.transient(parent)
+
+        self._create_ui()
+        self.refresh()
+
+    def _create_ui(self):
+        """UI 생성"""
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 상단: 기록 상태 / 카운터
+        status_frame = ttk.Frame(main_frame)
+        status_frame.pack(fill=tk.X, pady=(0, 10))
+
+        self.enabled_var = tk.BooleanVar(value=self.recorder.enabled)
+        ttk.Checkbutton(status_frame, text="계측 기록", variable=self.enabled_var,
+                        command=self._toggle_enabled).pack(side=tk.LEFT)
+        self.status_label = ttk.Label(status_frame, text="", foreground="gray")
+        self.status_label.pack(side=tk.LEFT, padx=(15, 0))
+
+        self.counter_label = ttk.Label(main_frame, text="", anchor="w", justify=tk.LEFT)
+        self.counter_label.pack(fill=tk.X, pady=(0, 10))
+
+        paned = ttk.PanedWindow(main_frame, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        # 구간별 집계
+        summary_frame = ttk.LabelFrame(paned, text="구간별 집계", padding="5")
+        columns = ("name", "category", "count", "total_ms", "avg_ms", "max_ms")
+        headings = ("구간", "분류", "횟수", "총 시간(ms)", "평균(ms)", "최대(ms)")
+        widths = (280, 80, 70, 110, 100, 100)
+        self.summary_tree = self._create_tree(summary_frame, columns, headings, widths)
+        paned.add(summary_frame, weight=1)
+
+        # 최근 구간
+        recent_frame = ttk.LabelFrame(paned, text=f"최근 구간 (최대 {RECENT_LIMIT}개)", padding="5")
+        columns = ("start_ms", "name", "duration_ms", "thread", "args")
+        headings = ("시작(ms)", "구간", "시간(ms)", "스레드", "속성")
+        widths = (90, 200, 90, 110, 450)
+        self.recent_tree = self._create_tree(recent_frame, columns, headings, widths)
+        paned.add(recent_frame, weight=1)
+
+        # 버튼
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+
+        ttk.Button(btn_frame, text="🔄 새로고침", command=self.refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="🗑️ 초기화", command=self._clear).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="닫기", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="📤 Chrome Trace 내보내기",
+                   command=self._export_chrome_trace).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="📄 JSON 내보내기",
+                   command=self._export_json).pack(side=tk.RIGHT, padx=5)
+
+    def _create_tree(self, parent, columns, headings, widths):
+        """스크롤바 포함 트리뷰 생성"""
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=8)
+        for column, heading, width in zip(columns, headings, widths):
+            tree.heading(column, text=heading)
+            anchor = "w" if column in ("name", "args", "category") else "e"
+            tree.column(column, width=width, anchor=anchor)
+
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return tree
+
+    def refresh(self):
+        """기록 내용 다시 표시"""
+        self.summary_tree.delete(*self.summary_tree.get_children())
+        for entry in self.recorder.summary():
+            self.summary_tree.insert("", "end", values=(
+                entry['name'], entry['category'], entry['count'],
+                f"{entry['total_ms']:.1f}", f"{entry['avg_ms']:.2f}", f"{entry['max_ms']:.2f}"
+            ))
+
+        self.recent_tree.delete(*self.recent_tree.get_children())
+        for record in reversed(self.recorder.recent_spans(limit=RECENT_LIMIT)):
+            args = ", ".join(f"{key}={value}" for key, value in record.args.items())
+            self.recent_tree.insert("", "end", values=(
+                f"{record.start_us / 1000:.1f}", record.name, f"{record.duration_ms:.2f}",
+                record.thread_id, args.replace("\n", " ")
+            ))
+
+        counters = self.recorder.counters()
+        hits, misses = counters.get('cache.hit', 0), counters.get('cache.miss', 0)
+        lines = [f"캐시 적중률: {hits / (hits + misses) * 100:.1f}% ({hits}/{hits + misses})"
+                 if hits + misses else "캐시 적중률: -"]
+        others = [f"{name}={value}" for name, value in sorted(counters.items())
+                  if name not in ('cache.hit', 'cache.miss')]
+        if others:
+            lines.append("카운터: " + ", ".join(others))
+        self.counter_label.config(text="\n".join(lines))
+
+        spans = len(self.recorder.recent_spans())
+        self.status_label.config(text=f"버퍼 {spans}/{self.recorder.capacity}개 구간")
+
+    def _toggle_enabled(self):
+        self.recorder.enabled = self.enabled_var.get()
+
+    def _clear(self):
+        self.recorder.clear()
+        self.refresh()
+
+    def _export(self, title, default_name, export_func):
+        file_path = filedialog.asksaveasfilename(
+            parent=self.dialog,
+            title=title,
+            defaultextension=".json",
+            initialfile=f"{default_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        try:
+            export_func(file_path)
+            messagebox.showinfo("완료", f"내보내기 완료:\n{file_path}", parent=self.dialog)
+        except Exception as e:
+            messagebox.showerror("오류", f"내보내기 실패:\n{str(e)}", parent=self.dialog)
+
+    def _export_json(self):
+        self._export("성능 기록 JSON 내보내기", "performance", self.recorder.export_json)
+
+    def _export_chrome_trace(self):
+        self._export("Chrome Trace 내보내기", "performance_trace", self.recorder.export_chrome_trace)
@@ -184,12 +184,13 @@ class ShippedEquipmentImportDialog:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
-        ttk.Button(
+        self.import_button = ttk.Button(
             button_frame,
             text="Import",
             command=self._import,
             width=15
-        ).pack(side=tk.RIGHT, padx=(5, 0))
+        )
+        self.import_button.pack(side=tk.RIGHT, padx=(5, 0))
 
         ttk.Button(
             button_frame,
@@ -352,46 +353,76 @@ class ShippedEquipmentImportDialog:
         if not confirm:
             return
 
-        try:
-            # Import 실행
-            file_path = self.file_path_entry.get().strip()
+        # 1. Equipment Type 조회
+        config = self.configuration_service.get_configuration_by_id(configuration_id)
+        if not config:
+            messagebox.showerror("Error", "Configuration not found.")
+            return
 
-            # ShippedEquipmentService.import_from_file() 사용하지 않고 직접 생성
-            # (ship_date, is_refit, original_serial_number, notes를 전달하기 위해)
+        # ShippedEquipmentService.import_from_file() 사용하지 않고 직접 생성
+        # (ship_date, is_refit, original_serial_number, notes를 전달하기 위해)
+        equipment = dict(
+            equipment_type_id=config.type_id,
+            configuration_id=configuration_id,
+            serial_number=self.parse_result.serial_number,
+            customer_name=self.parse_result.customer_name,
+            ship_date=ship_date_obj,
+            is_refit=is_refit,
+            original_serial_number=original_serial if is_refit else None,
+            notes=notes if notes else None
+        )
+        parameters = self.parse_result.parameters
 
-            # 1. Equipment Type 조회
-            config = self.configuration_service.get_configuration_by_id(configuration_id)
-            if not config:
-                messagebox.showerror("Error", "Configuration not found.")
-                return
+        write_queue = self.service_factory.get_write_queue()
+        if write_queue is None:
+            try:
+                self._on_import_done(self._import_equipment(equipment, parameters))
+            except Exception as e:
+                self._on_import_error(e)
+            return
+
+        # 쓰기 스레드에서 실행 (장비 생성 + 파라미터 삽입을 한 작업으로 → 실패 시 둘 다 취소)
+        self.import_button.config(state=tk.DISABLED, text="Importing...")
+        self.dialog.config(cursor="watch")
+        write_queue.submit(
+            self._import_equipment, equipment, parameters,
+            callback=self._on_import_done,
+            error_callback=self._on_import_error
+        )
 
-            # 2. Shipped Equipment 생성
-            equipment_id = self.shipped_service.create_shipped_equipment(
-                equipment_type_id=config.type_id,
-                configuration_id=configuration_id,
-                serial_number=self.parse_result.serial_number,
-                customer_name=self.parse_result.customer_name,
-                ship_date=ship_date_obj,
-                is_refit=is_refit,
-                original_serial_number=original_serial if is_refit else None,
-                notes=notes if notes else None
-            )
-
-            # 3. 파라미터 일괄 삽입
-            param_count = self.shipped_service.add_parameters_bulk(equipment_id, self.parse_result.parameters)
-
-            messagebox.showinfo(
-                "Import Success",
-                f"Equipment imported successfully!\n\n"
-                f"Equipment ID: {equipment_id}\n"
-                f"Serial: {self.parse_result.serial_number}\n"
-                f"Parameters: {param_count}"
-            )
-
-            # 다이얼로그 닫기
+    def _import_equipment(self, equipment, parameters):
+        """장비 생성 + 파라미터 일괄 삽입 → (equipment_id, 파라미터 수)"""
+        # 2. Shipped Equipment 생성
+        equipment_id = self.shipped_service.create_shipped_equipment(**equipment)
+
+        # 3. 파라미터 일괄 삽입
+        param_count = self.shipped_service.add_parameters_bulk(equipment_id, parameters)
+        return equipment_id, param_count
+
+    def _restore_import_button(self):
+        if self.dialog.winfo_exists():
+            self.import_button.config(state=tk.NORMAL, text="Import")
+            self.dialog.config(cursor="")
+
+    def _on_import_done(self, result):
+        """임포트 완료 (Tk 메인 스레드)"""
+        equipment_id, param_count = result
+        self._restore_import_button()
+        messagebox.showinfo(
+            "Import Success",
+            f"Equipment imported successfully!\n\n"
+            f"Equipment ID: {equipment_id}\n"
+            f"Serial: {self.parse_result.serial_number}\n"
+            f"Parameters: {param_count}"
+        )
+
+        # 다이얼로그 닫기
+        if self.dialog.winfo_exists():
             self.dialog.destroy()
 
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to import equipment:\n{e}")
-            import traceback
-            traceback.print_exc()
+    def _on_import_error(self, error):
+        """임포트 실패 (Tk 메인 스레드)"""
+        self._restore_import_button()
+        messagebox.showerror("Import Error", f"Failed to import equipment:\n{error}")
+        import traceback
+        traceback.print_exception(type(error), error, error.__traceback__)
@@ -2,6 +2,8 @@
 Shipped Equipment List 관리 다이얼로그 (Phase 2)
 
 출고 장비 목록을 표시하고, 필터링/검색/정렬 기능을 제공합니다.
+필터와 검색은 SQL로 처리하고 목록은 페이지 단위(keyset)로 읽어,
+스크롤이 끝에 가까워지면 다음 페이지를 붙입니다.
 """
 
 import tkinter as tk
@@ -13,6 +15,8 @@ from typing import Optional, List
 class ShippedEquipmentListDialog:
     """Shipped Equipment List 다이얼로그"""
 
+    PAGE_SIZE = 200
+
     def __init__(self, parent, db_schema, service_factory):
         """
         Args:
@@ -32,6 +36,14 @@ class ShippedEquipmentListDialog:
         self.filter_date_from = None
         self.filter_date_to = None
         self.search_text = ""
+        self._config_ids: List[int] = []
+
+        # 페이지 상태
+        self._last_id: Optional[int] = None
+        self._has_more = False
+        self._loaded_count = 0
+        self._page_pending = False
+        self._total_count = 0
 
         # 다이얼로그 생성
         self.dialog = tk.Toplevel(parent)
@@ -89,6 +101,13 @@ class ShippedEquipmentListDialog:
             width=12
         ).pack(side=tk.LEFT, padx=2)
 
+        ttk.Button(
+            toolbar_frame,
+            text="📊 Matrix",
+            command=self._open_matrix,
+            width=12
+        ).pack(side=tk.LEFT, padx=2)
+
         # 검색 입력 (우측)
         search_frame = ttk.Frame(toolbar_frame)
         search_frame.pack(side=tk.RIGHT, padx=2)
@@ -172,7 +191,8 @@ class ShippedEquipmentListDialog:
         # 스크롤바
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self._vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_scroll, xscrollcommand=hsb.set)
 
         # 배치
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -204,6 +224,15 @@ class ShippedEquipmentListDialog:
             width=15
         ).pack(side=tk.RIGHT)
 
+        self.more_button = ttk.Button(
+            button_frame,
+            text="Load More",
+            command=self._load_next_page,
+            width=15,
+            state=tk.DISABLED
+        )
+        self.more_button.pack(side=tk.RIGHT, padx=5)
+
     def _toggle_filter(self):
         """필터 영역 토글"""
         if self.filter_visible:
@@ -216,32 +245,31 @@ class ShippedEquipmentListDialog:
 
     def _load_filter_options(self):
         """필터 옵션 로드"""
-        # Configuration 목록
+        # Configuration 목록 (콤보 인덱스 - 1 → Configuration ID)
         configurations = []
+        self._config_ids = []
         if self.configuration_service:
             all_configs = self.configuration_service.get_all_configurations()
             configurations = [f"{c.configuration_name}" for c in all_configs]
+            self._config_ids = [c.id for c in all_configs]
 
         self.filter_config_combo['values'] = ["(All)"] + configurations
         self.filter_config_combo.current(0)
 
-        # Customer 목록 (DB에서 가져오기)
+        # Customer 목록
         customers = []
         if self.shipped_service:
-            with self.db_schema.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT customer_name FROM Shipped_Equipment ORDER BY customer_name")
-                customers = [row[0] for row in cursor.fetchall()]
+            customers = self.shipped_service.get_customer_names()
 
         self.filter_customer_combo['values'] = ["(All)"] + customers
         self.filter_customer_combo.current(0)
 
     def _apply_filter(self):
         """필터 적용"""
-        # Configuration 필터
-        config_text = self.filter_config_combo.get()
-        if config_text and config_text != "(All)":
-            self.filter_configuration = config_text
+        # Configuration 필터 (ID)
+        config_index = self.filter_config_combo.current()
+        if config_index > 0:
+            self.filter_configuration = self._config_ids[config_index - 1]
         else:
             self.filter_configuration = None
 
@@ -299,51 +327,45 @@ class ShippedEquipmentListDialog:
         self._load_data()
 
     def _load_data(self):
-        """데이터 로드"""
+        """데이터 로드 (개수 + 첫 페이지)"""
         # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self._last_id = None
+        self._has_more = False
+        self._loaded_count = 0
+        self._total_count = 0
 
         if not self.shipped_service:
+            self._update_stats()
             return
 
-        # 모든 Shipped Equipment 조회
-        equipments = self.shipped_service.get_all_shipped_equipment()
+        self._total_count = self.shipped_service.count_shipped_equipment(**self._filter_kwargs())
+        self._load_next_page()
+
+    def _filter_kwargs(self) -> dict:
+        """현재 필터 / 검색 → 서비스 조회 인자"""
+        return {
+            'configuration_id': self.filter_configuration,
+            'customer_name': self.filter_customer,
+            'start_date': self.filter_date_from,
+            'end_date': self.filter_date_to,
+            'search_text': self.search_text or None,
+        }
+
+    def _load_next_page(self):
+        """다음 페이지를 읽어 목록 끝에 추가"""
+        self._page_pending = False
+        if not self.shipped_service or (self._loaded_count and not self._has_more):
+            return
 
-        # 필터 적용
-        filtered_equipments = []
-        for eq in equipments:
-            # Configuration 필터
-            if self.filter_configuration and eq.configuration_name != self.filter_configuration:
-                continue
-
-            # Customer 필터
-            if self.filter_customer and eq.customer_name != self.filter_customer:
-                continue
-
-            # Date 필터
-            if eq.ship_date:
-                if self.filter_date_from and eq.ship_date < self.filter_date_from:
-                    continue
-                if self.filter_date_to and eq.ship_date > self.filter_date_to:
-                    continue
-
-            # 검색 필터 (Serial, Customer, Model, Type, Configuration)
-            if self.search_text:
-                search_lower = self.search_text.lower()
-                if not any([
-                    search_lower in (eq.serial_number or "").lower(),
-                    search_lower in (eq.customer_name or "").lower(),
-                    search_lower in (eq.model_name or "").lower(),
-                    search_lower in (eq.type_name or "").lower(),
-                    search_lower in (eq.configuration_name or "").lower()
-                ]):
-                    continue
-
-            filtered_equipments.append(eq)
+        equipments = self.shipped_service.get_shipped_equipment_page(
+            after_id=self._last_id,
+            limit=self.PAGE_SIZE,
+            **self._filter_kwargs()
+        )
 
         # Treeview에 추가
-        for eq in filtered_equipments:
+        for eq in equipments:
             ship_date_str = eq.ship_date.strftime("%Y-%m-%d") if eq.ship_date else ""
             refit_str = "Yes" if eq.is_refit else "No"
 
@@ -357,8 +379,27 @@ class ShippedEquipmentListDialog:
                 refit_str
             ), tags=(str(eq.id),))
 
-        # 통계 업데이트
-        self.stats_label.config(text=f"Total: {len(filtered_equipments)} equipment")
+        if equipments:
+            self._last_id = equipments[-1].id
+        self._loaded_count += len(equipments)
+        self._has_more = len(equipments) == self.PAGE_SIZE
+        self._update_stats()
+
+    def _on_tree_scroll(self, first, last):
+        """스크롤바 갱신 + 끝에 가까워지면 다음 페이지 로드"""
+        self._vsb.set(first, last)
+        if self._has_more and not self._page_pending and float(last) >= 0.9:
+            self._page_pending = True
+            self.dialog.after_idle(self._load_next_page)
+
+    def _update_stats(self):
+        """통계 / 더 보기 버튼 갱신"""
+        if self._loaded_count < self._total_count:
+            text = f"Showing {self._loaded_count} of {self._total_count} equipment"
+        else:
+            text = f"Total: {self._total_count} equipment"
+        self.stats_label.config(text=text)
+        self.more_button.config(state=tk.NORMAL if self._has_more else tk.DISABLED)
 
     def _refresh(self):
         """새로고침"""
@@ -393,6 +434,32 @@ class ShippedEquipmentListDialog:
             equipment_id
         )
 
+    def _open_matrix(self):
+        """현재 Configuration / Customer 필터의 파라미터 매트릭스 열기"""
+        if not self.filter_configuration and not self.filter_customer:
+            messagebox.showinfo(
+                "Parameter Matrix",
+                "Select a Configuration or Customer filter first.",
+                parent=self.dialog
+            )
+            return
+
+        suffix = " / ".join(
+            text for text in (
+                self.filter_config_combo.get() if self.filter_configuration else None,
+                self.filter_customer
+            ) if text
+        )
+
+        from .shipped_parameter_matrix_dialog import ShippedParameterMatrixDialog
+        ShippedParameterMatrixDialog(
+            self.dialog,
+            self.service_factory,
+            configuration_id=self.filter_configuration,
+            customer_name=self.filter_customer,
+            title_suffix=suffix
+        )
+
     def _delete_equipment(self):
         """장비 삭제"""
         selected = self.tree.selection()
@@ -2,16 +2,23 @@
 Shipped Equipment Parameter View 다이얼로그 (Phase 2)
 
 특정 출고 장비의 파라미터를 조회하고 표시합니다.
+검색은 SQL로 처리하고 파라미터는 이름 순 페이지(keyset)로 읽습니다.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import csv
+
+from app.file_service import export_sheets_in_background
+from app.services.common.export_service import ExportSheet
 
 
 class ShippedEquipmentParameterDialog:
     """Shipped Equipment Parameter View 다이얼로그"""
 
+    PAGE_SIZE = 500
+
+    EXPORT_COLUMNS = ("Parameter Name", "Value", "Module", "Part", "Data Type")
+
     def __init__(self, parent, db_schema, service_factory, equipment_id):
         """
         Args:
@@ -26,10 +33,14 @@ class ShippedEquipmentParameterDialog:
         self.shipped_service = service_factory.get_shipped_equipment_service()
         self.equipment_id = equipment_id
 
-        # 장비 정보 및 파라미터
+        # 장비 정보 및 페이지 상태
         self.equipment = None
-        self.parameters = []
-        self.filtered_parameters = []
+        self._last_name = None
+        self._has_more = False
+        self._loaded_count = 0
+        self._page_pending = False
+        self._total_count = 0
+        self._filtered_count = 0
 
         # 검색 텍스트
         self.search_text = ""
@@ -173,7 +184,8 @@ class ShippedEquipmentParameterDialog:
         # 스크롤바
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self._vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_scroll, xscrollcommand=hsb.set)
 
         # 배치
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -198,26 +210,47 @@ class ShippedEquipmentParameterDialog:
             width=15
         ).pack(side=tk.RIGHT)
 
+        self.more_button = ttk.Button(
+            button_frame,
+            text="Load More",
+            command=self._load_next_page,
+            width=15,
+            state=tk.DISABLED
+        )
+        self.more_button.pack(side=tk.RIGHT, padx=5)
+
     def _load_parameters(self):
-        """파라미터 로드"""
+        """파라미터 로드 (개수 + 첫 페이지)"""
+        self.tree.delete(*self.tree.get_children())
+        self._last_name = None
+        self._has_more = False
+        self._loaded_count = 0
+
         if not self.shipped_service:
             return
 
-        # 파라미터 조회
-        self.parameters = self.shipped_service.get_parameters_by_equipment(self.equipment_id)
-        self.filtered_parameters = self.parameters.copy()
+        self._total_count = self.shipped_service.count_parameters(self.equipment_id)
+        if self.search_text:
+            self._filtered_count = self.shipped_service.count_parameters(self.equipment_id, self.search_text)
+        else:
+            self._filtered_count = self._total_count
 
-        # Treeview에 표시
-        self._update_tree()
+        self._load_next_page()
 
-    def _update_tree(self):
-        """Treeview 업데이트"""
-        # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _load_next_page(self):
+        """다음 페이지를 읽어 목록 끝에 추가"""
+        self._page_pending = False
+        if not self.shipped_service or (self._loaded_count and not self._has_more):
+            return
+
+        parameters = self.shipped_service.get_parameters_page(
+            self.equipment_id,
+            after_name=self._last_name,
+            limit=self.PAGE_SIZE,
+            search_text=self.search_text or None
+        )
 
-        # 필터링된 파라미터 표시
-        for param in self.filtered_parameters:
+        for param in parameters:
             self.tree.insert("", tk.END, values=(
                 param.parameter_name,
                 param.parameter_value,
@@ -226,41 +259,70 @@ class ShippedEquipmentParameterDialog:
                 param.data_type or ""
             ))
 
+        if parameters:
+            self._last_name = parameters[-1].parameter_name
+        self._loaded_count += len(parameters)
+        self._has_more = len(parameters) == self.PAGE_SIZE
+
         # 통계 업데이트
-        self.stats_label.config(text=f"Total: {len(self.filtered_parameters)} parameters (of {len(self.parameters)})")
+        text = f"Total: {self._filtered_count} parameters (of {self._total_count})"
+        if self._loaded_count < self._filtered_count:
+            text += f" - showing {self._loaded_count}"
+        self.stats_label.config(text=text)
+        self.more_button.config(state=tk.NORMAL if self._has_more else tk.DISABLED)
+
+    def _on_tree_scroll(self, first, last):
+        """스크롤바 갱신 + 끝에 가까워지면 다음 페이지 로드"""
+        self._vsb.set(first, last)
+        if self._has_more and not self._page_pending and float(last) >= 0.9:
+            self._page_pending = True
+            self.dialog.after_idle(self._load_next_page)
+
+    def _iter_filtered_parameters(self, search_text=None):
+        """검색 조건의 모든 파라미터 (페이지 단위로 읽음)"""
+        last_name = None
+        while True:
+            page = self.shipped_service.get_parameters_page(
+                self.equipment_id,
+                after_name=last_name,
+                limit=self.PAGE_SIZE,
+                search_text=search_text or None
+            )
+            yield from page
+            if len(page) < self.PAGE_SIZE:
+                return
+            last_name = page[-1].parameter_name
 
     def _apply_search(self):
         """검색 적용"""
-        self.search_text = self.search_entry.get().strip().lower()
-
-        if not self.search_text:
-            self.filtered_parameters = self.parameters.copy()
-        else:
-            # 파라미터 이름, 값, 모듈, 파트에서 검색
-            self.filtered_parameters = [
-                p for p in self.parameters
-                if self.search_text in (p.parameter_name or "").lower()
-                or self.search_text in (p.parameter_value or "").lower()
-                or self.search_text in (p.module or "").lower()
-                or self.search_text in (p.part or "").lower()
-            ]
-
-        self._update_tree()
+        self.search_text = self.search_entry.get().strip()
+        self._load_parameters()
 
     def _clear_search(self):
         """검색 초기화"""
         self.search_entry.delete(0, tk.END)
         self.search_text = ""
-        self.filtered_parameters = self.parameters.copy()
-        self._update_tree()
+        self._load_parameters()
 
     def _refresh(self):
         """새로고침"""
         self._load_parameters()
 
+    def _parameter_columns(self, search_text):
+        """검색 결과 전체 → 내보내기 컬럼 배열 (화면에 읽어 둔 페이지와 무관)"""
+        columns = {name: [] for name in self.EXPORT_COLUMNS}
+        names, values, modules, parts, data_types = columns.values()
+        for param in self._iter_filtered_parameters(search_text):
+            names.append(param.parameter_name)
+            values.append(param.parameter_value)
+            modules.append(param.module or "")
+            parts.append(param.part or "")
+            data_types.append(param.data_type or "")
+        return columns
+
     def _export_csv(self):
-        """CSV로 내보내기"""
-        if not self.filtered_parameters:
+        """CSV로 내보내기 (서비스에서 작업 스레드로 읽어 저장 - 트리 항목은 읽지 않음)"""
+        if not self._filtered_count:
             messagebox.showinfo("No Data", "No parameters to export.")
             return
 
@@ -269,31 +331,14 @@ class ShippedEquipmentParameterDialog:
             parent=self.dialog,
             title="Export Parameters to CSV",
             defaultextension=".csv",
-            filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
+            filetypes=[("CSV Files", "*.csv"), ("TSV Files", "*.tsv"), ("Excel Files", "*.xlsx"), ("All Files", "*.*")],
             initialfile=f"{self.equipment.serial_number}_parameters.csv" if self.equipment else "parameters.csv"
         )
 
         if not file_path:
             return
 
-        try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-
-                # 헤더
-                writer.writerow(["Parameter Name", "Value", "Module", "Part", "Data Type"])
-
-                # 데이터
-                for param in self.filtered_parameters:
-                    writer.writerow([
-                        param.parameter_name,
-                        param.parameter_value,
-                        param.module or "",
-                        param.part or "",
-                        param.data_type or ""
-                    ])
-
-            messagebox.showinfo("Export Success", f"Exported {len(self.filtered_parameters)} parameters to:\n{file_path}")
-
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export CSV:\n{e}")
+        # 검색 조건은 지금 값으로 고정 (저장 중 검색을 바꿔도 영향 없음)
+        search_text = self.search_text
+        sheet = ExportSheet("Parameters", lambda: self._parameter_columns(search_text))
+        export_sheets_in_background(self.dialog, file_path, [sheet], "Export Parameters")
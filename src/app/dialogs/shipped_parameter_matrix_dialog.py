@@ -0,0 +1,245 @@
+"""
+Shipped Parameter Matrix 다이얼로그 (Phase 2)
+
+Configuration / 고객 단위로 출고 장비들의 파라미터를 한 표에서 비교합니다.
+행은 파라미터, 열은 Serial이며 fleet 값과 다른 값(drift)과 숫자 이상치(outlier)를 표시합니다.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from typing import Optional
+
+
+class ShippedParameterMatrixDialog:
+    """Shipped Parameter Matrix 다이얼로그"""
+
+    # Treeview 열이 많으면 그리기가 느려지므로 화면에는 앞쪽 Serial만 표시 (CSV는 전체)
+    MAX_SERIAL_COLUMNS = 100
+
+    DRIFT_MARK = "≠ "
+    OUTLIER_MARK = "⚠ "
+
+    def __init__(self, parent, service_factory, configuration_id: Optional[int] = None,
+                 customer_name: Optional[str] = None, title_suffix: str = ""):
+        """
+        Args:
+            parent: 부모 윈도우
+            service_factory: ServiceFactory 인스턴스
+            configuration_id: Configuration ID 필터
+            customer_name: 고객명 필터
+            title_suffix: 제목에 붙일 필터 설명
+        """
+        self.parent = parent
+        self.shipped_service = service_factory.get_shipped_equipment_service()
+        self.configuration_id = configuration_id
+        self.customer_name = customer_name
+
+        self.matrix = None
+        self.drift = None
+        self.outlier = None
+        self.visible_columns = []
+
+        self.deviating_only_var = tk.BooleanVar(value=True)
+
+        # 다이얼로그 생성
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(f"Parameter Matrix{' - ' + title_suffix if title_suffix else ''}")
+        self.dialog.geometry("1400x800")
+        self.dialog.transient(parent)
+
+        self._create_ui()
+        self._load_matrix()
+
+    def _create_ui(self):
+        """UI 생성"""
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 툴바
+        toolbar_frame = ttk.Frame(main_frame)
+        toolbar_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Button(
+            toolbar_frame,
+            text="🔄 Refresh",
+            command=self._load_matrix,
+            width=12
+        ).pack(side=tk.LEFT, padx=2)
+
+        ttk.Button(
+            toolbar_frame,
+            text="📁 Export CSV",
+            command=self._export_csv,
+            width=12
+        ).pack(side=tk.LEFT, padx=2)
+
+        ttk.Checkbutton(
+            toolbar_frame,
+            text="Deviating parameters only",
+            variable=self.deviating_only_var,
+            command=self._update_tree
+        ).pack(side=tk.LEFT, padx=10)
+
+        search_frame = ttk.Frame(toolbar_frame)
+        search_frame.pack(side=tk.RIGHT, padx=2)
+
+        ttk.Label(search_frame, text="Parameter:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_entry = ttk.Entry(search_frame, width=25)
+        self.search_entry.pack(side=tk.LEFT, padx=(0, 5))
+        self.search_entry.bind("<Return>", lambda e: self._update_tree())
+
+        ttk.Button(
+            search_frame,
+            text="Go",
+            command=self._update_tree,
+            width=5
+        ).pack(side=tk.LEFT)
+
+        # Treeview (열은 매트릭스를 읽은 뒤 설정)
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(tree_frame, show="headings", height=20)
+        self.tree.tag_configure("drift", background="#FFF3CD")
+        self.tree.tag_configure("outlier", background="#F8D7DA")
+
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+
+        # 하단
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+
+        self.stats_label = ttk.Label(button_frame, text="")
+        self.stats_label.pack(side=tk.LEFT)
+
+        ttk.Label(
+            button_frame,
+            text=f"{self.DRIFT_MARK}fleet 값과 다름   {self.OUTLIER_MARK}숫자 이상치",
+            foreground="gray"
+        ).pack(side=tk.LEFT, padx=20)
+
+        ttk.Button(
+            button_frame,
+            text="Close",
+            command=self.dialog.destroy,
+            width=15
+        ).pack(side=tk.RIGHT)
+
+    def _load_matrix(self):
+        """매트릭스 로드"""
+        if not self.shipped_service:
+            return
+
+        self.dialog.config(cursor="watch")
+        self.dialog.update_idletasks()
+        try:
+            self.matrix = self.shipped_service.get_parameter_matrix(
+                configuration_id=self.configuration_id,
+                customer_name=self.customer_name
+            )
+            self.drift = self.matrix.drift_mask()
+            self.outlier = self.matrix.outlier_mask()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build parameter matrix:\n{e}", parent=self.dialog)
+            return
+        finally:
+            self.dialog.config(cursor="")
+
+        serials = self.matrix.serials[:self.MAX_SERIAL_COLUMNS]
+        columns = ["Parameter", "Fleet Value", "Coverage", "Drift", "Outlier"] + [f"s{i}" for i in range(len(serials))]
+        self.tree.configure(columns=columns)
+
+        for column, width in (("Parameter", 260), ("Fleet Value", 120), ("Coverage", 70),
+                              ("Drift", 55), ("Outlier", 60)):
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=width, stretch=False)
+        for i, serial in enumerate(serials):
+            self.tree.heading(f"s{i}", text=serial)
+            self.tree.column(f"s{i}", width=110, stretch=False)
+
+        self._update_tree()
+
+    def _update_tree(self):
+        """표시할 파라미터 행 갱신 (검색 / 편차 필터)"""
+        self.tree.delete(*self.tree.get_children())
+        matrix = self.matrix
+        if matrix is None:
+            return
+
+        rows, cols = matrix.shape
+        shown_serials = min(rows, self.MAX_SERIAL_COLUMNS)
+        drift_counts = self.drift.sum(axis=0)
+        outlier_counts = self.outlier.sum(axis=0)
+
+        search = self.search_entry.get().strip().lower()
+        deviating_only = self.deviating_only_var.get()
+
+        self.visible_columns = []
+        for col in range(cols):
+            name = matrix.parameter_names[col]
+            if search and search not in name.lower():
+                continue
+            if deviating_only and not (drift_counts[col] or outlier_counts[col]):
+                continue
+            self.visible_columns.append(col)
+
+            cells = []
+            for row in range(shown_serials):
+                value = matrix.value(row, col)
+                if value is None:
+                    cells.append("")
+                elif self.outlier[row, col]:
+                    cells.append(self.OUTLIER_MARK + value)
+                elif self.drift[row, col]:
+                    cells.append(self.DRIFT_MARK + value)
+                else:
+                    cells.append(value)
+
+            tag = "outlier" if outlier_counts[col] else ("drift" if drift_counts[col] else "")
+            self.tree.insert("", tk.END, values=[
+                name,
+                matrix.fleet_value(col) or "",
+                f"{matrix.coverage[col]}/{rows}",
+                int(drift_counts[col]),
+                int(outlier_counts[col])
+            ] + cells, tags=(tag,) if tag else ())
+
+        text = f"{rows} equipment × {cols} parameters - showing {len(self.visible_columns)} parameters"
+        if rows > shown_serials:
+            text += f", first {shown_serials} serials (CSV export includes all)"
+        self.stats_label.config(text=text)
+
+    def _export_csv(self):
+        """CSV 내보내기 (표시 중인 파라미터, 전체 Serial)"""
+        if self.matrix is None or not self.visible_columns:
+            messagebox.showinfo("No Data", "No parameters to export.", parent=self.dialog)
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            parent=self.dialog,
+            title="Export Parameter Matrix to CSV",
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
+            initialfile="parameter_matrix.csv"
+        )
+        if not file_path:
+            return
+
+        try:
+            count = self.matrix.export_csv(file_path, columns=self.visible_columns)
+            messagebox.showinfo(
+                "Export Success",
+                f"Exported {count} equipment × {len(self.visible_columns)} parameters to:\n{file_path}",
+                parent=self.dialog
+            )
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export CSV:\n{e}", parent=self.dialog)
@@ -5,12 +5,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 from .loading import LoadingDialog
 from .utils import create_treeview_with_scrollbar
 from .schema import DBSchema
+from .qc.typed_shadow import column_shadow
+from .services.common.chart_service import chart_renderer
 
 class EnhancedQCValidator:
     """향상된 QC 검증 클래스 - Check list 모드 지원"""
@@ -312,41 +312,44 @@ class EnhancedQCValidator:
         """값 범위 고급 분석 - 새로운 검사"""
         results = []
         
-        if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']):
-            for _, row in df.iterrows():
-                try:
-                    if pd.notna(row['min_spec']) and pd.notna(row['max_spec']) and pd.notna(row['default_value']):
-                        min_val = float(row['min_spec'])
-                        max_val = float(row['max_spec'])
-                        default_val = float(row['default_value'])
-                        
-                        # 범위가 너무 넓은 경우
-                        range_ratio = (max_val - min_val) / abs(default_val) if default_val != 0 else float('inf')
-                        if range_ratio > 10:  # 기본값 대비 범위가 10배 이상
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "범위 과도",
-                                "description": f"사양 범위가 기본값 대비 너무 넓습니다 (범위: {min_val}~{max_val}, 기본값: {default_val})",
-                                "severity": "낮음",
-                                "category": "accuracy",
-                                "recommendation": "사양 범위가 적절한지 검토하세요."
-                            })
-                        
-                        # 기본값이 범위의 중앙에서 너무 치우친 경우
-                        if max_val != min_val:
-                            center_position = (default_val - min_val) / (max_val - min_val)
-                            if center_position < 0.1 or center_position > 0.9:
-                                results.append({
-                                    "parameter": row['parameter_name'],
-                                    "issue_type": "기본값 위치 부적절",
-                                    "description": f"기본값이 사양 범위의 {'하한' if center_position < 0.1 else '상한'}에 치우쳐 있습니다",
-                                    "severity": "낮음",
-                                    "category": "accuracy",
-                                    "recommendation": "기본값을 범위의 중앙 근처로 조정하는 것을 고려하세요."
-                                })
-                        
-                except (ValueError, TypeError, ZeroDivisionError):
-                    continue
+        if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']) and not df.empty:
+            # 다른 QC 검사와 공유하는 Typed Shadow로 컬럼 단위 계산
+            # (float() 변환과 같이 '1,000' 같은 쉼표 값은 숫자가 아니므로 검사에서 제외)
+            names = df['parameter_name'].tolist()
+            min_vals = column_shadow(df, 'min_spec').numeric
+            max_vals = column_shadow(df, 'max_spec').numeric
+            default_vals = column_shadow(df, 'default_value').numeric
+            valid = ~(np.isnan(min_vals) | np.isnan(max_vals) | np.isnan(default_vals))
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                span = max_vals - min_vals
+                range_ratio = np.where(default_vals != 0, span / np.abs(default_vals), np.inf)
+                center_position = np.where(span != 0, (default_vals - min_vals) / span, 0.5)
+
+            for i in np.flatnonzero(valid):
+                min_val, max_val, default_val = min_vals[i], max_vals[i], default_vals[i]
+
+                # 범위가 너무 넓은 경우
+                if range_ratio[i] > 10:  # 기본값 대비 범위가 10배 이상
+                    results.append({
+                        "parameter": names[i],
+                        "issue_type": "범위 과도",
+                        "description": f"사양 범위가 기본값 대비 너무 넓습니다 (범위: {min_val}~{max_val}, 기본값: {default_val})",
+                        "severity": "낮음",
+                        "category": "accuracy",
+                        "recommendation": "사양 범위가 적절한지 검토하세요."
+                    })
+
+                # 기본값이 범위의 중앙에서 너무 치우친 경우
+                if max_val != min_val and (center_position[i] < 0.1 or center_position[i] > 0.9):
+                    results.append({
+                        "parameter": names[i],
+                        "issue_type": "기본값 위치 부적절",
+                        "description": f"기본값이 사양 범위의 {'하한' if center_position[i] < 0.1 else '상한'}에 치우쳐 있습니다",
+                        "severity": "낮음",
+                        "category": "accuracy",
+                        "recommendation": "기본값을 범위의 중앙 근처로 조정하는 것을 고려하세요."
+                    })
         
         return results
 
@@ -456,6 +459,79 @@ class EnhancedQCValidator:
         }
 
 
+def draw_enhanced_qc_chart(figure, chart):
+    """QC 검수 결과 분석 차트 (2x2: 심각도 / 카테고리 / 점수 / 검수 정보)"""
+    (ax1, ax2), (ax3, ax4) = figure.subplots(2, 2)
+    figure.suptitle('QC 검수 결과 분석', fontsize=16, fontweight='bold')
+
+    # 1. 심각도별 파이차트
+    severity_data = chart['severity_breakdown']
+    if any(severity_data.values()):
+        colors1 = ['#f44336', '#ff9800', '#9c27b0']
+        labels1 = list(severity_data.keys())
+        sizes1 = list(severity_data.values())
+
+        ax1.pie(sizes1, labels=labels1, colors=colors1, autopct='%1.1f%%', startangle=90)
+    else:
+        ax1.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax1.transAxes)
+    ax1.set_title('심각도별 이슈 분포')
+
+    # 2. 카테고리별 막대차트
+    category_data = chart['category_breakdown']
+    if category_data:
+        categories = list(category_data.keys())
+        counts = list(category_data.values())
+
+        bars = ax2.bar(categories, counts, color=['#2196f3', '#4caf50', '#ff9800', '#9c27b0', '#f44336'])
+        ax2.set_ylabel('이슈 수')
+
+        # 막대 위에 숫자 표시
+        for bar, count in zip(bars, counts):
+            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
+                     str(count), ha='center', va='bottom')
+
+        # x축 라벨 회전
+        ax2.tick_params(axis='x', labelrotation=45)
+        for label in ax2.get_xticklabels():
+            label.set_horizontalalignment('right')
+    else:
+        ax2.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax2.transAxes)
+    ax2.set_title('카테고리별 이슈 분포')
+
+    # 3. QC 점수 게이지 차트 (간단한 막대로 표현)
+    score = chart['overall_score']
+    colors = ['red' if score < 60 else 'orange' if score < 80 else 'green']
+    ax3.barh(['QC 점수'], [score], color=colors)
+    ax3.set_xlim(0, 100)
+    ax3.set_xlabel('점수')
+    ax3.set_title(f'전체 QC 점수: {score:.0f}점')
+
+    # 점수 텍스트 표시
+    ax3.text(score/2, 0, f'{score:.0f}점', ha='center', va='center',
+             fontweight='bold', fontsize=12, color='white')
+
+    # 4. 성능 모드 정보 (텍스트)
+    mode_text = "Check list 중점 검수" if chart['is_checklist_mode'] else "전체 항목 검수"
+
+    info_text = f"""검수 모드: {mode_text}
+총 이슈 수: {chart['total_issues']}개
+높은 심각도: {severity_data.get('높음', 0)}개
+중간 심각도: {severity_data.get('중간', 0)}개
+낮은 심각도: {severity_data.get('낮음', 0)}개
+
+품질 등급: {'우수' if score >= 80 else '보통' if score >= 60 else '개선 필요'}"""
+
+    ax4.text(0.1, 0.9, info_text, transform=ax4.transAxes, fontsize=10,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+    ax4.set_xlim(0, 1)
+    ax4.set_ylim(0, 1)
+    ax4.axis('off')
+    ax4.set_title('검수 정보 요약')
+
+    # 레이아웃 조정
+    figure.tight_layout()
+
+
 def add_enhanced_qc_functions_to_class(cls):
     """
     DBManager 클래스에 향상된 QC 검수 기능을 추가합니다.
@@ -568,6 +644,7 @@ def add_enhanced_qc_functions_to_class(cls):
             # 트리뷰 초기화
             for item in self.qc_result_tree.get_children():
                 self.qc_result_tree.delete(item)
+            self.enhanced_qc_results = []
 
             # 통계 및 차트 프레임 초기화
             for widget in self.stats_summary_frame.winfo_children():
@@ -641,6 +718,8 @@ def add_enhanced_qc_functions_to_class(cls):
                 )
                 
                 self.update_log(f"[DEBUG] QC 검사 완료 - 결과: {len(results)}개")
+                # 결과 트리뷰의 원본 데이터 (내보내기는 트리 항목 대신 이 목록 사용)
+                self.enhanced_qc_results = results
                 
             except Exception as qc_error:
                 loading_dialog.close()
@@ -739,25 +818,11 @@ def add_enhanced_qc_functions_to_class(cls):
             from .qc_utils import QCResultExporter
             
             # 결과가 있는지 확인
-            if not self.qc_result_tree.get_children():
+            results = getattr(self, 'enhanced_qc_results', None)
+            if not results:
                 messagebox.showinfo("알림", "내보낼 QC 결과가 없습니다.")
                 return
             
-            # 트리뷰에서 결과 데이터 수집
-            results = []
-            for item in self.qc_result_tree.get_children():
-                values = self.qc_result_tree.item(item)['values']
-                results.append({
-                    'parameter': values[0],        # itemname
-                    'default_value': values[1],    # default_value
-                    'file_value': values[2],       # file_value
-                    'pass_fail': values[3],        # pass_fail
-                    'issue_type': values[4],       # issue_type
-                    'description': values[5],      # description
-                    'severity': 'N/A',             # 트리뷰에는 없지만 내보내기용
-                    'recommendation': 'N/A'        # 트리뷰에는 없지만 내보내기용
-                })
-            
             # 공통 내보내기 함수 사용
             if QCResultExporter.export_results_to_file(results, "qc_enhanced_results"):
                 self.update_log(f"[QC] Enhanced QC 검수 결과 내보내기 완료")
@@ -827,99 +892,22 @@ def add_enhanced_qc_functions_to_class(cls):
                          font=('Arial', 9), wraplength=400).pack(anchor='w', pady=2)
 
     def create_enhanced_charts(self, summary, is_checklist_mode=False):
-        """향상된 차트 생성"""
-        try:
-            # matplotlib 한글 폰트 설정
-            plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-            plt.rcParams['axes.unicode_minus'] = False
-            
-            # 차트 컨테이너 프레임
-            chart_frame = ttk.Frame(self.chart_container)
-            chart_frame.pack(fill=tk.BOTH, expand=True)
-            
-            # Figure 생성 (2x2 서브플롯)
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle('QC 검수 결과 분석', fontsize=16, fontweight='bold')
-            
-            # 1. 심각도별 파이차트
-            severity_data = summary['severity_breakdown']
-            if any(severity_data.values()):
-                colors1 = ['#f44336', '#ff9800', '#9c27b0']
-                labels1 = list(severity_data.keys())
-                sizes1 = list(severity_data.values())
-                
-                ax1.pie(sizes1, labels=labels1, colors=colors1, autopct='%1.1f%%', startangle=90)
-                ax1.set_title('심각도별 이슈 분포')
-            else:
-                ax1.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax1.transAxes)
-                ax1.set_title('심각도별 이슈 분포')
-            
-            # 2. 카테고리별 막대차트
-            category_data = summary['category_breakdown']
-            if category_data:
-                categories = list(category_data.keys())
-                counts = list(category_data.values())
-                
-                bars = ax2.bar(categories, counts, color=['#2196f3', '#4caf50', '#ff9800', '#9c27b0', '#f44336'])
-                ax2.set_title('카테고리별 이슈 분포')
-                ax2.set_ylabel('이슈 수')
-                
-                # 막대 위에 숫자 표시
-                for bar, count in zip(bars, counts):
-                    ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
-                            str(count), ha='center', va='bottom')
-                
-                # x축 라벨 회전
-                plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-            else:
-                ax2.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax2.transAxes)
-                ax2.set_title('카테고리별 이슈 분포')
-            
-            # 3. QC 점수 게이지 차트 (간단한 막대로 표현)
-            score = summary['overall_score']
-            colors = ['red' if score < 60 else 'orange' if score < 80 else 'green']
-            ax3.barh(['QC 점수'], [score], color=colors)
-            ax3.set_xlim(0, 100)
-            ax3.set_xlabel('점수')
-            ax3.set_title(f'전체 QC 점수: {score:.0f}점')
-            
-            # 점수 텍스트 표시
-            ax3.text(score/2, 0, f'{score:.0f}점', ha='center', va='center', 
-                    fontweight='bold', fontsize=12, color='white')
-            
-            # 4. 성능 모드 정보 (텍스트)
-            mode_text = "Check list 중점 검수" if is_checklist_mode else "전체 항목 검수"
-            total_issues = summary['total_issues']
-            
-            info_text = f"""검수 모드: {mode_text}
-총 이슈 수: {total_issues}개
-높은 심각도: {severity_data.get('높음', 0)}개
-중간 심각도: {severity_data.get('중간', 0)}개
-낮은 심각도: {severity_data.get('낮음', 0)}개
+        """향상된 차트 생성 (작업 스레드에서 그려 이미지로 표시, 같은 요약이면 캐시 사용)"""
+        chart = {
+            'severity_breakdown': dict(summary['severity_breakdown']),
+            'category_breakdown': dict(summary['category_breakdown']),
+            'overall_score': summary['overall_score'],
+            'total_issues': summary['total_issues'],
+            'is_checklist_mode': is_checklist_mode,
+        }
+        key = ('enhanced_qc', tuple(chart['severity_breakdown'].items()),
+               tuple(chart['category_breakdown'].items()), chart['overall_score'],
+               chart['total_issues'], is_checklist_mode)
 
-품질 등급: {'우수' if score >= 80 else '보통' if score >= 60 else '개선 필요'}"""
-            
-            ax4.text(0.1, 0.9, info_text, transform=ax4.transAxes, fontsize=10, 
-                    verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-            ax4.set_xlim(0, 1)
-            ax4.set_ylim(0, 1)
-            ax4.axis('off')
-            ax4.set_title('검수 정보 요약')
-            
-            # 레이아웃 조정
-            plt.tight_layout()
-            
-            # Tkinter에 차트 삽입
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-        except Exception as e:
-            # 차트 생성 실패 시 텍스트로 대체
-            error_label = ttk.Label(self.chart_container, 
-                                  text=f"차트 생성 중 오류 발생: {str(e)}\n\n기본 통계 정보는 '통계 요약' 탭에서 확인하세요.",
-                                  font=('Arial', 10), foreground='red')
-            error_label.pack(pady=20)
+        # 차트 컨테이너 프레임 (실패 시 Label에 오류 문구 표시)
+        chart_frame = ttk.Frame(self.chart_container)
+        chart_frame.pack(fill=tk.BOTH, expand=True)
+        chart_renderer.show(chart_frame, key, draw_enhanced_qc_chart, lambda: chart, figsize=(12, 8))
 
     def _create_new_template(self):
         """새 QC 템플릿 생성"""
@@ -0,0 +1,65 @@
+"""
+비교용 DB 파일 읽기
+
+GUI(load_folder, 파일 추가)와 명령줄 도구(app.cli)가 함께 사용합니다.
+tkinter를 import하지 않으므로 작업 프로세스에서도 불러올 수 있습니다.
+"""
+
+import os
+import sqlite3
+
+from app.instrumentation import span
+
+
+COMPARISON_REQUIRED_COLUMNS = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
+
+
+def read_comparison_file(file_path):
+    """
+    비교용 DB 파일 로드 (.txt / .csv / .db)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        tuple: (파일 이름(확장자 제외), DataFrame) - Model 컬럼 포함
+
+    Raises:
+        Exception: 파일 읽기 실패 시
+    """
+    import pandas as pd
+
+    file_name = os.path.basename(file_path)
+    base_name = os.path.splitext(file_name)[0]
+    ext = os.path.splitext(file_name)[1].lower()
+    with span('file.read', 'io', file=file_name) as s:
+        if ext == '.txt':
+            df = pd.read_csv(file_path, delimiter="\t", dtype=str)
+            # 텍스트 파일의 필수 컬럼 확인 및 추가
+            if all(col in df.columns for col in COMPARISON_REQUIRED_COLUMNS):
+                # 표준 텍스트 파일 형식: ItemType 정보 보존
+                df = df[COMPARISON_REQUIRED_COLUMNS].copy()
+            else:
+                # 호환성을 위한 fallback: 기본 컬럼명 추가
+                if 'ItemType' not in df.columns:
+                    df['ItemType'] = 'double'  # 기본값
+                if 'ItemDescription' not in df.columns:
+                    df['ItemDescription'] = ''
+        elif ext == '.csv':
+            df = pd.read_csv(file_path, dtype=str)
+            # CSV 파일에서도 ItemType 보존 시도
+            if 'ItemType' not in df.columns:
+                df['ItemType'] = 'double'  # 기본값
+        elif ext == '.db':
+            conn = sqlite3.connect(file_path)
+            df = pd.read_sql("SELECT * FROM main_table", conn)
+            conn.close()
+            # DB 파일에서도 ItemType 보존 시도
+            if 'ItemType' not in df.columns:
+                df['ItemType'] = 'double'  # 기본값
+        else:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
+        s.set(rows=len(df))
+
+    df["Model"] = base_name
+    return base_name, df
@@ -2,12 +2,62 @@
 # manager.py에서 추출된 파일 I/O 관련 기능들
 
 import os
-import pandas as pd
 import sqlite3
 from tkinter import filedialog, messagebox
 
+# 비교용 파일 읽기는 tkinter 없는 모듈에 있음 (CLI 공용) - 기존 import 경로 유지
+from app.file_reader import COMPARISON_REQUIRED_COLUMNS, read_comparison_file  # noqa: F401
 
-def export_dataframe_to_file(df, default_filename="export", title="데이터 내보내기"):
+
+_EXPORT_FILETYPES = [
+    ("Excel 파일", "*.xlsx"),
+    ("CSV 파일", "*.csv"),
+    ("TSV 파일 (빠름)", "*.tsv"),
+    ("모든 파일", "*.*")
+]
+
+
+def export_sheets_in_background(parent, file_path, sheets, title="내보내기", on_done=None):
+    """
+    시트들을 작업 스레드에서 저장 (진행률 / 취소 대화상자, 저장 중에도 창은 계속 응답)
+
+    Args:
+        parent: 부모 윈도우 (root.after 폴링에 사용)
+        file_path: 저장 경로 (.xlsx / .csv / .tsv)
+        sheets: ExportSheet 목록 (데이터 대신 함수를 주면 작업 스레드에서 계산)
+        title: 진행 대화상자 제목
+        on_done: 완료 시 저장한 경로 목록을 받는 함수 (Tk 메인 스레드)
+
+    Returns:
+        ExportJob
+    """
+    from app.loading import LoadingDialog
+    from app.services.common.export_service import ExportCancelled, start_export
+
+    job = start_export(file_path, sheets)
+    dialog = LoadingDialog(parent, on_cancel=job.cancel, title=title)
+    dialog.update_progress(0, "내보내기 준비 중...", refresh=False)
+
+    def on_progress(fraction, message):
+        dialog.update_progress(fraction * 100, message or None, refresh=False)
+
+    def on_finished(paths):
+        dialog.close()
+        messagebox.showinfo("완료", "파일이 성공적으로 저장되었습니다:\n" + "\n".join(paths))
+        if on_done is not None:
+            on_done(paths)
+
+    def on_failed(error):
+        dialog.close()
+        if isinstance(error, ExportCancelled):
+            messagebox.showinfo("취소", "내보내기를 취소했습니다.")
+        else:
+            messagebox.showerror("오류", f"내보내기 중 오류 발생: {error}")
+
+    return job.watch(parent, on_progress, on_finished, on_failed)
+
+
+def export_dataframe_to_file(df, default_filename="export", title="데이터 내보내기", parent=None):
     """
     DataFrame을 파일로 내보내기
     
@@ -15,10 +65,13 @@ def export_dataframe_to_file(df, default_filename="export", title="데이터 내
         df: 내보낼 DataFrame
         default_filename: 기본 파일명
         title: 파일 선택 대화상자 제목
+        parent: 지정하면 작업 스레드에서 저장 (진행률 / 취소 표시, 완료는 대화상자로 알림)
         
     Returns:
-        str: 저장된 파일 경로 (취소시 None)
+        str: 저장(시작)한 파일 경로 (취소시 None)
     """
+    from app.services.common.export_service import ExportSheet, write_export
+
     if df is None or df.empty:
         messagebox.showinfo("정보", "내보낼 데이터가 없습니다.")
         return None
@@ -27,20 +80,18 @@ def export_dataframe_to_file(df, default_filename="export", title="데이터 내
         # 파일 저장 대화상자
         filename = filedialog.asksaveasfilename(
             title=title,
+            initialfile=default_filename,
             defaultextension=".xlsx",
-            filetypes=[
-                ("Excel files", "*.xlsx"),
-                ("CSV files", "*.csv"),
-                ("All files", "*.*")
-            ]
+            filetypes=_EXPORT_FILETYPES
         )
         
         if filename:
-            if filename.endswith('.xlsx'):
-                df.to_excel(filename, index=False)
-            else:
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
-            
+            sheets = [ExportSheet("Sheet1", df)]
+            if parent is not None:
+                export_sheets_in_background(parent, filename, sheets, title)
+                return filename
+
+            write_export(filename, sheets)
             messagebox.showinfo("완료", f"데이터가 성공적으로 내보내졌습니다:\n{filename}")
             return filename
         
@@ -51,48 +102,46 @@ def export_dataframe_to_file(df, default_filename="export", title="데이터 내
         return None
 
 
-def export_tree_data_to_file(tree_widget, columns, file_names=None, title="보고서 내보내기"):
+def export_table_model_to_file(model, title="보고서 내보내기", parent=None, default_filename="report"):
     """
-    TreeView 데이터를 파일로 내보내기
-    
+    뷰의 표 모델(TableModel)을 파일로 내보내기
+
+    트리 항목 대신 모델의 컬럼 배열 + 표시 행에서 바로 저장하므로 행 수와 무관하게
+    Tk 위젯을 읽지 않습니다 (표시 행 추출도 작업 스레드에서 실행).
+
     Args:
-        tree_widget: tkinter TreeView 위젯
-        columns: 컬럼 이름 리스트
-        file_names: 추가 컬럼 이름들 (옵션)
+        model: app.view_model.TableModel
         title: 파일 선택 대화상자 제목
-        
+        parent: 지정하면 작업 스레드에서 저장 (진행률 / 취소 표시, 완료는 대화상자로 알림)
+        default_filename: 기본 파일명
+
     Returns:
-        str: 저장된 파일 경로 (취소시 None)
+        str: 저장(시작)한 파일 경로 (취소시 None)
     """
+    from app.services.common.export_service import write_export
+
+    if model is None or not len(model):
+        messagebox.showinfo("정보", "내보낼 데이터가 없습니다.")
+        return None
+
     try:
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel 파일", "*.xlsx"), ("CSV 파일", "*.csv"), ("모든 파일", "*.*")],
+            filetypes=_EXPORT_FILETYPES,
+            initialfile=default_filename,
             title=title
         )
         
         if not file_path:
             return None
-            
-        # TreeView에서 데이터 추출
-        data = []
-        for item in tree_widget.get_children():
-            data.append(tree_widget.item(item)["values"])
-        
-        # 컬럼 이름 설정
-        if file_names:
-            all_columns = columns + file_names
-        else:
-            all_columns = columns
-            
-        df = pd.DataFrame(data, columns=all_columns)
-        
+
+        sheets = [model.export_sheet("Sheet1")]
+        if parent is not None:
+            export_sheets_in_background(parent, file_path, sheets, title)
+            return file_path
+
         # 파일 저장
-        if file_path.endswith(".csv"):
-            df.to_csv(file_path, index=False, encoding="utf-8-sig")
-        else:
-            df.to_excel(file_path, index=False)
-            
+        write_export(file_path, sheets)
         messagebox.showinfo("완료", "보고서가 성공적으로 저장되었습니다.")
         return file_path
         
@@ -212,6 +261,8 @@ def load_and_merge_files(file_paths):
 
 def load_db_file(file_path, file_name):
     """SQLite DB 파일 로드"""
+    import pandas as pd
+
     try:
         conn = sqlite3.connect(file_path)
         
@@ -239,6 +290,8 @@ def load_db_file(file_path, file_name):
 
 def load_csv_file(file_path, file_name):
     """CSV 파일 로드"""
+    import pandas as pd
+
     try:
         # 여러 인코딩 시도
         encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
@@ -262,6 +315,8 @@ def load_csv_file(file_path, file_name):
 
 def load_txt_file(file_path, file_name):
     """텍스트 파일 로드 (탭 구분)"""
+    import pandas as pd
+
     try:
         # 여러 인코딩 시도
         encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
@@ -285,6 +340,8 @@ def load_txt_file(file_path, file_name):
 
 def merge_dataframes(dataframes):
     """여러 DataFrame들을 병합"""
+    import pandas as pd
+
     try:
         if not dataframes:
             return None
@@ -323,16 +380,16 @@ class FileService:
         self.last_export_path = None
         self.last_import_path = None
     
-    def export_dataframe(self, df, default_filename="export", title="데이터 내보내기"):
+    def export_dataframe(self, df, default_filename="export", title="데이터 내보내기", parent=None):
         """DataFrame 내보내기"""
-        result = export_dataframe_to_file(df, default_filename, title)
+        result = export_dataframe_to_file(df, default_filename, title, parent)
         if result:
             self.last_export_path = os.path.dirname(result)
         return result
     
-    def export_tree_data(self, tree_widget, columns, file_names=None, title="보고서 내보내기"):
-        """TreeView 데이터 내보내기"""
-        result = export_tree_data_to_file(tree_widget, columns, file_names, title)
+    def export_table_model(self, model, title="보고서 내보내기", parent=None, default_filename="report"):
+        """뷰 표 모델 내보내기"""
+        result = export_table_model_to_file(model, title, parent, default_filename)
         if result:
             self.last_export_path = os.path.dirname(result)
         return result
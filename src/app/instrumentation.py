@@ -0,0 +1,310 @@
+"""
+성능 계측 (Instrumentation)
+
+파일 로딩, Pivot 갱신, Treeview 갱신, QC 검증, SQL 호출, 캐시 조회 구간의
+소요 시간과 횟수를 가볍게 기록합니다.
+
+- span(): 구간 시간 측정 (컨텍스트 매니저 / 데코레이터 겸용)
+- count(): 이름별 누적 카운터
+- 최근 구간은 고정 크기 링 버퍼에 보관 (오래된 구간부터 버림)
+- JSON / Chrome trace 형식 내보내기 (chrome://tracing, Perfetto 에서 열기)
+
+표준 라이브러리만 사용하므로 어느 모듈에서든 부담 없이 import 할 수 있습니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+DEFAULT_CAPACITY = 5000
+SQL_TEXT_LIMIT = 500
+
+
+class SpanRecord:
+    """완료된 측정 구간"""
+
+    __slots__ = ('name', 'category', 'start_us', 'duration_us', 'thread_id', 'args')
+
+    def __init__(self, name, category, start_us, duration_us, thread_id, args):
+        self.name = name
+        self.category = category
+        self.start_us = start_us
+        self.duration_us = duration_us
+        self.thread_id = thread_id
+        self.args = args
+
+    @property
+    def duration_ms(self):
+        return self.duration_us / 1000.0
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'category': self.category,
+            'start_us': self.start_us,
+            'duration_us': self.duration_us,
+            'thread_id': self.thread_id,
+            'args': self.args,
+        }
+
+
+class _Span:
+    """span() 반환 객체 - with 문과 데코레이터로 모두 사용"""
+
+    __slots__ = ('_recorder', 'name', 'category', 'args', '_start_ns')
+
+    def __init__(self, recorder, name, category, args):
+        self._recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start_ns = None
+
+    def set(self, **args):
+        """구간 종료 전에 속성 추가 (행 수 등 측정 중에 알게 되는 값)"""
+        self.args.update(args)
+
+    def __enter__(self):
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self._recorder._record(self.name, self.category, self._start_ns, end_ns, self.args)
+        return False
+
+    def __call__(self, func):
+        recorder, name, category, args = self._recorder, self.name, self.category, self.args
+
+        @wraps(func)
+        def wrapper(*a, **kw):
+            with _Span(recorder, name, category, dict(args)):
+                return func(*a, **kw)
+        return wrapper
+
+
+class Instrumentation:
+    """구간 / 카운터 기록기 (스레드 안전)"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._spans = deque(maxlen=capacity)
+        self._counters = {}
+        self._dropped = 0
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_wall = time.time()
+
+    @property
+    def capacity(self):
+        return self._spans.maxlen
+
+    def span(self, name, category='app', **args):
+        """
+        구간 시간 측정
+
+        with instrumentation.span('file.read', 'io', path=p) as s:
+            ...
+            s.set(rows=len(df))
+
+        @instrumentation.span('qc.evaluate', 'qc')
+        def evaluate(...): ...
+        """
+        return _Span(self, name, category, args)
+
+    def count(self, name, value=1):
+        """
+        카운터 증가
+
+        캐시 조회처럼 자주 불리는 경로에서 사용하므로 lock 없이 갱신합니다
+        (스레드 경합 시 드물게 누락될 수 있는 근사값).
+        """
+        if self.enabled:
+            counters = self._counters
+            counters[name] = counters.get(name, 0) + value
+
+    def _record(self, name, category, start_ns, end_ns, args):
+        if not self.enabled:
+            return
+        record = SpanRecord(name, category,
+                            (start_ns - self._origin_ns) // 1000,
+                            (end_ns - start_ns) // 1000,
+                            threading.get_ident(), args)
+        with self._lock:
+            if len(self._spans) == self._spans.maxlen:
+                self._dropped += 1
+            self._spans.append(record)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def recent_spans(self, limit=None, category=None):
+        """최근 구간 목록 (오래된 순)"""
+        with self._lock:
+            spans = list(self._spans)
+        if category is not None:
+            spans = [s for s in spans if s.category == category]
+        if limit is not None:
+            spans = spans[-limit:]
+        return spans
+
+    def counters(self):
+        return dict(self._counters)
+
+    def summary(self):
+        """
+        이름별 집계 (링 버퍼에 남아 있는 구간 기준)
+
+        Returns:
+            list: [{'name', 'category', 'count', 'total_ms', 'avg_ms', 'max_ms'}, ...] (총 시간 내림차순)
+        """
+        stats = {}
+        for record in self.recent_spans():
+            entry = stats.get(record.name)
+            if entry is None:
+                entry = stats[record.name] = {'name': record.name, 'category': record.category,
+                                              'count': 0, 'total_us': 0, 'max_us': 0}
+            entry['count'] += 1
+            entry['total_us'] += record.duration_us
+            entry['max_us'] = max(entry['max_us'], record.duration_us)
+
+        result = []
+        for entry in stats.values():
+            result.append({
+                'name': entry['name'],
+                'category': entry['category'],
+                'count': entry['count'],
+                'total_ms': round(entry['total_us'] / 1000.0, 3),
+                'avg_ms': round(entry['total_us'] / 1000.0 / entry['count'], 3),
+                'max_ms': round(entry['max_us'] / 1000.0, 3),
+            })
+        result.sort(key=lambda e: e['total_ms'], reverse=True)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def to_dict(self):
+        """JSON 내보내기용 사전"""
+        with self._lock:
+            dropped = self._dropped
+        return {
+            'started_at': self._origin_wall,
+            'capacity': self.capacity,
+            'dropped': dropped,
+            'counters': self.counters(),
+            'summary': self.summary(),
+            'spans': [record.to_dict() for record in self.recent_spans()],
+        }
+
+    def to_chrome_trace(self):
+        """Chrome trace 이벤트 형식 (chrome://tracing, ui.perfetto.dev)"""
+        pid = os.getpid()
+        events = []
+        end_us = 0
+        for record in self.recent_spans():
+            events.append({
+                'name': record.name,
+                'cat': record.category,
+                'ph': 'X',
+                'ts': record.start_us,
+                'dur': record.duration_us,
+                'pid': pid,
+                'tid': record.thread_id,
+                'args': {key: _jsonable(value) for key, value in record.args.items()},
+            })
+            end_us = max(end_us, record.start_us + record.duration_us)
+        counters = self.counters()
+        if counters:
+            events.append({'name': 'counters', 'ph': 'C', 'ts': end_us, 'pid': pid, 'tid': 0,
+                           'args': counters})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_json(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+        return file_path
+
+    def export_chrome_trace(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return file_path
+
+
+def _jsonable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# ----------------------------------------------------------------------
+# SQL 계측 - sqlite3.connect(factory=TracedConnection)
+# ----------------------------------------------------------------------
+
+class TracedCursor(sqlite3.Cursor):
+    """execute / fetch 를 구간으로 기록하는 커서 (쿼리 문자열, 행 수 포함)"""
+
+    def execute(self, sql, parameters=()):
+        with instrumentation.span('sql.execute', 'sql', query=sql[:SQL_TEXT_LIMIT]) as s:
+            result = super().execute(sql, parameters)
+            if self.rowcount >= 0:
+                s.set(rows=self.rowcount)
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        with instrumentation.span('sql.executemany', 'sql', query=sql[:SQL_TEXT_LIMIT]) as s:
+            result = super().executemany(sql, seq_of_parameters)
+            s.set(rows=self.rowcount)
+        return result
+
+    def executescript(self, sql_script):
+        with instrumentation.span('sql.executescript', 'sql', query=sql_script[:SQL_TEXT_LIMIT]):
+            return super().executescript(sql_script)
+
+    def fetchall(self):
+        with instrumentation.span('sql.fetchall', 'sql') as s:
+            rows = super().fetchall()
+            s.set(rows=len(rows))
+        return rows
+
+    def fetchmany(self, size=None):
+        with instrumentation.span('sql.fetchmany', 'sql') as s:
+            rows = super().fetchmany(size if size is not None else self.arraysize)
+            s.set(rows=len(rows))
+        return rows
+
+
+class TracedConnection(sqlite3.Connection):
+    """TracedCursor 를 사용하는 연결 (conn.execute 단축 호출 포함)"""
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+# 애플리케이션 전역 기록기
+instrumentation = Instrumentation()
+span = instrumentation.span
+count = instrumentation.count
@@ -51,9 +51,15 @@ class LoadingDialog:
     """
     로딩 중임을 알려주는 대화 상자 클래스
     """
-    def __init__(self, parent):
+    def __init__(self, parent, on_cancel=None, title="로딩 중..."):
+        """
+        Args:
+            parent: 부모 윈도우
+            on_cancel: 지정하면 취소 버튼 표시 (창 닫기도 취소로 처리)
+            title: 창 제목
+        """
         self.top = tk.Toplevel(parent)
-        self.top.title("로딩 중...")
+        self.top.title(title)
         
         # 기본 크기 설정
         window_width = 300
@@ -81,17 +87,25 @@ class LoadingDialog:
         self.percentage_label = ttk.Label(self.top, text="0%")
         self.percentage_label.pack(pady=5)
         
-        # 창 닫기 버튼 비활성화
-        self.top.protocol("WM_DELETE_WINDOW", lambda: None)
+        if on_cancel is not None:
+            self.top.geometry(f'{window_width}x{window_height + 40}')
+            self.cancel_button = ttk.Button(self.top, text="취소", command=on_cancel)
+            self.cancel_button.pack(pady=5)
+            self.top.protocol("WM_DELETE_WINDOW", on_cancel)
+        else:
+            # 창 닫기 버튼 비활성화
+            self.top.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # 부모 창 중앙에 배치
         center_dialog_on_parent(self.top, parent)
-    def update_progress(self, value, status_text=None):
+    def update_progress(self, value, status_text=None, refresh=True):
+        """진행률 표시 (작업 스레드 폴링에서 호출할 때는 refresh=False - 이벤트 루프가 그려 줌)"""
         self.progress_var.set(value)
         self.percentage_label.config(text=f"{int(value)}%")
         if status_text:
             self.status_label.config(text=status_text)
-        self.top.update()
+        if refresh:
+            self.top.update()
     def close(self):
         self.top.grab_release()
         self.top.destroy()
@@ -3,16 +3,21 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import sys, os
+import threading
 from datetime import datetime
 from app.schema import DBSchema
+from app.services.common.write_queue import DatabaseWriter, run_write_now
+from app.instrumentation import span, TracedConnection
+from app.memory_tracker import memory_tracker, tk_object_counts
 from app.loading import LoadingDialog
-from app.qc import add_qc_check_functions_to_class
-from app.enhanced_qc import add_enhanced_qc_functions_to_class
 # Default DB 기능 제거됨 - 리팩토링으로 중복 코드 정리
 from app.utils import create_treeview_with_scrollbar, create_label_entry_pair, format_num_value
 from app.data_utils import numeric_sort_key, calculate_string_similarity
+from app.comparison_incremental import (
+    add_incremental_comparison_functions_to_class, grid_module_label, grid_part_label, VIEW_ROWS
+)
 from app.config_manager import ConfigManager
-from app.file_service import FileService, export_dataframe_to_file, export_tree_data_to_file
+from app.file_service import FileService, export_dataframe_to_file, export_sheets_in_background, read_comparison_file
 from app.dialog_helpers import create_parameter_dialog, center_dialog, validate_numeric_range, handle_error
 
 # 🆕 새로운 Default DB 및 QC 분리 시스템
@@ -44,6 +49,10 @@ except ImportError:
     SERVICES_AVAILABLE = False
 
 
+# 장시간 세션 메모리 스냅샷 주기 (메모리 리포트에서 증가 추이 확인)
+MEMORY_SNAPSHOT_INTERVAL_MS = 5 * 60 * 1000
+
+
 # 첫 번째 DBManager 클래스 제거됨 - 중복 코드 정리
 
 class DBManager:
@@ -60,6 +69,8 @@ class DBManager:
         self.file_names = []
         self.folder_path = ""
         self.merged_df = None
+        self._dataset = None  # 파일 단위 데이터 + Typed Shadow (dataset 속성으로 접근)
+        self._deferred_tabs = {}  # 자리표시 탭 → 첫 선택 시 실행할 탭 생성 함수
         self.context_menu = None
         
         # QC 엔지니어용 탭 프레임들을 저장할 변수들
@@ -74,8 +85,8 @@ class DBManager:
             traceback.print_exc()
             self.db_schema = None
         
-        add_qc_check_functions_to_class(DBManager)
-        add_enhanced_qc_functions_to_class(DBManager)
+        # QC 기능(pandas / matplotlib 의존)은 QC 탭을 처음 열 때 추가 (_ensure_qc_functions)
+        add_incremental_comparison_functions_to_class(DBManager)
         # Default DB 기능 제거됨 - 리팩토링 완료
         
         # 서비스 레이어 초기화 (DB 스키마 초기화 후)
@@ -87,6 +98,10 @@ class DBManager:
         else:
             self._setup_window_legacy()
         
+        # 쓰기 큐 (콜백은 Tk 메인 스레드에서 실행) + 종료 시 남은 쓰기 커밋
+        self._setup_write_queue()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # 바인딩 설정
         for key in ('<Control-o>', '<Control-O>'):
             self.window.bind(key, self.load_folder)
@@ -118,6 +133,28 @@ class DBManager:
         # 기본적으로는 장비 생산 엔지니어용 탭만 생성
         self.create_comparison_tabs()
 
+        # 메모리 리포트 측정 함수 등록 + 주기 스냅샷
+        memory_tracker.add_probe('manager', self._memory_probe)
+        memory_tracker.snapshot("시작")
+        self.window.after(MEMORY_SNAPSHOT_INTERVAL_MS, self._periodic_memory_snapshot)
+
+    @property
+    def dataset(self):
+        """비교 데이터셋 (numpy 의존 - 처음 사용할 때 생성, settings.json의 dataset 백엔드 사용)"""
+        if self._dataset is None:
+            from app.dataset import create_comparison_dataset
+            from app.utils import load_settings
+            from app.value_table import NormalizeOptions
+            options = load_settings().get('dataset') or {}
+            normalize = NormalizeOptions.from_settings(options.get('normalize'))
+            try:
+                self._dataset = create_comparison_dataset(options.get('backend', 'memory'),
+                                                          options.get('mmap_directory'), normalize)
+            except (ValueError, OSError) as e:
+                self.update_log(f"[데이터셋] 설정한 백엔드를 사용할 수 없어 메모리 백엔드 사용: {e}")
+                self._dataset = create_comparison_dataset(options=normalize)
+        return self._dataset
+
     def _setup_window_with_new_config(self):
         """새로운 설정 시스템을 사용한 윈도우 설정"""
         self.window = tk.Tk()
@@ -158,6 +195,7 @@ class DBManager:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         self.main_notebook = ttk.Notebook(self.window)
         self.main_notebook.pack(expand=True, fill=tk.BOTH)
+        self.main_notebook.bind("<<NotebookTabChanged>>", self._on_main_tab_changed)
         self.comparison_notebook = ttk.Notebook(self.main_notebook)
         self.main_notebook.add(self.comparison_notebook, text="DB 비교")
         self.log_text = tk.Text(self.window, height=5, state=tk.DISABLED)
@@ -206,6 +244,42 @@ class DBManager:
             self.update_log(f"서비스 레이어 초기화 실패: {str(e)}")
             print(f"Service layer initialization failed: {str(e)}")
     
+    def _setup_write_queue(self):
+        """백그라운드 쓰기 큐 시작 - DB 쓰기를 Tk 메인 스레드 밖에서 실행"""
+        self.write_queue = None
+        if not self.db_schema:
+            return
+        try:
+            if self.service_factory:
+                self.write_queue = self.service_factory.get_write_queue()
+            else:
+                self.write_queue = DatabaseWriter(self.db_schema.db_path)
+            self.write_queue.attach_tk(self.window)
+        except Exception as e:
+            self.write_queue = None
+            print(f"쓰기 큐 초기화 실패 (동기 쓰기 사용): {str(e)}")
+
+    def submit_write(self, func, *args, callback=None, error_callback=None):
+        """
+        DB 쓰기 작업 실행 - 쓰기 큐가 있으면 쓰기 스레드에서, 없으면 바로 실행
+
+        callback / error_callback은 Tk 메인 스레드에서 호출됩니다.
+        """
+        if self.write_queue is not None:
+            return self.write_queue.submit(func, *args, callback=callback, error_callback=error_callback)
+        return run_write_now(func, *args, callback=callback, error_callback=error_callback)
+
+    def _on_close(self):
+        """창 닫기 - 대기 중인 DB 쓰기를 모두 커밋한 뒤 종료"""
+        if self.write_queue is not None and self.write_queue.pending_count:
+            self.status_bar.config(text="저장 중인 변경 사항을 기록하는 중...")
+            self.window.update_idletasks()
+        if self.service_factory:
+            self.service_factory.cleanup()
+        elif self.write_queue is not None:
+            self.write_queue.close()
+        self.window.destroy()
+
     def _should_use_service(self, service_name: str) -> bool:
         """특정 서비스 사용 여부 확인"""
         return self.config_manager.should_use_service(service_name)
@@ -220,7 +294,7 @@ class DBManager:
         """
         if self.db_schema:
             import sqlite3
-            return sqlite3.connect(self.db_schema.db_path)
+            return sqlite3.connect(self.db_schema.db_path, factory=TracedConnection)
         else:
             raise Exception("DBSchema가 초기화되지 않았습니다.")
 
@@ -538,6 +612,8 @@ class DBManager:
         # 파일 메뉴
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="폴더 열기 (Ctrl+O)", command=self.load_folder)
+        file_menu.add_command(label="파일 추가...", command=self.append_files)
+        file_menu.add_command(label="파일 제거...", command=self.remove_loaded_file)
         file_menu.add_separator()
         file_menu.add_command(label="보고서 내보내기", command=self.export_report)
         file_menu.add_separator()
@@ -559,7 +635,11 @@ class DBManager:
         self.window.config(menu=menubar)
 
     def update_log(self, message):
-        """로그 표시 영역에 메시지를 추가합니다."""
+        """로그 표시 영역에 메시지를 추가합니다. (쓰기 스레드에서 호출하면 Tk 메인 스레드로 전달)"""
+        write_queue = getattr(self, 'write_queue', None)
+        if write_queue is not None and threading.current_thread() is not threading.main_thread():
+            write_queue.call_in_ui(self.update_log, message)
+            return
         self.log_text.configure(state=tk.NORMAL)
         from datetime import datetime
         self.log_text.insert(tk.END, f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
@@ -627,10 +707,11 @@ class DBManager:
                 if not self.maint_mode:
                     self.enable_maint_features()
 
-                # Default DB 탭 생성 확인 (QC 모드가 이미 활성화된 경우 대비)
-                if not hasattr(self, 'default_db_frame') or self.default_db_frame is None:
-                    self.update_log("🔧 Default DB 관리 탭 생성 중...")
-                    self.create_default_db_tab()
+                # Default DB 탭 등록 확인 (QC 모드가 이미 활성화된 경우 대비)
+                if (not hasattr(self, 'default_db_frame') or self.default_db_frame is None) and \
+                        not self._is_tab_deferred(self.create_default_db_tab):
+                    self.update_log("🔧 Default DB 관리 탭 등록 (처음 열 때 생성)")
+                    self._add_deferred_tab("Default DB 관리", self.create_default_db_tab)
                 
                 # 🆕 신규 QC 스펙 관리 탭 생성 (신규 시스템에서만)
                 if USE_NEW_DB_SYSTEM:
@@ -658,7 +739,7 @@ class DBManager:
         try:
             # QC Checklist 관리 다이얼로그 열기
             from app.dialogs.checklist_manager_dialog import ChecklistManagerDialog
-            ChecklistManagerDialog(self.window, self.db_schema)
+            ChecklistManagerDialog(self.window, self.db_schema, submit_write=self.submit_write)
 
         except Exception as e:
             messagebox.showerror("오류", f"QC Checklist 관리 열기 실패:\n{str(e)}")
@@ -701,17 +782,71 @@ class DBManager:
         try:
             # Configuration Exceptions 관리 다이얼로그 열기
             from app.dialogs.configuration_exceptions_dialog import ConfigurationExceptionsDialog
-            ConfigurationExceptionsDialog(self.window, self.db_schema)
+            ConfigurationExceptionsDialog(self.window, self.db_schema, submit_write=self.submit_write)
 
         except Exception as e:
             messagebox.showerror("오류", f"Configuration Exceptions 관리 열기 실패:\n{str(e)}")
             self.update_log(f"⚠️ Configuration Exceptions 관리 오류: {e}")
 
+    def open_performance_dialog(self):
+        """Performance 진단 다이얼로그 열기 (구간 시간 / 카운터 / trace 내보내기)"""
+        try:
+            from app.dialogs.performance_dialog import PerformanceDialog
+            PerformanceDialog(self.window)
+
+        except Exception as e:
+            messagebox.showerror("오류", f"Performance 진단 열기 실패:\n{str(e)}")
+            self.update_log(f"⚠️ Performance 진단 오류: {e}")
+
+    def open_memory_dialog(self):
+        """메모리 리포트 다이얼로그 열기 (분류별 객체 수 / 크기, 스냅샷 간 증가량)"""
+        try:
+            from app.dialogs.memory_dialog import MemoryReportDialog
+            MemoryReportDialog(self.window)
+
+        except Exception as e:
+            messagebox.showerror("오류", f"메모리 리포트 열기 실패:\n{str(e)}")
+            self.update_log(f"⚠️ 메모리 리포트 오류: {e}")
+
+    def _periodic_memory_snapshot(self):
+        """주기 메모리 스냅샷 (Tk 객체 수를 읽으므로 메인 스레드 after로 실행)"""
+        try:
+            memory_tracker.snapshot("주기")
+        finally:
+            self.window.after(MEMORY_SNAPSHOT_INTERVAL_MS, self._periodic_memory_snapshot)
+
+    def _memory_probe(self):
+        """메모리 리포트 측정 함수 - 데이터셋, 뷰 행, 캐시 항목, Tk 객체"""
+        counts = {}
+        # 데이터셋은 만들지 않고 (numpy 로드 방지) 이미 있을 때만 측정
+        if self._dataset is not None:
+            usage = self._dataset.memory_usage()
+            counts['dataset.files'] = (len(self._dataset), usage['frames'] + usage['shadows'])
+            counts['dataset.merged_df'] = (1 if usage['merged'] else 0, usage['merged'])
+            counts['dataset.pivot_rows'] = len(self._dataset.pivot)
+            if 'mapped' in usage:
+                # 매핑 파일은 RSS가 아닌 페이지 캐시에 올라가므로 별도 분류
+                counts['dataset.values'] = (len(self._dataset.pivot.values), usage['values'])
+                counts['dataset.mapped'] = (len(self._dataset), usage['mapped'])
+        counts['view.rows'] = sum(len(getattr(self, attr, None) or {}) for attr in VIEW_ROWS.values())
+        counts['view.item_checkboxes'] = len(getattr(self, 'item_checkboxes', None) or {})
+        counts['default_db.parameter_rows'] = len(getattr(self, 'original_parameter_data', None) or [])
+        counts['cache.report_statistics'] = 1 if getattr(self, '_report_statistics_cache', None) else 0
+        if self.service_factory:
+            stats = self.service_factory.get_cache_service().get_statistics()
+            counts['cache.entries'] = (stats['size'], stats['bytes'])
+        chart_service = sys.modules.get('app.services.common.chart_service')
+        if chart_service is not None:
+            stats = chart_service.chart_renderer.get_stats()
+            counts['cache.charts'] = (stats['entries'], stats['bytes'])
+        counts.update(tk_object_counts(self.window))
+        return counts
+
     def show_admin_features_dialog(self):
         """관리자 기능 안내 다이얼로그"""
         dialog = tk.Toplevel(self.window)
         dialog.title("관리자 모드")
-        dialog.geometry("500x400")
+        dialog.geometry("500x450")
         dialog.transient(self.window)
         dialog.grab_set()
 
@@ -783,6 +918,20 @@ class DBManager:
             width=25
         ).pack(pady=5)
 
+        ttk.Button(
+            mgmt_btn_frame,
+            text="⏱️ Performance 진단",
+            command=self.open_performance_dialog,
+            width=25
+        ).pack(pady=5)
+
+        ttk.Button(
+            mgmt_btn_frame,
+            text="🧠 메모리 리포트",
+            command=self.open_memory_dialog,
+            width=25
+        ).pack(pady=5)
+
         ttk.Button(
             mgmt_btn_frame,
             text="🗄️ Default DB 관리",
@@ -829,14 +978,14 @@ class DBManager:
             self.maint_mode = True
             self.update_log("🚀 유지보수 모드 활성화 시작...")
             
-            # QC 검수 탭 생성 (Enhanced QC 사용)
-            self.update_log("📋 Enhanced QC 검수 탭 생성 중...")
-            self.create_qc_tabs_with_advanced_features()
+            # QC 검수 탭 (Enhanced QC 사용) - 처음 선택할 때 생성
+            self.update_log("📋 Enhanced QC 검수 탭 등록 (처음 열 때 생성)")
+            self._add_deferred_tab("🔍 QC 검수", self.create_qc_tabs_with_advanced_features)
 
-            # Default DB 관리 탭 생성 (관리자 모드에서만)
+            # Default DB 관리 탭 (관리자 모드에서만) - 처음 선택할 때 생성
             if hasattr(self, 'admin_mode') and self.admin_mode:
-                self.update_log("🔧 Default DB 관리 탭 생성 중...")
-                self.create_default_db_tab()
+                self.update_log("🔧 Default DB 관리 탭 등록 (처음 열 때 생성)")
+                self._add_deferred_tab("Default DB 관리", self.create_default_db_tab)
 
             # 상태 업데이트
             mode_name = "관리자 모드" if (hasattr(self, 'admin_mode') and self.admin_mode) else "QC 엔지니어 모드"
@@ -864,12 +1013,56 @@ class DBManager:
         self.create_diff_only_tab()
         # 보고서, 간단 비교, 고급 분석은 QC 탭으로 이동
 
+    def _add_deferred_tab(self, text, builder):
+        """
+        자리표시 탭 추가 - 처음 선택할 때 builder로 실제 탭 생성
+
+        builder가 main_notebook에 추가한 탭들은 자리표시 탭 위치로 옮겨집니다.
+        """
+        placeholder = ttk.Frame(self.main_notebook)
+        self.main_notebook.add(placeholder, text=text)
+        self._deferred_tabs[str(placeholder)] = builder
+
+    def _is_tab_deferred(self, builder):
+        """builder가 아직 생성되지 않은 자리표시 탭으로 등록되어 있는지 확인"""
+        return builder in self._deferred_tabs.values()
+
+    def _on_main_tab_changed(self, event=None):
+        """자리표시 탭이 선택되면 실제 탭 생성"""
+        current = self.main_notebook.select()
+        builder = self._deferred_tabs.pop(current, None)
+        if builder is None:
+            return
+
+        index = self.main_notebook.index(current)
+        placeholder = self.main_notebook.nametowidget(current)
+        self.main_notebook.forget(current)
+        placeholder.destroy()
+
+        before = set(self.main_notebook.tabs())
+        builder()
+        new_tabs = [tab for tab in self.main_notebook.tabs() if tab not in before]
+        for offset, tab in enumerate(new_tabs):
+            self.main_notebook.insert(index + offset, tab)
+        if new_tabs:
+            self.main_notebook.select(new_tabs[0])
+
+    def _ensure_qc_functions(self):
+        """QC 검수 기능을 클래스에 추가 (QC 탭을 처음 열 때 한 번만 import)"""
+        cls = self.__class__
+        if getattr(cls, '_qc_functions_ready', False):
+            return
+        from app.qc import add_qc_check_functions_to_class
+        from app.enhanced_qc import add_enhanced_qc_functions_to_class
+        add_qc_check_functions_to_class(cls)
+        add_enhanced_qc_functions_to_class(cls)
+        cls._qc_functions_ready = True
+
     def create_qc_tabs_with_advanced_features(self):
         """QC 탭들을 고급 기능과 함께 생성"""
         try:
             # Enhanced QC 기능 사용 시도
-            from app.enhanced_qc import add_enhanced_qc_functions_to_class
-            add_enhanced_qc_functions_to_class(self.__class__)
+            self._ensure_qc_functions()
             
             # QC 검수 탭 생성 (향상된 기능)
             if not hasattr(self, 'qc_check_frame') or self.qc_check_frame is None:
@@ -1014,6 +1207,7 @@ class DBManager:
         
         self.update_qc_report_view()
 
+    @span('view.qc_report', 'ui')
     def update_qc_report_view(self):
         """QC 보고서 뷰 업데이트"""
         if not hasattr(self, 'qc_report_tree'):
@@ -1022,17 +1216,13 @@ class DBManager:
         for item in self.qc_report_tree.get_children():
             self.qc_report_tree.delete(item)
             
+        # Pivot 행 키 → 트리 항목 (파일 추가/제거 시 점진적 갱신에 사용)
+        self._qc_report_rows = {}
         if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    model_data = group[group["Model"] == fname]
-                    if not model_data.empty:
-                        values.append(str(model_data["ItemValue"].iloc[0]))
-                    else:
-                        values.append("-")
-                self.qc_report_tree.insert("", "end", values=values)
+            pivot = self.dataset.pivot
+            for key in pivot.sorted_keys():
+                values = list(key) + pivot.row_values(key, self.file_names)
+                self._qc_report_rows[key] = self.qc_report_tree.insert("", "end", values=values)
 
     def create_diff_only_tab(self):
         """차이만 보기 탭 생성"""
@@ -1075,6 +1265,7 @@ class DBManager:
         # 차이점 데이터 업데이트
         self.update_diff_only_view()
 
+    @span('view.diff_only', 'ui')
     def update_diff_only_view(self):
         """차이점만 보기 탭 업데이트 - 하이라이트 제거"""
         if not hasattr(self, 'diff_only_tree'):
@@ -1084,6 +1275,7 @@ class DBManager:
             self.diff_only_tree.delete(item)
         
         diff_count = 0
+        self._diff_only_rows = {}
         if self.merged_df is not None:
             # 컬럼 업데이트
             columns = ["Module", "Part", "ItemName"] + self.file_names
@@ -1096,26 +1288,12 @@ class DBManager:
                 else:
                     self.diff_only_tree.column(col, width=150)
             
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            
-            for (module, part, item_name), group in grouped:
-                # 각 파일별 값 추출
-                file_values = {}
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        file_values[model] = str(model_data["ItemValue"].iloc[0])
-                    else:
-                        file_values[model] = "-"
-                
-                # 차이점이 있는지 확인
-                unique_values = set(v for v in file_values.values() if v != "-")
-                if len(unique_values) > 1:
-                    # 차이점이 있는 항목만 추가 (하이라이트 없이)
-                    row_values = [module, part, item_name]
-                    row_values.extend([file_values.get(model, "-") for model in self.file_names])
-                    
-                    self.diff_only_tree.insert("", "end", values=row_values)
+            pivot = self.dataset.pivot
+            for key in pivot.sorted_keys():
+                # 차이점이 있는 항목만 추가 (하이라이트 없이)
+                if pivot.has_difference(key):
+                    row_values = list(key) + pivot.row_values(key, self.file_names)
+                    self._diff_only_rows[key] = self.diff_only_tree.insert("", "end", values=row_values)
                     diff_count += 1
         
         # 차이점 카운트 업데이트
@@ -1145,20 +1323,19 @@ class DBManager:
     def update_report_view(self):
         for item in self.report_tree.get_children():
             self.report_tree.delete(item)
+        # Pivot 행 키 → 트리 항목 (파일 추가/제거 시 점진적 갱신, 내보내기 모델에 사용)
+        self._report_rows = {}
         if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    values.append(group[fname].iloc[0] if fname in group else "")
-                self.report_tree.insert("", "end", values=values)
+            pivot = self.dataset.pivot
+            for key in pivot.sorted_keys():
+                values = list(key) + pivot.row_values(key, self.file_names)
+                self._report_rows[key] = self.report_tree.insert("", "end", values=values)
 
     def export_report(self):
-        """보고서 내보내기 기능"""
+        """보고서 내보내기 기능 (보고서 뷰의 모델에서 바로 저장)"""
         try:
-            columns = ["Module", "Part", "ItemName"]
-            return self.file_service.export_tree_data(
-                self.report_tree, columns, self.file_names, "보고서 내보내기"
+            return self.file_service.export_table_model(
+                self.view_model('report'), "보고서 내보내기", parent=self.window
             )
         except Exception as e:
             messagebox.showerror("오류", f"보고서 내보내기 중 오류 발생: {str(e)}")
@@ -1183,11 +1360,13 @@ class DBManager:
             return
         loading_dialog = LoadingDialog(self.window)
         try:
-            import pandas as pd
             import os
-            import sqlite3
-            df_list = []
+            loaded_count = 0
             self.file_names = []
+            # 이전 데이터셋 메모리 반환 (파일 프레임 / Typed Shadow / 병합 프레임과 파생 캐시)
+            self.dataset.clear()
+            self.merged_df = None
+            self._release_comparison_caches()
             # 🆕 QC 파일 선택을 위한 uploaded_files 딕셔너리 생성
             self.uploaded_files = {}
             total_files = len(files)
@@ -1200,36 +1379,10 @@ class DBManager:
                         f"파일 로딩 중... ({idx}/{total_files})"
                     )
                     file_name = os.path.basename(file)
-                    base_name = os.path.splitext(file_name)[0]
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext == '.txt':
-                        df = pd.read_csv(file, delimiter="\t", dtype=str)
-                        # 텍스트 파일의 필수 컬럼 확인 및 추가
-                        required_columns = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
-                        if all(col in df.columns for col in required_columns):
-                            # 표준 텍스트 파일 형식: ItemType 정보 보존
-                            df = df[required_columns].copy()
-                        else:
-                            # 호환성을 위한 fallback: 기본 컬럼명 추가
-                            if 'ItemType' not in df.columns:
-                                df['ItemType'] = 'double'  # 기본값
-                            if 'ItemDescription' not in df.columns:
-                                df['ItemDescription'] = ''
-                    elif ext == '.csv':
-                        df = pd.read_csv(file, dtype=str)
-                        # CSV 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    elif ext == '.db':
-                        conn = sqlite3.connect(file)
-                        df = pd.read_sql("SELECT * FROM main_table", conn)
-                        conn.close()
-                        # DB 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    
-                    df["Model"] = base_name
-                    df_list.append(df)
+                    base_name, df = read_comparison_file(file)
+                    self.dataset.add_file(base_name, df, file)
+                    del df  # 데이터셋이 보관 방식을 결정 (mmap 백엔드는 프레임을 남기지 않음)
+                    loaded_count += 1
                     self.file_names.append(base_name)
                     # 🆕 QC 파일 선택을 위해 파일 정보 저장
                     self.uploaded_files[file_name] = file
@@ -1238,10 +1391,10 @@ class DBManager:
                         "경고", 
                         f"'{file_name}' 파일 로드 중 오류 발생:\n{str(e)}"
                     )
-            if df_list:
+            if loaded_count:
                 self.folder_path = os.path.dirname(files[0])
                 loading_dialog.update_progress(75, "데이터 병합 중...")
-                self.merged_df = pd.concat(df_list, ignore_index=True)
+                self.merged_df = self.dataset.merged_df
                 loading_dialog.update_progress(85, "화면 업데이트 중...")
                 self.update_all_tabs()
                 loading_dialog.update_progress(100, "완료!")
@@ -1252,13 +1405,13 @@ class DBManager:
                 
                 messagebox.showinfo(
                     "로드 완료",
-                    f"총 {len(df_list)}개의 DB 파일을 성공적으로 로드했습니다.\n"
+                    f"총 {loaded_count}개의 DB 파일을 성공적으로 로드했습니다.\n"
                     f"• 폴더: {self.folder_path}\n"
                     f"• 파일: {', '.join(self.file_names)}\n"
                     f"• QC 검수 파일 선택 가능: {len(self.uploaded_files)}개"
                 )
                 self.status_bar.config(
-                    text=f"총 {len(df_list)}개의 DB 파일이 로드되었습니다. "
+                    text=f"총 {loaded_count}개의 DB 파일이 로드되었습니다. "
                          f"(폴더: {os.path.basename(self.folder_path)})"
                 )
             else:
@@ -1269,19 +1422,14 @@ class DBManager:
             loading_dialog.close()
             messagebox.showerror("오류", f"예기치 않은 오류가 발생했습니다:\n{str(e)}")
 
+    @span('view.update_all_tabs', 'ui')
     def update_all_tabs(self):
         # 기존 탭 제거
         for tab in self.comparison_notebook.winfo_children():
             tab.destroy()
-        # 탭 다시 생성
+        # 탭 다시 생성 (각 탭은 생성하면서 자기 뷰를 채우므로 다시 갱신하지 않음)
         self.create_comparison_tabs()
         
-        # 격자뷰와 차이점뷰 업데이트
-        if hasattr(self, 'update_grid_view'):
-            self.update_grid_view()
-        if hasattr(self, 'update_diff_only_view'):
-            self.update_diff_only_view()
-        
         # QC 보고서 뷰도 업데이트 (유지보수 모드인 경우)
         if self.maint_mode and hasattr(self, 'update_qc_report_view'):
             self.update_qc_report_view()
@@ -1344,6 +1492,7 @@ class DBManager:
         # 격자뷰 데이터 업데이트
         self.update_grid_view()
 
+    @span('view.grid', 'ui')
     def update_grid_view(self):
         """격자뷰 데이터 업데이트 - 트리뷰 구조"""
         if not hasattr(self, 'grid_tree'):
@@ -1353,6 +1502,12 @@ class DBManager:
         for item in self.grid_tree.get_children():
             self.grid_tree.delete(item)
         
+        # Pivot 행 키 → 트리 노드 (파일 추가/제거 시 점진적 갱신에 사용)
+        self._grid_modules = {}
+        self._grid_parts = {}
+        self._grid_rows = {}
+        self._grid_filter_model = None
+        
         if self.merged_df is None or self.merged_df.empty:
             # 통계 정보 초기화
             if hasattr(self, 'grid_total_label'):
@@ -1415,108 +1570,43 @@ class DBManager:
                                     background="#FFECB3", 
                                     foreground="#E65100")
         
-        # 계층 구조 데이터 구성
-        modules_data = {}
-        total_params = 0
-        diff_count = 0
-        
-        grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-        
-        for (module, part, item_name), group in grouped:
-            if module not in modules_data:
-                modules_data[module] = {}
-            if part not in modules_data[module]:
-                modules_data[module][part] = {}
-            
-            # 각 파일별 값 수집
-            values = []
-            for model in self.file_names:
-                model_data = group[group["Model"] == model]
-                if not model_data.empty:
-                    values.append(str(model_data["ItemValue"].iloc[0]))
-                else:
-                    values.append("-")
-            
-            # 값 차이 확인 (빈 값 제외)
-            non_empty_values = [v for v in values if v != "-"]
-            has_difference = len(set(non_empty_values)) > 1 if len(non_empty_values) > 1 else False
-            
-            modules_data[module][part][item_name] = {
-                "values": values,
-                "has_difference": has_difference
-            }
-            total_params += 1
-            if has_difference:
-                diff_count += 1
-        
-        # 트리뷰에 계층 구조로 데이터 추가
-        for module_name in sorted(modules_data.keys()):
-            # 모듈 레벨 통계 계산
-            module_total = sum(len(modules_data[module_name][part]) for part in modules_data[module_name])
-            module_diff = sum(1 for part in modules_data[module_name] 
-                            for item in modules_data[module_name][part] 
-                            if modules_data[module_name][part][item]["has_difference"])
-            
-            # 모듈 표시 - 파란색 통일
-            if module_diff == 0:
-                module_text = f"📁 {module_name} ({module_total})"
-            else:
-                module_text = f"📁 {module_name} ({module_total}) Diff: {module_diff}"
-            module_tag = "module"
-            
-            # 모듈 노드 추가
-            module_node = self.grid_tree.insert("", "end", 
-                                               text=module_text, 
-                                               values=[""] * len(columns), 
-                                               open=True,
-                                               tags=(module_tag,))
-            
-            for part_name in sorted(modules_data[module_name].keys()):
-                # 파트 레벨 통계 계산
-                part_total = len(modules_data[module_name][part_name])
-                part_diff = sum(1 for item in modules_data[module_name][part_name] 
-                              if modules_data[module_name][part_name][item]["has_difference"])
-                
-                # 파트 표시 - 차이가 없으면 초록색, 있으면 회색
-                if part_diff == 0:
-                    part_text = f"📂 {part_name} ({part_total})"
-                    part_tag = "part_clean"
-                else:
-                    part_text = f"📂 {part_name} ({part_total}) Diff: {part_diff}"
-                    part_tag = "part_diff"
-                
-                # 파트 노드 추가
+        # 계층 구조 데이터 구성 (Pivot 행 키 순서 = Module/Part/ItemName 정렬)
+        pivot = self.dataset.pivot
+        summary = pivot.summary()
+        
+        for module_name, part_name, item_name in pivot.sorted_keys():
+            module_node = self._grid_modules.get(module_name)
+            if module_node is None:
+                # 모듈 노드 추가 - 파란색 통일
+                module_text = grid_module_label(module_name, *pivot.module_counts(module_name))
+                module_node = self.grid_tree.insert("", "end", 
+                                                   text=module_text, 
+                                                   values=[""] * len(columns), 
+                                                   open=True,
+                                                   tags=("module",))
+                self._grid_modules[module_name] = module_node
+            
+            part_node = self._grid_parts.get((module_name, part_name))
+            if part_node is None:
+                # 파트 노드 추가 - 차이가 없으면 초록색, 있으면 빨간색
+                part_text, part_tag = grid_part_label(part_name, *pivot.part_counts[(module_name, part_name)])
                 part_node = self.grid_tree.insert(module_node, "end", 
                                                  text=part_text, 
                                                  values=[""] * len(columns), 
                                                  open=True,
                                                  tags=(part_tag,))
-                
-                for item_name in sorted(modules_data[module_name][part_name].keys()):
-                    # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
-                    item_data = modules_data[module_name][part_name][item_name]
-                    values = item_data["values"]
-                    has_difference = item_data["has_difference"]
-                    
-                    # 태그 선택
-                    tag = "parameter_different" if has_difference else "parameter_same"
-                    
-                    self.grid_tree.insert(part_node, "end", 
-                                        text=item_name, 
-                                        values=values, 
-                                        tags=(tag,))
+                self._grid_parts[(module_name, part_name)] = part_node
+            
+            # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
+            key = (module_name, part_name, item_name)
+            tag = "parameter_different" if pivot.has_difference(key) else "parameter_same"
+            self._grid_rows[key] = self.grid_tree.insert(part_node, "end", 
+                                                        text=item_name, 
+                                                        values=pivot.row_values(key, self.file_names), 
+                                                        tags=(tag,))
         
         # 통계 정보 업데이트
-        if hasattr(self, 'grid_total_label'):
-            self.grid_total_label.config(text=f"총 파라미터: {total_params}")
-            self.grid_modules_label.config(text=f"모듈 수: {len(modules_data)}")
-            
-            total_parts = sum(len(parts) for parts in modules_data.values())
-            self.grid_parts_label.config(text=f"파트 수: {total_parts}")
-            
-            # 차이점 개수도 표시
-            if hasattr(self, 'grid_diff_label'):
-                self.grid_diff_label.config(text=f"값이 다른 항목: {diff_count}")
+        self._update_grid_counters(summary)
 
     def create_comparison_tab(self):
         comparison_frame = ttk.Frame(self.comparison_notebook)
@@ -1970,18 +2060,10 @@ class DBManager:
         ttk.Button(button_frame, text="❌ 취소", command=dlg.destroy).pack(side=tk.RIGHT, padx=5)
         
         def on_confirm():
-            # 장비 유형 결정
+            # 장비 유형 결정 (새 장비 유형은 쓰기 작업 안에서 생성)
             if new_type_var.get().strip():
-                # 새 장비 유형 생성
                 type_name = new_type_var.get().strip()
-                type_id = self.db_schema.add_equipment_type(type_name, f"다중 모델 비교를 통해 자동 생성된 장비 유형")
-                self.update_log(f"새 장비 유형 생성: {type_name} (ID: {type_id})")
-                
-                self.db_schema.log_change_history(
-                    "add", "equipment_type", type_name, "", 
-                    f"multi-model comparison based", "admin"
-                )
-                
+                type_id = None
             elif selected_type.get():
                 # 기존 장비 유형 사용
                 type_id_str = selected_type.get().split("ID: ")[1][:-1]
@@ -1991,34 +2073,61 @@ class DBManager:
                 messagebox.showerror("오류", "장비 유형을 선택하거나 새로 입력해주세요.")
                 return
             
-            # 실제 DB 추가 로직
+            # 실제 DB 추가 로직 - 트리 / 통계 값은 여기서 수집하고 쓰기는 쓰기 스레드에서 실행
+            analyze = analyze_var.get()
+            confidence = confidence_var.get()
             try:
-                if analyze_var.get():
+                if analyze:
                     # 통계 기반 추가
                     stats_analysis = self.analyze_parameter_statistics(selected_items)
-                    added_count, updated_count, skipped_count = self.add_parameters_with_statistics(
-                        type_id, stats_analysis, confidence_var.get() / 100.0
-                    )
+                else:
+                    # 단순 추가
+                    simple_rows = self._simple_parameter_rows(selected_items)
+            except Exception as e:
+                messagebox.showerror("❌ 오류", f"Default DB 추가 중 오류 발생:\n{str(e)}")
+                self.update_log(f"Default DB 추가 오류: {str(e)}")
+                return
+
+            def write_parameters():
+                target_type_id = type_id
+                if target_type_id is None:
+                    # 새 장비 유형 생성
+                    target_type_id = self.db_schema.add_equipment_type(
+                        type_name, f"다중 모델 비교를 통해 자동 생성된 장비 유형")
+                    self.update_log(f"새 장비 유형 생성: {type_name} (ID: {target_type_id})")
                     
+                    self.db_schema.log_change_history(
+                        "add", "equipment_type", type_name, "", 
+                        f"multi-model comparison based", "admin"
+                    )
+
+                if analyze:
+                    counts = self.add_parameters_with_statistics(target_type_id, stats_analysis, confidence / 100.0)
+                else:
+                    counts = (self._add_simple_rows(target_type_id, simple_rows), 0, 0)
+
+                total_changes = counts[0] + counts[1]
+                self.db_schema.log_change_history(
+                    "bulk_add", "parameter", f"{type_name}_bulk_operation", 
+                    "", f"Added/Updated {total_changes} parameters via multi-model analysis", "admin"
+                )
+                return target_type_id, counts
+
+            def on_written(result):
+                written_type_id, (added_count, updated_count, skipped_count) = result
+                if analyze:
                     result_msg = (f"🎯 통계 기반 Default DB 추가 완료:\n\n"
                                  f"📊 분석된 파라미터: {len(stats_analysis)}개\n"
                                  f"✅ 새로 추가: {added_count}개\n"
                                  f"🔄 업데이트: {updated_count}개\n"
                                  f"❌ 낮은 신뢰도로 제외: {skipped_count}개\n\n"
-                                 f"💡 신뢰도 기준: {confidence_var.get():.1f}%")
+                                 f"💡 신뢰도 기준: {confidence:.1f}%")
                 else:
-                    # 단순 추가
-                    added_count = self.add_parameters_simple(type_id, selected_items)
                     result_msg = f"📋 단순 추가 완료:\n\n총 {added_count}개의 항목이 Default DB에 추가되었습니다."
-                
-                total_changes = added_count + (updated_count if analyze_var.get() else 0)
-                self.db_schema.log_change_history(
-                    "bulk_add", "parameter", f"{type_name}_bulk_operation", 
-                    "", f"Added/Updated {total_changes} parameters via multi-model analysis", "admin"
-                )
-                
+
                 messagebox.showinfo("✅ 작업 완료", result_msg)
-                dlg.destroy()
+                if dlg.winfo_exists():
+                    dlg.destroy()
                 self.update_comparison_view() # UI 갱신
                 
                 # Default DB 관리 탭이 있으면 업데이트
@@ -2030,7 +2139,7 @@ class DBManager:
                     
                     # 현재 사용된 장비 유형을 기준으로 찾기
                     for type_name_option in type_names:
-                        if f"ID: {type_id}" in type_name_option:
+                        if f"ID: {written_type_id}" in type_name_option:
                             target_type_name = type_name_option
                             break
                     
@@ -2055,11 +2164,14 @@ class DBManager:
                                 self.update_log("✅ Default DB 관리 탭 업데이트 완료 (첫 번째 항목)")
                             else:
                                 self.update_log("⚠️ 장비 유형이 없어 Default DB 탭 업데이트 실패")
-                
-            except Exception as e:
+
+            def on_failed(e):
                 messagebox.showerror("❌ 오류", f"Default DB 추가 중 오류 발생:\n{str(e)}")
                 self.update_log(f"Default DB 추가 오류: {str(e)}")
 
+            self.update_log(f"Default DB 추가 진행 중... ({len(selected_items)}개 항목)")
+            self.submit_write(write_parameters, callback=on_written, error_callback=on_failed)
+
         ttk.Button(button_frame, text="✅ Default DB에 추가", command=on_confirm).pack(side=tk.RIGHT, padx=5)
         
         # 다이얼로그 강제 업데이트 및 포커스
@@ -2253,7 +2365,17 @@ class DBManager:
         Returns:
             int: 추가된 항목 개수
         """
-        count = 0
+        return self._add_simple_rows(type_id, self._simple_parameter_rows(selected_items))
+
+    def _simple_parameter_rows(self, selected_items):
+        """
+        단순 추가할 파라미터 행 수집 (트리뷰 / merged_df 접근 - Tk 메인 스레드에서 호출)
+
+        Returns:
+            list: add_default_value 인자 딕셔너리 목록
+        """
+        rows = []
+        source_file = self.file_names[0]
         for item_id in selected_items:
             item_values = self.comparison_tree.item(item_id, "values")
             
@@ -2285,19 +2407,30 @@ class DBManager:
                         item_desc_values = matching_rows['ItemDescription'].dropna().unique()
                         if len(item_desc_values) > 0:
                             item_description = item_desc_values[0]
-            
+
+            rows.append({
+                'param_name': param_name, 'value': value, 'source_file': source_file,
+                'description': item_description, 'module': module, 'part': part, 'item_type': item_type,
+            })
+        return rows
+
+    def _add_simple_rows(self, type_id, rows):
+        """_simple_parameter_rows() 결과를 Default DB에 추가 (쓰기 큐 작업으로 실행 가능)"""
+        count = 0
+        for row in rows:
+            param_name, value = row['param_name'], row['value']
             try:
                 record_id = self.db_schema.add_default_value(
-                    type_id, param_name, value, None, None, 1, 1, self.file_names[0],
-                    description=item_description,
-                    module_name=module,
-                    part_name=part,
-                    item_type=item_type
+                    type_id, param_name, value, None, None, 1, 1, row['source_file'],
+                    description=row['description'],
+                    module_name=row['module'],
+                    part_name=row['part'],
+                    item_type=row['item_type']
                 )
                 
                 self.db_schema.log_change_history(
                     "add", "parameter", param_name, "", 
-                    f"default: {value}, source: {self.file_names[0]}", "admin"
+                    f"default: {value}, source: {row['source_file']}", "admin"
                 )
                 
                 count += 1
@@ -2331,12 +2464,16 @@ class DBManager:
                 self.item_checkboxes[item_key] = check
         self.update_checked_count()
 
+    @span('view.comparison', 'ui')
     def update_comparison_view(self, search_filter=""):
         for item in self.comparison_tree.get_children():
             self.comparison_tree.delete(item)
         
         saved_checkboxes = self.item_checkboxes.copy()
         self.item_checkboxes.clear()
+        # Pivot 행 키 → 트리 항목 (파일 추가/제거 시 점진적 갱신에 사용)
+        self._comparison_rows = {}
+        self._comparison_search_filter = search_filter
         
         if self.maint_mode:
             self.comparison_tree.bind("<ButtonRelease-1>", self.toggle_checkbox)
@@ -2348,28 +2485,17 @@ class DBManager:
         filtered_items = 0
         
         if self.merged_df is not None:
-            # 파라미터별로 그룹화하여 비교
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+            # 파라미터별 비교 (Pivot 행 단위)
+            pivot = self.dataset.pivot
+            total_items = len(pivot)
             
-            for (module, part, item_name), group in grouped:
-                total_items += 1
+            for key in pivot.sorted_keys():
+                module, part, item_name = key
                 
-                # 검색 필터링 적용
-                if search_filter and search_filter not in item_name.lower():
+                # 검색 / Module / Part 필터링 적용
+                if not self._comparison_row_visible(key, search_filter):
                     continue
                 
-                # Module 필터링 적용
-                if hasattr(self, 'comparison_module_filter_var'):
-                    module_filter = self.comparison_module_filter_var.get()
-                    if module_filter and module_filter != "All" and module != module_filter:
-                        continue
-                
-                # Part 필터링 적용
-                if hasattr(self, 'comparison_part_filter_var'):
-                    part_filter = self.comparison_part_filter_var.get()
-                    if part_filter and part_filter != "All" and part != part_filter:
-                        continue
-                
                 filtered_items += 1
                 
                 values = []
@@ -2384,33 +2510,15 @@ class DBManager:
                 
                 values.extend([module, part, item_name])
                 
-                # 각 파일별 값 추출 및 비교
-                file_values = []
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        value = model_data["ItemValue"].iloc[0]
-                        file_values.append(str(value))
-                    else:
-                        file_values.append("-")
+                # 각 파일별 값
+                values.extend(pivot.row_values(key, self.file_names))
                 
-                values.extend(file_values)
-                
-                # 차이점 검사 - 모든 값이 동일한지 확인
-                unique_values = set(v for v in file_values if v != "-")
-                has_difference = len(unique_values) > 1
-                
-                tags = []
-                if has_difference:
-                    tags.append("different")
+                # 차이점 / Default DB 존재 여부 태그
+                tags = self._comparison_row_tags(key)
+                if "different" in tags:
                     diff_count += 1
                 
-                # Default DB에 존재하는지 확인
-                is_existing = self.check_if_parameter_exists(module, part, item_name)
-                if is_existing:
-                    tags.append("existing")
-                
-                self.comparison_tree.insert("", "end", values=values, tags=tuple(tags))
+                self._comparison_rows[key] = self.comparison_tree.insert("", "end", values=values, tags=tags)
             
             # 스타일 설정
             self.comparison_tree.tag_configure("different", background="#FFECB3", foreground="#E65100")
@@ -2448,6 +2556,9 @@ class DBManager:
                 self.comparison_filter_result_label.config(text="")
 
     def create_comparison_context_menu(self):
+        # 탭을 다시 만들 때마다 창에 메뉴가 쌓이지 않도록 이전 메뉴 제거
+        if getattr(self, 'comparison_context_menu', None) is not None:
+            self.comparison_context_menu.destroy()
         self.comparison_context_menu = tk.Menu(self.window, tearoff=0)
         self.comparison_context_menu.add_command(label="선택한 항목을 Default DB에 추가", command=self.add_to_default_db)
         self.comparison_tree.bind("<Button-3>", self.show_comparison_context_menu)
@@ -2566,6 +2677,7 @@ class DBManager:
             # QC 엔지니어용 탭 프레임 참조 완전 제거
             self.qc_check_frame = None
             self.default_db_frame = None
+            self._deferred_tabs.clear()
             
             # QC 관련 추가 참조 제거
             if hasattr(self, 'qc_notebook'):
@@ -3955,29 +4067,33 @@ class DBManager:
                                    f"장비 유형 '{type_name}'과 관련된 모든 파라미터를 삭제하시겠습니까?\n"
                                    f"이 작업은 되돌릴 수 없습니다.")
         
-        if result:
-            try:
-                # 관련 파라미터 수 확인
-                default_values = self.db_schema.get_default_values(type_id)
-                param_count = len(default_values)
-                
-                # 삭제 실행
-                success = self.db_schema.delete_equipment_type(type_id)
+        if not result:
+            return
+
+        # 파라미터 수 확인 + 삭제 + 변경 이력은 쓰기 스레드에서 한 작업으로 실행
+        def delete_type():
+            param_count = len(self.db_schema.get_default_values(type_id))
+            success = self.db_schema.delete_equipment_type(type_id)
+            if success:
+                self.db_schema.log_change_history("delete", "equipment_type", type_name, 
+                                                f"{param_count} parameters", "", "admin")
+            return success, param_count
+
+        def on_deleted(outcome):
+            success, param_count = outcome
+            if success:
+                self.update_log(f"장비 유형 삭제: {type_name} (파라미터 {param_count}개 포함)")
                 
-                if success:
-                    self.update_log(f"장비 유형 삭제: {type_name} (파라미터 {param_count}개 포함)")
-                    
-                    self.db_schema.log_change_history("delete", "equipment_type", type_name, 
-                                                    f"{param_count} parameters", "", "admin")
-                    
-                    # 🆕 전체 탭 동기화 - 모든 장비 유형 목록 새로고침
-                    self.refresh_all_equipment_type_lists()
-                    messagebox.showinfo("성공", f"장비 유형 '{type_name}'과 관련 파라미터 {param_count}개가 삭제되었습니다.")
-                else:
-                    messagebox.showerror("오류", "장비 유형 삭제에 실패했습니다.")
-                    
-            except Exception as e:
-                messagebox.showerror("오류", f"장비 유형 삭제 중 오류:\n{str(e)}")
+                # 🆕 전체 탭 동기화 - 모든 장비 유형 목록 새로고침
+                self.refresh_all_equipment_type_lists()
+                messagebox.showinfo("성공", f"장비 유형 '{type_name}'과 관련 파라미터 {param_count}개가 삭제되었습니다.")
+            else:
+                messagebox.showerror("오류", "장비 유형 삭제에 실패했습니다.")
+
+        def on_failed(e):
+            messagebox.showerror("오류", f"장비 유형 삭제 중 오류:\n{str(e)}")
+
+        self.submit_write(delete_type, callback=on_deleted, error_callback=on_failed)
 
     def add_parameter_dialog(self):
         """새 파라미터 추가 다이얼로그"""
@@ -4090,7 +4206,15 @@ class DBManager:
                         messagebox.showerror("오류", "이미 존재하는 파라미터명입니다.")
                         return
 
-                # 파라미터 추가
+            except Exception as e:
+                messagebox.showerror("오류", f"파라미터 추가 중 오류 발생: {str(e)}")
+                self.update_log(f"❌ 파라미터 추가 오류: {str(e)}")
+                return
+
+            equipment_type_name = selected_type.split(" (ID:")[0]
+
+            # 파라미터 추가 + 변경 이력은 쓰기 스레드에서 한 작업으로 실행
+            def write_parameter():
                 record_id = self.db_schema.add_default_value(
                     equipment_type_id=equipment_type_id,
                     parameter_name=name,
@@ -4105,15 +4229,16 @@ class DBManager:
                     part_name=part_name,
                     item_type=item_type
                 )
-
-                equipment_type_name = selected_type.split(" (ID:")[0]
                 self.db_schema.log_change_history(
                     "add", "parameter", f"{equipment_type_name}_{name}", 
                     "", f"default: {default_value}, min: {min_value}, max: {max_value}", "admin"
                 )
+                return record_id
 
+            def on_written(record_id):
                 # 대화상자 닫기
-                param_dialog.destroy()
+                if param_dialog.winfo_exists():
+                    param_dialog.destroy()
 
                 # 파라미터 목록 갱신
                 self.on_equipment_type_selected()
@@ -4122,10 +4247,12 @@ class DBManager:
                 self.update_log(f"✅ 파라미터 추가 완료: {name} (장비유형: {equipment_type_name})")
                 messagebox.showinfo("완료", f"파라미터 '{name}'이 성공적으로 추가되었습니다.")
 
-            except Exception as e:
+            def on_failed(e):
                 messagebox.showerror("오류", f"파라미터 추가 중 오류 발생: {str(e)}")
                 self.update_log(f"❌ 파라미터 추가 오류: {str(e)}")
 
+            self.submit_write(write_parameter, callback=on_written, error_callback=on_failed)
+
         # 버튼 추가
         ttk.Button(button_frame, text="저장", command=save_parameter).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="취소", command=param_dialog.destroy).pack(side=tk.RIGHT, padx=5)
@@ -4175,11 +4302,14 @@ class DBManager:
         if not confirm:
             return
 
-        try:
-            # 파라미터 삭제 실행
+        equipment_type_name = self.equipment_type_var.get().split(" (ID:")[0]
+
+        # 파라미터 삭제 + 변경 이력은 쓰기 스레드에서 한 작업으로 실행 (항목별 실패는 결과로 전달)
+        def delete_parameters():
             success_count = 0
             failed_params = []
-            
+            messages = []
+
             for i, param_id in enumerate(param_ids):
                 try:
                     # DB에서 파라미터 삭제
@@ -4187,20 +4317,25 @@ class DBManager:
                     if success:
                         success_count += 1
                         
-                        equipment_type_name = self.equipment_type_var.get().split(" (ID:")[0]
                         self.db_schema.log_change_history(
                             "delete", "parameter", f"{equipment_type_name}_{param_names[i]}", 
                             "deleted", "", "admin"
                         )
                         
-                        self.update_log(f"✅ 파라미터 삭제 완료: {param_names[i]}")
+                        messages.append(f"✅ 파라미터 삭제 완료: {param_names[i]}")
                     else:
                         failed_params.append(param_names[i])
-                        self.update_log(f"❌ 파라미터 삭제 실패: {param_names[i]}")
+                        messages.append(f"❌ 파라미터 삭제 실패: {param_names[i]}")
                         
                 except Exception as e:
                     failed_params.append(param_names[i])
-                    self.update_log(f"❌ 파라미터 삭제 오류: {param_names[i]} - {str(e)}")
+                    messages.append(f"❌ 파라미터 삭제 오류: {param_names[i]} - {str(e)}")
+            return success_count, failed_params, messages
+
+        def on_deleted(result):
+            success_count, failed_params, messages = result
+            for message in messages:
+                self.update_log(message)
 
             # 결과 메시지 표시
             if success_count > 0:
@@ -4218,10 +4353,12 @@ class DBManager:
             else:
                 messagebox.showerror("오류", "파라미터 삭제에 실패했습니다.")
 
-        except Exception as e:
+        def on_failed(e):
             messagebox.showerror("오류", f"파라미터 삭제 중 오류 발생: {str(e)}")
             self.update_log(f"❌ 파라미터 삭제 중 오류: {str(e)}")
 
+        self.submit_write(delete_parameters, callback=on_deleted, error_callback=on_failed)
+
     def edit_parameter_dialog(self, event):
         """파라미터 편집 다이얼로그"""
         if not self.maint_mode:
@@ -4345,7 +4482,16 @@ class DBManager:
                                 messagebox.showerror("오류", "이미 존재하는 파라미터명입니다.")
                                 return
 
-                    # 파라미터 수정
+                except Exception as e:
+                    messagebox.showerror("오류", f"파라미터 수정 중 오류 발생: {str(e)}")
+                    self.update_log(f"❌ 파라미터 수정 오류: {str(e)}")
+                    return
+
+                equipment_type_name = self.equipment_type_var.get().split(" (ID:")[0]
+                old_name = param_data.get('parameter_name', '')
+
+                # 파라미터 수정 + 변경 이력은 쓰기 스레드에서 한 작업으로 실행
+                def write_parameter():
                     success = self.db_schema.update_default_value(
                         record_id=param_id,
                         parameter_name=new_name,
@@ -4357,31 +4503,35 @@ class DBManager:
                         part_name=new_part_name,
                         item_type=new_item_type
                     )
-
                     if success:
-                        equipment_type_name = self.equipment_type_var.get().split(" (ID:")[0]
-                        old_name = param_data.get('parameter_name', '')
                         self.db_schema.log_change_history(
                             "update", "parameter", f"{equipment_type_name}_{old_name}", 
                             f"old: {old_name}", f"new: {new_name}, default: {new_default_value}", "admin"
                         )
+                    return success
+
+                def on_written(success):
+                    if not success:
+                        messagebox.showerror("오류", "파라미터 수정에 실패했습니다.")
+                        return
 
-                        # 대화상자 닫기
+                    # 대화상자 닫기
+                    if param_dialog.winfo_exists():
                         param_dialog.destroy()
 
-                        # 파라미터 목록 갱신
-                        self.on_equipment_type_selected()
+                    # 파라미터 목록 갱신
+                    self.on_equipment_type_selected()
 
-                        # 로그 업데이트
-                        self.update_log(f"✅ 파라미터 수정 완료: {old_name} → {new_name}")
-                        messagebox.showinfo("완료", f"파라미터 '{new_name}'이 성공적으로 수정되었습니다.")
-                    else:
-                        messagebox.showerror("오류", "파라미터 수정에 실패했습니다.")
+                    # 로그 업데이트
+                    self.update_log(f"✅ 파라미터 수정 완료: {old_name} → {new_name}")
+                    messagebox.showinfo("완료", f"파라미터 '{new_name}'이 성공적으로 수정되었습니다.")
 
-                except Exception as e:
+                def on_failed(e):
                     messagebox.showerror("오류", f"파라미터 수정 중 오류 발생: {str(e)}")
                     self.update_log(f"❌ 파라미터 수정 오류: {str(e)}")
 
+                self.submit_write(write_parameter, callback=on_written, error_callback=on_failed)
+
             # 버튼 추가
             ttk.Button(button_frame, text="저장", command=save_parameter).pack(side=tk.LEFT, padx=5)
             ttk.Button(button_frame, text="취소", command=param_dialog.destroy).pack(side=tk.RIGHT, padx=5)
@@ -4504,74 +4654,87 @@ class DBManager:
             if not result['confirmed']:
                 return
             
-            # 장비 유형 추가/확인
+            # 장비 유형 추가/확인 + 데이터 추가는 쓰기 스레드에서 한 작업으로 실행
             type_name = result['type_name']
-            type_id = self.db_schema.add_equipment_type(
-                type_name, 
-                f"텍스트 파일에서 가져옴: {os.path.basename(file_path)}"
-            )
-            
-            # 데이터 추가
-            added_count = 0
-            updated_count = 0
-            error_count = 0
-            
-            for data in imported_data:
-                try:
-                    param_name = data['item_name']  # ItemName만 사용하여 통일
-                    
-                    # 기존 파라미터 확인
-                    existing = self.db_schema.get_parameter_statistics(type_id, param_name)
-                    
-                    record_id = self.db_schema.add_default_value(
-                        equipment_type_id=type_id,
-                        parameter_name=param_name,
-                        default_value=data['item_value'],
-                        min_spec=None,
-                        max_spec=None,
-                        occurrence_count=1,
-                        total_files=1,
-                        source_files=os.path.basename(file_path),
-                        description=data['item_description'],
-                        module_name=data['module'],
-                        part_name=data['part'],
-                        item_type=data['item_type']
-                    )
-                    
-                    if existing:
-                        updated_count += 1
-                    else:
-                        added_count += 1
+            source_name = os.path.basename(file_path)
+
+            def write_imported():
+                type_id = self.db_schema.add_equipment_type(
+                    type_name, 
+                    f"텍스트 파일에서 가져옴: {source_name}"
+                )
+                
+                # 데이터 추가
+                added_count = 0
+                updated_count = 0
+                error_count = 0
+                
+                for data in imported_data:
+                    try:
+                        param_name = data['item_name']  # ItemName만 사용하여 통일
                         
-                except Exception as e:
-                    error_count += 1
-                    self.update_log(f"파라미터 '{param_name}' 추가 실패: {str(e)}")
-            
-            # 결과 메시지
-            messagebox.showinfo(
-                "✅ 가져오기 완료",
-                f"텍스트 파일에서 Default DB로 성공적으로 가져왔습니다.\n\n"
-                f"📄 파일: {os.path.basename(file_path)}\n"
-                f"🏷️ 장비 유형: {type_name}\n"
-                f"✅ 새로 추가: {added_count}개\n"
-                f"🔄 업데이트: {updated_count}개\n"
-                f"❌ 오류: {error_count}개"
-            )
-            
-            # UI 업데이트
-            if hasattr(self, 'refresh_equipment_types'):
-                self.refresh_equipment_types()
-                # 방금 추가한 장비 유형 선택
-                if hasattr(self, 'equipment_type_combo'):
-                    type_names = self.equipment_type_combo['values']
-                    for type_option in type_names:
-                        if f"ID: {type_id}" in type_option:
-                            self.equipment_type_combo.set(type_option)
-                            if hasattr(self, 'on_equipment_type_selected'):
-                                self.on_equipment_type_selected()
-                            break
-            
-            self.update_log(f"텍스트 파일 가져오기 완료: {file_path} (추가 {added_count}개, 업데이트 {updated_count}개)")
+                        # 기존 파라미터 확인
+                        existing = self.db_schema.get_parameter_statistics(type_id, param_name)
+                        
+                        record_id = self.db_schema.add_default_value(
+                            equipment_type_id=type_id,
+                            parameter_name=param_name,
+                            default_value=data['item_value'],
+                            min_spec=None,
+                            max_spec=None,
+                            occurrence_count=1,
+                            total_files=1,
+                            source_files=source_name,
+                            description=data['item_description'],
+                            module_name=data['module'],
+                            part_name=data['part'],
+                            item_type=data['item_type']
+                        )
+                        
+                        if existing:
+                            updated_count += 1
+                        else:
+                            added_count += 1
+                            
+                    except Exception as e:
+                        error_count += 1
+                        self.update_log(f"파라미터 '{param_name}' 추가 실패: {str(e)}")
+                return type_id, added_count, updated_count, error_count
+
+            def on_imported(outcome):
+                type_id, added_count, updated_count, error_count = outcome
+
+                # 결과 메시지
+                messagebox.showinfo(
+                    "✅ 가져오기 완료",
+                    f"텍스트 파일에서 Default DB로 성공적으로 가져왔습니다.\n\n"
+                    f"📄 파일: {source_name}\n"
+                    f"🏷️ 장비 유형: {type_name}\n"
+                    f"✅ 새로 추가: {added_count}개\n"
+                    f"🔄 업데이트: {updated_count}개\n"
+                    f"❌ 오류: {error_count}개"
+                )
+                
+                # UI 업데이트
+                if hasattr(self, 'refresh_equipment_types'):
+                    self.refresh_equipment_types()
+                    # 방금 추가한 장비 유형 선택
+                    if hasattr(self, 'equipment_type_combo'):
+                        type_names = self.equipment_type_combo['values']
+                        for type_option in type_names:
+                            if f"ID: {type_id}" in type_option:
+                                self.equipment_type_combo.set(type_option)
+                                if hasattr(self, 'on_equipment_type_selected'):
+                                    self.on_equipment_type_selected()
+                                break
+                
+                self.update_log(f"텍스트 파일 가져오기 완료: {file_path} (추가 {added_count}개, 업데이트 {updated_count}개)")
+
+            def on_failed(e):
+                messagebox.showerror("❌ 오류", f"텍스트 파일 가져오기 중 오류 발생:\n{str(e)}")
+                self.update_log(f"텍스트 파일 가져오기 오류: {str(e)}")
+
+            self.submit_write(write_imported, callback=on_imported, error_callback=on_failed)
             
         except Exception as e:
             messagebox.showerror("❌ 오류", f"텍스트 파일 가져오기 중 오류 발생:\n{str(e)}")
@@ -5955,16 +6118,20 @@ class DBManager:
             return
             
         if messagebox.askyesno("Confirm", f"Delete {len(selected)} selected QC spec(s)?"):
-            try:
-                for item in selected:
-                    spec_id = self.qc_spec_tree.item(item, 'tags')[0]
+            spec_ids = [self.qc_spec_tree.item(item, 'tags')[0] for item in selected]
+
+            def delete_specs():
+                for spec_id in spec_ids:
                     self.qc_spec_service.delete_spec(spec_id)
-                
+
+            def on_deleted(_):
                 self.load_qc_specs()
-                messagebox.showinfo("Success", f"{len(selected)} QC spec(s) deleted")
-                
-            except Exception as e:
+                messagebox.showinfo("Success", f"{len(spec_ids)} QC spec(s) deleted")
+
+            def on_failed(e):
                 messagebox.showerror("Error", f"Failed to delete QC specs: {e}")
+
+            self.submit_write(delete_specs, callback=on_deleted, error_callback=on_failed)
     
     def import_qc_specs_csv(self):
         """
@@ -6840,28 +7007,24 @@ class DBManager:
             messagebox.showwarning("경고", "내보낼 검수 결과가 없습니다.")
             return
         
-        import pandas as pd
-        
+        from app.services.common.export_service import ExportSheet
+
         filepath = filedialog.asksaveasfilename(
             title="검수 결과 저장",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx")]
+            filetypes=[("CSV files", "*.csv"), ("TSV files", "*.tsv"), ("Excel files", "*.xlsx")]
         )
         
         if filepath:
-            try:
-                df = pd.DataFrame(self.qc_inspection_results)
-                
-                if filepath.endswith('.xlsx'):
-                    df.to_excel(filepath, index=False)
-                else:
-                    df.to_csv(filepath, index=False, encoding='utf-8-sig')
-                
-                messagebox.showinfo("완료", f"검수 결과가 저장되었습니다:\n{filepath}")
-                self.update_log(f"📥 검수 결과 내보내기: {filepath}")
-                
-            except Exception as e:
-                messagebox.showerror("오류", f"결과 내보내기 실패:\n{str(e)}")
+            # 결과 dict 목록 → 컬럼 배열 (키 순서는 처음 나온 순서)
+            results = self.qc_inspection_results
+            columns = list(dict.fromkeys(key for result in results for key in result))
+            sheet = ExportSheet("QC Results", {column: [result.get(column) for result in results]
+                                                for column in columns})
+            export_sheets_in_background(
+                self.window, filepath, [sheet], "검수 결과 저장",
+                on_done=lambda paths: self.update_log(f"📥 검수 결과 내보내기: {filepath}")
+            )
     
     def goto_qc_spec_management_tab(self):
         """QC 스펙 관리 탭으로 이동"""
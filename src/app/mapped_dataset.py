@@ -0,0 +1,285 @@
+"""
+메모리 매핑 비교 데이터셋 (대용량 비교 세트용 선택 백엔드)
+
+수백 개 파일 × 수만 항목처럼 파일 프레임을 모두 메모리에 두기 어려운 비교 세트를 위한
+ComparisonDataset 대체 구현입니다. 인터페이스는 ComparisonDataset / ComparisonPivot과 같습니다.
+
+- 값 코드화 / 차이 마스크 / 파일 제거 시 재계산은 ComparisonPivot과 같음 (정수 비교)
+- 파일별 코드 컬럼은 임시 디렉토리의 바이너리 파일에 np.memmap으로 저장
+  (ItemValue 외에 ItemType / ItemDescription 등 문자열 컬럼도 같은 방식으로 보관)
+- 파일 프레임은 보관하지 않고 필요할 때(QC 입력, 병합 프레임) 코드 컬럼에서 다시 만듦
+
+행 키 사전과 값 코드 테이블은 메모리에 유지합니다 (행 수 / 고유 값 수에 비례).
+같은 파일 안의 중복 키는 Pivot과 마찬가지로 첫 행만 보관합니다.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from app.dataset import (
+    ComparisonDataset, ComparisonPivot, LoadedFile, PivotDelta,
+    PIVOT_KEY_COLUMNS, VALUE_COLUMN,
+)
+from app.memory_tracker import track
+from app.value_table import CODE_DTYPE, MISSING_CODE, NormalizeOptions, text_values
+
+MIN_CAPACITY = 1024
+# 코드 컬럼으로 보관하지 않는 컬럼 (키 컬럼은 행 키 사전, Model은 파일 이름)
+_SKIP_COLUMNS = set(PIVOT_KEY_COLUMNS) | {'Model'}
+
+
+class MappedColumn:
+    """int32 코드 컬럼 파일 하나 (용량을 늘릴 때 파일 크기를 바꾸고 다시 매핑)"""
+
+    def __init__(self, path: str, capacity: int):
+        self.path = path
+        with open(path, 'wb') as f:
+            f.truncate(capacity * CODE_DTYPE().itemsize)
+        self.codes = self._map(capacity)
+
+    def _map(self, capacity: int) -> np.memmap:
+        return np.memmap(self.path, dtype=CODE_DTYPE, mode='r+', shape=(capacity,))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes if self.codes is not None else 0
+
+    def resize(self, capacity: int):
+        """용량 변경 (늘어난 구간은 0 = 값 없음)"""
+        self._unmap()
+        with open(self.path, 'r+b') as f:
+            f.truncate(capacity * CODE_DTYPE().itemsize)
+        self.codes = self._map(capacity)
+
+    def _unmap(self):
+        if self.codes is not None:
+            # 남은 배열 보기가 없으면 매핑도 함께 해제됨
+            self.codes.flush()
+            self.codes = None
+
+    def close(self):
+        """매핑 해제 후 파일 삭제"""
+        self._unmap()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class MappedComparisonPivot(ComparisonPivot):
+    """
+    매핑 파일 기반 (Module, Part, ItemName) × 파일 Pivot
+
+    추가 / 제거 / 차이 계산은 ComparisonPivot과 같고 코드 배열 보관만 다릅니다.
+    - 파일별 코드 컬럼은 MappedColumn 파일 (행 용량은 두 배씩 늘림)
+    - ItemValue 외 문자열 컬럼(ItemType / ItemDescription 등)도 코드 컬럼으로 보관
+    """
+
+    def __init__(self, directory: str, options: Optional[NormalizeOptions] = None):
+        super().__init__(options)
+        self.directory = directory
+        # 파일 이름 → {컬럼: MappedColumn} (VALUE_COLUMN이 비교 대상)
+        self._files: 'OrderedDict[str, Dict[str, MappedColumn]]' = OrderedDict()
+        self._capacity = MIN_CAPACITY
+        self._serial = itertools.count()
+
+    def column_codes(self, name: str, column: str = VALUE_COLUMN) -> np.ndarray:
+        """파일 컬럼의 행별 코드 (매핑 배열 보기, 길이 = 행 수)"""
+        return self._files[name][column].codes[:len(self.keys)]
+
+    def _model_codes(self, name: str) -> np.ndarray:
+        """표 모델용 코드 배열 (매핑 배열은 제자리 수정되므로 복사)"""
+        return np.array(self.column_codes(name))
+
+    def file_columns(self, name: str) -> List[str]:
+        """파일에 저장된 컬럼 (VALUE_COLUMN 먼저)"""
+        return list(self._files[name])
+
+    @property
+    def mapped_bytes(self) -> int:
+        """매핑 파일 크기 합계"""
+        return sum(column.nbytes for columns in self._files.values() for column in columns.values())
+
+    def _file_records(self, frame: pd.DataFrame):
+        """파일의 키 목록 + {컬럼: 값 목록} (키별 첫 행, 키에 NaN이 있는 행 제외)"""
+        keys, values = self._file_entries(frame)
+        records = {VALUE_COLUMN: values}
+        if not keys:
+            return keys, records
+        subset = frame.dropna(subset=PIVOT_KEY_COLUMNS).drop_duplicates(subset=PIVOT_KEY_COLUMNS, keep='first')
+        for column in subset.columns:
+            if column in _SKIP_COLUMNS or column == VALUE_COLUMN:
+                continue
+            records[str(column)] = text_values(subset[column].tolist())
+        return keys, records
+
+    def _store_column(self, name: str, positions: np.ndarray, records: Dict[str, List]):
+        serial = next(self._serial)
+        columns = {}
+        try:
+            for index, (column, values) in enumerate(records.items()):
+                path = os.path.join(self.directory, f"f{serial:05d}_{index}.i32")
+                columns[column] = MappedColumn(path, self._capacity)
+                if positions.size:
+                    columns[column].codes[positions] = self.values.encode(values)
+        except Exception:
+            for column in columns.values():
+                column.close()
+            raise
+        self._files[name] = columns
+
+    def _grow(self, grow: int):
+        rows = len(self.keys)
+        if rows <= self._capacity:
+            return
+        self._capacity = max(rows, self._capacity * 2)
+        for columns in self._files.values():
+            for column in columns.values():
+                column.resize(self._capacity)
+
+    def _drop_column(self, name: str):
+        for column in self._files.pop(name).values():
+            column.close()
+
+    def _compact(self, keep: np.ndarray):
+        """keep 행을 앞으로 당겨 기록 (파일 용량은 유지, 나머지는 값 없음)"""
+        rows, kept = len(keep), int(keep.sum())
+        for columns in self._files.values():
+            for column in columns.values():
+                codes = column.codes
+                codes[:kept] = codes[:rows][keep]
+                codes[kept:rows] = MISSING_CODE
+
+    # ------------------------------------------------------------------
+    # 프레임 복원
+    # ------------------------------------------------------------------
+
+    def _key_arrays(self):
+        keys = self.keys
+        arrays = []
+        for index in range(len(PIVOT_KEY_COLUMNS)):
+            array = np.empty(len(keys), dtype=object)
+            array[:] = [key[index] for key in keys]
+            arrays.append(array)
+        return arrays
+
+    def file_frame(self, name: str, key_arrays=None) -> pd.DataFrame:
+        """파일 하나의 프레임 (키 + 저장된 컬럼 + Model, Pivot 행 순서)"""
+        import pandas as pd
+
+        key_arrays = key_arrays if key_arrays is not None else self._key_arrays()
+        rows = np.flatnonzero(self.column_codes(name))
+        data = {column: array[rows] for column, array in zip(PIVOT_KEY_COLUMNS, key_arrays)}
+        for column in self._files[name]:
+            data[column] = self.values.decode(self.column_codes(name, column)[rows])
+        data['Model'] = name
+        return pd.DataFrame(data)
+
+    def long_frame(self, file_names: Optional[List[str]] = None) -> pd.DataFrame:
+        """여러 파일 프레임을 이어 붙인 병합 프레임"""
+        import pandas as pd
+
+        names = file_names if file_names is not None else list(self._files)
+        key_arrays = self._key_arrays()
+        return pd.concat([self.file_frame(name, key_arrays) for name in names], ignore_index=True)
+
+    def clear(self):
+        for files in self._files.values():
+            for column in files.values():
+                column.close()
+        self.__init__(self.directory, self.values.options)
+
+
+class MappedLoadedFile(LoadedFile):
+    """코드 컬럼에 저장된 파일 (프레임은 보관하지 않고 접근할 때 다시 만듦)"""
+
+    def __init__(self, name: str, pivot: MappedComparisonPivot, path: Optional[str] = None):
+        self.name = name
+        self.path = path
+        self._pivot = pivot
+        self._shadow = None
+        track('LoadedFile', self)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._pivot.file_frame(self.name)
+
+    def memory_usage(self) -> Dict[str, int]:
+        shadow_bytes = self._shadow.nbytes if self._shadow is not None else 0
+        return {'frame': 0, 'shadow': shadow_bytes}
+
+
+class MappedComparisonDataset(ComparisonDataset):
+    """
+    메모리 매핑 비교 데이터셋
+
+    매핑 파일은 directory 아래 임시 디렉토리에 만들고 close() 또는 객체 해제 시 삭제합니다.
+    """
+
+    def __init__(self, directory: Optional[str] = None, options: Optional[NormalizeOptions] = None):
+        """
+        Args:
+            directory: 매핑 파일을 만들 상위 디렉토리 (None이면 시스템 임시 디렉토리)
+            options: 값 비교 정규화 옵션
+        """
+        super().__init__(options)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix='dbm_dataset_', dir=directory)
+        self.pivot = MappedComparisonPivot(self.directory, options)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def _add(self, name: str, frame: pd.DataFrame, path: Optional[str]):
+        if name in self._files:
+            self.remove_file(name)
+        delta = self.pivot.add_column(name, frame)
+        loaded = MappedLoadedFile(name, self.pivot, path)
+        self._files[name] = loaded
+        self._merged = None
+        return loaded, delta
+
+    def remove_file(self, name: str) -> PivotDelta:
+        """파일 제거 후 Pivot 변경 내역 반환"""
+        loaded = self._files.pop(name)
+        loaded.release()
+        delta = self.pivot.remove_column(name)
+        self._merged = None
+        return delta
+
+    @property
+    def merged_df(self) -> Optional[pd.DataFrame]:
+        """전체 파일 병합 데이터프레임 (코드 컬럼에서 만들어 캐시, 파일 추가 / 제거 시 폐기)"""
+        if self._merged is None and self._files:
+            self._merged = track('merged_df', self.pivot.long_frame(self.file_names))
+        return self._merged
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        데이터셋 메모리 사용량 (bytes)
+
+        Returns:
+            ComparisonDataset.memory_usage() + {'values': 값 코드 테이블, 'mapped': 매핑 파일 크기}
+            (total은 프로세스 메모리 기준이라 매핑 파일 크기를 포함하지 않음)
+        """
+        usage = super().memory_usage()
+        usage['values'] = self.pivot.values.nbytes if len(self.pivot.values) else 0
+        usage['mapped'] = self.pivot.mapped_bytes
+        usage['total'] += usage['values']
+        return usage
+
+    def close(self):
+        """모든 파일 해제 후 매핑 디렉토리 삭제"""
+        self.clear()
+        self._finalizer()
@@ -0,0 +1,308 @@
+"""
+메모리 추적 (Memory Tracking)
+
+하루 종일 켜 두고 파일 세트를 여러 번 로드 / 해제하는 세션에서
+분류별 살아 있는 객체 수와 크기를 기록해 해제되지 않는 메모리를 찾습니다.
+
+- track(): 객체를 분류별 약한 참조로 등록 (참조가 모두 사라지면 자동으로 빠짐)
+- add_probe(): 분류별 (개수, 크기)를 돌려주는 측정 함수 등록
+  (데이터셋, 트리 항목, 캐시 항목, Tk 변수 등)
+- snapshot(): 추적 객체 수 + 측정 함수 결과 + 프로세스 메모리(RSS) + tracemalloc 합계
+  최근 스냅샷은 고정 크기 링 버퍼에 보관
+- growth(): 두 스냅샷 사이 분류별 증가량 (누수 의심 분류 확인)
+- JSON 내보내기
+
+표준 라이브러리만 사용하므로 어느 모듈에서든 부담 없이 import 할 수 있습니다.
+Tk 측정(tk_object_counts)도 전달받은 위젯의 메서드만 사용합니다.
+"""
+
+import gc
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+
+DEFAULT_CAPACITY = 240
+TOP_ALLOCATION_LIMIT = 15
+
+# Treeview 항목 수를 Tcl 안에서 재귀 계산 (항목마다 Python ↔ Tcl 호출하지 않음)
+_TREE_COUNT_PROC = (
+    "proc ::dbm_tree_item_count {w item} {"
+    " set n 0;"
+    " foreach c [$w children $item] { incr n [expr {1 + [::dbm_tree_item_count $w $c]}] };"
+    " return $n }"
+)
+
+
+class MemorySnapshot:
+    """한 시점의 분류별 메모리 기록"""
+
+    __slots__ = ('timestamp', 'label', 'rss_kb', 'traced_kb', 'categories')
+
+    def __init__(self, timestamp, label, rss_kb, traced_kb, categories):
+        self.timestamp = timestamp
+        self.label = label
+        self.rss_kb = rss_kb
+        self.traced_kb = traced_kb
+        self.categories = categories  # {분류: {'count': int, 'bytes': int 또는 None}}
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'label': self.label,
+            'rss_kb': self.rss_kb,
+            'traced_kb': self.traced_kb,
+            'categories': self.categories,
+        }
+
+
+class MemoryTracker:
+    """분류별 객체 수 / 크기 기록기 (스레드 안전)"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._tracked = {}
+        self._probes = {}
+        self._snapshots = deque(maxlen=capacity)
+
+    @property
+    def capacity(self):
+        return self._snapshots.maxlen
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+
+    def track(self, category, obj):
+        """
+        객체를 분류에 등록하고 그대로 반환
+
+        약한 참조만 보관하므로 추적 때문에 객체가 해제되지 않는 일은 없습니다.
+        DataFrame처럼 해시할 수 없는 객체도 id로 보관합니다.
+        """
+        if self.enabled:
+            with self._lock:
+                objects = self._tracked.get(category)
+                if objects is None:
+                    objects = self._tracked[category] = {}
+                key = id(obj)
+                objects[key] = weakref.ref(obj, lambda _, objects=objects, key=key: objects.pop(key, None))
+        return obj
+
+    def live_count(self, category):
+        """분류에 등록된 객체 중 아직 살아 있는 수"""
+        with self._lock:
+            objects = self._tracked.get(category)
+            return len(objects) if objects is not None else 0
+
+    def add_probe(self, name, func):
+        """
+        측정 함수 등록 (같은 이름이면 교체)
+
+        func()는 {분류: 개수} 또는 {분류: (개수, bytes)}를 반환합니다.
+        bytes를 알 수 없으면 None.
+        """
+        with self._lock:
+            self._probes[name] = func
+
+    def remove_probe(self, name):
+        with self._lock:
+            self._probes.pop(name, None)
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+
+    def collect(self):
+        """현재 분류별 {'count', 'bytes'} (측정 함수 오류는 'error'로 기록)"""
+        with self._lock:
+            tracked = {name: len(objects) for name, objects in self._tracked.items()}
+            probes = list(self._probes.items())
+
+        categories = {f"live.{name}": {'count': count, 'bytes': None} for name, count in tracked.items()}
+        for probe_name, func in probes:
+            try:
+                values = func() or {}
+            except Exception as e:
+                categories[probe_name] = {'count': None, 'bytes': None, 'error': f"{type(e).__name__}: {e}"}
+                continue
+            for name, value in values.items():
+                count, size = value if isinstance(value, tuple) else (value, None)
+                categories[name] = {'count': count, 'bytes': size}
+        return categories
+
+    def snapshot(self, label='', collect_garbage=False):
+        """
+        스냅샷 기록
+
+        Args:
+            label: 스냅샷 설명 (예: '파일 로드 후')
+            collect_garbage: True면 gc.collect() 후 측정 (해제 확인용)
+        """
+        if collect_garbage:
+            gc.collect()
+        traced_kb = None
+        if tracemalloc.is_tracing():
+            traced_kb = round(tracemalloc.get_traced_memory()[0] / 1024, 1)
+        record = MemorySnapshot(time.time(), label, process_rss_kb(), traced_kb, self.collect())
+        if self.enabled:
+            with self._lock:
+                self._snapshots.append(record)
+        return record
+
+    def snapshots(self, limit=None):
+        """최근 스냅샷 목록 (오래된 순)"""
+        with self._lock:
+            records = list(self._snapshots)
+        if limit is not None:
+            records = records[-limit:]
+        return records
+
+    @staticmethod
+    def growth(before, after):
+        """
+        두 스냅샷 사이 분류별 증가량 (증가한 분류만, 크기 증가량 → 개수 증가량 순)
+
+        Returns:
+            list: [{'category', 'count', 'bytes', 'count_delta', 'bytes_delta'}, ...]
+        """
+        result = []
+        for name, current in after.categories.items():
+            previous = before.categories.get(name, {})
+            count_delta = _delta(previous.get('count'), current.get('count'))
+            bytes_delta = _delta(previous.get('bytes'), current.get('bytes'))
+            if (count_delta or 0) > 0 or (bytes_delta or 0) > 0:
+                result.append({
+                    'category': name,
+                    'count': current.get('count'),
+                    'bytes': current.get('bytes'),
+                    'count_delta': count_delta,
+                    'bytes_delta': bytes_delta,
+                })
+        result.sort(key=lambda e: (e['bytes_delta'] or 0, e['count_delta'] or 0), reverse=True)
+        return result
+
+    # ------------------------------------------------------------------
+    # tracemalloc (켜면 Python 할당이 느려지므로 진단할 때만)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def tracing():
+        return tracemalloc.is_tracing()
+
+    @staticmethod
+    def set_tracing(enabled, frames=1):
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @staticmethod
+    def top_allocations(limit=TOP_ALLOCATION_LIMIT):
+        """
+        할당량이 큰 소스 위치 (tracemalloc이 켜져 있을 때만)
+
+        Returns:
+            list: [{'location', 'size_kb', 'count'}, ...]
+        """
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        result = []
+        for stat in snapshot.statistics('lineno')[:limit]:
+            frame = stat.traceback[0]
+            result.append({
+                'location': f"{frame.filename}:{frame.lineno}",
+                'size_kb': round(stat.size / 1024, 1),
+                'count': stat.count,
+            })
+        return result
+
+    def clear(self):
+        """스냅샷 삭제 (등록된 추적 객체 / 측정 함수는 유지)"""
+        with self._lock:
+            self._snapshots.clear()
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def to_dict(self):
+        """JSON 내보내기용 사전"""
+        return {
+            'pid': os.getpid(),
+            'capacity': self.capacity,
+            'snapshots': [record.to_dict() for record in self.snapshots()],
+            'top_allocations': self.top_allocations(),
+        }
+
+    def export_json(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+        return file_path
+
+
+def _delta(before, after):
+    if after is None:
+        return None
+    return after - (before or 0)
+
+
+def process_rss_kb():
+    """
+    현재 프로세스 상주 메모리 (KB)
+
+    psutil이 있으면 사용하고, 없으면 Linux /proc 값을 읽습니다. 둘 다 없으면 None.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss // 1024
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def tk_object_counts(root):
+    """
+    Tk 객체 수 (root 아래 위젯, Treeview 항목, Python이 만든 Tk 변수, Python 콜백 Tcl 명령)
+
+    Returns:
+        {'tk.widgets', 'tk.tree_items', 'tk.variables', 'tk.callbacks'}
+    """
+    interp = root.tk
+    if not interp.call('info', 'procs', '::dbm_tree_item_count'):
+        interp.eval(_TREE_COUNT_PROC)
+
+    widgets = tree_items = 0
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        if widget.winfo_class() == 'Treeview':
+            tree_items += int(interp.call('::dbm_tree_item_count', str(widget), ''))
+        stack.extend(widget.children.values())
+
+    return {
+        'tk.widgets': widgets,
+        'tk.tree_items': tree_items,
+        # tk.Variable 기본 이름은 PY_VAR<n>, register()로 만든 명령 이름은 숫자로 시작
+        'tk.variables': len(interp.splitlist(interp.call('info', 'globals', 'PY_VAR*'))),
+        'tk.callbacks': len(interp.splitlist(interp.call('info', 'commands', '[0-9]*'))),
+    }
+
+
+# 애플리케이션 전역 기록기
+memory_tracker = MemoryTracker()
+track = memory_tracker.track
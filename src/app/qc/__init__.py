@@ -4,8 +4,7 @@ QC 검수 모듈
 QC 검수 관련 기능을 제공합니다.
 """
 
-# Phase 1: Check list 검증
-from .checklist_validator import ChecklistValidator, integrate_checklist_validation
+import importlib
 
 # Phase 1.5: QC Inspection v2 (ItemName 기반 자동 매칭)
 from .qc_inspection_v2 import (
@@ -17,12 +16,50 @@ from .qc_inspection_v2 import (
     get_spec_display
 )
 
-# 레거시 QC 함수들 (기존 호환성 유지)
-from app.qc_legacy import (
-    QCValidator,
-    add_qc_check_functions_to_class
+# 공통 QC 커널 (모든 QC 진입점이 공유)
+from .qc_kernel import (
+    QCRule,
+    CompiledRuleSet,
+    QCKernelResult,
+    compile_rules,
+    evaluate,
+    evaluate_aligned,
+    evaluate_bounds,
+    rule_from_checklist_item,
+    rule_from_spec,
+    rule_passes,
+    rules_from_spec_columns
 )
 
+# 값 컬럼 타입 변환 캐시 (QC 커널 공유)
+from .typed_shadow import TypedShadow, column_shadow
+
+# pandas / matplotlib 에 의존하는 모듈은 이름에 처음 접근할 때 import 합니다.
+# (시작 시 app.qc 를 import 해도 무거운 라이브러리를 로드하지 않음)
+_LAZY_EXPORTS = {
+    # Phase 1: Check list 검증
+    'ChecklistValidator': '.checklist_validator',
+    'integrate_checklist_validation': '.checklist_validator',
+    # 레거시 QC 함수들 (기존 호환성 유지)
+    'QCValidator': 'app.qc_legacy',
+    'add_qc_check_functions_to_class': 'app.qc_legacy',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
+
 __all__ = [
     # Phase 1
     'ChecklistValidator',
@@ -34,6 +71,20 @@ __all__ = [
     'get_exception_item_ids',
     'validate_item',
     'get_spec_display',
+    # QC 커널
+    'QCRule',
+    'CompiledRuleSet',
+    'QCKernelResult',
+    'compile_rules',
+    'evaluate',
+    'evaluate_aligned',
+    'evaluate_bounds',
+    'rule_from_checklist_item',
+    'rule_from_spec',
+    'rule_passes',
+    'rules_from_spec_columns',
+    'TypedShadow',
+    'column_shadow',
     # 레거시
     'QCValidator',
     'add_qc_check_functions_to_class'
@@ -7,6 +7,8 @@ QC 검수 시 Check list 기반으로 파라미터를 검증합니다.
 import pandas as pd
 from typing import Dict, List, Tuple
 
+from .typed_shadow import column_shadow
+
 
 class ChecklistValidator:
     """Check list 기반 파라미터 검증"""
@@ -70,8 +72,11 @@ class ChecklistValidator:
             'details': []
         }
 
+        # 값 컬럼의 숫자 변환은 Typed Shadow로 한 번만 수행
+        numeric_values = column_shadow(df, 'Value1').numeric if 'Value1' in df.columns else None
+
         # 각 파라미터 검증
-        for idx, row in df.iterrows():
+        for pos, (idx, row) in enumerate(df.iterrows()):
             param_name = row.get('ItemName', '')
             param_value = row.get('Value1', '') if 'Value1' in df.columns else ''
 
@@ -82,7 +87,8 @@ class ChecklistValidator:
             validation_result = self.checklist_service.validate_parameter_against_checklist(
                 self.equipment_type_id,
                 str(param_name),
-                str(param_value)
+                str(param_value),
+                numeric_value=numeric_values[pos] if numeric_values is not None else None
             )
 
             if validation_result['is_checklist']:
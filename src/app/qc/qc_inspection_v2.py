@@ -14,6 +14,11 @@ import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from .qc_kernel import (
+    CompiledRuleSet, compile_rules, evaluate, evaluate_aligned, rule_from_checklist_item, rule_passes
+)
+from .typed_shadow import TypedShadow
+
 
 @dataclass
 class ChecklistItem:
@@ -28,16 +33,19 @@ class ChecklistItem:
     is_active: bool
 
 
-def get_active_checklist_items() -> List[ChecklistItem]:
+def get_active_checklist_items(db_schema=None) -> List[ChecklistItem]:
     """
     활성화된 QC Checklist 항목 조회
 
+    Args:
+        db_schema: 조회할 DB 스키마 (None이면 기본 DB)
+
     Returns:
         List[ChecklistItem]: 활성화된 Check list 항목 목록
     """
-    from db_schema import DBSchema
-
-    db_schema = DBSchema()
+    if db_schema is None:
+        from db_schema import DBSchema
+        db_schema = DBSchema()
 
     with db_schema.get_connection() as conn:
         cursor = conn.cursor()
@@ -66,12 +74,13 @@ def get_active_checklist_items() -> List[ChecklistItem]:
         ]
 
 
-def get_exception_item_ids(configuration_id: Optional[int]) -> List[int]:
+def get_exception_item_ids(configuration_id: Optional[int], db_schema=None) -> List[int]:
     """
     Configuration별 예외 항목 ID 목록 조회
 
     Args:
         configuration_id: Configuration ID (None이면 빈 목록 반환)
+        db_schema: 조회할 DB 스키마 (None이면 기본 DB)
 
     Returns:
         List[int]: 예외 항목 ID 목록
@@ -79,9 +88,9 @@ def get_exception_item_ids(configuration_id: Optional[int]) -> List[int]:
     if configuration_id is None:
         return []
 
-    from db_schema import DBSchema
-
-    db_schema = DBSchema()
+    if db_schema is None:
+        from db_schema import DBSchema
+        db_schema = DBSchema()
 
     with db_schema.get_connection() as conn:
         cursor = conn.cursor()
@@ -95,6 +104,11 @@ def get_exception_item_ids(configuration_id: Optional[int]) -> List[int]:
         return [row[0] for row in rows]
 
 
+def compile_checklist_rules(checklist_items: List[ChecklistItem]) -> CompiledRuleSet:
+    """활성 Check list 항목 전체 → 컴파일된 규칙 (qc_inspection_v2(compiled_rules=...)로 재사용)"""
+    return compile_rules([rule_from_checklist_item(item) for item in checklist_items])
+
+
 def validate_item(item: ChecklistItem, file_value: Any) -> bool:
     """
     단일 Check list 항목 검증
@@ -106,30 +120,8 @@ def validate_item(item: ChecklistItem, file_value: Any) -> bool:
     Returns:
         bool: 검증 성공 여부
     """
-    # Spec 범위 검증
-    if item.spec_min and item.spec_max:
-        try:
-            val = float(file_value)
-            return float(item.spec_min) <= val <= float(item.spec_max)
-        except (ValueError, TypeError):
-            return False
-
-    # Expected Value 검증 (Pass/Fail, Enum 등)
-    elif item.expected_value:
-        # JSON 파싱 시도 (Enum: ["Pass", "Fail"] 등)
-        try:
-            allowed_values = json.loads(item.expected_value)
-            if isinstance(allowed_values, list):
-                return str(file_value) in [str(v) for v in allowed_values]
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-        # 단순 문자열 비교 (대소문자 무시)
-        return str(file_value).upper() == str(item.expected_value).upper()
-
-    # Spec 없음 (항목 존재만 확인)
-    else:
-        return True
+    # 공통 QC 커널 판정으로 규칙 하나만 직접 평가 (항목마다 규칙 집합을 컴파일하지 않음)
+    return rule_passes(rule_from_checklist_item(item), file_value)
 
 
 def get_spec_display(item: ChecklistItem) -> str:
@@ -157,7 +149,11 @@ def get_spec_display(item: ChecklistItem) -> str:
         return "N/A"
 
 
-def qc_inspection_v2(file_data: Dict[str, Any], configuration_id: Optional[int] = None) -> Dict[str, Any]:
+def qc_inspection_v2(file_data: Dict[str, Any], configuration_id: Optional[int] = None,
+                     shadow: Optional[TypedShadow] = None,
+                     checklist_items: Optional[List[ChecklistItem]] = None,
+                     exception_item_ids: Optional[List[int]] = None,
+                     compiled_rules: Optional[CompiledRuleSet] = None) -> Dict[str, Any]:
     """
     ItemName 기반 자동 매칭 QC 검수 (Phase 1.5 신규 시스템)
 
@@ -169,6 +165,11 @@ def qc_inspection_v2(file_data: Dict[str, Any], configuration_id: Optional[int]
     Args:
         file_data: 파일 데이터 (ItemName → Value 매핑)
         configuration_id: Configuration ID (None이면 Type Common)
+        shadow: file_data 값 순서와 일치하는 Typed Shadow (있으면 변환 결과 재사용)
+        checklist_items: 미리 조회한 활성 Check list 항목 (여러 파일 검수 시 DB 조회 생략)
+        exception_item_ids: 미리 조회한 configuration_id의 예외 항목 ID
+        compiled_rules: checklist_items 전체를 compile_checklist_rules()로 미리 컴파일한 규칙
+            (있으면 검수마다 규칙을 다시 컴파일하지 않음)
 
     Returns:
         Dict[str, Any]: 검수 결과
@@ -183,7 +184,7 @@ def qc_inspection_v2(file_data: Dict[str, Any], configuration_id: Optional[int]
     file_item_names = set(file_data.keys())
 
     # 2. QC_Checklist_Items 마스터에서 활성 항목 조회
-    all_checklist_items = get_active_checklist_items()
+    all_checklist_items = checklist_items if checklist_items is not None else get_active_checklist_items()
 
     # 3. ItemName 매칭 (파일에 있는 항목만)
     matched_items = [
@@ -192,22 +193,33 @@ def qc_inspection_v2(file_data: Dict[str, Any], configuration_id: Optional[int]
     ]
 
     # 4. Configuration 예외 제거
-    exception_item_ids = get_exception_item_ids(configuration_id)
+    if exception_item_ids is None:
+        exception_item_ids = get_exception_item_ids(configuration_id)
+    exception_id_set = set(exception_item_ids)
     checklist_items = [
         item for item in matched_items
-        if item.id not in exception_item_ids
+        if item.id not in exception_id_set
     ]
 
-    # 5. 각 항목 검증 (Pass/Fail만)
-    results = []
-    for item in checklist_items:
-        file_value = file_data[item.item_name]
-        is_valid = validate_item(item, file_value)
+    # 5. 각 항목 검증 (Pass/Fail만) - 공통 QC 커널로 일괄 평가
+    file_values = [file_data[item.item_name] for item in checklist_items]
+    item_shadow = None
+    if shadow is not None:
+        positions = {name: i for i, name in enumerate(file_data)}
+        item_shadow = shadow.take([positions[item.item_name] for item in checklist_items])
+    if compiled_rules is not None:
+        evaluation = evaluate([item.item_name for item in checklist_items], file_values,
+                              compiled_rules, shadow=item_shadow)
+    else:
+        rules = compile_rules([rule_from_checklist_item(item) for item in checklist_items])
+        evaluation = evaluate_aligned(file_values, rules, shadow=item_shadow)
 
+    results = []
+    for item, file_value, is_valid in zip(checklist_items, file_values, evaluation.is_valid):
         results.append({
             'item_name': item.item_name,
             'file_value': file_value,
-            'is_valid': is_valid,
+            'is_valid': bool(is_valid),
             'spec': get_spec_display(item),
             'category': item.category or 'Uncategorized',
             'description': item.description or ''
@@ -0,0 +1,375 @@
+"""
+QC Kernel - 컬럼 기반 공통 QC 실행 코어
+
+모든 QC 진입점(qc_inspection_v2, SimplifiedQCSystem, UnifiedQCSystem,
+QCValidator, EnhancedQCValidator, QCSpecService)이 공유하는 검증 엔진입니다.
+
+- 규칙(QCRule)을 한 번 컴파일하여 배열 형태(CompiledRuleSet)로 보관
+- 정규화된 key/value 배열을 받아 결과 배열(QCKernelResult)을 반환
+- 숫자 변환/대문자 변환은 TypedShadow로 입력 전체에 대해 한 번만 수행
+- 각 진입점은 결과 배열을 기존 출력 형식(dict 목록)으로 변환만 담당
+"""
+
+import copy
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .typed_shadow import TypedShadow, TRUE_TOKENS, FALSE_TOKENS
+from ..instrumentation import span
+
+
+# ==================== 규칙 종류 ====================
+
+KIND_ANY = 0        # Spec 없음 (항목 존재만 확인, 항상 Pass)
+KIND_RANGE = 1      # 숫자 범위 (min ~ max)
+KIND_ENUM = 2       # 허용 값 목록 (대소문자 구분)
+KIND_EXACT = 3      # 단일 기대값 (대소문자 무시)
+KIND_BOOLEAN = 4    # ON/OFF 토큰 비교
+KIND_PATTERN = 5    # 정규식 패턴
+KIND_EXISTS = 6     # 값 존재 여부
+
+# ==================== 결과 상태 코드 ====================
+
+STATUS_PASS = 0
+STATUS_NO_RULE = 1          # 매칭되는 규칙 없음
+STATUS_BELOW_MIN = 2
+STATUS_ABOVE_MAX = 3
+STATUS_NOT_NUMERIC = 4
+STATUS_MISMATCH = 5
+STATUS_EMPTY = 6
+STATUS_PATTERN_MISMATCH = 7
+STATUS_RULE_ERROR = 8       # 규칙 자체 오류 (잘못된 정규식 등)
+
+@dataclass
+class QCRule:
+    """단일 QC 규칙 (컴파일 전)"""
+    key: str
+    kind: int = KIND_ANY
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    expected: Optional[str] = None
+    allowed: Optional[Sequence[str]] = None
+
+
+class CompiledRuleSet:
+    """
+    컴파일된 규칙 집합
+
+    규칙별 속성을 배열로 보관하여 평가 시 인덱스 연산만으로
+    규칙을 적용할 수 있도록 합니다.
+    """
+
+    def __init__(self, rules: Sequence[QCRule]):
+        count = len(rules)
+        self.keys: List[str] = [rule.key for rule in rules]
+        self.kinds = np.array([rule.kind for rule in rules], dtype=np.int8)
+        self.min_values = np.full(count, -np.inf, dtype=np.float64)
+        self.max_values = np.full(count, np.inf, dtype=np.float64)
+        self.expected_upper = np.empty(count, dtype=object)
+        # 1: TRUE 토큰 기대, 0: FALSE 토큰 기대, -1: 문자열 비교
+        self.bool_polarity = np.full(count, -1, dtype=np.int8)
+        self.allowed = np.empty(count, dtype=object)
+        self.patterns = np.empty(count, dtype=object)
+
+        for i, rule in enumerate(rules):
+            if rule.min_value is not None:
+                self.min_values[i] = rule.min_value
+            if rule.max_value is not None:
+                self.max_values[i] = rule.max_value
+
+            expected = '' if rule.expected is None else str(rule.expected)
+            self.expected_upper[i] = expected.upper()
+
+            if rule.kind == KIND_BOOLEAN:
+                if self.expected_upper[i] in TRUE_TOKENS:
+                    self.bool_polarity[i] = 1
+                elif self.expected_upper[i] in FALSE_TOKENS:
+                    self.bool_polarity[i] = 0
+            elif rule.kind == KIND_ENUM:
+                self.allowed[i] = frozenset(str(v) for v in (rule.allowed or []))
+            elif rule.kind == KIND_PATTERN:
+                try:
+                    self.patterns[i] = re.compile(expected)
+                except re.error:
+                    self.patterns[i] = None
+
+        # key → 규칙 인덱스 (동일 key는 첫 번째 규칙 사용)
+        self.index: Dict[str, int] = {}
+        for i, key in enumerate(self.keys):
+            self.index.setdefault(key, i)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+@dataclass
+class QCKernelResult:
+    """QC 커널 평가 결과 (입력 행과 동일한 순서의 배열)"""
+    rule_index: np.ndarray      # int64, 매칭 규칙 인덱스 (-1: 없음)
+    matched: np.ndarray         # bool
+    is_valid: np.ndarray        # bool (규칙 없음은 True)
+    status: np.ndarray          # int8, STATUS_* 코드
+    numeric: np.ndarray         # float64, 숫자 변환 값 (실패 시 NaN)
+
+    @property
+    def matched_count(self) -> int:
+        return int(self.matched.sum())
+
+    @property
+    def failed_count(self) -> int:
+        return int((self.matched & ~self.is_valid).sum())
+
+
+# ==================== 규칙 생성 헬퍼 ====================
+
+def compile_rules(rules: Sequence[QCRule]) -> CompiledRuleSet:
+    """규칙 목록 컴파일"""
+    return CompiledRuleSet(rules)
+
+
+def _parse_bound(value: Any, strip_commas: bool = False) -> Optional[float]:
+    """Spec 경계값 변환 (빈 값은 None, 변환 실패는 NaN → 항상 Fail)"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    if strip_commas:
+        text = text.replace(',', '')
+    try:
+        return float(text)
+    except ValueError:
+        return float('nan')
+
+
+def rule_from_checklist_item(item) -> QCRule:
+    """
+    ChecklistItem(qc_inspection_v2) → QCRule
+
+    spec_min/spec_max가 모두 있으면 범위, expected_value가 JSON 목록이면
+    허용 값 목록, 그 외 expected_value는 대소문자 무시 비교
+    """
+    if item.spec_min and item.spec_max:
+        return QCRule(
+            key=item.item_name,
+            kind=KIND_RANGE,
+            min_value=_parse_bound(item.spec_min),
+            max_value=_parse_bound(item.spec_max)
+        )
+
+    if item.expected_value:
+        try:
+            allowed_values = json.loads(item.expected_value)
+            if isinstance(allowed_values, list):
+                return QCRule(key=item.item_name, kind=KIND_ENUM, allowed=allowed_values)
+        except (json.JSONDecodeError, TypeError):
+            pass
+        return QCRule(key=item.item_name, kind=KIND_EXACT, expected=item.expected_value)
+
+    return QCRule(key=item.item_name, kind=KIND_ANY)
+
+
+_CHECK_TYPE_KINDS = {
+    'range': KIND_RANGE,
+    'exact': KIND_EXACT,
+    'boolean': KIND_BOOLEAN,
+    'pattern': KIND_PATTERN,
+    'exists': KIND_EXISTS,
+}
+
+
+def rule_from_spec(item_name: str, spec: Dict[str, Any]) -> QCRule:
+    """
+    QC Spec 딕셔너리(QC_Spec_Master 형식) → QCRule
+
+    Args:
+        item_name: 파라미터명
+        spec: {'check_type', 'min_spec', 'max_spec', 'expected_value', ...}
+    """
+    kind = _CHECK_TYPE_KINDS.get(spec.get('check_type') or 'range', KIND_ANY)
+
+    if kind == KIND_RANGE:
+        return QCRule(
+            key=item_name,
+            kind=KIND_RANGE,
+            min_value=_parse_bound(spec.get('min_spec')),
+            max_value=_parse_bound(spec.get('max_spec'))
+        )
+
+    return QCRule(key=item_name, kind=kind, expected=spec.get('expected_value'))
+
+
+def rules_from_spec_columns(keys: Sequence[str], min_specs: Sequence[Any],
+                            max_specs: Sequence[Any], strip_commas: bool = True) -> CompiledRuleSet:
+    """
+    Default DB 형식(min_spec/max_spec 컬럼) → 행 정렬 규칙 집합
+
+    두 경계가 모두 비어 있거나 숫자가 아닌 경계가 있는 행은 KIND_ANY
+    규칙이 됩니다 (기존 Default DB 검사와 동일하게 검사 생략).
+    strip_commas가 True이면 쉼표가 포함된 숫자("1,000")도 허용합니다.
+    """
+    rules = []
+    for key, min_spec, max_spec in zip(keys, min_specs, max_specs):
+        min_value = _parse_bound(None if _is_missing(min_spec) else min_spec, strip_commas)
+        max_value = _parse_bound(None if _is_missing(max_spec) else max_spec, strip_commas)
+        invalid_bound = any(v is not None and v != v for v in (min_value, max_value))
+        if invalid_bound or (min_value is None and max_value is None):
+            rules.append(QCRule(key=str(key), kind=KIND_ANY))
+        else:
+            rules.append(QCRule(key=str(key), kind=KIND_RANGE,
+                                min_value=min_value, max_value=max_value))
+    return CompiledRuleSet(rules)
+
+
+# ==================== 값 정규화 ====================
+
+def _is_missing(value: Any) -> bool:
+    """None/NaN 여부"""
+    if value is None:
+        return True
+    try:
+        return value != value  # NaN
+    except Exception:
+        return False
+
+
+# ==================== 평가 ====================
+
+def evaluate(keys: Sequence[str], values: Sequence[Any], rules: CompiledRuleSet,
+             strip_commas: bool = False, shadow: Optional[TypedShadow] = None) -> QCKernelResult:
+    """
+    key 기반 평가 - 각 행의 key로 규칙을 찾아 값을 검증합니다.
+
+    Args:
+        keys: 파라미터명 배열
+        values: 값 배열 (keys와 동일 길이)
+        rules: 컴파일된 규칙 집합
+        strip_commas: 숫자 변환 시 쉼표 제거 여부
+        shadow: values의 Typed Shadow (있으면 변환 결과 재사용, strip_commas 무시)
+    """
+    index = rules.index
+    rule_index = np.fromiter((index.get(key, -1) for key in keys),
+                             dtype=np.int64, count=len(keys))
+    with span('qc.evaluate', 'qc', rows=len(keys), rules=len(rules)) as s:
+        result = _evaluate_indexed(values, rule_index, rules, strip_commas, shadow)
+        s.set(failed=result.failed_count)
+    return result
+
+
+def evaluate_aligned(values: Sequence[Any], rules: CompiledRuleSet,
+                     strip_commas: bool = False,
+                     shadow: Optional[TypedShadow] = None) -> QCKernelResult:
+    """행 정렬 평가 - i번째 값에 i번째 규칙을 적용합니다."""
+    if len(values) != len(rules):
+        raise ValueError(f"값 개수({len(values)})와 규칙 개수({len(rules)})가 다릅니다")
+    rule_index = np.arange(len(rules), dtype=np.int64)
+    with span('qc.evaluate_aligned', 'qc', rows=len(values)) as s:
+        result = _evaluate_indexed(values, rule_index, rules, strip_commas, shadow)
+        s.set(failed=result.failed_count)
+    return result
+
+
+def _evaluate_indexed(values: Sequence[Any], rule_index: np.ndarray, rules: CompiledRuleSet,
+                      strip_commas: bool, shadow: Optional[TypedShadow]) -> QCKernelResult:
+    """규칙 인덱스가 정해진 상태에서 종류별로 일괄 평가"""
+    count = len(rule_index)
+    if shadow is None:
+        shadow = TypedShadow(values, strip_commas=strip_commas)
+    numeric = shadow.numeric
+
+    matched = rule_index >= 0
+    status = np.where(matched, STATUS_PASS, STATUS_NO_RULE).astype(np.int8)
+    if count == 0 or not matched.any():
+        return QCKernelResult(rule_index, matched, np.ones(count, dtype=bool), status, numeric)
+
+    safe_index = np.where(matched, rule_index, 0)
+    kinds = np.where(matched, rules.kinds[safe_index], -1)
+
+    # 1. 범위 검증 (완전 벡터화)
+    rows = np.flatnonzero(kinds == KIND_RANGE)
+    if rows.size:
+        nums = numeric[rows]
+        lo = rules.min_values[safe_index[rows]]
+        hi = rules.max_values[safe_index[rows]]
+        not_numeric = np.isnan(nums)
+        below = ~not_numeric & ~(nums >= lo)
+        above = ~not_numeric & ~below & ~(nums <= hi)
+        status[rows[not_numeric]] = STATUS_NOT_NUMERIC
+        status[rows[below]] = STATUS_BELOW_MIN
+        status[rows[above]] = STATUS_ABOVE_MAX
+
+    # 2. 단일 기대값 (대소문자 무시) - 대문자 컬럼은 필요할 때만 생성
+    rows = np.flatnonzero(kinds == KIND_EXACT)
+    if rows.size:
+        mismatch = shadow.upper[rows] != rules.expected_upper[safe_index[rows]]
+        status[rows[mismatch]] = STATUS_MISMATCH
+
+    # 3. Boolean 토큰
+    rows = np.flatnonzero(kinds == KIND_BOOLEAN)
+    if rows.size:
+        tokens = shadow.bool_tokens[rows]
+        polarity = rules.bool_polarity[safe_index[rows]]
+        literal = shadow.upper[rows] == rules.expected_upper[safe_index[rows]]
+        ok = np.where(polarity == 1, tokens == 1, np.where(polarity == 0, tokens == 0, literal))
+        status[rows[~ok]] = STATUS_MISMATCH
+
+    # 4. 허용 값 목록 (대소문자 구분)
+    rows = np.flatnonzero(kinds == KIND_ENUM)
+    for row in rows:
+        if str(values[row]) not in rules.allowed[safe_index[row]]:
+            status[row] = STATUS_MISMATCH
+
+    # 5. 정규식 패턴
+    rows = np.flatnonzero(kinds == KIND_PATTERN)
+    for row in rows:
+        pattern = rules.patterns[safe_index[row]]
+        if pattern is None:
+            status[row] = STATUS_RULE_ERROR
+        elif not pattern.match(str(values[row])):
+            status[row] = STATUS_PATTERN_MISMATCH
+
+    # 6. 존재 여부
+    rows = np.flatnonzero(kinds == KIND_EXISTS)
+    for row in rows:
+        value = values[row]
+        if value is None or str(value).strip() == '':
+            status[row] = STATUS_EMPTY
+
+    is_valid = (status == STATUS_PASS) | (status == STATUS_NO_RULE)
+    return QCKernelResult(rule_index, matched, is_valid, status, numeric)
+
+
+def evaluate_bounds(values: Sequence[Any], rules: CompiledRuleSet,
+                    strip_commas: bool = False,
+                    shadow: Optional[TypedShadow] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    행 정렬 범위 평가를 최소 / 최대 경계별로 수행
+
+    상태 코드는 행마다 하나이므로, min > max인 잘못된 Spec에서 두 위반을 모두 알 수 있도록
+    경계를 하나씩만 가진 규칙 집합으로 두 번 평가합니다 (숫자 변환은 Shadow 하나를 공유).
+
+    Returns:
+        (below_min, above_max): 행별 bool 배열
+    """
+    if shadow is None:
+        shadow = TypedShadow(values, strip_commas=strip_commas)
+    lower, upper = copy.copy(rules), copy.copy(rules)
+    lower.max_values = np.full(len(rules), np.inf)
+    upper.min_values = np.full(len(rules), -np.inf)
+    below_min = evaluate_aligned(values, lower, shadow=shadow).status == STATUS_BELOW_MIN
+    above_max = evaluate_aligned(values, upper, shadow=shadow).status == STATUS_ABOVE_MAX
+    return below_min, above_max
+
+
+def rule_passes(rule: QCRule, value: Any, strip_commas: bool = False) -> bool:
+    """
+    단일 규칙 / 단일 값 평가 (한 행 evaluate_aligned)
+
+    항목 하나를 검증하는 진입점(validate_item 등)에서 사용합니다.
+    """
+    result = evaluate_aligned([value], compile_rules([rule]), strip_commas)
+    return bool(result.is_valid[0])
@@ -0,0 +1,222 @@
+"""
+Typed Shadow - 값 컬럼의 타입 변환 결과 캐시
+
+문자열 값 컬럼에 대해 다음 파생 컬럼을 필요할 때 한 번만 계산하여
+모든 QC 규칙 평가기가 공유합니다.
+
+- numeric: float64 배열 (변환 실패는 NaN)
+- nan_mask: 숫자 변환 실패 여부
+- upper: 대문자 문자열 (str(value).upper())
+- bool_tokens: Boolean 토큰 (1: TRUE 계열, 0: FALSE 계열, -1: 해당 없음)
+
+메모리 사용량(nbytes)을 추적하며, 데이터셋 해제 시 release()로 반환합니다.
+"""
+
+import sys
+import weakref
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+TRUE_TOKENS = frozenset(['1', 'ON', 'TRUE', 'ENABLE', 'ENABLED', 'YES'])
+FALSE_TOKENS = frozenset(['0', 'OFF', 'FALSE', 'DISABLE', 'DISABLED', 'NO'])
+
+
+# ==================== 변환 함수 ====================
+
+def to_float(value: Any, strip_commas: bool = False) -> float:
+    """값 하나 → float (변환 실패는 NaN, to_float_array와 같은 규칙)"""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        try:
+            return float(value.replace(',', '') if strip_commas else value)
+        except ValueError:
+            return np.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def to_float_array(values: Sequence[Any], strip_commas: bool = False) -> np.ndarray:
+    """
+    값 목록 → float64 배열 (변환 실패는 NaN)
+
+    동일한 문자열은 한 번만 변환합니다.
+
+    Args:
+        values: 원본 값 목록
+        strip_commas: 천 단위 쉼표 제거 여부
+    """
+    result = np.full(len(values), np.nan, dtype=np.float64)
+    memo: Dict[str, float] = {}
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            parsed = memo.get(value)
+            if parsed is None:
+                parsed = memo[value] = to_float(value, strip_commas)
+            result[i] = parsed
+            continue
+        result[i] = to_float(value)
+    return result
+
+
+def to_upper_array(values: Sequence[Any]) -> np.ndarray:
+    """값 목록 → 대문자 문자열 배열 (str(value).upper())"""
+    return np.array([str(value).upper() for value in values], dtype=object)
+
+
+def to_bool_token_array(upper: np.ndarray) -> np.ndarray:
+    """대문자 문자열 배열 → Boolean 토큰 배열 (1/0/-1)"""
+    tokens = np.full(len(upper), -1, dtype=np.int8)
+    for i, value in enumerate(upper):
+        if value in TRUE_TOKENS:
+            tokens[i] = 1
+        elif value in FALSE_TOKENS:
+            tokens[i] = 0
+    return tokens
+
+
+# ==================== Typed Shadow ====================
+
+class TypedShadow:
+    """
+    값 컬럼의 타입 변환 결과 (지연 계산)
+
+    각 파생 컬럼은 처음 접근할 때 계산되어 이후 재사용됩니다.
+    """
+
+    def __init__(self, values: Sequence[Any], strip_commas: bool = False):
+        """
+        Args:
+            values: 원본 값 목록
+            strip_commas: 숫자 변환 시 천 단위 쉼표 제거 여부
+        """
+        self._values = list(values)
+        self.strip_commas = strip_commas
+        self._numeric: Optional[np.ndarray] = None
+        self._upper: Optional[np.ndarray] = None
+        self._upper_bytes = 0
+        self._bool_tokens: Optional[np.ndarray] = None
+        # take()로 만든 부분 Shadow는 원본의 파생 컬럼을 잘라서 사용
+        self._parent: Optional['TypedShadow'] = None
+        self._positions: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> list:
+        """원본 값 목록"""
+        return self._values
+
+    @property
+    def numeric(self) -> np.ndarray:
+        """float64 배열 (변환 실패는 NaN)"""
+        if self._numeric is None:
+            if self._parent is not None:
+                self._numeric = self._parent.numeric[self._positions]
+            else:
+                self._numeric = to_float_array(self._values, strip_commas=self.strip_commas)
+        return self._numeric
+
+    @property
+    def nan_mask(self) -> np.ndarray:
+        """숫자 변환 실패 마스크"""
+        return np.isnan(self.numeric)
+
+    @property
+    def upper(self) -> np.ndarray:
+        """대문자 문자열 배열"""
+        if self._upper is None:
+            if self._parent is not None:
+                # 문자열 객체는 원본과 공유하므로 배열 크기만 집계
+                self._upper = self._parent.upper[self._positions]
+            else:
+                self._upper = to_upper_array(self._values)
+                self._upper_bytes = sum(sys.getsizeof(v) for v in self._upper)
+        return self._upper
+
+    @property
+    def bool_tokens(self) -> np.ndarray:
+        """Boolean 토큰 배열 (1: TRUE, 0: FALSE, -1: 해당 없음)"""
+        if self._bool_tokens is None:
+            if self._parent is not None:
+                self._bool_tokens = self._parent.bool_tokens[self._positions]
+            else:
+                self._bool_tokens = to_bool_token_array(self.upper)
+        return self._bool_tokens
+
+    def take(self, positions: Sequence[int]) -> 'TypedShadow':
+        """
+        부분 Shadow 생성
+
+        파생 컬럼은 원본 Shadow에서 계산(또는 재사용)한 뒤 잘라서 사용하므로
+        같은 값을 두 번 변환하지 않습니다.
+
+        Args:
+            positions: 선택할 행 위치 목록
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        subset = TypedShadow([self._values[i] for i in positions], self.strip_commas)
+        subset._parent = self
+        subset._positions = positions
+        return subset
+
+    @property
+    def nbytes(self) -> int:
+        """계산된 파생 컬럼의 메모리 사용량 (bytes)"""
+        total = 0
+        if self._numeric is not None:
+            total += self._numeric.nbytes
+        if self._upper is not None:
+            total += self._upper.nbytes + self._upper_bytes
+        if self._bool_tokens is not None:
+            total += self._bool_tokens.nbytes
+        return total
+
+    def release(self):
+        """파생 컬럼 해제 (다시 접근하면 재계산)"""
+        self._numeric = None
+        self._upper = None
+        self._upper_bytes = 0
+        self._bool_tokens = None
+
+
+# ==================== DataFrame 컬럼 Shadow 캐시 ====================
+
+# (id(df), column, strip_commas) → TypedShadow
+# DataFrame이 해제되면 weakref.finalize로 자동 제거됩니다.
+_frame_shadows: Dict[Tuple[int, str, bool], TypedShadow] = {}
+
+
+def _drop_frame_shadows(frame_id: int):
+    """해제된 DataFrame의 Shadow 제거"""
+    for key in [k for k in _frame_shadows if k[0] == frame_id]:
+        _frame_shadows.pop(key).release()
+
+
+def column_shadow(df, column: str, strip_commas: bool = False) -> TypedShadow:
+    """
+    DataFrame 컬럼의 Typed Shadow 조회 (없으면 생성)
+
+    동일한 DataFrame에 대해 여러 QC 검사가 같은 Shadow를 공유합니다.
+    검사 대상 DataFrame은 읽기 전용으로 취급해야 합니다.
+    """
+    key = (id(df), column, strip_commas)
+    shadow = _frame_shadows.get(key)
+    if shadow is None or len(shadow) != len(df):
+        if not any(k[0] == key[0] for k in _frame_shadows):
+            weakref.finalize(df, _drop_frame_shadows, key[0])
+        shadow = TypedShadow(df[column].tolist(), strip_commas=strip_commas)
+        _frame_shadows[key] = shadow
+    return shadow
+
+
+def shadow_memory_usage() -> int:
+    """DataFrame 컬럼 Shadow 캐시의 전체 메모리 사용량 (bytes)"""
+    return sum(shadow.nbytes for shadow in _frame_shadows.values())
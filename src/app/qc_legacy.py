@@ -5,11 +5,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 from app.loading import LoadingDialog
 from app.utils import create_treeview_with_scrollbar
+from app.services.common.chart_service import chart_renderer
 
 class QCValidator:
     """QC 검증을 수행하는 클래스"""
@@ -125,32 +124,39 @@ class QCValidator:
         """데이터 일관성 검사 - 사양 범위 검사"""
         results = []
         
-        # min_spec과 max_spec이 모두 있는 경우 범위 검사
-        if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']):
-            for _, row in df.iterrows():
-                try:
-                    if pd.notna(row['min_spec']) and pd.notna(row['max_spec']) and pd.notna(row['default_value']):
-                        min_val = float(row['min_spec'])
-                        max_val = float(row['max_spec'])
-                        default_val = float(row['default_value'])
-                        
-                        if min_val > max_val:
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "사양 오류",
-                                "description": f"최소값({min_val})이 최대값({max_val})보다 큽니다.",
-                                "severity": "높음"
-                            })
-                        elif not (min_val <= default_val <= max_val):
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "범위 초과",
-                                "description": f"설정값({default_val})이 사양 범위({min_val}~{max_val})를 벗어납니다.",
-                                "severity": "중간"
-                            })
-                except (ValueError, TypeError):
-                    # 숫자가 아닌 값은 무시
-                    continue
+        # app.qc 패키지가 이 모듈을 재export하므로 순환 import 방지를 위해 지연 import
+        from app.qc.qc_kernel import evaluate_aligned, rules_from_spec_columns, STATUS_PASS
+        from app.qc.typed_shadow import column_shadow
+
+        # min_spec과 max_spec이 모두 있는 경우 범위 검사 (공통 QC 커널)
+        if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']) and not df.empty:
+            names = df['parameter_name'].tolist()
+            # 기존 검사와 같이 float() 그대로 변환 (쉼표가 있는 값은 숫자가 아니므로 검사 생략)
+            rules = rules_from_spec_columns(names, df['min_spec'].tolist(), df['max_spec'].tolist(),
+                                            strip_commas=False)
+            shadow = column_shadow(df, 'default_value')
+            evaluation = evaluate_aligned(shadow.values, rules, shadow=shadow)
+
+            # 양쪽 경계가 모두 숫자이고 기본값도 숫자인 행만 대상
+            lo, hi = rules.min_values, rules.max_values
+            checked = np.isfinite(lo) & np.isfinite(hi) & ~np.isnan(evaluation.numeric)
+
+            for i in np.flatnonzero(checked):
+                min_val, max_val, default_val = lo[i], hi[i], evaluation.numeric[i]
+                if min_val > max_val:
+                    results.append({
+                        "parameter": names[i],
+                        "issue_type": "사양 오류",
+                        "description": f"최소값({min_val})이 최대값({max_val})보다 큽니다.",
+                        "severity": "높음"
+                    })
+                elif evaluation.status[i] != STATUS_PASS:
+                    results.append({
+                        "parameter": names[i],
+                        "issue_type": "범위 초과",
+                        "description": f"설정값({default_val})이 사양 범위({min_val}~{max_val})를 벗어납니다.",
+                        "severity": "중간"
+                    })
         
         return results
 
@@ -169,6 +175,41 @@ class QCValidator:
         return all_results
 
 
+def draw_issue_pie_chart(figure, chart):
+    """이슈 유형 분포 파이 차트 (chart: (유형별 개수, 제목))"""
+    data, title = chart
+    ax = figure.subplots()
+
+    # 데이터가 있는 항목만 포함
+    labels = []
+    sizes = []
+    # Professional color scheme for engineering applications
+    professional_colors = ['#0078d4', '#107c10', '#ff8c00', '#d13438', '#605e5c', '#8764b8']
+    chart_colors = []
+
+    for i, (label, value) in enumerate(data.items()):
+        if value > 0:
+            labels.append(label)
+            sizes.append(value)
+            chart_colors.append(professional_colors[i % len(professional_colors)])
+
+    if not sizes:  # 데이터가 없는 경우
+        ax.text(0.5, 0.5, "No Data Available", ha='center', va='center',
+                fontsize=12, color='gray')
+        ax.axis('off')
+    else:
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
+                                          colors=chart_colors, startangle=90)
+        ax.axis('equal')  # 원형 파이 차트
+
+        # Professional styling
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+
+    ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
+
+
 def add_qc_check_functions_to_class(cls):
     """
     DBManager 클래스에 QC 검수 기능을 추가합니다.
@@ -452,42 +493,10 @@ def add_qc_check_functions_to_class(cls):
         self.create_pie_chart(issue_counts, "Issue Type Distribution")
 
     def create_pie_chart(self, data, title):
-        """Professional Engineering Style Pie Chart"""
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        # 데이터가 있는 항목만 포함
-        labels = []
-        sizes = []
-        # Professional color scheme for engineering applications
-        professional_colors = ['#0078d4', '#107c10', '#ff8c00', '#d13438', '#605e5c', '#8764b8']
-        chart_colors = []
-
-        for i, (label, value) in enumerate(data.items()):
-            if value > 0:
-                labels.append(label)
-                sizes.append(value)
-                chart_colors.append(professional_colors[i % len(professional_colors)])
-
-        if not sizes:  # 데이터가 없는 경우
-            ax.text(0.5, 0.5, "No Data Available", ha='center', va='center', 
-                   fontsize=12, color='gray')
-            ax.axis('off')
-        else:
-            wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                            colors=chart_colors, startangle=90)
-            ax.axis('equal')  # 원형 파이 차트
-            
-            # Professional styling
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-
-        ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
-
-        # tkinter 캔버스에 matplotlib 차트 표시
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        """Professional Engineering Style Pie Chart (작업 스레드에서 그려 이미지로 표시)"""
+        data = dict(data)
+        chart_renderer.show(self.chart_frame, ('qc_pie', title, tuple(data.items())),
+                            draw_issue_pie_chart, lambda: (data, title), figsize=(6, 4))
 
     def export_qc_results(self):
         """QC 검수 결과 내보내기"""
@@ -1,38 +1,41 @@
 # 간소화된 QC 검수 보고서 생성 모듈
+# 시트는 결과 목록에서 바로 컬럼 배열로 만들어 export_service로 흘려 씀 (DataFrame 변환 없음)
 
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import pandas as pd
 
+from app.services.common.export_service import ExportSheet, write_export, FORMAT_CSV
 
-def export_qc_results_to_excel(qc_results: List[Dict], equipment_name: str, 
+# 검수 결과 시트 컬럼 → 결과 dict 키
+QC_RESULT_FIELDS = {
+    '파라미터': 'parameter',
+    '문제 유형': 'issue_type',
+    '상세 설명': 'description',
+    '심각도': 'severity',
+    '카테고리': 'category',
+    '권장사항': 'recommendation'
+}
+
+
+def _qc_results_sheet(name: str, qc_results: List[Dict], empty_message: str) -> ExportSheet:
+    return ExportSheet.from_records(name, qc_results, QC_RESULT_FIELDS, empty_message={'결과': empty_message})
+
+
+def export_qc_results_to_excel(qc_results: List[Dict], equipment_name: str,
                               equipment_type: str, file_path: str) -> bool:
     """QC 검수 결과를 Excel 파일로 내보내기"""
     try:
-        # 검수 결과 데이터프레임 생성
-        results_data = []
-        for result in qc_results:
-            results_data.append({
-                '파라미터': result.get('parameter', ''),
-                '문제 유형': result.get('issue_type', ''),
-                '상세 설명': result.get('description', ''),
-                '심각도': result.get('severity', ''),
-                '카테고리': result.get('category', ''),
-                '권장사항': result.get('recommendation', '')
-            })
-        
-        results_df = pd.DataFrame(results_data)
-        
         # 검수 요약 정보
+        severities = [r.get('severity') for r in qc_results]
         summary_data = {
             '항목': [
                 '검수 일시',
-                '장비명', 
+                '장비명',
                 '장비 유형',
                 '총 이슈 수',
                 '높은 심각도',
-                '중간 심각도', 
+                '중간 심각도',
                 '낮은 심각도'
             ],
             '값': [
@@ -40,30 +43,20 @@ def export_qc_results_to_excel(qc_results: List[Dict], equipment_name: str,
                 equipment_name,
                 equipment_type,
                 len(qc_results),
-                len([r for r in qc_results if r.get('severity') == '높음']),
-                len([r for r in qc_results if r.get('severity') == '중간']),
-                len([r for r in qc_results if r.get('severity') == '낮음'])
+                severities.count('높음'),
+                severities.count('중간'),
+                severities.count('낮음')
             ]
         }
-        summary_df = pd.DataFrame(summary_data)
-        
-        # Excel 파일 생성
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            # 검수 요약 시트
-            summary_df.to_excel(writer, sheet_name='검수 요약', index=False)
-            
-            # 검수 결과 시트
-            if results_df.empty:
-                # 이슈가 없는 경우
-                no_issues_df = pd.DataFrame({
-                    '결과': ['✅ 검수 완료 - 발견된 이슈가 없습니다.']
-                })
-                no_issues_df.to_excel(writer, sheet_name='검수 결과', index=False)
-            else:
-                results_df.to_excel(writer, sheet_name='검수 결과', index=False)
-        
+
+        # Excel 파일 생성 (검수 요약 + 검수 결과, 이슈가 없으면 안내 한 줄)
+        write_export(file_path, [
+            ExportSheet('검수 요약', summary_data),
+            _qc_results_sheet('검수 결과', qc_results, '✅ 검수 완료 - 발견된 이슈가 없습니다.')
+        ])
+
         return True
-        
+
     except Exception as e:
         print(f"Excel 보고서 생성 오류: {e}")
         return False
@@ -73,22 +66,9 @@ def export_qc_results_to_csv(qc_results: List[Dict], equipment_name: str,
                             equipment_type: str, file_path: str) -> bool:
     """QC 검수 결과를 CSV 파일로 내보내기"""
     try:
-        # 검수 결과 데이터프레임 생성
-        results_data = []
-        for result in qc_results:
-            results_data.append({
-                '파라미터': result.get('parameter', ''),
-                '문제 유형': result.get('issue_type', ''),
-                '상세 설명': result.get('description', ''),
-                '심각도': result.get('severity', ''),
-                '카테고리': result.get('category', ''),
-                '권장사항': result.get('recommendation', '')
-            })
-
-        results_df = pd.DataFrame(results_data)
-
         # CSV 파일 생성
-        results_df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        write_export(file_path, [ExportSheet.from_records('검수 결과', qc_results, QC_RESULT_FIELDS)],
+                     file_format=FORMAT_CSV)
 
         return True
 
@@ -170,66 +150,36 @@ def export_full_qc_report_to_excel(qc_result: Dict[str, Any], equipment_name: st
                 summary_data['항목'].append('예외 적용')
                 summary_data['값'].append(exception_count)
 
-        summary_df = pd.DataFrame(summary_data)
+        sheets = [ExportSheet('검수 요약', summary_data)]
 
         # 2. 기본 QC 검사 결과
-        qc_results = qc_result.get('detailed_results', [])
-        qc_results_data = []
-        for result in qc_results:
-            qc_results_data.append({
-                '파라미터': result.get('parameter', ''),
-                '문제 유형': result.get('issue_type', ''),
-                '상세 설명': result.get('description', ''),
-                '심각도': result.get('severity', ''),
-                '카테고리': result.get('category', ''),
-                '권장사항': result.get('recommendation', '')
-            })
-
-        qc_results_df = pd.DataFrame(qc_results_data) if qc_results_data else pd.DataFrame({
-            '결과': ['✅ 발견된 이슈가 없습니다.']
-        })
+        sheets.append(_qc_results_sheet('기본 QC 검사', qc_result.get('detailed_results', []),
+                                        '✅ 발견된 이슈가 없습니다.'))
 
         # 3. Check list 검증 결과 (Phase 1.5: Pass/Fail만, 심각도 없음)
-        checklist_df = None
         if checklist_validation:
             checklist_results = checklist_validation.get('results', [])
-            checklist_data = []
-            for result in checklist_results:
-                checklist_data.append({
-                    'Result': '✅ Pass' if result.get('is_valid', False) else '❌ Fail',
-                    'ItemName': result.get('item_name', ''),
-                    'Value': result.get('value', ''),
-                    'Expected': result.get('expected', ''),
-                    'Category': result.get('category', ''),
-                    'Reason': result.get('reason', '')
-                })
-
-            checklist_df = pd.DataFrame(checklist_data) if checklist_data else pd.DataFrame({
-                '결과': ['✅ 검증된 Check list 항목이 없습니다.']
-            })
+            if checklist_results:
+                checklist_data = {
+                    'Result': ['✅ Pass' if r.get('is_valid', False) else '❌ Fail' for r in checklist_results],
+                    'ItemName': [r.get('item_name', '') for r in checklist_results],
+                    'Value': [r.get('value', '') for r in checklist_results],
+                    'Expected': [r.get('expected', '') for r in checklist_results],
+                    'Category': [r.get('category', '') for r in checklist_results],
+                    'Reason': [r.get('reason', '') for r in checklist_results]
+                }
+            else:
+                checklist_data = {'결과': ['✅ 검증된 Check list 항목이 없습니다.']}
+            sheets.append(ExportSheet('Check list 검증', checklist_data))
 
         # 4. 권장사항
         recommendations = qc_result.get('recommendations', [])
-        recommendations_df = pd.DataFrame({
-            '권장사항': recommendations
-        }) if recommendations else pd.DataFrame({
-            '권장사항': ['권장사항이 없습니다.']
-        })
+        sheets.append(ExportSheet('권장사항', {
+            '권장사항': list(recommendations) if recommendations else ['권장사항이 없습니다.']
+        }))
 
         # Excel 파일 생성
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            # 검수 요약 시트
-            summary_df.to_excel(writer, sheet_name='검수 요약', index=False)
-
-            # 기본 QC 검사 결과 시트
-            qc_results_df.to_excel(writer, sheet_name='기본 QC 검사', index=False)
-
-            # Check list 검증 결과 시트 (Phase 1.5)
-            if checklist_df is not None:
-                checklist_df.to_excel(writer, sheet_name='Check list 검증', index=False)
-
-            # 권장사항 시트
-            recommendations_df.to_excel(writer, sheet_name='권장사항', index=False)
+        write_export(file_path, sheets)
 
         return True
 
@@ -237,4 +187,4 @@ def export_full_qc_report_to_excel(qc_result: Dict[str, Any], equipment_name: st
         print(f"전체 QC 보고서 생성 오류: {e}")
         import traceback
         traceback.print_exc()
-        return False
\ No newline at end of file
+        return False
@@ -5,11 +5,237 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 from app.utils import create_treeview_with_scrollbar
-from app.loading import LoadingDialog
+from app.services.common.chart_service import chart_renderer, data_token
+
+# 차이 유형 (차이점 리포트 / 차트 공통)
+DIFF_TYPES = ['Default DB에 없음', '파일에 없음', '값 차이']
+
+# 통계 차트: 편차 막대로 보여줄 파라미터 수 / 편차 표시 범위(%)
+STATISTICS_TOP_N = 15
+DEVIATION_LIMIT = 100
+
+# 통계 리포트 화면에 펼쳐 보여줄 파라미터 수 (전체는 내보내기)
+STATISTICS_VIEW_LIMIT = 200
+
+# 통계 리포트 / 내보내기 컬럼 (numeric_statistics 키 → 표시 이름)
+STATISTICS_COLUMNS = [
+    ('parameter', "파라미터"),
+    ('default', "Default 값"),
+    ('mean', "평균"),
+    ('min', "최소값"),
+    ('max', "최대값"),
+    ('std', "표준편차"),
+    ('deviation', "Default 대비 편차(%)"),
+]
+
+
+def _short(label, limit):
+    """축 레이블 축약"""
+    return label[:limit] + '...' if len(label) > limit else label
+
+
+def _column(merged_df, name):
+    """컬럼 (없으면 전체 NaN)"""
+    if name in merged_df.columns:
+        return merged_df[name]
+    return pd.Series(np.nan, index=merged_df.index, dtype=object)
+
+
+def file_difference_masks(merged_df, file_names, options=None):
+    """
+    파일별 차이 유형 마스크 (행 단위 비교를 컬럼 연산으로)
+
+    Default 값과 파일 값은 한 값 코드 테이블로 코드화하여 정수로 비교합니다
+    (정규화 옵션은 코드를 부여할 때 한 번 적용).
+
+    Args:
+        options: 값 비교 정규화 옵션 (NormalizeOptions, None이면 문자열이 같아야 같은 값)
+
+    Returns:
+        [(파일 이름, 파일 값 Series, {차이 유형: bool 배열})] - file_names 순서
+    """
+    from app.value_table import ValueTable, text_values
+
+    table = ValueTable(options)
+    default = _column(merged_df, 'default_value')
+    default_codes = table.canonical(table.encode(text_values(default.tolist())))
+    default_missing = default_codes == 0
+    result = []
+    for file_idx, file_name in enumerate(file_names):
+        values = _column(merged_df, f"file_{file_idx}")
+        file_codes = table.canonical(table.encode(text_values(values.tolist())))
+        file_missing = file_codes == 0
+        both = ~default_missing & ~file_missing
+        result.append((os.path.basename(file_name), values, {
+            'Default DB에 없음': default_missing & ~file_missing,
+            '파일에 없음': ~default_missing & file_missing,
+            '값 차이': both & (default_codes != file_codes),
+        }))
+    return result
+
+
+def difference_counts(merged_df, file_names, options=None):
+    """파일별 차이 유형 개수 {'files': [...], 차이 유형: [...]}"""
+    counts = {'files': []}
+    counts.update({diff_type: [] for diff_type in DIFF_TYPES})
+    for file_name, _, masks in file_difference_masks(merged_df, file_names, options):
+        counts['files'].append(file_name)
+        for diff_type in DIFF_TYPES:
+            counts[diff_type].append(int(masks[diff_type].sum()))
+    return counts
+
+
+def numeric_statistics(merged_df, file_names, sort_by_deviation=True):
+    """
+    수치형 파라미터 전체의 파일 값 통계 (값 행렬 한 번에 계산)
+
+    Default 값과 파일 값이 숫자로 변환되는 행만 포함합니다.
+    Default 값이 0이면 편차는 0으로 둡니다.
+
+    Args:
+        sort_by_deviation: True면 Default 대비 편차 절대값이 큰 순서 (같으면 원래 순서)
+
+    Returns:
+        {'parameter', 'default', 'mean', 'min', 'max', 'std', 'deviation'} - numpy 배열
+    """
+    default = pd.to_numeric(_column(merged_df, 'default_value'), errors='coerce').to_numpy(dtype=float)
+    columns = [_column(merged_df, f"file_{i}") for i in range(len(file_names))]
+    if columns:
+        values = np.column_stack([pd.to_numeric(col, errors='coerce').to_numpy(dtype=float) for col in columns])
+    else:
+        values = np.empty((len(merged_df), 0))
+
+    keep = ~np.isnan(default) & (~np.isnan(values)).any(axis=1)
+    default, values = default[keep], values[keep]
+    if len(values):
+        mean = np.nanmean(values, axis=1)
+        minimum, maximum, std = np.nanmin(values, axis=1), np.nanmax(values, axis=1), np.nanstd(values, axis=1)
+    else:
+        mean = minimum = maximum = std = np.empty(0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        deviation = np.where(default != 0, (mean - default) / default * 100, 0.0)
+
+    stats = {
+        'parameter': _column(merged_df, 'parameter').to_numpy(dtype=object)[keep],
+        'default': default,
+        'mean': mean,
+        'min': minimum,
+        'max': maximum,
+        'std': std,
+        'deviation': deviation,
+    }
+    if sort_by_deviation:
+        stats = sort_statistics(stats)
+    return stats
+
+
+def sort_statistics(stats, key='deviation', descending=True):
+    """
+    통계 배열을 수치 컬럼 하나로 정렬 (같은 값은 원래 순서 유지)
+
+    key가 'deviation'이면 절대값 기준입니다.
+    """
+    values = np.abs(stats[key]) if key == 'deviation' else stats[key]
+    order = np.argsort(-values if descending else values, kind='stable')
+    return {name: column[order] for name, column in stats.items()}
+
+
+def statistics_table(stats):
+    """통계 배열 → 내보내기용 {표시 이름: 배열}"""
+    return {label: stats[key] for key, label in STATISTICS_COLUMNS}
+
+
+def statistics_chart_data(stats):
+    """통계 차트 데이터 (전체 수치형 파라미터 집계 + 편차 상위 파라미터)"""
+    deviation = stats['deviation']
+    top = np.argsort(-np.abs(deviation), kind='stable')[:STATISTICS_TOP_N]
+    return {
+        'count': len(deviation),
+        'deviation': np.clip(deviation, -DEVIATION_LIMIT, DEVIATION_LIMIT),
+        'top_parameters': [str(p) for p in stats['parameter'][top]],
+        'top_deviation': deviation[top],
+    }
+
+
+def draw_summary_chart(figure, diff_counts):
+    """파일별 차이점 수 막대 차트"""
+    ax = figure.subplots()
+    files = [_short(f, 15) for f in diff_counts]
+    counts = list(diff_counts.values())
+
+    bars = ax.bar(files, counts, color='skyblue')
+    for bar, count in zip(bars, counts):
+        ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height() + 0.1,
+                str(count), ha='center', va='bottom')
+
+    ax.set_title('파일별 차이점 수')
+    ax.set_xlabel('파일')
+    ax.set_ylabel('차이점 수')
+    ax.set_xticks(range(len(files)))
+    ax.set_xticklabels(files, rotation=45, ha='right')
+    figure.tight_layout()
+
+
+def draw_differences_chart(figure, counts):
+    """파일별 차이 유형 묶음 막대 차트"""
+    ax = figure.subplots()
+    labels = [_short(f, 15) for f in counts['files']]
+    width = 0.25
+    x = np.arange(len(labels))
+
+    colors = ['#FF9800', '#2196F3', '#4CAF50']
+    for offset, diff_type, color in zip((-width, 0, width), DIFF_TYPES, colors):
+        bars = ax.bar(x + offset, counts[diff_type], width, label=diff_type, color=color)
+        for bar in bars:
+            height = bar.get_height()
+            if height > 0:  # 값이 0인 경우 레이블 표시 안함
+                ax.text(bar.get_x() + bar.get_width() / 2., height + 0.1,
+                        str(int(height)), ha='center', va='bottom', fontsize=8)
+
+    ax.set_title('파일별 차이점 유형')
+    ax.set_xlabel('파일')
+    ax.set_ylabel('차이점 수')
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.legend()
+    figure.tight_layout()
+
+
+def draw_statistics_chart(figure, data):
+    """편차 분포 히스토그램 + 편차 상위 파라미터 막대 차트"""
+    ax1, ax2 = figure.subplots(1, 2)
+    if not data['count']:
+        for ax in (ax1, ax2):
+            ax.text(0.5, 0.5, '분석 가능한 수치형 파라미터가 없습니다.', ha='center', va='center',
+                    transform=ax.transAxes, color='gray')
+            ax.axis('off')
+        return
+
+    # 1. 전체 파라미터의 Default 대비 편차 분포
+    ax1.hist(data['deviation'], bins=40, range=(-DEVIATION_LIMIT, DEVIATION_LIMIT), color='#3F51B5')
+    ax1.axvline(0, color='gray', linewidth=0.5)
+    ax1.set_title(f"Default 대비 편차 분포 ({data['count']}개 파라미터)")
+    ax1.set_xlabel(f"편차 (%, ±{DEVIATION_LIMIT}%에서 자름)")
+    ax1.set_ylabel('파라미터 수')
+
+    # 2. 편차가 큰 파라미터
+    deviation = data['top_deviation']
+    capped = np.clip(deviation, -DEVIATION_LIMIT, DEVIATION_LIMIT)
+    y = np.arange(len(capped))
+    ax2.barh(y, capped, color=np.where(capped >= 0, '#4CAF50', '#F44336'))
+    for pos, (dev, bar_len) in enumerate(zip(deviation, capped)):
+        ax2.text(bar_len, pos, f" {dev:.1f}%", va='center', ha='left' if bar_len >= 0 else 'right', fontsize=8)
+    ax2.set_yticks(y)
+    ax2.set_yticklabels([_short(p, 20) for p in data['top_parameters']], fontsize=8)
+    ax2.invert_yaxis()
+    ax2.set_xlim(-DEVIATION_LIMIT * 1.3, DEVIATION_LIMIT * 1.3)
+    ax2.axvline(0, color='gray', linewidth=0.5)
+    ax2.set_title(f"편차 상위 {len(capped)}개 파라미터")
+    ax2.set_xlabel('편차 (%)')
+    figure.tight_layout()
+
 
 def add_report_functions_to_class(cls):
     """
@@ -52,6 +278,13 @@ def add_report_functions_to_class(cls):
             command=self.export_report
         ).pack(side=tk.RIGHT, padx=5)
 
+        # 원본 데이터(merged_df 전체) 시트 포함 여부 - 큰 비교에서는 저장 시간 대부분을 차지
+        self.report_include_raw_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            top_frame, text="원본 데이터 포함",
+            variable=self.report_include_raw_var
+        ).pack(side=tk.RIGHT, padx=5)
+
         # 중간 프레임 - 트리뷰
         columns = ("item", "value")
         headings = {"item": "항목", "value": "값"}
@@ -103,24 +336,13 @@ def add_report_functions_to_class(cls):
         total_params = len(self.merged_df)
         self.report_tree.insert("", "end", values=("총 파라미터 수", total_params))
 
-        # 차이점 통계
-        diff_counts = {}
-        total_diffs = 0
-
-        for file_idx in range(len(self.file_names)):
-            file_col = f"file_{file_idx}"
-            file_name = os.path.basename(self.file_names[file_idx])
-            diff_count = 0
-
-            for _, row in self.merged_df.iterrows():
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else ""
-                file_value = row[file_col] if file_col in row and pd.notna(row[file_col]) else ""
-
-                if default_value != file_value:
-                    diff_count += 1
-
-            diff_counts[file_name] = diff_count
-            total_diffs += diff_count
+        # 차이점 통계 (차이 유형 합계 = Default 값과 다른 행 수)
+        counts = difference_counts(self.merged_df, self.file_names, self._value_options())
+        diff_counts = {
+            file_name: sum(counts[diff_type][i] for diff_type in DIFF_TYPES)
+            for i, file_name in enumerate(counts['files'])
+        }
+        total_diffs = sum(diff_counts.values())
 
         self.report_tree.insert("", "end", values=("총 차이점 수", total_diffs))
 
@@ -131,430 +353,184 @@ def add_report_functions_to_class(cls):
         # 차트 생성
         self.create_summary_chart(diff_counts)
 
-    def create_summary_chart(self, diff_counts):
-        """요약 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 5))
-
-        files = list(diff_counts.keys())
-        counts = list(diff_counts.values())
+    def _value_options(self):
+        """값 비교 정규화 옵션 (비교 데이터셋과 같은 설정)"""
+        dataset = getattr(self, 'dataset', None)
+        return dataset.pivot.values.options if dataset is not None else None
 
-        # 파일명이 너무 길면 축약
-        short_files = [f[:15] + '...' if len(f) > 15 else f for f in files]
+    def _report_chart_key(self, kind):
+        """차트 캐시 키 (데이터 버전 + 파일 목록 + 차트 종류)"""
+        return ('report', kind, data_token(self.merged_df), tuple(self.file_names))
 
-        # 막대 그래프 생성
-        bars = ax.bar(short_files, counts, color='skyblue')
-
-        # 막대 위에 값 표시
-        for bar, count in zip(bars, counts):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    str(count), ha='center', va='bottom')
-
-        ax.set_title('파일별 차이점 수')
-        ax.set_xlabel('파일')
-        ax.set_ylabel('차이점 수')
-
-        # X축 레이블 회전
-        plt.xticks(rotation=45, ha='right')
-
-        plt.tight_layout()
-
-        # tkinter 캔버스에 matplotlib 차트 표시
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def create_summary_chart(self, diff_counts):
+        """요약 차트 생성 (작업 스레드에서 그려 이미지로 표시)"""
+        diff_counts = dict(diff_counts)
+        chart_renderer.show(self.chart_frame, self._report_chart_key('summary'),
+                            draw_summary_chart, lambda: diff_counts, figsize=(8, 5))
 
     def show_differences_report(self):
         """차이점 리포트 표시"""
-        # 파일별 차이점 분석
-        for file_idx, file_name in enumerate(self.file_names):
-            file_basename = os.path.basename(file_name)
-            file_col = f"file_{file_idx}"
+        parameters = _column(self.merged_df, 'parameter').to_numpy(dtype=object)
+        default_values = _column(self.merged_df, 'default_value').to_numpy(dtype=object)
 
+        # 파일별 차이점 분석
+        masks_by_file = file_difference_masks(self.merged_df, self.file_names, self._value_options())
+        for file_basename, file_values, masks in masks_by_file:
             file_item = self.report_tree.insert("", "end", values=(f"파일: {file_basename}", ""))
 
-            missing_in_default = 0
-            missing_in_file = 0
-            value_diffs = 0
-
-            for _, row in self.merged_df.iterrows():
-                parameter = row['parameter']
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else ""
-                file_value = row[file_col] if file_col in row and pd.notna(row[file_col]) else ""
-
-                # 차이 유형 확인
-                if pd.isna(default_value) and pd.notna(file_value):
-                    missing_in_default += 1
-                    self.report_tree.insert(
-                        file_item, "end", 
-                        values=(f"파라미터: {parameter}", "Default DB에 없음")
-                    )
-                elif pd.notna(default_value) and pd.isna(file_value):
-                    missing_in_file += 1
-                    self.report_tree.insert(
-                        file_item, "end", 
-                        values=(f"파라미터: {parameter}", "파일에 없음")
-                    )
-                elif default_value != file_value:
-                    value_diffs += 1
-                    self.report_tree.insert(
-                        file_item, "end", 
-                        values=(f"파라미터: {parameter}", f"값 차이: {default_value} != {file_value}")
-                    )
-
-            # 요약 정보 추가
-            summary_item = self.report_tree.insert(
-                file_item, "end", 
-                values=("요약", f"누락(Default): {missing_in_default}, 누락(파일): {missing_in_file}, 값 차이: {value_diffs}")
+            # 요약 정보 (첫 번째 항목)
+            self.report_tree.insert(
+                file_item, "end",
+                values=("요약", f"누락(Default): {int(masks['Default DB에 없음'].sum())}, "
+                                f"누락(파일): {int(masks['파일에 없음'].sum())}, 값 차이: {int(masks['값 차이'].sum())}")
             )
 
-            # 첫 번째 항목으로 이동
-            self.report_tree.move(summary_item, file_item, 0)
+            # 차이 행 (원래 행 순서)
+            file_values = file_values.to_numpy(dtype=object)
+            missing_default, missing_file, value_diff = (masks[diff_type] for diff_type in DIFF_TYPES)
+            for i in np.flatnonzero(missing_default | missing_file | value_diff):
+                if missing_default[i]:
+                    detail = "Default DB에 없음"
+                elif missing_file[i]:
+                    detail = "파일에 없음"
+                else:
+                    detail = f"값 차이: {default_values[i]} != {file_values[i]}"
+                self.report_tree.insert(file_item, "end", values=(f"파라미터: {parameters[i]}", detail))
 
         # 차트 생성
         self.create_differences_chart()
 
     def create_differences_chart(self):
-        """차이점 차트 생성"""
-        # 파일별 차이점 유형 데이터 수집
-        diff_types = {'Default DB에 없음': [], '파일에 없음': [], '값 차이': []}
-        file_labels = []
-
-        for file_idx, file_name in enumerate(self.file_names):
-            file_basename = os.path.basename(file_name)
-            file_labels.append(file_basename)
-            file_col = f"file_{file_idx}"
-
-            missing_in_default = 0
-            missing_in_file = 0
-            value_diffs = 0
-
-            for _, row in self.merged_df.iterrows():
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else ""
-                file_value = row[file_col] if file_col in row and pd.notna(row[file_col]) else ""
-
-                # 차이 유형 확인
-                if pd.isna(default_value) and pd.notna(file_value):
-                    missing_in_default += 1
-                elif pd.notna(default_value) and pd.isna(file_value):
-                    missing_in_file += 1
-                elif default_value != file_value:
-                    value_diffs += 1
-
-            diff_types['Default DB에 없음'].append(missing_in_default)
-            diff_types['파일에 없음'].append(missing_in_file)
-            diff_types['값 차이'].append(value_diffs)
-
-        # 파일명이 너무 길면 축약
-        short_labels = [f[:15] + '...' if len(f) > 15 else f for f in file_labels]
-
-        # 차트 생성
-        fig, ax = plt.subplots(figsize=(8, 6))
-
-        width = 0.25  # 막대 너비
-        x = np.arange(len(short_labels))
-
-        # 각 차이 유형별 막대 그래프
-        bars1 = ax.bar(x - width, diff_types['Default DB에 없음'], width, label='Default DB에 없음', color='#FF9800')
-        bars2 = ax.bar(x, diff_types['파일에 없음'], width, label='파일에 없음', color='#2196F3')
-        bars3 = ax.bar(x + width, diff_types['값 차이'], width, label='값 차이', color='#4CAF50')
-
-        # 축 및 레이블 설정
-        ax.set_title('파일별 차이점 유형')
-        ax.set_xlabel('파일')
-        ax.set_ylabel('차이점 수')
-        ax.set_xticks(x)
-        ax.set_xticklabels(short_labels, rotation=45, ha='right')
-        ax.legend()
-
-        # 막대 위에 값 표시
-        def add_labels(bars):
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:  # 값이 0인 경우 레이블 표시 안함
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                            str(int(height)), ha='center', va='bottom', fontsize=8)
-
-        add_labels(bars1)
-        add_labels(bars2)
-        add_labels(bars3)
-
-        plt.tight_layout()
-
-        # tkinter 캔버스에 matplotlib 차트 표시
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        """차이점 차트 생성 (유형별 개수 계산과 그리기는 작업 스레드에서)"""
+        merged_df, file_names, options = self.merged_df, list(self.file_names), self._value_options()
+        chart_renderer.show(self.chart_frame, self._report_chart_key('differences'), draw_differences_chart,
+                            lambda: difference_counts(merged_df, file_names, options), figsize=(8, 6))
+
+    def _report_statistics(self):
+        """
+        수치형 파라미터 통계 (편차 순) - 화면 / 차트 / 내보내기 공용
+
+        merged_df 객체와 파일 목록이 같으면 한 번 계산한 결과를 재사용합니다.
+        """
+        key = (data_token(self.merged_df), tuple(self.file_names))
+        cached = getattr(self, '_report_statistics_cache', None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        stats = numeric_statistics(self.merged_df, self.file_names)
+        self._report_statistics_cache = (key, stats)
+        return stats
 
     def show_statistics_report(self):
-        """통계 리포트 표시"""
+        """통계 리포트 표시 (편차가 큰 순서)"""
         if 'default_value' not in self.merged_df.columns:
             self.report_tree.insert("", "end", values=("오류", "Default DB 값이 없습니다."))
             return
 
-        # 수치형 파라미터만 선택
-        numeric_params = []
-        for _, row in self.merged_df.iterrows():
-            try:
-                # default_value가 숫자인지 확인
-                if pd.notna(row['default_value']) and float(row['default_value']):
-                    numeric_params.append(row['parameter'])
-            except (ValueError, TypeError):
-                continue
-
-        if not numeric_params:
+        stats = self._report_statistics()
+        total = len(stats['parameter'])
+        if not total:
             self.report_tree.insert("", "end", values=("알림", "분석 가능한 수치형 파라미터가 없습니다."))
             return
 
-        # 통계 데이터 생성
-        stats_data = []
-
-        for param in numeric_params[:10]:  # 상위 10개 파라미터만 분석
-            param_row = self.merged_df[self.merged_df['parameter'] == param]
-
-            # Default 값
-            default_value = param_row['default_value'].iloc[0]
-            if pd.isna(default_value):
-                continue
-
-            try:
-                default_value = float(default_value)
-            except (ValueError, TypeError):
-                continue
-
-            # 파일 값 수집
-            file_values = []
-            for file_idx in range(len(self.file_names)):
-                file_col = f"file_{file_idx}"
-                if file_col in param_row.columns and pd.notna(param_row[file_col].iloc[0]):
-                    try:
-                        file_values.append(float(param_row[file_col].iloc[0]))
-                    except (ValueError, TypeError):
-                        continue
-
-            if not file_values:
-                continue
-
-            # 통계 계산
-            mean_value = np.mean(file_values)
-            min_value = np.min(file_values)
-            max_value = np.max(file_values)
-            std_value = np.std(file_values) if len(file_values) > 1 else 0
-
-            # 데이터 저장
-            stats_data.append({
-                'parameter': param,
-                'default': default_value,
-                'mean': mean_value,
-                'min': min_value,
-                'max': max_value,
-                'std': std_value,
-                'values': file_values
-            })
-
-            # 트리뷰에 표시
-            param_item = self.report_tree.insert("", "end", values=(f"파라미터: {param}", ""))
+        if total > STATISTICS_VIEW_LIMIT:
+            self.report_tree.insert("", "end", values=(
+                "알림", f"편차 상위 {STATISTICS_VIEW_LIMIT}개 표시 (전체 {total}개는 내보내기에서 확인)"))
+
+        # 트리뷰에 표시 (표시 문자열은 상위 행만 만듦)
+        for i in range(min(total, STATISTICS_VIEW_LIMIT)):
+            default_value = stats['default'][i]
+            param_item = self.report_tree.insert("", "end", values=(f"파라미터: {stats['parameter'][i]}", ""))
             self.report_tree.insert(param_item, "end", values=("Default 값", f"{default_value:.4f}"))
-            self.report_tree.insert(param_item, "end", values=("평균", f"{mean_value:.4f}"))
-            self.report_tree.insert(param_item, "end", values=("최소값", f"{min_value:.4f}"))
-            self.report_tree.insert(param_item, "end", values=("최대값", f"{max_value:.4f}"))
-            self.report_tree.insert(param_item, "end", values=("표준편차", f"{std_value:.4f}"))
+            self.report_tree.insert(param_item, "end", values=("평균", f"{stats['mean'][i]:.4f}"))
+            self.report_tree.insert(param_item, "end", values=("최소값", f"{stats['min'][i]:.4f}"))
+            self.report_tree.insert(param_item, "end", values=("최대값", f"{stats['max'][i]:.4f}"))
+            self.report_tree.insert(param_item, "end", values=("표준편차", f"{stats['std'][i]:.4f}"))
 
             # 편차 비율
             if default_value != 0:
-                deviation_pct = ((mean_value - default_value) / default_value) * 100
-                self.report_tree.insert(param_item, "end", values=("Default 대비 편차", f"{deviation_pct:.2f}%"))
-
-        # 차트 생성
-        if stats_data:
-            self.create_statistics_chart(stats_data)
+                self.report_tree.insert(param_item, "end", values=("Default 대비 편차", f"{stats['deviation'][i]:.2f}%"))
 
-    def create_statistics_chart(self, stats_data):
-        """통계 차트 생성"""
-        if not stats_data:
-            return
+        # 차트 생성 (전체 수치형 파라미터 집계)
+        self.create_statistics_chart()
 
-        # 1행 2열 서브플롯 생성
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
-
-        # 첫 번째 차트: 파라미터별 Default 값 vs 평균 값
-        params = [item['parameter'] for item in stats_data]
-        defaults = [item['default'] for item in stats_data]
-        means = [item['mean'] for item in stats_data]
-
-        # 파라미터명이 너무 길면 축약
-        short_params = [p[:10] + '...' if len(p) > 10 else p for p in params]
-
-        x = np.arange(len(short_params))
-        width = 0.35
-
-        ax1.bar(x - width/2, defaults, width, label='Default 값', color='#3F51B5')
-        ax1.bar(x + width/2, means, width, label='평균 값', color='#FF5722')
-
-        ax1.set_title('Default 값 vs 평균 값')
-        ax1.set_xlabel('파라미터')
-        ax1.set_ylabel('값')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(short_params, rotation=45, ha='right')
-        ax1.legend()
-
-        # 두 번째 차트: 파라미터별 편차 비율
-        deviation_pcts = []
-        for item in stats_data:
-            if item['default'] != 0:
-                deviation_pct = ((item['mean'] - item['default']) / item['default']) * 100
-                deviation_pcts.append(deviation_pct)
-            else:
-                deviation_pcts.append(0)
-
-        # 절대값이 너무 큰 경우 제한
-        capped_deviations = []
-        for dev in deviation_pcts:
-            if dev > 100:
-                capped_deviations.append(100)
-            elif dev < -100:
-                capped_deviations.append(-100)
-            else:
-                capped_deviations.append(dev)
-
-        colors = ['#4CAF50' if dev >= 0 else '#F44336' for dev in capped_deviations]
-        ax2.bar(short_params, capped_deviations, color=colors)
-
-        # 원래 값 표시
-        for i, (x_pos, dev, capped) in enumerate(zip(range(len(short_params)), deviation_pcts, capped_deviations)):
-            if capped == 100 or capped == -100:
-                ax2.text(x_pos, capped + (5 if capped > 0 else -5), f"{dev:.1f}%", 
-                         ha='center', va='bottom' if capped > 0 else 'top', fontsize=8)
-            else:
-                ax2.text(x_pos, capped + (5 if capped > 0 else -5), f"{dev:.1f}%", 
-                         ha='center', va='bottom' if capped > 0 else 'top', fontsize=8)
-
-        ax2.set_title('Default 대비 편차 비율')
-        ax2.set_xlabel('파라미터')
-        ax2.set_ylabel('편차 (%)')
-        ax2.set_ylim(-120, 120)  # y축 범위 설정
-        ax2.axhline(y=0, color='gray', linestyle='-', linewidth=0.5)
-        ax2.set_xticklabels(short_params, rotation=45, ha='right')
-
-        plt.tight_layout()
-
-        # tkinter 캔버스에 matplotlib 차트 표시
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def create_statistics_chart(self):
+        """통계 차트 생성 (화면에 쓴 통계를 재사용, 그리기는 작업 스레드에서)"""
+        stats = self._report_statistics()
+        chart_renderer.show(self.chart_frame, self._report_chart_key('statistics'), draw_statistics_chart,
+                            lambda: statistics_chart_data(stats), figsize=(10, 5))
 
     def export_report(self):
-        """리포트 내보내기"""
+        """리포트 내보내기 (작업 스레드에서 저장 - 진행률 / 취소 표시)"""
         if self.merged_df is None or self.merged_df.empty:
             messagebox.showinfo("알림", "내보낼 데이터가 없습니다.")
             return
 
-        # 파일 저장 대화상자
+        # 파일 저장 대화상자 (CSV / TSV는 시트마다 파일 하나)
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel 파일", "*.xlsx"), ("모든 파일", "*.*")],
+            filetypes=[("Excel 파일", "*.xlsx"), ("CSV 파일", "*.csv"), ("TSV 파일", "*.tsv"), ("모든 파일", "*.*")],
             title="리포트 저장"
         )
 
         if not file_path:
             return
 
-        try:
-            # 로딩 대화상자 표시
-            loading_dialog = LoadingDialog(self.window)
-            self.window.update_idletasks()
-            loading_dialog.update_progress(10, "리포트 생성 중...")
-
-            # 리포트 유형 확인
-            report_type = self.report_type_var.get()
-
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # 기본 정보 시트
-                loading_dialog.update_progress(20, "기본 정보 작성 중...")
-                info_data = {
-                    "항목": [
-                        "리포트 생성 일시",
-                        "파일 수",
-                        "총 파라미터 수",
-                        "리포트 유형"
-                    ],
-                    "값": [
-                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        len(self.file_names),
-                        len(self.merged_df),
-                        {"summary": "요약", "differences": "차이점", "statistics": "통계"}[report_type]
-                    ]
-                }
-
-                # 파일 목록 추가
-                for i, file_name in enumerate(self.file_names):
-                    info_data["항목"].append(f"파일 {i+1}")
-                    info_data["값"].append(os.path.basename(file_name))
-
-                info_df = pd.DataFrame(info_data)
-                info_df.to_excel(writer, sheet_name="기본 정보", index=False)
-
-                # 유형별 리포트 시트
-                loading_dialog.update_progress(40, "상세 리포트 작성 중...")
-
-                if report_type == "summary":
-                    # 요약 리포트 시트
-                    summary_data = self.create_summary_report_data()
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name="요약 리포트", index=False)
-
-                elif report_type == "differences":
-                    # 차이점 리포트 시트
-                    diffs_data = self.create_differences_report_data()
-                    diffs_df = pd.DataFrame(diffs_data)
-                    diffs_df.to_excel(writer, sheet_name="차이점 리포트", index=False)
-
-                elif report_type == "statistics":
-                    # 통계 리포트 시트
-                    stats_data = self.create_statistics_report_data()
-                    stats_df = pd.DataFrame(stats_data)
-                    stats_df.to_excel(writer, sheet_name="통계 리포트", index=False)
-
-                # 원본 데이터 시트
-                loading_dialog.update_progress(70, "원본 데이터 작성 중...")
-                self.merged_df.to_excel(writer, sheet_name="원본 데이터", index=False)
-
-            # 완료
-            loading_dialog.update_progress(100, "완료")
-            loading_dialog.close()
-
-            # 로그 업데이트
-            self.update_log(f"[리포트] '{file_path}'에 리포트가 저장되었습니다.")
-
-            messagebox.showinfo("내보내기 완료", f"리포트가 성공적으로 저장되었습니다.\n\n{file_path}")
-
-        except Exception as e:
-            if 'loading_dialog' in locals():
-                loading_dialog.close()
-            messagebox.showerror("오류", f"리포트 내보내기 중 오류 발생: {str(e)}")
+        from app.file_service import export_sheets_in_background
+        from app.services.common.export_service import ExportSheet
 
-    def create_summary_report_data(self):
-        """요약 리포트 데이터 생성"""
-        summary_data = {"항목": [], "값": []}
+        # 리포트 유형 확인
+        report_type = self.report_type_var.get()
+
+        # 기본 정보 시트
+        info_data = {
+            "항목": [
+                "리포트 생성 일시",
+                "파일 수",
+                "총 파라미터 수",
+                "리포트 유형"
+            ],
+            "값": [
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                len(self.file_names),
+                len(self.merged_df),
+                {"summary": "요약", "differences": "차이점", "statistics": "통계"}[report_type]
+            ]
+        }
+
+        # 파일 목록 추가
+        for i, file_name in enumerate(self.file_names):
+            info_data["항목"].append(f"파일 {i+1}")
+            info_data["값"].append(os.path.basename(file_name))
+
+        sheets = [ExportSheet("기본 정보", info_data)]
 
-        # 파일별 차이점 통계
-        diff_counts = {}
-        total_diffs = 0
+        # 유형별 리포트 시트 (계산은 작업 스레드에서)
+        if report_type == "summary":
+            sheets.append(ExportSheet("요약 리포트", self.create_summary_report_data))
+        elif report_type == "differences":
+            sheets.append(ExportSheet("차이점 리포트", self.create_differences_report_data))
+        elif report_type == "statistics":
+            sheets.append(ExportSheet("통계 리포트", self.create_statistics_report_data))
 
-        for file_idx, file_name in enumerate(self.file_names):
-            file_basename = os.path.basename(file_name)
-            file_col = f"file_{file_idx}"
-            diff_count = 0
+        # 원본 데이터 시트는 선택한 경우에만
+        if self.report_include_raw_var.get():
+            sheets.append(ExportSheet("원본 데이터", self.merged_df))
 
-            for _, row in self.merged_df.iterrows():
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else ""
-                file_value = row[file_col] if file_col in row and pd.notna(row[file_col]) else ""
+        export_sheets_in_background(
+            self.window, file_path, sheets, "리포트 저장",
+            on_done=lambda paths: self.update_log(f"[리포트] '{file_path}'에 리포트가 저장되었습니다.")
+        )
 
-                if default_value != file_value:
-                    diff_count += 1
+    def create_summary_report_data(self):
+        """요약 리포트 데이터 생성 (차이 유형 합계 = Default 값과 다른 행 수)"""
+        summary_data = {"항목": [], "값": []}
 
-            diff_counts[file_basename] = diff_count
-            total_diffs += diff_count
+        counts = difference_counts(self.merged_df, self.file_names, self._value_options())
+        diff_counts = {
+            file_name: sum(counts[diff_type][i] for diff_type in DIFF_TYPES)
+            for i, file_name in enumerate(counts['files'])
+        }
+        total_diffs = sum(diff_counts.values())
 
         # 데이터 추가
         summary_data["항목"].append("총 파라미터 수")
@@ -570,110 +546,47 @@ def add_report_functions_to_class(cls):
         return summary_data
 
     def create_differences_report_data(self):
-        """차이점 리포트 데이터 생성"""
+        """차이점 리포트 데이터 생성 (파일 순서 → 원래 행 순서)"""
         diffs_data = {"파일": [], "파라미터": [], "차이 유형": [], "Default 값": [], "파일 값": []}
-
-        for file_idx, file_name in enumerate(self.file_names):
-            file_basename = os.path.basename(file_name)
-            file_col = f"file_{file_idx}"
-
-            for _, row in self.merged_df.iterrows():
-                parameter = row['parameter']
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else ""
-                file_value = row[file_col] if file_col in row and pd.notna(row[file_col]) else ""
-
-                # 차이 유형 확인
-                if pd.isna(default_value) and pd.notna(file_value):
-                    diff_type = "Default DB에 없음"
-                    diffs_data["파일"].append(file_basename)
-                    diffs_data["파라미터"].append(parameter)
-                    diffs_data["차이 유형"].append(diff_type)
+        parameters = _column(self.merged_df, 'parameter').to_numpy(dtype=object)
+        default_values = _column(self.merged_df, 'default_value').to_numpy(dtype=object)
+
+        for file_basename, file_values, masks in file_difference_masks(
+                self.merged_df, self.file_names, self._value_options()):
+            file_values = file_values.to_numpy(dtype=object)
+            missing_default, missing_file, value_diff = (masks[diff_type] for diff_type in DIFF_TYPES)
+            for i in np.flatnonzero(missing_default | missing_file | value_diff):
+                diffs_data["파일"].append(file_basename)
+                diffs_data["파라미터"].append(parameters[i])
+                if missing_default[i]:
+                    diffs_data["차이 유형"].append("Default DB에 없음")
                     diffs_data["Default 값"].append("")
-                    diffs_data["파일 값"].append(file_value)
-                elif pd.notna(default_value) and pd.isna(file_value):
-                    diff_type = "파일에 없음"
-                    diffs_data["파일"].append(file_basename)
-                    diffs_data["파라미터"].append(parameter)
-                    diffs_data["차이 유형"].append(diff_type)
-                    diffs_data["Default 값"].append(default_value)
+                    diffs_data["파일 값"].append(file_values[i])
+                elif missing_file[i]:
+                    diffs_data["차이 유형"].append("파일에 없음")
+                    diffs_data["Default 값"].append(default_values[i])
                     diffs_data["파일 값"].append("")
-                elif default_value != file_value:
-                    diff_type = "값 차이"
-                    diffs_data["파일"].append(file_basename)
-                    diffs_data["파라미터"].append(parameter)
-                    diffs_data["차이 유형"].append(diff_type)
-                    diffs_data["Default 값"].append(default_value)
-                    diffs_data["파일 값"].append(file_value)
+                else:
+                    diffs_data["차이 유형"].append("값 차이")
+                    diffs_data["Default 값"].append(default_values[i])
+                    diffs_data["파일 값"].append(file_values[i])
 
         return diffs_data
 
     def create_statistics_report_data(self):
-        """통계 리포트 데이터 생성"""
-        stats_data = {
-            "파라미터": [], 
-            "Default 값": [], 
-            "평균": [], 
-            "최소값": [], 
-            "최대값": [], 
-            "표준편차": [], 
-            "Default 대비 편차(%)": []
-        }
-
-        # 수치형 파라미터만 선택
-        for _, row in self.merged_df.iterrows():
-            parameter = row['parameter']
-
-            try:
-                # default_value가 숫자인지 확인
-                default_value = row['default_value'] if 'default_value' in row and pd.notna(row['default_value']) else None
-                if default_value is None:
-                    continue
-
-                default_value = float(default_value)
-
-                # 파일 값 수집
-                file_values = []
-                for file_idx in range(len(self.file_names)):
-                    file_col = f"file_{file_idx}"
-                    if file_col in row and pd.notna(row[file_col]):
-                        try:
-                            file_values.append(float(row[file_col]))
-                        except (ValueError, TypeError):
-                            continue
-
-                if not file_values:
-                    continue
-
-                # 통계 계산
-                mean_value = np.mean(file_values)
-                min_value = np.min(file_values)
-                max_value = np.max(file_values)
-                std_value = np.std(file_values) if len(file_values) > 1 else 0
-
-                # 편차 비율
-                deviation_pct = ((mean_value - default_value) / default_value) * 100 if default_value != 0 else 0
-
-                # 데이터 추가
-                stats_data["파라미터"].append(parameter)
-                stats_data["Default 값"].append(default_value)
-                stats_data["평균"].append(mean_value)
-                stats_data["최소값"].append(min_value)
-                stats_data["최대값"].append(max_value)
-                stats_data["표준편차"].append(std_value)
-                stats_data["Default 대비 편차(%)"].append(deviation_pct)
-
-            except (ValueError, TypeError):
-                continue
-
-        return stats_data
+        """통계 리포트 데이터 생성 (화면과 같은 편차 순서, 전체 파라미터)"""
+        return statistics_table(self._report_statistics())
 
     # 클래스에 함수 추가
     cls.create_report_tab = create_report_tab
     cls.update_report_view = update_report_view
     cls.show_summary_report = show_summary_report
+    cls._value_options = _value_options
+    cls._report_chart_key = _report_chart_key
     cls.create_summary_chart = create_summary_chart
     cls.show_differences_report = show_differences_report
     cls.create_differences_chart = create_differences_chart
+    cls._report_statistics = _report_statistics
     cls.show_statistics_report = show_statistics_report
     cls.create_statistics_chart = create_statistics_chart
     cls.export_report = export_report
@@ -5,6 +5,10 @@ import sqlite3
 from datetime import datetime
 from contextlib import contextmanager
 
+from app.instrumentation import TracedConnection
+from app.services.common.write_queue import writer_connection
+from app.services.common.connection_pool import connection_pool
+
 class DBSchema:
     """
     DB Manager 애플리케이션의 로컬 데이터베이스 스키마를 관리하는 클래스
@@ -24,14 +28,35 @@ class DBSchema:
 
     @contextmanager
     def get_connection(self, conn_override=None):
+        # 쓰기 큐 작업 안에서는 쓰기 스레드의 연결을 사용 (작업 단위 트랜잭션)
+        if conn_override is None:
+            conn_override = writer_connection(self.db_path)
+        # 서비스 모드: 설치된 연결 풀에서 빌림
+        pool = connection_pool(self.db_path) if conn_override is None else None
+        if pool is not None:
+            with pool.connection() as conn:
+                yield conn
+            return
         conn_provided = conn_override is not None
-        conn = conn_override if conn_provided else sqlite3.connect(self.db_path)
+        conn = conn_override if conn_provided else sqlite3.connect(self.db_path, factory=TracedConnection)
         try:
             yield conn
         finally:
             if not conn_provided and conn:
                 conn.close()
 
+    def execute_query(self, query, params=(), conn_override=None):
+        """SELECT 실행 → 행 목록 (QCSpecService 등 SQL을 직접 쓰는 서비스용)"""
+        with self.get_connection(conn_override) as conn:
+            return conn.execute(query, params).fetchall()
+
+    def execute_update(self, query, params=(), conn_override=None):
+        """INSERT / UPDATE / DELETE 실행 후 커밋 → 변경 행 수"""
+        with self.get_connection(conn_override) as conn:
+            rowcount = conn.execute(query, params).rowcount
+            conn.commit()
+            return rowcount
+
     def create_tables(self):
         """핵심 테이블들만 생성"""
         with self.get_connection() as conn:
@@ -227,8 +252,9 @@ class DBSchema:
         with self.get_connection(conn_override) as conn:
             cursor = conn.cursor()
             try:
-                # 트랜잭션 시작
-                cursor.execute('BEGIN TRANSACTION')
+                # 트랜잭션 시작 (쓰기 큐 작업 안에서는 이미 트랜잭션 중)
+                if not conn.in_transaction:
+                    cursor.execute('BEGIN TRANSACTION')
                 
                 # 먼저 관련된 Default DB 값들 삭제
                 cursor.execute('DELETE FROM Default_DB_Values WHERE equipment_type_id = ?', (type_id,))
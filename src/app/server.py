@@ -0,0 +1,600 @@
+"""
+DB Manager 로컬 HTTP/JSON 서비스 (Tk 없이 실행)
+
+    python -m app.cli serve --port 8765 --max-concurrency 4
+
+GUI를 설치하지 않은 스테이션에서 QC 판정 / 비교 / Default DB 조회를 요청할 수 있도록
+기존 서비스를 작은 HTTP/JSON API로 노출합니다. 표준 라이브러리(asyncio)만 사용.
+
+    GET  /health                      상태, 캐시된 Check list / QC 스펙 수
+    POST /qc                          qc_inspection_v2 {"file_data": {...} | "path": ..., "configuration_id": ...}
+    POST /qc/spec                     QCSpecService.perform_qc_inspection (같은 입력)
+    GET  /checklist?type_id=          ChecklistService 장비별 Check list (없으면 공통 항목)
+    POST /compare                     {"paths": [...], "all": false, "normalize": "trim,numeric"} → 차이 행
+    POST /shipped/import              {"path": ..., "configuration_id": ..., "auto_match": true}
+    GET  /defaultdb/types             장비 유형 목록
+    GET  /defaultdb?type=&checklist_only=   장비 유형의 Default DB
+    POST /reload                      Check list / 스펙 / 캐시 다시 읽기
+    GET  /metrics                     경로별 지연 히스토그램, 연결 풀 / 쓰기 큐 / 캐시 통계
+
+- 서비스 호출은 스레드 풀에서 실행. 동시 실행은 max_concurrency개로 제한하고
+  자리가 나기를 queue_timeout초 넘게 기다린 요청은 503 (Retry-After)
+- 읽기는 연결 풀(ConnectionPool)을 공유, 쓰기(출고 장비 임포트)는 쓰기 큐(DatabaseWriter)로 직렬화
+- 활성 Check list / QC 스펙은 시작 시 한 번 읽고 규칙을 컴파일해서 모든 요청이 공유 (/reload로 갱신)
+- 응답은 요청마다 연결을 닫음 (Connection: close)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.instrumentation import instrumentation
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENCY = 4
+
+# 실행 자리를 기다리는 최대 시간 (초)
+DEFAULT_QUEUE_TIMEOUT = 10.0
+
+# 요청 본문 최대 크기 (bytes)
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# 지연 히스토그램 구간 상한 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# 동시 실행 제한을 받지 않는 경로 (상태 확인용)
+UNLIMITED_ROUTES = frozenset({'/health', '/metrics'})
+
+HTTP_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+# Default DB 행 위치 → 응답 필드 (get_default_values)
+DEFAULT_DB_FIELDS = [
+    ('id', 0), ('parameter_name', 1), ('default_value', 2), ('min_spec', 3), ('max_spec', 4),
+    ('description', 10), ('module_name', 11), ('part_name', 12), ('item_type', 13), ('is_checklist', 14),
+]
+
+
+class HttpError(Exception):
+    """처리 중 HTTP 오류 응답 (status, 메시지)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ==================== 지표 ====================
+
+class LatencyHistogram:
+    """누적 지연 히스토그램 (구간별 개수 + 합계 / 최대)"""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.counts[bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """구간 상한 기준 근사 분위수 (마지막 구간은 최대값)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets_ms, self.counts):
+            seen += count
+            if seen >= target:
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        # 누적 개수 (le = 이하)
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets_ms, self.counts):
+            cumulative += count
+            buckets[f"le_{bound}"] = cumulative
+        buckets['le_inf'] = self.count
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ms, 3),
+            'avg_ms': round(self.sum_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.quantile(0.5),
+            'p95_ms': self.quantile(0.95),
+            'p99_ms': self.quantile(0.99),
+            'buckets': buckets,
+        }
+
+
+class ServerMetrics:
+    """경로별 지연 / 상태 코드, 실행 중 / 대기 / 거절 요청 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._queue_wait = LatencyHistogram()
+        self._status: Dict[str, Dict[int, int]] = {}
+        self.started_at = time.time()
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    def observe(self, route: str, status: int, elapsed_ms: float):
+        with self._lock:
+            histogram = self._latency.get(route)
+            if histogram is None:
+                histogram = self._latency[route] = LatencyHistogram()
+            histogram.observe(elapsed_ms)
+            statuses = self._status.setdefault(route, {})
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def observe_queue_wait(self, elapsed_ms: float):
+        with self._lock:
+            self._queue_wait.observe(elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = {}
+            for route, histogram in sorted(self._latency.items()):
+                statuses = self._status.get(route, {})
+                routes[route] = dict(
+                    histogram.to_dict(),
+                    status={str(code): count for code, count in sorted(statuses.items())},
+                    errors=sum(count for code, count in statuses.items() if code >= 500),
+                )
+            return {
+                'uptime_seconds': round(time.time() - self.started_at, 3),
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'rejected': self.rejected,
+                'queue_wait': self._queue_wait.to_dict(),
+                'routes': routes,
+            }
+
+
+# ==================== 서비스 ====================
+
+def _int_or_none(value: Any, name: str) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"{name}는 정수여야 합니다: {value!r}")
+
+
+def _query_value(query: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = query.get(name)
+    return values[-1] if values else None
+
+
+def _read_file_data(path: str) -> Dict[str, Any]:
+    """서버 로컬 파일 → {ItemName: ItemValue}"""
+    from app.file_reader import read_comparison_file
+
+    if not os.path.isfile(path):
+        raise HttpError(400, f"파일이 없습니다: {path}")
+    _, frame = read_comparison_file(path)
+    return dict(zip(frame['ItemName'], frame['ItemValue']))
+
+
+class QCServiceApp:
+    """
+    HTTP 경로 → 서비스 호출
+
+    DB 연결 풀 / 쓰기 큐 / 캐시 / 컴파일된 규칙을 모든 요청이 공유합니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 queue_timeout: float = DEFAULT_QUEUE_TIMEOUT, pool_size: Optional[int] = None):
+        from app.schema import DBSchema
+        from app.services.common.cache_service import CacheService
+        from app.services.common.connection_pool import ConnectionPool
+        from app.services.common.write_queue import DatabaseWriter
+        from app.services.checklist.checklist_service import ChecklistService
+        from app.services.qc_spec_service import QCSpecService
+        from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self.db_schema = DBSchema(db_path)
+        self.pool = ConnectionPool(self.db_schema.db_path, size=pool_size or self.max_concurrency).install()
+        self.writer = DatabaseWriter(self.db_schema.db_path)
+        self.cache = CacheService()
+        self._exception_cache = self.cache.namespace('qc_server')
+        self.checklist_service = ChecklistService(self.db_schema, self.cache)
+        self.spec_service = QCSpecService(self.db_schema)
+        self.shipped_service = ShippedEquipmentService(self.db_schema)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='QCServer')
+        self.metrics = ServerMetrics()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        # (활성 Check list 항목, 컴파일된 규칙) - 교체는 한 번에. 테이블이 없으면 None
+        self._checklist_rules: Optional[Tuple[list, Any]] = None
+        self._spec_count: Optional[int] = None
+
+        self.routes: Dict[Tuple[str, str], Callable[[Dict, Any], Any]] = {
+            ('GET', '/health'): self.health,
+            ('POST', '/qc'): self.qc,
+            ('POST', '/qc/spec'): self.qc_spec,
+            ('GET', '/checklist'): self.checklist,
+            ('POST', '/compare'): self.compare,
+            ('POST', '/shipped/import'): self.import_shipped,
+            ('GET', '/defaultdb/types'): self.equipment_types,
+            ('GET', '/defaultdb'): self.default_db,
+            ('POST', '/reload'): self.reload,
+            ('GET', '/metrics'): self.get_metrics,
+        }
+        self.warm()
+
+    # ==================== 캐시 ====================
+
+    def warm(self) -> Dict[str, Any]:
+        """활성 Check list / QC 스펙 읽기 + 규칙 컴파일 (요청 간 공유)"""
+        from app.qc.qc_inspection_v2 import compile_checklist_rules, get_active_checklist_items
+
+        # Phase 1.5 Check list(QC_Checklist_Items) / QC 스펙(QC_Spec_Master)이 없는 DB는 해당 경로만 503
+        try:
+            items = get_active_checklist_items(self.db_schema)
+            self._checklist_rules = (items, compile_checklist_rules(items))
+        except sqlite3.Error as e:
+            self._logger.warning(f"Check list를 읽을 수 없습니다: {e}")
+            self._checklist_rules = None
+        try:
+            self._spec_count = self.spec_service.warm_cache()
+        except sqlite3.Error as e:
+            self._logger.warning(f"QC 스펙을 읽을 수 없습니다: {e}")
+            self.spec_service.invalidate_cache()
+            self._spec_count = None
+        instrumentation.count('server.warm')
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        """캐시된 Check list / QC 스펙 수 (사용할 수 없으면 None)"""
+        rules = self._checklist_rules
+        return {'checklist_items': None if rules is None else len(rules[0]), 'qc_specs': self._spec_count}
+
+    def _exception_item_ids(self, configuration_id: Optional[int]) -> List[int]:
+        from app.qc.qc_inspection_v2 import get_exception_item_ids
+
+        if configuration_id is None:
+            return []
+        return self._exception_cache.get_or_load(
+            f'exceptions_{configuration_id}',
+            lambda: get_exception_item_ids(configuration_id, self.db_schema),
+            ttl_seconds=300, tags=['checklist', f'config:{configuration_id}'])
+
+    # ==================== 경로 ====================
+
+    def health(self, query, body):
+        return dict(self.status(), status='ok')
+
+    def _qc_input(self, body) -> Tuple[Dict[str, Any], Optional[int]]:
+        if not isinstance(body, dict):
+            raise HttpError(400, "JSON 객체가 필요합니다")
+        configuration_id = _int_or_none(body.get('configuration_id'), 'configuration_id')
+        file_data = body.get('file_data')
+        if file_data is None and body.get('path'):
+            file_data = _read_file_data(body['path'])
+        if not isinstance(file_data, dict):
+            raise HttpError(400, "file_data(ItemName → 값) 또는 path가 필요합니다")
+        return file_data, configuration_id
+
+    def qc(self, query, body):
+        from app.qc.qc_inspection_v2 import qc_inspection_v2
+
+        if self._checklist_rules is None:
+            raise HttpError(503, "Check list 테이블(QC_Checklist_Items)을 사용할 수 없습니다")
+        file_data, configuration_id = self._qc_input(body)
+        items, rules = self._checklist_rules
+        return qc_inspection_v2(file_data, configuration_id, checklist_items=items,
+                                exception_item_ids=self._exception_item_ids(configuration_id),
+                                compiled_rules=rules)
+
+    def qc_spec(self, query, body):
+        if self._spec_count is None:
+            raise HttpError(503, "QC 스펙 테이블(QC_Spec_Master)을 사용할 수 없습니다")
+        file_data, configuration_id = self._qc_input(body)
+        return self.spec_service.perform_qc_inspection(file_data, configuration_id)
+
+    def checklist(self, query, body):
+        type_id = _int_or_none(_query_value(query, 'type_id'), 'type_id')
+        if type_id is None:
+            return {'items': [list(row) for row in self.checklist_service.get_common_checklist_items()]}
+        return {'equipment_type_id': type_id, 'items': self.checklist_service.get_equipment_checklist(type_id)}
+
+    def compare(self, query, body):
+        from app.dataset import ComparisonDataset
+        from app.file_reader import read_comparison_file
+        from app.value_table import NormalizeOptions
+
+        paths = body.get('paths') if isinstance(body, dict) else None
+        if not isinstance(paths, list) or len(paths) < 2:
+            raise HttpError(400, "비교할 파일 경로(paths)가 2개 이상 필요합니다")
+        try:
+            options = NormalizeOptions.parse(body.get('normalize'))
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        dataset = ComparisonDataset(options)
+        for path in paths:
+            if not os.path.isfile(path):
+                raise HttpError(400, f"파일이 없습니다: {path}")
+            name, frame = read_comparison_file(path)
+            dataset.add_file(name, frame, path)
+
+        pivot = dataset.pivot
+        visible_keys = None if body.get('all') else {key for key, diff in zip(pivot.keys, pivot.diff) if diff}
+        model = pivot.table_model(dataset.file_names, visible_keys=visible_keys)
+        return {
+            'columns': model.column_names,
+            'rows': [list(record.values()) for record in model.records()],
+            'summary': pivot.summary(),
+        }
+
+    def import_shipped(self, query, body):
+        path = body.get('path') if isinstance(body, dict) else None
+        if not path or not os.path.isfile(path):
+            raise HttpError(400, f"파일이 없습니다: {path}")
+        configuration_id = _int_or_none(body.get('configuration_id'), 'configuration_id')
+        # 파싱은 요청 스레드, 저장은 쓰기 큐 (SQLite 쓰기 직렬화)
+        parse_result = self.shipped_service.parse_equipment_file(path)
+        success, message, equipment_id = self.writer.submit(
+            self.shipped_service.import_parsed, parse_result, configuration_id,
+            bool(body.get('auto_match', True)), os.path.basename(path)).result()
+        return {'success': success, 'message': message, 'equipment_id': equipment_id}
+
+    def equipment_types(self, query, body):
+        return {'types': [{'id': row[0], 'type_name': row[1], 'description': row[2]}
+                          for row in self.db_schema.get_equipment_types()]}
+
+    def default_db(self, query, body):
+        type_arg = _query_value(query, 'type')
+        if not type_arg:
+            raise HttpError(400, "type(장비 유형 이름 또는 ID)이 필요합니다")
+        if type_arg.isdigit():
+            type_id = int(type_arg)
+        else:
+            row = self.db_schema.get_equipment_type_by_name(type_arg)
+            if row is None:
+                raise HttpError(404, f"장비 유형을 찾을 수 없습니다: {type_arg}")
+            type_id = row[0]
+        checklist_only = _query_value(query, 'checklist_only') in ('1', 'true', 'yes')
+        rows = self.db_schema.get_default_values(type_id, checklist_only=checklist_only)
+        return {'equipment_type_id': type_id,
+                'values': [{name: row[pos] for name, pos in DEFAULT_DB_FIELDS} for row in rows]}
+
+    def reload(self, query, body):
+        self.cache.clear()
+        return self.warm()
+
+    def get_metrics(self, query, body):
+        return dict(
+            self.metrics.to_dict(),
+            max_concurrency=self.max_concurrency,
+            db_pool=self.pool.get_stats(),
+            writer=self.writer.get_stats(),
+            cache=self.cache.get_statistics(),
+            counters=instrumentation.counters(),
+        )
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.writer.close()
+        self.pool.close()
+
+
+# ==================== HTTP ====================
+
+class QCServer:
+    """
+    asyncio HTTP/1.1 서버 (요청마다 연결 종료)
+
+    serve_forever()로 실행하거나, 다른 프로그램 / 테스트에서는 start_background()로
+    별도 스레드의 이벤트 루프에서 실행합니다.
+    """
+
+    def __init__(self, app: QCServiceApp, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.app = app
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    async def start(self) -> Tuple[str, int]:
+        """수신 시작 → (host, 실제 port). port=0이면 빈 포트"""
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.app.max_concurrency)
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.host, self.port
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self, on_started: Optional[Callable[[str, int], Any]] = None):
+        await self.start()
+        self._logger.info(f"http://{self.host}:{self.port} 에서 요청 대기")
+        if on_started is not None:
+            on_started(self.host, self.port)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def start_background(self) -> Tuple[str, int]:
+        """별도 스레드에서 이벤트 루프 실행 → (host, port)"""
+        started = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start())
+            except BaseException as e:
+                failure.append(e)
+                started.set()
+                loop.close()
+                return
+            started.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.run_until_complete(self.stop())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name='QCServerLoop', daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            raise failure[0]
+        return self.host, self.port
+
+    def stop_background(self, timeout: Optional[float] = 10.0):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ==================== 요청 처리 ====================
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """요청 줄 / 헤더 / 본문 → (method, path, query, body)"""
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        if not request_line:
+            return None
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise HttpError(400, f"잘못된 요청 줄: {request_line}")
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HttpError(400, "잘못된 Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, f"요청 본문이 너무 큽니다 ({length} bytes)")
+        body = None
+        if length:
+            raw = await reader.readexactly(length)
+            try:
+                body = json.loads(raw.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise HttpError(400, f"JSON 형식 오류: {e}")
+
+        url = urlsplit(target)
+        return method.upper(), url.path.rstrip('/') or '/', parse_qs(url.query), body
+
+    async def _dispatch(self, method: str, path: str, query, body) -> Any:
+        handler = self.app.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.app.routes):
+                raise HttpError(405, f"{method} {path}는 지원하지 않습니다")
+            raise HttpError(404, f"경로가 없습니다: {path}")
+
+        loop = asyncio.get_running_loop()
+        if path in UNLIMITED_ROUTES:
+            return await loop.run_in_executor(None, handler, query, body)
+
+        # 동시 실행 제한: 자리가 나기를 queue_timeout초까지 기다림
+        metrics = self.app.metrics
+        wait_start = time.perf_counter()
+        metrics.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.app.queue_timeout)
+        except asyncio.TimeoutError:
+            metrics.rejected += 1
+            raise HttpError(503, f"요청이 많습니다 (동시 실행 {self.app.max_concurrency}개)")
+        finally:
+            metrics.waiting -= 1
+        metrics.observe_queue_wait((time.perf_counter() - wait_start) * 1000)
+
+        metrics.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.app.executor, handler, query, body)
+        finally:
+            metrics.in_flight -= 1
+            self._semaphore.release()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        start = time.perf_counter()
+        route = None
+        try:
+            try:
+                request = await self._read_request(reader)
+                if request is None:
+                    return
+                method, path, query, body = request
+                route = path if any(p == path for _, p in self.app.routes) else 'unmatched'
+                status, payload = 200, await self._dispatch(method, path, query, body)
+            except HttpError as e:
+                status, payload = e.status, {'error': str(e)}
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except Exception as e:
+                self._logger.exception("요청 처리 오류")
+                status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+            data = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            headers = [
+                f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'Error')}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(data)}",
+                "Connection: close",
+            ]
+            if status == 503:
+                headers.append("Retry-After: 1")
+            writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + data)
+            await writer.drain()
+            self.app.metrics.observe(route or 'unmatched', status, (time.perf_counter() - start) * 1000)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def serve(db_path: Optional[str] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+          max_concurrency: int = DEFAULT_MAX_CONCURRENCY, queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+          on_started: Optional[Callable[[QCServiceApp, str, int], Any]] = None):
+    """서비스 실행 (Ctrl+C로 종료). on_started(app, host, port)는 수신 시작 후 호출"""
+    app = QCServiceApp(db_path, max_concurrency=max_concurrency, queue_timeout=queue_timeout)
+    server = QCServer(app, host, port)
+    try:
+        asyncio.run(server.serve_forever(
+            None if on_started is None else lambda bound_host, bound_port: on_started(app, bound_host, bound_port)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        app.close()
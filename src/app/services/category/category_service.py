@@ -17,6 +17,8 @@ from ..interfaces.category_service_interface import (
 )
 from ..common.cache_service import CacheService
 from ..common.logging_service import LoggingService
+from ..common.write_queue import after_commit
+from .equipment_hierarchy import EquipmentHierarchyCache
 
 
 class CategoryService(ICategoryService):
@@ -31,7 +33,10 @@ class CategoryService(ICategoryService):
             cache_service: 캐시 서비스 (선택사항)
         """
         self._db_schema = db_schema
-        self._cache = cache_service or CacheService(max_size=500, default_ttl=300)
+        # 공유 캐시는 'category' 이름 공간으로 사용 (다른 서비스의 clear()와 분리)
+        self._cache = (cache_service or CacheService(max_size=500, default_ttl=300)).namespace('category')
+        # Model → Type → Configuration 계층 스냅샷 (ConfigurationService와 공유)
+        self._hierarchy = EquipmentHierarchyCache(db_schema, self._cache)
         self._logging = LoggingService()
         self._logger = self._logging.get_logger(self.__class__.__name__)
 
@@ -41,7 +46,6 @@ class CategoryService(ICategoryService):
         self._CACHE_KEY_ALL_TYPES = "equipment_types_all"
         self._CACHE_KEY_TYPE_PREFIX = "equipment_type_"
         self._CACHE_KEY_TYPES_BY_MODEL_PREFIX = "equipment_types_by_model_"
-        self._CACHE_KEY_HIERARCHY = "equipment_hierarchy_tree"
 
     @contextmanager
     def _transaction(self):
@@ -55,16 +59,18 @@ class CategoryService(ICategoryService):
             raise
 
     def _invalidate_cache(self, model_id: Optional[int] = None, type_id: Optional[int] = None):
-        """캐시 무효화"""
-        if model_id:
-            self._cache.delete(f"{self._CACHE_KEY_MODEL_PREFIX}{model_id}")
-            self._cache.delete(f"{self._CACHE_KEY_TYPES_BY_MODEL_PREFIX}{model_id}")
-        if type_id:
-            self._cache.delete(f"{self._CACHE_KEY_TYPE_PREFIX}{type_id}")
-        # 전체 목록 캐시도 무효화
-        self._cache.delete(self._CACHE_KEY_ALL_MODELS)
-        self._cache.delete(self._CACHE_KEY_ALL_TYPES)
-        self._cache.delete(self._CACHE_KEY_HIERARCHY)
+        """캐시 무효화 (쓰기 큐 작업 안에서는 그룹 커밋 후)"""
+        def invalidate():
+            # 해당 모델 / 타입에 의존하는 캐시 무효화 (다른 서비스 항목 포함)
+            if model_id:
+                self._cache.invalidate_tags(f"model:{model_id}")
+            if type_id:
+                self._cache.invalidate_tags(f"type:{type_id}")
+            # 전체 목록 캐시도 무효화
+            self._cache.delete(self._CACHE_KEY_ALL_MODELS)
+            self._cache.delete(self._CACHE_KEY_ALL_TYPES)
+
+        after_commit(invalidate)
 
     # ==================== Equipment Models ====================
 
@@ -133,7 +139,7 @@ class CategoryService(ICategoryService):
                         created_at=row[5],
                         updated_at=row[6]
                     )
-                    self._cache.set(cache_key, model)
+                    self._cache.set(cache_key, model, tags=[f"model:{model_id}"])
                     return model
                 return None
 
@@ -177,6 +183,7 @@ class CategoryService(ICategoryService):
                     model_id = cursor.lastrowid
                     conn.commit()
 
+                    self._hierarchy.refresh_model(model_id)
                     self._logger.info(f"장비 모델 생성: {model_name} (ID: {model_id})")
                     return model_id
 
@@ -228,6 +235,7 @@ class CategoryService(ICategoryService):
                     conn.commit()
 
                     self._invalidate_cache(model_id=model_id)
+                    self._hierarchy.refresh_model(model_id)
                     self._logger.info(f"장비 모델 수정: ID {model_id}")
                     return cursor.rowcount > 0
 
@@ -253,6 +261,7 @@ class CategoryService(ICategoryService):
                     conn.commit()
 
                     self._invalidate_cache(model_id=model_id)
+                    self._hierarchy.refresh_model(model_id)
                     self._logger.info(f"장비 모델 삭제: ID {model_id} ({type_count}개 Types 포함)")
                     return cursor.rowcount > 0
 
@@ -276,6 +285,7 @@ class CategoryService(ICategoryService):
 
                     conn.commit()
                     self._invalidate_cache()
+                    self._hierarchy.refresh_model()
                     self._logger.info(f"{len(model_id_order)}개 모델 순서 변경")
                     return True
 
@@ -319,7 +329,7 @@ class CategoryService(ICategoryService):
                     for row in rows
                 ]
 
-                self._cache.set(cache_key, types)
+                self._cache.set(cache_key, types, tags=[f"model:{model_id}"])
                 return types
 
         except Exception as e:
@@ -395,7 +405,7 @@ class CategoryService(ICategoryService):
                         updated_at=row[6],
                         model_name=row[7]
                     )
-                    self._cache.set(cache_key, type_obj)
+                    self._cache.set(cache_key, type_obj, tags=[f"type:{type_id}", f"model:{type_obj.model_id}"])
                     return type_obj
                 return None
 
@@ -429,6 +439,7 @@ class CategoryService(ICategoryService):
                     conn.commit()
 
                     self._invalidate_cache(model_id=model_id)
+                    self._hierarchy.refresh_type(type_id)
                     self._logger.info(f"Equipment Type 생성: {type_name} (model_id: {model_id}, ID: {type_id})")
                     return type_id
 
@@ -475,6 +486,7 @@ class CategoryService(ICategoryService):
                     conn.commit()
 
                     self._invalidate_cache(type_id=type_id)
+                    self._hierarchy.refresh_type(type_id)
                     self._logger.info(f"Equipment Type 수정: ID {type_id}")
                     return cursor.rowcount > 0
 
@@ -500,6 +512,7 @@ class CategoryService(ICategoryService):
                     conn.commit()
 
                     self._invalidate_cache(type_id=type_id)
+                    self._hierarchy.refresh_type(type_id)
                     self._logger.info(f"Equipment Type 삭제: ID {type_id} ({config_count}개 Configurations 포함)")
                     return cursor.rowcount > 0
 
@@ -510,79 +523,35 @@ class CategoryService(ICategoryService):
     # ==================== Hierarchy Operations ====================
 
     def get_hierarchy_tree(self) -> List[Dict[str, Any]]:
-        """전체 Equipment Hierarchy Tree 조회"""
-        cached_result = self._cache.get(self._CACHE_KEY_HIERARCHY)
-        if cached_result is not None:
-            return cached_result
+        """
+        전체 Equipment Hierarchy Tree 조회
 
+        계층 스냅샷(고정 쿼리 4회, 캐시)에서 메모리로 조립합니다.
+        Type은 기본 Type 먼저, 이름 순입니다.
+        """
         try:
-            with self._db_schema.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Models 조회
-                cursor.execute("""
-                    SELECT id, model_name, model_code, description, display_order
-                    FROM Equipment_Models
-                    ORDER BY display_order, model_name
-                """)
-                models = cursor.fetchall()
-
-                hierarchy = []
-
-                for model_row in models:
-                    model_id = model_row[0]
-
-                    # 각 Model의 Types 조회
-                    cursor.execute("""
-                        SELECT id, type_name, description, is_default
-                        FROM Equipment_Types
-                        WHERE model_id = ?
-                        ORDER BY is_default DESC, type_name
-                    """, (model_id,))
-                    types_rows = cursor.fetchall()
-
-                    types_data = []
-                    for type_row in types_rows:
-                        type_id = type_row[0]
-
-                        # 각 Type의 Configuration 개수 조회
-                        cursor.execute("""
-                            SELECT COUNT(*)
-                            FROM Equipment_Configurations
-                            WHERE equipment_type_id = ?
-                        """, (type_id,))
-                        config_count = cursor.fetchone()[0]
-
-                        types_data.append({
-                            'type': EquipmentTypeV2(
-                                id=type_id,
-                                model_id=model_id,
-                                type_name=type_row[1],
-                                description=type_row[2],
-                                is_default=bool(type_row[3]),
-                                model_name=model_row[1]
-                            ),
-                            'configuration_count': config_count
-                        })
-
-                    hierarchy.append({
-                        'model': EquipmentModel(
-                            id=model_id,
-                            model_name=model_row[1],
-                            model_code=model_row[2],
-                            description=model_row[3],
-                            display_order=model_row[4]
-                        ),
-                        'types': types_data
-                    })
-
-                self._cache.set(self._CACHE_KEY_HIERARCHY, hierarchy)
-                return hierarchy
-
+            snapshot = self._hierarchy.snapshot()
         except Exception as e:
             self._logger.error(f"Hierarchy Tree 조회 실패: {e}")
             raise
 
+        types_by_model = snapshot.types_by_model(default_first=True)
+        configurations_by_type = snapshot.configurations_by_type()
+
+        return [
+            {
+                'model': model,
+                'types': [
+                    {
+                        'type': equipment_type,
+                        'configuration_count': len(configurations_by_type.get(equipment_type.id, ()))
+                    }
+                    for equipment_type in types_by_model.get(model.id, [])
+                ]
+            }
+            for model in snapshot.sorted_models()
+        ]
+
     def validate_model_type_combination(self, model_id: int, type_name: str) -> bool:
         """Model + Type 조합 유효성 검사 (Unique 제약)"""
         try:
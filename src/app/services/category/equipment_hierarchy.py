@@ -0,0 +1,340 @@
+"""
+Equipment Hierarchy 스냅샷 (Phase 1.5)
+
+Model → Type → Configuration 전체 계층과 Configuration별 Default DB Value 개수를
+고정된 개수의 쿼리(모델 / 타입 / 구성 JOIN / GROUP BY 집계 4회)로 읽어 메모리에서 조립합니다.
+
+- 스냅샷은 공유 CacheService의 'hierarchy' 이름 공간에 한 항목으로 저장
+- 노드 하나가 바뀌면 해당 노드만 다시 읽어 스냅샷을 갱신 (전체 재조회 없음)
+- CategoryService / ConfigurationService가 같은 스냅샷을 사용
+- 쓰기 큐 작업 안의 갱신 / 무효화는 그룹 커밋 후에 실행 (커밋되지 않은 행을 스냅샷에 넣지 않음)
+"""
+
+import json
+import threading
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from ..interfaces.category_service_interface import EquipmentModel, EquipmentTypeV2
+from ..interfaces.configuration_service_interface import EquipmentConfiguration
+from ..common.write_queue import after_commit
+
+HIERARCHY_NAMESPACE = 'hierarchy'
+HIERARCHY_KEY = 'equipment_hierarchy'
+HIERARCHY_TAG = 'equipment_hierarchy'
+
+_MODEL_COLUMNS = """
+    SELECT id, model_name, model_code, description, display_order,
+           created_at, updated_at
+    FROM Equipment_Models
+"""
+
+_TYPE_COLUMNS = """
+    SELECT t.id, t.model_id, t.type_name, t.description, t.is_default,
+           t.created_at, t.updated_at, m.model_name
+    FROM Equipment_Types t
+    JOIN Equipment_Models m ON t.model_id = m.id
+"""
+
+_CONFIG_COLUMNS = """
+    SELECT
+        c.id, c.type_id, c.configuration_name,
+        c.port_count, c.wafer_count, c.custom_options,
+        c.is_customer_specific, c.customer_name,
+        c.description, c.created_at, c.updated_at,
+        t.type_name,
+        m.model_name
+    FROM Equipment_Configurations c
+    JOIN Equipment_Types t ON c.type_id = t.id
+    JOIN Equipment_Models m ON t.model_id = m.id
+"""
+
+_VALUE_COUNTS = """
+    SELECT configuration_id,
+           COUNT(*),
+           SUM(CASE WHEN is_type_common = 1 THEN 1 ELSE 0 END)
+    FROM Default_DB_Values
+"""
+
+# 스냅샷 갱신 직렬화 (서비스마다 EquipmentHierarchyCache를 만들지만 캐시 항목은 공유)
+_refresh_lock = threading.Lock()
+
+
+def _model_from_row(row) -> EquipmentModel:
+    return EquipmentModel(
+        id=row[0],
+        model_name=row[1],
+        model_code=row[2],
+        description=row[3],
+        display_order=row[4],
+        created_at=row[5],
+        updated_at=row[6]
+    )
+
+
+def _type_from_row(row) -> EquipmentTypeV2:
+    return EquipmentTypeV2(
+        id=row[0],
+        model_id=row[1],
+        type_name=row[2],
+        description=row[3],
+        is_default=bool(row[4]),
+        created_at=row[5],
+        updated_at=row[6],
+        model_name=row[7]
+    )
+
+
+def _configuration_from_row(row) -> EquipmentConfiguration:
+    custom_options = None
+    if row[5]:
+        try:
+            custom_options = json.loads(row[5])
+        except (json.JSONDecodeError, TypeError):
+            custom_options = None
+
+    return EquipmentConfiguration(
+        id=row[0],
+        type_id=row[1],
+        configuration_name=row[2],
+        port_count=row[3],
+        wafer_count=row[4],
+        custom_options=custom_options,
+        is_customer_specific=bool(row[6]),
+        customer_name=row[7],
+        description=row[8],
+        created_at=row[9],
+        updated_at=row[10],
+        type_name=row[11],
+        model_name=row[12]
+    )
+
+
+def _nulls_first(value):
+    """SQLite ORDER BY와 같은 순서 (NULL 먼저)"""
+    return (value is not None, value if value is not None else 0)
+
+
+class HierarchySnapshot:
+    """
+    계층 스냅샷 (불변으로 취급 - 갱신 시 새 스냅샷을 만들어 교체)
+
+    models / types / configurations: id → 엔티티
+    value_counts: configuration_id → (전체 개수, Type 공통 개수)
+    """
+
+    __slots__ = ('models', 'types', 'configurations', 'value_counts')
+
+    def __init__(self, models: Dict[int, EquipmentModel], types: Dict[int, EquipmentTypeV2],
+                 configurations: Dict[int, EquipmentConfiguration],
+                 value_counts: Dict[int, Tuple[int, int]]):
+        self.models = models
+        self.types = types
+        self.configurations = configurations
+        self.value_counts = value_counts
+
+    def copy(self) -> 'HierarchySnapshot':
+        return HierarchySnapshot(dict(self.models), dict(self.types),
+                                 dict(self.configurations), dict(self.value_counts))
+
+    # ------------------------------------------------------------------
+    # 조회 (메모리 조립)
+    # ------------------------------------------------------------------
+
+    def sorted_models(self) -> List[EquipmentModel]:
+        """display_order, model_name 순"""
+        return sorted(self.models.values(),
+                      key=lambda m: (_nulls_first(m.display_order), m.model_name))
+
+    def types_by_model(self, default_first: bool = False) -> Dict[int, List[EquipmentTypeV2]]:
+        """model_id → Types (type_name 순, default_first면 기본 Type 먼저)"""
+        grouped: Dict[int, List[EquipmentTypeV2]] = {}
+        for equipment_type in self.types.values():
+            grouped.setdefault(equipment_type.model_id, []).append(equipment_type)
+        if default_first:
+            sort_key = lambda t: (not t.is_default, t.type_name)
+        else:
+            sort_key = lambda t: t.type_name
+        for types in grouped.values():
+            types.sort(key=sort_key)
+        return grouped
+
+    def configurations_by_type(self) -> Dict[int, List[EquipmentConfiguration]]:
+        """type_id → Configurations (configuration_name 순)"""
+        grouped: Dict[int, List[EquipmentConfiguration]] = {}
+        for configuration in self.configurations.values():
+            grouped.setdefault(configuration.type_id, []).append(configuration)
+        for configurations in grouped.values():
+            configurations.sort(key=lambda c: c.configuration_name)
+        return grouped
+
+    def configurations_of(self, type_id: int) -> List[EquipmentConfiguration]:
+        configurations = [c for c in self.configurations.values() if c.type_id == type_id]
+        configurations.sort(key=lambda c: c.configuration_name)
+        return configurations
+
+    def value_count(self, config_id: int) -> Tuple[int, int]:
+        return self.value_counts.get(config_id, (0, 0))
+
+    # ------------------------------------------------------------------
+    # 노드 단위 갱신 (copy()한 스냅샷에서 호출)
+    # ------------------------------------------------------------------
+
+    def _drop_type(self, type_id: int):
+        self.types.pop(type_id, None)
+        for config_id in [c.id for c in self.configurations.values() if c.type_id == type_id]:
+            self.configurations.pop(config_id, None)
+            self.value_counts.pop(config_id, None)
+
+    def _drop_model(self, model_id: int):
+        self.models.pop(model_id, None)
+        for type_id in [t.id for t in self.types.values() if t.model_id == model_id]:
+            self._drop_type(type_id)
+
+
+def load_hierarchy(conn) -> HierarchySnapshot:
+    """전체 계층 조회 (쿼리 4회)"""
+    cursor = conn.cursor()
+
+    cursor.execute(_MODEL_COLUMNS)
+    models = {row[0]: _model_from_row(row) for row in cursor.fetchall()}
+
+    cursor.execute(_TYPE_COLUMNS)
+    types = {row[0]: _type_from_row(row) for row in cursor.fetchall()}
+
+    cursor.execute(_CONFIG_COLUMNS)
+    configurations = {row[0]: _configuration_from_row(row) for row in cursor.fetchall()}
+
+    cursor.execute(_VALUE_COUNTS + " WHERE configuration_id IS NOT NULL GROUP BY configuration_id")
+    value_counts = {row[0]: (row[1] or 0, row[2] or 0) for row in cursor.fetchall()}
+
+    return HierarchySnapshot(models, types, configurations, value_counts)
+
+
+class EquipmentHierarchyCache:
+    """
+    계층 스냅샷 캐시
+
+    snapshot()은 캐시에 없을 때만 load_hierarchy()를 실행합니다 (동시 요청은 1회로 합침).
+    refresh_*()는 캐시된 스냅샷이 있을 때만 해당 노드를 다시 읽어 교체하며,
+    스냅샷이 없으면 다음 snapshot() 호출에서 전체를 읽으므로 아무것도 하지 않습니다.
+    """
+
+    def __init__(self, db_schema, cache):
+        """
+        Args:
+            db_schema: DBSchema 인스턴스
+            cache: CacheService 또는 CacheNamespace (공유 캐시의 'hierarchy' 이름 공간 사용)
+        """
+        self._db_schema = db_schema
+        self._cache = cache.namespace(HIERARCHY_NAMESPACE)
+
+    def snapshot(self) -> HierarchySnapshot:
+        return self._cache.get_or_load(HIERARCHY_KEY, self._load, tags=[HIERARCHY_TAG])
+
+    def _load(self) -> HierarchySnapshot:
+        with self._db_schema.get_connection() as conn:
+            return load_hierarchy(conn)
+
+    def invalidate(self):
+        after_commit(self._cache.delete, HIERARCHY_KEY)
+
+    def _update(self, apply):
+        """캐시된 스냅샷을 복사 → apply(snapshot, cursor) → 교체 (쓰기 큐 작업 안에서는 그룹 커밋 후)"""
+        after_commit(self._apply_update, apply)
+
+    def _apply_update(self, apply):
+        with _refresh_lock:
+            current = self._cache.get(HIERARCHY_KEY)
+            if current is None:
+                return
+            snapshot = current.copy()
+            with self._db_schema.get_connection() as conn:
+                apply(snapshot, conn.cursor())
+            self._cache.set(HIERARCHY_KEY, snapshot, tags=[HIERARCHY_TAG])
+
+    def refresh_model(self, model_id: Optional[int] = None):
+        """
+        Model 갱신 (삭제 시 하위 Types / Configurations 제거)
+
+        model_id가 없으면 모든 Model 행을 다시 읽습니다 (정렬 순서 변경 등).
+        Model 이름이 바뀌면 하위 노드의 model_name도 함께 바꿉니다.
+        """
+        def apply(snapshot: HierarchySnapshot, cursor):
+            if model_id is None:
+                cursor.execute(_MODEL_COLUMNS)
+                rows = cursor.fetchall()
+                for removed_id in set(snapshot.models) - {row[0] for row in rows}:
+                    snapshot._drop_model(removed_id)
+            else:
+                cursor.execute(_MODEL_COLUMNS + " WHERE id = ?", (model_id,))
+                rows = cursor.fetchall()
+                if not rows:
+                    snapshot._drop_model(model_id)
+
+            for row in rows:
+                model = _model_from_row(row)
+                previous = snapshot.models.get(model.id)
+                snapshot.models[model.id] = model
+                if previous is not None and previous.model_name != model.model_name:
+                    self._rename_model(snapshot, model)
+
+        self._update(apply)
+
+    @staticmethod
+    def _rename_model(snapshot: HierarchySnapshot, model: EquipmentModel):
+        type_ids = set()
+        for equipment_type in list(snapshot.types.values()):
+            if equipment_type.model_id == model.id:
+                snapshot.types[equipment_type.id] = replace(equipment_type, model_name=model.model_name)
+                type_ids.add(equipment_type.id)
+        for configuration in list(snapshot.configurations.values()):
+            if configuration.type_id in type_ids:
+                snapshot.configurations[configuration.id] = replace(configuration, model_name=model.model_name)
+
+    def refresh_type(self, type_id: int):
+        """Type 갱신 (삭제 시 하위 Configurations 제거, 이름 변경 시 하위 type_name 갱신)"""
+        def apply(snapshot: HierarchySnapshot, cursor):
+            cursor.execute(_TYPE_COLUMNS + " WHERE t.id = ?", (type_id,))
+            row = cursor.fetchone()
+            if row is None:
+                snapshot._drop_type(type_id)
+                return
+
+            equipment_type = _type_from_row(row)
+            previous = snapshot.types.get(type_id)
+            snapshot.types[type_id] = equipment_type
+            if previous is not None and previous.type_name != equipment_type.type_name:
+                for configuration in list(snapshot.configurations.values()):
+                    if configuration.type_id == type_id:
+                        snapshot.configurations[configuration.id] = replace(
+                            configuration, type_name=equipment_type.type_name)
+
+        self._update(apply)
+
+    def refresh_configuration(self, config_id: int):
+        """Configuration 갱신 (삭제 시 Default DB Value 개수도 제거)"""
+        def apply(snapshot: HierarchySnapshot, cursor):
+            cursor.execute(_CONFIG_COLUMNS + " WHERE c.id = ?", (config_id,))
+            row = cursor.fetchone()
+            if row is None:
+                snapshot.configurations.pop(config_id, None)
+                snapshot.value_counts.pop(config_id, None)
+                return
+            snapshot.configurations[config_id] = _configuration_from_row(row)
+            self._apply_value_count(snapshot, cursor, config_id)
+
+        self._update(apply)
+
+    def refresh_value_counts(self, config_id: int):
+        """Configuration의 Default DB Value 개수 갱신"""
+        self._update(lambda snapshot, cursor: self._apply_value_count(snapshot, cursor, config_id))
+
+    @staticmethod
+    def _apply_value_count(snapshot: HierarchySnapshot, cursor, config_id: int):
+        cursor.execute(_VALUE_COUNTS + " WHERE configuration_id = ? GROUP BY configuration_id", (config_id,))
+        row = cursor.fetchone()
+        if row is None:
+            snapshot.value_counts.pop(config_id, None)
+        else:
+            snapshot.value_counts[config_id] = (row[1] or 0, row[2] or 0)
@@ -7,6 +7,7 @@ import json
 from typing import List, Dict, Optional, Tuple
 
 from ..interfaces.checklist_service_interface import IChecklistService
+from ..common.write_queue import after_commit
 
 
 class ChecklistService(IChecklistService):
@@ -19,7 +20,8 @@ class ChecklistService(IChecklistService):
             cache_service: CacheService 인스턴스 (선택)
         """
         self.db_schema = db_schema
-        self.cache = cache_service
+        # 공유 캐시는 'checklist' 이름 공간으로 사용 (다른 서비스의 clear()와 분리)
+        self.cache = cache_service.namespace('checklist') if cache_service else None
 
     def add_checklist_item(self, item_name: str, parameter_pattern: str,
                           is_common: bool = True, severity_level: str = 'MEDIUM',
@@ -47,9 +49,9 @@ class ChecklistService(IChecklistService):
             description=description
         )
 
-        # 캐시 무효화
+        # 캐시 무효화 (쓰기 큐 작업 안에서는 그룹 커밋 후)
         if self.cache:
-            self.cache.invalidate_pattern('checklist_*')
+            after_commit(self.cache.invalidate_tags, 'checklist')
 
         return result
 
@@ -57,32 +59,26 @@ class ChecklistService(IChecklistService):
         """공통 Check list 항목 조회"""
         cache_key = 'checklist_common_items'
 
-        # 캐시 조회
-        if self.cache:
-            cached = self.cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        # DB 조회
-        result = self.db_schema.get_checklist_items(common_only=True)
+        def load():
+            return self.db_schema.get_checklist_items(common_only=True)
 
-        # 캐시 저장
+        # 캐시 조회 (동시 요청은 DB 조회 1회로 합쳐짐)
         if self.cache:
-            self.cache.set(cache_key, result, ttl_seconds=300)
-
-        return result
+            return self.cache.get_or_load(cache_key, load, ttl_seconds=300, tags=['checklist'])
+        return load()
 
     def get_equipment_checklist(self, equipment_type_id: int) -> List[Dict]:
         """장비별 적용되는 Check list 조회"""
         cache_key = f'checklist_equipment_{equipment_type_id}'
 
-        # 캐시 조회
+        # 캐시 조회 (동시 요청은 DB 조회 1회로 합쳐짐, 공통 항목 / 해당 장비 유형 변경 시 무효화)
         if self.cache:
-            cached = self.cache.get(cache_key)
-            if cached is not None:
-                return cached
+            return self.cache.get_or_load(cache_key, lambda: self._load_equipment_checklist(equipment_type_id),
+                                          ttl_seconds=300, tags=['checklist', f'type:{equipment_type_id}'])
+        return self._load_equipment_checklist(equipment_type_id)
 
-        # DB 조회
+    def _load_equipment_checklist(self, equipment_type_id: int) -> List[Dict]:
+        """장비별 Check list DB 조회"""
         raw_data = self.db_schema.get_equipment_checklist_items(equipment_type_id)
 
         # 딕셔너리 형태로 변환
@@ -105,11 +101,6 @@ class ChecklistService(IChecklistService):
         # 심각도 순서 정렬
         severity_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
         result.sort(key=lambda x: (severity_order.get(x['severity_level'], 999), x['item_name']))
-
-        # 캐시 저장
-        if self.cache:
-            self.cache.set(cache_key, result, ttl_seconds=300)
-
         return result
 
     def add_equipment_specific_checklist(self, equipment_type_id: int,
@@ -137,9 +128,9 @@ class ChecklistService(IChecklistService):
             added_by=added_by
         )
 
-        # 캐시 무효화
+        # 캐시 무효화 (쓰기 큐 작업 안에서는 그룹 커밋 후)
         if self.cache:
-            self.cache.invalidate_pattern(f'checklist_equipment_{equipment_type_id}')
+            after_commit(self.cache.delete, f'checklist_equipment_{equipment_type_id}')
 
         return result
 
@@ -158,9 +149,9 @@ class ChecklistService(IChecklistService):
             approved_by=approved_by
         )
 
-        # 캐시 무효화
+        # 캐시 무효화 (쓰기 큐 작업 안에서는 그룹 커밋 후)
         if self.cache:
-            self.cache.invalidate_pattern(f'checklist_equipment_{equipment_type_id}')
+            after_commit(self.cache.delete, f'checklist_equipment_{equipment_type_id}')
 
         return result
 
@@ -170,7 +161,8 @@ class ChecklistService(IChecklistService):
 
     def validate_parameter_against_checklist(self, equipment_type_id: int,
                                             parameter_name: str,
-                                            parameter_value: str) -> Dict:
+                                            parameter_value: str,
+                                            numeric_value: Optional[float] = None) -> Dict:
         """파라미터가 Check list에 포함되는지 검증"""
         # 장비별 Check list 조회
         checklist_items = self.get_equipment_checklist(equipment_type_id)
@@ -193,7 +185,7 @@ class ChecklistService(IChecklistService):
                     validation_rule = item.get('custom_validation_rule') or item.get('validation_rule')
                     if validation_rule:
                         validation_result = self._apply_validation_rule(
-                            parameter_name, parameter_value, validation_rule
+                            parameter_name, parameter_value, validation_rule, numeric_value
                         )
                         result['validation_passed'] = validation_result['passed']
                         result['message'] = validation_result['message']
@@ -213,7 +205,8 @@ class ChecklistService(IChecklistService):
         }
 
     def _apply_validation_rule(self, parameter_name: str, parameter_value: str,
-                              validation_rule: str) -> Dict:
+                              validation_rule: str,
+                              numeric_value: Optional[float] = None) -> Dict:
         """
         검증 규칙 적용
 
@@ -233,7 +226,13 @@ class ChecklistService(IChecklistService):
             if rule_type == 'range':
                 # 범위 검증
                 try:
-                    value = float(parameter_value)
+                    # Typed Shadow에서 변환된 값이 있으면 재사용 (NaN은 변환 실패)
+                    if numeric_value is None:
+                        value = float(parameter_value)
+                    elif numeric_value != numeric_value:
+                        raise ValueError(parameter_value)
+                    else:
+                        value = numeric_value
                     min_val = rule.get('min')
                     max_val = rule.get('max')
 
@@ -5,11 +5,26 @@
 """
 
 from .service_registry import ServiceRegistry
-from .cache_service import CacheService
+from .cache_service import CacheService, CacheNamespace
 from .logging_service import LoggingService
+from .search_index import SearchIndex
+from .write_queue import DatabaseWriter
+from .connection_pool import ConnectionPool
+from .export_service import ExportSheet, ExportCancelled, write_export, start_export
+from .chart_service import ChartRenderer, chart_renderer
 
 __all__ = [
     'ServiceRegistry',
-    'CacheService', 
-    'LoggingService'
+    'CacheService',
+    'CacheNamespace',
+    'LoggingService',
+    'SearchIndex',
+    'DatabaseWriter',
+    'ConnectionPool',
+    'ExportSheet',
+    'ExportCancelled',
+    'write_export',
+    'start_export',
+    'ChartRenderer',
+    'chart_renderer'
 ] 
\ No newline at end of file
@@ -3,123 +3,454 @@
 
 메모리 기반 캐싱을 제공하여 성능을 개선합니다.
 LRU(Least Recently Used) 캐시와 TTL(Time To Live) 기능을 지원합니다.
+
+- 태그: 항목이 의존하는 엔티티(예: 'config:12', 'type:3', 'checklist')를 함께 저장하고
+  invalidate_tags()로 해당 태그 항목만 무효화 (영향 받는 항목 수에 비례)
+- 이름 공간: namespace('configuration')로 서비스별 뷰를 얻어 사용하면
+  한 서비스의 clear()가 다른 서비스 항목을 제거하지 않음. 통계도 이름 공간별로 집계
+- 메모리 예산: 항목별 추정 크기(bytes)를 합산해 max_bytes를 넘으면 오래된 항목부터 제거
+- get_or_load(): 같은 키를 여러 스레드가 동시에 요청해도 loader는 한 번만 실행 (single-flight)
+- 시간은 monotonic 시계 기준 (시스템 시각 변경에 영향 없음), 만료 항목은 저장 시 주기적으로 정리
 """
 
-from typing import Any, Optional, Dict, TypeVar
-from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Optional, Dict, Set, Tuple, TypeVar
+from datetime import datetime
 from collections import OrderedDict
-import threading
+from itertools import islice
 import logging
+import sys
+import threading
+import time
+
+from ...instrumentation import instrumentation
 
 T = TypeVar('T')
 
+DEFAULT_NAMESPACE = 'default'
+
+CacheKey = Tuple[str, str]
+
+# 크기 추정 시 컨테이너당 표본 수 / 최대 깊이
+_SIZE_SAMPLE = 32
+_SIZE_MAX_DEPTH = 4
+_ATOMIC_TYPES = frozenset((str, bytes, bytearray, int, float, bool, complex, type(None)))
+_getsizeof = sys.getsizeof
+_monotonic = time.monotonic
+_NO_TAGS = frozenset()
+
+# 만료 항목 전체 정리 최대 주기 (초)
+_SWEEP_INTERVAL = 30
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    값의 대략적인 메모리 크기 (bytes)
+
+    큰 컨테이너는 앞쪽 표본의 평균 크기 × 길이로 추정하므로
+    2만 행 목록도 일정한 비용으로 계산됩니다.
+    """
+    size = _getsizeof(value)
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES or _depth >= _SIZE_MAX_DEPTH:
+        return size
+
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        count = len(value)
+        if not count:
+            return size
+        items = value.items() if isinstance(value, dict) else value
+        sample = items if count <= _SIZE_SAMPLE else islice(items, _SIZE_SAMPLE)
+        depth = _depth + 1
+        total = 0
+        sampled = 0
+        for item in sample:
+            sampled += 1
+            total += _getsizeof(item) if type(item) in _ATOMIC_TYPES else estimate_size(item, depth)
+        if sampled != count:
+            total = int(total / sampled * count)
+        return size + total
+
+    # pandas DataFrame / Series, numpy 배열
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return size + int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except (TypeError, ValueError):
+            pass
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return size + nbytes
+
+    # 일반 객체 / dataclass
+    attributes = getattr(value, '__dict__', None)
+    if attributes is not None:
+        size += estimate_size(attributes, _depth + 1)
+    return size
+
+
 class CacheEntry:
-    """캐시 엔트리"""
-    
-    def __init__(self, value: Any, ttl_seconds: Optional[int] = None):
+    """캐시 엔트리 (시간 값은 time.monotonic() 기준)"""
+
+    __slots__ = ('value', 'created_at', 'expires_at', 'access_count', 'last_accessed', 'tags', 'size')
+
+    def __init__(self, value: Any, ttl_seconds: Optional[float] = None,
+                 tags: Optional[Iterable[str]] = None, size: Optional[int] = None):
         self.value = value
-        self.created_at = datetime.now()
-        self.expires_at = None
-        if ttl_seconds:
-            self.expires_at = self.created_at + timedelta(seconds=ttl_seconds)
+        self.created_at = _monotonic()
+        self.expires_at = self.created_at + ttl_seconds if ttl_seconds else None
         self.access_count = 0
         self.last_accessed = self.created_at
-    
-    def is_expired(self) -> bool:
+        self.tags = frozenset(tags) if tags else _NO_TAGS
+        self.size = size if size is not None else estimate_size(value)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """만료 여부 확인"""
         if self.expires_at is None:
             return False
-        return datetime.now() > self.expires_at
-    
-    def access(self) -> Any:
+        return (now if now is not None else time.monotonic()) > self.expires_at
+
+    def access(self, now: Optional[float] = None) -> Any:
         """값 접근 (접근 시간 및 횟수 업데이트)"""
-        self.last_accessed = datetime.now()
+        self.last_accessed = now if now is not None else time.monotonic()
         self.access_count += 1
         return self.value
 
+
+class _NamespaceStats:
+    """이름 공간별 통계"""
+
+    __slots__ = ('hits', 'misses', 'evictions', 'invalidations', 'expirations', 'loads', 'coalesced', 'bytes')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+        self.loads = 0          # get_or_load에서 loader 실행 횟수
+        self.coalesced = 0      # 진행 중인 로드를 기다려 결과를 받은 횟수
+        self.bytes = 0
+
+    def to_dict(self, size: int) -> Dict[str, Any]:
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        return {
+            'size': size,
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(hit_rate, 2),
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'expirations': self.expirations,
+            'loads': self.loads,
+            'coalesced': self.coalesced
+        }
+
+
+class _Flight:
+    """진행 중인 get_or_load 로드 (로드 중 해당 키 / 태그가 무효화되면 stale)"""
+
+    __slots__ = ('event', 'value', 'error', 'tags', 'stale')
+
+    def __init__(self, tags: Optional[Iterable[str]] = None):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+        self.tags = frozenset(tags or ())
+        self.stale = False
+
+
 class CacheService:
     """캐시 서비스 구현"""
-    
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None):
+
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
         """
         캐시 서비스 초기화
-        
+
         Args:
-            max_size: 최대 캐시 항목 수
+            max_size: 최대 캐시 항목 수 (모든 이름 공간 합계)
             default_ttl: 기본 TTL (초)
+            max_bytes: 메모리 예산 (추정 크기 합계, bytes). None이면 항목 수만 제한
         """
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (이름 공간, 키) → 엔트리. LRU 순서는 이름 공간 구분 없이 전체 기준
+        self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._default_ttl = default_ttl
+        self._bytes = 0
         self._lock = threading.RLock()
         self._logger = logging.getLogger(self.__class__.__name__)
-        
+
+        # 역색인: 태그 → 항목, 이름 공간 → 항목
+        self._tag_index: Dict[str, Set[CacheKey]] = {}
+        self._namespace_index: Dict[str, Set[CacheKey]] = {}
+        self._namespaces: Dict[str, 'CacheNamespace'] = {}
+
+        # 만료 항목 주기 정리 (저장 시 확인, 주기마다 전체 1회 순회)
+        self._sweep_interval = min(default_ttl, _SWEEP_INTERVAL) if default_ttl else _SWEEP_INTERVAL
+        self._next_sweep = _monotonic() + self._sweep_interval
+
+        # single-flight: 진행 중인 로드 (로드 중 그 키 / 태그가 무효화되면 결과를 저장하지 않음)
+        self._inflight: Dict[CacheKey, _Flight] = {}
+
         # 통계 정보
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-    
+        self._stats: Dict[str, _NamespaceStats] = {}
+
+    def namespace(self, name: str) -> 'CacheNamespace':
+        """
+        이름 공간 뷰 반환 (같은 이름이면 같은 객체)
+
+        Args:
+            name: 이름 공간 이름 (예: 'configuration', 'checklist')
+        """
+        with self._lock:
+            view = self._namespaces.get(name)
+            if view is None:
+                view = self._namespaces[name] = CacheNamespace(self, name)
+            return view
+
+    def _stats_for(self, namespace: str) -> _NamespaceStats:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = _NamespaceStats()
+        return stats
+
+    def _remove(self, cache_key: CacheKey) -> CacheEntry:
+        """항목 제거 및 역색인 / 크기 정리 (lock 보유 상태에서 호출)"""
+        entry = self._cache.pop(cache_key)
+        self._bytes -= entry.size
+        self._stats[cache_key[0]].bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_index[tag]
+        keys = self._namespace_index.get(cache_key[0])
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._namespace_index[cache_key[0]]
+        return entry
+
+    def _purge_expired(self, now: float) -> int:
+        """만료 시각이 지난 항목 정리 (lock 보유 상태에서 호출)"""
+        self._next_sweep = now + self._sweep_interval
+        expired = [cache_key for cache_key, entry in self._cache.items()
+                   if entry.expires_at is not None and now > entry.expires_at]
+        for cache_key in expired:
+            self._remove(cache_key)
+            self._stats_for(cache_key[0]).expirations += 1
+        return len(expired)
+
+    def _mark_stale(self, predicate: Callable[[CacheKey, _Flight], bool]) -> None:
+        """조건에 맞는 진행 중 로드를 stale로 표시 (lock 보유 상태에서 호출)"""
+        for cache_key, flight in self._inflight.items():
+            if predicate(cache_key, flight):
+                flight.stale = True
+
+    # ==================== 이름 공간 단위 연산 ====================
+
+    def _lookup(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """(찾음 여부, 값) - lock 보유 상태에서 호출"""
+        cache_key = (namespace, key)
+        stats = self._stats.get(namespace) or self._stats_for(namespace)
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            now = _monotonic()
+            expires_at = entry.expires_at
+            if expires_at is None or now <= expires_at:
+                # LRU 업데이트 (최근 사용된 항목을 끝으로 이동)
+                self._cache.move_to_end(cache_key)
+                stats.hits += 1
+                entry.last_accessed = now
+                entry.access_count += 1
+                instrumentation.count('cache.hit')
+                return True, entry.value
+
+            # 만료
+            self._remove(cache_key)
+            stats.expirations += 1
+            self._logger.debug(f"캐시 만료: {namespace}:{key}")
+
+        stats.misses += 1
+        instrumentation.count('cache.miss')
+        return False, None
+
+    def _get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._lookup(namespace, key)[1]
+
+    def _set(self, namespace: str, key: str, value: Any, ttl_seconds: Optional[float],
+             tags: Optional[Iterable[str]], flight: Optional[_Flight] = None) -> bool:
+        # 크기 추정은 lock 밖에서 (큰 목록도 다른 스레드 조회를 막지 않음)
+        size = estimate_size(value)
+        cache_key = (namespace, key)
+        with self._lock:
+            # get_or_load: 로드 중 무효화가 있었으면 오래된 값일 수 있으므로 저장하지 않음
+            if flight is not None and flight.stale:
+                return False
+
+            # TTL 결정
+            effective_ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+
+            # 기존 키가 있으면 업데이트
+            if cache_key in self._cache:
+                self._remove(cache_key)
+
+            # 예산보다 큰 항목은 저장하지 않음 (다른 항목을 모두 밀어내는 것 방지)
+            if self._max_bytes is not None and size > self._max_bytes:
+                self._logger.debug("캐시 예산 초과로 저장 생략: %s:%s (%d bytes)", namespace, key, size)
+                return False
+
+            entry = CacheEntry(value, effective_ttl, tags, size)
+            self._cache[cache_key] = entry
+            self._bytes += size
+            self._stats_for(namespace).bytes += size
+            keys = self._namespace_index.get(namespace)
+            if keys is None:
+                keys = self._namespace_index[namespace] = set()
+            keys.add(cache_key)
+            for tag in entry.tags:
+                self._tag_index.setdefault(tag, set()).add(cache_key)
+
+            # 만료 항목 주기 정리 후 크기 / 예산 제한 확인 (LRU 방식으로 제거)
+            if entry.created_at >= self._next_sweep:
+                self._purge_expired(entry.created_at)
+            while len(self._cache) > self._max_size or \
+                    (self._max_bytes is not None and self._bytes > self._max_bytes):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._stats_for(oldest_key[0]).evictions += 1
+                self._logger.debug("캐시 LRU 제거: %s:%s", oldest_key[0], oldest_key[1])
+
+            self._logger.debug("캐시 저장: %s:%s (TTL: %s, %d bytes)", namespace, key, effective_ttl, size)
+            return True
+
+    def _get_or_load(self, namespace: str, key: str, loader: Callable[[], T],
+                     ttl_seconds: Optional[float], tags: Optional[Iterable[str]]) -> T:
+        cache_key = (namespace, key)
+        with self._lock:
+            found, value = self._lookup(namespace, key)
+            if found:
+                return value
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[cache_key] = _Flight(tags)
+            else:
+                self._stats_for(namespace).coalesced += 1
+
+        # 다른 스레드가 로드 중이면 결과를 기다림
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+            flight.value = value
+            # 진행 중 목록에서 빼기 전에 저장 (저장 직전 무효화도 stale로 표시되도록)
+            if value is not None:
+                self._set(namespace, key, value, ttl_seconds, tags, flight)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[cache_key]
+                self._stats_for(namespace).loads += 1
+            flight.event.set()
+        return value
+
+    def _delete(self, namespace: str, key: str) -> bool:
+        cache_key = (namespace, key)
+        with self._lock:
+            flight = self._inflight.get(cache_key)
+            if flight is not None:
+                flight.stale = True
+            if cache_key in self._cache:
+                self._remove(cache_key)
+                self._logger.debug(f"캐시 삭제: {namespace}:{key}")
+                return True
+            return False
+
+    def _invalidate_pattern(self, namespace: str, pattern: str) -> int:
+        import fnmatch
+
+        with self._lock:
+            self._mark_stale(lambda cache_key, flight: cache_key[0] == namespace and
+                             fnmatch.fnmatch(cache_key[1], pattern))
+            keys_to_delete = [cache_key for cache_key in self._namespace_index.get(namespace, ())
+                              if fnmatch.fnmatch(cache_key[1], pattern)]
+            for cache_key in keys_to_delete:
+                self._remove(cache_key)
+
+            if keys_to_delete:
+                self._stats_for(namespace).invalidations += len(keys_to_delete)
+                self._logger.debug(f"패턴 '{pattern}'로 {len(keys_to_delete)}개 캐시 항목 삭제")
+
+            return len(keys_to_delete)
+
+    def _clear_namespace(self, namespace: str) -> int:
+        with self._lock:
+            self._mark_stale(lambda cache_key, flight: cache_key[0] == namespace)
+            keys = list(self._namespace_index.get(namespace, ()))
+            for cache_key in keys:
+                self._remove(cache_key)
+            self._logger.info(f"캐시 이름 공간 삭제: {namespace} ({len(keys)}개 항목)")
+            return len(keys)
+
+    # ==================== 기본 이름 공간 API ====================
+
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값 조회
-        
+
         Args:
             key: 캐시 키
-            
+
         Returns:
             캐시된 값 또는 None
         """
-        with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
-            
-            entry = self._cache[key]
-            
-            # 만료 확인
-            if entry.is_expired():
-                del self._cache[key]
-                self._misses += 1
-                self._logger.debug(f"캐시 만료: {key}")
-                return None
-            
-            # LRU 업데이트 (최근 사용된 항목을 끝으로 이동)
-            self._cache.move_to_end(key)
-            self._hits += 1
-            
-            return entry.access()
-    
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        return self._get(DEFAULT_NAMESPACE, key)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """
         캐시에 값 저장
-        
+
         Args:
             key: 캐시 키
             value: 저장할 값
             ttl_seconds: TTL (초), None이면 default_ttl 사용
+            tags: 항목이 의존하는 엔티티 태그 (예: ['config:12', 'type:3'])
+
+        Returns:
+            저장 여부 (메모리 예산보다 큰 값은 저장하지 않음)
         """
-        with self._lock:
-            # TTL 결정
-            effective_ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-            
-            # 새 엔트리 생성
-            entry = CacheEntry(value, effective_ttl)
-            
-            # 기존 키가 있으면 업데이트
-            if key in self._cache:
-                del self._cache[key]
-            
-            self._cache[key] = entry
-            
-            # 크기 제한 확인 (LRU 방식으로 제거)
-            while len(self._cache) > self._max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._evictions += 1
-                self._logger.debug(f"캐시 LRU 제거: {oldest_key}")
-            
-            self._logger.debug(f"캐시 저장: {key} (TTL: {effective_ttl})")
-    
+        return self._set(DEFAULT_NAMESPACE, key, value, ttl_seconds, tags)
+
+    def get_or_load(self, key: str, loader: Callable[[], T], ttl_seconds: Optional[int] = None,
+                    tags: Optional[Iterable[str]] = None) -> T:
+        """
+        캐시 조회, 없으면 loader() 결과를 저장 후 반환
+
+        같은 키를 동시에 요청한 스레드들은 하나의 loader 실행 결과를 함께 받습니다.
+        loader가 예외를 던지면 기다리던 스레드에도 같은 예외가 전달되며, None 결과는 저장하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 읽어 오는 함수 (인자 없음)
+            ttl_seconds: TTL (초), None이면 default_ttl 사용
+            tags: 항목이 의존하는 엔티티 태그
+        """
+        return self._get_or_load(DEFAULT_NAMESPACE, key, loader, ttl_seconds, tags)
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 키 삭제
@@ -130,16 +461,13 @@ class CacheService:
         Returns:
             삭제 성공 여부
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._logger.debug(f"캐시 삭제: {key}")
-                return True
-            return False
+        return self._delete(DEFAULT_NAMESPACE, key)
 
     def invalidate_pattern(self, pattern: str) -> int:
         """
-        패턴에 매칭되는 캐시 키들을 무효화
+        패턴에 매칭되는 캐시 키들을 무효화 (기본 이름 공간)
+
+        가능하면 태그 기반 invalidate_tags()를 사용하세요.
 
         Args:
             pattern: 패턴 (예: 'checklist_*', '*equipment*')
@@ -147,86 +475,166 @@ class CacheService:
         Returns:
             삭제된 항목 수
         """
-        import fnmatch
+        return self._invalidate_pattern(DEFAULT_NAMESPACE, pattern)
 
-        with self._lock:
-            keys_to_delete = []
-            for key in self._cache.keys():
-                if fnmatch.fnmatch(key, pattern):
-                    keys_to_delete.append(key)
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        태그가 하나라도 붙은 항목 무효화 (모든 이름 공간 대상)
 
-            for key in keys_to_delete:
-                del self._cache[key]
+        태그는 서비스가 아니라 엔티티를 가리키므로, 예를 들어 'type:3' 무효화는
+        Equipment Type 3에 의존하는 다른 서비스의 항목도 함께 제거합니다.
 
-            if keys_to_delete:
-                self._logger.debug(f"패턴 '{pattern}'로 {len(keys_to_delete)}개 캐시 항목 삭제")
+        Args:
+            tags: 무효화할 태그
 
-            return len(keys_to_delete)
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            self._mark_stale(lambda cache_key, flight: not flight.tags.isdisjoint(tags))
+            keys = set()
+            for tag in tags:
+                keys.update(self._tag_index.get(tag, ()))
+            for cache_key in keys:
+                self._remove(cache_key)
+                self._stats_for(cache_key[0]).invalidations += 1
+            if keys:
+                self._logger.debug(f"태그 {list(tags)}로 {len(keys)}개 캐시 항목 삭제")
+            return len(keys)
 
     def clear(self) -> None:
-        """모든 캐시 제거"""
+        """모든 캐시 제거 (모든 이름 공간)"""
         with self._lock:
+            self._mark_stale(lambda cache_key, flight: True)
             cleared_count = len(self._cache)
             self._cache.clear()
+            self._tag_index.clear()
+            self._namespace_index.clear()
+            self._bytes = 0
+            for stats in self._stats.values():
+                stats.bytes = 0
             self._logger.info(f"캐시 전체 삭제: {cleared_count}개 항목")
-    
+
     def cleanup_expired(self) -> int:
         """
         만료된 항목들 정리
-        
+
         Returns:
             정리된 항목 수
         """
         with self._lock:
-            expired_keys = []
-            for key, entry in self._cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._cache[key]
-            
-            if expired_keys:
-                self._logger.info(f"만료된 캐시 항목 정리: {len(expired_keys)}개")
-            
-            return len(expired_keys)
-    
+            purged = self._purge_expired(time.monotonic())
+            if purged:
+                self._logger.info(f"만료된 캐시 항목 정리: {purged}개")
+            return purged
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         캐시 통계 정보 조회
-        
+
         Returns:
-            통계 정보 딕셔너리
+            통계 정보 딕셔너리 (namespaces: 이름 공간별 통계)
         """
         with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
-            
+            hits = sum(stats.hits for stats in self._stats.values())
+            misses = sum(stats.misses for stats in self._stats.values())
+            evictions = sum(stats.evictions for stats in self._stats.values())
+            total_requests = hits + misses
+            hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
             return {
                 'size': len(self._cache),
                 'max_size': self._max_size,
-                'hits': self._hits,
-                'misses': self._misses,
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes,
+                'hits': hits,
+                'misses': misses,
                 'hit_rate': round(hit_rate, 2),
-                'evictions': self._evictions,
-                'default_ttl': self._default_ttl
+                'evictions': evictions,
+                'default_ttl': self._default_ttl,
+                'tags': len(self._tag_index),
+                'namespaces': {
+                    name: stats.to_dict(len(self._namespace_index.get(name, ())))
+                    for name, stats in sorted(self._stats.items())
+                }
             }
-    
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         상세 캐시 정보 조회
-        
+
         Returns:
-            캐시 엔트리별 상세 정보
+            캐시 엔트리별 상세 정보 (기본 이름 공간은 키 그대로, 그 외는 '이름 공간:키')
         """
         with self._lock:
+            now = time.monotonic()
+            wall_now = time.time()
+
+            def to_iso(monotonic_time):
+                return datetime.fromtimestamp(wall_now - (now - monotonic_time)).isoformat()
+
             info = {}
-            for key, entry in self._cache.items():
-                info[key] = {
-                    'created_at': entry.created_at.isoformat(),
-                    'last_accessed': entry.last_accessed.isoformat(),
+            for (namespace, key), entry in self._cache.items():
+                display_key = key if namespace == DEFAULT_NAMESPACE else f"{namespace}:{key}"
+                info[display_key] = {
+                    'namespace': namespace,
+                    'tags': sorted(entry.tags),
+                    'size': entry.size,
+                    'created_at': to_iso(entry.created_at),
+                    'last_accessed': to_iso(entry.last_accessed),
                     'access_count': entry.access_count,
-                    'expires_at': entry.expires_at.isoformat() if entry.expires_at else None,
-                    'is_expired': entry.is_expired()
+                    'expires_at': to_iso(entry.expires_at) if entry.expires_at else None,
+                    'is_expired': entry.is_expired(now)
                 }
-            return info 
\ No newline at end of file
+            return info
+
+
+class CacheNamespace:
+    """
+    CacheService 이름 공간 뷰
+
+    CacheService와 같은 인터페이스를 제공하며, 키와 clear()/통계가 이름 공간 안으로 한정됩니다.
+    invalidate_tags()는 엔티티 기준이므로 모든 이름 공간에 적용됩니다.
+    """
+
+    def __init__(self, cache: CacheService, name: str):
+        self._cache = cache
+        self.name = name
+
+    def namespace(self, name: str) -> 'CacheNamespace':
+        return self._cache.namespace(name)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache._get(self.name, key)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
+        return self._cache._set(self.name, key, value, ttl_seconds, tags)
+
+    def get_or_load(self, key: str, loader: Callable[[], T], ttl_seconds: Optional[int] = None,
+                    tags: Optional[Iterable[str]] = None) -> T:
+        return self._cache._get_or_load(self.name, key, loader, ttl_seconds, tags)
+
+    def delete(self, key: str) -> bool:
+        return self._cache._delete(self.name, key)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        return self._cache._invalidate_pattern(self.name, pattern)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        return self._cache.invalidate_tags(*tags)
+
+    def clear(self) -> None:
+        """이 이름 공간의 항목만 제거"""
+        self._cache._clear_namespace(self.name)
+
+    def cleanup_expired(self) -> int:
+        return self._cache.cleanup_expired()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """이 이름 공간의 통계"""
+        with self._cache._lock:
+            stats = self._cache._stats_for(self.name)
+            result = stats.to_dict(len(self._cache._namespace_index.get(self.name, ())))
+            result['namespace'] = self.name
+            return result
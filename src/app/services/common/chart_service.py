@@ -0,0 +1,208 @@
+"""
+차트 렌더링 서비스
+
+리포트 / QC 통계 차트를 Tk 메인 스레드 밖에서 그립니다.
+
+- 차트 데이터 계산(data 함수)과 그리기(draw 함수)는 차트 전용 작업 스레드 하나에서 실행
+  (matplotlib은 스레드 안전하지 않으므로 pyplot 없이 Figure + Agg 캔버스만 사용하고 작업을 직렬화)
+- 결과는 PNG 바이트로 캐시 (키: 데이터 버전 + 차트 종류). 같은 보고서로 돌아오면 바로 표시
+- 같은 키를 그리는 중에 다시 요청하면 진행 중인 작업을 공유
+- show(): 자리표시 Label을 먼저 붙이고 root.after 폴링으로 완성된 이미지를 표시
+
+matplotlib은 첫 차트를 그릴 때 작업 스레드에서 로드합니다.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import base64
+import io
+import itertools
+import logging
+import threading
+import weakref
+
+from ...instrumentation import instrumentation
+
+DEFAULT_CACHE_ENTRIES = 32
+DEFAULT_DPI = 100
+
+# 차트 기본 폰트 (한글 표시용, 없으면 다음 폰트로 대체)
+FONT_FAMILY = ['Malgun Gothic', 'AppleGothic', 'NanumGothic', 'DejaVu Sans']
+
+logger = logging.getLogger(__name__)
+
+_tokens: Dict[int, Tuple[Any, int]] = {}
+_token_counter = itertools.count(1)
+_token_lock = threading.Lock()
+_fonts_applied = False
+
+
+def data_token(obj) -> int:
+    """
+    객체별 데이터 버전 번호 (같은 객체면 같은 번호, 새 객체면 새 번호)
+
+    merged_df처럼 데이터를 다시 불러올 때 객체 자체가 바뀌는 경우 캐시 키로 사용합니다.
+    """
+    key = id(obj)
+    with _token_lock:
+        entry = _tokens.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        token = next(_token_counter)
+        _tokens[key] = (weakref.ref(obj, lambda _, key=key: _tokens.pop(key, None)), token)
+        return token
+
+
+def _apply_chart_fonts():
+    """한글 표시용 기본 폰트 설정 (첫 렌더 전 한 번)"""
+    global _fonts_applied
+    if _fonts_applied:
+        return
+    import matplotlib
+
+    matplotlib.rcParams['font.family'] = FONT_FAMILY
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    # 없는 폰트마다 나오는 경고 억제
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    _fonts_applied = True
+
+
+def _render_png(draw, data, figsize, dpi) -> bytes:
+    """Figure + Agg 캔버스로 그려 PNG 바이트 반환 (pyplot / Tk 미사용)"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    _apply_chart_fonts()
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    draw(figure, data)
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+class ChartRenderer:
+    """차트 작업 스레드 + PNG 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {'hits': 0, 'renders': 0, 'shared': 0, 'errors': 0}
+
+    def _submit(self, func, *args) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ChartRenderer')
+        return self._executor.submit(func, *args)
+
+    def render(self, key: Hashable, draw: Callable[[Any, Any], Any], data: Callable[[], Any],
+               figsize: Tuple[float, float] = (8, 5), dpi: int = DEFAULT_DPI) -> Future:
+        """
+        차트를 PNG로 그리기 (작업 스레드)
+
+        Args:
+            key: 캐시 키 (데이터 버전과 차트 종류를 포함해야 함)
+            draw: draw(figure, data) - figure.subplots()로 축을 만들어 그림
+            data: 차트 데이터를 계산하는 함수 (작업 스레드에서 실행)
+
+        Returns:
+            PNG 바이트를 돌려주는 Future (캐시에 있으면 완료된 Future)
+        """
+        cache_key = (key, tuple(figsize), dpi)
+        with self._lock:
+            png = self._cache.get(cache_key)
+            if png is not None:
+                self._cache.move_to_end(cache_key)
+                self._stats['hits'] += 1
+                future = Future()
+                future.set_result(png)
+                return future
+            future = self._pending.get(cache_key)
+            if future is not None:
+                self._stats['shared'] += 1
+                return future
+            future = self._submit(self._run, cache_key, draw, data, figsize, dpi)
+            self._pending[cache_key] = future
+            return future
+
+    def _run(self, cache_key, draw, data, figsize, dpi):
+        try:
+            with instrumentation.span('chart.render', 'ui', chart=str(cache_key[0])[:80]):
+                png = _render_png(draw, data(), figsize, dpi)
+        except BaseException:
+            with self._lock:
+                self._pending.pop(cache_key, None)
+                self._stats['errors'] += 1
+            raise
+        with self._lock:
+            self._pending.pop(cache_key, None)
+            self._cache[cache_key] = png
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            self._stats['renders'] += 1
+        return png
+
+    def show(self, container, key: Hashable, draw: Callable[[Any, Any], Any], data: Callable[[], Any],
+             figsize: Tuple[float, float] = (8, 5), dpi: int = DEFAULT_DPI, poll_ms: int = 50):
+        """
+        container에 차트 표시 (그리는 동안 자리표시 문구, 완성되면 이미지로 교체)
+
+        container가 그 사이 파괴되면 결과는 버립니다 (캐시에는 남음).
+
+        Returns:
+            표시용 Label
+        """
+        import tkinter as tk
+        from tkinter import ttk
+
+        holder = ttk.Label(container, text="📊 차트 생성 중...", anchor='center')
+        holder.pack(fill=tk.BOTH, expand=True)
+        future = self.render(key, draw, data, figsize, dpi)
+
+        def poll():
+            if not holder.winfo_exists():
+                return
+            if not future.done():
+                holder.after(poll_ms, poll)
+                return
+            error = future.exception()
+            if error is not None:
+                logger.error(f"차트 생성 실패 ({key}): {error}")
+                holder.config(text=f"차트 생성 중 오류 발생: {error}", foreground='red')
+                return
+            image = tk.PhotoImage(master=holder, data=base64.b64encode(future.result()))
+            holder.config(image=image, text='')
+            holder.image = image  # PhotoImage 참조 유지
+
+        if future.done():
+            poll()
+        else:
+            holder.after(poll_ms, poll)
+        return holder
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """캐시 삭제 (predicate(key)가 참인 항목만, 없으면 전체)"""
+        with self._lock:
+            if predicate is None:
+                self._cache.clear()
+                return
+            for cache_key in [k for k in self._cache if predicate(k[0])]:
+                del self._cache[cache_key]
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, entries=len(self._cache),
+                        bytes=sum(len(png) for png in self._cache.values()))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 프로세스 공용 렌더러
+chart_renderer = ChartRenderer()
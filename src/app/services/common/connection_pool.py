@@ -0,0 +1,139 @@
+"""
+SQLite 읽기 연결 풀
+
+GUI는 호출마다 새 연결을 열지만, 여러 요청을 동시에 처리하는 서비스 모드(app.server)에서는
+연결을 여는 비용(파일 열기 + 스키마 로드)이 요청마다 반복되므로 연결을 재사용합니다.
+
+- install(): db_path에 풀을 등록하면 DBSchema.get_connection()이 새 연결 대신 풀의 연결을
+  빌려주고 with 블록이 끝나면 돌려받음 → 기존 서비스 메서드를 그대로 사용
+- 쓰기 큐 작업 안에서는 지금처럼 쓰기 연결을 사용 (writer_connection 우선)
+- 반납 시 열린 트랜잭션은 되돌리고 row_factory를 초기화. 서비스 코드의 close()는 무시
+- 빌린 연결이 size개를 넘으면 새로 열고, 반납 시 size개까지만 보관 (대기 없음)
+"""
+
+from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+import os
+import sqlite3
+import threading
+
+from ...instrumentation import TracedConnection, instrumentation
+
+DEFAULT_POOL_SIZE = 4
+
+# 쓰기 스레드가 잠금을 가진 경우 대기 시간 (ms)
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+# 설치된 풀 (절대 경로 → 풀)
+_pools: Dict[str, 'ConnectionPool'] = {}
+_pools_lock = threading.Lock()
+
+
+def connection_pool(db_path: str) -> Optional['ConnectionPool']:
+    """db_path에 설치된 풀, 없으면 None"""
+    if not _pools:
+        return None
+    return _pools.get(os.path.abspath(db_path))
+
+
+class _PooledConnection(TracedConnection):
+    """풀 연결 - 서비스 코드의 close()는 무시하고 풀이 닫을 때만 닫음"""
+
+    def close(self):
+        pass
+
+    def _close(self):
+        super().close()
+
+
+class ConnectionPool:
+    """
+    db_path 하나의 SQLite 연결 풀 (여러 스레드 공용)
+
+    사용 예:
+        pool = ConnectionPool(db_path).install()
+        ...  # DBSchema(db_path).get_connection()이 풀 연결 사용
+        pool.close()
+    """
+
+    def __init__(self, db_path: str, size: int = DEFAULT_POOL_SIZE,
+                 busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
+        self.db_path = os.path.abspath(db_path)
+        self.size = max(1, size)
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._idle: List[_PooledConnection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {'created': 0, 'reused': 0, 'in_use': 0, 'discarded': 0}
+
+    def install(self) -> 'ConnectionPool':
+        """DBSchema.get_connection()에서 사용하도록 등록"""
+        with _pools_lock:
+            _pools[self.db_path] = self
+        return self
+
+    def uninstall(self):
+        with _pools_lock:
+            if _pools.get(self.db_path) is self:
+                del _pools[self.db_path]
+
+    def _connect(self) -> _PooledConnection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=_PooledConnection)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """연결 빌리기 (with 블록이 끝나면 반납)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("연결 풀이 닫혔습니다")
+            conn = self._idle.pop() if self._idle else None
+            self._stats['reused' if conn is not None else 'created'] += 1
+            self._stats['in_use'] += 1
+        if conn is None:
+            conn = self._connect()
+            instrumentation.count('db.pool.connect')
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def _release(self, conn: _PooledConnection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            # 손상된 연결은 버림
+            conn = self._discard(conn)
+        with self._lock:
+            self._stats['in_use'] -= 1
+            if conn is not None and not self._closed and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        if conn is not None:
+            self._discard(conn)
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        try:
+            conn._close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._stats['discarded'] += 1
+        return None
+
+    def close(self):
+        """등록 해제 후 보관 중인 연결 닫기 (빌려간 연결은 반납 시 닫힘)"""
+        self.uninstall()
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn._close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle), size=self.size)
@@ -0,0 +1,389 @@
+"""
+내보내기 서비스 (Excel / CSV / TSV)
+
+비교 결과, 리포트, QC 결과를 파일로 저장합니다.
+
+- 시트는 컬럼 배열에서 만듦: DataFrame, {컬럼: 값 목록} 또는 둘 중 하나를 돌려주는 함수
+  (함수는 작업 스레드에서 실행되므로 무거운 리포트 계산도 Tk 메인 스레드 밖에서 처리)
+- Excel은 openpyxl write-only 모드로 행 묶음(chunk)씩 흘려 쓰므로 메모리 사용이 일정
+  (시트 최대 행 수를 넘으면 '이름 (2)' 시트로 이어서 기록)
+- CSV / TSV는 csv 모듈로 바로 기록 (첫 시트는 지정한 파일, 나머지 시트는 '파일명_시트명.csv')
+- 임시 파일에 쓴 뒤 교체하므로 취소 / 오류 시 기존 파일이나 반쯤 쓴 파일이 남지 않음
+- start_export(): 작업 스레드에서 실행 + 진행률 / 취소. ExportJob.watch()로 Tk 폴링 연결
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from concurrent.futures import Future
+import csv
+import logging
+import os
+import threading
+
+from ...instrumentation import instrumentation
+
+# 한 번에 변환 / 기록하는 행 수
+DEFAULT_CHUNK_SIZE = 5000
+
+# Excel 시트당 최대 행 수 (헤더 포함) / 시트 이름 길이
+EXCEL_MAX_ROWS = 1048576
+EXCEL_SHEET_NAME_LIMIT = 31
+_INVALID_SHEET_CHARS = str.maketrans({c: '_' for c in '[]:*?/\\'})
+
+# 열 너비 추정 표본 행 수 / 최대 너비
+_WIDTH_SAMPLE = 200
+_MAX_COLUMN_WIDTH = 60
+
+FORMAT_XLSX = 'xlsx'
+FORMAT_CSV = 'csv'
+FORMAT_TSV = 'tsv'
+_FORMATS = {'.xlsx': FORMAT_XLSX, '.csv': FORMAT_CSV, '.tsv': FORMAT_TSV, '.txt': FORMAT_TSV}
+
+ProgressCallback = Callable[[float, str], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class ExportCancelled(Exception):
+    """사용자가 내보내기를 취소함"""
+
+
+def export_format(file_path: str) -> str:
+    """확장자로 형식 결정 (알 수 없는 확장자는 xlsx)"""
+    return _FORMATS.get(os.path.splitext(file_path)[1].lower(), FORMAT_XLSX)
+
+
+def _clean_values(values) -> list:
+    """값 목록 → Python 값 목록 (NaN → None)"""
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    return [None if isinstance(value, float) and value != value else value for value in values]
+
+
+class ExportSheet:
+    """
+    내보낼 시트 하나 (컬럼 이름 + 컬럼 배열)
+
+    data: DataFrame, {컬럼: 값 목록 / numpy 배열}, 또는 둘 중 하나를 돌려주는 함수
+    """
+
+    def __init__(self, name: str, data):
+        self.name = name
+        self._data = data
+        self.columns: List[str] = []
+        self.row_count = 0
+        self._frame = None
+        self._arrays = None
+
+    @classmethod
+    def from_records(cls, name: str, records: Sequence[Dict[str, Any]], fields: Dict[str, str],
+                     empty_message: Optional[Dict[str, str]] = None) -> 'ExportSheet':
+        """
+        dict 목록 → 컬럼 배열 시트
+
+        Args:
+            fields: {시트 컬럼 이름: record 키}
+            empty_message: 결과가 없을 때 대신 쓸 {컬럼: 메시지} 한 줄
+        """
+        if not records and empty_message:
+            return cls(name, {column: [message] for column, message in empty_message.items()})
+        return cls(name, {column: [record.get(key, '') for record in records] for column, key in fields.items()})
+
+    def load(self) -> 'ExportSheet':
+        """데이터 준비 (함수면 실행) 후 컬럼 / 행 수 결정"""
+        data = self._data
+        if callable(data) and not hasattr(data, 'iloc'):
+            data = data()
+        if hasattr(data, 'iloc'):
+            self._frame = data
+            self.columns = [str(column) for column in data.columns]
+            self.row_count = len(data)
+        elif isinstance(data, dict):
+            self.columns = [str(column) for column in data]
+            self._arrays = list(data.values())
+            lengths = {len(values) for values in self._arrays}
+            if len(lengths) > 1:
+                raise ValueError(f"시트 '{self.name}' 컬럼 길이가 다릅니다: {sorted(lengths)}")
+            self.row_count = lengths.pop() if lengths else 0
+        else:
+            raise TypeError(f"시트 '{self.name}' 데이터 형식을 지원하지 않습니다: {type(data).__name__}")
+        return self
+
+    def column_chunk(self, start: int, stop: int) -> List[list]:
+        """start ~ stop 행의 컬럼별 값 목록"""
+        if self._frame is not None:
+            block = self._frame.iloc[start:stop]
+            return [block.iloc[:, i].to_numpy(dtype=object, na_value=None).tolist()
+                    for i in range(block.shape[1])]
+        return [_clean_values(values[start:stop]) for values in self._arrays]
+
+    def row_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   start: int = 0, stop: Optional[int] = None) -> Iterator[List[tuple]]:
+        """행 튜플 묶음 (컬럼 배열을 zip)"""
+        stop = self.row_count if stop is None else min(stop, self.row_count)
+        for chunk_start in range(start, stop, chunk_size):
+            columns = self.column_chunk(chunk_start, min(chunk_start + chunk_size, stop))
+            if columns:
+                yield list(zip(*columns))
+            else:
+                yield [()] * (min(chunk_start + chunk_size, stop) - chunk_start)
+
+
+class _Progress:
+    """행 단위 진행률 보고 + 취소 확인"""
+
+    def __init__(self, total_rows, callback, cancel_event):
+        self.total = max(total_rows, 1)
+        self.done = 0
+        self.callback = callback
+        self.cancel_event = cancel_event
+
+    def check(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ExportCancelled("내보내기가 취소되었습니다")
+
+    def advance(self, rows, message):
+        self.done += rows
+        self.check()
+        if self.callback is not None:
+            self.callback(min(self.done / self.total, 1.0), message)
+
+
+def _sheet_titles(sheets: Sequence[ExportSheet]) -> List[List[tuple]]:
+    """시트별 [(Excel 시트 이름, 시작 행, 끝 행)] - 최대 행 수를 넘으면 이어지는 시트로 나눔"""
+    used = set()
+    per_part = EXCEL_MAX_ROWS - 1
+    result = []
+    for sheet in sheets:
+        base = (sheet.name or 'Sheet').translate(_INVALID_SHEET_CHARS).strip("'") or 'Sheet'
+        parts = []
+        for index, start in enumerate(range(0, max(sheet.row_count, 1), per_part)):
+            suffix = f" ({index + 1})" if index else ''
+            title = base[:EXCEL_SHEET_NAME_LIMIT - len(suffix)] + suffix
+            number = 2
+            while title.lower() in used:
+                extra = f"~{number}"
+                title = base[:EXCEL_SHEET_NAME_LIMIT - len(suffix) - len(extra)] + extra + suffix
+                number += 1
+            used.add(title.lower())
+            parts.append((title, start, min(start + per_part, sheet.row_count)))
+        result.append(parts)
+    return result
+
+
+def _column_widths(sheet: ExportSheet, start: int, stop: int) -> List[float]:
+    """헤더 + 앞쪽 표본 행으로 열 너비 추정"""
+    widths = [len(column) for column in sheet.columns]
+    for i, values in enumerate(sheet.column_chunk(start, min(start + _WIDTH_SAMPLE, stop))):
+        for value in values:
+            if value is not None:
+                widths[i] = max(widths[i], len(str(value)))
+    return [min(width + 2, _MAX_COLUMN_WIDTH) for width in widths]
+
+
+def _write_xlsx(file_path, sheets, progress, chunk_size):
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    bold = Font(bold=True)
+    try:
+        for sheet, parts in zip(sheets, _sheet_titles(sheets)):
+            for title, start, stop in parts:
+                worksheet = workbook.create_sheet(title=title)
+                worksheet.freeze_panes = 'A2'
+                for i, width in enumerate(_column_widths(sheet, start, stop)):
+                    worksheet.column_dimensions[get_column_letter(i + 1)].width = width
+
+                header = []
+                for column in sheet.columns:
+                    cell = WriteOnlyCell(worksheet, value=column)
+                    cell.font = bold
+                    header.append(cell)
+                worksheet.append(header)
+
+                append = worksheet.append
+                for rows in sheet.row_chunks(chunk_size, start, stop):
+                    for row in rows:
+                        append(row)
+                    progress.advance(len(rows), f"'{title}' 시트 기록 중...")
+        progress.check()
+    except BaseException:
+        _discard_worksheets(workbook)
+        raise
+    workbook.save(file_path)
+    return [file_path]
+
+
+def _discard_worksheets(workbook):
+    """중단된 write-only 시트의 임시 파일 정리"""
+    for worksheet in workbook.worksheets:
+        try:
+            if not worksheet.closed:
+                worksheet.close()
+            if worksheet._writer is not None:
+                worksheet._writer.cleanup()
+        except Exception as e:
+            logger.debug(f"시트 임시 파일 정리 실패: {e}")
+
+
+def _delimited_paths(file_path, sheets):
+    """첫 시트는 file_path, 나머지는 '파일명_시트명.확장자'"""
+    stem, extension = os.path.splitext(file_path)
+    paths = [file_path]
+    for sheet in sheets[1:]:
+        name = sheet.name.translate(_INVALID_SHEET_CHARS).replace(' ', '_') or 'Sheet'
+        paths.append(f"{stem}_{name}{extension}")
+    return paths
+
+
+def _write_delimited(paths, sheets, progress, chunk_size, delimiter):
+    for path, sheet in zip(paths, sheets):
+        # Excel에서 한글이 깨지지 않도록 BOM 포함
+        with open(path, 'w', newline='', encoding='utf-8-sig') as handle:
+            writer = csv.writer(handle, delimiter=delimiter)
+            writer.writerow(sheet.columns)
+            for rows in sheet.row_chunks(chunk_size):
+                writer.writerows(rows)
+                progress.advance(len(rows), f"'{os.path.basename(path)}' 기록 중...")
+
+
+def write_export(file_path: str, sheets: Sequence[ExportSheet], progress: Optional[ProgressCallback] = None,
+                 cancel_event: Optional[threading.Event] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 file_format: Optional[str] = None) -> List[str]:
+    """
+    시트들을 파일로 저장 (현재 스레드에서 실행)
+
+    Args:
+        file_path: 저장 경로 (확장자로 형식 결정: .xlsx / .csv / .tsv, .txt)
+        sheets: ExportSheet 목록
+        progress: progress(비율 0~1, 메시지) - 행 묶음마다 호출
+        cancel_event: set되면 다음 행 묶음에서 ExportCancelled
+        file_format: 형식 직접 지정 (FORMAT_XLSX / FORMAT_CSV / FORMAT_TSV)
+
+    Returns:
+        저장한 파일 경로 목록 (CSV / TSV는 시트마다 파일 하나)
+    """
+    if not sheets:
+        raise ValueError("내보낼 시트가 없습니다")
+    file_format = file_format or export_format(file_path)
+
+    with instrumentation.span('export.write', 'io', format=file_format) as export_span:
+        report = _Progress(0, progress, cancel_event)
+        report.check()
+        if progress is not None:
+            progress(0.0, "데이터 준비 중...")
+        for sheet in sheets:
+            sheet.load()
+            report.check()
+        report.total = max(sum(sheet.row_count for sheet in sheets), 1)
+
+        if file_format == FORMAT_XLSX:
+            targets = [file_path]
+        else:
+            targets = _delimited_paths(file_path, sheets)
+        temporaries = [f"{path}.partial" for path in targets]
+        try:
+            if file_format == FORMAT_XLSX:
+                _write_xlsx(temporaries[0], sheets, report, chunk_size)
+            else:
+                delimiter = '\t' if file_format == FORMAT_TSV else ','
+                _write_delimited(temporaries, sheets, report, chunk_size, delimiter)
+            report.check()
+            for temporary, path in zip(temporaries, targets):
+                os.replace(temporary, path)
+        finally:
+            for temporary in temporaries:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+        export_span.set(rows=report.done, files=len(targets))
+
+    if progress is not None:
+        progress(1.0, "완료")
+    return targets
+
+
+class ExportJob:
+    """
+    작업 스레드에서 실행 중인 내보내기
+
+    progress / message는 작업 스레드가 갱신하고 UI는 watch()로 폴링합니다.
+    """
+
+    def __init__(self, file_path: str, sheets: Sequence[ExportSheet], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 file_format: Optional[str] = None):
+        self.file_path = file_path
+        self.progress = 0.0
+        self.message = ''
+        self._sheets = list(sheets)
+        self._chunk_size = chunk_size
+        self._file_format = file_format
+        self._cancel_event = threading.Event()
+        self._future = Future()
+        self._thread = threading.Thread(target=self._run, name='ExportJob', daemon=True)
+
+    def start(self) -> 'ExportJob':
+        self._future.set_running_or_notify_cancel()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """다음 행 묶음에서 중단 (임시 파일 삭제)"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> List[str]:
+        """저장한 파일 경로 목록 (취소 시 ExportCancelled, 실패 시 해당 예외)"""
+        return self._future.result(timeout)
+
+    def _update(self, fraction, message):
+        self.progress = fraction
+        self.message = message
+
+    def _run(self):
+        try:
+            paths = write_export(self.file_path, self._sheets, self._update, self._cancel_event,
+                                 self._chunk_size, self._file_format)
+        except BaseException as e:
+            if not isinstance(e, ExportCancelled):
+                logger.error(f"내보내기 실패 ({self.file_path}): {e}")
+            self._future.set_exception(e)
+        else:
+            self._future.set_result(paths)
+
+    def watch(self, root, on_progress: Optional[ProgressCallback] = None,
+              on_done: Optional[Callable[[List[str]], Any]] = None,
+              on_error: Optional[Callable[[BaseException], Any]] = None, interval: int = 100):
+        """
+        root.after()로 진행률 / 완료를 폴링해 Tk 메인 스레드에서 콜백 실행
+
+        on_error는 취소(ExportCancelled)에도 호출됩니다.
+        """
+        def poll():
+            if on_progress is not None:
+                on_progress(self.progress, self.message)
+            if not self._future.done():
+                root.after(interval, poll)
+                return
+            error = self._future.exception()
+            if error is None:
+                if on_done is not None:
+                    on_done(self._future.result())
+            elif on_error is not None:
+                on_error(error)
+
+        root.after(interval, poll)
+        return self
+
+
+def start_export(file_path: str, sheets: Sequence[ExportSheet], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 file_format: Optional[str] = None) -> ExportJob:
+    """작업 스레드에서 내보내기 시작"""
+    return ExportJob(file_path, sheets, chunk_size, file_format).start()
@@ -0,0 +1,310 @@
+"""
+SQLite FTS5 검색 색인
+
+LIKE '%q%' 전체 스캔 대신 FTS5 색인으로 검색합니다.
+- Default DB Values: parameter_name, default_value, notes
+- Equipment Configurations: configuration_name, customer_name, description
+- Shipped Equipment: serial_number, customer_name, notes
+- 출고 파라미터 이름: Shipped_Equipment_Parameters의 고유 이름 목록 (Shipped_Parameter_Names)
+
+색인은 외부 콘텐츠(content=) FTS5 테이블이며 트리거로 원본 테이블과 동기화됩니다.
+처음 검색할 때 색인이 없으면 만들고 기존 데이터로 채웁니다 (DB 파일당 1회).
+출고 파라미터는 수백만 행이지만 이름 종류는 수천 개이므로, 고유 이름 테이블(사용 횟수 포함)을
+트리거로 유지하고 그 이름만 색인합니다.
+
+FTS5를 쓸 수 없는 SQLite 빌드이거나 원본 테이블이 없으면 table_for()가 None을 반환하고,
+호출하는 쪽은 기존 LIKE 검색을 사용합니다.
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# 원본 테이블 → 색인할 컬럼 (원본에 있는 컬럼만 색인)
+_INDEXED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'Default_DB_Values': ('parameter_name', 'default_value', 'notes'),
+    'Equipment_Configurations': ('configuration_name', 'customer_name', 'description'),
+    'Shipped_Equipment': ('serial_number', 'customer_name', 'notes'),
+    'Shipped_Parameter_Names': ('name',),
+}
+
+PARAMETER_NAMES_TABLE = 'Shipped_Parameter_Names'
+
+# 밑줄 / 점으로 이어진 파라미터 이름도 단어 단위로 검색되도록 unicode61 기본 구분 사용
+_TOKENIZE = "unicode61 remove_diacritics 2"
+_PREFIX = "2 3"
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+_lock = threading.Lock()
+_ready: Dict[str, frozenset] = {}
+
+
+def fts_table_name(table: str) -> str:
+    return f"{table}_fts"
+
+
+def match_expression(query: str, columns: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    사용자 입력 → FTS5 MATCH 식
+
+    단어마다 접두어 검색("temp set" → "temp"* "set"*, 모든 단어 일치)으로 바꿉니다.
+    columns를 주면 해당 컬럼에서만 찾습니다. 검색할 단어가 없으면 None.
+    """
+    tokens = _TOKEN_RE.findall(query or "")
+    if not tokens:
+        return None
+    expression = " ".join(f'"{token}"*' for token in tokens)
+    if columns:
+        expression = "{%s} : (%s)" % (" ".join(columns), expression)
+    return expression
+
+
+def fts5_available() -> bool:
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE _probe USING fts5(x)")
+            return True
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+
+class SearchIndex:
+    """DB 파일별 FTS5 색인 관리"""
+
+    def __init__(self, db_schema):
+        self._db_schema = db_schema
+
+    def table_for(self, conn, table: str) -> Optional[str]:
+        """
+        원본 테이블의 FTS 테이블 이름 (색인이 없으면 만들어 채움)
+
+        Returns:
+            FTS 테이블 이름, 색인을 쓸 수 없으면 None
+        """
+        indexed = self.ensure(conn)
+        return fts_table_name(table) if table in indexed else None
+
+    def ensure(self, conn) -> frozenset:
+        """색인 / 트리거 생성 (DB 파일당 1회) - 색인된 원본 테이블 집합 반환"""
+        key = getattr(self._db_schema, 'db_path', None) or id(self._db_schema)
+        indexed = _ready.get(key)
+        if indexed is not None:
+            return indexed
+
+        with _lock:
+            indexed = _ready.get(key)
+            if indexed is None:
+                indexed = frozenset(self._create(conn)) if fts5_available() else frozenset()
+                _ready[key] = indexed
+        return indexed
+
+    def rebuild(self):
+        """모든 색인을 원본 데이터로 다시 채움 (트리거 밖에서 원본을 직접 고친 경우)"""
+        with self._db_schema.get_connection() as conn:
+            indexed = self.ensure(conn)
+            if PARAMETER_NAMES_TABLE in indexed:
+                _fill_parameter_names(conn.cursor())
+            for table in indexed:
+                conn.execute(f"INSERT INTO {fts_table_name(table)}({fts_table_name(table)}) VALUES ('rebuild')")
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _columns(cursor, table: str) -> Tuple[str, ...]:
+        cursor.execute(f"PRAGMA table_info({table})")
+        return tuple(row[1] for row in cursor.fetchall())
+
+    def _create(self, conn):
+        cursor = conn.cursor()
+        if self._columns(cursor, 'Shipped_Equipment_Parameters'):
+            self._create_parameter_names(cursor)
+
+        indexed = []
+        for table, wanted in _INDEXED_COLUMNS.items():
+            existing = self._columns(cursor, table)
+            columns = [column for column in wanted if column in existing]
+            if not columns:
+                continue
+            self._create_fts(cursor, table, columns)
+            indexed.append(table)
+
+        conn.commit()
+        return indexed
+
+    @staticmethod
+    def _create_fts(cursor, table: str, columns):
+        fts = fts_table_name(table)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,))
+        if cursor.fetchone() is not None:
+            return
+
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE {fts} USING fts5(
+                {column_list},
+                content='{table}', content_rowid='rowid',
+                tokenize='{_TOKENIZE}', prefix='{_PREFIX}'
+            )
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        # 관련도: 첫 컬럼(이름) 일치에 가중치
+        weights = ", ".join(["10.0"] + ["1.0"] * (len(columns) - 1))
+        cursor.execute(f"INSERT INTO {fts}({fts}, rank) VALUES ('rank', 'bm25({weights})')")
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    def _create_parameter_names(self, cursor):
+        """출고 파라미터 고유 이름 테이블 + 사용 횟수 유지 트리거"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (PARAMETER_NAMES_TABLE,))
+        if cursor.fetchone() is not None:
+            # 이전 버전이 만든 트리거 집합이면 다시 만들고 사용 수를 다시 채움
+            if _name_triggers_missing(cursor):
+                install_parameter_name_triggers(cursor)
+            return
+
+        cursor.execute(f"""
+            CREATE TABLE {PARAMETER_NAMES_TABLE} (
+                name TEXT PRIMARY KEY,
+                usage_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        install_parameter_name_triggers(cursor)
+
+
+# ----------------------------------------------------------------------
+# 출고 파라미터 이름 트리거
+# ----------------------------------------------------------------------
+
+_NAME_TRIGGERS = ('shipped_parameter_names_ai', 'shipped_parameter_names_ad', 'shipped_parameter_names_au')
+_DELTA_NAME_TRIGGERS = ('shipped_parameter_names_baseline_ai', 'shipped_parameter_names_baseline_ad',
+                        'shipped_parameter_names_removal_ai', 'shipped_parameter_names_removal_ad')
+
+
+def _name_triggers_missing(cursor) -> bool:
+    """현재 저장 방식에 필요한 이름 사용 수 트리거 중 없는 것이 있는지"""
+    expected = set(_NAME_TRIGGERS)
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Shipped_Equipment_Baselines'")
+    if cursor.fetchone() is not None:
+        expected.update(_DELTA_NAME_TRIGGERS)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'shipped_parameter_names_%'")
+    return not expected <= {row[0] for row in cursor.fetchall()}
+
+
+def _fill_parameter_names(cursor):
+    cursor.execute(f"DELETE FROM {PARAMETER_NAMES_TABLE}")
+    cursor.execute(f"""
+        INSERT INTO {PARAMETER_NAMES_TABLE}(name, usage_count)
+        SELECT parameter_name, COUNT(*) FROM Shipped_Equipment_Parameters GROUP BY parameter_name
+    """)
+
+
+def install_parameter_name_triggers(cursor):
+    """
+    출고 파라미터 이름 테이블의 사용 횟수 트리거를 현재 저장 방식에 맞게 (다시) 만들고 채움
+
+    Shipped_Equipment_Parameters가 테이블이면 그 테이블에, 정규화 저장소(VIEW)이면
+    Shipped_Parameter_Values에 트리거를 겁니다 (이름은 Parameter_Keys에서 조회).
+    차분 저장소이면 기준값 연결 / 빠진 키에도 트리거를 걸고, 기준값을 덮어쓰는 값은 세지 않습니다.
+    이름 테이블이 없으면(색인을 아직 만들지 않은 DB) 아무것도 하지 않습니다.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (PARAMETER_NAMES_TABLE,))
+    if cursor.fetchone() is None:
+        return
+
+    for trigger in _NAME_TRIGGERS + _DELTA_NAME_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    cursor.execute("SELECT type FROM sqlite_master WHERE name = 'Shipped_Equipment_Parameters'")
+    row = cursor.fetchone()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Shipped_Equipment_Baselines'")
+    deltas = cursor.fetchone() is not None
+    condition = ""
+    if row is not None and row[0] == 'view':
+        source, column = 'Shipped_Parameter_Values', 'key_id'
+        new_name = "(SELECT parameter_name FROM Parameter_Keys WHERE id = new.key_id)"
+        old_name = "(SELECT parameter_name FROM Parameter_Keys WHERE id = old.key_id)"
+        if deltas:
+            # 기준값에 있는 키의 값은 기준값 행을 덮어쓸 뿐 이름 사용 수는 그대로
+            condition = """
+                WHEN NOT EXISTS (SELECT 1 FROM Shipped_Equipment_Baselines eb
+                                 JOIN Shipped_Baseline_Values bv ON bv.baseline_id = eb.baseline_id
+                                 WHERE eb.shipped_equipment_id = {row}.shipped_equipment_id
+                                   AND bv.key_id = {row}.key_id)
+            """
+    else:
+        source, column = 'Shipped_Equipment_Parameters', 'parameter_name'
+        new_name, old_name = 'new.parameter_name', 'old.parameter_name'
+
+    def increment(name):
+        return f"""
+            INSERT INTO {PARAMETER_NAMES_TABLE}(name, usage_count) VALUES ({name}, 1)
+            ON CONFLICT(name) DO UPDATE SET usage_count = usage_count + 1;
+        """
+
+    def decrement(name):
+        return f"""
+            UPDATE {PARAMETER_NAMES_TABLE} SET usage_count = usage_count - 1 WHERE name = {name};
+            DELETE FROM {PARAMETER_NAMES_TABLE} WHERE name = {name} AND usage_count <= 0;
+        """
+
+    cursor.execute(f"CREATE TRIGGER shipped_parameter_names_ai AFTER INSERT ON {source} "
+                   f"{condition.format(row='new')} BEGIN {increment(new_name)} END")
+    cursor.execute(f"CREATE TRIGGER shipped_parameter_names_ad AFTER DELETE ON {source} "
+                   f"{condition.format(row='old')} BEGIN {decrement(old_name)} END")
+    cursor.execute(f"CREATE TRIGGER shipped_parameter_names_au AFTER UPDATE OF {column} ON {source} "
+                   f"BEGIN {decrement(old_name)} {increment(new_name)} END")
+
+    if deltas:
+        baseline_names = """
+            SELECT k.parameter_name FROM Shipped_Baseline_Values bv
+            JOIN Parameter_Keys k ON k.id = bv.key_id
+            WHERE bv.baseline_id = {row}.baseline_id
+        """
+        removal_name = "(SELECT parameter_name FROM Parameter_Keys WHERE id = {row}.key_id)"
+        cursor.execute(f"""
+            CREATE TRIGGER shipped_parameter_names_baseline_ai AFTER INSERT ON Shipped_Equipment_Baselines BEGIN
+                INSERT INTO {PARAMETER_NAMES_TABLE}(name, usage_count)
+                SELECT parameter_name, 1 FROM ({baseline_names.format(row='new')}) WHERE true
+                ON CONFLICT(name) DO UPDATE SET usage_count = usage_count + 1;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER shipped_parameter_names_baseline_ad AFTER DELETE ON Shipped_Equipment_Baselines BEGIN
+                UPDATE {PARAMETER_NAMES_TABLE}
+                SET usage_count = usage_count - (SELECT COUNT(*) FROM ({baseline_names.format(row='old')}) b
+                                                 WHERE b.parameter_name = {PARAMETER_NAMES_TABLE}.name)
+                WHERE name IN ({baseline_names.format(row='old')});
+                DELETE FROM {PARAMETER_NAMES_TABLE}
+                WHERE usage_count <= 0 AND name IN ({baseline_names.format(row='old')});
+            END
+        """)
+        cursor.execute(f"CREATE TRIGGER shipped_parameter_names_removal_ai AFTER INSERT ON "
+                       f"Shipped_Parameter_Removals BEGIN {decrement(removal_name.format(row='new'))} END")
+        cursor.execute(f"CREATE TRIGGER shipped_parameter_names_removal_ad AFTER DELETE ON "
+                       f"Shipped_Parameter_Removals BEGIN {increment(removal_name.format(row='old'))} END")
+    _fill_parameter_names(cursor)
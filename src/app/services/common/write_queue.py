@@ -0,0 +1,476 @@
+"""
+백그라운드 쓰기 큐
+
+Default DB 편집, Check list 변경, 예외 추가, 감사 로그, 출고 장비 임포트 같은 SQLite 쓰기를
+Tk 메인 스레드 대신 전용 쓰기 스레드 하나가 가진 연결에서 실행합니다.
+
+- submit(): 쓰기 작업(호출 가능 객체)을 넣고 concurrent.futures.Future를 받음.
+  callback / error_callback은 attach_tk() 후에는 Tk 메인 스레드에서 실행 (root.after 폴링)
+- 그룹 커밋: 대기 중인 작업들을 한 트랜잭션에서 차례로 실행하고 COMMIT은 한 번.
+  작업마다 SAVEPOINT를 두므로 실패한 작업만 되돌리고 나머지는 함께 커밋
+- 병합: 같은 key로 아직 시작하지 않은 작업이 있으면 마지막 작업으로 대체 (Future는 모두 같은 결과)
+- 작업 안에서 DBSchema.get_connection()은 쓰기 연결을 돌려줌 (writer_connection) → 기존 서비스
+  메서드를 그대로 작업으로 실행. 작업 안의 commit()은 무시되고 rollback()은 작업 시작 지점까지만 되돌림
+- 읽기는 지금처럼 호출마다 새 연결 → WAL 모드라 쓰기 중에도 마지막 커밋 스냅샷을 읽음
+- after_commit(): 캐시 무효화 / 스냅샷 갱신은 그룹 커밋이 끝난 뒤에 실행
+  (커밋 전에 무효화하면 그 사이의 읽기가 이전 스냅샷을 다시 캐시에 넣음)
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from ...instrumentation import TracedConnection, instrumentation
+
+# 그룹 커밋 한 번에 묶는 최대 작업 수 / 시간 (초)
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_BATCH_SECONDS = 0.05
+
+# 다른 프로세스가 쓰기 잠금을 가진 경우 대기 시간 (ms)
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+# Tk 콜백 큐 폴링 주기 (ms)
+DEFAULT_POLL_MS = 50
+
+_SAVEPOINT = 'write_job'
+
+# 쓰기 스레드의 현재 연결 (writer_connection)
+_local = threading.local()
+
+Waiter = Tuple[Future, Optional[Callable[[Any], Any]], Optional[Callable[[BaseException], Any]]]
+
+
+def writer_connection(db_path: str) -> Optional[sqlite3.Connection]:
+    """
+    현재 스레드가 db_path의 쓰기 스레드이면 실행 중인 작업의 연결, 아니면 None
+
+    DBSchema.get_connection()이 새 연결 대신 이 연결을 사용하므로 작업 안의
+    서비스 호출이 모두 같은 트랜잭션에 들어갑니다.
+    """
+    conn = getattr(_local, 'connection', None)
+    if conn is None or conn.db_path != os.path.abspath(db_path):
+        return None
+    return conn
+
+
+def after_commit(func: Callable[..., Any], *args):
+    """
+    쓰기 작업 안이면 func(*args)를 그룹 커밋이 끝난 뒤로 미루고, 아니면 바로 실행
+
+    커밋된 내용을 기준으로 해야 하는 후처리(캐시 무효화, 계층 스냅샷 갱신)용입니다.
+    작업이 실패해 SAVEPOINT가 되돌려지거나 그룹 커밋이 실패하면 실행하지 않습니다.
+    """
+    conn = getattr(_local, 'connection', None)
+    if conn is not None and conn.in_job:
+        conn.job_hooks.append((func, args))
+    else:
+        func(*args)
+
+
+def run_write_now(func: Callable[..., Any], *args,
+                  callback: Optional[Callable[[Any], Any]] = None,
+                  error_callback: Optional[Callable[[BaseException], Any]] = None):
+    """
+    쓰기 큐 없이 func(*args)를 바로 실행 (DatabaseWriter.submit과 같은 콜백 형태)
+
+    error_callback이 없으면 예외를 그대로 올립니다.
+    """
+    try:
+        result = func(*args)
+    except Exception as e:
+        if error_callback is None:
+            raise
+        error_callback(e)
+        return None
+    if callback is not None:
+        callback(result)
+    return result
+
+
+class _WriterConnection(TracedConnection):
+    """쓰기 스레드 전용 연결 - 작업 실행 중에는 commit / rollback / close를 작업 단위로 제한"""
+
+    db_path = None
+    in_job = False
+
+    def begin_batch(self):
+        self.execute("BEGIN IMMEDIATE")
+        self.batch_hooks = []
+
+    def begin_job(self):
+        self.row_factory = None
+        self.execute(f"SAVEPOINT {_SAVEPOINT}")
+        self.job_hooks = []
+        self.in_job = True
+
+    def end_job(self, success):
+        self.in_job = False
+        hooks, self.job_hooks = self.job_hooks, []
+        if not success:
+            self.execute(f"ROLLBACK TO {_SAVEPOINT}")
+        self.execute(f"RELEASE {_SAVEPOINT}")
+        # 되돌린 작업의 후처리는 버림
+        if success:
+            self.batch_hooks.extend(hooks)
+
+    def commit(self):
+        # 작업 안의 커밋은 그룹 커밋으로 미룸
+        if not self.in_job:
+            super().commit()
+
+    def rollback(self):
+        if self.in_job:
+            self.execute(f"ROLLBACK TO {_SAVEPOINT}")
+        else:
+            super().rollback()
+
+    def close(self):
+        if not self.in_job:
+            super().close()
+
+    def __exit__(self, exc_type, exc, tb):
+        # with conn: 블록도 작업 단위로 (C 구현은 commit()을 거치지 않고 바로 COMMIT)
+        if not self.in_job:
+            return super().__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            self.rollback()
+        return False
+
+    def executescript(self, sql_script):
+        # executescript()는 열린 트랜잭션을 먼저 COMMIT 하므로 작업 안에서는 문장 단위로 실행
+        if not self.in_job:
+            return super().executescript(sql_script)
+        cursor = self.cursor()
+        statement = ''
+        for piece in sql_script.split(';'):
+            statement += piece + ';'
+            if sqlite3.complete_statement(statement):
+                if statement.strip(' \t\r\n;'):
+                    cursor.execute(statement)
+                statement = ''
+        return cursor
+
+
+class _WriteJob:
+    """대기 중인 쓰기 작업 (병합되면 waiters가 늘어남)"""
+
+    __slots__ = ('func', 'args', 'kwargs', 'key', 'waiters')
+
+    def __init__(self, func, args, kwargs, key, waiter):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.waiters: List[Waiter] = [waiter]
+
+
+class DatabaseWriter:
+    """
+    SQLite 쓰기 전용 스레드 + 작업 큐
+
+    사용 예:
+        writer = DatabaseWriter(db_schema.db_path)
+        writer.attach_tk(root)
+        writer.submit(service.add_parameters_bulk, equipment_id, parameters,
+                      callback=on_done, error_callback=on_error)
+    """
+
+    def __init__(self, db_path: str, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_batch_seconds: float = DEFAULT_MAX_BATCH_SECONDS,
+                 busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            max_batch: 그룹 커밋 한 번에 묶는 최대 작업 수
+            max_batch_seconds: 그룹 커밋 한 번에 작업을 실행하는 최대 시간 (초과하면 다음 작업은 다음 커밋)
+            busy_timeout_ms: 다른 프로세스의 쓰기 잠금 대기 시간
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.max_batch = max(1, max_batch)
+        self.max_batch_seconds = max_batch_seconds
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._pending = deque()
+        self._keyed: Dict[Any, _WriteJob] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {'jobs': 0, 'failed': 0, 'coalesced': 0, 'commits': 0}
+
+        self._ui_queue = queue.SimpleQueue()
+        self._tk_root = None
+        self._ui_thread = None
+        self._poll_ms = DEFAULT_POLL_MS
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._thread = threading.Thread(target=self._run, name='DatabaseWriter', daemon=True)
+        self._thread.start()
+
+    # ==================== 작업 제출 ====================
+
+    def submit(self, func: Callable[..., Any], *args, key: Any = None,
+               callback: Optional[Callable[[Any], Any]] = None,
+               error_callback: Optional[Callable[[BaseException], Any]] = None, **kwargs) -> Future:
+        """
+        쓰기 작업 제출
+
+        func(*args, **kwargs)는 쓰기 스레드에서 실행되며 결과는 그룹 커밋이 끝난 뒤
+        Future / callback으로 전달됩니다 (커밋 실패 시 error_callback).
+
+        Args:
+            func: 실행할 함수 (DBSchema / 서비스 메서드 등)
+            key: 병합 키 - 같은 키로 아직 시작하지 않은 작업이 있으면 이번 작업으로 대체
+            callback: 성공 시 결과를 받는 함수 (attach_tk() 후에는 Tk 메인 스레드에서 실행)
+            error_callback: 실패 시 예외를 받는 함수
+
+        Returns:
+            concurrent.futures.Future
+        """
+        future = Future()
+        waiter = (future, callback, error_callback)
+
+        if self.in_writer_thread():
+            # 작업 안에서 다시 제출: 큐를 기다리면 교착이므로 현재 작업의 일부로 바로 실행
+            future.set_running_or_notify_cancel()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._resolve([waiter], None, e)
+                raise
+            self._resolve([waiter], result, None)
+            return future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("쓰기 큐가 종료되었습니다")
+            job = self._keyed.get(key) if key is not None else None
+            if job is not None:
+                job.func, job.args, job.kwargs = func, args, kwargs
+                job.waiters.append(waiter)
+                self._stats['coalesced'] += 1
+            else:
+                job = _WriteJob(func, args, kwargs, key, waiter)
+                self._pending.append(job)
+                if key is not None:
+                    self._keyed[key] = job
+                self._condition.notify()
+        return future
+
+    def flush(self, timeout: Optional[float] = None):
+        """지금까지 제출한 작업이 모두 커밋될 때까지 대기"""
+        if self.in_writer_thread():
+            return
+        self.submit(lambda: None).result(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 작업을 모두 커밋한 뒤 쓰기 스레드 종료 (이후 submit은 RuntimeError)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if not self.in_writer_thread():
+            self._thread.join(timeout)
+        if self._ui_thread is threading.current_thread():
+            self._drain_ui()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def in_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    @property
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 / 실패 / 병합 / 커밋 횟수, 커밋당 평균 작업 수"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending)
+        stats['jobs_per_commit'] = stats['jobs'] / stats['commits'] if stats['commits'] else 0.0
+        return stats
+
+    # ==================== Tk 연동 ====================
+
+    def attach_tk(self, root, poll_ms: int = DEFAULT_POLL_MS):
+        """
+        콜백을 Tk 메인 스레드에서 실행하도록 연결
+
+        root.after()로 콜백 큐를 폴링합니다. attach_tk()를 호출한 스레드를 UI 스레드로 간주합니다.
+        연결하지 않으면 콜백은 쓰기 스레드에서 바로 실행됩니다.
+        """
+        self._tk_root = root
+        self._ui_thread = threading.current_thread()
+        self._poll_ms = poll_ms
+        root.after(poll_ms, self._poll_ui)
+
+    def call_in_ui(self, func: Callable[..., Any], *args):
+        """
+        func(*args)를 UI 스레드에서 실행 (진행 상황 / 로그 표시용)
+
+        UI 스레드에서 호출하거나 Tk에 연결하지 않았으면 바로 실행합니다.
+        """
+        if self._tk_root is None or threading.current_thread() is self._ui_thread:
+            func(*args)
+        else:
+            self._ui_queue.put((func, args))
+
+    def _poll_ui(self):
+        root = self._tk_root
+        if root is None:
+            return
+        self._drain_ui()
+        try:
+            root.after(self._poll_ms, self._poll_ui)
+        except Exception:
+            # 창이 이미 닫힘 (TclError)
+            self._tk_root = None
+
+    def _drain_ui(self):
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception:
+                self._logger.exception("쓰기 큐 UI 콜백 오류")
+
+    def _resolve(self, waiters: List[Waiter], result, error):
+        for future, callback, error_callback in waiters:
+            if error is None:
+                future.set_result(result)
+                if callback is not None:
+                    self.call_in_ui(callback, result)
+            else:
+                future.set_exception(error)
+                if error_callback is not None:
+                    self.call_in_ui(error_callback, error)
+
+    # ==================== 쓰기 스레드 ====================
+
+    def _take(self, block):
+        """다음 작업 (시작한 작업은 더 이상 병합 대상이 아님). 종료 후 큐가 비면 None"""
+        with self._condition:
+            while not self._pending:
+                if self._closed or not block:
+                    return None
+                self._condition.wait()
+            job = self._pending.popleft()
+            if job.key is not None and self._keyed.get(job.key) is job:
+                del self._keyed[job.key]
+            return job
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, isolation_level=None, factory=_WriterConnection)
+        conn.db_path = self.db_path
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            self._logger.error(f"쓰기 연결 실패: {e}")
+            with self._condition:
+                self._closed = True
+            job = self._take(block=False)
+            while job is not None:
+                self._resolve([w for w in job.waiters if w[0].set_running_or_notify_cancel()], None, e)
+                job = self._take(block=False)
+            return
+
+        _local.connection = conn
+        try:
+            job = self._take(block=True)
+            while job is not None:
+                self._run_batch(conn, job)
+                job = self._take(block=True)
+        finally:
+            _local.connection = None
+            conn.close()
+
+    def _run_batch(self, conn, job):
+        """job부터 시작해 대기 중인 작업을 한 트랜잭션에서 실행하고 한 번에 커밋"""
+        done = []
+        started = time.monotonic()
+        with instrumentation.span('db.write_batch', 'sql') as batch_span:
+            try:
+                conn.begin_batch()
+            except sqlite3.Error as e:
+                self._resolve([w for w in job.waiters if w[0].set_running_or_notify_cancel()], None, e)
+                return
+
+            while job is not None:
+                waiters = [w for w in job.waiters if w[0].set_running_or_notify_cancel()]
+                if waiters:
+                    done.append((waiters,) + self._run_job(conn, job))
+                if len(done) >= self.max_batch or time.monotonic() - started >= self.max_batch_seconds:
+                    break
+                job = self._take(block=False)
+
+            hooks, conn.batch_hooks = conn.batch_hooks, []
+            try:
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._logger.error(f"그룹 커밋 실패: {e}")
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                done = [(waiters, None, error or e) for waiters, _, error in done]
+                hooks = []
+            batch_span.set(jobs=len(done))
+
+        # 커밋 후처리 → 결과 전달 (콜백에서 읽는 캐시는 이미 무효화된 상태)
+        self._run_hooks(hooks)
+
+        failed = sum(1 for _, _, error in done if error is not None)
+        with self._condition:
+            self._stats['jobs'] += len(done)
+            self._stats['failed'] += failed
+            self._stats['commits'] += 1
+        instrumentation.count('db.write_jobs', len(done))
+
+        for waiters, result, error in done:
+            self._resolve(waiters, result, error)
+
+    def _run_hooks(self, hooks):
+        """after_commit() 후처리 실행 (쓰기 연결 대신 일반 연결로 커밋된 내용을 읽도록)"""
+        if not hooks:
+            return
+        conn, _local.connection = _local.connection, None
+        try:
+            for func, args in hooks:
+                try:
+                    func(*args)
+                except Exception as e:
+                    self._logger.error(f"커밋 후처리 실패 ({getattr(func, '__name__', func)}): {e}")
+        finally:
+            _local.connection = conn
+
+    def _run_job(self, conn, job):
+        """작업 하나를 SAVEPOINT 안에서 실행 → (결과, 예외)"""
+        conn.begin_job()
+        try:
+            result = job.func(*job.args, **job.kwargs)
+        except Exception as e:
+            self._logger.warning(f"쓰기 작업 실패 ({getattr(job.func, '__name__', job.func)}): {e}")
+            success, error = False, e
+        else:
+            success, error = True, None
+        try:
+            conn.end_job(success)
+        except sqlite3.Error as e:
+            # 작업이 직접 COMMIT / ROLLBACK 해서 SAVEPOINT가 사라진 경우
+            self._logger.error(f"쓰기 작업 SAVEPOINT 정리 실패: {e}")
+            return None, error or e
+        return (result if success else None), error
@@ -15,6 +15,9 @@ from ..interfaces.configuration_service_interface import (
 )
 from ..common.cache_service import CacheService
 from ..common.logging_service import LoggingService
+from ..common.search_index import SearchIndex, match_expression
+from ..common.write_queue import after_commit
+from ..category.equipment_hierarchy import EquipmentHierarchyCache
 
 
 class ConfigurationService(IConfigurationService):
@@ -26,6 +29,8 @@ class ConfigurationService(IConfigurationService):
     _CACHE_KEY_CONFIGS_BY_TYPE = "configurations:type:{}"
     _CACHE_KEY_DEFAULT_VALUES = "default_values:config:{}"
     _CACHE_KEY_CUSTOMERS = "configurations:customers"
+    _CACHE_TAG_CONFIGS = "configurations"
+    _CACHE_TAG_DEFAULT_VALUES = "default_values"
 
     def __init__(self, db_schema, cache_service: Optional[CacheService] = None):
         """
@@ -34,16 +39,20 @@ class ConfigurationService(IConfigurationService):
             cache_service: CacheService 인스턴스 (옵션)
         """
         self._db_schema = db_schema
-        self._cache = cache_service or CacheService(max_size=1000, default_ttl=300)
+        # 공유 캐시는 'configuration' 이름 공간으로 사용 (다른 서비스의 clear()와 분리)
+        self._cache = (cache_service or CacheService(max_size=1000, default_ttl=300)).namespace('configuration')
+        # Model → Type → Configuration 계층 스냅샷 (CategoryService와 공유)
+        self._hierarchy = EquipmentHierarchyCache(db_schema, self._cache)
+        self._search = SearchIndex(db_schema)
         self._logging = LoggingService()
         self._logger = self._logging.get_logger(self.__class__.__name__)
 
     @contextmanager
-    def _transaction(self):
-        """트랜잭션 컨텍스트 매니저 (자동 캐시 무효화)"""
+    def _transaction(self, *tags: str):
+        """트랜잭션 컨텍스트 매니저 (자동 캐시 무효화, tags가 있으면 해당 태그만)"""
         try:
             yield
-            self._invalidate_cache()
+            self._invalidate_cache(*tags)
             self._logging.log_service_action(
                 "ConfigurationService",
                 "Transaction completed and cache invalidated"
@@ -56,9 +65,21 @@ class ConfigurationService(IConfigurationService):
             )
             raise
 
-    def _invalidate_cache(self):
-        """모든 캐시 무효화"""
-        self._cache.clear()
+    def _invalidate_cache(self, *tags: str):
+        """
+        캐시 무효화
+
+        태그:
+            'configurations': 구성 목록 (전체 / 타입별 / 고객 목록)
+            'config:{id}': 해당 Configuration 및 그 Default DB Values
+            'default_values': 모든 Default DB Values 목록
+        태그가 없으면 이 서비스의 캐시 전체를 무효화합니다.
+        쓰기 큐 작업 안에서는 그룹 커밋이 끝난 뒤에 무효화합니다.
+        """
+        if tags:
+            after_commit(self._cache.invalidate_tags, *tags)
+        else:
+            after_commit(self._cache.clear)
 
     def _row_to_configuration(self, row) -> EquipmentConfiguration:
         """DB Row를 EquipmentConfiguration 객체로 변환"""
@@ -126,7 +147,7 @@ class ConfigurationService(IConfigurationService):
             """)
 
             configurations = [self._row_to_configuration(row) for row in cursor.fetchall()]
-            self._cache.set(self._CACHE_KEY_ALL_CONFIGS, configurations)
+            self._cache.set(self._CACHE_KEY_ALL_CONFIGS, configurations, tags=[self._CACHE_TAG_CONFIGS])
             return configurations
 
     def get_configurations_by_type(self, type_id: int) -> List[EquipmentConfiguration]:
@@ -154,7 +175,7 @@ class ConfigurationService(IConfigurationService):
             """, (type_id,))
 
             configurations = [self._row_to_configuration(row) for row in cursor.fetchall()]
-            self._cache.set(cache_key, configurations)
+            self._cache.set(cache_key, configurations, tags=[self._CACHE_TAG_CONFIGS, f"type:{type_id}"])
             return configurations
 
     def get_configuration_by_id(self, config_id: int) -> Optional[EquipmentConfiguration]:
@@ -183,7 +204,8 @@ class ConfigurationService(IConfigurationService):
             row = cursor.fetchone()
             if row:
                 configuration = self._row_to_configuration(row)
-                self._cache.set(cache_key, configuration)
+                self._cache.set(cache_key, configuration,
+                                tags=[f"config:{config_id}", f"type:{configuration.type_id}"])
                 return configuration
             return None
 
@@ -238,7 +260,7 @@ class ConfigurationService(IConfigurationService):
         if custom_options:
             custom_options_json = json.dumps(custom_options, ensure_ascii=False)
 
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_CONFIGS):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -252,6 +274,7 @@ class ConfigurationService(IConfigurationService):
                 ))
                 conn.commit()
                 config_id = cursor.lastrowid
+                self._hierarchy.refresh_configuration(config_id)
 
                 self._logging.log_service_action(
                     "ConfigurationService",
@@ -311,7 +334,7 @@ class ConfigurationService(IConfigurationService):
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.append(config_id)
 
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_CONFIGS, f"config:{config_id}"):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
@@ -320,6 +343,7 @@ class ConfigurationService(IConfigurationService):
                     WHERE id = ?
                 """, params)
                 conn.commit()
+                self._hierarchy.refresh_configuration(config_id)
 
                 self._logging.log_service_action(
                     "ConfigurationService",
@@ -329,7 +353,7 @@ class ConfigurationService(IConfigurationService):
 
     def delete_configuration(self, config_id: int) -> bool:
         """장비 구성 삭제 (CASCADE: 관련 Default_DB_Values 삭제)"""
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_CONFIGS, f"config:{config_id}"):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -344,6 +368,7 @@ class ConfigurationService(IConfigurationService):
                     DELETE FROM Equipment_Configurations WHERE id = ?
                 """, (config_id,))
                 conn.commit()
+                self._hierarchy.refresh_configuration(config_id)
 
                 if cursor.rowcount > 0:
                     self._logging.log_service_action(
@@ -361,7 +386,7 @@ class ConfigurationService(IConfigurationService):
         custom_options: Dict[str, Any]
     ) -> bool:
         """커스텀 옵션 JSON 업데이트"""
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_CONFIGS, f"config:{config_id}"):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -370,6 +395,7 @@ class ConfigurationService(IConfigurationService):
                     WHERE id = ?
                 """, (json.dumps(custom_options, ensure_ascii=False), config_id))
                 conn.commit()
+                self._hierarchy.refresh_configuration(config_id)
 
                 self._logging.log_service_action(
                     "ConfigurationService",
@@ -421,7 +447,7 @@ class ConfigurationService(IConfigurationService):
             """)
 
             customers = [row['customer_name'] for row in cursor.fetchall()]
-            self._cache.set(self._CACHE_KEY_CUSTOMERS, customers)
+            self._cache.set(self._CACHE_KEY_CUSTOMERS, customers, tags=[self._CACHE_TAG_CONFIGS])
             return customers
 
     # ==================== Default DB Values ====================
@@ -477,7 +503,7 @@ class ConfigurationService(IConfigurationService):
             values = [self._row_to_default_value(row) for row in cursor.fetchall()]
 
             if include_type_common:
-                self._cache.set(cache_key, values)
+                self._cache.set(cache_key, values, tags=[f"config:{config_id}", self._CACHE_TAG_DEFAULT_VALUES])
             return values
 
     def get_default_value_by_name(
@@ -522,7 +548,7 @@ class ConfigurationService(IConfigurationService):
                 f"Parameter '{parameter_name}' already exists for configuration_id {configuration_id}"
             )
 
-        with self._transaction():
+        with self._transaction(f"config:{configuration_id}"):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -536,6 +562,7 @@ class ConfigurationService(IConfigurationService):
                 ))
                 conn.commit()
                 value_id = cursor.lastrowid
+                self._hierarchy.refresh_value_counts(configuration_id)
 
                 self._logging.log_service_action(
                     "ConfigurationService",
@@ -570,7 +597,7 @@ class ConfigurationService(IConfigurationService):
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.append(value_id)
 
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_DEFAULT_VALUES):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
@@ -580,6 +607,10 @@ class ConfigurationService(IConfigurationService):
                 """, params)
                 conn.commit()
 
+                # Type 공통 개수가 바뀌는 경우만 계층 스냅샷 갱신
+                if is_type_common is not None:
+                    self._refresh_value_counts_of(cursor, value_id)
+
                 self._logging.log_service_action(
                     "ConfigurationService",
                     f"Updated default value ID: {value_id}"
@@ -588,13 +619,17 @@ class ConfigurationService(IConfigurationService):
 
     def delete_default_value(self, value_id: int) -> bool:
         """Default DB Value 삭제"""
-        with self._transaction():
+        with self._transaction(self._CACHE_TAG_DEFAULT_VALUES):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute("SELECT configuration_id FROM Default_DB_Values WHERE id = ?", (value_id,))
+                row = cursor.fetchone()
                 cursor.execute("DELETE FROM Default_DB_Values WHERE id = ?", (value_id,))
                 conn.commit()
 
                 if cursor.rowcount > 0:
+                    if row is not None and row[0] is not None:
+                        self._hierarchy.refresh_value_counts(row[0])
                     self._logging.log_service_action(
                         "ConfigurationService",
                         f"Deleted default value ID: {value_id}"
@@ -607,188 +642,167 @@ class ConfigurationService(IConfigurationService):
         configuration_id: int,
         values: List[Dict[str, Any]]
     ) -> int:
-        """Default DB Values 대량 생성"""
-        created_count = 0
+        """Default DB Values 대량 생성 (이미 있는 파라미터는 건너뜀)"""
+        return len(self.bulk_load_default_values(configuration_id, values)['inserted'])
 
-        with self._transaction():
-            with self._db_schema.get_connection() as conn:
-                cursor = conn.cursor()
+    def bulk_load_default_values(
+        self,
+        configuration_id: int,
+        values: List[Dict[str, Any]]
+    ) -> Dict[str, List[str]]:
+        """
+        Default DB Values 일괄 적재
 
-                for value_data in values:
-                    parameter_name = value_data.get('parameter_name')
-                    default_value = value_data.get('default_value')
-                    is_type_common = value_data.get('is_type_common', False)
-                    notes = value_data.get('notes')
+        행별 존재 확인 없이 임시 테이블에 적재한 뒤 집합 연산으로 처리합니다.
+        - executemany 1회로 임시 테이블 적재
+        - 비교 쿼리 1회로 추가 / 건너뜀 목록 산출
+          (이미 있는 파라미터는 건너뛰고, 같은 목록 안의 중복은 첫 행만 추가)
+        - 같은 조건의 INSERT ... SELECT 1회로 추가
+        - 해당 Configuration의 캐시만 무효화
 
-                    # Skip if parameter already exists
-                    if not self.validate_parameter_name(configuration_id, parameter_name):
-                        continue
+        Returns:
+            {'inserted': [parameter_name, ...], 'skipped': [parameter_name, ...]} (입력 순서)
+        """
+        staged = [
+            (seq, value_data.get('parameter_name'), value_data.get('default_value'),
+             int(bool(value_data.get('is_type_common', False))), value_data.get('notes'))
+            for seq, value_data in enumerate(values)
+        ]
+        result = {'inserted': [], 'skipped': []}
+        if not staged:
+            return result
 
-                    cursor.execute("""
+        try:
+            with self._db_schema.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS _staged_default_values (
+                        seq INTEGER PRIMARY KEY,
+                        parameter_name TEXT,
+                        default_value TEXT,
+                        is_type_common INTEGER,
+                        notes TEXT
+                    )
+                """)
+                cursor.execute("DELETE FROM _staged_default_values")
+                cursor.executemany("""
+                    INSERT INTO _staged_default_values (
+                        seq, parameter_name, default_value, is_type_common, notes
+                    ) VALUES (?, ?, ?, ?, ?)
+                """, staged)
+
+                # 추가 대상: 같은 이름의 첫 행이면서 기존 값이 없는 행
+                staged_rows = """
+                    FROM _staged_default_values s
+                    LEFT JOIN (
+                        SELECT MIN(seq) AS seq FROM _staged_default_values GROUP BY parameter_name
+                    ) f ON f.seq = s.seq
+                    LEFT JOIN Default_DB_Values d
+                        ON d.configuration_id = ? AND d.parameter_name = s.parameter_name
+                """
+                cursor.execute(f"""
+                    SELECT s.parameter_name, (d.id IS NULL AND f.seq IS NOT NULL)
+                    {staged_rows}
+                    ORDER BY s.seq
+                """, (configuration_id,))
+                for parameter_name, is_new in cursor.fetchall():
+                    result['inserted' if is_new else 'skipped'].append(parameter_name)
+
+                if result['inserted']:
+                    cursor.execute(f"""
                         INSERT INTO Default_DB_Values (
                             configuration_id, parameter_name, default_value,
                             is_type_common, notes
-                        ) VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        configuration_id, parameter_name, default_value,
-                        int(is_type_common), notes
-                    ))
-                    created_count += 1
-
+                        )
+                        SELECT ?, s.parameter_name, s.default_value, s.is_type_common, s.notes
+                        {staged_rows}
+                        WHERE d.id IS NULL AND f.seq IS NOT NULL
+                        ORDER BY s.seq
+                    """, (configuration_id, configuration_id))
+
+                cursor.execute("DROP TABLE _staged_default_values")
                 conn.commit()
 
-                self._logging.log_service_action(
-                    "ConfigurationService",
-                    f"Bulk created {created_count} default values for configuration {configuration_id}"
-                )
-                return created_count
-
-    # ==================== Hierarchy Operations ====================
-
-    def get_configuration_hierarchy(self, type_id: int) -> Dict[str, Any]:
-        """특정 Type의 Configuration 계층 구조 조회"""
-        with self._db_schema.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Get Type info
-            cursor.execute("""
-                SELECT
-                    t.id, t.model_id, t.type_name, t.description,
-                    t.is_default, t.created_at, t.updated_at,
-                    m.model_name
-                FROM Equipment_Types t
-                LEFT JOIN Equipment_Models m ON t.model_id = m.id
-                WHERE t.id = ?
-            """, (type_id,))
-            type_row = cursor.fetchone()
-
-            if not type_row:
-                return {}
-
-            from ..interfaces.category_service_interface import EquipmentTypeV2
-            equipment_type = EquipmentTypeV2(
-                id=type_row['id'],
-                model_id=type_row['model_id'],
-                type_name=type_row['type_name'],
-                description=type_row.get('description'),
-                is_default=bool(type_row.get('is_default', False)),
-                created_at=type_row.get('created_at'),
-                updated_at=type_row.get('updated_at'),
-                model_name=type_row.get('model_name')
+        except Exception as e:
+            self._logging.log_error(
+                "ConfigurationService",
+                e,
+                f"Bulk load failed for configuration {configuration_id}"
             )
+            raise
 
-            # Get Configurations
-            configurations = self.get_configurations_by_type(type_id)
-            config_details = []
-
-            for config in configurations:
-                # Get default value counts
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_count,
-                        SUM(CASE WHEN is_type_common = 1 THEN 1 ELSE 0 END) as type_common_count
-                    FROM Default_DB_Values
-                    WHERE configuration_id = ?
-                """, (config.id,))
-                counts = cursor.fetchone()
-
-                total_count = counts['total_count'] or 0
-                type_common_count = counts['type_common_count'] or 0
-                config_specific_count = total_count - type_common_count
-
-                config_details.append({
-                    'configuration': config,
-                    'default_value_count': total_count,
-                    'type_common_count': type_common_count,
-                    'config_specific_count': config_specific_count
-                })
-
-            return {
-                'type': equipment_type,
-                'configurations': config_details
-            }
-
-    def get_full_hierarchy(self) -> List[Dict[str, Any]]:
-        """전체 Equipment Hierarchy 조회 (Model → Type → Configuration)"""
-        with self._db_schema.get_connection() as conn:
-            cursor = conn.cursor()
+        if result['inserted']:
+            self._invalidate_cache(f"config:{configuration_id}")
+            self._hierarchy.refresh_value_counts(configuration_id)
 
-            # Get all Models
-            cursor.execute("""
-                SELECT id, model_name, model_code, description, display_order,
-                       created_at, updated_at
-                FROM Equipment_Models
-                ORDER BY display_order, model_name
-            """)
+        self._logging.log_service_action(
+            "ConfigurationService",
+            f"Bulk created {len(result['inserted'])} default values for configuration {configuration_id} "
+            f"(skipped {len(result['skipped'])})"
+        )
+        return result
 
-            from ..interfaces.category_service_interface import EquipmentModel, EquipmentTypeV2
+    # ==================== Hierarchy Operations ====================
 
-            hierarchy = []
+    def _refresh_value_counts_of(self, cursor, value_id: int):
+        """Default DB Value가 속한 Configuration의 계층 스냅샷 개수 갱신"""
+        cursor.execute("SELECT configuration_id FROM Default_DB_Values WHERE id = ?", (value_id,))
+        row = cursor.fetchone()
+        if row is not None and row[0] is not None:
+            self._hierarchy.refresh_value_counts(row[0])
 
-            for model_row in cursor.fetchall():
-                model = EquipmentModel(
-                    id=model_row['id'],
-                    model_name=model_row['model_name'],
-                    model_code=model_row.get('model_code'),
-                    description=model_row.get('description'),
-                    display_order=model_row.get('display_order', 0),
-                    created_at=model_row.get('created_at'),
-                    updated_at=model_row.get('updated_at')
-                )
+    def get_configuration_hierarchy(self, type_id: int) -> Dict[str, Any]:
+        """특정 Type의 Configuration 계층 구조 조회 (계층 스냅샷에서 조립)"""
+        snapshot = self._hierarchy.snapshot()
+        equipment_type = snapshot.types.get(type_id)
+        if equipment_type is None:
+            return {}
+
+        config_details = []
+        for config in snapshot.configurations_of(type_id):
+            total_count, type_common_count = snapshot.value_count(config.id)
+            config_details.append({
+                'configuration': config,
+                'default_value_count': total_count,
+                'type_common_count': type_common_count,
+                'config_specific_count': total_count - type_common_count
+            })
+
+        return {
+            'type': equipment_type,
+            'configurations': config_details
+        }
 
-                # Get Types for this Model
-                cursor.execute("""
-                    SELECT id, model_id, type_name, description, is_default,
-                           created_at, updated_at
-                    FROM Equipment_Types
-                    WHERE model_id = ?
-                    ORDER BY type_name
-                """, (model.id,))
-
-                type_details = []
-
-                for type_row in cursor.fetchall():
-                    equipment_type = EquipmentTypeV2(
-                        id=type_row['id'],
-                        model_id=type_row['model_id'],
-                        type_name=type_row['type_name'],
-                        description=type_row.get('description'),
-                        is_default=bool(type_row.get('is_default', False)),
-                        created_at=type_row.get('created_at'),
-                        updated_at=type_row.get('updated_at'),
-                        model_name=model.model_name
-                    )
+    def get_full_hierarchy(self) -> List[Dict[str, Any]]:
+        """
+        전체 Equipment Hierarchy 조회 (Model → Type → Configuration)
 
-                    # Get Configurations for this Type
-                    configurations = self.get_configurations_by_type(equipment_type.id)
-                    config_details = []
-
-                    for config in configurations:
-                        # Get default value count
-                        cursor.execute("""
-                            SELECT COUNT(*) as count
-                            FROM Default_DB_Values
-                            WHERE configuration_id = ?
-                        """, (config.id,))
-                        count_row = cursor.fetchone()
-                        default_value_count = count_row['count'] if count_row else 0
-
-                        config_details.append({
-                            'configuration': config,
-                            'default_value_count': default_value_count
-                        })
-
-                    type_details.append({
+        계층 스냅샷(고정 쿼리 4회, 캐시)에서 메모리로 조립합니다.
+        노드 변경 시 스냅샷은 해당 노드만 다시 읽어 갱신됩니다.
+        """
+        snapshot = self._hierarchy.snapshot()
+        types_by_model = snapshot.types_by_model()
+        configurations_by_type = snapshot.configurations_by_type()
+
+        return [
+            {
+                'model': model,
+                'types': [
+                    {
                         'type': equipment_type,
-                        'configurations': config_details
-                    })
-
-                hierarchy.append({
-                    'model': model,
-                    'types': type_details
-                })
-
-            return hierarchy
+                        'configurations': [
+                            {
+                                'configuration': config,
+                                'default_value_count': snapshot.value_count(config.id)[0]
+                            }
+                            for config in configurations_by_type.get(equipment_type.id, [])
+                        ]
+                    }
+                    for equipment_type in types_by_model.get(model.id, [])
+                ]
+            }
+            for model in snapshot.sorted_models()
+        ]
 
     # ==================== Validation ====================
 
@@ -812,13 +826,15 @@ class ConfigurationService(IConfigurationService):
 
     # ==================== Search ====================
 
-    def search_configurations(self, query: str) -> List[EquipmentConfiguration]:
-        """Configuration 검색 (이름, 고객명, 설명)"""
+    def search_configurations(self, query: str, limit: int = 200) -> List[EquipmentConfiguration]:
+        """
+        Configuration 검색 (이름, 고객명, 설명)
+
+        FTS5 색인이 있으면 단어 접두어 검색 + 관련도 순, 없으면 LIKE 검색입니다.
+        """
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
-            search_pattern = f"%{query}%"
-
-            cursor.execute("""
+            columns = """
                 SELECT
                     c.id, c.type_id, c.configuration_name,
                     c.port_count, c.wafer_count, c.custom_options,
@@ -826,24 +842,48 @@ class ConfigurationService(IConfigurationService):
                     c.description, c.created_at, c.updated_at,
                     t.type_name,
                     m.model_name
-                FROM Equipment_Configurations c
+            """
+            joins = """
                 LEFT JOIN Equipment_Types t ON c.type_id = t.id
                 LEFT JOIN Equipment_Models m ON t.model_id = m.id
-                WHERE c.configuration_name LIKE ?
-                   OR c.customer_name LIKE ?
-                   OR c.description LIKE ?
-                ORDER BY m.display_order, t.type_name, c.configuration_name
-            """, (search_pattern, search_pattern, search_pattern))
+            """
+
+            fts = self._search.table_for(conn, 'Equipment_Configurations')
+            expression = match_expression(query)
+            if fts and expression:
+                cursor.execute(f"""
+                    {columns}
+                    FROM {fts} f
+                    JOIN Equipment_Configurations c ON c.id = f.rowid
+                    {joins}
+                    WHERE {fts} MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                """, (expression, limit))
+            else:
+                search_pattern = f"%{query}%"
+                cursor.execute(f"""
+                    {columns}
+                    FROM Equipment_Configurations c
+                    {joins}
+                    WHERE c.configuration_name LIKE ?
+                       OR c.customer_name LIKE ?
+                       OR c.description LIKE ?
+                    ORDER BY m.display_order, t.type_name, c.configuration_name
+                    LIMIT ?
+                """, (search_pattern, search_pattern, search_pattern, limit))
 
             return [self._row_to_configuration(row) for row in cursor.fetchall()]
 
-    def search_default_values(self, query: str) -> List[DefaultDBValue]:
-        """Default DB Value 검색 (파라미터 이름, 값, 비고)"""
+    def search_default_values(self, query: str, limit: int = 500) -> List[DefaultDBValue]:
+        """
+        Default DB Value 검색 (파라미터 이름, 값, 비고)
+
+        FTS5 색인이 있으면 단어 접두어 검색 + 관련도 순, 없으면 LIKE 검색입니다.
+        """
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
-            search_pattern = f"%{query}%"
-
-            cursor.execute("""
+            columns = """
                 SELECT
                     d.id, d.configuration_id, d.parameter_name,
                     d.default_value, d.is_type_common, d.notes,
@@ -851,14 +891,36 @@ class ConfigurationService(IConfigurationService):
                     c.configuration_name,
                     t.type_name,
                     m.model_name
-                FROM Default_DB_Values d
+            """
+            joins = """
                 LEFT JOIN Equipment_Configurations c ON d.configuration_id = c.id
                 LEFT JOIN Equipment_Types t ON c.type_id = t.id
                 LEFT JOIN Equipment_Models m ON t.model_id = m.id
-                WHERE d.parameter_name LIKE ?
-                   OR d.default_value LIKE ?
-                   OR d.notes LIKE ?
-                ORDER BY m.display_order, t.type_name, c.configuration_name, d.parameter_name
-            """, (search_pattern, search_pattern, search_pattern))
+            """
+
+            fts = self._search.table_for(conn, 'Default_DB_Values')
+            expression = match_expression(query)
+            if fts and expression:
+                cursor.execute(f"""
+                    {columns}
+                    FROM {fts} f
+                    JOIN Default_DB_Values d ON d.id = f.rowid
+                    {joins}
+                    WHERE {fts} MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                """, (expression, limit))
+            else:
+                search_pattern = f"%{query}%"
+                cursor.execute(f"""
+                    {columns}
+                    FROM Default_DB_Values d
+                    {joins}
+                    WHERE d.parameter_name LIKE ?
+                       OR d.default_value LIKE ?
+                       OR d.notes LIKE ?
+                    ORDER BY m.display_order, t.type_name, c.configuration_name, d.parameter_name
+                    LIMIT ?
+                """, (search_pattern, search_pattern, search_pattern, limit))
 
             return [self._row_to_default_value(row) for row in cursor.fetchall()]
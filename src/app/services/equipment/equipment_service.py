@@ -12,6 +12,7 @@ from contextlib import contextmanager
 from ..interfaces.equipment_service_interface import IEquipmentService, EquipmentType
 from ..common.cache_service import CacheService
 from ..common.logging_service import LoggingService
+from ..common.write_queue import after_commit
 
 class EquipmentService(IEquipmentService):
     """장비 관리 서비스 구현체"""
@@ -25,13 +26,15 @@ class EquipmentService(IEquipmentService):
             cache_service: 캐시 서비스 (선택사항)
         """
         self._db_schema = db_schema
-        self._cache = cache_service or CacheService(max_size=500, default_ttl=300)  # 5분 TTL
+        # 공유 캐시는 'equipment' 이름 공간으로 사용 (다른 서비스의 clear()와 분리)
+        self._cache = (cache_service or CacheService(max_size=500, default_ttl=300)).namespace('equipment')  # 5분 TTL
         self._logging = LoggingService()
         self._logger = self._logging.get_logger(self.__class__.__name__)
         
         # 캐시 키 상수
         self._CACHE_KEY_ALL_TYPES = "equipment_types_all"
         self._CACHE_KEY_TYPE_PREFIX = "equipment_type_"
+        self._CACHE_TAG_TYPES = "equipment_types"
     
     @contextmanager
     def _transaction(self):
@@ -45,15 +48,14 @@ class EquipmentService(IEquipmentService):
             raise
     
     def _invalidate_cache(self, type_id: Optional[int] = None):
-        """캐시 무효화"""
+        """캐시 무효화 (쓰기 큐 작업 안에서는 그룹 커밋 후)"""
         if type_id:
-            # 특정 장비 유형 캐시만 무효화
-            self._cache.delete(f"{self._CACHE_KEY_TYPE_PREFIX}{type_id}")
+            # 해당 장비 유형에 의존하는 캐시 무효화 (다른 서비스 항목 포함)
+            after_commit(self._cache.invalidate_tags, f"type:{type_id}")
+            after_commit(self._cache.delete, self._CACHE_KEY_ALL_TYPES)
         else:
-            # 전체 캐시 무효화
-            self._cache.delete(self._CACHE_KEY_ALL_TYPES)
-            # 개별 장비 유형 캐시들도 정리 (간단한 방법)
-            self._cache.cleanup_expired()
+            # 장비 유형 목록 / 개별 장비 유형 캐시 무효화
+            after_commit(self._cache.invalidate_tags, self._CACHE_TAG_TYPES)
     
     def get_all_equipment_types(self) -> List[EquipmentType]:
         """
@@ -80,7 +82,7 @@ class EquipmentService(IEquipmentService):
             ]
             
             # 결과 캐싱
-            self._cache.set(self._CACHE_KEY_ALL_TYPES, equipment_types)
+            self._cache.set(self._CACHE_KEY_ALL_TYPES, equipment_types, tags=[self._CACHE_TAG_TYPES])
             
             self._logging.log_service_action(
                 "EquipmentService", 
@@ -119,7 +121,7 @@ class EquipmentService(IEquipmentService):
         for equipment_type in all_types:
             if equipment_type.id == type_id:
                 # 개별 캐시에도 저장
-                self._cache.set(cache_key, equipment_type)
+                self._cache.set(cache_key, equipment_type, tags=[self._CACHE_TAG_TYPES, f"type:{type_id}"])
                 return equipment_type
         
         self._logger.debug(f"장비 유형을 찾을 수 없음: ID {type_id}")
@@ -114,7 +114,8 @@ class IChecklistService(ABC):
     @abstractmethod
     def validate_parameter_against_checklist(self, equipment_type_id: int,
                                             parameter_name: str,
-                                            parameter_value: str) -> Dict:
+                                            parameter_value: str,
+                                            numeric_value: Optional[float] = None) -> Dict:
         """
         파라미터가 Check list에 포함되는지 검증
 
@@ -122,6 +123,7 @@ class IChecklistService(ABC):
             equipment_type_id: 장비 유형 ID
             parameter_name: 파라미터 이름
             parameter_value: 파라미터 값
+            numeric_value: 미리 변환된 숫자 값 (Typed Shadow, 없으면 직접 변환)
 
         Returns:
             {
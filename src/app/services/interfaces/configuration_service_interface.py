@@ -274,6 +274,24 @@ class IConfigurationService(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_load_default_values(
+        self,
+        configuration_id: int,
+        values: List[Dict[str, Any]]
+    ) -> Dict[str, List[str]]:
+        """
+        Default DB Values 일괄 적재 (집합 연산, 행별 존재 확인 없음)
+
+        Args:
+            configuration_id: Configuration ID
+            values: 파라미터 목록 (bulk_create_default_values와 같은 형식)
+
+        Returns:
+            {'inserted': [parameter_name, ...], 'skipped': [parameter_name, ...]}
+        """
+        pass
+
     # ==================== Hierarchy Operations ====================
 
     @abstractmethod
@@ -360,11 +378,11 @@ class IConfigurationService(ABC):
     # ==================== Search ====================
 
     @abstractmethod
-    def search_configurations(self, query: str) -> List[EquipmentConfiguration]:
+    def search_configurations(self, query: str, limit: int = 200) -> List[EquipmentConfiguration]:
         """Configuration 검색 (이름, 고객명, 설명)"""
         pass
 
     @abstractmethod
-    def search_default_values(self, query: str) -> List[DefaultDBValue]:
+    def search_default_values(self, query: str, limit: int = 500) -> List[DefaultDBValue]:
         """Default DB Value 검색 (파라미터 이름, 값, 비고)"""
         pass
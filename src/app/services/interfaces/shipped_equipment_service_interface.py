@@ -7,10 +7,14 @@ Shipped Equipment Service 인터페이스 (Phase 2)
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import date
 
+if TYPE_CHECKING:
+    # 타입 힌트 전용 (NumPy는 구현체에서 매트릭스를 만들 때 로드)
+    from app.services.shipped_equipment.parameter_matrix import ParameterMatrix
+
 
 @dataclass
 class ShippedEquipment:
@@ -35,7 +39,7 @@ class ShippedEquipment:
 @dataclass
 class ShippedEquipmentParameter:
     """출고 장비 파라미터 데이터 클래스"""
-    id: int
+    id: Optional[int]  # 차분 저장소에서 기준값(Default DB)으로 재구성된 행은 None
     shipped_equipment_id: int
     parameter_name: str
     parameter_value: str
@@ -95,6 +99,51 @@ class IShippedEquipmentService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_shipped_equipment_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 200,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search_text: Optional[str] = None
+    ) -> List[ShippedEquipment]:
+        """
+        출고 장비 한 페이지 조회 (keyset 페이지네이션, 출고일 최신순)
+
+        Args:
+            after_id: 이전 페이지 마지막 장비 ID (None이면 첫 페이지)
+            limit: 페이지 크기
+            configuration_id: Configuration ID 필터
+            customer_name: 고객명 필터 (정확히 일치)
+            start_date: 출고일 시작 (이상)
+            end_date: 출고일 종료 (이하)
+            search_text: Serial / Customer / Model / Type / Configuration 부분 일치
+
+        Returns:
+            List[ShippedEquipment]: 최대 limit개
+        """
+        pass
+
+    @abstractmethod
+    def count_shipped_equipment(
+        self,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search_text: Optional[str] = None
+    ) -> int:
+        """출고 장비 개수 (get_shipped_equipment_page와 같은 조건)"""
+        pass
+
+    @abstractmethod
+    def get_customer_names(self) -> List[str]:
+        """출고 장비 고객명 목록 (필터용)"""
+        pass
+
     @abstractmethod
     def get_shipped_equipment_by_id(self, equipment_id: int) -> Optional[ShippedEquipment]:
         """특정 출고 장비 조회"""
@@ -182,6 +231,33 @@ class IShippedEquipmentService(ABC):
         """특정 출고 장비의 모든 파라미터 조회"""
         pass
 
+    @abstractmethod
+    def get_parameters_page(
+        self,
+        equipment_id: int,
+        after_name: Optional[str] = None,
+        limit: int = 500,
+        search_text: Optional[str] = None
+    ) -> List[ShippedEquipmentParameter]:
+        """
+        출고 장비 파라미터 한 페이지 조회 (keyset 페이지네이션, 이름 순)
+
+        Args:
+            equipment_id: 장비 ID
+            after_name: 이전 페이지 마지막 파라미터 이름 (None이면 첫 페이지)
+            limit: 페이지 크기
+            search_text: 이름 / 값 / 모듈 / 파트 부분 일치
+
+        Returns:
+            List[ShippedEquipmentParameter]: 최대 limit개
+        """
+        pass
+
+    @abstractmethod
+    def count_parameters(self, equipment_id: int, search_text: Optional[str] = None) -> int:
+        """출고 장비 파라미터 개수 (get_parameters_page와 같은 조건)"""
+        pass
+
     @abstractmethod
     def add_parameters_bulk(
         self,
@@ -280,6 +356,63 @@ class IShippedEquipmentService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_parameter_deviations(
+        self,
+        parameter_name: str,
+        configuration_id: Optional[int] = None
+    ) -> List[Tuple[str, Optional[str], str]]:
+        """
+        특정 파라미터가 기준값(Default DB)과 다른 출고 장비 조회
+
+        차분 저장소에서는 임포트 시점 기준값 스냅샷과 비교하며 저장된 차이만 인덱스로 읽습니다.
+        그 외에는 현재 Default_DB_Values와 비교합니다.
+
+        Args:
+            parameter_name: 파라미터 이름
+            configuration_id: Configuration ID 필터 (선택)
+
+        Returns:
+            [(serial, 출고 값 (없으면 None), 기준값), ...] (Serial 순)
+        """
+        pass
+
+    @abstractmethod
+    def get_parameter_matrix(
+        self,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        parameter_names: Optional[List[str]] = None,
+        chunk_size: int = 500
+    ) -> 'ParameterMatrix':
+        """
+        출고 장비 × 파라미터 매트릭스 (fleet 비교용)
+
+        Args:
+            configuration_id: Configuration ID 필터
+            customer_name: 고객명 필터 (정확히 일치)
+            parameter_names: 포함할 파라미터 이름 (None이면 전체)
+            chunk_size: 한 번에 읽을 장비 수
+
+        Returns:
+            ParameterMatrix: Serial × Parameter 값 행렬 (drift / outlier 표시 지원)
+        """
+        pass
+
+    @abstractmethod
+    def search_parameter_names(self, query: str, limit: int = 50) -> List[Tuple[str, int]]:
+        """
+        출고 파라미터 이름 검색 (단어 접두어 검색, 관련도 순)
+
+        Args:
+            query: 검색어 (예: "temp set" → Temp_Setpoint, Temp_Setpoint_Max ...)
+            limit: 최대 결과 수
+
+        Returns:
+            [(parameter_name, 출고 장비 사용 횟수), ...]
+        """
+        pass
+
     # ==================== Auto Matching ====================
 
     @abstractmethod
@@ -7,12 +7,44 @@ import json
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+
 class QCSpecService:
     """QC Spec 중앙 관리 서비스"""
     
     def __init__(self, db_schema):
         self.db_schema = db_schema
         self.spec_cache = {}
+        # warm_cache() 후: 활성 스펙 전체가 spec_cache에 있음 + 컴파일된 규칙 집합
+        self._all_specs_loaded = False
+        self._compiled_rules = None
+        
+    def warm_cache(self) -> int:
+        """
+        활성 스펙 전체를 한 번에 읽고 규칙을 미리 컴파일
+        
+        이후 검수는 스펙 조회(없는 항목 포함) 없이 캐시만 사용하고 규칙도 다시 컴파일하지 않습니다.
+        여러 요청이 한 서비스 객체를 공유하는 서비스 모드(app.server)에서 사용.
+        스펙을 추가 / 수정 / 삭제하면 캐시가 비워지므로 다시 호출해야 합니다.
+        
+        Returns:
+            캐시된 스펙 수
+        """
+        from app.qc.qc_kernel import compile_rules
+
+        specs = self.get_all_specs()
+        spec_cache = {spec['item_name']: spec for spec in specs}
+        compiled = compile_rules([self._compile_spec_rule(spec) for spec in spec_cache.values()])
+        # 다른 스레드가 검수 중이어도 한 번에 교체
+        self.spec_cache = spec_cache
+        self._compiled_rules = compiled
+        self._all_specs_loaded = True
+        return len(spec_cache)
+    
+    def invalidate_cache(self):
+        """스펙 캐시 / 컴파일된 규칙 비우기"""
+        self._all_specs_loaded = False
+        self._compiled_rules = None
+        self.spec_cache = {}
         
     def add_spec(self, item_name: str, min_spec: Optional[str] = None,
                  max_spec: Optional[str] = None, expected_value: Optional[str] = None,
@@ -48,7 +80,7 @@ class QCSpecService:
                 (item_name, min_spec, max_spec, expected_value, check_type, category, severity)
             )
             # 캐시 무효화
-            self.spec_cache.clear()
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"QC Spec 추가 오류: {e}")
@@ -102,6 +134,8 @@ class QCSpecService:
         # 캐시 확인
         if item_name in self.spec_cache:
             return self.spec_cache[item_name]
+        if self._all_specs_loaded:
+            return None
             
         query = """
         SELECT id, min_spec, max_spec, expected_value, check_type, 
@@ -157,8 +191,7 @@ class QCSpecService:
         try:
             self.db_schema.execute_update(query, values)
             # 캐시 무효화
-            if item_name in self.spec_cache:
-                del self.spec_cache[item_name]
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"스펙 업데이트 오류: {e}")
@@ -175,8 +208,7 @@ class QCSpecService:
         try:
             self.db_schema.execute_update(query, (item_name,))
             # 캐시 무효화
-            if item_name in self.spec_cache:
-                del self.spec_cache[item_name]
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"스펙 삭제 오류: {e}")
@@ -287,49 +319,70 @@ class QCSpecService:
         
         # 오버라이드 확인 (TODO: 구현 필요)
         
-        # 값 검증
-        passed = False
-        message = ''
+        # 값 검증 (공통 QC 커널)
+        return self._evaluate_specs([spec], [value])[0]
+    
+    def _compile_spec_rule(self, spec: Dict):
+        """스펙 → QC 커널 규칙 (boolean은 항상 TRUE 기대)"""
+        from app.qc.qc_kernel import rule_from_spec, KIND_BOOLEAN
+
+        rule = rule_from_spec(spec['item_name'], spec)
+        if rule.kind == KIND_BOOLEAN:
+            rule.expected = '1'
+        return rule
+    
+    def _evaluate_specs(self, specs: List[Dict], values: List) -> List[Dict]:
+        """
+        스펙/값 목록을 공통 QC 커널로 일괄 검증
+        
+        Returns:
+            check_value()와 동일한 형식의 결과 목록
+        """
+        # QC 커널(numpy)은 검수 시점에 로드
+        from app.qc.qc_kernel import compile_rules, evaluate, evaluate_aligned, STATUS_NOT_NUMERIC
+
+        compiled = self._compiled_rules
+        if compiled is not None:
+            # warm_cache()로 컴파일한 규칙을 항목 이름으로 적용
+            evaluation = evaluate([spec['item_name'] for spec in specs], values, compiled)
+        else:
+            rules = compile_rules([self._compile_spec_rule(spec) for spec in specs])
+            evaluation = evaluate_aligned(values, rules)
         
-        if spec['check_type'] == 'range':
-            try:
-                val = float(value)
-                min_val = float(spec['min_spec']) if spec['min_spec'] else float('-inf')
-                max_val = float(spec['max_spec']) if spec['max_spec'] else float('inf')
-                passed = min_val <= val <= max_val
+        checked = []
+        for i, (spec, value) in enumerate(zip(specs, values)):
+            passed = bool(evaluation.is_valid[i])
+            message = ''
+            check_type = spec['check_type']
+            
+            if check_type == 'range':
                 spec_str = f"{spec['min_spec'] or '-∞'} ~ {spec['max_spec'] or '+∞'}"
-                if not passed:
+                if evaluation.status[i] == STATUS_NOT_NUMERIC:
+                    message = f"Cannot convert '{value}' to number"
+                    spec_str = f"{spec['min_spec']} ~ {spec['max_spec']}"
+                elif not passed:
                     message = f"Value {value} is out of range {spec_str}"
-            except ValueError:
-                message = f"Cannot convert '{value}' to number"
-                spec_str = f"{spec['min_spec']} ~ {spec['max_spec']}"
-                
-        elif spec['check_type'] == 'exact':
-            expected = spec['expected_value']
-            passed = str(value).upper() == str(expected).upper()
-            spec_str = expected
-            if not passed:
-                message = f"Expected '{expected}', got '{value}'"
-                
-        elif spec['check_type'] == 'boolean':
-            expected = spec['expected_value']
-            passed = str(value) in ['1', 'true', 'True', 'TRUE', 'ON', 'on']
-            spec_str = 'Boolean'
-            if not passed:
-                message = f"Expected boolean true, got '{value}'"
-                
-        else:  # exists
-            passed = value is not None and str(value).strip() != ''
-            spec_str = 'Exists'
-            if not passed:
-                message = "Value is missing or empty"
+            elif check_type == 'exact':
+                spec_str = spec['expected_value']
+                if not passed:
+                    message = f"Expected '{spec['expected_value']}', got '{value}'"
+            elif check_type == 'boolean':
+                spec_str = 'Boolean'
+                if not passed:
+                    message = f"Expected boolean true, got '{value}'"
+            else:  # exists
+                spec_str = 'Exists'
+                if not passed:
+                    message = "Value is missing or empty"
+            
+            checked.append({
+                'pass': passed,
+                'spec': spec_str,
+                'message': message or 'OK',
+                'severity': spec['severity']
+            })
         
-        return {
-            'pass': passed,
-            'spec': spec_str,
-            'message': message or 'OK',
-            'severity': spec['severity']
-        }
+        return checked
     
     def perform_qc_inspection(self, file_data: Dict, 
                              configuration_id: Optional[int] = None) -> Dict:
@@ -362,22 +415,45 @@ class QCSpecService:
             'LOW': {'passed': 0, 'failed': 0}
         }
         
+        # 스펙 매칭 및 예외 목록은 한 번만 조회
+        excepted_ids = set()
+        if configuration_id:
+            excepted_ids = {
+                e['spec_master_id']
+                for e in self.get_exceptions(configuration_id=configuration_id)
+            }
+        
+        matched = []
         for item_name, value in file_data.items():
             # QC 스펙 확인
             spec = self.get_spec_by_item_name(item_name)
             if not spec:
                 continue
-                
-            matched_count += 1
-            
-            # 값 검증
-            check_result = self.check_value(item_name, value, configuration_id)
+            matched.append((item_name, value, spec))
+        matched_count = len(matched)
+        
+        # 예외 항목은 검증 없이 통과 처리
+        evaluated = [(n, v, s) for n, v, s in matched if s['id'] not in excepted_ids]
+        checks = dict(zip(
+            (n for n, _, _ in evaluated),
+            self._evaluate_specs([s for _, _, s in evaluated], [v for _, v, _ in evaluated])
+        ))
+        
+        for item_name, value, spec in matched:
+            check_result = checks.get(item_name) or {
+                'pass': True,
+                'spec': 'Excepted',
+                'message': 'This item is excepted for this configuration',
+                'severity': 'INFO'
+            }
             
             if check_result['pass']:
                 passed_count += 1
+                severity_counts.setdefault(check_result['severity'], {'passed': 0, 'failed': 0})
                 severity_counts[check_result['severity']]['passed'] += 1
             else:
                 failed_count += 1
+                severity_counts.setdefault(check_result['severity'], {'passed': 0, 'failed': 0})
                 severity_counts[check_result['severity']]['failed'] += 1
                 
             results.append({
@@ -4,9 +4,16 @@ QC 검증 서비스
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from app.qc.qc_kernel import (
+    compile_rules, evaluate_aligned, rule_from_spec,
+    STATUS_BELOW_MIN, STATUS_ABOVE_MAX, STATUS_NOT_NUMERIC,
+    STATUS_MISMATCH, STATUS_PATTERN_MISMATCH, STATUS_RULE_ERROR,
+    KIND_BOOLEAN, KIND_ANY
+)
+
 class QCValidator:
     """QC 검증 서비스"""
     
@@ -117,7 +124,8 @@ class QCValidator:
         # 카테고리별 결과 집계
         category_results = {}
         
-        # 각 파라미터 검증
+        # 1. 각 파라미터의 Spec 결정 (제외/미정의 항목은 skipped)
+        targets = []
         for item_name, value in parameters.items():
             # Spec 찾기
             spec = self.find_spec(item_name, master_specs, overrides)
@@ -139,8 +147,15 @@ class QCValidator:
                 })
                 continue
             
-            # 검증 수행
-            is_valid, message = self.check_value(value, spec)
+            targets.append((item_name, value, spec))
+        
+        # 2. 공통 QC 커널로 일괄 검증
+        rules = compile_rules([rule_from_spec(item_name, spec) for item_name, _, spec in targets])
+        evaluation = evaluate_aligned([value for _, value, _ in targets], rules)
+        
+        for i, (item_name, value, spec) in enumerate(targets):
+            is_valid = bool(evaluation.is_valid[i])
+            message = self._status_message(evaluation, rules, i, value)
             
             # 카테고리별 집계
             category = spec.get('category', 'General')
@@ -248,71 +263,34 @@ class QCValidator:
         Returns:
             (검증 결과, 메시지)
         """
-        check_type = spec.get('check_type', 'range')
+        rules = compile_rules([rule_from_spec('', spec)])
+        evaluation = evaluate_aligned([value], rules)
+        return bool(evaluation.is_valid[0]), self._status_message(evaluation, rules, 0, value)
+    
+    def _status_message(self, evaluation, rules, i: int, value: Any) -> str:
+        """커널 결과 상태 코드 → 메시지"""
+        status = evaluation.status[i]
+        rule = evaluation.rule_index[i]
         
-        try:
-            if check_type == 'range':
-                # 범위 검증
-                val = float(value)
-                min_spec = float(spec['min_spec']) if spec.get('min_spec') else None
-                max_spec = float(spec['max_spec']) if spec.get('max_spec') else None
-                
-                if min_spec is not None and val < min_spec:
-                    return False, f"값 {val}이(가) 최소값 {min_spec}보다 작음"
-                if max_spec is not None and val > max_spec:
-                    return False, f"값 {val}이(가) 최대값 {max_spec}보다 큼"
-                return True, "OK"
-                
-            elif check_type == 'exact':
-                # 정확한 값 비교
-                expected = str(spec.get('expected_value', '')).upper()
-                actual = str(value).upper()
-                
-                if actual == expected:
-                    return True, "OK"
-                else:
-                    return False, f"기대값 {expected}, 실제값 {actual}"
-                    
-            elif check_type == 'boolean':
-                # Boolean 검증
-                value_str = str(value).upper()
-                expected = str(spec.get('expected_value', '1')).upper()
-                
-                true_values = ['1', 'ON', 'TRUE', 'ENABLE', 'ENABLED', 'YES']
-                false_values = ['0', 'OFF', 'FALSE', 'DISABLE', 'DISABLED', 'NO']
-                
-                if expected in true_values:
-                    if value_str in true_values:
-                        return True, "OK"
-                    else:
-                        return False, f"기대값 ON, 실제값 {value}"
-                        
-                elif expected in false_values:
-                    if value_str in false_values:
-                        return True, "OK"
-                    else:
-                        return False, f"기대값 OFF, 실제값 {value}"
-                        
-                else:
-                    if value_str == expected:
-                        return True, "OK"
-                    else:
-                        return False, f"기대값 {expected}, 실제값 {value}"
-                        
-            elif check_type == 'pattern':
-                # 정규식 패턴 매칭
-                pattern = spec.get('expected_value', '')
-                if re.match(pattern, str(value)):
-                    return True, "OK"
-                else:
-                    return False, f"패턴 {pattern}과 불일치"
-                    
-            else:
-                # 알 수 없는 타입
-                return True, "검증 타입 미지정"
-                
-        except Exception as e:
-            return False, f"검증 오류: {str(e)}"
+        if status == STATUS_BELOW_MIN:
+            return f"값 {evaluation.numeric[i]}이(가) 최소값 {rules.min_values[rule]}보다 작음"
+        if status == STATUS_ABOVE_MAX:
+            return f"값 {evaluation.numeric[i]}이(가) 최대값 {rules.max_values[rule]}보다 큼"
+        if status == STATUS_NOT_NUMERIC:
+            return f"검증 오류: 숫자로 변환할 수 없는 값 '{value}'"
+        if status == STATUS_MISMATCH:
+            if rules.kinds[rule] == KIND_BOOLEAN and rules.bool_polarity[rule] == 1:
+                return f"기대값 ON, 실제값 {value}"
+            if rules.kinds[rule] == KIND_BOOLEAN and rules.bool_polarity[rule] == 0:
+                return f"기대값 OFF, 실제값 {value}"
+            return f"기대값 {rules.expected_upper[rule]}, 실제값 {str(value).upper()}"
+        if status == STATUS_PATTERN_MISMATCH:
+            return f"패턴 {rules.patterns[rule].pattern}과 불일치"
+        if status == STATUS_RULE_ERROR:
+            return "검증 오류: 잘못된 패턴"
+        if rules.kinds[rule] == KIND_ANY:
+            return "검증 타입 미지정"
+        return "OK"
     
     def format_spec_display(self, spec: Dict) -> str:
         """Spec을 표시용 문자열로 포맷"""
@@ -7,10 +7,12 @@
 
 from typing import Optional, Dict, Any
 import logging
+import os
 
 from .common.service_registry import ServiceRegistry
 from .common.cache_service import CacheService
 from .common.logging_service import LoggingService
+from .common.write_queue import DatabaseWriter
 
 # 인터페이스들
 from .interfaces.equipment_service_interface import IEquipmentService, IParameterService
@@ -57,7 +59,8 @@ class ServiceFactory:
         cache_config = self._config.get('cache', {})
         cache_service = CacheService(
             max_size=cache_config.get('max_size', 1000),
-            default_ttl=cache_config.get('default_ttl', 300)
+            default_ttl=cache_config.get('default_ttl', 300),
+            max_bytes=cache_config.get('max_bytes', 64 * 1024 * 1024)
         )
         
         # 공통 서비스들 등록
@@ -187,6 +190,30 @@ class ServiceFactory:
         """로깅 서비스 조회"""
         return self._registry.get_service(LoggingService)
     
+    def get_write_queue(self) -> Optional[DatabaseWriter]:
+        """
+        백그라운드 쓰기 큐 조회 (처음 호출 시 쓰기 스레드 시작)
+
+        DB 스키마가 없으면 None
+        """
+        if not self._db_schema:
+            return None
+        # 레지스트리는 프로세스 전역이므로 같은 DB의 살아 있는 쓰기 큐만 재사용
+        if self._registry.is_registered(DatabaseWriter):
+            writer = self._registry.get_service(DatabaseWriter)
+            if not writer.closed and writer.db_path == os.path.abspath(self._db_schema.db_path):
+                return writer
+            writer.close()
+        write_config = self._config.get('write_queue', {})
+        writer = DatabaseWriter(
+            self._db_schema.db_path,
+            max_batch=write_config.get('max_batch', 64),
+            max_batch_seconds=write_config.get('max_batch_seconds', 0.05)
+        )
+        self._registry.register_singleton(DatabaseWriter, writer)
+        self._logger.info("쓰기 큐 시작")
+        return writer
+
     def is_service_available(self, service_type) -> bool:
         """서비스 사용 가능 여부 확인"""
         return self._registry.is_registered(service_type)
@@ -196,7 +223,9 @@ class ServiceFactory:
         return self._registry.get_registered_services()
     
     def cleanup(self):
-        """팩토리 정리"""
+        """팩토리 정리 (쓰기 큐는 남은 작업을 커밋한 뒤 종료)"""
+        if self._registry.is_registered(DatabaseWriter):
+            self._registry.get_service(DatabaseWriter).close()
         self._registry.clear_all()
         self._logger.info("서비스 팩토리 정리 완료")
 
@@ -0,0 +1,317 @@
+"""
+출고 장비 파라미터 매트릭스 (Serial × Parameter)
+
+여러 출고 장비의 같은 파라미터를 한 화면에서 비교하기 위한 행렬입니다.
+Shipped_Equipment_Parameters를 장비 / 파라미터 이름 / 값 각각의 임시 번호표에 조인하여
+(행, 열, 값 코드) 정수 3개씩만 읽으므로, 행마다 Python 객체를 만들지 않고 장비 묶음(chunk)
+단위로 NumPy 배열에 바로 채웁니다.
+
+- codes: int32 (장비 수 × 파라미터 수), 값 없음은 -1
+- value_table: 고유 값 문자열 목록 (codes가 가리킴)
+- numeric: float64 (숫자 변환 실패 / 값 없음은 NaN) - 필요할 때 계산
+
+편차 표시
+- drift: 장비 다수(drift_quorum 이상)가 같은 값을 쓰는 파라미터에서 그 값(fleet 값)과 다른 셀
+- outlier: 숫자 파라미터에서 중앙값 / MAD 기준 robust z-score가 임계값을 넘는 셀
+"""
+
+import csv
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.qc.typed_shadow import to_float_array
+from app.services.shipped_equipment.parameter_storage import (
+    KEYS_TABLE, VALUES_TABLE, BASELINE_VALUES_TABLE, EQUIPMENT_BASELINES_TABLE, REMOVALS_TABLE,
+    MODE_DELTA, storage_mode
+)
+
+DEFAULT_CHUNK_SIZE = 500
+DRIFT_QUORUM = 0.5
+OUTLIER_THRESHOLD = 3.5
+
+# chunk 결과를 한 번에 배열로 옮기는 행 수
+_FETCH_ROWS = 50000
+
+# 선택한 장비의 (idx, parameter_name, parameter_value)
+# 임시 테이블에는 통계가 없어 전체 파라미터 테이블을 먼저 읽는 계획이 선택될 수 있으므로
+# CROSS JOIN으로 선택한 장비 → 장비별 파라미터 순서를 고정
+_ROWS = """
+    _matrix_equipment m
+    CROSS JOIN Shipped_Equipment_Parameters sep ON sep.shipped_equipment_id = m.equipment_id
+"""
+
+# 차분 저장소: 호환 VIEW(UNION ALL)는 장비 조인 조건을 안으로 넘기지 못해 전체를 재구성하므로
+# 저장된 값 / 기준값을 장비별로 직접 조인
+_DELTA_ROWS = f"""
+    (SELECT m.idx AS idx, k.parameter_name AS parameter_name, v.parameter_value AS parameter_value
+     FROM _matrix_equipment m
+     CROSS JOIN {VALUES_TABLE} v ON v.shipped_equipment_id = m.equipment_id
+     JOIN {KEYS_TABLE} k ON k.id = v.key_id
+     UNION ALL
+     SELECT m.idx, k.parameter_name, bv.parameter_value
+     FROM _matrix_equipment m
+     CROSS JOIN {EQUIPMENT_BASELINES_TABLE} eb ON eb.shipped_equipment_id = m.equipment_id
+     CROSS JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+     JOIN {KEYS_TABLE} k ON k.id = bv.key_id
+     WHERE NOT EXISTS (SELECT 1 FROM {VALUES_TABLE} v
+                       WHERE v.shipped_equipment_id = eb.shipped_equipment_id AND v.key_id = bv.key_id)
+       AND NOT EXISTS (SELECT 1 FROM {REMOVALS_TABLE} r
+                       WHERE r.shipped_equipment_id = eb.shipped_equipment_id AND r.key_id = bv.key_id)
+    ) sep
+"""
+
+# MAD → 표준편차 환산 계수 (정규분포)
+_MAD_SCALE = 0.6745
+
+
+class ParameterMatrix:
+    """Serial × Parameter 값 행렬"""
+
+    __slots__ = (
+        'equipment_ids', 'serials', 'parameter_names', 'coverage', 'codes', 'value_table',
+        '_numeric', '_modes'
+    )
+
+    def __init__(
+        self,
+        equipment_ids: np.ndarray,
+        serials: List[str],
+        parameter_names: List[str],
+        coverage: np.ndarray,
+        codes: np.ndarray,
+        value_table: List[str]
+    ):
+        self.equipment_ids = equipment_ids
+        self.serials = serials
+        self.parameter_names = parameter_names
+        self.coverage = coverage
+        self.codes = codes
+        self.value_table = value_table
+        self._numeric = None
+        self._modes = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.codes.shape
+
+    def value(self, row: int, col: int) -> Optional[str]:
+        code = self.codes[row, col]
+        return self.value_table[code] if code >= 0 else None
+
+    def column_index(self, parameter_name: str) -> int:
+        return self.parameter_names.index(parameter_name)
+
+    def column_values(self, col: int) -> List[Optional[str]]:
+        return [self.value_table[code] if code >= 0 else None for code in self.codes[:, col]]
+
+    # ------------------------------------------------------------------
+    # 파생 배열
+    # ------------------------------------------------------------------
+
+    @property
+    def numeric(self) -> np.ndarray:
+        """float64 행렬 (변환 실패 / 값 없음은 NaN)"""
+        if self._numeric is None:
+            # 코드 -1(값 없음)이 마지막 NaN을 가리키도록 한 칸 추가
+            table = np.append(to_float_array(self.value_table), np.nan)
+            self._numeric = table[self.codes]
+        return self._numeric
+
+    def _mode_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """파라미터별 최빈값 코드와 그 장비 수 (값이 없으면 -1, 0)"""
+        if self._modes is None:
+            cols = self.shape[1]
+            mode_codes = np.full(cols, -1, dtype=np.int64)
+            mode_counts = np.zeros(cols, dtype=np.int64)
+
+            valid = self.codes >= 0
+            if valid.any():
+                width = max(len(self.value_table), 1)
+                keys = np.nonzero(valid)[1].astype(np.int64) * width + self.codes[valid]
+                unique, counts = np.unique(keys, return_counts=True)
+                unique_cols = unique // width
+
+                # 열 순서, 같은 열 안에서는 많이 쓰인 값 순서 → 열마다 첫 항목
+                order = np.lexsort((-counts, unique_cols))
+                sorted_cols = unique_cols[order]
+                first = np.ones(len(order), dtype=bool)
+                first[1:] = sorted_cols[1:] != sorted_cols[:-1]
+
+                mode_codes[sorted_cols[first]] = (unique % width)[order][first]
+                mode_counts[sorted_cols[first]] = counts[order][first]
+
+            self._modes = (mode_codes, mode_counts)
+        return self._modes
+
+    def fleet_value(self, col: int) -> Optional[str]:
+        """파라미터의 fleet 값 (가장 많이 쓰인 값)"""
+        code = self._mode_stats()[0][col]
+        return self.value_table[code] if code >= 0 else None
+
+    def drift_mask(self, quorum: float = DRIFT_QUORUM) -> np.ndarray:
+        """fleet 값과 다른 셀 (값을 가진 장비 중 quorum 이상이 같은 값인 파라미터만)"""
+        mode_codes, mode_counts = self._mode_stats()
+        settled = mode_counts >= np.maximum(self.coverage, 1) * quorum
+        return (self.codes >= 0) & (self.codes != mode_codes[None, :]) & settled[None, :]
+
+    def outlier_mask(self, threshold: float = OUTLIER_THRESHOLD) -> np.ndarray:
+        """숫자 값의 robust z-score(|0.6745 × (x - 중앙값) / MAD|)가 threshold를 넘는 셀"""
+        numeric = self.numeric
+        mask = np.zeros(numeric.shape, dtype=bool)
+        has_numeric = ~np.isnan(numeric).all(axis=0) if numeric.size else np.zeros(numeric.shape[1], dtype=bool)
+        if not has_numeric.any():
+            return mask
+
+        values = numeric[:, has_numeric]
+        median = np.nanmedian(values, axis=0)
+        deviation = np.abs(values - median)
+        mad = np.nanmedian(deviation, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = _MAD_SCALE * deviation / mad
+        # MAD가 0인 파라미터(대부분 같은 값)는 drift로 표시되므로 제외
+        score[:, mad == 0] = 0
+        mask[:, has_numeric] = np.nan_to_num(score, nan=0.0) > threshold
+        return mask
+
+    def deviating_columns(self, quorum: float = DRIFT_QUORUM, threshold: float = OUTLIER_THRESHOLD) -> np.ndarray:
+        """drift 또는 outlier 셀이 있는 파라미터 열 번호"""
+        flagged = self.drift_mask(quorum) | self.outlier_mask(threshold)
+        return np.nonzero(flagged.any(axis=0))[0]
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def to_dataframe(self):
+        """pandas DataFrame (index: Serial, columns: Parameter, 값 없음은 None)"""
+        import pandas as pd
+
+        table = np.array(self.value_table + [None], dtype=object)
+        return pd.DataFrame(table[self.codes], index=pd.Index(self.serials, name='Serial'),
+                            columns=self.parameter_names)
+
+    def export_csv(self, file_path: str, columns: Optional[Sequence[int]] = None, include_summary: bool = True) -> int:
+        """
+        CSV 내보내기 (장비 한 줄씩 기록)
+
+        Args:
+            file_path: 저장 경로
+            columns: 내보낼 파라미터 열 번호 (None이면 전체)
+            include_summary: 헤더 아래 Fleet Value / Coverage / Drift / Outlier 요약 행 추가
+
+        Returns:
+            int: 기록한 장비 수
+        """
+        cols = np.arange(self.shape[1]) if columns is None else np.asarray(columns, dtype=np.int64)
+        value_table = self.value_table
+
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Serial'] + [self.parameter_names[c] for c in cols])
+
+            if include_summary:
+                drift = self.drift_mask().sum(axis=0)
+                outlier = self.outlier_mask().sum(axis=0)
+                writer.writerow(['[Fleet Value]'] + [self.fleet_value(c) or '' for c in cols])
+                writer.writerow(['[Coverage]'] + [int(self.coverage[c]) for c in cols])
+                writer.writerow(['[Drift]'] + [int(drift[c]) for c in cols])
+                writer.writerow(['[Outlier]'] + [int(outlier[c]) for c in cols])
+
+            for row, serial in enumerate(self.serials):
+                codes = self.codes[row, cols]
+                writer.writerow([serial] + [value_table[code] if code >= 0 else '' for code in codes])
+
+        return len(self.serials)
+
+
+def build_parameter_matrix(
+    conn,
+    equipment: Sequence[Tuple[int, str]],
+    parameter_names: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> ParameterMatrix:
+    """
+    출고 장비 목록의 파라미터 매트릭스 생성
+
+    Args:
+        conn: DB 연결
+        equipment: [(장비 ID, Serial), ...] - 행 순서
+        parameter_names: 포함할 파라미터 이름 (None이면 장비들이 가진 전체)
+        chunk_size: 한 번에 읽을 장비 수
+
+    Returns:
+        ParameterMatrix
+    """
+    cursor = conn.cursor()
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _matrix_equipment (idx INTEGER PRIMARY KEY, equipment_id INTEGER)")
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _matrix_parameters "
+                   "(col INTEGER PRIMARY KEY, name TEXT UNIQUE, coverage INTEGER)")
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _matrix_values (code INTEGER PRIMARY KEY, value TEXT UNIQUE)")
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _matrix_names (name TEXT PRIMARY KEY)")
+
+    try:
+        cursor.executemany("INSERT INTO _matrix_equipment (idx, equipment_id) VALUES (?, ?)",
+                           [(idx, equipment_id) for idx, (equipment_id, _) in enumerate(equipment)])
+
+        name_filter = ""
+        if parameter_names is not None:
+            cursor.executemany("INSERT OR IGNORE INTO _matrix_names (name) VALUES (?)",
+                               [(name,) for name in parameter_names])
+            name_filter = "WHERE sep.parameter_name IN (SELECT name FROM _matrix_names)"
+
+        rows = _DELTA_ROWS if storage_mode(conn) == MODE_DELTA else _ROWS
+
+        # 열 번호표: 파라미터 이름별 장비 수 (이름 순, col은 1부터)
+        cursor.execute(f"""
+            INSERT INTO _matrix_parameters (name, coverage)
+            SELECT sep.parameter_name, COUNT(*)
+            FROM {rows}
+            {name_filter}
+            GROUP BY sep.parameter_name
+            ORDER BY sep.parameter_name
+        """)
+
+        # 값 번호표: 고유 값 (code는 1부터)
+        cursor.execute(f"""
+            INSERT INTO _matrix_values (value)
+            SELECT DISTINCT sep.parameter_value
+            FROM {rows}
+            JOIN _matrix_parameters p ON p.name = sep.parameter_name
+            WHERE sep.parameter_value IS NOT NULL
+        """)
+
+        cursor.execute("SELECT name, coverage FROM _matrix_parameters ORDER BY col")
+        columns = cursor.fetchall()
+        cursor.execute("SELECT value FROM _matrix_values ORDER BY code")
+        value_table = [row[0] for row in cursor.fetchall()]
+
+        codes = np.full((len(equipment), len(columns)), -1, dtype=np.int32)
+
+        # 장비 chunk 단위로 (행, 열, 값 코드)만 읽어 채움
+        for start in range(0, len(equipment), chunk_size):
+            cursor.execute(f"""
+                SELECT idx, p.col - 1, v.code - 1
+                FROM {rows}
+                JOIN _matrix_parameters p ON p.name = sep.parameter_name
+                JOIN _matrix_values v ON v.value = sep.parameter_value
+                WHERE idx >= ? AND idx < ?
+            """, (start, start + chunk_size))
+            while True:
+                batch = cursor.fetchmany(_FETCH_ROWS)
+                if not batch:
+                    break
+                cells = np.array(batch, dtype=np.int64)
+                codes[cells[:, 0], cells[:, 1]] = cells[:, 2]
+    finally:
+        for table in ('_matrix_equipment', '_matrix_parameters', '_matrix_values', '_matrix_names'):
+            cursor.execute(f"DROP TABLE IF EXISTS temp.{table}")
+
+    return ParameterMatrix(
+        equipment_ids=np.array([equipment_id for equipment_id, _ in equipment], dtype=np.int64),
+        serials=[serial for _, serial in equipment],
+        parameter_names=[name for name, _ in columns],
+        coverage=np.array([coverage for _, coverage in columns], dtype=np.int64),
+        codes=codes,
+        value_table=value_table
+    )
@@ -0,0 +1,852 @@
+"""
+출고 파라미터 정규화 저장소 (Parameter_Keys)
+
+기존 Shipped_Equipment_Parameters는 장비마다 parameter_name(Module.Part.ItemName),
+module, part, data_type 문자열을 2,000개씩 반복 저장합니다. 정규화 저장소는
+(이름, 모듈, 파트, 데이터 타입) 내용 자체를 키로 Parameter_Keys에 한 번만 저장하고,
+장비별 행은 (shipped_equipment_id, key_id, parameter_value)만 가집니다.
+
+- Parameter_Keys: 키 내용의 UNIQUE 인덱스(NULL은 ''로 비교)로 중복 없이 추가 (INSERT OR IGNORE)
+- Shipped_Parameter_Values: 장비 × 키 값 (UNIQUE (shipped_equipment_id, key_id))
+- Shipped_Equipment_Parameters: 같은 컬럼을 돌려주는 호환 VIEW + INSTEAD OF 트리거
+  (기존 조회 SQL과 외부 도구는 그대로 동작)
+
+차분 저장소(enable_deltas)는 정규화 저장소 위에서 장비 값을 Configuration 기준값과의
+차이로만 저장합니다. 출고 장비 대부분은 Default DB와 몇 개 파라미터만 다르므로 장비당
+2,000행 대신 변경 / 추가 값과 빠진 키 몇 개만 남습니다.
+
+- Shipped_Baselines / Shipped_Baseline_Values: 임포트 시점 Default_DB_Values(configuration_id)
+  스냅샷. 내용 해시가 같으면 재사용하고, Default DB가 바뀌면 새 스냅샷을 만들므로 이미
+  출고된 장비의 값은 Default DB 편집과 무관합니다.
+- Shipped_Equipment_Baselines: 장비 → 스냅샷
+- Shipped_Parameter_Values: 기준값과 다른 값 / 기준값에 없는 키 (기준값과 같은 값은 저장 안 함)
+- Shipped_Parameter_Removals: 기준값에 있지만 장비 파일에 없는 키
+- 호환 VIEW는 (저장된 값) ∪ (덮어쓰거나 빠지지 않은 기준값)으로 전체 행을 재구성합니다.
+  기준값에서 온 행의 id는 NULL 입니다.
+
+기본은 기존 테이블이며, normalize()(tools/migrate_parameter_keys.py)로 전환하고
+denormalize()로 되돌립니다. 차분 저장소는 enable_deltas() / expand_deltas() 입니다.
+저장 방식은 DB 파일별로 확인하여 기억합니다.
+장비별 중복 검사는 기존 테이블의 UNIQUE (shipped_equipment_id, parameter_name)과 같이
+이름 단위입니다. 값 테이블의 UNIQUE는 (장비, 키)이므로 VIEW 쓰기 트리거와 집합 추가가
+이름을 직접 검사합니다 (모듈 / 파트 / 데이터 타입만 다른 같은 이름도 중복).
+이 검사가 없던 이전 버전의 트리거는 스키마 생성(DBSchema) 시 upgrade_view_triggers()로 갱신합니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+KEYS_TABLE = 'Parameter_Keys'
+VALUES_TABLE = 'Shipped_Parameter_Values'
+LEGACY_TABLE = 'Shipped_Equipment_Parameters'
+BASELINES_TABLE = 'Shipped_Baselines'
+BASELINE_VALUES_TABLE = 'Shipped_Baseline_Values'
+EQUIPMENT_BASELINES_TABLE = 'Shipped_Equipment_Baselines'
+REMOVALS_TABLE = 'Shipped_Parameter_Removals'
+
+# 저장 방식
+MODE_LEGACY = 'legacy'
+MODE_NORMALIZED = 'normalized'
+MODE_DELTA = 'delta'
+
+# 키 내용 비교 (UNIQUE 인덱스와 같은 식이어야 인덱스를 사용)
+_KEY_MATCH = """
+    k.parameter_name = {src}.parameter_name
+    AND IFNULL(k.module, '') = IFNULL({src}.module, '')
+    AND IFNULL(k.part, '') = IFNULL({src}.part, '')
+    AND IFNULL(k.data_type, '') = IFNULL({src}.data_type, '')
+"""
+
+# 장비(eq)의 기준값에 키(key)가 있음
+_IN_BASELINE = f"""
+    EXISTS (SELECT 1 FROM {EQUIPMENT_BASELINES_TABLE} eb
+            JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id AND bv.key_id = {{key}}
+            WHERE eb.shipped_equipment_id = {{eq}})
+"""
+
+# 기존 테이블의 UNIQUE 위반과 같은 메시지 (트리거 버전 확인에도 사용)
+_DUPLICATE_NAME_ERROR = (f"UNIQUE constraint failed: {LEGACY_TABLE}.shipped_equipment_id, "
+                         f"{LEGACY_TABLE}.parameter_name")
+
+_VIEW_TRIGGERS = ('shipped_parameters_view_insert', 'shipped_parameters_view_update',
+                  'shipped_parameters_view_delete')
+
+
+def _name_visible(eq: str, name: str, deltas: bool, exclude_id: Optional[str] = None) -> str:
+    """
+    장비(eq)에 이름(name)의 파라미터가 이미 보이는지 (SQL 조건)
+
+    저장된 값(exclude_id 행 제외)과, 차분 저장소이면 빠지지 않은 기준값까지 봅니다.
+    """
+    excluded = f" AND nv.id IS NOT {exclude_id}" if exclude_id else ""
+    condition = f"""
+        EXISTS (SELECT 1 FROM {KEYS_TABLE} nk
+                JOIN {VALUES_TABLE} nv ON nv.key_id = nk.id
+                WHERE nk.parameter_name = {name} AND nv.shipped_equipment_id = {eq}{excluded})
+    """
+    if deltas:
+        condition += f"""
+        OR EXISTS (SELECT 1 FROM {KEYS_TABLE} nk
+                   WHERE nk.parameter_name = {name}
+                     AND {_IN_BASELINE.format(eq=eq, key='nk.id')}
+                     AND NOT EXISTS (SELECT 1 FROM {REMOVALS_TABLE} nr
+                                     WHERE nr.shipped_equipment_id = {eq} AND nr.key_id = nk.id))
+        """
+    return f"({condition})"
+
+
+_lock = threading.Lock()
+_modes: Dict[str, str] = {}
+
+
+def is_normalized(conn) -> bool:
+    """Shipped_Equipment_Parameters가 정규화 저장소의 VIEW인지 여부 (차분 저장소 포함)"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT type FROM sqlite_master WHERE name = ?", (LEGACY_TABLE,))
+    row = cursor.fetchone()
+    return row is not None and row[0] == 'view'
+
+
+def storage_mode(conn) -> str:
+    """현재 저장 방식 (MODE_LEGACY / MODE_NORMALIZED / MODE_DELTA)"""
+    if not is_normalized(conn):
+        return MODE_LEGACY
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (EQUIPMENT_BASELINES_TABLE,))
+    return MODE_DELTA if cursor.fetchone() else MODE_NORMALIZED
+
+
+def has_configuration_defaults(cursor) -> bool:
+    """Default_DB_Values가 configuration_id 기준(Phase 1.5)인지 여부"""
+    cursor.execute("PRAGMA table_info(Default_DB_Values)")
+    return any(row[1] == 'configuration_id' for row in cursor.fetchall())
+
+
+class ParameterStorage:
+    """DB 파일별 출고 파라미터 저장 방식"""
+
+    def __init__(self, db_schema):
+        self._db_schema = db_schema
+
+    def mode(self, conn) -> str:
+        key = getattr(self._db_schema, 'db_path', None) or id(self._db_schema)
+        mode = _modes.get(key)
+        if mode is None:
+            with _lock:
+                mode = _modes.setdefault(key, storage_mode(conn))
+        return mode
+
+    def normalized(self, conn) -> bool:
+        return self.mode(conn) != MODE_LEGACY
+
+    def deltas(self, conn) -> bool:
+        return self.mode(conn) == MODE_DELTA
+
+    def delete_equipment_parameters(self, conn, equipment_id: int) -> None:
+        """
+        장비의 파라미터 행 삭제 (Shipped_Equipment 행을 지우기 전에 호출)
+
+        연결에서 외래 키를 켜지 않으므로 ON DELETE CASCADE가 동작하지 않아 저장 방식별로 직접
+        지웁니다. 차분 저장소는 값 → 빠진 키 → 기준값 연결 순서로 지워야 파라미터 이름 사용 수
+        트리거가 맞게 줄어듭니다 (값 트리거는 기준값 연결이 있을 때 덮어쓴 값을 세지 않음).
+        """
+        cursor = conn.cursor()
+        mode = self.mode(conn)
+        if mode == MODE_LEGACY:
+            cursor.execute(f"DELETE FROM {LEGACY_TABLE} WHERE shipped_equipment_id = ?", (equipment_id,))
+            return
+        cursor.execute(f"DELETE FROM {VALUES_TABLE} WHERE shipped_equipment_id = ?", (equipment_id,))
+        if mode == MODE_DELTA:
+            cursor.execute(f"DELETE FROM {REMOVALS_TABLE} WHERE shipped_equipment_id = ?", (equipment_id,))
+            cursor.execute(f"DELETE FROM {EQUIPMENT_BASELINES_TABLE} WHERE shipped_equipment_id = ?",
+                           (equipment_id,))
+
+    @staticmethod
+    def insert_parameters(cursor, equipment_id: int, parameters: List[Dict[str, str]]) -> int:
+        """
+        정규화 저장소에 장비 파라미터 추가 (집합 단위)
+
+        임시 테이블에 모은 뒤 새 키만 Parameter_Keys에 추가하고, 값은 INSERT ... SELECT
+        한 번으로 넣습니다. 목록 안이나 같은 장비에 같은 이름이 있으면 IntegrityError.
+
+        Returns:
+            int: 추가된 파라미터 개수
+        """
+        _stage_parameters(cursor, parameters)
+        try:
+            _check_staged_names(cursor, equipment_id, deltas=False)
+            cursor.execute(f"""
+                INSERT INTO {VALUES_TABLE} (shipped_equipment_id, key_id, parameter_value)
+                SELECT ?, s.key_id, s.parameter_value
+                FROM _staged_parameters s
+                ORDER BY s.seq
+            """, (equipment_id,))
+            return cursor.rowcount
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS temp._staged_parameters")
+
+    @staticmethod
+    def insert_parameter_deltas(cursor, equipment_id: int, parameters: List[Dict[str, str]],
+                                infer_type: Optional[Callable[[str], str]] = None) -> int:
+        """
+        차분 저장소에 장비 파라미터 추가 (집합 단위)
+
+        파라미터가 없는 장비의 첫 추가이면 Configuration 기준값 스냅샷을 연결하고, 파일에 없는
+        기준값 키를 빠진 키로 기록합니다. 이후 추가는 빠진 키를 되살립니다. 값은 기준값과 다를
+        때만 저장합니다. 기준값이 없는(Default DB가 비어 있는) 장비는 정규화 저장소와 같습니다.
+        목록 안에 같은 이름이 있거나 이미 보이는 이름(저장된 값 또는 기준값)을 다시 추가하면
+        IntegrityError.
+        infer_type은 파일에도 기존 키에도 없는 기준값 이름의 데이터 타입 추론 (파일 파싱과 같은 규칙).
+
+        Returns:
+            int: 추가된 파라미터 개수
+        """
+        cursor.execute(f"""
+            SELECT se.configuration_id, eb.baseline_id,
+                   EXISTS (SELECT 1 FROM {VALUES_TABLE} v WHERE v.shipped_equipment_id = se.id)
+            FROM Shipped_Equipment se
+            LEFT JOIN {EQUIPMENT_BASELINES_TABLE} eb ON eb.shipped_equipment_id = se.id
+            WHERE se.id = ?
+        """, (equipment_id,))
+        configuration_id, baseline_id, has_values = cursor.fetchone()
+
+        metadata = {p.get('parameter_name'): (p.get('module'), p.get('part'), p.get('data_type'))
+                    for p in parameters}
+        attach = baseline_id is None and not has_values
+        if attach:
+            baseline_id = _baseline_for(cursor, configuration_id, metadata, infer_type)
+
+        _stage_parameters(cursor, parameters)
+        try:
+            # 첫 추가이면 기준값 연결 전이므로 목록 안 중복만 걸림
+            staged = _check_staged_names(cursor, equipment_id, deltas=True)
+
+            if baseline_id is not None and attach:
+                cursor.execute(f"INSERT INTO {EQUIPMENT_BASELINES_TABLE} (shipped_equipment_id, baseline_id) "
+                               f"VALUES (?, ?)", (equipment_id, baseline_id))
+                cursor.execute(f"""
+                    INSERT INTO {REMOVALS_TABLE} (shipped_equipment_id, key_id)
+                    SELECT ?, bv.key_id FROM {BASELINE_VALUES_TABLE} bv
+                    WHERE bv.baseline_id = ?
+                      AND bv.key_id NOT IN (SELECT key_id FROM _staged_parameters)
+                """, (equipment_id, baseline_id))
+            elif baseline_id is not None:
+                cursor.execute(f"""
+                    DELETE FROM {REMOVALS_TABLE}
+                    WHERE shipped_equipment_id = ? AND key_id IN (SELECT key_id FROM _staged_parameters)
+                """, (equipment_id,))
+
+            cursor.execute(f"""
+                INSERT INTO {VALUES_TABLE} (shipped_equipment_id, key_id, parameter_value)
+                SELECT ?, s.key_id, s.parameter_value
+                FROM _staged_parameters s
+                LEFT JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = ? AND bv.key_id = s.key_id
+                WHERE bv.parameter_value IS NOT s.parameter_value
+                ORDER BY s.seq
+            """, (equipment_id, baseline_id))
+            return staged
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS temp._staged_parameters")
+
+
+def _check_staged_names(cursor, equipment_id: int, deltas: bool) -> int:
+    """
+    _staged_parameters의 이름 중복 검사 (기존 테이블의 UNIQUE (shipped_equipment_id, parameter_name))
+
+    목록 안에서 겹치거나 장비에 이미 보이는 이름이면 IntegrityError. 반환값은 모은 행 수.
+    """
+    cursor.execute("SELECT COUNT(*), COUNT(DISTINCT parameter_name) FROM _staged_parameters")
+    staged, distinct = cursor.fetchone()
+    if staged != distinct:
+        raise sqlite3.IntegrityError(_DUPLICATE_NAME_ERROR)
+    cursor.execute(f"""
+        SELECT 1 FROM _staged_parameters s
+        WHERE {_name_visible(':equipment_id', 's.parameter_name', deltas)}
+        LIMIT 1
+    """, {'equipment_id': equipment_id})
+    if cursor.fetchone():
+        raise sqlite3.IntegrityError(_DUPLICATE_NAME_ERROR)
+    return staged
+
+
+def _stage_parameters(cursor, parameters: List[Dict[str, str]]):
+    """파라미터를 임시 테이블 _staged_parameters에 모으고 새 키를 Parameter_Keys에 추가 (key_id 채움)"""
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS _staged_parameters (
+            seq INTEGER PRIMARY KEY,
+            parameter_name TEXT, parameter_value TEXT, module TEXT, part TEXT, data_type TEXT,
+            key_id INTEGER
+        )
+    """)
+    cursor.execute("DELETE FROM temp._staged_parameters")
+    try:
+        cursor.executemany("""
+            INSERT INTO _staged_parameters (parameter_name, parameter_value, module, part, data_type)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (p.get('parameter_name'), p.get('parameter_value'), p.get('module'), p.get('part'),
+             p.get('data_type'))
+            for p in parameters
+        ])
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+            SELECT parameter_name, module, part, data_type FROM _staged_parameters ORDER BY seq
+        """)
+        cursor.execute(f"""
+            UPDATE _staged_parameters
+            SET key_id = (SELECT k.id FROM {KEYS_TABLE} k WHERE {_KEY_MATCH.format(src='_staged_parameters')})
+        """)
+    except Exception:
+        cursor.execute("DROP TABLE IF EXISTS temp._staged_parameters")
+        raise
+
+
+# ----------------------------------------------------------------------
+# 스키마
+# ----------------------------------------------------------------------
+
+def create_normalized_tables(cursor):
+    """Parameter_Keys / Shipped_Parameter_Values 테이블과 인덱스"""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {KEYS_TABLE} (
+            id INTEGER PRIMARY KEY,
+            parameter_name TEXT NOT NULL,
+            module TEXT,
+            part TEXT,
+            data_type TEXT
+        )
+    """)
+    cursor.execute(f"""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_parameter_keys_content
+        ON {KEYS_TABLE}(parameter_name, IFNULL(module, ''), IFNULL(part, ''), IFNULL(data_type, ''))
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VALUES_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            shipped_equipment_id INTEGER NOT NULL,
+            key_id INTEGER NOT NULL,
+            parameter_value TEXT NOT NULL,
+            FOREIGN KEY (shipped_equipment_id) REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+            FOREIGN KEY (key_id) REFERENCES {KEYS_TABLE}(id),
+            UNIQUE (shipped_equipment_id, key_id)
+        )
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_shipped_values_key
+        ON {VALUES_TABLE}(key_id)
+    """)
+
+
+def _create_compat_view(cursor):
+    """기존 테이블과 같은 컬럼의 VIEW + 쓰기용 INSTEAD OF 트리거"""
+    cursor.execute(f"""
+        CREATE VIEW {LEGACY_TABLE} AS
+        SELECT
+            v.id AS id,
+            v.shipped_equipment_id AS shipped_equipment_id,
+            k.parameter_name AS parameter_name,
+            v.parameter_value AS parameter_value,
+            k.module AS module,
+            k.part AS part,
+            k.data_type AS data_type
+        FROM {VALUES_TABLE} v
+        JOIN {KEYS_TABLE} k ON k.id = v.key_id
+    """)
+    _create_compat_triggers(cursor)
+
+
+def _create_compat_triggers(cursor):
+    """정규화 VIEW 쓰기 트리거 (같은 장비에 같은 이름이 있으면 ABORT)"""
+    duplicate = f"SELECT RAISE(ABORT, '{_DUPLICATE_NAME_ERROR}') WHERE "
+    cursor.execute(f"""
+        CREATE TRIGGER shipped_parameters_view_insert
+        INSTEAD OF INSERT ON {LEGACY_TABLE} BEGIN
+            {duplicate}{_name_visible('new.shipped_equipment_id', 'new.parameter_name', False)};
+            INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+            VALUES (new.parameter_name, new.module, new.part, new.data_type);
+            INSERT INTO {VALUES_TABLE} (id, shipped_equipment_id, key_id, parameter_value)
+            SELECT new.id, new.shipped_equipment_id, k.id, new.parameter_value
+            FROM {KEYS_TABLE} k WHERE {_KEY_MATCH.format(src='new')};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER shipped_parameters_view_update
+        INSTEAD OF UPDATE ON {LEGACY_TABLE} BEGIN
+            {duplicate}{_name_visible('new.shipped_equipment_id', 'new.parameter_name', False, 'old.id')};
+            INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+            VALUES (new.parameter_name, new.module, new.part, new.data_type);
+            UPDATE {VALUES_TABLE}
+            SET shipped_equipment_id = new.shipped_equipment_id,
+                parameter_value = new.parameter_value,
+                key_id = (SELECT k.id FROM {KEYS_TABLE} k WHERE {_KEY_MATCH.format(src='new')})
+            WHERE id = old.id;
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER shipped_parameters_view_delete
+        INSTEAD OF DELETE ON {LEGACY_TABLE} BEGIN
+            DELETE FROM {VALUES_TABLE} WHERE id = old.id;
+        END
+    """)
+
+
+def create_delta_tables(cursor):
+    """차분 저장소 테이블 (기준값 스냅샷, 장비 → 스냅샷, 빠진 키)"""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BASELINES_TABLE} (
+            id INTEGER PRIMARY KEY,
+            configuration_id INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (configuration_id, content_hash)
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BASELINE_VALUES_TABLE} (
+            baseline_id INTEGER NOT NULL REFERENCES {BASELINES_TABLE}(id) ON DELETE CASCADE,
+            key_id INTEGER NOT NULL REFERENCES {KEYS_TABLE}(id),
+            parameter_value TEXT NOT NULL,
+            PRIMARY KEY (baseline_id, key_id)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_baseline_values_key
+        ON {BASELINE_VALUES_TABLE}(key_id, baseline_id)
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {EQUIPMENT_BASELINES_TABLE} (
+            shipped_equipment_id INTEGER PRIMARY KEY REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+            baseline_id INTEGER NOT NULL REFERENCES {BASELINES_TABLE}(id)
+        )
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_equipment_baselines_baseline
+        ON {EQUIPMENT_BASELINES_TABLE}(baseline_id)
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {REMOVALS_TABLE} (
+            shipped_equipment_id INTEGER NOT NULL REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+            key_id INTEGER NOT NULL REFERENCES {KEYS_TABLE}(id),
+            PRIMARY KEY (shipped_equipment_id, key_id)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_parameter_removals_key
+        ON {REMOVALS_TABLE}(key_id)
+    """)
+
+
+def _create_delta_view(cursor):
+    """
+    차분 저장소 호환 VIEW: 저장된 값 ∪ (덮어쓰거나 빠지지 않은 기준값)
+
+    쓰기 트리거는 (장비, 키) 단위이고 중복 검사만 이름 단위입니다. 삭제는 저장된 값을 지우고 기준값에 있는 키이면
+    빠진 키로 기록하며, 추가는 빠진 키를 되살리고 기준값과 다를 때만 값을 저장합니다.
+    수정은 삭제 + 추가입니다.
+    """
+    cursor.execute(f"""
+        CREATE VIEW {LEGACY_TABLE} AS
+        SELECT
+            v.id AS id,
+            v.shipped_equipment_id AS shipped_equipment_id,
+            k.parameter_name AS parameter_name,
+            v.parameter_value AS parameter_value,
+            k.module AS module,
+            k.part AS part,
+            k.data_type AS data_type
+        FROM {VALUES_TABLE} v
+        JOIN {KEYS_TABLE} k ON k.id = v.key_id
+        UNION ALL
+        SELECT NULL, eb.shipped_equipment_id, k.parameter_name, bv.parameter_value,
+               k.module, k.part, k.data_type
+        FROM {EQUIPMENT_BASELINES_TABLE} eb
+        JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+        JOIN {KEYS_TABLE} k ON k.id = bv.key_id
+        WHERE NOT EXISTS (SELECT 1 FROM {VALUES_TABLE} v
+                          WHERE v.shipped_equipment_id = eb.shipped_equipment_id AND v.key_id = bv.key_id)
+          AND NOT EXISTS (SELECT 1 FROM {REMOVALS_TABLE} r
+                          WHERE r.shipped_equipment_id = eb.shipped_equipment_id AND r.key_id = bv.key_id)
+    """)
+    _create_delta_triggers(cursor)
+
+
+def _create_delta_triggers(cursor):
+    """차분 VIEW 쓰기 트리거 (수정은 이전 행을 지운 뒤 추가하므로 이름 검사에서 제외할 행이 없음)"""
+    new_key = f"(SELECT k.id FROM {KEYS_TABLE} k WHERE {_KEY_MATCH.format(src='new')})"
+    old_key = f"(SELECT k.id FROM {KEYS_TABLE} k WHERE {_KEY_MATCH.format(src='old')})"
+    remove_old = f"""
+        DELETE FROM {VALUES_TABLE} WHERE shipped_equipment_id = old.shipped_equipment_id AND key_id = {old_key};
+        INSERT OR IGNORE INTO {REMOVALS_TABLE} (shipped_equipment_id, key_id)
+        SELECT old.shipped_equipment_id, {old_key}
+        WHERE {_IN_BASELINE.format(eq='old.shipped_equipment_id', key=old_key)};
+    """
+
+    def add_new(row_id):
+        return f"""
+        INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+        VALUES (new.parameter_name, new.module, new.part, new.data_type);
+        SELECT RAISE(ABORT, '{_DUPLICATE_NAME_ERROR}')
+        WHERE {_name_visible('new.shipped_equipment_id', 'new.parameter_name', True)};
+        DELETE FROM {REMOVALS_TABLE} WHERE shipped_equipment_id = new.shipped_equipment_id AND key_id = {new_key};
+        INSERT INTO {VALUES_TABLE} (id, shipped_equipment_id, key_id, parameter_value)
+        SELECT {row_id}, new.shipped_equipment_id, {new_key}, new.parameter_value
+        WHERE NOT EXISTS (SELECT 1 FROM {EQUIPMENT_BASELINES_TABLE} eb
+                          JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+                          WHERE eb.shipped_equipment_id = new.shipped_equipment_id
+                            AND bv.key_id = {new_key} AND bv.parameter_value = new.parameter_value);
+        """
+
+    cursor.execute(f"CREATE TRIGGER shipped_parameters_view_insert INSTEAD OF INSERT ON {LEGACY_TABLE} "
+                   f"BEGIN {add_new('new.id')} END")
+    cursor.execute(f"CREATE TRIGGER shipped_parameters_view_update INSTEAD OF UPDATE ON {LEGACY_TABLE} "
+                   f"BEGIN {remove_old} {add_new('old.id')} END")
+    cursor.execute(f"CREATE TRIGGER shipped_parameters_view_delete INSTEAD OF DELETE ON {LEGACY_TABLE} "
+                   f"BEGIN {remove_old} END")
+
+
+def _baseline_for(cursor, configuration_id: Optional[int],
+                  metadata: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]],
+                  infer_type: Optional[Callable[[str], str]] = None) -> Optional[int]:
+    """
+    Configuration의 현재 Default DB 스냅샷 ID (없으면 생성, Default DB가 비어 있으면 None)
+
+    기준값 키의 모듈 / 파트 / 데이터 타입은 metadata(임포트 파일) → 같은 이름의 기존 키 →
+    이름(Module.Part.ItemName) + infer_type(기본값) 순으로 정합니다. 장비 파일과 키가 다르면
+    그 장비에는 변경 + 빠진 키로 저장되므로(재구성 결과는 같음) 가능한 한 파일과 맞춥니다.
+    """
+    if configuration_id is None or not has_configuration_defaults(cursor):
+        return None
+
+    cursor.execute("""
+        SELECT parameter_name, default_value FROM Default_DB_Values
+        WHERE configuration_id = ? ORDER BY parameter_name
+    """, (configuration_id,))
+    defaults = [(row[0], row[1]) for row in cursor.fetchall()]
+    if not defaults:
+        return None
+
+    digest = hashlib.sha1()
+    for name, value in defaults:
+        digest.update(f"{name}\x1f{value}\x1e".encode('utf-8'))
+    content_hash = digest.hexdigest()
+
+    cursor.execute(f"SELECT id FROM {BASELINES_TABLE} WHERE configuration_id = ? AND content_hash = ?",
+                   (configuration_id, content_hash))
+    row = cursor.fetchone()
+    if row:
+        return row[0]
+
+    cursor.execute(f"""
+        SELECT parameter_name, module, part, data_type FROM {KEYS_TABLE}
+        WHERE id IN (SELECT MIN(id) FROM {KEYS_TABLE} GROUP BY parameter_name)
+    """)
+    known = {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
+
+    rows = []
+    for name, value in defaults:
+        key = metadata.get(name) or known.get(name)
+        if key is None:
+            parts = name.split('.')
+            data_type = infer_type(value) if infer_type else None
+            key = (parts[0], parts[1], data_type) if len(parts) >= 3 else (None, None, data_type)
+        rows.append((name, value) + tuple(key))
+
+    cursor.execute(f"INSERT INTO {BASELINES_TABLE} (configuration_id, content_hash) VALUES (?, ?)",
+                   (configuration_id, content_hash))
+    baseline_id = cursor.lastrowid
+
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS _staged_baseline (
+            parameter_name TEXT, parameter_value TEXT, module TEXT, part TEXT, data_type TEXT
+        )
+    """)
+    try:
+        cursor.executemany("INSERT INTO _staged_baseline VALUES (?, ?, ?, ?, ?)", rows)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+            SELECT parameter_name, module, part, data_type FROM _staged_baseline
+        """)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {BASELINE_VALUES_TABLE} (baseline_id, key_id, parameter_value)
+            SELECT ?, k.id, b.parameter_value
+            FROM _staged_baseline b
+            JOIN {KEYS_TABLE} k ON {_KEY_MATCH.format(src='b')}
+        """, (baseline_id,))
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS temp._staged_baseline")
+    return baseline_id
+
+
+def _create_legacy_table(cursor):
+    """기존 Shipped_Equipment_Parameters 테이블 (db_schema.py와 같은 정의)"""
+    cursor.execute(f"""
+        CREATE TABLE {LEGACY_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            shipped_equipment_id INTEGER NOT NULL,
+            parameter_name TEXT NOT NULL,
+            parameter_value TEXT NOT NULL,
+            module TEXT,
+            part TEXT,
+            data_type TEXT,
+            FOREIGN KEY (shipped_equipment_id) REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+            UNIQUE (shipped_equipment_id, parameter_name)
+        )
+    """)
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_shipped_params_equipment ON {LEGACY_TABLE}(shipped_equipment_id)")
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_shipped_params_name ON {LEGACY_TABLE}(parameter_name)")
+
+
+def upgrade_view_triggers(cursor) -> bool:
+    """
+    호환 VIEW 쓰기 트리거가 이름 중복 검사가 없는 이전 버전이면 다시 생성 (스키마 생성 시 호출)
+
+    Returns:
+        bool: 다시 생성했는지 여부
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (_VIEW_TRIGGERS[0],))
+    row = cursor.fetchone()
+    if row is not None and _DUPLICATE_NAME_ERROR in row[0]:
+        return False
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (EQUIPMENT_BASELINES_TABLE,))
+    deltas = cursor.fetchone() is not None
+    for trigger in _VIEW_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    if deltas:
+        _create_delta_triggers(cursor)
+    else:
+        _create_compat_triggers(cursor)
+    return True
+
+
+def _reinstall_name_triggers(cursor):
+    """출고 파라미터 이름 색인 트리거를 현재 저장 방식에 맞게 다시 생성 (색인이 있을 때만)"""
+    from app.services.common.search_index import install_parameter_name_triggers
+    install_parameter_name_triggers(cursor)
+
+
+# ----------------------------------------------------------------------
+# 전환 / 복원
+# ----------------------------------------------------------------------
+
+def normalize(conn, commit: bool = True) -> Dict[str, int]:
+    """
+    기존 테이블 → 정규화 저장소 (한 트랜잭션)
+
+    ID는 유지하므로 ShippedEquipmentParameter.id를 참조하는 곳은 영향이 없습니다.
+    commit=False이면 커밋하지 않으며 호출하는 쪽이 commit / rollback 합니다 (dry run,
+    enable_deltas()까지 한 트랜잭션). 오류 시에는 열린 트랜잭션 전체를 rollback 합니다.
+
+    Returns:
+        {'keys': 키 수, 'values': 값 행 수}
+    """
+    if is_normalized(conn):
+        raise ValueError("이미 정규화 저장소를 사용 중입니다")
+
+    cursor = conn.cursor()
+    try:
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+        create_normalized_tables(cursor)
+
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+            SELECT parameter_name, module, part, data_type
+            FROM {LEGACY_TABLE}
+            GROUP BY parameter_name, IFNULL(module, ''), IFNULL(part, ''), IFNULL(data_type, '')
+            ORDER BY MIN(id)
+        """)
+        cursor.execute(f"""
+            INSERT INTO {VALUES_TABLE} (id, shipped_equipment_id, key_id, parameter_value)
+            SELECT p.id, p.shipped_equipment_id, k.id, p.parameter_value
+            FROM {LEGACY_TABLE} p
+            JOIN {KEYS_TABLE} k ON {_KEY_MATCH.format(src='p')}
+            ORDER BY p.id
+        """)
+        values = cursor.rowcount
+
+        cursor.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}")
+        if cursor.fetchone()[0] != values:
+            raise RuntimeError("파라미터 행 수가 일치하지 않습니다")
+
+        cursor.execute(f"DROP TABLE {LEGACY_TABLE}")
+        _create_compat_view(cursor)
+        _reinstall_name_triggers(cursor)
+
+        cursor.execute(f"SELECT COUNT(*) FROM {KEYS_TABLE}")
+        keys = cursor.fetchone()[0]
+        if commit:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _modes.clear()
+
+    return {'keys': keys, 'values': values}
+
+
+def denormalize(conn, commit: bool = True) -> int:
+    """
+    정규화 저장소 → 기존 테이블 (한 트랜잭션, commit은 normalize()와 같음)
+
+    Returns:
+        int: 복원된 파라미터 행 수
+    """
+    mode = storage_mode(conn)
+    if mode == MODE_LEGACY:
+        raise ValueError("정규화 저장소를 사용하고 있지 않습니다")
+    if mode == MODE_DELTA:
+        raise ValueError("차분 저장소를 먼저 해제하세요 (expand_deltas)")
+
+    cursor = conn.cursor()
+    try:
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+        cursor.execute(f"DROP VIEW {LEGACY_TABLE}")
+        _create_legacy_table(cursor)
+        cursor.execute(f"""
+            INSERT INTO {LEGACY_TABLE} (id, shipped_equipment_id, parameter_name, parameter_value,
+                                        module, part, data_type)
+            SELECT v.id, v.shipped_equipment_id, k.parameter_name, v.parameter_value,
+                   k.module, k.part, k.data_type
+            FROM {VALUES_TABLE} v
+            JOIN {KEYS_TABLE} k ON k.id = v.key_id
+            ORDER BY v.id
+        """)
+        restored = cursor.rowcount
+        cursor.execute(f"DROP TABLE {VALUES_TABLE}")
+        cursor.execute(f"DROP TABLE {KEYS_TABLE}")
+        _reinstall_name_triggers(cursor)
+        if commit:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _modes.clear()
+
+    return restored
+
+
+def enable_deltas(conn, commit: bool = True) -> Dict[str, int]:
+    """
+    정규화 저장소 → 차분 저장소 (한 트랜잭션, commit은 normalize()와 같음)
+
+    파라미터가 있는 장비마다 Configuration의 현재 Default DB 스냅샷을 연결하고, 기준값과
+    같은 값 행을 지우고, 기준값에 있지만 장비에 없는 키를 빠진 키로 기록합니다.
+    Default DB가 없는 Configuration의 장비는 그대로(전체 값) 둡니다.
+    지워진 행은 VIEW에서 기준값 행(id NULL)으로 보입니다.
+
+    Returns:
+        {'baselines': 스냅샷 수, 'equipment': 연결된 장비 수, 'values': 남은 값 행 수,
+         'removed': 빠진 키 수}
+    """
+    mode = storage_mode(conn)
+    if mode != MODE_NORMALIZED:
+        raise ValueError("정규화 저장소에서만 차분 저장소로 전환할 수 있습니다"
+                         if mode == MODE_LEGACY else "이미 차분 저장소를 사용 중입니다")
+
+    cursor = conn.cursor()
+    try:
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+        create_delta_tables(cursor)
+
+        cursor.execute(f"""
+            SELECT DISTINCT se.configuration_id FROM Shipped_Equipment se
+            WHERE EXISTS (SELECT 1 FROM {VALUES_TABLE} v WHERE v.shipped_equipment_id = se.id)
+            ORDER BY se.configuration_id
+        """)
+        for configuration_id in [row[0] for row in cursor.fetchall()]:
+            baseline_id = _baseline_for(cursor, configuration_id, {})
+            if baseline_id is None:
+                continue
+            cursor.execute(f"""
+                INSERT INTO {EQUIPMENT_BASELINES_TABLE} (shipped_equipment_id, baseline_id)
+                SELECT se.id, ? FROM Shipped_Equipment se
+                WHERE se.configuration_id = ?
+                  AND EXISTS (SELECT 1 FROM {VALUES_TABLE} v WHERE v.shipped_equipment_id = se.id)
+            """, (baseline_id, configuration_id))
+            cursor.execute(f"""
+                INSERT INTO {REMOVALS_TABLE} (shipped_equipment_id, key_id)
+                SELECT eb.shipped_equipment_id, bv.key_id
+                FROM {EQUIPMENT_BASELINES_TABLE} eb
+                CROSS JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+                WHERE eb.baseline_id = ?
+                  AND NOT EXISTS (SELECT 1 FROM {VALUES_TABLE} v
+                                  WHERE v.shipped_equipment_id = eb.shipped_equipment_id AND v.key_id = bv.key_id)
+            """, (baseline_id,))
+            cursor.execute(f"""
+                DELETE FROM {VALUES_TABLE} WHERE id IN (
+                    SELECT v.id
+                    FROM {EQUIPMENT_BASELINES_TABLE} eb
+                    CROSS JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+                    CROSS JOIN {VALUES_TABLE} v
+                        ON v.shipped_equipment_id = eb.shipped_equipment_id AND v.key_id = bv.key_id
+                    WHERE eb.baseline_id = ? AND v.parameter_value = bv.parameter_value
+                )
+            """, (baseline_id,))
+
+        cursor.execute(f"DROP VIEW {LEGACY_TABLE}")
+        _create_delta_view(cursor)
+        _reinstall_name_triggers(cursor)
+
+        result = {}
+        for name, table in (('baselines', BASELINES_TABLE), ('equipment', EQUIPMENT_BASELINES_TABLE),
+                            ('values', VALUES_TABLE), ('removed', REMOVALS_TABLE)):
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            result[name] = cursor.fetchone()[0]
+        if commit:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _modes.clear()
+
+    return result
+
+
+def expand_deltas(conn, commit: bool = True) -> int:
+    """
+    차분 저장소 → 정규화 저장소 (기준값 행을 장비별 값으로 채움, commit은 normalize()와 같음)
+
+    Returns:
+        int: 채운 기준값 행 수
+    """
+    if storage_mode(conn) != MODE_DELTA:
+        raise ValueError("차분 저장소를 사용하고 있지 않습니다")
+
+    cursor = conn.cursor()
+    try:
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+        cursor.execute(f"""
+            INSERT INTO {VALUES_TABLE} (shipped_equipment_id, key_id, parameter_value)
+            SELECT eb.shipped_equipment_id, bv.key_id, bv.parameter_value
+            FROM {EQUIPMENT_BASELINES_TABLE} eb
+            CROSS JOIN {BASELINE_VALUES_TABLE} bv ON bv.baseline_id = eb.baseline_id
+            WHERE NOT EXISTS (SELECT 1 FROM {VALUES_TABLE} v
+                              WHERE v.shipped_equipment_id = eb.shipped_equipment_id AND v.key_id = bv.key_id)
+              AND NOT EXISTS (SELECT 1 FROM {REMOVALS_TABLE} r
+                              WHERE r.shipped_equipment_id = eb.shipped_equipment_id AND r.key_id = bv.key_id)
+            ORDER BY eb.shipped_equipment_id, bv.key_id
+        """)
+        expanded = cursor.rowcount
+
+        cursor.execute(f"DROP VIEW {LEGACY_TABLE}")
+        for table in (REMOVALS_TABLE, EQUIPMENT_BASELINES_TABLE, BASELINE_VALUES_TABLE, BASELINES_TABLE):
+            cursor.execute(f"DROP TABLE {table}")
+        _create_compat_view(cursor)
+        _reinstall_name_triggers(cursor)
+        if commit:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _modes.clear()
+
+    return expanded
@@ -6,10 +6,12 @@ Shipped Equipment Service 구현 (Phase 2)
 
 import os
 import re
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
 from pathlib import Path
 
+from app.services.common.search_index import SearchIndex, PARAMETER_NAMES_TABLE, match_expression
+from app.services.shipped_equipment.parameter_storage import ParameterStorage, has_configuration_defaults
 from app.services.interfaces.shipped_equipment_service_interface import (
     IShippedEquipmentService,
     ShippedEquipment,
@@ -18,6 +20,10 @@ from app.services.interfaces.shipped_equipment_service_interface import (
     ParameterHistory
 )
 
+if TYPE_CHECKING:
+    # 타입 힌트 전용 (NumPy는 매트릭스를 만들 때 로드)
+    from .parameter_matrix import ParameterMatrix
+
 
 class ShippedEquipmentService(IShippedEquipmentService):
     """출고 장비 관리 서비스 구현"""
@@ -28,6 +34,8 @@ class ShippedEquipmentService(IShippedEquipmentService):
             db_schema (DBSchema): 데이터베이스 스키마 인스턴스
         """
         self.db_schema = db_schema
+        self._search = SearchIndex(db_schema)
+        self._storage = ParameterStorage(db_schema)
 
     # ==================== Shipped Equipment CRUD ====================
 
@@ -63,8 +71,15 @@ class ShippedEquipmentService(IShippedEquipmentService):
                 params.append(configuration_id)
 
             if customer_name:
-                query += " AND se.customer_name LIKE ?"
-                params.append(f"%{customer_name}%")
+                # 고객명은 FTS5 색인(단어 접두어)으로 찾고, 색인이 없으면 LIKE
+                fts = self._search.table_for(conn, 'Shipped_Equipment')
+                expression = match_expression(customer_name, columns=['customer_name'])
+                if fts and expression:
+                    query += f" AND se.id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)"
+                    params.append(expression)
+                else:
+                    query += " AND se.customer_name LIKE ?"
+                    params.append(f"%{customer_name}%")
 
             if start_date:
                 query += " AND se.ship_date >= ?"
@@ -81,6 +96,132 @@ class ShippedEquipmentService(IShippedEquipmentService):
 
             return [self._row_to_shipped_equipment(row) for row in rows]
 
+    def _equipment_filters(
+        self,
+        configuration_id: Optional[int],
+        customer_name: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        search_text: Optional[str]
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        목록 / 개수 조회 공통 WHERE 조건 (JOIN 없이 Shipped_Equipment se 기준)
+
+        출고일 필터는 출고일이 없는 장비를 제외하지 않습니다 (기존 목록 화면의 필터와 동일).
+        """
+        clauses = []
+        params = []
+
+        if configuration_id:
+            clauses.append("se.configuration_id = ?")
+            params.append(configuration_id)
+
+        if customer_name:
+            clauses.append("se.customer_name = ?")
+            params.append(customer_name)
+
+        if start_date:
+            clauses.append("(se.ship_date IS NULL OR se.ship_date >= ?)")
+            params.append(start_date.isoformat())
+
+        if end_date:
+            clauses.append("(se.ship_date IS NULL OR se.ship_date <= ?)")
+            params.append(end_date.isoformat())
+
+        if search_text:
+            # Serial, Customer, Model, Type, Configuration 부분 일치 (Model/Type/Configuration은 ID 집합으로 변환)
+            pattern = f"%{search_text}%"
+            clauses.append("""(
+                se.serial_number LIKE ?
+                OR se.customer_name LIKE ?
+                OR se.configuration_id IN (
+                    SELECT id FROM Equipment_Configurations WHERE configuration_name LIKE ?)
+                OR se.equipment_type_id IN (
+                    SELECT t.id FROM Equipment_Types t
+                    LEFT JOIN Equipment_Models m ON t.model_id = m.id
+                    WHERE t.type_name LIKE ? OR m.model_name LIKE ?)
+            )""")
+            params.extend([pattern] * 5)
+
+        return clauses, params
+
+    def get_shipped_equipment_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 200,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search_text: Optional[str] = None
+    ) -> List[ShippedEquipment]:
+        """
+        출고 장비 한 페이지 조회 (keyset 페이지네이션)
+
+        정렬은 출고일 최신순, 같은 날짜는 ID 역순입니다. 다음 페이지는 이전 페이지의
+        마지막 ID를 after_id로 넘깁니다 (OFFSET 없이 인덱스 위치에서 바로 이어서 읽음).
+        customer_name은 정확히 일치, search_text는 Serial / Customer / Model / Type /
+        Configuration 부분 일치입니다.
+        """
+        clauses, params = self._equipment_filters(
+            configuration_id, customer_name, start_date, end_date, search_text)
+
+        if after_id is not None:
+            clauses.append("""
+                (COALESCE(se.ship_date, ''), se.id) < (
+                    SELECT COALESCE(ship_date, ''), id FROM Shipped_Equipment WHERE id = ?)
+            """)
+            params.append(after_id)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    se.id, se.equipment_type_id, se.configuration_id,
+                    se.serial_number, se.customer_name, se.ship_date,
+                    se.is_refit, se.original_serial_number, se.notes, se.created_at,
+                    et.type_name,
+                    ec.configuration_name,
+                    em.model_name
+                FROM Shipped_Equipment se
+                LEFT JOIN Equipment_Types et ON se.equipment_type_id = et.id
+                LEFT JOIN Equipment_Configurations ec ON se.configuration_id = ec.id
+                LEFT JOIN Equipment_Models em ON et.model_id = em.id
+                {where}
+                ORDER BY COALESCE(se.ship_date, '') DESC, se.id DESC
+                LIMIT ?
+            """, params)
+
+            return [self._row_to_shipped_equipment(row) for row in cursor.fetchall()]
+
+    def count_shipped_equipment(
+        self,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search_text: Optional[str] = None
+    ) -> int:
+        """출고 장비 개수 (get_shipped_equipment_page와 같은 조건, JOIN 없는 COUNT)"""
+        clauses, params = self._equipment_filters(
+            configuration_id, customer_name, start_date, end_date, search_text)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM Shipped_Equipment se {where}", params)
+            return cursor.fetchone()[0]
+
+    def get_customer_names(self) -> List[str]:
+        """출고 장비 고객명 목록 (필터용)"""
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT customer_name FROM Shipped_Equipment ORDER BY customer_name")
+            return [row[0] for row in cursor.fetchall()]
+
     def get_shipped_equipment_by_id(self, equipment_id: int) -> Optional[ShippedEquipment]:
         """특정 출고 장비 조회"""
         with self.db_schema.get_connection() as conn:
@@ -218,10 +359,11 @@ class ShippedEquipmentService(IShippedEquipmentService):
             return cursor.rowcount > 0
 
     def delete_shipped_equipment(self, equipment_id: int) -> bool:
-        """출고 장비 삭제 (CASCADE: 파라미터도 함께 삭제)"""
+        """출고 장비 삭제 (파라미터 / 차분 저장소 기준값 연결 / 빠진 키도 함께 삭제)"""
         with self.db_schema.get_connection() as conn:
             cursor = conn.cursor()
 
+            self._storage.delete_equipment_parameters(conn, equipment_id)
             cursor.execute("DELETE FROM Shipped_Equipment WHERE id = ?", (equipment_id,))
             conn.commit()
 
@@ -259,6 +401,69 @@ class ShippedEquipmentService(IShippedEquipmentService):
                 for row in rows
             ]
 
+    def _parameter_filters(self, equipment_id: int, search_text: Optional[str]) -> Tuple[List[str], List[Any]]:
+        clauses = ["shipped_equipment_id = ?"]
+        params: List[Any] = [equipment_id]
+        if search_text:
+            pattern = f"%{search_text}%"
+            clauses.append("(parameter_name LIKE ? OR parameter_value LIKE ? OR module LIKE ? OR part LIKE ?)")
+            params.extend([pattern] * 4)
+        return clauses, params
+
+    def get_parameters_page(
+        self,
+        equipment_id: int,
+        after_name: Optional[str] = None,
+        limit: int = 500,
+        search_text: Optional[str] = None
+    ) -> List[ShippedEquipmentParameter]:
+        """
+        출고 장비 파라미터 한 페이지 조회 (keyset 페이지네이션)
+
+        파라미터 이름 순입니다. 저장 방식과 관계없이 장비별 파라미터 이름은 유일하므로
+        (parameter_storage 참고) 이름만으로 페이지 경계를 정할 수 있습니다.
+        다음 페이지는 마지막 파라미터 이름을 after_name으로 넘깁니다.
+        search_text는 이름 / 값 / 모듈 / 파트 부분 일치입니다.
+        """
+        clauses, params = self._parameter_filters(equipment_id, search_text)
+        if after_name is not None:
+            clauses.append("parameter_name > ?")
+            params.append(after_name)
+        params.append(limit)
+
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT id, shipped_equipment_id, parameter_name, parameter_value,
+                       module, part, data_type
+                FROM Shipped_Equipment_Parameters
+                WHERE {' AND '.join(clauses)}
+                ORDER BY parameter_name
+                LIMIT ?
+            """, params)
+
+            return [
+                ShippedEquipmentParameter(
+                    id=row[0],
+                    shipped_equipment_id=row[1],
+                    parameter_name=row[2],
+                    parameter_value=row[3],
+                    module=row[4],
+                    part=row[5],
+                    data_type=row[6]
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def count_parameters(self, equipment_id: int, search_text: Optional[str] = None) -> int:
+        """출고 장비 파라미터 개수 (get_parameters_page와 같은 조건)"""
+        clauses, params = self._parameter_filters(equipment_id, search_text)
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT COUNT(*) FROM Shipped_Equipment_Parameters WHERE {' AND '.join(clauses)}", params)
+            return cursor.fetchone()[0]
+
     def add_parameters_bulk(
         self,
         equipment_id: int,
@@ -273,6 +478,19 @@ class ShippedEquipmentService(IShippedEquipmentService):
             if not cursor.fetchone():
                 raise ValueError(f"Invalid equipment_id: {equipment_id}")
 
+            # 차분 저장소: Configuration 기준값과 다른 값 / 빠진 키만 저장
+            if self._storage.deltas(conn):
+                inserted = self._storage.insert_parameter_deltas(
+                    cursor, equipment_id, parameters, self._infer_data_type)
+                conn.commit()
+                return inserted
+
+            # 정규화 저장소: 키 사전 + (장비, 키, 값) 집합 단위 추가
+            if self._storage.normalized(conn):
+                inserted = self._storage.insert_parameters(cursor, equipment_id, parameters)
+                conn.commit()
+                return inserted
+
             # Batch insert (1000개씩)
             batch_size = 1000
             total_inserted = 0
@@ -304,10 +522,14 @@ class ShippedEquipmentService(IShippedEquipmentService):
 
     # ==================== File Import ====================
 
-    def parse_equipment_file(self, file_path: str) -> FileParseResult:
+    @staticmethod
+    def parse_equipment_file(file_path: str) -> FileParseResult:
         """
         장비 데이터 파일 파싱 ({Serial}_{Customer}_{Model}.txt)
 
+        DB를 사용하지 않으므로 작업 프로세스에서 클래스로 바로 호출할 수 있습니다
+        (ShippedEquipmentService.parse_equipment_file(path)).
+
         파일명 형식: U27005-100225_Intel Hillsboro #4_NX-Hybrid WLI.txt
                     D27004-211124_Samsung_NX-Mask.txt
 
@@ -370,7 +592,7 @@ class ShippedEquipmentService(IShippedEquipmentService):
                             'parameter_value': item_value,
                             'module': module,
                             'part': part,
-                            'data_type': item_type if item_type else self._infer_data_type(item_value)
+                            'data_type': item_type if item_type else ShippedEquipmentService._infer_data_type(item_value)
                         }
                     else:
                         # 기존 Key=Value 형식
@@ -385,7 +607,7 @@ class ShippedEquipmentService(IShippedEquipmentService):
                             'parameter_value': value,
                             'module': None,
                             'part': None,
-                            'data_type': self._infer_data_type(value)
+                            'data_type': ShippedEquipmentService._infer_data_type(value)
                         }
 
                         # Module.Part.ItemName 구조 파싱
@@ -422,10 +644,26 @@ class ShippedEquipmentService(IShippedEquipmentService):
         auto_match: bool = True
     ) -> Tuple[bool, str, Optional[int]]:
         """파일에서 출고 장비 데이터 임포트"""
-        try:
-            # 1. 파일 파싱
-            parse_result = self.parse_equipment_file(file_path)
+        # 1. 파일 파싱
+        parse_result = self.parse_equipment_file(file_path)
+        return self.import_parsed(parse_result, configuration_id, auto_match, Path(file_path).name)
 
+    def import_parsed(
+        self,
+        parse_result: FileParseResult,
+        configuration_id: Optional[int] = None,
+        auto_match: bool = True,
+        source_name: Optional[str] = None
+    ) -> Tuple[bool, str, Optional[int]]:
+        """
+        파싱된 파일 결과를 출고 장비 데이터로 저장
+
+        파싱은 여러 프로세스에서 나눠 하고 DB 쓰기만 한 곳에서 할 때 사용합니다.
+
+        Args:
+            source_name: 비고(notes)에 남길 원본 파일 이름
+        """
+        try:
             if not parse_result.success:
                 return False, f"File parsing failed: {parse_result.error_message}", None
 
@@ -462,7 +700,7 @@ class ShippedEquipmentService(IShippedEquipmentService):
                 serial_number=parse_result.serial_number,
                 customer_name=parse_result.customer_name,
                 ship_date=date.today(),  # 기본값: 오늘
-                notes=f"Imported from {Path(file_path).name}"
+                notes=f"Imported from {source_name}" if source_name else None
             )
 
             # 5. Parameters 일괄 삽입
@@ -534,6 +772,119 @@ class ShippedEquipmentService(IShippedEquipmentService):
                     values=values
                 )
 
+    def get_parameter_deviations(
+        self,
+        parameter_name: str,
+        configuration_id: Optional[int] = None
+    ) -> List[Tuple[str, Optional[str], str]]:
+        """특정 파라미터가 기준값(Default DB)과 다른 출고 장비 (출고 값이 None이면 빠진 파라미터)"""
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            config_filter = " AND se.configuration_id = ?" if configuration_id else ""
+
+            if self._storage.deltas(conn):
+                # 저장된 차이만 읽음: 이름 → 키 → 값 / 빠진 키 (인덱스 조회)
+                query = f"""
+                    SELECT se.serial_number, v.parameter_value, bv.parameter_value
+                    FROM Parameter_Keys k
+                    JOIN Shipped_Parameter_Values v ON v.key_id = k.id
+                    JOIN Shipped_Equipment_Baselines eb ON eb.shipped_equipment_id = v.shipped_equipment_id
+                    JOIN Shipped_Baseline_Values bv ON bv.baseline_id = eb.baseline_id AND bv.key_id = k.id
+                    JOIN Shipped_Equipment se ON se.id = v.shipped_equipment_id
+                    WHERE k.parameter_name = ?{config_filter}
+                    UNION ALL
+                    SELECT se.serial_number, NULL, bv.parameter_value
+                    FROM Parameter_Keys k
+                    JOIN Shipped_Parameter_Removals r ON r.key_id = k.id
+                    JOIN Shipped_Equipment_Baselines eb ON eb.shipped_equipment_id = r.shipped_equipment_id
+                    JOIN Shipped_Baseline_Values bv ON bv.baseline_id = eb.baseline_id AND bv.key_id = k.id
+                    JOIN Shipped_Equipment se ON se.id = r.shipped_equipment_id
+                    WHERE k.parameter_name = ?{config_filter}
+                    ORDER BY 1
+                """
+            elif has_configuration_defaults(cursor):
+                query = f"""
+                    SELECT se.serial_number, sep.parameter_value, d.default_value
+                    FROM Shipped_Equipment_Parameters sep
+                    JOIN Shipped_Equipment se ON se.id = sep.shipped_equipment_id
+                    JOIN Default_DB_Values d
+                        ON d.configuration_id = se.configuration_id AND d.parameter_name = sep.parameter_name
+                    WHERE sep.parameter_name = ? AND sep.parameter_value != d.default_value{config_filter}
+                    UNION ALL
+                    SELECT se.serial_number, NULL, d.default_value
+                    FROM Default_DB_Values d
+                    JOIN Shipped_Equipment se ON se.configuration_id = d.configuration_id
+                    WHERE d.parameter_name = ?{config_filter}
+                      AND EXISTS (SELECT 1 FROM Shipped_Equipment_Parameters p WHERE p.shipped_equipment_id = se.id)
+                      AND NOT EXISTS (SELECT 1 FROM Shipped_Equipment_Parameters p
+                                      WHERE p.shipped_equipment_id = se.id AND p.parameter_name = d.parameter_name)
+                    ORDER BY 1
+                """
+            else:
+                return []
+
+            params = [parameter_name] + ([configuration_id] if configuration_id else [])
+            cursor.execute(query, params * 2)
+            return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
+    def get_parameter_matrix(
+        self,
+        configuration_id: Optional[int] = None,
+        customer_name: Optional[str] = None,
+        parameter_names: Optional[List[str]] = None,
+        chunk_size: int = 500
+    ) -> 'ParameterMatrix':
+        """
+        출고 장비 × 파라미터 매트릭스 (Serial 순)
+
+        값은 장비 chunk_size대씩 (행, 열, 값 코드) 정수로 읽어 NumPy 배열에 채웁니다.
+        NumPy는 이 메서드를 처음 호출할 때 로드됩니다.
+        """
+        from .parameter_matrix import build_parameter_matrix
+
+        clauses, params = self._equipment_filters(configuration_id, customer_name, None, None, None)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT se.id, se.serial_number FROM Shipped_Equipment se {where} "
+                           f"ORDER BY se.serial_number", params)
+            equipment = [(row[0], row[1]) for row in cursor.fetchall()]
+            return build_parameter_matrix(conn, equipment, parameter_names, chunk_size)
+
+    def search_parameter_names(self, query: str, limit: int = 50) -> List[Tuple[str, int]]:
+        """
+        출고 파라미터 이름 검색
+
+        수백만 행의 Shipped_Equipment_Parameters 대신 고유 이름 색인만 검색하므로
+        데이터 양과 무관하게 즉시 응답합니다. 색인이 없으면 LIKE + DISTINCT 입니다.
+        """
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            fts = self._search.table_for(conn, PARAMETER_NAMES_TABLE)
+            expression = match_expression(query)
+
+            if fts and expression:
+                cursor.execute(f"""
+                    SELECT n.name, n.usage_count
+                    FROM {fts} f
+                    JOIN {PARAMETER_NAMES_TABLE} n ON n.rowid = f.rowid
+                    WHERE {fts} MATCH ?
+                    ORDER BY f.rank, n.usage_count DESC
+                    LIMIT ?
+                """, (expression, limit))
+            else:
+                cursor.execute("""
+                    SELECT parameter_name, COUNT(*)
+                    FROM Shipped_Equipment_Parameters
+                    WHERE parameter_name LIKE ?
+                    GROUP BY parameter_name
+                    ORDER BY COUNT(*) DESC
+                    LIMIT ?
+                """, (f"%{query}%", limit))
+
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
     # ==================== Auto Matching ====================
 
     def match_configuration(
@@ -610,7 +961,8 @@ class ShippedEquipmentService(IShippedEquipmentService):
             model_name=row[12]
         )
 
-    def _infer_data_type(self, value: str) -> str:
+    @staticmethod
+    def _infer_data_type(value: str) -> str:
         """값에서 데이터 타입 추론"""
         # 정수
         if re.match(r'^-?\d+$', value):
@@ -4,8 +4,6 @@ import os
 import re
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
-import tkinter as tk
-from tkinter import messagebox
 
 class TextFileHandler:
     """
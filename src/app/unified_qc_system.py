@@ -11,6 +11,9 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 
+from app.qc.qc_kernel import evaluate_bounds, rules_from_spec_columns
+from app.qc.typed_shadow import column_shadow
+
 class UnifiedQCSystem:
     """통합 QC 검수 시스템 - 단일 진입점 (간소화)"""
     
@@ -84,14 +87,17 @@ class UnifiedQCSystem:
         """종합적인 QC 검사 실행"""
         results = []
         
-        for idx, row in df.iterrows():
+        # 스펙 범위 검증은 공통 QC 커널로 컬럼 단위 일괄 수행
+        spec_issues = self._check_spec_compliance(df)
+        
+        for idx, row in enumerate(df.to_dict('records')):
             param_results = []
             
             # 1. 기본 데이터 검증
             param_results.extend(self._check_basic_data_integrity(row))
             
             # 2. 스펙 범위 검증
-            param_results.extend(self._check_spec_compliance(row))
+            param_results.extend(spec_issues[idx])
             
             # 3. 체크리스트 전용 검증 (해당되는 경우)
             if row['is_checklist'] or mode == "checklist_only":
@@ -124,49 +130,39 @@ class UnifiedQCSystem:
         
         return issues
     
-    def _check_spec_compliance(self, row: pd.Series) -> List[Dict]:
-        """스펙 준수 검사"""
-        issues = []
+    def _check_spec_compliance(self, df: pd.DataFrame) -> List[List[Dict]]:
+        """스펙 준수 검사 (행별 이슈 목록 반환)"""
+        issues = [[] for _ in range(len(df))]
+        if df.empty:
+            return issues
         
-        try:
-            default_val = float(str(row['default_value']).replace(',', ''))
-            
-            # Min 스펙 검사
-            if not pd.isna(row['min_spec']) and str(row['min_spec']).strip():
-                min_val = float(str(row['min_spec']).replace(',', ''))
-                if default_val < min_val:
-                    issues.append({
-                        'parameter': row['parameter_name'],
-                        'issue_type': 'Spec Out',
-                        'description': f'기본값 {default_val}이 최소 스펙 {min_val}보다 작습니다.',
-                        'severity': '높음'
-                    })
-            
-            # Max 스펙 검사
-            if not pd.isna(row['max_spec']) and str(row['max_spec']).strip():
-                max_val = float(str(row['max_spec']).replace(',', ''))
-                if default_val > max_val:
-                    issues.append({
-                        'parameter': row['parameter_name'],
-                        'issue_type': 'Spec Out',
-                        'description': f'기본값 {default_val}이 최대 스펙 {max_val}보다 큽니다.',
-                        'severity': '높음'
-                    })
-        
-        except ValueError:
-            # 숫자가 아닌 값은 스킵
-            pass
-        except Exception as e:
-            issues.append({
-                'parameter': row.get('parameter_name', 'Unknown'),
-                'issue_type': 'Data Error',
-                'description': f'스펙 검사 중 오류 발생: {str(e)}',
-                'severity': '중간'
+        names = df['parameter_name'].tolist()
+        rules = rules_from_spec_columns(names, df['min_spec'].tolist(), df['max_spec'].tolist())
+        shadow = column_shadow(df, 'default_value', strip_commas=True)
+        numeric = shadow.numeric
+        
+        # 최소 / 최대 스펙 위반을 각각 판정 - min > max이면 두 이슈를 모두 보고
+        # (숫자가 아닌 기본값은 검사 생략)
+        below_min, above_max = evaluate_bounds(shadow.values, rules, shadow=shadow)
+        
+        for i in np.flatnonzero(below_min):
+            issues[i].append({
+                'parameter': names[i],
+                'issue_type': 'Spec Out',
+                'description': f'기본값 {numeric[i]}이 최소 스펙 {rules.min_values[i]}보다 작습니다.',
+                'severity': '높음'
+            })
+        
+        for i in np.flatnonzero(above_max):
+            issues[i].append({
+                'parameter': names[i],
+                'issue_type': 'Spec Out',
+                'description': f'기본값 {numeric[i]}이 최대 스펙 {rules.max_values[i]}보다 큽니다.',
+                'severity': '높음'
             })
         
         return issues
     
-    
     def _check_critical_parameters(self, row: pd.Series) -> List[Dict]:
         """중요 파라미터 전용 검사"""
         issues = []
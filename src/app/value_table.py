@@ -0,0 +1,172 @@
+"""
+값 코드 테이블 (Value Interning)
+
+고유 값마다 정수 코드를 하나씩 부여합니다 (코드 0 = 값 없음).
+같은 값은 항상 같은 코드이므로 값 비교를 정수 비교로 처리할 수 있고,
+값 배열은 int32 코드 배열 + 고유 값 목록으로 보관할 수 있습니다.
+
+정규화 옵션(앞뒤 공백 / 대소문자 / 숫자 표기)은 코드를 부여할 때 한 번만 적용합니다.
+- 코드: 원래 값 그대로 구분 (표시 / 내보내기용, "1.0"과 "1"은 다른 코드)
+- 정규화 코드: 정규화 후 같은 값이면 같은 코드 (비교용, 그 값 중 처음 등록된 값의 코드)
+옵션을 쓰지 않으면 정규화 코드 = 코드입니다.
+"""
+
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+MISSING_CODE = 0
+CODE_DTYPE = np.int32
+
+# 숫자 표기 통일 대상 (부호, 소수점, 지수만 허용 - "1_000", "nan", "inf"는 문자열로 비교)
+_NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+@dataclass(frozen=True)
+class NormalizeOptions:
+    """값 비교 정규화 옵션"""
+    trim: bool = False          # 앞뒤 공백 무시
+    ignore_case: bool = False   # 대소문자 무시
+    numeric: bool = False       # 숫자 표기 통일 ("1.0" == "1" == "1e0" == "01")
+
+    @property
+    def enabled(self) -> bool:
+        return self.trim or self.ignore_case or self.numeric
+
+    @classmethod
+    def from_settings(cls, options: Optional[Dict[str, Any]]) -> 'NormalizeOptions':
+        """settings.json의 {"trim": bool, "ignore_case": bool, "numeric": bool}"""
+        options = options or {}
+        return cls(trim=bool(options.get('trim')), ignore_case=bool(options.get('ignore_case')),
+                   numeric=bool(options.get('numeric')))
+
+    @classmethod
+    def parse(cls, text: Optional[str]) -> 'NormalizeOptions':
+        """쉼표로 구분한 옵션 이름 (trim, case, numeric) - 명령줄 / API용"""
+        names = {'trim': 'trim', 'case': 'ignore_case', 'numeric': 'numeric'}
+        selected = {}
+        for name in filter(None, (part.strip().lower() for part in (text or '').split(','))):
+            if name not in names:
+                raise ValueError(f"알 수 없는 정규화 옵션: {name} (사용 가능: {', '.join(names)})")
+            selected[names[name]] = True
+        return cls(**selected)
+
+    def normalize(self, value: str) -> str:
+        """비교용 값 (숫자로 읽히는 값은 표기를 통일, 나머지는 공백 / 대소문자 옵션 적용)"""
+        text = value.strip() if self.trim else value
+        if self.numeric and _NUMBER_PATTERN.fullmatch(text):
+            number = _canonical_number(text)
+            if number is not None:
+                return number
+        return text.casefold() if self.ignore_case else text
+
+
+def _canonical_number(text: str) -> Optional[str]:
+    """숫자 문자열의 통일 표기 (정수는 정수 그대로, 실수는 정수 값이면 정수로)"""
+    if '.' not in text and 'e' not in text and 'E' not in text:
+        return str(int(text))
+    number = float(text)
+    if number != number or number in (float('inf'), float('-inf')):
+        return None
+    if number.is_integer() and abs(number) < _EXACT_FLOAT_INT:
+        return str(int(number))
+    return repr(number)
+
+
+def text_values(values: Iterable) -> List[Optional[str]]:
+    """값 목록 → 문자열 목록 (None / NaN은 None)"""
+    return [None if value is None or value != value else str(value) for value in values]
+
+
+class ValueTable:
+    """값 ↔ int32 코드 사전 (추가만 가능, 코드는 해제 전까지 바뀌지 않음)"""
+
+    def __init__(self, options: Optional[NormalizeOptions] = None):
+        self.options = options or NormalizeOptions()
+        self._codes: Dict[Any, int] = {}
+        self._values: List[Any] = [None]
+        self._canonical: List[int] = [MISSING_CODE]
+        self._classes: Dict[Any, int] = {}  # 정규화 값 → 정규화 코드 (옵션을 쓸 때만)
+        self._array: Optional[np.ndarray] = None
+        self._canonical_array: Optional[np.ndarray] = None
+        self._value_bytes = 0
+
+    def __len__(self) -> int:
+        """고유 값 수 (값 없음 제외)"""
+        return len(self._values) - 1
+
+    def code(self, value) -> int:
+        """값의 코드 (처음 보는 값이면 새 코드 부여, None은 값 없음)"""
+        if value is None:
+            return MISSING_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+            if self.options.enabled:
+                key = self.options.normalize(value) if isinstance(value, str) else value
+                self._canonical.append(self._classes.setdefault(key, code))
+            else:
+                self._canonical.append(code)
+            self._value_bytes += sys.getsizeof(value)
+        return code
+
+    def lookup(self, value) -> Optional[int]:
+        """이미 있는 값의 코드 (없으면 None, 새 코드를 만들지 않음)"""
+        if value is None:
+            return MISSING_CODE
+        return self._codes.get(value)
+
+    def encode(self, values: Sequence) -> np.ndarray:
+        """값 목록 → 코드 배열"""
+        code = self.code
+        return np.fromiter((code(value) for value in values), dtype=CODE_DTYPE, count=len(values))
+
+    def value(self, code: int):
+        """코드 → 값 (값 없음은 None)"""
+        return self._values[code]
+
+    def decode(self, codes) -> np.ndarray:
+        """코드 배열 → 값 object 배열"""
+        return self.array().take(np.asarray(codes, dtype=np.intp))
+
+    def array(self) -> np.ndarray:
+        """코드 순서의 값 배열 (0번은 None, 새 값이 생기면 다시 만듦)"""
+        if self._array is None or len(self._array) != len(self._values):
+            array = np.empty(len(self._values), dtype=object)
+            array[:] = self._values
+            self._array = array
+        return self._array
+
+    def canonical(self, codes) -> np.ndarray:
+        """코드 배열 → 정규화 코드 배열 (옵션을 쓰지 않으면 그대로)"""
+        if not self.options.enabled:
+            return np.asarray(codes, dtype=CODE_DTYPE)
+        if self._canonical_array is None or len(self._canonical_array) != len(self._canonical):
+            self._canonical_array = np.array(self._canonical, dtype=CODE_DTYPE)
+        return self._canonical_array.take(np.asarray(codes, dtype=np.intp))
+
+    def canonical_code(self, code: int) -> int:
+        """코드 하나의 정규화 코드"""
+        return self._canonical[code]
+
+    def values(self) -> Iterable:
+        """등록된 값 (코드 순서)"""
+        return iter(self._values[1:])
+
+    @property
+    def nbytes(self) -> int:
+        """대략적인 메모리 사용량 (값 객체 + 사전 / 목록 / 배열)"""
+        size = (self._value_bytes + sys.getsizeof(self._codes) + sys.getsizeof(self._values)
+                + sys.getsizeof(self._canonical) + sys.getsizeof(self._classes))
+        for array in (self._array, self._canonical_array):
+            if array is not None:
+                size += array.nbytes
+        return size
+
+    def clear(self):
+        self.__init__(self.options)
@@ -0,0 +1,88 @@
+"""
+뷰 데이터 모델 - Treeview에 표시 중인 표의 원본 데이터
+
+뷰(Treeview)는 화면에 그릴 행만 위젯에 넣고, 표 전체는 TableModel로 제공합니다.
+내보내기 / 통계는 위젯 항목(tree.item(...)["values"])을 읽지 않고 모델에서 바로 처리하므로
+행 수와 무관하게 Tk 호출이 없고 값의 타입도 유지됩니다.
+
+- columns: {컬럼: 값 배열} (list / numpy 배열) 또는 DataFrame
+- rows: 현재 필터 / 정렬이 적용된 행 위치 목록 (None이면 전체, 원래 순서)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class TableModel:
+    """컬럼 배열 + 현재 표시 행(필터 마스크)"""
+
+    def __init__(self, columns, rows: Optional[Sequence[int]] = None):
+        """
+        Args:
+            columns: {컬럼: 값 배열} 또는 DataFrame (모델은 배열을 복사하지 않으므로
+                     만든 뒤 원본 배열을 제자리 수정하지 않아야 함)
+            rows: 표시 행 위치 목록 (None이면 전체)
+        """
+        self._columns = columns
+        self.rows = rows
+
+    @classmethod
+    def from_mask(cls, columns, mask) -> 'TableModel':
+        """bool 마스크(list / numpy 배열)로 표시 행 지정"""
+        if hasattr(mask, 'nonzero'):
+            return cls(columns, mask.nonzero()[0])
+        return cls(columns, [i for i, visible in enumerate(mask) if visible])
+
+    @property
+    def column_names(self) -> List[str]:
+        return [str(column) for column in self._columns]
+
+    @property
+    def row_count(self) -> int:
+        """전체 행 수 (필터 전)"""
+        if hasattr(self._columns, 'iloc'):
+            return len(self._columns)
+        for values in self._columns.values():
+            return len(values)
+        return 0
+
+    def __len__(self) -> int:
+        """표시 행 수"""
+        return self.row_count if self.rows is None else len(self.rows)
+
+    def with_rows(self, rows: Optional[Sequence[int]]) -> 'TableModel':
+        """같은 컬럼에 다른 필터를 적용한 모델"""
+        return TableModel(self._columns, rows)
+
+    def select(self, column_names: Sequence[str]) -> 'TableModel':
+        """일부 컬럼만 가진 모델 (순서는 column_names)"""
+        if hasattr(self._columns, 'iloc'):
+            return TableModel(self._columns[list(column_names)], self.rows)
+        return TableModel({name: self._columns[name] for name in column_names}, self.rows)
+
+    def visible_columns(self) -> Dict[str, Any]:
+        """표시 행만 모은 {컬럼: 값 배열} 또는 DataFrame"""
+        columns, rows = self._columns, self.rows
+        if hasattr(columns, 'iloc'):
+            return columns if rows is None else columns.iloc[list(rows)]
+        if rows is None:
+            return dict(columns)
+        return {name: values.take(rows) if hasattr(values, 'take') else [values[i] for i in rows]
+                for name, values in columns.items()}
+
+    def records(self) -> List[Dict[str, Any]]:
+        """표시 행을 dict 목록으로"""
+        columns = self.visible_columns()
+        if hasattr(columns, 'iloc'):
+            return columns.to_dict('records')
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def export_sheet(self, name: str = "Sheet1"):
+        """
+        내보내기 시트 (표시 행 추출은 내보내기 작업 스레드에서 실행)
+
+        모델은 만든 시점의 컬럼 배열 / 표시 행을 가지므로 내보내는 동안 뷰가 바뀌어도 영향이 없습니다.
+        """
+        from app.services.common.export_service import ExportSheet
+
+        return ExportSheet(name, self.visible_columns)
@@ -38,6 +38,29 @@ class CheckboxTreeview(ttk.Treeview):
         self._set_checkbox_image(item)
         return item
 
+    def delete(self, *items):
+        """아이템 삭제 시 해당 아이템과 하위 아이템의 체크박스 변수도 해제"""
+        for item in items:
+            self._forget_checkboxes(item)
+        super().delete(*items)
+
+    def _forget_checkboxes(self, item):
+        """아이템과 하위 아이템의 체크박스 변수 제거 (BooleanVar는 참조가 사라질 때 Tcl 변수 해제)"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            self.checkboxes.pop(current, None)
+            stack.extend(self.get_children(current))
+
+    def clear(self):
+        """모든 아이템과 체크박스 변수 제거"""
+        super().delete(*self.get_children())
+        self.checkboxes.clear()
+
+    def destroy(self):
+        self.checkboxes.clear()
+        super().destroy()
+
     def _set_checkbox_image(self, item):
         """체크박스 이미지 설정"""
         if self.checkboxes[item].get():
@@ -62,7 +85,8 @@ class CheckboxTreeview(ttk.Treeview):
 
     def is_checked(self, item) -> bool:
         """아이템의 체크 상태 반환"""
-        return self.checkboxes.get(item, tk.BooleanVar(value=False)).get()
+        var = self.checkboxes.get(item)
+        return var.get() if var is not None else False
 
     def check(self, item):
         """아이템 체크"""
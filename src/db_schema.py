@@ -10,6 +10,8 @@ import sqlite3
 from datetime import datetime
 from contextlib import contextmanager
 
+from app.services.common.write_queue import writer_connection
+
 class DBSchema:
     """
     DB Manager 애플리케이션의 로컬 데이터베이스 스키마를 관리하는 클래스
@@ -49,6 +51,9 @@ class DBSchema:
         Yields:
             sqlite3.Connection: 데이터베이스 연결 객체
         """
+        # 쓰기 큐 작업 안에서는 쓰기 스레드의 연결을 사용 (작업 단위 트랜잭션)
+        if conn_override is None:
+            conn_override = writer_connection(self.db_path)
         conn_provided = conn_override is not None
         conn = conn_override if conn_provided else sqlite3.connect(self.db_path)
 
@@ -218,7 +223,13 @@ class DBSchema:
             ''')
 
             # Phase 2: 출고 장비 파라미터 Raw Data 테이블
-            cursor.execute('''
+            # (정규화 저장소로 전환한 DB는 같은 이름의 호환 VIEW가 있으므로 건너뜀)
+            cursor.execute("SELECT type FROM sqlite_master WHERE name = 'Shipped_Equipment_Parameters'")
+            row = cursor.fetchone()
+            parameters_is_view = row is not None and row[0] == 'view'
+
+            if not parameters_is_view:
+                cursor.execute('''
             CREATE TABLE IF NOT EXISTS Shipped_Equipment_Parameters (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 shipped_equipment_id INTEGER NOT NULL,
@@ -232,16 +243,26 @@ class DBSchema:
             )
             ''')
 
-            # Phase 2: 인덱스 생성
-            cursor.execute('''
+                # Phase 2: 인덱스 생성
+                cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_shipped_params_equipment
             ON Shipped_Equipment_Parameters(shipped_equipment_id)
             ''')
 
-            cursor.execute('''
+                cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_shipped_params_name
             ON Shipped_Equipment_Parameters(parameter_name)
             ''')
+            else:
+                # 이전 버전이 만든 VIEW 쓰기 트리거 (장비별 이름 중복 검사 없음) 갱신
+                from app.services.shipped_equipment.parameter_storage import upgrade_view_triggers
+                upgrade_view_triggers(cursor)
+
+            # 출고 장비 목록 keyset 페이지 (출고일 최신순, ID 역순)
+            cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_shipped_equipment_ship_date
+            ON Shipped_Equipment(COALESCE(ship_date, ''), id)
+            ''')
 
             conn.commit()
     
@@ -415,8 +436,9 @@ class DBSchema:
             cursor = conn.cursor()
             
             try:
-                # 트랜잭션 시작
-                conn.execute("BEGIN TRANSACTION")
+                # 트랜잭션 시작 (쓰기 큐 작업 안에서는 이미 트랜잭션 중)
+                if not conn.in_transaction:
+                    conn.execute("BEGIN TRANSACTION")
                 
                 # 관련 기본값 삭제
                 cursor.execute("DELETE FROM Default_DB_Values WHERE equipment_type_id = ?", (equipment_type_id,))
@@ -5,6 +5,10 @@ DB Manager 애플리케이션 메인 진입점
 
 import sys
 import os
+import time
+
+# 시작 시간 측정 (import 포함)
+_START_TIME = time.perf_counter()
 
 # 현재 파일의 디렉토리를 sys.path에 추가하여 app 모듈을 찾을 수 있도록 함
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -13,10 +17,17 @@ if current_dir not in sys.path:
 
 from app.manager import DBManager
 
+_IMPORT_TIME = time.perf_counter() - _START_TIME
+
 def main():
     """메인 함수"""
     try:
         app = DBManager()
+        # 창이 처음 표시된 뒤(이벤트 루프 첫 idle) 시작 시간 기록
+        app.window.after_idle(lambda: app.update_log(
+            f"[시작] 창 표시 {time.perf_counter() - _START_TIME:.2f}초 "
+            f"(모듈 import {_IMPORT_TIME:.2f}초) - 상세: python tools/startup_report.py"
+        ))
         app.window.mainloop()
     except Exception as e:
         print(f"애플리케이션 실행 중 오류 발생: {e}")
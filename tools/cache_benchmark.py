@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CacheService 벤치마크
+
+현재 CacheService와 이전 구현(datetime 기반, 항목 수 제한만 있는 LRU)을 비교합니다.
+
+1. 조회(hit) / 저장 처리량
+2. 메모리 예산: 2만 행 Default DB 목록 + 작은 항목들을 저장했을 때 남는 항목 / 추정 크기
+3. 동시 로드: 여러 스레드가 같은 키를 동시에 요청할 때 loader(DB 조회) 실행 횟수
+
+사용법:
+    python tools/cache_benchmark.py
+    python tools/cache_benchmark.py --iterations 500000 --threads 32
+"""
+
+import sys
+import os
+import argparse
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from app.services.common.cache_service import CacheService, estimate_size
+
+
+class LegacyCacheService:
+    """비교용 이전 구현 (get / set 핵심 동작만 유지)"""
+
+    class Entry:
+        def __init__(self, value, ttl_seconds=None):
+            self.value = value
+            self.created_at = datetime.now()
+            self.expires_at = None
+            if ttl_seconds:
+                self.expires_at = self.created_at + timedelta(seconds=ttl_seconds)
+            self.access_count = 0
+            self.last_accessed = self.created_at
+
+        def is_expired(self):
+            if self.expires_at is None:
+                return False
+            return datetime.now() > self.expires_at
+
+        def access(self):
+            self.last_accessed = datetime.now()
+            self.access_count += 1
+            return self.value
+
+    def __init__(self, max_size=1000, default_ttl=None):
+        self._cache = OrderedDict()
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._cache:
+                return None
+            entry = self._cache[key]
+            if entry.is_expired():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry.access()
+
+    def set(self, key, value, ttl_seconds=None):
+        with self._lock:
+            effective_ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+            entry = self.Entry(value, effective_ttl)
+            if key in self._cache:
+                del self._cache[key]
+            self._cache[key] = entry
+            while len(self._cache) > self._max_size:
+                del self._cache[next(iter(self._cache))]
+
+    def get_or_load(self, key, loader, ttl_seconds=None):
+        """기존 서비스 코드의 조회 → 없으면 로드 → 저장 패턴"""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value, ttl_seconds)
+        return value
+
+
+def _rate(count, seconds):
+    return f"{count / seconds / 1000:,.0f} k ops/s" if seconds > 0 else "-"
+
+
+def bench_throughput(cache, iterations):
+    """조회(hit) / 저장 처리량"""
+    keys = [f"key_{i}" for i in range(500)]
+    for key in keys:
+        cache.set(key, (key, 1, 'value'))
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        cache.get(keys[i % 500])
+    get_seconds = time.perf_counter() - start
+
+    set_count = iterations // 10
+    start = time.perf_counter()
+    for i in range(set_count):
+        cache.set(keys[i % 500], (i, 'value'))
+    set_seconds = time.perf_counter() - start
+    return _rate(iterations, get_seconds), _rate(set_count, set_seconds)
+
+
+def bench_memory(cache):
+    """큰 목록 1개 + 작은 항목 다수 저장 후 남은 항목 / 추정 크기"""
+    big = [(i, f"PARAM_{i:05d}", f"{i * 0.5:.3f}", "note") for i in range(20000)]
+    cache.set('default_db_values', big)
+    for i in range(900):
+        cache.set(f"small_{i}", (i, 'x'))
+    entries = [cache.get(f"small_{i}") for i in range(900)]
+    kept_small = sum(1 for e in entries if e is not None)
+    kept_big = cache.get('default_db_values') is not None
+    total = estimate_size(big) * kept_big + estimate_size((0, 'x')) * kept_small
+    return kept_big, kept_small, total
+
+
+def bench_concurrent_load(cache, threads, load_seconds=0.02):
+    """같은 키 동시 요청 시 loader 실행 횟수"""
+    calls = []
+    calls_lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def loader():
+        with calls_lock:
+            calls.append(1)
+        time.sleep(load_seconds)
+        return ['checklist'] * 100
+
+    def worker():
+        barrier.wait()
+        cache.get_or_load('checklist_equipment_1', loader, ttl_seconds=300)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return len(calls), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CacheService 벤치마크 (현재 구현 vs 이전 구현)")
+    parser.add_argument('--iterations', type=int, default=200000, help="조회 반복 횟수")
+    parser.add_argument('--threads', type=int, default=16, help="동시 로드 스레드 수")
+    parser.add_argument('--max-bytes', type=int, default=1024 * 1024, help="메모리 예산 (bytes)")
+    args = parser.parse_args()
+
+    legacy_get, legacy_set = bench_throughput(LegacyCacheService(max_size=1000, default_ttl=300), args.iterations)
+    current_get, current_set = bench_throughput(CacheService(max_size=1000, default_ttl=300), args.iterations)
+
+    legacy_mem = bench_memory(LegacyCacheService(max_size=1000))
+    current_mem = bench_memory(CacheService(max_size=1000, max_bytes=args.max_bytes))
+
+    legacy_loads = bench_concurrent_load(LegacyCacheService(), args.threads)
+    current_loads = bench_concurrent_load(CacheService(), args.threads)
+
+    print("\n⚡ CacheService 벤치마크")
+    print("=" * 70)
+    print(f"{'항목':<36}{'이전 구현':>16}{'현재 구현':>16}")
+    print("-" * 70)
+    print(f"{'조회 (hit)':<36}{legacy_get:>16}{current_get:>16}")
+    print(f"{'저장 (덮어쓰기)':<36}{legacy_set:>16}{current_set:>16}")
+    print(f"{'큰 목록(2만 행) 유지':<36}{str(legacy_mem[0]):>16}{str(current_mem[0]):>16}")
+    print(f"{'작은 항목 유지 (900개 중)':<36}{legacy_mem[1]:>16}{current_mem[1]:>16}")
+    print(f"{'유지 항목 추정 크기 (KB)':<36}{legacy_mem[2] / 1024:>16,.0f}{current_mem[2] / 1024:>16,.0f}")
+    print(f"{f'동시 요청 {args.threads}개 loader 실행':<36}{legacy_loads[0]:>16}{current_loads[0]:>16}")
+    print(f"{'동시 요청 소요 (ms)':<36}{legacy_loads[1] * 1000:>16.1f}{current_loads[1] * 1000:>16.1f}")
+    print("=" * 70)
+    print(f"메모리 예산: {args.max_bytes / 1024:,.0f} KB (이전 구현은 항목 수만 제한)")
+
+
+if __name__ == "__main__":
+    main()
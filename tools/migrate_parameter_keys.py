@@ -0,0 +1,238 @@
+"""
+Shipped Parameter 정규화 마이그레이션 스크립트
+
+목적: 출고 파라미터 저장 공간 절감
+- Parameter_Keys 생성: (parameter_name, module, part, data_type) 내용당 1행
+- Shipped_Parameter_Values 생성: 장비별 (shipped_equipment_id, key_id, parameter_value)
+- Shipped_Equipment_Parameters 테이블 → 같은 컬럼의 호환 VIEW (INSTEAD OF 트리거 포함)
+- 출고 파라미터 이름 색인 트리거 재생성
+- --deltas: 차분 저장소까지 전환 (Configuration Default DB 스냅샷 대비 차이만 저장)
+
+--rollback은 백업 파일 대신 현재 데이터로 기존 테이블을 다시 만듭니다
+(마이그레이션 이후 임포트한 장비도 유지).
+
+사용법:
+    python tools/migrate_parameter_keys.py --db data/local_db.sqlite --dry-run
+    python tools/migrate_parameter_keys.py --db data/local_db.sqlite --vacuum
+    python tools/migrate_parameter_keys.py --db data/local_db.sqlite --deltas --vacuum
+    python tools/migrate_parameter_keys.py --db data/local_db.sqlite --rollback
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import sqlite3
+from datetime import datetime
+from contextlib import contextmanager
+
+from app.services.shipped_equipment.parameter_storage import (
+    KEYS_TABLE, VALUES_TABLE, LEGACY_TABLE, EQUIPMENT_BASELINES_TABLE, REMOVALS_TABLE,
+    MODE_LEGACY, MODE_NORMALIZED, MODE_DELTA, storage_mode, normalize, denormalize,
+    enable_deltas, expand_deltas
+)
+
+MODE_LABELS = {
+    MODE_LEGACY: '기존 테이블',
+    MODE_NORMALIZED: '정규화 (Parameter_Keys)',
+    MODE_DELTA: '차분 (Default DB 기준값 대비)',
+}
+
+
+class ParameterKeysMigration:
+    """출고 파라미터 정규화 마이그레이션 클래스"""
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            # 기본 데이터베이스 경로
+            data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+            self.db_path = os.path.join(data_dir, 'local_db.sqlite')
+        else:
+            self.db_path = db_path
+
+        # 백업 경로
+        backup_dir = os.path.join(os.path.dirname(os.path.abspath(self.db_path)), 'backups')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.backup_path = os.path.join(backup_dir, f'pre_parameter_keys_backup_{timestamp}.sqlite')
+
+    @contextmanager
+    def get_connection(self):
+        """데이터베이스 연결 컨텍스트 매니저"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def backup_database(self):
+        """데이터베이스 백업 (SQLite 온라인 백업)"""
+        if not os.path.exists(self.db_path):
+            print("[WARN]  데이터베이스 파일이 없습니다.")
+            return False
+
+        os.makedirs(os.path.dirname(self.backup_path), exist_ok=True)
+        with self.get_connection() as conn:
+            target = sqlite3.connect(self.backup_path)
+            try:
+                conn.backup(target)
+            finally:
+                target.close()
+        print(f"[OK] 백업 생성: {self.backup_path}")
+        return True
+
+    def report(self, conn, title):
+        """저장 방식 / 행 수 / 파일 크기 출력"""
+        cursor = conn.cursor()
+        print(f"\n=== {title} ===")
+        mode = storage_mode(conn)
+        print(f"  저장 방식: {MODE_LABELS[mode]}")
+
+        cursor.execute(f"SELECT COUNT(*), COUNT(DISTINCT shipped_equipment_id) FROM {LEGACY_TABLE}")
+        rows, equipment = cursor.fetchone()
+        print(f"  파라미터 행: {rows:,}개 (장비 {equipment:,}대)")
+
+        if mode != MODE_LEGACY:
+            cursor.execute(f"SELECT COUNT(*) FROM {KEYS_TABLE}")
+            print(f"  Parameter_Keys: {cursor.fetchone()[0]:,}개")
+        if mode == MODE_DELTA:
+            counts = [cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in (EQUIPMENT_BASELINES_TABLE, VALUES_TABLE, REMOVALS_TABLE)]
+            print(f"  차분: 기준값 연결 장비 {counts[0]:,}대, 저장된 값 {counts[1]:,}개, 빠진 키 {counts[2]:,}개")
+
+        cursor.execute("PRAGMA page_count")
+        page_count = cursor.fetchone()[0]
+        cursor.execute("PRAGMA page_size")
+        page_size = cursor.fetchone()[0]
+        cursor.execute("PRAGMA freelist_count")
+        free_pages = cursor.fetchone()[0]
+        print(f"  DB 크기: {page_count * page_size / 1024 / 1024:.1f} MB "
+              f"(빈 페이지 {free_pages * page_size / 1024 / 1024:.1f} MB)")
+
+    def verify_migration(self, conn, expected_rows):
+        """마이그레이션 검증: 행 수, 키 누락, 호환 VIEW 조회"""
+        cursor = conn.cursor()
+        print("\n=== 마이그레이션 검증 ===")
+
+        cursor.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}")
+        rows = cursor.fetchone()[0]
+        if rows != expected_rows:
+            raise RuntimeError(f"행 수 불일치: {expected_rows} → {rows}")
+        print(f"  [OK] 파라미터 행 수 일치: {rows:,}개")
+
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM {VALUES_TABLE} v
+            LEFT JOIN {KEYS_TABLE} k ON k.id = v.key_id
+            WHERE k.id IS NULL
+        """)
+        orphans = cursor.fetchone()[0]
+        if orphans:
+            raise RuntimeError(f"키 없는 값 행: {orphans}개")
+        print("  [OK] 키 없는 값 행 없음")
+
+        cursor.execute(f"PRAGMA table_info({LEGACY_TABLE})")
+        columns = [row[1] for row in cursor.fetchall()]
+        print(f"  [OK] 호환 VIEW 컬럼: {', '.join(columns)}")
+
+    def rollback(self):
+        """정규화 / 차분 저장소 → 기존 테이블"""
+        print("\n=== 마이그레이션 롤백 ===")
+        with self.get_connection() as conn:
+            mode = storage_mode(conn)
+            if mode == MODE_LEGACY:
+                print("[WARN]  정규화 저장소를 사용하고 있지 않습니다.")
+                return False
+            if mode == MODE_DELTA:
+                expanded = expand_deltas(conn, commit=False)
+                print(f"[OK] 기준값 행 복원: {expanded:,}개")
+            restored = denormalize(conn)
+            print(f"[OK] 기존 테이블 복원: {restored:,}개 행")
+            self.report(conn, "롤백 후")
+        return True
+
+    def run(self, dry_run=False, vacuum=False, deltas=False):
+        """전체 마이그레이션 실행"""
+        print("=" * 80)
+        print("Shipped Parameter 정규화 마이그레이션")
+        print("=" * 80)
+        print(f"데이터베이스: {self.db_path}")
+        print(f"백업 경로: {self.backup_path}")
+        print(f"Dry Run: {dry_run}")
+        print(f"차분 저장소: {deltas}")
+        print("=" * 80)
+
+        if dry_run:
+            print("\n[DRY RUN] 실제 변경은 수행되지 않습니다.\n")
+        elif not self.backup_database():
+            print("[ERROR] 백업 실패. 마이그레이션 중단.")
+            return False
+
+        try:
+            with self.get_connection() as conn:
+                mode = storage_mode(conn)
+                if mode == MODE_DELTA or (mode == MODE_NORMALIZED and not deltas):
+                    print(f"[OK] 이미 {MODE_LABELS[mode]} 저장소를 사용 중입니다.")
+                    return True
+
+                self.report(conn, "마이그레이션 전")
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}")
+                expected_rows = cursor.fetchone()[0]
+
+                if mode == MODE_LEGACY:
+                    result = normalize(conn, commit=False)
+                    print(f"\n[OK] Parameter_Keys {result['keys']:,}개, 값 {result['values']:,}개 이전")
+                if deltas:
+                    result = enable_deltas(conn, commit=False)
+                    print(f"\n[OK] 기준값 스냅샷 {result['baselines']:,}개, 장비 {result['equipment']:,}대 연결 "
+                          f"(저장된 값 {result['values']:,}개, 빠진 키 {result['removed']:,}개)")
+                self.verify_migration(conn, expected_rows)
+
+                if dry_run:
+                    print("\n[WARN]  DRY RUN 모드: 변경사항 롤백")
+                    conn.rollback()
+                    return True
+
+                conn.commit()
+                if vacuum:
+                    print("\nVACUUM 실행 중...")
+                    conn.execute("VACUUM")
+                self.report(conn, "마이그레이션 후")
+
+            print("\n" + "=" * 80)
+            print("마이그레이션 성공!")
+            print("=" * 80)
+            return True
+
+        except Exception as e:
+            print(f"\n[ERROR] 마이그레이션 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Shipped Parameter 정규화 마이그레이션')
+    parser.add_argument('--db', type=str, help='데이터베이스 경로 (기본: data/local_db.sqlite)')
+    parser.add_argument('--dry-run', action='store_true', help='Dry run 모드 (실제 변경 안함)')
+    parser.add_argument('--vacuum', action='store_true', help='마이그레이션 후 VACUUM (파일 크기 축소)')
+    parser.add_argument('--deltas', action='store_true', help='차분 저장소까지 전환 (Default DB 기준값 대비)')
+    parser.add_argument('--rollback', action='store_true', help='기존 테이블로 되돌리기')
+
+    args = parser.parse_args()
+
+    migration = ParameterKeysMigration(db_path=args.db)
+
+    if args.rollback:
+        ok = migration.rollback()
+    else:
+        ok = migration.run(dry_run=args.dry_run, vacuum=args.vacuum, deltas=args.deltas)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
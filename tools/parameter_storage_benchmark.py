@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+출고 파라미터 저장 방식 벤치마크
+
+기존 Shipped_Equipment_Parameters 테이블, 정규화 저장소(Parameter_Keys +
+Shipped_Parameter_Values + 호환 VIEW), 차분 저장소(Configuration 기준값 대비 차이만)를
+같은 데이터로 비교합니다. 장비 값은 Default DB 값에서 약 1%만 다릅니다 (--drift).
+
+1. 임포트: add_parameters_bulk로 장비 N대 × 파라미터 M개 추가 시간
+2. DB 크기: VACUUM 후 파일 크기, 테이블 / 인덱스별 크기 (dbstat 지원 시)
+3. 조회: 장비별 파라미터, 파라미터 이력, 페이지 조회, 파라미터 매트릭스, 기준값과 다른 장비
+
+사용법:
+    python tools/parameter_storage_benchmark.py
+    python tools/parameter_storage_benchmark.py --tools 1000 --parameters 2000
+"""
+
+import sys
+import os
+import argparse
+import itertools
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from app.services.shipped_equipment.parameter_storage import normalize, enable_deltas
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _BenchSchema:
+    """출고 장비 테이블만 가진 벤치마크용 스키마 (db_schema.py와 같은 정의 / 인덱스)"""
+
+    def __init__(self, db_path, layout, defaults):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Default_DB_Values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER,
+                    parameter_name TEXT NOT NULL, default_value TEXT NOT NULL, is_type_common INTEGER DEFAULT 0,
+                    notes TEXT, created_at TIMESTAMP, updated_at TIMESTAMP,
+                    UNIQUE (configuration_id, parameter_name));
+                CREATE TABLE Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER NOT NULL,
+                    configuration_id INTEGER NOT NULL, serial_number TEXT NOT NULL UNIQUE,
+                    customer_name TEXT NOT NULL, ship_date DATE, is_refit INTEGER DEFAULT 0,
+                    original_serial_number TEXT, notes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER NOT NULL,
+                    parameter_name TEXT NOT NULL, parameter_value TEXT NOT NULL,
+                    module TEXT, part TEXT, data_type TEXT,
+                    FOREIGN KEY (shipped_equipment_id) REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+                    UNIQUE (shipped_equipment_id, parameter_name));
+                CREATE INDEX idx_shipped_params_equipment ON Shipped_Equipment_Parameters(shipped_equipment_id);
+                CREATE INDEX idx_shipped_params_name ON Shipped_Equipment_Parameters(parameter_name);
+            """)
+            conn.executemany(
+                "INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value) VALUES (?, ?, ?)",
+                [(configuration_id, p['parameter_name'], p['parameter_value'])
+                 for configuration_id in (1, 2) for p in defaults])
+            conn.commit()
+            if layout != 'legacy':
+                normalize(conn)
+            if layout == 'delta':
+                enable_deltas(conn)
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _parameter_set(count, seed, defaults=None, drift=0.01):
+    """
+    Module.Part.ItemName 형식 파라미터 count개
+
+    defaults가 있으면 그 값에서 drift 비율만 바꾼 장비 파일 (장비마다 다른 위치)
+    """
+    rng = random.Random(seed)
+    parameters = []
+    for i in range(count):
+        module = f"PM{i % 8}"
+        part = ["Chamber", "Heater", "Robot", "Stage", "Gas"][i % 5]
+        item = f"Item_{i:04d}_{'Setpoint' if i % 3 else 'Limit'}"
+        data_type = ["double", "int", "string"][i % 3]
+        if data_type == "string":
+            value = rng.choice(["AUTO", "MANUAL", "ON", "OFF"])
+        elif data_type == "int":
+            value = str(rng.randint(0, 100))
+        else:
+            value = f"{rng.gauss(100, 5):.3f}"
+        if defaults is not None and rng.random() >= drift:
+            value = defaults[i]['parameter_value']
+        parameters.append({
+            'parameter_name': f"{module}.{part}.{item}",
+            'parameter_value': value,
+            'module': module,
+            'part': part,
+            'data_type': data_type,
+        })
+    return parameters
+
+
+def _timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<36} {elapsed * 1000:10.2f} ms")
+    return result, elapsed
+
+
+def _object_sizes(db_path):
+    """테이블 / 인덱스별 크기 (dbstat 가상 테이블이 없으면 빈 목록)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name ORDER BY SUM(pgsize) DESC LIMIT 8").fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+
+
+LAYOUTS = {
+    'legacy': "기존 테이블",
+    'normalized': "정규화 (Parameter_Keys)",
+    'delta': "차분 (기준값 대비)",
+}
+
+
+def run_layout(directory, layout, tools, parameters, drift):
+    """저장 방식 하나에 대해 임포트 / 크기 / 조회 측정"""
+    print(f"\n[{LAYOUTS[layout]}]")
+
+    defaults = _parameter_set(parameters, 0)
+    db_path = os.path.join(directory, f"{layout}.sqlite")
+    schema = _BenchSchema(db_path, layout, defaults)
+    service = ShippedEquipmentService(schema)
+
+    with schema.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, customer_name) "
+            "VALUES (1, ?, ?, 'Customer')",
+            [(1 + i % 2, f"SN{i:06d}") for i in range(tools)])
+        conn.commit()
+
+    start = time.perf_counter()
+    for equipment_id in range(1, tools + 1):
+        service.add_parameters_bulk(equipment_id, _parameter_set(parameters, equipment_id, defaults, drift))
+    import_time = time.perf_counter() - start
+    print(f"  {'임포트 (장비당)':<36} {import_time / tools * 1000:10.2f} ms")
+
+    with schema.get_connection() as conn:
+        conn.execute("VACUUM")
+    size = os.path.getsize(db_path)
+    print(f"  {'DB 크기 (VACUUM 후)':<36} {size / 1024 / 1024:10.1f} MB")
+    for name, object_size in _object_sizes(db_path):
+        print(f"    {name:<34} {object_size / 1024 / 1024:10.1f} MB")
+
+    rng = random.Random(0)
+    sample_ids = [rng.randint(1, tools) for _ in range(20)]
+    name = defaults[parameters // 2]['parameter_name']
+
+    timings = {'import': import_time / tools, 'size': size}
+    next_id = itertools.cycle(sample_ids).__next__
+    _, timings['by_equipment'] = _timed(
+        "장비별 파라미터 (get_parameters_by_equipment)",
+        lambda: service.get_parameters_by_equipment(next_id()), repeat=len(sample_ids))
+    _, timings['page'] = _timed(
+        "파라미터 페이지 (검색 포함)",
+        lambda: service.get_parameters_page(sample_ids[0], limit=500, search_text='heater'), repeat=5)
+    _, timings['history'] = _timed(
+        "파라미터 이력 (get_parameter_history)",
+        lambda: service.get_parameter_history(name, limit=tools), repeat=5)
+    _, timings['matrix'] = _timed(
+        "파라미터 매트릭스 (Configuration 1)",
+        lambda: service.get_parameter_matrix(configuration_id=1))
+    _, timings['deviations'] = _timed(
+        "기준값과 다른 장비 (get_parameter_deviations)",
+        lambda: service.get_parameter_deviations(name), repeat=5)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출고 파라미터 저장 방식 벤치마크")
+    parser.add_argument('--tools', type=int, default=300, help="장비 수")
+    parser.add_argument('--parameters', type=int, default=2000, help="장비당 파라미터 수")
+    parser.add_argument('--drift', type=float, default=0.01, help="Default DB와 다른 값 비율")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"출고 파라미터 저장 방식 벤치마크 (장비 {args.tools}대 × 파라미터 {args.parameters}개)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {layout: run_layout(directory, layout, args.tools, args.parameters, args.drift)
+                   for layout in LAYOUTS}
+
+    print("\n" + "=" * 70)
+    print(f"{'항목':<28} {'기존':>10} {'정규화':>10} {'차분':>10} {'차분/기존':>10}")
+    rows = [
+        ("DB 크기 (MB)", 'size', 1 / 1024 / 1024),
+        ("임포트 / 장비 (ms)", 'import', 1000),
+        ("장비별 파라미터 (ms)", 'by_equipment', 1000),
+        ("파라미터 페이지 (ms)", 'page', 1000),
+        ("파라미터 이력 (ms)", 'history', 1000),
+        ("파라미터 매트릭스 (ms)", 'matrix', 1000),
+        ("기준값과 다른 장비 (ms)", 'deviations', 1000),
+    ]
+    for label, key, scale in rows:
+        legacy = results['legacy'][key]
+        ratio = results['delta'][key] / legacy if legacy else float('nan')
+        values = ''.join(f"{results[layout][key] * scale:10.2f} " for layout in LAYOUTS)
+        print(f"{label:<28} {values}{ratio:9.2f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DB Manager 시작 시간 리포트
+
+`python -X importtime`으로 시작 모듈(app.manager)의 모듈별 import 시간을 측정합니다.
+무거운 라이브러리(pandas, numpy, matplotlib, openpyxl)가 시작 시 로드되는지도 확인합니다.
+
+사용법:
+    python tools/startup_report.py                  # app.manager 기준 상위 20개
+    python tools/startup_report.py --top 40         # 상위 40개
+    python tools/startup_report.py --module app.qc  # 다른 모듈 기준
+"""
+
+import sys
+import os
+import argparse
+import subprocess
+
+# 프로젝트 경로
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_path = os.path.join(project_root, 'src')
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'openpyxl']
+
+
+def measure_imports(module='app.manager'):
+    """
+    새 프로세스에서 모듈을 import 하며 모듈별 import 시간 측정
+
+    Returns:
+        list: [(모듈 이름, 자체 시간(us), 누적 시간(us), 깊이), ...] (import 순서)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=src_path, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def print_report(entries, module, top=20):
+    """리포트 출력"""
+    total_us = sum(self_us for _, self_us, _, _ in entries)
+    loaded = {name for name, _, _, _ in entries}
+
+    print("\n⏱️ DB Manager 시작 시간 리포트")
+    print("=" * 70)
+    print(f"대상 모듈: {module}")
+    print(f"import 모듈 수: {len(entries)}개, 전체 import 시간: {total_us / 1000:.1f} ms")
+
+    print(f"\n📦 누적 시간 상위 {top}개 (하위 import 포함)")
+    print("-" * 70)
+    print(f"{'모듈':<48}{'누적(ms)':>10}{'자체(ms)':>10}")
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:top]:
+        print(f"{name:<48}{cumulative_us / 1000:>10.1f}{self_us / 1000:>10.1f}")
+
+    # app 패키지 모듈별 시간
+    app_entries = [e for e in entries if e[0] == 'app' or e[0].startswith('app.')]
+    print(f"\n🧩 app 패키지 모듈 ({len(app_entries)}개)")
+    print("-" * 70)
+    for name, self_us, cumulative_us, _ in sorted(app_entries, key=lambda e: e[2], reverse=True)[:top]:
+        print(f"{name:<48}{cumulative_us / 1000:>10.1f}{self_us / 1000:>10.1f}")
+
+    print("\n🔍 무거운 라이브러리 로드 여부")
+    print("-" * 70)
+    for heavy in HEAVY_MODULES:
+        status = "로드됨 ⚠️" if heavy in loaded else "지연 로드 ✅"
+        print(f"  {heavy:<14} {status}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB Manager 시작 시간(모듈 import) 리포트")
+    parser.add_argument('--module', default='app.manager', help="측정할 시작 모듈 (기본: app.manager)")
+    parser.add_argument('--top', type=int, default=20, help="출력할 상위 모듈 수")
+    args = parser.parse_args()
+
+    # 첫 실행은 .pyc 생성 시간이 포함되므로 한 번 미리 실행
+    measure_imports(args.module)
+    entries = measure_imports(args.module)
+    print_report(entries, args.module, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+벤치마크 모음 테스트
+
+benchmarks/ (generators, harness, run_benchmarks) 테스트
+- 합성 데이터: 시드가 같으면 같은 파일, 덤프 / 출고 장비 파일이 앱 파서로 읽힘
+- 측정: 백분위, setup 시간 제외, tracemalloc 최대 메모리
+- 회귀 판정: 같은 환경 / 규모 기준, 임계값 + 최소 차이
+- run_benchmarks.main(): 이력 기록, 회귀 시 종료 코드 1 (--no-fail이면 0)
+"""
+
+import sys
+import os
+import json
+import re
+import tempfile
+import time
+
+# 프로젝트 루트 / src 디렉토리를 Python 경로에 추가
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from benchmarks import generators, harness, run_benchmarks
+from benchmarks.suite import CASE_NAMES
+
+TINY_SCALE = ['--files', '2', '--parameters', '300', '--checklist', '10', '--tools', '3',
+              '--tool-parameters', '50', '--models', '1', '--types', '1', '--configurations', '2',
+              '--values', '20']
+
+
+def _read_bytes(paths):
+    contents = []
+    for path in paths:
+        with open(path, 'rb') as handle:
+            contents.append(handle.read())
+    return contents
+
+
+def test_generators():
+    """테스트 1: 합성 데이터 재현성 / 앱 파서 호환"""
+    print("\n=== 테스트 1: 합성 데이터 생성 ===")
+
+    from app.file_reader import read_comparison_file
+    from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        first = generators.write_dump_files(os.path.join(temp_dir, 'a'), 3, 400)
+        second = generators.write_dump_files(os.path.join(temp_dir, 'b'), 3, 400)
+        other = generators.write_dump_files(os.path.join(temp_dir, 'c'), 3, 400, seed=7)
+        assert [os.path.basename(path) for path in first] == ['DUMP_000.txt', 'DUMP_001.txt', 'DUMP_002.txt']
+        assert _read_bytes(first) == _read_bytes(second)
+        assert _read_bytes(first) != _read_bytes(other)
+
+        frames = [read_comparison_file(path)[1] for path in first]
+        assert all(len(frame) == 400 for frame in frames)
+        changed = (frames[0]['ItemValue'].values != frames[1]['ItemValue'].values).sum()
+        assert 0 < changed < 40, changed
+
+        fleet = generators.write_shipped_fleet(os.path.join(temp_dir, 'fleet'), 4, 60)
+        for path in fleet:
+            parsed = ShippedEquipmentService.parse_equipment_file(path)
+            assert parsed.success, parsed.error_message
+            assert parsed.total_count == 60 and parsed.customer_name in generators.CUSTOMERS
+
+    items = generators.checklist_items(400, 25)
+    assert len(items) == 25 and len({item.item_name for item in items}) == 25
+    assert all((item.spec_min is not None) != (item.expected_value is not None) for item in items)
+
+    names = [row[2] for row in generators.parameter_table(2000)]
+    patterns = generators.checklist_patterns(30)
+    matched = [sum(1 for name in names if re.match(p['parameter_pattern'], name)) for p in patterns]
+    assert sum(1 for count in matched if count) > 10
+    assert max(matched) < len(names) / 10
+    assert json.loads(patterns[0]['validation_rule'])['type'] == 'range'
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_harness():
+    """테스트 2: 측정 / 회귀 판정"""
+    print("\n=== 테스트 2: 측정과 회귀 판정 ===")
+
+    assert harness.percentile([5, 1, 3, 2, 4], 50) == 3
+    assert harness.percentile([1, 2], 90) == 1.9
+    assert harness.percentile([], 99) == 0.0
+
+    # setup 시간은 측정에서 제외
+    slow_setup = harness.Case('setup', lambda state: state, setup=lambda: time.sleep(0.02) or 42)
+    stats = harness.measure(slow_setup, repeat=3, warmup=1, trace_memory=False)
+    assert stats['result'] == 42 and len(stats['samples_ms']) == 3
+    assert stats['p99_ms'] < 10 and 'peak_kb' not in stats
+
+    allocate = harness.Case('alloc', lambda _: len(bytearray(8 * 1024 * 1024)))
+    stats = harness.measure(allocate, repeat=2, warmup=0)
+    assert stats['peak_kb'] >= 8 * 1024, stats['peak_kb']
+    assert stats['min_ms'] <= stats['p50_ms'] <= stats['max_ms']
+
+    env = harness.environment()
+    scale = {'files': 3, 'seed': 1}
+
+    def run(p50, peak, scale_=scale, env_=env):
+        return {'scale': scale_, 'environment': env_,
+                'results': {'load': {'p50_ms': p50, 'peak_kb': peak}}}
+
+    history = [run(10.0, 1000.0), run(12.0, 1200.0), run(11.0, 1100.0),
+               run(1.0, 10.0, scale_={'files': 9, 'seed': 1}),
+               run(1.0, 10.0, env_=dict(env, node='other-host'))]
+    reference = harness.baseline(history, scale, env)
+    assert reference['load'] == {'p50_ms': 11.0, 'peak_kb': 1100.0, 'runs': 3}
+    assert harness.baseline(history, scale, env, window=1)['load']['p50_ms'] == 11.0
+
+    regressions = harness.find_regressions({'load': {'p50_ms': 20.0, 'peak_kb': 1150.0}}, reference)
+    assert [(r['case'], r['metric']) for r in regressions] == [('load', 'p50_ms')]
+    assert regressions[0]['ratio'] == round(20.0 / 11.0, 3)
+    regressions = harness.find_regressions({'load': {'p50_ms': 11.5, 'peak_kb': 4000.0}}, reference)
+    assert [r['metric'] for r in regressions] == ['peak_kb']
+
+    # 비율은 넘어도 차이가 작으면 잡음으로 처리
+    tiny = {'load': {'p50_ms': 0.5, 'peak_kb': 10.0}}
+    assert harness.find_regressions({'load': {'p50_ms': 1.5, 'peak_kb': 100.0}}, tiny) == []
+    assert harness.find_regressions({'search': {'p50_ms': 99.0}}, reference) == []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'results', 'history.json')
+        assert harness.load_history(path) == []
+        harness.append_history(path, history[0])
+        harness.append_history(path, history[1])
+        assert harness.load_history(path) == history[:2]
+        assert not os.path.exists(path + '.tmp')
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_run_benchmarks():
+    """테스트 3: 실행 스크립트 (이력 기록 / 회귀 종료 코드)"""
+    print("\n=== 테스트 3: run_benchmarks ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        history_path = os.path.join(temp_dir, 'history.json')
+        common = TINY_SCALE + ['--repeat', '2', '--warmup', '0', '--history', history_path]
+
+        assert run_benchmarks.main(common) == run_benchmarks.EXIT_OK
+        runs = harness.load_history(history_path)
+        assert len(runs) == 1 and list(runs[0]['results']) == CASE_NAMES
+        assert runs[0]['scale']['parameters'] == 300 and runs[0]['scale']['seed'] == generators.DEFAULT_SEED
+        assert runs[0]['results']['bulk_import']['result'] == 3
+        assert all(stats['peak_kb'] > 0 for stats in runs[0]['results'].values())
+        assert runs[0]['regressions'] == []
+
+        # 훨씬 빠른 기준 실행을 넣으면 회귀
+        fast = json.loads(json.dumps(runs[0]))
+        fast['results'] = {'load': dict(fast['results']['load'], p50_ms=0.001)}
+        harness.append_history(history_path, fast)
+        only_load = common + ['--only', 'load', '--no-memory', '--window', '1']
+        assert run_benchmarks.main(only_load + ['--no-record']) == run_benchmarks.EXIT_REGRESSION
+        assert run_benchmarks.main(only_load + ['--no-record', '--no-fail']) == run_benchmarks.EXIT_OK
+        assert len(harness.load_history(history_path)) == 2
+
+        # 다른 규모는 비교하지 않음
+        other_scale = only_load + ['--no-record', '--parameters', '301']
+        assert run_benchmarks.main(other_scale) == run_benchmarks.EXIT_OK
+
+        assert run_benchmarks.main(common + ['--only', 'load,unknown', '--no-record']) == run_benchmarks.EXIT_ERROR
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("벤치마크 모음 테스트 시작\n")
+    print("=" * 60)
+
+    test_generators()
+    test_harness()
+    test_run_benchmarks()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
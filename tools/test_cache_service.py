@@ -0,0 +1,257 @@
+"""
+CacheService 테스트
+
+태그 기반 무효화 / 이름 공간 테스트
+- invalidate_tags(): 태그가 붙은 항목만 제거, 역색인 정리
+- 이름 공간별 clear() 분리, 이름 공간별 통계
+- 공유 캐시를 쓰는 서비스 간 간섭 없음
+- 메모리 예산(추정 크기) 기반 제거, monotonic 시계 만료
+- get_or_load() 동시 요청 시 loader 1회 실행 (single-flight)
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.services.common.cache_service import CacheService, estimate_size
+
+
+def test_tag_invalidation():
+    """태그 기반 무효화"""
+    print("\n=== 테스트 1: 태그 기반 무효화 ===")
+
+    cache = CacheService(max_size=100)
+    cache.set('config_12', 'A', tags=['config:12', 'type:3'])
+    cache.set('config_13', 'B', tags=['config:13', 'type:3'])
+    cache.set('values_12', 'C', tags=['config:12'])
+    cache.set('plain', 'D')
+
+    assert cache.invalidate_tags('config:12') == 2
+    assert cache.get('config_12') is None and cache.get('values_12') is None
+    assert cache.get('config_13') == 'B' and cache.get('plain') == 'D'
+
+    assert cache.invalidate_tags('type:3', 'missing') == 1
+    assert cache.get('config_13') is None
+    assert cache.get_statistics()['tags'] == 0, "빈 태그 색인 정리"
+
+    # 덮어쓰기 시 이전 태그 해제
+    cache.set('k', 1, tags=['old'])
+    cache.set('k', 2, tags=['new'])
+    assert cache.invalidate_tags('old') == 0 and cache.get('k') == 2
+    assert cache.invalidate_tags('new') == 1
+
+    # LRU 제거 시에도 색인 정리
+    small = CacheService(max_size=2)
+    small.set('a', 1, tags=['t'])
+    small.set('b', 2, tags=['t'])
+    small.set('c', 3, tags=['t'])
+    assert small.invalidate_tags('t') == 2
+    assert small.get_statistics()['evictions'] == 1
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_namespaces():
+    """이름 공간 분리 / 통계"""
+    print("\n=== 테스트 2: 이름 공간 ===")
+
+    cache = CacheService(max_size=100)
+    config = cache.namespace('configuration')
+    checklist = cache.namespace('checklist')
+    assert cache.namespace('configuration') is config
+
+    config.set('all', [1, 2], tags=['configurations'])
+    checklist.set('all', ['x'], tags=['checklist', 'type:3'])
+    config.set('by_type_3', [1], tags=['type:3'])
+
+    assert config.get('all') == [1, 2] and checklist.get('all') == ['x'], "같은 키도 이름 공간별로 분리"
+    assert cache.get('all') is None
+
+    config.clear()
+    assert config.get('all') is None
+    assert checklist.get('all') == ['x'], "다른 이름 공간 항목 유지"
+
+    # 태그는 엔티티 기준 - 모든 이름 공간에 적용
+    config.set('by_type_3', [1], tags=['type:3'])
+    assert config.invalidate_tags('type:3') == 2
+    assert checklist.get('all') is None
+
+    stats = cache.get_statistics()['namespaces']
+    assert stats['checklist']['hits'] == 2 and stats['checklist']['misses'] == 1
+    assert stats['checklist']['invalidations'] == 1
+    assert stats['configuration']['hits'] == 1 and stats['configuration']['misses'] == 1
+    assert stats['default']['misses'] == 1
+    assert checklist.get_statistics()['namespace'] == 'checklist'
+
+    info = cache.get_cache_info()
+    assert info == {}
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_services_share_cache():
+    """공유 캐시를 쓰는 서비스 간 간섭 없음"""
+    print("\n=== 테스트 3: 서비스 간 분리 ===")
+
+    from app.schema import DBSchema
+    from app.services.equipment.equipment_service import EquipmentService
+    from app.services.checklist.checklist_service import ChecklistService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        cache = CacheService(max_size=100)
+        equipment = EquipmentService(db_schema, cache)
+        checklist = ChecklistService(db_schema, cache)
+
+        equipment.get_all_equipment_types()
+        checklist.get_common_checklist_items()
+
+        # Check list 항목 추가 → checklist 이름 공간만 무효화
+        checklist.add_checklist_item('Item A', 'pattern_a')
+        equipment.get_all_equipment_types()
+        stats = cache.get_statistics()['namespaces']
+        assert stats['equipment']['hits'] == 1, "장비 유형 캐시 유지"
+        assert stats['checklist']['invalidations'] == 1
+
+        # 다른 서비스가 clear() 해도 영향 없음
+        cache.namespace('configuration').clear()
+        equipment.get_all_equipment_types()
+        assert equipment.get_cache_statistics()['hits'] == 2
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_memory_budget_and_expiry():
+    """메모리 예산 / 만료"""
+    print("\n=== 테스트 4: 메모리 예산 / 만료 ===")
+
+    rows = [(i, f"PARAM_{i:05d}", f"{i * 0.5:.3f}") for i in range(20000)]
+    small = (1, 'x')
+    assert estimate_size(rows) > 100 * estimate_size(small), "큰 목록은 작은 항목보다 크게 추정"
+
+    budget = estimate_size(rows) + 10 * estimate_size(small)
+    cache = CacheService(max_size=1000, max_bytes=budget)
+    assert cache.set('rows', rows)
+    for i in range(20):
+        cache.set(f"small_{i}", small)
+    stats = cache.get_statistics()
+    assert stats['bytes'] <= budget
+    assert cache.get('rows') is None, "가장 오래된 큰 항목부터 제거"
+    assert cache.get('small_19') == small
+    assert stats['evictions'] >= 1
+
+    tiny = CacheService(max_size=1000, max_bytes=estimate_size(small) * 4)
+    assert not tiny.set('rows', rows), "예산보다 큰 값은 저장하지 않음"
+    assert tiny.get_statistics()['bytes'] == 0
+
+    cache = CacheService(max_size=100)
+    cache.set('short', 1, ttl_seconds=0.05)
+    cache.set('long', 2, ttl_seconds=60)
+    assert cache.get('short') == 1
+    time.sleep(0.08)
+    assert cache.cleanup_expired() == 1
+    assert cache.get('short') is None and cache.get('long') == 2
+    assert cache.get_statistics()['namespaces']['default']['expirations'] == 1
+    assert cache.get_cache_info()['long']['size'] > 0
+
+    print("[OK] 테스트 4 통과")
+
+
+def test_get_or_load_single_flight():
+    """get_or_load 동시 요청"""
+    print("\n=== 테스트 5: get_or_load single-flight ===")
+
+    cache = CacheService(max_size=100)
+    namespace = cache.namespace('checklist')
+    calls = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return ['item']
+
+    def worker():
+        barrier.wait()
+        results.append(namespace.get_or_load('items', loader, tags=['checklist']))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1, f"loader 실행 {len(calls)}회"
+    assert results == [['item']] * 8
+    stats = namespace.get_statistics()
+    assert stats['loads'] == 1 and stats['coalesced'] == 7
+    assert namespace.get_or_load('items', loader) == ['item'] and len(calls) == 1
+
+    # loader 예외는 호출자에게 전달, 캐시에 저장하지 않음
+    def failing():
+        raise RuntimeError('db error')
+    try:
+        cache.get_or_load('bad', failing)
+        assert False, "예외 전달"
+    except RuntimeError:
+        pass
+    assert cache.get('bad') is None
+
+    # 로드 중 그 키 / 태그가 무효화되면 결과를 반환만 하고 저장하지 않음
+    def stale_loader(invalidate):
+        def load():
+            invalidate()
+            return 'stale'
+        return load
+    stale_cases = [
+        lambda: cache.invalidate_tags('checklist'),
+        lambda: cache.delete('stale'),
+        lambda: cache.invalidate_pattern('sta*'),
+        lambda: cache.clear(),
+    ]
+    for invalidate in stale_cases:
+        assert cache.get_or_load('stale', stale_loader(invalidate), tags=['checklist']) == 'stale'
+        assert cache.get('stale') is None
+    assert namespace.get_or_load('stale', stale_loader(namespace.clear)) == 'stale'
+    assert namespace.get('stale') is None
+
+    # 다른 키 / 태그 / 이름 공간 무효화는 진행 중인 로드 결과를 버리지 않음
+    unrelated_cases = [
+        lambda: cache.invalidate_tags('config:1'),
+        lambda: cache.delete('other'),
+        lambda: cache.invalidate_pattern('other*'),
+        lambda: cache.namespace('configuration').clear(),
+        lambda: namespace.delete('fresh'),
+    ]
+    for index, invalidate in enumerate(unrelated_cases):
+        key = f"fresh{index}"
+        assert cache.get_or_load(key, stale_loader(invalidate), tags=['checklist']) == 'stale'
+        assert cache.get(key) == 'stale', key
+
+    print("[OK] 테스트 5 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("CacheService 테스트 시작\n")
+    print("=" * 60)
+
+    test_tag_invalidation()
+    test_namespaces()
+    test_services_share_cache()
+    test_memory_budget_and_expiry()
+    test_get_or_load_single_flight()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (5/5)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
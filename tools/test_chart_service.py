@@ -0,0 +1,186 @@
+"""
+차트 렌더링 서비스 테스트
+
+app.services.common.chart_service.ChartRenderer 테스트 (Tk 없이 PNG 렌더만)
+- PNG 렌더 / 캐시 적중 / 진행 중 렌더 공유 / 데이터 함수는 작업 스레드에서 실행
+- data_token: 같은 객체면 같은 번호, 새 객체면 새 번호
+- 리포트 집계 (차이 유형 개수 / 수치 통계)가 행 단위 계산과 일치, 차트 그리기 함수 렌더
+"""
+
+import sys
+import os
+import threading
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from app.services.common.chart_service import ChartRenderer, data_token
+from app.report import (DIFF_TYPES, difference_counts, numeric_statistics, statistics_chart_data,
+                        draw_summary_chart, draw_differences_chart, draw_statistics_chart)
+from app.qc_legacy import draw_issue_pie_chart
+from app.enhanced_qc import draw_enhanced_qc_chart
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _draw_line(figure, values):
+    ax = figure.subplots()
+    ax.plot(values)
+
+
+def _merged_frame(n=500):
+    """file_handler 형식 merged_df (parameter / default_value / file_0..)"""
+    rng = np.random.default_rng(7)
+    default = rng.integers(1, 100, n).astype(object)
+    default[::11] = None
+    file_0 = default.copy()
+    file_0[::5] = rng.integers(1, 100, len(file_0[::5]))
+    file_0[::13] = None
+    file_1 = default.copy()
+    file_1[::3] = 'abc'
+    return pd.DataFrame({'parameter': [f"P{i}" for i in range(n)], 'default_value': default,
+                         'file_0': file_0, 'file_1': file_1})
+
+
+def test_render_and_cache():
+    """PNG 렌더 + 캐시 적중"""
+    print("\n=== 테스트 1: 렌더 / 캐시 ===")
+
+    renderer = ChartRenderer(max_entries=2)
+    try:
+        png = renderer.render('line', _draw_line, lambda: [1, 3, 2], figsize=(3, 2)).result(timeout=60)
+        assert png.startswith(PNG_SIGNATURE)
+
+        again = renderer.render('line', _draw_line, lambda: [1, 3, 2], figsize=(3, 2))
+        assert again.done() and again.result() is png
+        stats = renderer.get_stats()
+        assert stats['renders'] == 1 and stats['hits'] == 1 and stats['entries'] == 1
+
+        # 다른 크기는 다른 캐시 항목, 최대 개수 초과 시 오래된 항목 제거
+        renderer.render('line', _draw_line, lambda: [1], figsize=(2, 2)).result(timeout=60)
+        renderer.render('other', _draw_line, lambda: [1], figsize=(2, 2)).result(timeout=60)
+        assert renderer.get_stats()['entries'] == 2
+        assert not renderer.render('line', _draw_line, lambda: [1, 3, 2], figsize=(3, 2)).done()
+
+        # 그리기 실패는 Future 예외로 전달, 캐시에 남지 않음
+        def fail(figure, data):
+            raise ValueError("bad chart")
+        future = renderer.render('fail', fail, lambda: None)
+        assert isinstance(future.exception(timeout=60), ValueError)
+        assert renderer.get_stats()['errors'] == 1
+    finally:
+        renderer.shutdown()
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_shared_render_and_tokens():
+    """진행 중 렌더 공유 / 작업 스레드 실행 / data_token / invalidate"""
+    print("\n=== 테스트 2: 렌더 공유 / 데이터 버전 ===")
+
+    renderer = ChartRenderer()
+    gate = threading.Event()
+    threads = []
+
+    def data():
+        threads.append(threading.current_thread().name)
+        gate.wait(10)
+        return [1, 2]
+
+    try:
+        first = renderer.render(('k', 1), _draw_line, data)
+        second = renderer.render(('k', 1), _draw_line, data)
+        assert second is first and renderer.get_stats()['shared'] == 1
+        gate.set()
+        first.result(timeout=60)
+        assert len(threads) == 1 and threads[0] != threading.current_thread().name
+
+        renderer.render(('k', 2), _draw_line, lambda: [3]).result(timeout=60)
+        renderer.invalidate(lambda key: key[1] == 1)
+        assert renderer.get_stats()['entries'] == 1
+        renderer.invalidate()
+        assert renderer.get_stats()['entries'] == 0
+    finally:
+        renderer.shutdown()
+
+    frame = pd.DataFrame({'a': [1]})
+    token = data_token(frame)
+    assert data_token(frame) == token
+    other = pd.DataFrame({'a': [1]})
+    assert data_token(other) != token
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_report_aggregates():
+    """리포트 집계 = 행 단위 계산, 그리기 함수 렌더"""
+    print("\n=== 테스트 3: 리포트 집계 / 차트 ===")
+
+    merged_df = _merged_frame()
+    file_names = ['/tmp/a.txt', '/tmp/b.txt']
+
+    # 행 단위 기준 계산
+    expected = {diff_type: [0, 0] for diff_type in DIFF_TYPES}
+    for _, row in merged_df.iterrows():
+        for i in range(2):
+            default, value = row['default_value'], row[f"file_{i}"]
+            if pd.isna(default) and pd.notna(value):
+                expected['Default DB에 없음'][i] += 1
+            elif pd.notna(default) and pd.isna(value):
+                expected['파일에 없음'][i] += 1
+            elif pd.notna(default) and default != value:
+                expected['값 차이'][i] += 1
+    counts = difference_counts(merged_df, file_names)
+    assert counts['files'] == ['a.txt', 'b.txt']
+    for diff_type in DIFF_TYPES:
+        assert counts[diff_type] == expected[diff_type], diff_type
+
+    stats = numeric_statistics(merged_df, file_names)
+    row = merged_df.iloc[5]
+    position = list(stats['parameter']).index(row['parameter'])
+    values = [float(v) for v in (row['file_0'], row['file_1']) if isinstance(v, (int, np.integer))]
+    assert np.isclose(stats['mean'][position], np.mean(values))
+    assert np.isclose(stats['deviation'][position], (np.mean(values) - row['default_value']) / row['default_value'] * 100)
+    numeric_rows = merged_df['default_value'].notna() & (merged_df['file_0'].notna() | (merged_df['file_1'] != 'abc'))
+    assert len(stats['parameter']) == int(numeric_rows.sum())
+
+    renderer = ChartRenderer()
+    try:
+        charts = [
+            (draw_summary_chart, {'a.txt': 3, 'b.txt': 5}),
+            (draw_differences_chart, counts),
+            (draw_statistics_chart, statistics_chart_data(numeric_statistics(merged_df, file_names))),
+            (draw_statistics_chart, statistics_chart_data(numeric_statistics(merged_df.iloc[:0], file_names))),
+            (draw_issue_pie_chart, ({'누락': 3, '중복': 0, '이상치': 2}, "Issue Type Distribution")),
+            (draw_enhanced_qc_chart, {'severity_breakdown': {'높음': 1, '중간': 2, '낮음': 0},
+                                      'category_breakdown': {'누락': 3}, 'overall_score': 72.0,
+                                      'total_issues': 3, 'is_checklist_mode': True}),
+        ]
+        for i, (draw, data) in enumerate(charts):
+            png = renderer.render(('chart', i), draw, lambda data=data: data, figsize=(6, 4)).result(timeout=120)
+            assert png.startswith(PNG_SIGNATURE), draw.__name__
+    finally:
+        renderer.shutdown()
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("차트 렌더링 서비스 테스트 시작\n")
+    print("=" * 60)
+
+    test_render_and_cache()
+    test_shared_render_and_tokens()
+    test_report_aggregates()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
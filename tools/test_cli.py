@@ -0,0 +1,240 @@
+"""
+명령줄 도구 테스트
+
+app.cli (python -m app.cli) 테스트
+- compare: 여러 프로세스로 읽고 차이 행만 TSV(stdout) / CSV 저장, 값 정규화 / mmap 백엔드
+- qc: 파일별 JSON Lines, JSON / Excel 보고서, 종료 코드 (0 Pass / 1 Fail / 2 오류), Configuration 예외
+- import-shipped / export-defaultdb: 디렉토리 → DB, Default DB → 텍스트 / Excel
+- tkinter를 import하지 않음
+"""
+
+import sys
+import os
+import io
+import json
+import sqlite3
+import subprocess
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+
+# src 디렉토리를 Python 경로에 추가
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from app import cli
+from app.schema import DBSchema
+
+HEADER = "Module\tPart\tItemName\tItemType\tItemValue\tItemDescription\n"
+
+
+def _write_dump(path, values):
+    """{ItemName: 값} → 표준 텍스트 DB 파일"""
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(HEADER)
+        for i, (name, value) in enumerate(values.items()):
+            handle.write(f"PM{i % 2}\tHeater\t{name}\tdouble\t{value}\t{name} 설명\n")
+    return path
+
+
+def _run(argv):
+    """cli.main 실행 → (종료 코드, stdout 줄 목록)"""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        code = cli.main(argv)
+    return code, out.getvalue().splitlines()
+
+
+def _create_qc_db(db_path):
+    """Phase 1.5 형식 Check list / 예외 / Configuration / 출고 장비 테이블"""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE QC_Checklist_Items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE,
+            spec_min TEXT, spec_max TEXT, expected_value TEXT,
+            category TEXT, description TEXT, is_active BOOLEAN DEFAULT 1);
+        CREATE TABLE Equipment_Checklist_Exceptions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER NOT NULL,
+            checklist_item_id INTEGER NOT NULL, reason TEXT);
+        CREATE TABLE Equipment_Configurations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER NOT NULL, configuration_name TEXT);
+        CREATE TABLE Shipped_Equipment (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+            configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+            ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+            notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE Shipped_Equipment_Parameters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER NOT NULL,
+            parameter_name TEXT NOT NULL, parameter_value TEXT NOT NULL,
+            module TEXT, part TEXT, data_type TEXT,
+            UNIQUE (shipped_equipment_id, parameter_name));
+    """)
+    conn.executemany(
+        "INSERT INTO QC_Checklist_Items (item_name, spec_min, spec_max, expected_value, category) VALUES (?, ?, ?, ?, ?)",
+        [('Temp', '10', '20', None, 'Heater'), ('Mode', None, None, 'AUTO', 'Control'),
+         ('Disabled', None, None, 'X', 'Control')])
+    conn.execute("UPDATE QC_Checklist_Items SET is_active = 0 WHERE item_name = 'Disabled'")
+    # Configuration 7은 Temp 항목 예외
+    conn.execute("INSERT INTO Equipment_Checklist_Exceptions (configuration_id, checklist_item_id, reason) "
+                 "VALUES (7, 1, 'test')")
+    conn.execute("INSERT INTO Equipment_Configurations (id, type_id, configuration_name) VALUES (3, 1, 'Std')")
+    conn.commit()
+    conn.close()
+
+
+def test_compare():
+    """compare: 차이 행만, 병렬 읽기"""
+    print("\n=== 테스트 1: compare ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = {f"Item{i:03d}": str(i) for i in range(300)}
+        a = _write_dump(os.path.join(tmp, 'A.txt'), base)
+        b = _write_dump(os.path.join(tmp, 'B.txt'), dict(base, Item005='x', Item100='y'))
+        c = _write_dump(os.path.join(tmp, 'C.txt'), dict(base, Item005='x'))
+
+        code, lines = _run(['--workers', '1', 'compare', a, b, c])
+        assert code == cli.EXIT_OK
+        assert lines[0] == "Module\tPart\tItemName\tA\tB\tC"
+        assert lines[1:] == ["PM0\tHeater\tItem100\t100\ty\t100", "PM1\tHeater\tItem005\t5\tx\tx"]
+
+        # 프로세스 풀 + 디렉토리 인자 + 저장
+        out = os.path.join(tmp, 'diff.csv')
+        code, _ = _run(['--workers', '3', 'compare', tmp, '-o', out, '--all'])
+        assert code == cli.EXIT_OK
+        with open(out, encoding='utf-8-sig') as handle:
+            rows = handle.read().splitlines()
+        assert rows[0] == "Module,Part,ItemName,A,B,C" and len(rows) == 301
+
+        # 읽을 수 없는 파일 → 오류 코드 (나머지는 비교)
+        code, lines = _run(['--workers', '1', 'compare', a, b, os.path.join(tmp, 'missing.txt')])
+        assert code == cli.EXIT_ERROR and len(lines) == 3
+
+        # 숫자 표기 정규화 ("100.0" == "100") + mmap 백엔드
+        d = _write_dump(os.path.join(tmp, 'D.txt'), dict(base, Item100='100.0'))
+        code, lines = _run(['--workers', '1', 'compare', a, d])
+        assert code == cli.EXIT_OK and lines[1:] == ["PM0\tHeater\tItem100\t100\t100.0"]
+        code, lines = _run(['--workers', '1', 'compare', a, d, '--normalize', 'numeric', '--store', 'mmap'])
+        assert code == cli.EXIT_OK and lines == ["Module\tPart\tItemName\tA\tD"]
+        assert _run(['--workers', '1', 'compare', a, d, '--normalize', 'unknown'])[0] == cli.EXIT_ERROR
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_qc():
+    """qc: JSON Lines / 보고서 / 종료 코드"""
+    print("\n=== 테스트 2: qc ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'qc.sqlite')
+        _create_qc_db(db_path)
+        good = _write_dump(os.path.join(tmp, 'good.txt'), {'Temp': '15', 'Mode': 'auto', 'Other': '1'})
+        bad = _write_dump(os.path.join(tmp, 'bad.txt'), {'Temp': '25', 'Mode': 'AUTO', 'Disabled': 'Y'})
+
+        code, lines = _run(['--db', db_path, '--workers', '1', 'qc', good])
+        assert code == cli.EXIT_OK
+        assert json.loads(lines[0])['is_pass'] is True
+
+        report_path = os.path.join(tmp, 'qc.json')
+        excel_path = os.path.join(tmp, 'qc.xlsx')
+        code, lines = _run(['--db', db_path, '--workers', '2', 'qc', bad, good,
+                            '--json', report_path, '--excel', excel_path])
+        assert code == cli.EXIT_QC_FAILED
+        by_file = {json.loads(line)['file']: json.loads(line) for line in lines}
+        assert by_file['bad']['failed_items'] == ['Temp'] and by_file['bad']['total_count'] == 2
+        with open(report_path, encoding='utf-8') as handle:
+            report = json.load(handle)
+        assert report['is_pass'] is False and report['failed_files'] == ['bad']
+        assert [f['file'] for f in report['files']] == ['bad', 'good']
+
+        from openpyxl import load_workbook
+        workbook = load_workbook(excel_path, read_only=True)
+        summary = list(workbook['QC 요약'].values)
+        items = list(workbook['검수 결과'].values)
+        workbook.close()
+        assert summary[1][:2] == ('bad', 'FAIL') and len(items) == 5
+
+        # Configuration 7: Temp 예외 → Pass
+        code, lines = _run(['--db', db_path, '--workers', '1', 'qc', bad, '--configuration', '7'])
+        assert code == cli.EXIT_OK
+        assert json.loads(lines[0])['exception_count'] == 1
+
+        # 없는 파일 → 오류
+        code, _ = _run(['--db', db_path, '--workers', '1', 'qc', good, os.path.join(tmp, 'none.txt')])
+        assert code == cli.EXIT_ERROR
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_import_and_export():
+    """import-shipped / export-defaultdb"""
+    print("\n=== 테스트 3: import-shipped / export-defaultdb ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'db.sqlite')
+        _create_qc_db(db_path)
+        shipped_dir = os.path.join(tmp, 'shipped')
+        os.makedirs(shipped_dir)
+        for serial in ('S001', 'S002', 'S003'):
+            _write_dump(os.path.join(shipped_dir, f"{serial}_Customer_NX-Mask.txt"),
+                        {f"Item{i}": str(i) for i in range(50)})
+        with open(os.path.join(shipped_dir, 'broken.txt'), 'w', encoding='utf-8') as handle:
+            handle.write(HEADER)
+
+        code, lines = _run(['--db', db_path, '--workers', '2', 'import-shipped', shipped_dir,
+                            '--configuration', '3'])
+        assert code == cli.EXIT_ERROR  # broken.txt 파일명 형식 오류
+        assert sorted(line.split('\t')[0] for line in lines) == ['FAIL', 'OK', 'OK', 'OK']
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM Shipped_Equipment").fetchone()[0] == 3
+        conn.close()
+
+        schema = DBSchema(db_path)
+        with schema.get_connection() as conn:
+            type_id = conn.execute("INSERT INTO Equipment_Types (type_name) VALUES ('NX-Mask')").lastrowid
+            conn.commit()
+        for i in range(20):
+            schema.add_default_value(type_id, f"Param{i:02d}", str(i), module_name="PM1", part_name="Heater",
+                                     item_type="double", is_checklist=int(i < 5))
+
+        text_path = os.path.join(tmp, 'default.txt')
+        code, _ = _run(['--db', db_path, 'export-defaultdb', '--type', 'NX-Mask', '-o', text_path])
+        assert code == cli.EXIT_OK
+        with open(text_path, encoding='utf-8') as handle:
+            text_lines = handle.read().splitlines()
+        assert text_lines[0] == HEADER.strip() and len(text_lines) == 21
+
+        csv_path = os.path.join(tmp, 'default.csv')
+        code, _ = _run(['--db', db_path, 'export-defaultdb', '--type', str(type_id), '-o', csv_path, '--checklist-only'])
+        assert code == cli.EXIT_OK
+        with open(csv_path, encoding='utf-8-sig') as handle:
+            rows = handle.read().splitlines()
+        assert rows[0].startswith("Module,Part,ItemName,ItemType,ItemValue") and len(rows) == 6
+
+        code, _ = _run(['--db', db_path, 'export-defaultdb', '--type', 'Unknown', '-o', csv_path])
+        assert code == cli.EXIT_ERROR
+
+    # 명령 실행 후에도 tkinter 미사용
+    script = ("import sys, tempfile, os; from app import cli; "
+              "d = tempfile.mkdtemp(); cli.main(['--workers', '1', 'compare', d]); "
+              "print('tkinter' in sys.modules)")
+    output = subprocess.run([sys.executable, '-c', script], cwd=SRC_DIR, capture_output=True, text=True)
+    assert output.stdout.strip() == 'False', output.stdout + output.stderr
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("명령줄 도구 테스트 시작\n")
+    print("=" * 60)
+
+    test_compare()
+    test_qc()
+    test_import_and_export()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Comparison Pivot 테스트
+
+비교 데이터셋 Pivot(app.dataset.ComparisonPivot) 점진적 갱신 테스트
+- 파일 추가 시 새 행 / 차이 여부 변경 내역
+- 파일 제거 시 빈 행 삭제 / 차이 여부 재계산
+- 점진적 갱신 결과와 전체 재계산(groupby) 결과 일치
+- 값 코드: 파일을 추가해도 기존 코드 유지, 정규화 옵션(공백 / 대소문자 / 숫자 표기) 비교
+"""
+
+import sys
+import os
+import random
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+
+from app.dataset import ComparisonDataset
+from app.report import difference_counts
+from app.value_table import NormalizeOptions
+
+
+def _frame(rows):
+    """(Module, Part, ItemName, ItemValue) 목록 → DataFrame"""
+    return pd.DataFrame(rows, columns=['Module', 'Part', 'ItemName', 'ItemValue'])
+
+
+def _groupby_reference(merged_df, file_names):
+    """기존 비교 뷰 방식(groupby)으로 계산한 행 값 / 차이 여부"""
+    reference = {}
+    for key, group in merged_df.groupby(["Module", "Part", "ItemName"]):
+        values = []
+        for model in file_names:
+            model_data = group[group["Model"] == model]
+            values.append(str(model_data["ItemValue"].iloc[0]) if not model_data.empty else "-")
+        non_empty = [v for v in values if v != "-"]
+        reference[key] = (values, len(set(non_empty)) > 1)
+    return reference
+
+
+def test_append_delta():
+    """파일 추가 변경 내역"""
+    print("\n=== 테스트 1: 파일 추가 ===")
+
+    dataset = ComparisonDataset()
+    delta = dataset.append_file('A', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', '2')]))
+    assert delta.added and delta.column == 'A'
+    assert delta.added_keys == [('M', 'P', 'a'), ('M', 'P', 'b')]
+    assert delta.diff_changed_keys == []
+
+    delta = dataset.append_file('B', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', '3'), ('M', 'Q', 'c', '9')]))
+    assert delta.added_keys == [('M', 'Q', 'c')]
+    assert delta.diff_changed_keys == [('M', 'P', 'b')], "b 값이 달라져 차이 발생"
+
+    pivot = dataset.pivot
+    assert pivot.row_values(('M', 'P', 'b')) == ['2', '3']
+    assert pivot.row_values(('M', 'Q', 'c')) == ['-', '9']
+    assert pivot.summary() == {'total': 3, 'diff': 1, 'modules': 1, 'parts': 2}
+    assert pivot.part_counts[('M', 'P')] == [2, 1]
+    assert pivot.module_counts('M') == (3, 1)
+    assert len(dataset.merged_df) == 5
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_remove_delta():
+    """파일 제거 변경 내역"""
+    print("\n=== 테스트 2: 파일 제거 ===")
+
+    dataset = ComparisonDataset()
+    dataset.append_file('A', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', '2')]))
+    dataset.append_file('B', _frame([('M', 'P', 'b', '3'), ('M', 'Q', 'c', '9')]))
+    dataset.append_file('C', _frame([('M', 'P', 'b', '2')]))
+
+    delta = dataset.remove_file('B')
+    assert not delta.added
+    assert delta.removed_keys == [('M', 'Q', 'c')], "B에만 있던 행 삭제"
+    assert delta.diff_changed_keys == [('M', 'P', 'b')], "남은 값이 같아져 차이 해소"
+
+    pivot = dataset.pivot
+    assert pivot.file_names == ['A', 'C']
+    assert pivot.summary() == {'total': 2, 'diff': 0, 'modules': 1, 'parts': 1}
+    assert ('M', 'Q') not in pivot.part_counts
+    assert set(dataset.merged_df['Model']) == {'A', 'C'}
+
+    try:
+        dataset.append_file('A', _frame([]))
+        assert False, "같은 이름 파일은 먼저 제거해야 함"
+    except ValueError:
+        pass
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_matches_groupby():
+    """점진적 갱신 결과 = 전체 재계산 결과"""
+    print("\n=== 테스트 3: 전체 재계산과 일치 ===")
+
+    rng = random.Random(7)
+
+    def random_frame():
+        rows = [(f"M{rng.randint(1, 3)}", f"P{rng.randint(1, 3)}",
+                 f"item{rng.randint(1, 8)}", str(rng.randint(1, 3)))
+                for _ in range(rng.randint(1, 30))]
+        return _frame(rows)
+
+    dataset = ComparisonDataset()
+    for step in range(60):
+        names = dataset.file_names
+        if names and rng.random() < 0.4:
+            dataset.remove_file(rng.choice(names))
+        else:
+            name = f"F{step}"
+            dataset.append_file(name, random_frame())
+
+        pivot = dataset.pivot
+        if not dataset.file_names:
+            assert len(pivot) == 0 and not pivot.part_counts
+            continue
+
+        reference = _groupby_reference(dataset.merged_df, dataset.file_names)
+        assert pivot.sorted_keys() == list(reference.keys())
+        for key, (values, has_difference) in reference.items():
+            assert pivot.row_values(key, dataset.file_names) == values, key
+            assert pivot.has_difference(key) == has_difference, key
+        assert pivot.diff_count == sum(diff for _, diff in reference.values())
+        assert sum(total for total, _ in pivot.part_counts.values()) == len(reference)
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_value_codes():
+    """값 코드 / 정규화 옵션"""
+    print("\n=== 테스트 4: 값 코드와 정규화 ===")
+
+    dataset = ComparisonDataset()
+    dataset.append_file('A', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', 'On'), ('M', 'P', 'c', 'x')]))
+    pivot = dataset.pivot
+    codes = {value: pivot.values.lookup(value) for value in ('1', 'On', 'x')}
+
+    # 새 파일을 추가 / 제거해도 기존 코드는 그대로
+    dataset.append_file('B', _frame([('M', 'P', 'a', '1.0'), ('M', 'P', 'b', ' on'), ('M', 'Q', 'd', 'x')]))
+    dataset.remove_file('A')
+    assert {value: pivot.values.lookup(value) for value in codes} == codes
+    assert pivot.column_codes('B')[pivot.key_pos[('M', 'Q', 'd')]] == codes['x']
+
+    # 정규화 없음: 문자열이 다르면 차이
+    dataset.append_file('A', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', 'On')]))
+    assert {key for key in pivot.keys if pivot.has_difference(key)} == {('M', 'P', 'a'), ('M', 'P', 'b')}
+
+    # 정규화: 비교만 같게, 표시 값은 원래 값
+    options = NormalizeOptions(trim=True, ignore_case=True, numeric=True)
+    assert NormalizeOptions.parse('trim, case,numeric') == options
+    assert NormalizeOptions.from_settings({'numeric': True}) == NormalizeOptions(numeric=True)
+    normalized = ComparisonDataset(options)
+    normalized.append_file('A', _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', 'On'), ('M', 'P', 'c', '2.50')]))
+    delta = normalized.append_file('B', _frame([('M', 'P', 'a', '1.0'), ('M', 'P', 'b', ' on'),
+                                                ('M', 'P', 'c', '2.5e0')]))
+    assert delta.diff_changed_keys == [] and normalized.pivot.diff_count == 0
+    assert normalized.pivot.row_values(('M', 'P', 'a')) == ['1', '1.0']
+    delta = normalized.append_file('C', _frame([('M', 'P', 'a', '01'), ('M', 'P', 'b', 'off')]))
+    assert delta.diff_changed_keys == [('M', 'P', 'b')]
+    delta = normalized.remove_file('C')
+    assert delta.diff_changed_keys == [('M', 'P', 'b')] and normalized.pivot.diff_count == 0
+
+    # Default 값 비교 (리포트)
+    merged_df = pd.DataFrame({'parameter': ['a', 'b', 'c'], 'default_value': ['1', 'ON', None],
+                              'file_0': ['1.0', 'on ', '3']})
+    assert difference_counts(merged_df, ['f'])['값 차이'] == [2]
+    counts = difference_counts(merged_df, ['f'], options)
+    assert counts['값 차이'] == [0] and counts['Default DB에 없음'] == [1]
+
+    print("[OK] 테스트 4 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("Comparison Pivot 테스트 시작\n")
+    print("=" * 60)
+
+    test_append_delta()
+    test_remove_delta()
+    test_matches_groupby()
+    test_value_codes()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (4/4)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
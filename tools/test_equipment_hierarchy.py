@@ -0,0 +1,384 @@
+"""
+Equipment Hierarchy 스냅샷 테스트
+
+Model → Type → Configuration 계층 조회 테스트
+- 노드 수와 무관하게 고정된 쿼리 수로 전체 계층 조회
+- 기존 출력 구조 유지 (get_hierarchy_tree / get_full_hierarchy / get_configuration_hierarchy)
+- 스냅샷 한 항목 캐시, 노드 변경 시 해당 노드만 다시 조회
+- Default DB Values 일괄 적재 (행별 존재 확인 없는 집합 연산)
+- 쓰기 큐 작업의 캐시 무효화 / 스냅샷 갱신은 커밋 후 (동시 읽기, 작업 실패)
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.instrumentation import instrumentation, TracedConnection
+from app.services.common.cache_service import CacheService
+from app.services.category.category_service import CategoryService
+from app.services.configuration.configuration_service import ConfigurationService
+from app.services.common.write_queue import DatabaseWriter, writer_connection
+
+
+class _Row(sqlite3.Row):
+    """인덱스 / 컬럼명 / get() 접근을 모두 지원하는 행"""
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys() else default
+
+
+class _Phase15Schema:
+    """서비스가 사용하는 Phase 1.5 테이블만 가진 테스트용 스키마"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Equipment_Models (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    model_name TEXT NOT NULL UNIQUE,
+                    model_code TEXT,
+                    description TEXT,
+                    display_order INTEGER DEFAULT 999,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE TABLE Equipment_Types (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    model_id INTEGER NOT NULL,
+                    type_name TEXT NOT NULL,
+                    description TEXT,
+                    is_default INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (model_id) REFERENCES Equipment_Models(id) ON DELETE CASCADE
+                );
+                CREATE TABLE Equipment_Configurations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    type_id INTEGER NOT NULL,
+                    equipment_type_id INTEGER,
+                    configuration_name TEXT NOT NULL,
+                    port_count INTEGER,
+                    wafer_count INTEGER,
+                    custom_options TEXT,
+                    is_customer_specific INTEGER DEFAULT 0,
+                    customer_name TEXT,
+                    description TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE
+                );
+                CREATE TABLE Default_DB_Values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    configuration_id INTEGER,
+                    parameter_name TEXT NOT NULL,
+                    default_value TEXT NOT NULL,
+                    is_type_common INTEGER DEFAULT 0,
+                    notes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (configuration_id) REFERENCES Equipment_Configurations(id) ON DELETE CASCADE
+                );
+            """)
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path, factory=TracedConnection)
+        conn.row_factory = _Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+class _QueuedSchema(_Phase15Schema):
+    """쓰기 큐 작업 안에서는 DBSchema처럼 쓰기 연결을 사용"""
+
+    @contextmanager
+    def get_connection(self):
+        conn = writer_connection(self.db_path)
+        if conn is None:
+            with super().get_connection() as conn:
+                yield conn
+            return
+        conn.row_factory = _Row
+        yield conn
+
+
+def _populate(db_schema, models=3, types=2, configs=4, values=5):
+    with db_schema.get_connection() as conn:
+        for m in range(models):
+            model_id = conn.execute(
+                "INSERT INTO Equipment_Models (model_name, display_order) VALUES (?, ?)",
+                (f"MODEL_{m}", models - m)).lastrowid
+            for t in range(types):
+                type_id = conn.execute(
+                    "INSERT INTO Equipment_Types (model_id, type_name, is_default) VALUES (?, ?, ?)",
+                    (model_id, f"TYPE_{t}", int(t == types - 1))).lastrowid
+                for c in range(configs):
+                    config_id = conn.execute(
+                        "INSERT INTO Equipment_Configurations (type_id, equipment_type_id, configuration_name, "
+                        "port_count, wafer_count) VALUES (?, ?, ?, ?, ?)",
+                        (type_id, type_id, f"CFG_{c}", c + 1, 25)).lastrowid
+                    conn.executemany(
+                        "INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value, "
+                        "is_type_common) VALUES (?, ?, ?, ?)",
+                        [(config_id, f"P_{v}", str(v), int(v % 2 == 0)) for v in range(values + c)])
+        conn.commit()
+
+
+def _sql_count():
+    return len([s for s in instrumentation.recent_spans(category='sql')
+                if s.name == 'sql.execute' and s.args['query'].lstrip().upper().startswith('SELECT')])
+
+
+def _services(db_schema):
+    cache = CacheService(max_size=100)
+    return cache, CategoryService(db_schema, cache), ConfigurationService(db_schema, cache)
+
+
+def test_fixed_query_count():
+    """노드 수와 무관한 쿼리 수"""
+    print("\n=== 테스트 1: 고정 쿼리 수 ===")
+
+    counts = []
+    for size in (1, 4):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_schema = _Phase15Schema(os.path.join(tmp, 'test.sqlite'))
+            _populate(db_schema, models=size * 2, types=size, configs=size * 2)
+            _, category, configuration = _services(db_schema)
+
+            instrumentation.clear()
+            hierarchy = configuration.get_full_hierarchy()
+            counts.append(_sql_count())
+
+            assert len(hierarchy) == size * 2
+            assert all(len(m['types']) == size for m in hierarchy)
+
+            # 같은 스냅샷 재사용 - 추가 쿼리 없음
+            category.get_hierarchy_tree()
+            configuration.get_configuration_hierarchy(hierarchy[0]['types'][0]['type'].id)
+            assert _sql_count() == counts[-1], "스냅샷 공유"
+
+    assert counts[0] == counts[1] == 4, f"쿼리 수 {counts}"
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_output_structure():
+    """기존 출력 구조 / 정렬 / 개수"""
+    print("\n=== 테스트 2: 출력 구조 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _Phase15Schema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, models=3, types=2, configs=3, values=4)
+        _, category, configuration = _services(db_schema)
+
+        full = configuration.get_full_hierarchy()
+        assert [m['model'].model_name for m in full] == ['MODEL_2', 'MODEL_1', 'MODEL_0'], "display_order 순"
+        first_type = full[0]['types'][0]
+        assert first_type['type'].type_name == 'TYPE_0' and first_type['type'].model_name == 'MODEL_2'
+        configs = first_type['configurations']
+        assert [c['configuration'].configuration_name for c in configs] == ['CFG_0', 'CFG_1', 'CFG_2']
+        assert [c['default_value_count'] for c in configs] == [4, 5, 6]
+        assert configs[0]['configuration'].model_name == 'MODEL_2'
+
+        tree = category.get_hierarchy_tree()
+        assert tree[0]['types'][0]['type'].type_name == 'TYPE_1', "기본 Type 먼저"
+        assert tree[0]['types'][0]['configuration_count'] == 3
+
+        detail = configuration.get_configuration_hierarchy(first_type['type'].id)
+        counts = detail['configurations'][1]
+        assert (counts['default_value_count'], counts['type_common_count'], counts['config_specific_count']) == (5, 3, 2)
+        assert configuration.get_configuration_hierarchy(9999) == {}
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_incremental_refresh():
+    """노드 변경 시 부분 갱신"""
+    print("\n=== 테스트 3: 부분 갱신 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _Phase15Schema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, models=3, types=2, configs=3, values=2)
+        cache, category, configuration = _services(db_schema)
+
+        full = configuration.get_full_hierarchy()
+        model = full[0]['model']
+        type_id = full[0]['types'][0]['type'].id
+        config_id = full[0]['types'][0]['configurations'][0]['configuration'].id
+        loads = cache.get_statistics()['namespaces']['hierarchy']['loads']
+
+        # Configuration 추가 / Default DB Value 추가
+        new_id = configuration.create_configuration(type_id, 'CFG_NEW', 2, 25)
+        configuration.create_default_value(new_id, 'P_NEW', '1', is_type_common=True)
+        detail = configuration.get_configuration_hierarchy(type_id)
+        names = [c['configuration'].configuration_name for c in detail['configurations']]
+        assert names == ['CFG_0', 'CFG_1', 'CFG_2', 'CFG_NEW']
+        assert detail['configurations'][-1]['type_common_count'] == 1
+
+        # 이름 변경은 하위 노드의 관계 데이터까지 반영
+        category.update_model(model.id, model_name='RENAMED')
+        category.update_type(type_id, type_name='TYPE_X')
+        full = configuration.get_full_hierarchy()
+        renamed = full[0]
+        assert renamed['model'].model_name == 'RENAMED'
+        type_data = [t for t in renamed['types'] if t['type'].id == type_id][0]
+        assert type_data['type'].model_name == 'RENAMED'
+        assert type_data['configurations'][0]['configuration'].type_name == 'TYPE_X'
+        assert type_data['configurations'][0]['configuration'].model_name == 'RENAMED'
+
+        # 삭제
+        configuration.delete_configuration(config_id)
+        assert all(c['configuration'].id != config_id
+                   for c in configuration.get_configuration_hierarchy(type_id)['configurations'])
+        category.delete_model(model.id)
+        assert [m['model'].model_name for m in configuration.get_full_hierarchy()] == ['MODEL_1', 'MODEL_0']
+
+        # 순서 변경 / Type 추가
+        category.reorder_models([m['model'].id for m in reversed(configuration.get_full_hierarchy())])
+        other_model_id = configuration.get_full_hierarchy()[0]['model'].id
+        category.create_type(other_model_id, 'TYPE_NEW', is_default=True)
+
+        tree = category.get_hierarchy_tree()
+        assert [m['model'].model_name for m in tree] == ['MODEL_0', 'MODEL_1']
+        assert [t['type'].type_name for t in tree[0]['types']] == ['TYPE_1', 'TYPE_NEW', 'TYPE_0'], "기본 Type 먼저"
+
+        stats = cache.get_statistics()['namespaces']['hierarchy']
+        assert stats['loads'] == loads, "전체 재조회 없음"
+
+        # 갱신 결과가 전체 재조회 결과와 같음
+        expected = ConfigurationService(db_schema, CacheService()).get_full_hierarchy()
+        assert configuration.get_full_hierarchy() == expected
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_bulk_load_default_values():
+    """Default DB Values 일괄 적재"""
+    print("\n=== 테스트 4: Default DB Values 일괄 적재 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _Phase15Schema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, models=1, types=1, configs=2, values=3)
+        cache, _, configuration = _services(db_schema)
+
+        type_id = configuration.get_full_hierarchy()[0]['types'][0]['type'].id
+        config_a, config_b = [c['configuration'].id
+                              for c in configuration.get_configuration_hierarchy(type_id)['configurations']]
+        configuration.get_default_values_by_configuration(config_a)
+        configuration.get_default_values_by_configuration(config_b)
+
+        values = [{'parameter_name': f"NEW_{i}", 'default_value': str(i), 'is_type_common': i % 2 == 0}
+                  for i in range(1000)]
+        values += [{'parameter_name': 'P_0', 'default_value': 'x'},       # 이미 있음
+                   {'parameter_name': 'NEW_1', 'default_value': 'dup'}]  # 목록 안 중복
+
+        instrumentation.clear()
+        result = configuration.bulk_load_default_values(config_a, values)
+        statements = [s for s in instrumentation.recent_spans(category='sql') if s.name.startswith('sql.execute')]
+        assert len(statements) < 10, f"행 수와 무관한 문장 수 (현재 {len(statements)})"
+
+        assert result['inserted'] == [f"NEW_{i}" for i in range(1000)]
+        assert result['skipped'] == ['P_0', 'NEW_1']
+        assert configuration.bulk_create_default_values(config_a, values) == 0
+
+        stored = {v.parameter_name: v for v in configuration.get_default_values_by_configuration(config_a)}
+        assert len(stored) == 1003
+        assert stored['NEW_1'].default_value == '1' and stored['P_0'].default_value == '0', "기존 값 / 첫 행 유지"
+        assert stored['NEW_2'].is_type_common and not stored['NEW_3'].is_type_common
+
+        # 다른 Configuration 캐시는 유지, 계층 개수는 갱신
+        stats = cache.get_statistics()['namespaces']['configuration']
+        hits = stats['hits']
+        configuration.get_default_values_by_configuration(config_b)
+        assert cache.get_statistics()['namespaces']['configuration']['hits'] == hits + 1
+        counts = [c['default_value_count'] for c in configuration.get_configuration_hierarchy(type_id)['configurations']]
+        assert counts == [1003, 4]
+        assert configuration.bulk_load_default_values(config_a, []) == {'inserted': [], 'skipped': []}
+
+    print("[OK] 테스트 4 통과")
+
+
+def test_write_queue_commit_order():
+    """쓰기 큐 작업: 커밋 후 무효화 / 갱신"""
+    print("\n=== 테스트 5: 쓰기 큐 커밋 후 무효화 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _QueuedSchema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, models=1, types=1, configs=2, values=1)
+        cache, _, configuration = _services(db_schema)
+        writer = DatabaseWriter(db_schema.db_path)
+        try:
+            type_id = configuration.get_full_hierarchy()[0]['types'][0]['type'].id
+            config_id = configuration.get_configurations_by_type(type_id)[0].id
+            seen = []
+
+            def concurrent_read():
+                # 커밋 전 다른 스레드의 읽기 → 마지막 커밋 스냅샷을 읽어 캐시에 넣음
+                seen.append([c.description for c in configuration.get_configurations_by_type(type_id)])
+
+            def update_then_read():
+                configuration.update_configuration(config_id, description='updated')
+                reader = threading.Thread(target=concurrent_read)
+                reader.start()
+                reader.join(10)
+
+            writer.submit(update_then_read).result(10)
+            assert seen == [[None, None]], "커밋 전 읽기는 이전 값"
+            descriptions = [c.description for c in configuration.get_configurations_by_type(type_id)]
+            assert descriptions == ['updated', None], "커밋 후 무효화 → 이전 값이 캐시에 남지 않음"
+
+            # 실패한 작업의 행은 계층 스냅샷에 들어가지 않음
+            def create_then_fail():
+                configuration.create_configuration(type_id, 'CFG_ROLLBACK', 2, 25)
+                raise RuntimeError("작업 실패")
+
+            try:
+                writer.submit(create_then_fail).result(10)
+                assert False, "작업 예외 전달"
+            except RuntimeError:
+                pass
+            names = [c['configuration'].configuration_name
+                     for c in configuration.get_configuration_hierarchy(type_id)['configurations']]
+            assert names == ['CFG_0', 'CFG_1']
+
+            # 성공한 작업은 커밋 후 스냅샷에 반영 (전체 재조회 없음)
+            loads = cache.get_statistics()['namespaces']['hierarchy']['loads']
+            writer.submit(configuration.create_configuration, type_id, 'CFG_NEW', 2, 25).result(10)
+            names = [c['configuration'].configuration_name
+                     for c in configuration.get_configuration_hierarchy(type_id)['configurations']]
+            assert names == ['CFG_0', 'CFG_1', 'CFG_NEW']
+            assert cache.get_statistics()['namespaces']['hierarchy']['loads'] == loads
+        finally:
+            writer.close()
+
+    print("[OK] 테스트 5 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("Equipment Hierarchy 테스트 시작\n")
+    print("=" * 60)
+
+    test_fixed_query_count()
+    test_output_structure()
+    test_incremental_refresh()
+    test_bulk_load_default_values()
+    test_write_queue_commit_order()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (5/5)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+내보내기 서비스 테스트
+
+app.services.common.export_service 테스트
+- Excel: 컬럼 배열 / DataFrame 시트를 write-only로 기록 (헤더, NaN → 빈 셀, 시트 이름 정리 / 분할)
+- CSV / TSV: 시트별 파일, BOM 포함 UTF-8
+- 작업 스레드 실행: 진행률, 취소 시 임시 파일 / 대상 파일 없음, 지연 시트 함수
+"""
+
+import sys
+import os
+import csv
+import tempfile
+import threading
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.services.common import export_service
+from app.services.common.export_service import (
+    ExportSheet, ExportCancelled, write_export, start_export, FORMAT_TSV
+)
+from app.qc_reports import export_qc_results_to_excel, export_qc_results_to_csv, export_full_qc_report_to_excel
+
+
+class _FakeRoot:
+    """root.after()만 흉내 내는 Tk 대용 (폴링 함수를 직접 실행)"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def run_until_idle(self):
+        while self.scheduled:
+            scheduled, self.scheduled = self.scheduled, []
+            for func in scheduled:
+                func()
+
+
+def test_xlsx_export():
+    """DataFrame + 컬럼 배열 시트를 Excel로 기록"""
+    print("\n=== 테스트 1: Excel 내보내기 ===")
+
+    import numpy as np
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    frame = pd.DataFrame({'Parameter': ['A', 'B', 'C'], 'Value': [1.5, np.nan, 3.0]})
+    arrays = {'항목': ['x', 'y'], '값': np.array([10, 20])}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'report.xlsx')
+        updates = []
+        paths = write_export(path, [ExportSheet('비교/결과', frame), ExportSheet('요약', arrays)],
+                             progress=lambda fraction, message: updates.append(fraction), chunk_size=2)
+        assert paths == [path]
+        assert not os.path.exists(path + '.partial')
+        assert updates[0] == 0.0 and updates[-1] == 1.0
+        assert updates == sorted(updates), "진행률은 증가만"
+
+        workbook = load_workbook(path)
+        assert workbook.sheetnames == ['비교_결과', '요약'], workbook.sheetnames
+        rows = list(workbook['비교_결과'].values)
+        assert rows == [('Parameter', 'Value'), ('A', 1.5), ('B', None), ('C', 3.0)], rows
+        assert workbook['비교_결과']['A1'].font.bold
+        assert workbook['비교_결과'].freeze_panes == 'A2'
+        assert list(workbook['요약'].values) == [('항목', '값'), ('x', 10), ('y', 20)]
+
+        # 최대 행 수를 넘는 시트는 '이름 (2)'로 이어서 기록
+        original = export_service.EXCEL_MAX_ROWS
+        export_service.EXCEL_MAX_ROWS = 4
+        try:
+            write_export(path, [ExportSheet('Data', {'n': list(range(7))}), ExportSheet('data', {'m': [1]})])
+        finally:
+            export_service.EXCEL_MAX_ROWS = original
+        workbook = load_workbook(path)
+        assert workbook.sheetnames == ['Data', 'Data (2)', 'Data (3)', 'data~2'], workbook.sheetnames
+        assert [row[0] for row in workbook['Data (3)'].values] == ['n', 6]
+
+        try:
+            write_export(path, [ExportSheet('Bad', {'a': [1, 2], 'b': [1]})])
+            assert False, "컬럼 길이가 다르면 ValueError"
+        except ValueError:
+            pass
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_delimited_export():
+    """CSV / TSV: 시트마다 파일 하나"""
+    print("\n=== 테스트 2: CSV / TSV 내보내기 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'result.csv')
+        sheets = [ExportSheet('결과', {'파라미터': ['PM1.Temp', 'PM2.Temp'], '값': [1.0, float('nan')]}),
+                  ExportSheet('검수 요약', {'항목': ['장비명'], '값': ['SN001']})]
+        paths = write_export(path, sheets)
+        assert paths == [path, os.path.join(tmp, 'result_검수_요약.csv')], paths
+
+        with open(path, 'rb') as handle:
+            assert handle.read(3) == b'\xef\xbb\xbf', "Excel 한글 표시용 BOM"
+        with open(path, newline='', encoding='utf-8-sig') as handle:
+            assert list(csv.reader(handle)) == [['파라미터', '값'], ['PM1.Temp', '1.0'], ['PM2.Temp', '']]
+
+        tsv_path = os.path.join(tmp, 'result.txt')
+        write_export(tsv_path, sheets[:1], file_format=FORMAT_TSV)
+        with open(tsv_path, encoding='utf-8-sig') as handle:
+            assert handle.readline().rstrip('\r\n') == '파라미터\t값'
+
+        # QC 보고서 함수 (bool 반환 유지)
+        issues = [{'parameter': 'PM1.Temp', 'issue_type': '범위 초과', 'description': '높음',
+                   'severity': '높음', 'category': 'Temp', 'recommendation': '확인'}]
+        qc_csv = os.path.join(tmp, 'qc.csv')
+        assert export_qc_results_to_csv(issues, 'EQ1', 'TypeA', qc_csv)
+        with open(qc_csv, newline='', encoding='utf-8-sig') as handle:
+            assert list(csv.reader(handle))[1][:2] == ['PM1.Temp', '범위 초과']
+
+        from openpyxl import load_workbook
+        qc_xlsx = os.path.join(tmp, 'qc.xlsx')
+        assert export_qc_results_to_excel([], 'EQ1', 'TypeA', qc_xlsx)
+        assert list(load_workbook(qc_xlsx)['검수 결과'].values)[1] == ('✅ 검수 완료 - 발견된 이슈가 없습니다.',)
+
+        full = {'summary': {'total_issues': 1, 'high_severity': 1},
+                'detailed_results': issues,
+                'checklist_validation': {'results': [{'is_valid': False, 'item_name': 'Temp', 'value': 5}],
+                                         'failed': 1},
+                'recommendations': ['재측정']}
+        assert export_full_qc_report_to_excel(full, 'EQ1', 'TypeA', qc_xlsx)
+        workbook = load_workbook(qc_xlsx)
+        assert workbook.sheetnames == ['검수 요약', '기본 QC 검사', 'Check list 검증', '권장사항']
+        assert list(workbook['Check list 검증'].values)[1][:3] == ('❌ Fail', 'Temp', 5)
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_background_job_and_cancel():
+    """작업 스레드 실행 + watch 폴링 + 취소"""
+    print("\n=== 테스트 3: 백그라운드 실행 / 취소 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 지연 시트: 함수는 작업 스레드에서 실행
+        threads = []
+
+        def build_sheet():
+            threads.append(threading.current_thread())
+            return {'n': list(range(1000))}
+
+        path = os.path.join(tmp, 'lazy.csv')
+        root = _FakeRoot()
+        progress, done, errors = [], [], []
+        job = start_export(path, [ExportSheet('lazy', build_sheet)], chunk_size=100)
+        job.watch(root, on_progress=lambda fraction, message: progress.append(fraction),
+                  on_done=done.append, on_error=errors.append)
+        job.result(10)
+        root.run_until_idle()
+        assert done == [[path]] and errors == []
+        assert progress[-1] == 1.0
+        assert threads and threads[0] is not threading.current_thread()
+
+        # 취소: 첫 묶음을 쓴 뒤 취소 → 임시 파일 / 대상 파일 모두 없음
+        path = os.path.join(tmp, 'cancel.xlsx')
+        started = threading.Event()
+        release = threading.Event()
+
+        def rows():
+            return {'n': list(range(1000))}
+
+        class _SlowSheet(ExportSheet):
+            def column_chunk(self, start, stop):
+                if start >= 100:
+                    started.set()
+                    release.wait(10)
+                return super().column_chunk(start, stop)
+
+        root = _FakeRoot()
+        errors = []
+        job = start_export(path, [_SlowSheet('big', rows)], chunk_size=100)
+        job.watch(root, on_done=lambda paths: errors.append('done'), on_error=errors.append)
+        assert started.wait(10)
+        job.cancel()
+        release.set()
+        try:
+            job.result(10)
+            assert False, "취소된 작업은 ExportCancelled"
+        except ExportCancelled:
+            pass
+        root.run_until_idle()
+        assert len(errors) == 1 and isinstance(errors[0], ExportCancelled)
+        assert job.cancelled
+        assert os.listdir(tmp) == ['lazy.csv'], os.listdir(tmp)
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("내보내기 서비스 테스트 시작\n")
+    print("=" * 60)
+
+    test_xlsx_export()
+    test_delimited_export()
+    test_background_job_and_cancel()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
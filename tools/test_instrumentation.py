@@ -0,0 +1,177 @@
+"""
+성능 계측 테스트
+
+app.instrumentation 테스트
+- span 컨텍스트 매니저 / 데코레이터, 링 버퍼 용량
+- JSON / Chrome trace 내보내기 형식
+- SQL 호출 (쿼리 문자열, 행 수), 캐시 적중 / 실패 카운터
+- 파일 로딩, Pivot, QC 검증 구간 기록
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.instrumentation import Instrumentation, instrumentation
+
+
+def test_span_and_ring_buffer():
+    """구간 기록 / 링 버퍼"""
+    print("\n=== 테스트 1: 구간 기록 / 링 버퍼 ===")
+
+    recorder = Instrumentation(capacity=3)
+
+    with recorder.span('load', 'io', file='a.txt') as s:
+        s.set(rows=10)
+
+    @recorder.span('work', 'app')
+    def work(x):
+        return x * 2
+
+    assert work(4) == 8
+    try:
+        with recorder.span('fail'):
+            raise KeyError('x')
+    except KeyError:
+        pass
+
+    spans = recorder.recent_spans()
+    assert [s.name for s in spans] == ['load', 'work', 'fail']
+    assert spans[0].args == {'file': 'a.txt', 'rows': 10}
+    assert spans[2].args['error'] == 'KeyError'
+    assert all(s.duration_us >= 0 for s in spans)
+
+    for _ in range(5):
+        work(1)
+    assert [s.name for s in recorder.recent_spans()] == ['work'] * 3, "오래된 구간부터 버림"
+    assert recorder.to_dict()['dropped'] == 5
+
+    summary = recorder.summary()
+    assert summary[0]['name'] == 'work' and summary[0]['count'] == 3
+
+    recorder.enabled = False
+    work(1)
+    recorder.count('x')
+    assert len(recorder.recent_spans()) == 3 and recorder.counters() == {}
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_export_formats():
+    """JSON / Chrome trace 내보내기"""
+    print("\n=== 테스트 2: 내보내기 형식 ===")
+
+    recorder = Instrumentation()
+    with recorder.span('sql.execute', 'sql', query='SELECT 1'):
+        pass
+    recorder.count('cache.hit', 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = recorder.export_chrome_trace(os.path.join(tmp, 'trace.json'))
+        with open(trace_path, encoding='utf-8') as f:
+            trace = json.load(f)
+        json_path = recorder.export_json(os.path.join(tmp, 'perf.json'))
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+
+    complete = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    assert len(complete) == 1
+    event = complete[0]
+    assert event['name'] == 'sql.execute' and event['cat'] == 'sql'
+    assert {'ts', 'dur', 'pid', 'tid'} <= set(event)
+    assert event['args'] == {'query': 'SELECT 1'}
+    counter = [e for e in trace['traceEvents'] if e['ph'] == 'C'][0]
+    assert counter['args'] == {'cache.hit': 2}
+
+    assert data['counters'] == {'cache.hit': 2}
+    assert data['spans'][0]['name'] == 'sql.execute'
+    assert data['summary'][0]['count'] == 1
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_sql_and_cache_hooks():
+    """SQL 호출 / 캐시 카운터 계측"""
+    print("\n=== 테스트 3: SQL / 캐시 계측 ===")
+
+    from app.schema import DBSchema
+    from app.services.common.cache_service import CacheService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        instrumentation.clear()
+
+        db_schema.add_checklist_item('Item A', 'pattern_a')
+        db_schema.add_checklist_item('Item B', 'pattern_b')
+        items = db_schema.get_checklist_items()
+        assert len(items) >= 2
+
+    spans = instrumentation.recent_spans(category='sql')
+    inserts = [s for s in spans if s.name == 'sql.execute' and 'INSERT' in s.args['query'].upper()]
+    assert len(inserts) == 2 and all(s.args['rows'] == 1 for s in inserts)
+    fetches = [s for s in spans if s.name == 'sql.fetchall']
+    assert fetches and fetches[-1].args['rows'] == len(items)
+
+    cache = CacheService()
+    cache.set('k', 1)
+    cache.get('k')
+    cache.get('k')
+    cache.get('missing')
+    counters = instrumentation.counters()
+    assert counters['cache.hit'] == 2 and counters['cache.miss'] == 1
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_load_pivot_qc_hooks():
+    """파일 로딩 / Pivot / QC 검증 구간"""
+    print("\n=== 테스트 4: 로딩 / Pivot / QC 계측 ===")
+
+    from app.file_service import read_comparison_file
+    from app.dataset import ComparisonDataset
+    from app.qc.qc_kernel import QCRule, KIND_RANGE, compile_rules, evaluate
+
+    instrumentation.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'A.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Module\tPart\tItemName\tItemValue\n")
+            f.write("M\tP\ta\t1\nM\tP\tb\t5\n")
+        name, df = read_comparison_file(path)
+
+    dataset = ComparisonDataset()
+    dataset.append_file(name, df)
+    dataset.remove_file(name)
+
+    rules = compile_rules([QCRule('a', KIND_RANGE, 0, 2), QCRule('b', KIND_RANGE, 0, 2)])
+    evaluate(['a', 'b'], ['1', '5'], rules)
+
+    by_name = {s.name: s for s in instrumentation.recent_spans()}
+    assert by_name['file.read'].args == {'file': 'A.txt', 'rows': 2}
+    assert 'pivot.add_column' in by_name and 'pivot.remove_column' in by_name
+    assert by_name['qc.evaluate'].args == {'rows': 2, 'rules': 2, 'failed': 1}
+
+    print("[OK] 테스트 4 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("성능 계측 테스트 시작\n")
+    print("=" * 60)
+
+    test_span_and_ring_buffer()
+    test_export_formats()
+    test_sql_and_cache_hooks()
+    test_load_pivot_qc_hooks()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (4/4)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+메모리 매핑 데이터셋 테스트
+
+app.value_table / app.mapped_dataset (MappedComparisonDataset) 테스트
+- 무작위 파일 추가 / 제거에서 메모리 백엔드와 같은 Pivot 결과 / 변경 내역
+- 표 모델, 병합 프레임, 파일 프레임 (ItemType 등 문자열 컬럼 보존)
+- 매핑 파일 생성 / 삭제, 메모리 사용량, 백엔드 선택
+"""
+
+import sys
+import os
+import gc
+import random
+import tempfile
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+
+from app.dataset import ComparisonDataset, create_comparison_dataset
+from app.mapped_dataset import MIN_CAPACITY, MappedComparisonDataset
+from app.value_table import MISSING_CODE, ValueTable
+
+
+def _frame(rows):
+    """(Module, Part, ItemName, ItemValue) 목록 → DataFrame"""
+    return pd.DataFrame(rows, columns=['Module', 'Part', 'ItemName', 'ItemValue'])
+
+
+def _delta_tuple(delta):
+    return (delta.column, delta.added, delta.added_keys, delta.removed_keys,
+            delta.diff_changed_keys, delta.column_keys)
+
+
+def test_matches_memory_backend():
+    """테스트 1: 메모리 백엔드와 같은 결과"""
+    print("\n=== 테스트 1: 메모리 백엔드와 일치 ===")
+
+    table = ValueTable()
+    assert table.code('a') == table.code('a') == 1 and table.code('b') == 2
+    assert table.code(None) == MISSING_CODE and table.lookup('zz') is None
+    assert list(table.decode([2, 0, 1])) == ['b', None, 'a'] and len(table) == 2
+
+    rng = random.Random(11)
+
+    def random_frame():
+        # 행 수가 매핑 파일 초기 용량을 넘도록 (용량 확장 확인)
+        rows = [(f"M{rng.randint(1, 3)}", f"P{rng.randint(1, 4)}",
+                 f"item{rng.randint(1, MIN_CAPACITY * 2)}", str(rng.randint(1, 3)))
+                for _ in range(rng.randint(1, 900))]
+        return _frame(rows)
+
+    memory = ComparisonDataset()
+    mapped = MappedComparisonDataset()
+    try:
+        for step in range(40):
+            names = memory.file_names
+            if names and rng.random() < 0.35:
+                name = rng.choice(names)
+                deltas = memory.remove_file(name), mapped.remove_file(name)
+            else:
+                name, frame = f"F{step}", random_frame()
+                deltas = memory.append_file(name, frame), mapped.append_file(name, frame)
+            assert _delta_tuple(deltas[0]) == _delta_tuple(deltas[1]), step
+
+            expected, actual = memory.pivot, mapped.pivot
+            assert actual.file_names == expected.file_names == mapped.file_names
+            assert actual.keys == expected.keys
+            assert (actual.diff == expected.diff).all() and (actual.present == expected.present).all()
+            assert actual.part_counts == expected.part_counts
+            assert actual.summary() == expected.summary()
+            for key in rng.sample(expected.keys, min(50, len(expected.keys))):
+                assert actual.row_values(key) == expected.row_values(key), key
+                assert actual.has_difference(key) == expected.has_difference(key), key
+        assert len(mapped.pivot) > MIN_CAPACITY
+    finally:
+        mapped.close()
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_dataset_interface():
+    """테스트 2: 표 모델 / 병합 프레임 / 파일 프레임"""
+    print("\n=== 테스트 2: 데이터셋 인터페이스 ===")
+
+    frame_a = pd.DataFrame({
+        'Module': ['M', 'M', 'M', 'M'], 'Part': ['P', 'P', 'Q', 'P'],
+        'ItemName': ['a', 'b', 'c', 'a'], 'ItemValue': ['1', '2', '9', 'dup'],
+        'ItemType': ['double', 'int', 'string', 'double'], 'ItemDescription': ['설명', None, '', 'x'],
+    })
+    frame_b = _frame([('M', 'P', 'a', '1'), ('M', 'P', 'b', '3')])
+
+    dataset = create_comparison_dataset('mmap')
+    try:
+        assert isinstance(dataset, MappedComparisonDataset)
+        dataset.add_file('A', frame_a, '/tmp/A.txt')
+        dataset.add_file('B', frame_b)
+        del frame_a
+
+        # 표 모델: 정렬 순서 / 값 없음은 None
+        model = dataset.pivot.table_model(['A', 'B'])
+        assert model.records() == [
+            {'Module': 'M', 'Part': 'P', 'ItemName': 'a', 'A': '1', 'B': '1'},
+            {'Module': 'M', 'Part': 'P', 'ItemName': 'b', 'A': '2', 'B': '3'},
+            {'Module': 'M', 'Part': 'Q', 'ItemName': 'c', 'A': '9', 'B': None},
+        ]
+        diff_keys = {key for key, diff in zip(dataset.pivot.keys, dataset.pivot.diff) if diff}
+        assert diff_keys == {('M', 'P', 'b')}
+        assert len(dataset.pivot.table_model(visible_keys=diff_keys)) == 1
+        assert list(dataset.pivot.columns['B']) == ['1', '3', None]
+
+        # 파일 프레임: 키별 첫 행 + 문자열 컬럼 보존
+        loaded = dataset.get_file('A')
+        assert loaded.path == '/tmp/A.txt'
+        frame = loaded.frame
+        assert list(frame['ItemName']) == ['a', 'b', 'c'] and set(frame['Model']) == {'A'}
+        assert list(frame['ItemType']) == ['double', 'int', 'string']
+        assert frame['ItemDescription'][0] == '설명' and frame['ItemDescription'][2] == ''
+        assert frame['ItemDescription'].isna().tolist() == [False, True, False]
+        assert loaded.file_data() == {'a': '1', 'b': '2', 'c': '9'}
+        data, shadow = loaded.file_data_with_shadow()
+        assert len(shadow) == len(data) == 3
+
+        merged = dataset.merged_df
+        assert len(merged) == 5 and dataset.merged_df is merged
+        assert list(merged['Model']) == ['A', 'A', 'A', 'B', 'B']
+        assert merged['ItemType'].isna().sum() == 2
+
+        dataset.remove_file('A')
+        assert set(dataset.merged_df['Model']) == {'B'} and len(dataset.pivot) == 2
+        assert dataset.pivot.row_values(('M', 'P', 'b')) == ['3'] and dataset.pivot.diff_count == 0
+    finally:
+        dataset.close()
+
+    try:
+        create_comparison_dataset('disk')
+        assert False, "알 수 없는 백엔드는 ValueError"
+    except ValueError:
+        pass
+    assert type(create_comparison_dataset()) is ComparisonDataset
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_mapped_files():
+    """테스트 3: 매핑 파일 / 메모리 사용량"""
+    print("\n=== 테스트 3: 매핑 파일 ===")
+
+    rows = 5000
+    frame = _frame([('M', f"P{i % 7}", f"item{i}", f"v{i % 50}") for i in range(rows)])
+
+    with tempfile.TemporaryDirectory() as parent:
+        dataset = MappedComparisonDataset(parent)
+        directory = dataset.directory
+        assert os.path.dirname(directory) == parent
+
+        for index in range(3):
+            dataset.add_file(f"F{index}", frame)
+        assert len(os.listdir(directory)) == 3
+
+        usage = dataset.memory_usage()
+        assert usage['frames'] == 0 and usage['merged'] == 0
+        assert usage['mapped'] >= 3 * rows * 4 and usage['values'] > 0
+        assert usage['total'] == usage['shadows'] + usage['values']
+        assert len(dataset.pivot.values) == 50
+
+        dataset.remove_file('F1')
+        assert len(os.listdir(directory)) == 2
+        dataset.merged_df
+        assert dataset.memory_usage()['merged'] > 0
+
+        dataset.clear()
+        assert os.listdir(directory) == [] and dataset.memory_usage()['total'] == 0
+        dataset.add_file('again', frame)
+        assert len(dataset.pivot) == rows
+
+        dataset.close()
+        assert not os.path.exists(directory)
+
+        # close 없이 해제되어도 디렉토리 삭제
+        dataset = MappedComparisonDataset(parent)
+        dataset.add_file('F', frame)
+        directory = dataset.directory
+        del dataset
+        gc.collect()
+        assert not os.path.exists(directory)
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("메모리 매핑 데이터셋 테스트 시작\n")
+    print("=" * 60)
+
+    test_matches_memory_backend()
+    test_dataset_interface()
+    test_mapped_files()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
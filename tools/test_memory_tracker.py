@@ -0,0 +1,216 @@
+"""
+메모리 추적 테스트
+
+app.memory_tracker / 데이터셋 해제 / CheckboxTreeview 테스트
+- 약한 참조 추적: 객체가 해제되면 개수에서 빠짐, 측정 함수 결과 / 오류 기록
+- 스냅샷 링 버퍼, 스냅샷 간 증가량, tracemalloc 할당 위치, JSON 내보내기
+- 데이터셋 해제(clear / remove_file) 후 LoadedFile / 병합 프레임이 남지 않고 메모리가 반환됨
+- CheckboxTreeview: 아이템 삭제 시 체크박스 변수 해제, Tk 객체 수 (디스플레이가 있을 때만)
+"""
+
+import sys
+import os
+import gc
+import json
+import tempfile
+import tracemalloc
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+
+from app.dataset import ComparisonDataset
+from app.memory_tracker import MemoryTracker, memory_tracker, process_rss_kb
+
+
+class _Item:
+    """약한 참조 가능한 추적 대상"""
+
+
+def _frame(rows, value_prefix='v'):
+    return pd.DataFrame({
+        'Module': [f"M{i % 4}" for i in range(rows)],
+        'Part': [f"P{i % 9}" for i in range(rows)],
+        'ItemName': [f"Item{i:06d}" for i in range(rows)],
+        'ItemValue': [f"{value_prefix}{i}" for i in range(rows)],
+    })
+
+
+def test_tracker():
+    """테스트 1: 추적 / 측정 함수 / 스냅샷"""
+    print("\n=== 테스트 1: 메모리 추적기 ===")
+
+    tracker = MemoryTracker(capacity=3)
+    items = [tracker.track('item', _Item()) for _ in range(5)]
+    assert tracker.live_count('item') == 5 and tracker.live_count('unknown') == 0
+    del items[:3]
+    gc.collect()
+    assert tracker.live_count('item') == 2
+
+    rows = []
+    tracker.add_probe('rows', lambda: {'rows': (len(rows), len(rows) * 100), 'views': 1})
+    tracker.add_probe('broken', lambda: 1 / 0)
+    first = tracker.snapshot('처음')
+    assert first.categories['live.item'] == {'count': 2, 'bytes': None}
+    assert first.categories['rows'] == {'count': 0, 'bytes': 0}
+    assert first.categories['views'] == {'count': 1, 'bytes': None}
+    assert first.categories['broken']['error'].startswith('ZeroDivisionError')
+
+    rows.extend(range(50))
+    items.append(tracker.track('item', _Item()))
+    second = tracker.snapshot('증가')
+    growth = tracker.growth(first, second)
+    assert [entry['category'] for entry in growth] == ['rows', 'live.item']
+    assert growth[0]['bytes_delta'] == 5000 and growth[1]['count_delta'] == 1
+    assert tracker.growth(second, second) == []
+
+    # 링 버퍼: 오래된 스냅샷부터 버림
+    tracker.snapshot('3')
+    tracker.snapshot('4')
+    assert [record.label for record in tracker.snapshots()] == ['증가', '3', '4']
+    assert [record.label for record in tracker.snapshots(limit=1)] == ['4']
+
+    tracker.remove_probe('broken')
+    assert 'broken' not in tracker.snapshot().categories
+
+    rss = process_rss_kb()
+    assert rss is None or rss > 0
+
+    # tracemalloc은 켰을 때만 합계 / 할당 위치 기록
+    assert tracker.snapshot().traced_kb is None and tracker.top_allocations() == []
+    tracker.set_tracing(True)
+    try:
+        assert tracker.tracing()
+        blocks = [bytearray(1024) for _ in range(2000)]
+        record = tracker.snapshot('추적')
+        assert record.traced_kb >= 2000
+        top = tracker.top_allocations(limit=3)
+        assert len(top) <= 3 and top[0]['size_kb'] >= 2000 and 'test_memory_tracker.py' in top[0]['location']
+        del blocks
+    finally:
+        tracker.set_tracing(False)
+    assert not tracker.tracing()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = tracker.export_json(os.path.join(temp_dir, 'memory.json'))
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['capacity'] == 3 and len(data['snapshots']) == 3
+        assert data['snapshots'][-1]['label'] == '추적'
+
+    tracker.clear()
+    assert tracker.snapshots() == [] and tracker.live_count('item') == 3
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_dataset_release():
+    """테스트 2: 데이터셋 해제 시 메모리 반환"""
+    print("\n=== 테스트 2: 데이터셋 해제 ===")
+
+    gc.collect()
+    baseline_files = memory_tracker.live_count('LoadedFile')
+    baseline_merged = memory_tracker.live_count('merged_df')
+
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        dataset = ComparisonDataset()
+        for round_no in range(3):
+            for index in range(4):
+                dataset.add_file(f"F{index}", _frame(20000, f"r{round_no}_{index}_"))
+            merged = dataset.merged_df
+            assert len(merged) == 80000
+            dataset.get_file('F0').shadow
+            assert memory_tracker.live_count('LoadedFile') == baseline_files + 4
+            loaded_bytes = tracemalloc.get_traced_memory()[0] - before
+            del merged
+
+            # 한 파일 제거: 병합 프레임은 새 프레임으로 교체, 제거된 파일은 해제
+            dataset.remove_file('F3')
+            gc.collect()
+            assert memory_tracker.live_count('LoadedFile') == baseline_files + 3
+            assert memory_tracker.live_count('merged_df') == baseline_merged + 1
+
+            dataset.clear()
+            gc.collect()
+            assert memory_tracker.live_count('LoadedFile') == baseline_files
+            assert memory_tracker.live_count('merged_df') == baseline_merged
+            assert dataset.memory_usage()['total'] == 0
+            remaining = tracemalloc.get_traced_memory()[0] - before
+            assert remaining < loaded_bytes * 0.05, (round_no, remaining, loaded_bytes)
+    finally:
+        tracemalloc.stop()
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_checkbox_treeview():
+    """테스트 3: CheckboxTreeview 체크박스 변수 해제 / Tk 객체 수"""
+    print("\n=== 테스트 3: CheckboxTreeview ===")
+
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"[SKIP] Tk를 사용할 수 없음: {e}")
+        return
+    root.withdraw()
+
+    try:
+        from app.widgets import CheckboxTreeview
+        from app.memory_tracker import tk_object_counts
+
+        tree = CheckboxTreeview(root, columns=('value',))
+        baseline = tk_object_counts(root)
+        parents = [tree.insert('', 'end', values=('', i)) for i in range(10)]
+        for parent in parents:
+            for j in range(5):
+                tree.insert(parent, 'end', values=('', j))
+        tree.check(parents[0])
+        counts = tk_object_counts(root)
+        assert counts['tk.tree_items'] - baseline['tk.tree_items'] == 60
+        assert counts['tk.variables'] - baseline['tk.variables'] == 60
+
+        # 부모를 지우면 하위 아이템 변수까지 해제
+        tree.delete(parents[0], parents[1])
+        assert len(tree.checkboxes) == 48
+        assert not tree.is_checked(parents[0])
+        gc.collect()
+        assert tk_object_counts(root)['tk.variables'] - baseline['tk.variables'] == 48
+
+        # 없는 아이템 조회는 변수를 만들지 않음
+        for _ in range(100):
+            tree.is_checked('missing')
+        gc.collect()
+        assert tk_object_counts(root)['tk.variables'] - baseline['tk.variables'] == 48
+
+        tree.clear()
+        gc.collect()
+        counts = tk_object_counts(root)
+        assert tree.checkboxes == {} and counts['tk.tree_items'] == baseline['tk.tree_items']
+        assert counts['tk.variables'] == baseline['tk.variables']
+    finally:
+        root.destroy()
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("메모리 추적 테스트 시작\n")
+    print("=" * 60)
+
+    test_tracker()
+    test_dataset_release()
+    test_checkbox_treeview()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+출고 파라미터 차분 저장소 테스트
+
+app.services.shipped_equipment.parameter_storage 차분 저장소 테스트
+- Configuration 기준값(Default DB) 대비 변경 / 추가 / 빠진 값만 저장, 읽을 때 전체 재구성
+- 기준값 스냅샷 재사용 / Default DB 변경 후 새 스냅샷
+- 기존 정규화 저장소 전환(enable_deltas) / 복원(expand_deltas) 전후 조회 결과 동일
+- 마이그레이션 스크립트 --deltas (dry run, 롤백)
+- 기준값과 다른 장비 조회 (get_parameter_deviations)
+- 호환 VIEW 쓰기, 파라미터 이름 색인 사용 수
+- 장비 삭제 시 값 / 빠진 키 / 기준값 연결 정리
+- 장비별 파라미터 이름 중복 거부 (모듈 / 파트 / 타입만 다른 같은 이름 포함)
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+# src / tools 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.common.search_index import fts5_available
+from app.services.shipped_equipment.parameter_storage import (
+    VALUES_TABLE, REMOVALS_TABLE, BASELINES_TABLE, EQUIPMENT_BASELINES_TABLE,
+    MODE_LEGACY, MODE_DELTA, MODE_NORMALIZED,
+    storage_mode, normalize, enable_deltas, expand_deltas
+)
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _ShippedSchema:
+    """Default DB / 출고 장비 테이블만 가진 테스트용 스키마"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Default_DB_Values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER,
+                    parameter_name TEXT, default_value TEXT, is_type_common INTEGER DEFAULT 0,
+                    notes TEXT, created_at TIMESTAMP, updated_at TIMESTAMP,
+                    UNIQUE (configuration_id, parameter_name));
+                CREATE TABLE Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+                    configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+                    ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+                    notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER NOT NULL,
+                    parameter_name TEXT NOT NULL, parameter_value TEXT NOT NULL,
+                    module TEXT, part TEXT, data_type TEXT,
+                    UNIQUE (shipped_equipment_id, parameter_name));
+            """)
+            conn.executemany(
+                "INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value) VALUES (1, ?, ?)",
+                [(f"PM{i % 3}.Heater.Item{i:03d}", str(i)) for i in range(200)])
+            conn.commit()
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _tool_file(changed=(), missing=(), extra=()):
+    """기준값 200개 중 changed는 값 변경, missing은 제외, extra는 추가 (파일 파싱 결과 형식)"""
+    parameters = []
+    for i in range(200):
+        if i in missing:
+            continue
+        parameters.append({
+            'parameter_name': f"PM{i % 3}.Heater.Item{i:03d}",
+            'parameter_value': f"{i}.5" if i in changed else str(i),
+            'module': f"PM{i % 3}",
+            'part': 'Heater',
+            'data_type': 'int',
+        })
+    for name in extra:
+        parameters.append({'parameter_name': name, 'parameter_value': 'X', 'module': 'EFEM',
+                           'part': 'Robot', 'data_type': 'str'})
+    return parameters
+
+
+def _add_tools(db_schema, service, tools):
+    """tools: [(serial, configuration_id, parameters)] → 장비 ID 목록"""
+    ids = []
+    for serial, configuration_id, parameters in tools:
+        with db_schema.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, customer_name) "
+                "VALUES (1, ?, ?, 'Samsung')", (configuration_id, serial))
+            conn.commit()
+            ids.append(cursor.lastrowid)
+        service.add_parameters_bulk(ids[-1], parameters)
+    return ids
+
+
+def _rows(service, equipment_id):
+    return sorted((p.parameter_name, p.parameter_value, p.module, p.part, p.data_type)
+                  for p in service.get_parameters_by_equipment(equipment_id))
+
+
+def _expected(parameters):
+    return sorted((p['parameter_name'], p['parameter_value'], p['module'], p['part'], p['data_type'])
+                  for p in parameters)
+
+
+def _count(db_schema, table):
+    with db_schema.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_delta_import():
+    """차분 임포트 + 전체 재구성"""
+    print("\n=== 테스트 1: 차분 임포트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+            enable_deltas(conn)
+            assert storage_mode(conn) == MODE_DELTA
+
+        tool_a = _tool_file(changed={5, 17, 42}, missing={7, 8}, extra=['EFEM.Robot.Speed', 'EFEM.Robot.Home'])
+        tool_b = _tool_file(changed={5})
+        other = _tool_file()[:50]
+        # A 파일에 없는 기준값 키(7, 8)의 데이터 타입은 기본값에서 추론 → B 파일과 같은 키
+        a, b, c = _add_tools(db_schema, service, [('SN001', 1, tool_a), ('SN002', 1, tool_b), ('SN003', 2, other)])
+
+        # 저장: A 변경 3 + 추가 2, B 변경 1, 기준값 없는 Configuration 2는 전체 50
+        assert _count(db_schema, VALUES_TABLE) == 5 + 1 + 50
+        assert _count(db_schema, REMOVALS_TABLE) == 2
+        assert _count(db_schema, BASELINES_TABLE) == 1, "같은 Default DB는 스냅샷 재사용"
+
+        assert _rows(service, a) == _expected(tool_a)
+        assert _rows(service, b) == _expected(tool_b)
+        assert _rows(service, c) == _expected(other)
+        assert service.count_parameters(a) == 200 and service.count_parameters(a, "robot") == 2
+        inherited = [p for p in service.get_parameters_by_equipment(b) if p.id is None]
+        assert len(inherited) == 199, "기준값 행은 id None"
+
+        # Default DB 변경 → 새 장비는 새 스냅샷, 기존 장비 값은 그대로
+        with db_schema.get_connection() as conn:
+            conn.execute("UPDATE Default_DB_Values SET default_value = '5.5' WHERE parameter_name = 'PM2.Heater.Item005'")
+            conn.commit()
+        d, = _add_tools(db_schema, service, [('SN004', 1, tool_b)])
+        assert _count(db_schema, BASELINES_TABLE) == 2
+        assert _rows(service, d) == _rows(service, b) == _expected(tool_b)
+
+        # 빠진 키 추가 허용, 이미 보이는 키(기준값 / 저장된 값)는 중복 → 전체 취소
+        missing = [p for p in _tool_file() if p['parameter_name'] == 'PM1.Heater.Item007']
+        assert service.add_parameters_bulk(a, missing) == 1
+        assert _count(db_schema, REMOVALS_TABLE) == 1
+        for duplicate in (_tool_file()[:1], [tool_a[-1]]):
+            try:
+                service.add_parameters_bulk(a, [{'parameter_name': 'New.Part.Item', 'parameter_value': '1'}]
+                                            + duplicate)
+                assert False, "중복 키는 IntegrityError"
+            except sqlite3.IntegrityError:
+                pass
+        assert service.count_parameters(a) == 201 and service.count_parameters(a, "new.part") == 0
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_enable_and_expand():
+    """기존 데이터 전환 / 복원 + 기준값과 다른 장비 조회 + 마이그레이션 스크립트"""
+    print("\n=== 테스트 2: 전환 / 복원 / 차이 조회 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        ids = _add_tools(db_schema, service, [
+            (f"SN{i:03d}", 1, _tool_file(changed={i, 100}, missing={150 + i % 3}, extra=[f"EFEM.Robot.Opt{i}"]))
+            for i in range(10)] + [('SN100', 2, _tool_file()[:20])])
+
+        def snapshot():
+            rows = [_rows(service, equipment_id) for equipment_id in ids]
+            page = [p.parameter_name for p in service.get_parameters_page(ids[3], after_name="PM1", limit=30)]
+            history = service.get_parameter_history("PM1.Heater.Item100")
+            matrix = service.get_parameter_matrix(configuration_id=1)
+            return (rows, page, sorted(history.values), history.avg_value, service.count_parameters(ids[4], "item15"),
+                    matrix.parameter_names,
+                    [[matrix.value(row, col) for col in range(matrix.shape[1])] for row in range(matrix.shape[0])])
+
+        before = snapshot()
+        deviations = service.get_parameter_deviations("PM1.Heater.Item100")
+        assert [(serial, value) for serial, value, _ in deviations] == [(f"SN{i:03d}", "100.5") for i in range(10)]
+        assert service.get_parameter_deviations("PM0.Heater.Item150", configuration_id=1) == [
+            ('SN000', None, '150'), ('SN003', None, '150'), ('SN006', None, '150'), ('SN009', None, '150')]
+
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+            result = enable_deltas(conn)
+        assert result == {'baselines': 1, 'equipment': 10, 'values': 10 * 3 + 20, 'removed': 10}, result
+        assert snapshot() == before
+        assert service.get_parameter_deviations("PM1.Heater.Item100") == deviations
+        assert service.get_parameter_deviations("PM0.Heater.Item150", configuration_id=1) == [
+            ('SN000', None, '150'), ('SN003', None, '150'), ('SN006', None, '150'), ('SN009', None, '150')]
+        assert service.get_parameter_deviations("PM0.Heater.Item150", configuration_id=2) == []
+
+        with db_schema.get_connection() as conn:
+            assert expand_deltas(conn) == 10 * 200 - 10 * 3
+            assert storage_mode(conn) == MODE_NORMALIZED
+        assert snapshot() == before
+        assert _count(db_schema, VALUES_TABLE) == 10 * 200 + 20
+
+        # 마이그레이션 스크립트: dry run은 변경 없음, 롤백은 기존 테이블까지
+        from migrate_parameter_keys import ParameterKeysMigration
+        migration = ParameterKeysMigration(db_path=db_schema.db_path)
+        assert migration.run(dry_run=True, deltas=True)
+        with db_schema.get_connection() as conn:
+            assert storage_mode(conn) == MODE_NORMALIZED
+        assert migration.run(deltas=True)
+        with db_schema.get_connection() as conn:
+            assert storage_mode(conn) == MODE_DELTA
+        assert snapshot() == before
+        assert migration.rollback()
+        with db_schema.get_connection() as conn:
+            assert storage_mode(conn) == MODE_LEGACY
+        assert snapshot() == before
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_view_writes_and_search():
+    """호환 VIEW 쓰기 + 파라미터 이름 사용 수"""
+    print("\n=== 테스트 3: 호환 VIEW 쓰기 / 이름 색인 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        if fts5_available():
+            service.search_parameter_names("item")  # 색인 생성
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+            enable_deltas(conn)
+        a, b = _add_tools(db_schema, service, [('SN001', 1, _tool_file(missing={9})),
+                                               ('SN002', 1, _tool_file(changed={9}))])
+
+        with db_schema.get_connection() as conn:
+            # 기준값 행 수정 / 삭제, 빠진 키 추가, 새 키 추가, 중복 추가
+            conn.execute("UPDATE Shipped_Equipment_Parameters SET parameter_value = '1.5' "
+                         "WHERE shipped_equipment_id = ? AND parameter_name = 'PM1.Heater.Item001'", (a,))
+            conn.execute("DELETE FROM Shipped_Equipment_Parameters "
+                         "WHERE shipped_equipment_id = ? AND parameter_name IN ('PM2.Heater.Item002', "
+                         "'PM0.Heater.Item009')", (b,))
+            conn.execute("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                         "parameter_value, module, part, data_type) "
+                         "VALUES (?, 'PM0.Heater.Item009', '9', 'PM0', 'Heater', 'int')", (a,))
+            conn.execute("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                         "parameter_value) VALUES (?, 'Vacuum.Gauge', '3')", (a,))
+            try:
+                conn.execute("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                             "parameter_value, module, part, data_type) "
+                             "VALUES (?, 'PM0.Heater.Item000', '0', 'PM0', 'Heater', 'int')", (b,))
+                assert False, "기준값으로 보이는 키 중복"
+            except sqlite3.IntegrityError:
+                pass
+            conn.commit()
+
+        rows_a = {name: value for name, value, *_ in _rows(service, a)}
+        rows_b = {name: value for name, value, *_ in _rows(service, b)}
+        assert len(rows_a) == 201 and rows_a['PM1.Heater.Item001'] == '1.5' and rows_a['Vacuum.Gauge'] == '3'
+        assert rows_a['PM0.Heater.Item009'] == '9'
+        assert len(rows_b) == 198 and 'PM2.Heater.Item002' not in rows_b and 'PM0.Heater.Item009' not in rows_b
+        with db_schema.get_connection() as conn:
+            # A: 기준값과 같은 값으로 되살린 키는 값 행 없음
+            assert conn.execute(f"SELECT COUNT(*) FROM {VALUES_TABLE}").fetchone()[0] == 2
+            assert conn.execute(f"SELECT COUNT(*) FROM {REMOVALS_TABLE}").fetchone()[0] == 2
+
+        if fts5_available():
+            counts = dict(service.search_parameter_names("heater", limit=500))
+            assert len(counts) == 200
+            assert counts['PM1.Heater.Item001'] == 2 and counts['PM0.Heater.Item009'] == 1
+            assert counts['PM2.Heater.Item002'] == 1
+            assert service.search_parameter_names("vacuum") == [('Vacuum.Gauge', 1)]
+
+        # 장비 삭제: 값 / 빠진 키 / 기준값 연결도 지워 VIEW에 남지 않음, 이름 사용 수 감소
+        assert service.delete_shipped_equipment(a)
+        assert service.get_parameters_by_equipment(a) == [] and service.count_parameters(a) == 0
+        assert len(_rows(service, b)) == 198
+        with db_schema.get_connection() as conn:
+            assert conn.execute(f"SELECT COUNT(*) FROM {VALUES_TABLE}").fetchone()[0] == 0
+            assert conn.execute(f"SELECT COUNT(*) FROM {REMOVALS_TABLE}").fetchone()[0] == 2
+            assert conn.execute(f"SELECT shipped_equipment_id FROM {EQUIPMENT_BASELINES_TABLE}").fetchall() == [(b,)]
+            assert conn.execute("SELECT COUNT(*) FROM Shipped_Equipment_Parameters "
+                                "WHERE shipped_equipment_id = ?", (a,)).fetchone()[0] == 0
+
+        if fts5_available():
+            counts = dict(service.search_parameter_names("heater", limit=500))
+            assert len(counts) == 198 and counts['PM1.Heater.Item001'] == 1
+            assert 'PM2.Heater.Item002' not in counts and 'PM0.Heater.Item009' not in counts
+            assert service.search_parameter_names("vacuum") == []
+
+        assert service.delete_shipped_equipment(b)
+        assert _count(db_schema, REMOVALS_TABLE) == _count(db_schema, EQUIPMENT_BASELINES_TABLE) == 0
+        if fts5_available():
+            assert service.search_parameter_names("heater") == []
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_duplicate_names():
+    """장비별 파라미터 이름 중복 거부 (기존 테이블의 UNIQUE (shipped_equipment_id, parameter_name))"""
+    print("\n=== 테스트 4: 이름 중복 거부 ===")
+
+    def rejected(write):
+        try:
+            write()
+            return False
+        except sqlite3.IntegrityError:
+            return True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+            enable_deltas(conn)
+
+        # 첫 추가(기준값 연결)에서 목록 안 중복 → 전체 취소, 기준값 연결도 남지 않음
+        same_name = [{'parameter_name': 'EFEM.Robot.Speed', 'parameter_value': '1', 'data_type': 'int'},
+                     {'parameter_name': 'EFEM.Robot.Speed', 'parameter_value': '1', 'data_type': 'str'}]
+        with db_schema.get_connection() as conn:
+            a = conn.execute("INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, "
+                             "customer_name) VALUES (1, 1, 'SN001', 'Samsung')").lastrowid
+            conn.commit()
+        assert rejected(lambda: service.add_parameters_bulk(a, _tool_file() + same_name))
+        assert _count(db_schema, EQUIPMENT_BASELINES_TABLE) == 0 and service.count_parameters(a) == 0
+        assert service.add_parameters_bulk(a, _tool_file(missing={9}) + same_name[:1]) == 200
+
+        # 기준값 / 저장된 값과 이름만 같은 키 (파트 / 타입 다름)
+        for duplicate in ({'parameter_name': 'PM0.Heater.Item000', 'parameter_value': '0', 'part': 'Other'},
+                          {'parameter_name': 'EFEM.Robot.Speed', 'parameter_value': '1', 'data_type': 'str'}):
+            assert rejected(lambda: service.add_parameters_bulk(a, [duplicate]))
+        assert service.count_parameters(a) == 200
+
+        with db_schema.get_connection() as conn:
+            insert = ("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                      "parameter_value, module, part, data_type) VALUES (?, ?, '1', ?, ?, ?)")
+            assert rejected(lambda: conn.execute(insert, (a, 'PM0.Heater.Item000', 'PM0', 'Heater', 'str')))
+            assert rejected(lambda: conn.execute(insert, (a, 'EFEM.Robot.Speed', 'EFEM', None, None)))
+            # 빠진 키 이름은 다른 타입으로도 추가 가능
+            conn.execute(insert, (a, 'PM0.Heater.Item009', 'PM0', 'Heater', 'str'))
+            # 다른 행의 이름으로 수정 → 중복, 같은 행의 타입 수정은 허용
+            assert rejected(lambda: conn.execute(
+                "UPDATE Shipped_Equipment_Parameters SET parameter_name = 'PM1.Heater.Item001' "
+                "WHERE shipped_equipment_id = ? AND parameter_name = 'EFEM.Robot.Speed'", (a,)))
+            conn.execute("UPDATE Shipped_Equipment_Parameters SET data_type = 'float' "
+                         "WHERE shipped_equipment_id = ? AND parameter_name = 'EFEM.Robot.Speed'", (a,))
+            conn.commit()
+
+        rows = _rows(service, a)
+        names = [name for name, *_ in rows]
+        assert len(rows) == 201 and len(set(names)) == 201
+        assert ('EFEM.Robot.Speed', '1', None, None, 'float') in rows
+        assert ('PM0.Heater.Item009', '1', 'PM0', 'Heater', 'str') in rows
+
+    print("[OK] 테스트 4 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("출고 파라미터 차분 저장소 테스트 시작\n")
+    print("=" * 60)
+
+    test_delta_import()
+    test_enable_and_expand()
+    test_view_writes_and_search()
+    test_duplicate_names()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (4/4)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+출고 장비 파라미터 매트릭스 테스트
+
+app.services.shipped_equipment.parameter_matrix 테스트
+- Serial × Parameter 행렬이 장비별 파라미터 조회 결과와 일치 (chunk 크기 무관)
+- Configuration / 고객 / 파라미터 이름 필터
+- fleet 값, drift / outlier 표시
+- CSV / DataFrame 내보내기
+"""
+
+import sys
+import os
+import csv
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _ShippedSchema:
+    """출고 장비 / 파라미터 테이블만 가진 테스트용 스키마"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+                    configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+                    ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+                    notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER,
+                    parameter_name TEXT, parameter_value TEXT, module TEXT, part TEXT, data_type TEXT,
+                    UNIQUE (shipped_equipment_id, parameter_name));
+            """)
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _populate(db_schema, service, count=40):
+    """
+    Configuration 1: count대, Configuration 2: 5대
+
+    - Mode: 전부 'AUTO', SN0007만 'MANUAL' (drift)
+    - Gain: 1.00 ~ 1.10 분포, SN0011만 9.5 (outlier)
+    - Offset: 장비마다 다른 값 (drift 아님)
+    - Option: 짝수 장비에만 있음
+    """
+    with db_schema.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, customer_name) "
+            "VALUES (1, ?, ?, ?)",
+            [(1, f"SN{i:04d}", 'Samsung' if i % 2 else 'Hynix') for i in range(count)]
+            + [(2, f"XN{i:04d}", 'Samsung') for i in range(5)])
+        conn.commit()
+
+    for i in range(count):
+        parameters = [
+            {'parameter_name': 'Mode', 'parameter_value': 'MANUAL' if i == 7 else 'AUTO'},
+            {'parameter_name': 'Gain', 'parameter_value': '9.5' if i == 11 else f"{1 + (i % 11) / 100:.2f}"},
+            {'parameter_name': 'Offset', 'parameter_value': str(i * 3)},
+        ]
+        if i % 2 == 0:
+            parameters.append({'parameter_name': 'Option', 'parameter_value': 'ON'})
+        service.add_parameters_bulk(i + 1, parameters)
+    for i in range(5):
+        service.add_parameters_bulk(count + i + 1, [{'parameter_name': 'Other', 'parameter_value': 'X'}])
+
+
+def test_matrix_values():
+    """행렬 값 = 장비별 파라미터 (chunk 크기 무관)"""
+    print("\n=== 테스트 1: 매트릭스 값 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        _populate(db_schema, service)
+
+        matrix = service.get_parameter_matrix(configuration_id=1)
+        assert matrix.shape == (40, 4)
+        assert matrix.parameter_names == ['Gain', 'Mode', 'Offset', 'Option']
+        assert matrix.serials == [f"SN{i:04d}" for i in range(40)]
+        assert matrix.coverage.tolist() == [40, 40, 40, 20]
+        assert matrix.codes.dtype == np.int32
+
+        for row, equipment_id in enumerate(matrix.equipment_ids):
+            expected = {p.parameter_name: p.parameter_value
+                        for p in service.get_parameters_by_equipment(int(equipment_id))}
+            actual = {name: matrix.value(row, col) for col, name in enumerate(matrix.parameter_names)
+                      if matrix.value(row, col) is not None}
+            assert actual == expected, matrix.serials[row]
+
+        chunked = service.get_parameter_matrix(configuration_id=1, chunk_size=3)
+        assert np.array_equal(chunked.codes, matrix.codes) and chunked.value_table == matrix.value_table
+
+        # 필터
+        assert service.get_parameter_matrix(customer_name='Hynix').shape == (20, 4)
+        assert service.get_parameter_matrix(configuration_id=2).parameter_names == ['Other']
+        named = service.get_parameter_matrix(configuration_id=1, parameter_names=['Mode', 'Missing'])
+        assert named.parameter_names == ['Mode'] and named.column_values(0).count('AUTO') == 39
+        empty = service.get_parameter_matrix(configuration_id=99)
+        assert empty.shape == (0, 0) and not empty.drift_mask().any() and not empty.outlier_mask().any()
+
+        # 임시 테이블 정리
+        with db_schema.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_temp_master").fetchone()[0] == 0
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_drift_and_outliers():
+    """fleet 값 / drift / outlier"""
+    print("\n=== 테스트 2: drift / outlier ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        _populate(db_schema, service)
+
+        matrix = service.get_parameter_matrix(configuration_id=1)
+        gain, mode, offset, option = (matrix.column_index(n) for n in ('Gain', 'Mode', 'Offset', 'Option'))
+
+        assert matrix.fleet_value(mode) == 'AUTO' and matrix.fleet_value(option) == 'ON'
+        assert np.isnan(matrix.numeric[:, mode]).all() and matrix.numeric[11, gain] == 9.5
+
+        drift = matrix.drift_mask()
+        assert np.nonzero(drift[:, mode])[0].tolist() == [7]
+        assert not drift[:, offset].any(), "다수가 공유하는 값이 없으면 drift 아님"
+        assert not drift[:, option].any(), "값 없음은 drift 아님"
+
+        outlier = matrix.outlier_mask()
+        assert np.nonzero(outlier[:, gain])[0].tolist() == [11]
+        assert not outlier[:, offset].any() and not outlier[:, mode].any()
+
+        assert matrix.deviating_columns().tolist() == sorted([gain, mode])
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_export():
+    """CSV / DataFrame 내보내기"""
+    print("\n=== 테스트 3: 내보내기 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        _populate(db_schema, service)
+        matrix = service.get_parameter_matrix(configuration_id=1)
+
+        path = os.path.join(tmp, 'matrix.csv')
+        assert matrix.export_csv(path) == 40
+        with open(path, encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ['Serial', 'Gain', 'Mode', 'Offset', 'Option']
+        assert rows[1][0] == '[Fleet Value]' and rows[1][2] == 'AUTO'
+        assert rows[3] == ['[Drift]', '0', '1', '0', '0'] and rows[4] == ['[Outlier]', '1', '0', '0', '0']
+        assert rows[5] == ['SN0000', '1.00', 'AUTO', '0', 'ON'] and rows[6][4] == ''
+        assert len(rows) == 45
+
+        matrix.export_csv(path, columns=[matrix.column_index('Mode')], include_summary=False)
+        with open(path, encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ['Serial', 'Mode'] and rows[8] == ['SN0007', 'MANUAL'] and len(rows) == 41
+
+        try:
+            import pandas
+        except ImportError:
+            print("  (pandas 없음 - DataFrame 확인 생략)")
+        else:
+            frame = matrix.to_dataframe()
+            assert frame.shape == (40, 4) and frame.loc['SN0007', 'Mode'] == 'MANUAL'
+            assert pandas.isna(frame.loc['SN0001', 'Option'])
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("출고 장비 파라미터 매트릭스 테스트 시작\n")
+    print("=" * 60)
+
+    test_matrix_values()
+    test_drift_and_outliers()
+    test_export()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
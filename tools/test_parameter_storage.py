@@ -0,0 +1,279 @@
+"""
+출고 파라미터 정규화 저장소 테스트
+
+app.services.shipped_equipment.parameter_storage 테스트
+- 전환(normalize) 전후 서비스 조회 결과 동일, ID 유지, 키 중복 제거
+- 정규화 저장소에 파라미터 추가 (집합 단위, 중복 시 전체 취소)
+- 호환 VIEW 쓰기 (INSTEAD OF 트리거), 파라미터 이름 색인 동기화
+- 복원(denormalize) / 마이그레이션 스크립트 (dry run, 백업, 롤백)
+- 장비별 파라미터 이름 중복 거부, 이전 버전 VIEW 트리거 갱신
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+
+# src / tools 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from db_schema import DBSchema
+from app.services.common.search_index import fts5_available
+from app.services.shipped_equipment.parameter_storage import (
+    KEYS_TABLE, VALUES_TABLE, is_normalized, normalize, denormalize
+)
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+def _parameters(equipment_id, count=300):
+    return [
+        {
+            'parameter_name': f"PM{i % 4}.Part{i % 3}.Item{i}",
+            'parameter_value': str(i * equipment_id),
+            'module': f"PM{i % 4}" if i % 7 else None,
+            'part': f"Part{i % 3}",
+            'data_type': 'int' if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def _populate(db_path):
+    db_schema = DBSchema(db_path)
+    service = ShippedEquipmentService(db_schema)
+    with db_schema.get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, customer_name) "
+            "VALUES (1, 1, ?, 'Samsung')", [(f"SN{i:03d}",) for i in range(3)])
+        conn.commit()
+    for equipment_id in (1, 2, 3):
+        service.add_parameters_bulk(equipment_id, _parameters(equipment_id))
+    return db_schema, service
+
+
+def _snapshot(service):
+    """서비스 조회 결과 (저장 방식 비교용)"""
+    by_equipment = [
+        [(p.id, p.shipped_equipment_id, p.parameter_name, p.parameter_value, p.module, p.part, p.data_type)
+         for p in service.get_parameters_by_equipment(equipment_id)]
+        for equipment_id in (1, 2, 3)
+    ]
+    history = service.get_parameter_history("PM1.Part2.Item5")
+    page = [p.parameter_name for p in service.get_parameters_page(2, after_name="PM2", limit=50, search_text="item1")]
+    return by_equipment, (history.value_count, history.avg_value), page, service.count_parameters(3, "part1")
+
+
+def test_normalize():
+    """전환 전후 조회 결과 동일 + 정규화 저장소 추가"""
+    print("\n=== 테스트 1: 정규화 전환 / 추가 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'test.sqlite')
+        db_schema, service = _populate(db_path)
+        before = _snapshot(service)
+
+        with db_schema.get_connection() as conn:
+            result = normalize(conn)
+            assert is_normalized(conn)
+            keys = conn.execute(f"SELECT COUNT(*) FROM {KEYS_TABLE}").fetchone()[0]
+            assert result == {'keys': 300, 'values': 900} and keys == 300, result
+
+        # 스키마 재생성(앱 시작)은 호환 VIEW를 건드리지 않음
+        db_schema = DBSchema(db_path)
+        service = ShippedEquipmentService(db_schema)
+        assert _snapshot(service) == before, "ID / 값 / 모듈 / 파트 / 타입 유지"
+
+        # 새 장비: 기존 키 재사용, 새 키만 추가
+        with db_schema.get_connection() as conn:
+            conn.execute("INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, "
+                         "customer_name) VALUES (1, 1, 'SN100', 'Hynix')")
+            conn.commit()
+        parameters = _parameters(4, count=310)
+        assert service.add_parameters_bulk(4, parameters) == 310
+        with db_schema.get_connection() as conn:
+            assert conn.execute(f"SELECT COUNT(*) FROM {KEYS_TABLE}").fetchone()[0] == 310
+        stored = service.get_parameters_by_equipment(4)
+        assert sorted((p.parameter_name, p.parameter_value, p.module, p.data_type) for p in stored) == sorted(
+            (p['parameter_name'], p['parameter_value'], p['module'], p['data_type']) for p in parameters)
+
+        # 중복 키 → 전체 취소 (새 키도 남지 않음)
+        try:
+            service.add_parameters_bulk(4, [{'parameter_name': 'New.Item', 'parameter_value': '1'},
+                                            parameters[0]])
+            assert False, "중복 키는 IntegrityError"
+        except sqlite3.IntegrityError:
+            pass
+        with db_schema.get_connection() as conn:
+            assert conn.execute(f"SELECT COUNT(*) FROM {KEYS_TABLE}").fetchone()[0] == 310
+        assert len(service.get_parameters_by_equipment(4)) == 310
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_view_writes_and_search():
+    """호환 VIEW 쓰기 + 파라미터 이름 색인"""
+    print("\n=== 테스트 2: 호환 VIEW 쓰기 / 이름 색인 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema, service = _populate(os.path.join(tmp, 'test.sqlite'))
+        if fts5_available():
+            assert dict(service.search_parameter_names("item5", limit=500))["PM1.Part2.Item5"] == 3
+
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+
+        with db_schema.get_connection() as conn:
+            conn.execute("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                         "parameter_value, module) VALUES (1, 'Vacuum.Gauge', '3', 'PM9')")
+            conn.execute("UPDATE Shipped_Equipment_Parameters SET parameter_value = 'changed' "
+                         "WHERE shipped_equipment_id = 2 AND parameter_name = 'PM1.Part2.Item5'")
+            conn.execute("DELETE FROM Shipped_Equipment_Parameters WHERE shipped_equipment_id = 3")
+            conn.commit()
+            assert conn.execute(f"SELECT COUNT(*) FROM {VALUES_TABLE}").fetchone()[0] == 601
+
+        params = {p.parameter_name: p for p in service.get_parameters_by_equipment(1)}
+        assert params['Vacuum.Gauge'].parameter_value == '3' and params['Vacuum.Gauge'].module == 'PM9'
+        assert {p.parameter_name: p.parameter_value
+                for p in service.get_parameters_by_equipment(2)}['PM1.Part2.Item5'] == 'changed'
+        assert service.get_parameters_by_equipment(3) == []
+
+        if fts5_available():
+            counts = dict(service.search_parameter_names("item5", limit=500))
+            assert counts["PM1.Part2.Item5"] == 2, counts
+            assert service.search_parameter_names("vacuum") == [('Vacuum.Gauge', 1)]
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_denormalize_and_migration_script():
+    """복원 + 마이그레이션 스크립트"""
+    print("\n=== 테스트 3: 복원 / 마이그레이션 스크립트 ===")
+
+    from migrate_parameter_keys import ParameterKeysMigration
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'test.sqlite')
+        db_schema, service = _populate(db_path)
+        before = _snapshot(service)
+        migration = ParameterKeysMigration(db_path=db_path)
+
+        assert migration.run(dry_run=True)
+        with db_schema.get_connection() as conn:
+            assert not is_normalized(conn), "dry run은 변경 없음"
+
+        assert migration.run(vacuum=True)
+        assert os.path.exists(migration.backup_path)
+        with db_schema.get_connection() as conn:
+            assert is_normalized(conn)
+        assert _snapshot(service) == before
+
+        assert migration.rollback()
+        with db_schema.get_connection() as conn:
+            assert not is_normalized(conn)
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+            assert KEYS_TABLE not in tables and VALUES_TABLE not in tables
+            assert {'idx_shipped_params_equipment', 'idx_shipped_params_name'} <= tables
+        assert _snapshot(service) == before
+
+        # 복원 후 기존 방식으로 추가
+        assert service.add_parameters_bulk(1, [{'parameter_name': 'After.Rollback', 'parameter_value': '1'}]) == 1
+
+        with db_schema.get_connection() as conn:
+            try:
+                denormalize(conn)
+                assert False, "기존 테이블에서 복원은 ValueError"
+            except ValueError:
+                pass
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_duplicate_names():
+    """같은 장비에 같은 이름 거부 (모듈 / 파트 / 타입만 달라도) + 이전 버전 트리거 갱신"""
+    print("\n=== 테스트 4: 이름 중복 거부 ===")
+
+    def rejected(write):
+        try:
+            write()
+            return False
+        except sqlite3.IntegrityError:
+            return True
+
+    insert = ("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+              "parameter_value, data_type) VALUES (?, ?, '1', ?)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'test.sqlite')
+        db_schema, service = _populate(db_path)
+        with db_schema.get_connection() as conn:
+            normalize(conn)
+            # 이름 검사가 없던 이전 버전의 INSERT 트리거
+            conn.execute("DROP TRIGGER shipped_parameters_view_insert")
+            conn.execute(f"""
+                CREATE TRIGGER shipped_parameters_view_insert
+                INSTEAD OF INSERT ON Shipped_Equipment_Parameters BEGIN
+                    INSERT OR IGNORE INTO {KEYS_TABLE} (parameter_name, module, part, data_type)
+                    VALUES (new.parameter_name, new.module, new.part, new.data_type);
+                    INSERT INTO {VALUES_TABLE} (shipped_equipment_id, key_id, parameter_value)
+                    SELECT new.shipped_equipment_id, k.id, new.parameter_value FROM {KEYS_TABLE} k
+                    WHERE k.parameter_name = new.parameter_name AND IFNULL(k.data_type, '') = new.data_type;
+                END
+            """)
+            conn.commit()
+
+        # 스키마 생성(앱 시작)에서 트리거 갱신
+        db_schema = DBSchema(db_path)
+        service = ShippedEquipmentService(db_schema)
+
+        name = _parameters(1)[1]['parameter_name']  # data_type 'int'
+        with db_schema.get_connection() as conn:
+            assert rejected(lambda: conn.execute(insert, (1, name, 'str')))
+            assert rejected(lambda: conn.execute(insert, (1, name, 'int')))
+            conn.execute(insert, (1, 'Vacuum.Gauge', 'str'))
+            assert rejected(lambda: conn.execute(
+                "UPDATE Shipped_Equipment_Parameters SET parameter_name = ? "
+                "WHERE shipped_equipment_id = 1 AND parameter_name = 'Vacuum.Gauge'", (name,)))
+            conn.execute("UPDATE Shipped_Equipment_Parameters SET data_type = 'int' "
+                         "WHERE shipped_equipment_id = 1 AND parameter_name = 'Vacuum.Gauge'")
+            conn.commit()
+
+        # 집합 추가: 목록 안 중복 / 이미 있는 이름 (다른 타입) → 전체 취소
+        for parameters in ([{'parameter_name': 'New.Item', 'parameter_value': '1', 'data_type': 'int'},
+                            {'parameter_name': 'New.Item', 'parameter_value': '1', 'data_type': 'str'}],
+                           [{'parameter_name': name, 'parameter_value': '1', 'data_type': 'str'}]):
+            assert rejected(lambda: service.add_parameters_bulk(1, parameters))
+        assert service.add_parameters_bulk(2, [{'parameter_name': 'Vacuum.Gauge', 'parameter_value': '2'}]) == 1
+
+        names = [p.parameter_name for p in service.get_parameters_by_equipment(1)]
+        assert len(names) == len(set(names)) == 301
+        # 이름이 유일하므로 이름 기준 페이지가 행을 빠뜨리거나 반복하지 않음
+        pages, after = [], None
+        while True:
+            page = service.get_parameters_page(1, after_name=after, limit=70)
+            if not page:
+                break
+            pages.extend(p.parameter_name for p in page)
+            after = page[-1].parameter_name
+        assert pages == sorted(names)
+
+    print("[OK] 테스트 4 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("출고 파라미터 정규화 저장소 테스트 시작\n")
+    print("=" * 60)
+
+    test_normalize()
+    test_view_writes_and_search()
+    test_denormalize_and_migration_script()
+    test_duplicate_names()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (4/4)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+QC Kernel 테스트
+
+공통 QC 커널(app.qc.qc_kernel) 기능 테스트
+- 규칙 종류별 평가 (범위 / 허용 값 / 기대값 / Boolean / 패턴 / 존재)
+- key 기반 매칭 및 행 정렬 평가
+- 기존 진입점(validate_item, QCValidator, QCSpecService)과의 결과 일치
+"""
+
+import sys
+import os
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+
+from app.qc.qc_kernel import (
+    QCRule, compile_rules, evaluate, evaluate_aligned, evaluate_bounds, rule_passes, rules_from_spec_columns,
+    KIND_RANGE, KIND_ENUM, KIND_EXACT, KIND_BOOLEAN, KIND_PATTERN, KIND_EXISTS,
+    STATUS_PASS, STATUS_NO_RULE, STATUS_BELOW_MIN, STATUS_ABOVE_MAX,
+    STATUS_NOT_NUMERIC, STATUS_MISMATCH, STATUS_EMPTY, STATUS_PATTERN_MISMATCH
+)
+from app.qc.qc_inspection_v2 import ChecklistItem, validate_item
+
+
+def test_rule_kinds():
+    """규칙 종류별 평가"""
+    print("\n=== 테스트 1: 규칙 종류별 평가 ===")
+
+    rule_list = [
+        QCRule(key='Gain', kind=KIND_RANGE, min_value=0.5, max_value=2.0),
+        QCRule(key='SelfTest', kind=KIND_ENUM, allowed=['Pass', 'Fail']),
+        QCRule(key='Comm', kind=KIND_EXACT, expected='ok'),
+        QCRule(key='Heater', kind=KIND_BOOLEAN, expected='ON'),
+        QCRule(key='Version', kind=KIND_PATTERN, expected=r'^v\d+'),
+        QCRule(key='Serial', kind=KIND_EXISTS),
+    ]
+    rules = compile_rules(rule_list)
+
+    keys = ['Gain', 'Gain', 'Gain', 'Gain', 'SelfTest', 'SelfTest', 'Comm',
+            'Heater', 'Heater', 'Version', 'Serial', 'Unknown']
+    values = ['1.0', '0.1', '5', 'abc', 'Pass', 'pass', 'OK',
+              'enabled', 'off', 'x1', '  ', 'anything']
+
+    result = evaluate(keys, values, rules)
+
+    expected_status = [
+        STATUS_PASS, STATUS_BELOW_MIN, STATUS_ABOVE_MAX, STATUS_NOT_NUMERIC,
+        STATUS_PASS, STATUS_MISMATCH, STATUS_PASS,
+        STATUS_PASS, STATUS_MISMATCH, STATUS_PATTERN_MISMATCH, STATUS_EMPTY,
+        STATUS_NO_RULE
+    ]
+    assert result.status.tolist() == expected_status, result.status.tolist()
+    assert result.matched_count == 11
+    assert result.failed_count == 7
+    assert bool(result.is_valid[-1]), "규칙 없는 항목은 Pass로 취급"
+
+    # 단일 규칙 직접 평가(rule_passes)도 같은 판정
+    by_key = {rule.key: rule for rule in rule_list}
+    for key, value, is_valid in zip(keys[:-1], values, result.is_valid):
+        assert rule_passes(by_key[key], value) == bool(is_valid), (key, value)
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_spec_columns():
+    """Default DB 컬럼(min_spec/max_spec) 규칙"""
+    print("\n=== 테스트 2: Default DB 스펙 컬럼 ===")
+
+    df = pd.DataFrame({
+        'parameter_name': ['A', 'B', 'C', 'D', 'E'],
+        'default_value': ['1,500', '5', 'text', '3', '7'],
+        'min_spec': ['1,000', '10', '0', None, 'abc'],
+        'max_spec': ['2,000', None, '1', '2', '9'],
+    })
+
+    rules = rules_from_spec_columns(df['parameter_name'], df['min_spec'], df['max_spec'])
+    result = evaluate_aligned(df['default_value'].tolist(), rules, strip_commas=True)
+
+    assert result.status[0] == STATUS_PASS, "쉼표 포함 숫자 허용"
+    assert result.status[1] == STATUS_BELOW_MIN
+    assert result.status[2] == STATUS_NOT_NUMERIC
+    assert result.status[3] == STATUS_ABOVE_MAX
+    assert result.status[4] == STATUS_PASS, "숫자가 아닌 경계는 검사 생략"
+
+    # 경계별 평가: min > max이면 두 경계 모두 위반
+    inverted = rules_from_spec_columns(['X', 'Y'], ['10', '0'], ['1', '5'])
+    below_min, above_max = evaluate_bounds(['5', 'text'], inverted)
+    assert below_min.tolist() == [True, False] and above_max.tolist() == [True, False]
+    assert evaluate_aligned(['5', 'text'], inverted).status.tolist() == [STATUS_BELOW_MIN, STATUS_NOT_NUMERIC]
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_validate_item_compat():
+    """qc_inspection_v2.validate_item 결과 유지"""
+    print("\n=== 테스트 3: validate_item 호환성 ===")
+
+    def item(spec_min=None, spec_max=None, expected=None):
+        return ChecklistItem(1, 'X', spec_min, spec_max, expected, None, None, True)
+
+    assert validate_item(item('0.5', '2.0'), '1.5') is True
+    assert validate_item(item('0.5', '2.0'), 'abc') is False
+    assert validate_item(item('0.5', '2.0'), 3) is False
+    assert validate_item(item(expected='["Pass", "Fail"]'), 'Pass') is True
+    assert validate_item(item(expected='["Pass", "Fail"]'), 'PASS') is False
+    assert validate_item(item(expected='OK'), 'ok') is True
+    assert validate_item(item(), None) is True
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_service_validators():
+    """services.QCValidator / QCSpecService가 커널 결과를 사용"""
+    print("\n=== 테스트 4: 서비스 검증기 ===")
+
+    from app.services.qc_validator import QCValidator
+    from app.services.qc_spec_service import QCSpecService
+
+    class _SpecStub:
+        def get_master_specs(self):
+            return {
+                'Temp': {'check_type': 'range', 'min_spec': '20', 'max_spec': '25', 'category': 'Safety'},
+                'Mode': {'check_type': 'exact', 'expected_value': 'AUTO'},
+                'Fan': {'check_type': 'boolean', 'expected_value': 'OFF'},
+            }
+
+        def get_overrides(self, *args):
+            return {}
+
+    validator = QCValidator(None, _SpecStub())
+    result = validator.validate_parameters({'Temp': '30', 'Mode': 'auto', 'Fan': 'disabled', 'Extra': '1'})
+
+    assert result['summary']['passed'] == 2
+    assert result['summary']['failed'] == 1
+    assert result['summary']['skipped'] == 1
+    assert result['summary']['status'] == 'CRITICAL_FAIL'
+    assert '최대값' in result['failed'][0]['message']
+
+    specs = {
+        'Temp': {'id': 1, 'item_name': 'Temp', 'min_spec': '20', 'max_spec': '25',
+                 'expected_value': None, 'check_type': 'range', 'severity': 'CRITICAL'},
+        'Power': {'id': 2, 'item_name': 'Power', 'min_spec': None, 'max_spec': None,
+                  'expected_value': '1', 'check_type': 'boolean', 'severity': 'LOW'},
+    }
+
+    class _DBStub:
+        def execute_query(self, query, params=None):
+            return []
+
+    service = QCSpecService(_DBStub())
+    service.spec_cache.update(specs)
+
+    inspection = service.perform_qc_inspection({'Temp': '22', 'Power': 'ON', 'Other': 'x'})
+    assert inspection['matched'] == 2
+    assert inspection['passed'] == 2
+    assert inspection['overall_pass'] is True
+
+    inspection = service.perform_qc_inspection({'Temp': 'hot', 'Power': 'ON'})
+    assert inspection['failed'] == 1
+    assert inspection['overall_pass'] is False
+    assert inspection['results'][0]['message'] == "Cannot convert 'hot' to number"
+
+    print("[OK] 테스트 4 통과")
+
+
+def test_default_db_checks_compat():
+    """Default DB 스펙 검사(SimplifiedQCSystem / UnifiedQCSystem / qc_legacy) 기존 동작 유지"""
+    print("\n=== 테스트 5: Default DB 스펙 검사 호환성 ===")
+
+    from app.simplified_qc_system import SimplifiedQCSystem
+    from app.unified_qc_system import UnifiedQCSystem
+    from app.qc_legacy import QCValidator as LegacyQCValidator
+
+    df = pd.DataFrame({
+        'parameter_name': ['Inverted', 'Comma', 'Text', 'CommaBound'],
+        'default_value': ['5', '1,500', 'text', '3'],
+        'min_spec': ['10', '1,000', '0', '1,000'],
+        'max_spec': ['1', '1,200', '1', '2'],
+    })
+
+    # min > max이면 최소 / 최대 스펙 이슈를 모두 보고, 쉼표 포함 숫자 허용
+    for system in (SimplifiedQCSystem(None), UnifiedQCSystem(None)):
+        issues = system._check_spec_compliance(df)
+        assert [len(row) for row in issues] == [2, 1, 0, 2], issues
+        assert '최소 스펙' in issues[0][0]['description'] and '최대 스펙' in issues[0][1]['description']
+        assert '최대 스펙 1200.0' in issues[1][0]['description']
+
+    # qc_legacy는 float() 그대로 변환 - 쉼표가 있는 기본값 / 경계는 숫자가 아니므로 검사 생략
+    results = LegacyQCValidator.check_data_consistency(df, None)
+    assert [(r['parameter'], r['issue_type']) for r in results] == [('Inverted', '사양 오류')], results
+
+    print("[OK] 테스트 5 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("QC Kernel 테스트 시작\n")
+    print("=" * 60)
+
+    test_rule_kinds()
+    test_spec_columns()
+    test_validate_item_compat()
+    test_service_validators()
+    test_default_db_checks_compat()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (5/5)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+통계 리포트 테스트
+
+app.report.numeric_statistics / 리포트 통계 공용 결과 테스트
+- 값 행렬 한 번 계산 = 파라미터별 float 변환 루프 결과 (전체 수치형 파라미터)
+- 편차 절대값 순 정렬 / 다른 컬럼 정렬
+- 화면 / 내보내기가 같은 통계를 재사용 (merged_df가 바뀌면 다시 계산)
+"""
+
+import sys
+import os
+import time
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from app.report import (add_report_functions_to_class, numeric_statistics, sort_statistics,
+                        STATISTICS_COLUMNS)
+
+
+def _merged_frame(n, files=3, seed=11):
+    """file_handler 형식 merged_df (숫자 / 문자 / 누락 값 섞음)"""
+    rng = np.random.default_rng(seed)
+    data = {'parameter': [f"Param_{i:05d}" for i in range(n)]}
+    default = rng.normal(50, 20, n).round(3).astype(object)
+    default[::17] = None
+    default[::23] = 'text'
+    default[::29] = 0
+    data['default_value'] = default
+    for f in range(files):
+        values = (rng.normal(50, 20, n).round(3)).astype(object)
+        values[f::7] = None
+        values[f::31] = 'N/A'
+        data[f"file_{f}"] = values
+    return pd.DataFrame(data)
+
+
+def _loop_statistics(merged_df, file_count):
+    """이전 구현과 같은 행 단위 계산 {파라미터: (default, mean, min, max, std, deviation)}"""
+    result = {}
+    for _, row in merged_df.iterrows():
+        try:
+            default_value = float(row['default_value'])
+        except (ValueError, TypeError):
+            continue
+        if np.isnan(default_value):
+            continue
+        file_values = []
+        for file_idx in range(file_count):
+            try:
+                value = float(row[f"file_{file_idx}"])
+            except (ValueError, TypeError):
+                continue
+            if not np.isnan(value):
+                file_values.append(value)
+        if not file_values:
+            continue
+        mean_value = np.mean(file_values)
+        deviation = ((mean_value - default_value) / default_value) * 100 if default_value != 0 else 0
+        result[row['parameter']] = (default_value, mean_value, np.min(file_values), np.max(file_values),
+                                    np.std(file_values), deviation)
+    return result
+
+
+def test_matches_row_loop():
+    """값 행렬 계산 = 행 단위 계산"""
+    print("\n=== 테스트 1: 행 단위 계산과 일치 ===")
+
+    merged_df = _merged_frame(3000)
+    expected = _loop_statistics(merged_df, 3)
+    stats = numeric_statistics(merged_df, ['a', 'b', 'c'], sort_by_deviation=False)
+
+    assert list(stats['parameter']) == list(expected)
+    actual = np.column_stack([stats[key] for key in ('default', 'mean', 'min', 'max', 'std', 'deviation')])
+    assert np.allclose(actual, np.array(list(expected.values())))
+
+    # 큰 표에서도 한 번 계산
+    big = _merged_frame(100000, files=5)
+    start = time.perf_counter()
+    big_stats = numeric_statistics(big, ['f'] * 5)
+    elapsed = time.perf_counter() - start
+    print(f"  100,000행 x 5파일: {len(big_stats['parameter'])}개 파라미터, {elapsed:.3f}s")
+    assert len(big_stats['parameter']) > 80000
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_sorting():
+    """편차 절대값 순 / 다른 컬럼 정렬"""
+    print("\n=== 테스트 2: 정렬 ===")
+
+    merged_df = pd.DataFrame({
+        'parameter': ['a', 'b', 'c', 'd'],
+        'default_value': ['10', '10', '10', '10'],
+        'file_0': ['11', '5', '13', '15'],
+    })
+    stats = numeric_statistics(merged_df, ['x'])
+    assert list(stats['parameter']) == ['b', 'd', 'c', 'a']
+    assert np.allclose(stats['deviation'], [-50, 50, 30, 10])
+
+    by_mean = sort_statistics(stats, 'mean', descending=False)
+    assert list(by_mean['parameter']) == ['b', 'a', 'c', 'd']
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_shared_report_statistics():
+    """화면 / 내보내기 공용 통계"""
+    print("\n=== 테스트 3: 리포트 공용 통계 ===")
+
+    class _Manager:
+        """리포트 상태만 가진 DBManager 대용"""
+
+    add_report_functions_to_class(_Manager)
+    manager = _Manager()
+    manager.merged_df = _merged_frame(500)
+    manager.file_names = ['a', 'b', 'c']
+
+    stats = manager._report_statistics()
+    assert manager._report_statistics() is stats
+
+    table = manager.create_statistics_report_data()
+    assert list(table) == [label for _, label in STATISTICS_COLUMNS]
+    assert list(table["파라미터"]) == list(stats['parameter'])
+    deviations = np.abs(table["Default 대비 편차(%)"])
+    assert np.all(deviations[:-1] >= deviations[1:])
+
+    # 데이터를 다시 불러오면 다시 계산
+    manager.merged_df = _merged_frame(500, seed=12)
+    assert manager._report_statistics() is not stats
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("통계 리포트 테스트 시작\n")
+    print("=" * 60)
+
+    test_matches_row_loop()
+    test_sorting()
+    test_shared_report_statistics()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+FTS5 검색 색인 테스트
+
+app.services.common.search_index 테스트
+- 검색어 → MATCH 식 (단어 접두어, 컬럼 한정)
+- 색인 생성 시 기존 데이터 채움, 트리거로 추가 / 수정 / 삭제 동기화
+- Configuration / Default DB Value 검색 (관련도 순), 출고 장비 고객명 필터
+- 출고 파라미터 이름 검색 (고유 이름 색인, 사용 횟수)
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.services.common.cache_service import CacheService
+from app.services.common.search_index import SearchIndex, match_expression, fts5_available
+from app.services.configuration.configuration_service import ConfigurationService
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _Row(sqlite3.Row):
+    """인덱스 / 컬럼명 / get() 접근을 모두 지원하는 행"""
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys() else default
+
+
+class _SearchSchema:
+    """검색 대상 테이블만 가진 테스트용 스키마"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Equipment_Models (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_name TEXT, display_order INTEGER);
+                CREATE TABLE Equipment_Types (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_id INTEGER, type_name TEXT);
+                CREATE TABLE Equipment_Configurations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER, configuration_name TEXT,
+                    port_count INTEGER, wafer_count INTEGER, custom_options TEXT,
+                    is_customer_specific INTEGER DEFAULT 0, customer_name TEXT, description TEXT,
+                    created_at TIMESTAMP, updated_at TIMESTAMP);
+                CREATE TABLE Default_DB_Values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER,
+                    parameter_name TEXT, default_value TEXT, is_type_common INTEGER DEFAULT 0,
+                    notes TEXT, created_at TIMESTAMP, updated_at TIMESTAMP);
+                CREATE TABLE Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+                    configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+                    ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+                    notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER,
+                    parameter_name TEXT, parameter_value TEXT, module TEXT, part TEXT, data_type TEXT);
+            """)
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = _Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def test_match_expression():
+    """검색어 → MATCH 식"""
+    print("\n=== 테스트 1: MATCH 식 ===")
+
+    assert match_expression("temp set") == '"temp"* "set"*'
+    assert match_expression("Temp_Setpoint") == '"Temp"* "Setpoint"*', "밑줄은 단어 구분"
+    assert match_expression('a"b OR c') == '"a"* "b"* "OR"* "c"*', "FTS 구문 / 따옴표 무력화"
+    assert match_expression("삼성 전자") == '"삼성"* "전자"*'
+    assert match_expression("Samsung", columns=['customer_name']) == '{customer_name} : ("Samsung"*)'
+    assert match_expression("  -- ") is None and match_expression(None) is None
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_configuration_search():
+    """Configuration / Default DB Value 검색 + 트리거 동기화"""
+    print("\n=== 테스트 2: Configuration / Default DB Value 검색 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _SearchSchema(os.path.join(tmp, 'test.sqlite'))
+        with db_schema.get_connection() as conn:
+            conn.execute("INSERT INTO Equipment_Models (model_name, display_order) VALUES ('SX-100', 1)")
+            conn.execute("INSERT INTO Equipment_Types (model_id, type_name) VALUES (1, '분리형')")
+            conn.executemany(
+                "INSERT INTO Equipment_Configurations (type_id, configuration_name, port_count, wafer_count, "
+                "customer_name, description) VALUES (1, ?, 2, 25, ?, ?)",
+                [('Standard 2P', None, 'default layout'),
+                 ('Samsung Custom', 'Samsung Electronics', 'customer specific layout'),
+                 ('Hynix Custom', 'SK Hynix', None)])
+            conn.executemany(
+                "INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value, notes) "
+                "VALUES (?, ?, ?, ?)",
+                [(1, 'Temp_Setpoint', '25.0', None),
+                 (1, 'Temp_Setpoint_Max', '30.0', 'temperature limit'),
+                 (1, 'Pressure_Max', '100', None),
+                 (2, 'Gas_Flow', '5', 'setpoint for gas')])
+            conn.commit()
+
+        service = ConfigurationService(db_schema, CacheService())
+
+        names = [c.configuration_name for c in service.search_configurations("sams")]
+        assert names == ['Samsung Custom'], names
+        assert {c.configuration_name for c in service.search_configurations("custom")} == {'Samsung Custom', 'Hynix Custom'}
+        assert [c.configuration_name for c in service.search_configurations("layout default")] == ['Standard 2P']
+
+        values = [v.parameter_name for v in service.search_default_values("temp set")]
+        assert set(values) == {'Temp_Setpoint', 'Temp_Setpoint_Max'}
+        assert [v.parameter_name for v in service.search_default_values("setpoint")][-1] == 'Gas_Flow', "관련도 순"
+        assert service.search_default_values("temp", limit=1)[0].parameter_name.startswith('Temp')
+
+        # 트리거 동기화 (추가 / 수정 / 삭제)
+        with db_schema.get_connection() as conn:
+            conn.execute("INSERT INTO Default_DB_Values (configuration_id, parameter_name, default_value) "
+                         "VALUES (3, 'Vacuum_Level', '0.1')")
+            conn.execute("UPDATE Default_DB_Values SET parameter_name = 'Press_Limit' WHERE parameter_name = 'Pressure_Max'")
+            conn.execute("DELETE FROM Default_DB_Values WHERE parameter_name = 'Gas_Flow'")
+            conn.commit()
+
+        assert [v.parameter_name for v in service.search_default_values("vacuum")] == ['Vacuum_Level']
+        assert service.search_default_values("pressure") == []
+        assert [v.parameter_name for v in service.search_default_values("press")] == ['Press_Limit']
+        assert [v.parameter_name for v in service.search_default_values("gas")] == []
+
+        # 검색어에 단어가 없으면 LIKE
+        assert len(service.search_default_values("_")) == 4
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_shipped_search():
+    """출고 장비 고객명 필터 / 파라미터 이름 검색"""
+    print("\n=== 테스트 3: 출고 장비 검색 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _SearchSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+
+        with db_schema.get_connection() as conn:
+            for i, customer in enumerate(['Samsung Electronics', 'SK Hynix', 'Samsung Display']):
+                conn.execute("INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, "
+                             "customer_name) VALUES (1, 1, ?, ?)", (f"SN{i:03d}", customer))
+            conn.commit()
+
+        # 색인 생성 전 데이터도 검색됨 (생성 시 채움)
+        customers = sorted(e.customer_name for e in service.get_all_shipped_equipment(customer_name="samsung"))
+        assert customers == ['Samsung Display', 'Samsung Electronics']
+        assert [e.serial_number for e in service.get_all_shipped_equipment(customer_name="hyn")] == ['SN001']
+
+        # 파라미터: 이름 200종 x 장비 50대 = 10,000행
+        names = [f"Module{i % 10}_Temp_Setpoint_{i}" if i % 2 else f"Pressure_Limit_{i}" for i in range(200)]
+        for equipment_id in range(1, 4):
+            service.add_parameters_bulk(equipment_id, [
+                {'parameter_name': name, 'parameter_value': str(j)} for j, name in enumerate(names)])
+        with db_schema.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, parameter_value) "
+                "VALUES (?, ?, ?)",
+                [(100 + k, name, '1') for k in range(47) for name in names])
+            conn.commit()
+
+        start = time.perf_counter()
+        result = service.search_parameter_names("temp set", limit=500)
+        elapsed = time.perf_counter() - start
+        assert len(result) == 100 and all(count == 50 for _, count in result)
+        assert elapsed < 0.5, f"검색 {elapsed * 1000:.1f} ms"
+        assert [n for n, _ in service.search_parameter_names("module3 temp")][:1] == ['Module3_Temp_Setpoint_3']
+
+        # 사용 횟수 / 이름 목록 동기화
+        with db_schema.get_connection() as conn:
+            conn.execute("DELETE FROM Shipped_Equipment_Parameters WHERE shipped_equipment_id = 1")
+            conn.execute("DELETE FROM Shipped_Equipment_Parameters WHERE parameter_name = 'Pressure_Limit_0'")
+            conn.execute("INSERT INTO Shipped_Equipment_Parameters (shipped_equipment_id, parameter_name, "
+                         "parameter_value) VALUES (1, 'Vacuum_Gauge', '3')")
+            conn.commit()
+        counts = dict(service.search_parameter_names("pressure limit", limit=500))
+        assert 'Pressure_Limit_0' not in counts and counts['Pressure_Limit_2'] == 49
+        assert service.search_parameter_names("vacuum") == [('Vacuum_Gauge', 1)]
+
+        # 원본을 직접 고친 경우 rebuild()로 복구
+        SearchIndex(db_schema).rebuild()
+        assert service.search_parameter_names("vacuum") == [('Vacuum_Gauge', 1)]
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("FTS5 검색 색인 테스트 시작\n")
+    print("=" * 60)
+
+    if not fts5_available():
+        print("[SKIP] 이 SQLite 빌드는 FTS5를 지원하지 않습니다")
+        return
+
+    test_match_expression()
+    test_configuration_search()
+    test_shipped_search()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
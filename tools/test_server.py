@@ -0,0 +1,327 @@
+"""
+로컬 HTTP/JSON 서비스 테스트
+
+app.server (python -m app.cli serve) 테스트
+- 경로: /health, /qc, /qc/spec, /checklist, /compare, /shipped/import, /defaultdb, 오류 응답
+- 동시 실행 제한 (초과 대기 → 503), /metrics 지연 히스토그램, 연결 풀 재사용
+- 공유 규칙 캐시: 미리 컴파일한 규칙 결과 = 검수마다 컴파일한 결과, /reload 갱신
+- tkinter를 import하지 않음
+"""
+
+import sys
+import os
+import json
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# src 디렉토리를 Python 경로에 추가
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from app.schema import DBSchema
+from app.server import QCServer, QCServiceApp, LatencyHistogram
+from app.services.qc_spec_service import QCSpecService
+
+HEADER = "Module\tPart\tItemName\tItemType\tItemValue\tItemDescription\n"
+
+
+def _write_dump(path, values):
+    """{ItemName: 값} → 표준 텍스트 DB 파일"""
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(HEADER)
+        for i, (name, value) in enumerate(values.items()):
+            handle.write(f"PM{i % 2}\tHeater\t{name}\tdouble\t{value}\t{name} 설명\n")
+    return path
+
+
+def _create_db(db_path):
+    """Phase 1.5 Check list / 예외 / 출고 장비 + QC 스펙 테이블"""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE QC_Checklist_Items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE,
+            spec_min TEXT, spec_max TEXT, expected_value TEXT,
+            category TEXT, description TEXT, is_active BOOLEAN DEFAULT 1);
+        CREATE TABLE Equipment_Checklist_Exceptions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER NOT NULL,
+            checklist_item_id INTEGER NOT NULL, reason TEXT);
+        CREATE TABLE Equipment_Configurations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER NOT NULL, configuration_name TEXT);
+        CREATE TABLE Shipped_Equipment (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+            configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+            ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+            notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE Shipped_Equipment_Parameters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER NOT NULL,
+            parameter_name TEXT NOT NULL, parameter_value TEXT NOT NULL,
+            module TEXT, part TEXT, data_type TEXT,
+            UNIQUE (shipped_equipment_id, parameter_name));
+        CREATE TABLE QC_Spec_Master (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE,
+            min_spec TEXT, max_spec TEXT, expected_value TEXT, check_type TEXT,
+            category TEXT, severity TEXT, is_active BOOLEAN DEFAULT 1, description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE QC_Equipment_Exceptions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER, model_id INTEGER,
+            spec_master_id INTEGER NOT NULL, reason TEXT NOT NULL, approved_by TEXT,
+            UNIQUE(configuration_id, model_id, spec_master_id));
+    """)
+    conn.executemany(
+        "INSERT INTO QC_Checklist_Items (item_name, spec_min, spec_max, expected_value, category) VALUES (?, ?, ?, ?, ?)",
+        [('Temp', '10', '20', None, 'Heater'), ('Mode', None, None, 'AUTO', 'Control')])
+    conn.execute("INSERT INTO Equipment_Checklist_Exceptions (configuration_id, checklist_item_id, reason) "
+                 "VALUES (7, 1, 'test')")
+    conn.execute("INSERT INTO Equipment_Configurations (id, type_id, configuration_name) VALUES (3, 1, 'Std')")
+    conn.commit()
+    conn.close()
+
+
+def _request(base, path, body=None, method=None):
+    """JSON 요청 → (상태 코드, 응답 JSON)"""
+    data = None if body is None else json.dumps(body).encode('utf-8')
+    request = urllib.request.Request(base + path, data=data, method=method or ('POST' if data else 'GET'),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read().decode('utf-8'))
+
+
+class _Running:
+    """테스트용 서버 (별도 스레드 이벤트 루프, 빈 포트)"""
+
+    def __init__(self, db_path, **kwargs):
+        self.app = QCServiceApp(db_path, **kwargs)
+        self.server = QCServer(self.app, port=0)
+
+    def __enter__(self):
+        host, port = self.server.start_background()
+        self.base = f"http://{host}:{port}"
+        return self
+
+    def __exit__(self, *exc):
+        self.server.stop_background()
+        self.app.close()
+
+
+def test_routes():
+    """경로별 서비스 호출"""
+    print("\n=== 테스트 1: 경로 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'server.sqlite')
+        _create_db(db_path)
+        QCSpecService(DBSchema(db_path)).add_spec('Temp', '10', '20', category='Heater', severity='CRITICAL')
+        good = _write_dump(os.path.join(tmp, 'good.txt'), {'Temp': '15', 'Mode': 'auto', 'Other': '1'})
+        bad = _write_dump(os.path.join(tmp, 'bad.txt'), {'Temp': '25', 'Mode': 'AUTO', 'Other': '1'})
+
+        with _Running(db_path) as running:
+            base = running.base
+            status, health = _request(base, '/health')
+            assert status == 200 and health == {'status': 'ok', 'checklist_items': 2, 'qc_specs': 1}
+
+            # qc_inspection_v2: 값 직접 전달 / 서버 로컬 파일 / Configuration 예외
+            status, result = _request(base, '/qc', {'file_data': {'Temp': '25', 'Mode': 'AUTO'}})
+            assert status == 200 and result['is_pass'] is False and result['failed_count'] == 1
+            status, result = _request(base, '/qc', {'path': good})
+            assert status == 200 and result['is_pass'] is True and result['total_count'] == 2
+            status, result = _request(base, '/qc', {'path': bad, 'configuration_id': 7})
+            assert result['is_pass'] is True and result['exception_count'] == 1
+
+            # QCSpecService
+            status, result = _request(base, '/qc/spec', {'file_data': {'Temp': '25', 'Unknown': 'x'}})
+            assert status == 200 and result['matched'] == 1 and result['overall_pass'] is False
+
+            # ChecklistService (공통 / 장비 유형별)
+
+            # 비교: 차이 행만
+            status, result = _request(base, '/compare', {'paths': [good, bad]})
+            assert status == 200 and result['columns'] == ['Module', 'Part', 'ItemName', 'good', 'bad']
+            assert sorted(row[2] for row in result['rows']) == ['Mode', 'Temp']
+            assert result['summary']['total'] == 3
+
+            # 출고 장비 임포트 (쓰기 큐)
+            shipped = _write_dump(os.path.join(tmp, 'S100_Customer_NX-Mask.txt'), {'P1': '1', 'P2': '2'})
+            status, result = _request(base, '/shipped/import', {'path': shipped, 'configuration_id': 3})
+            assert status == 200 and result['success'] is True, result
+            conn = sqlite3.connect(db_path)
+            assert conn.execute("SELECT COUNT(*) FROM Shipped_Equipment_Parameters").fetchone()[0] == 2
+            type_id = conn.execute("INSERT INTO Equipment_Types (type_name) VALUES ('NX-Mask')").lastrowid
+            conn.commit()
+            conn.close()
+
+            # Default DB 조회
+            running.app.db_schema.add_default_value(type_id, 'Param', '5', module_name='PM1',
+                                                    part_name='Heater', item_type='double')
+            status, result = _request(base, '/defaultdb?type=NX-Mask')
+            assert status == 200 and result['equipment_type_id'] == type_id
+            assert [(v['parameter_name'], v['default_value'], v['module_name']) for v in result['values']] == \
+                [('Param', '5', 'PM1')]
+            status, result = _request(base, '/defaultdb/types')
+            assert [t['type_name'] for t in result['types']] == ['NX-Mask']
+
+            # 오류 응답
+            assert _request(base, '/defaultdb?type=Unknown')[0] == 404
+            assert _request(base, '/qc', {'configuration_id': 'x', 'file_data': {}})[0] == 400
+            assert _request(base, '/qc', {'path': os.path.join(tmp, 'none.txt')})[0] == 400
+            assert _request(base, '/compare', {'paths': [good]})[0] == 400
+            assert _request(base, '/nowhere')[0] == 404
+            assert _request(base, '/qc')[0] == 405
+
+    # 기존 Check list 테이블 DB: ChecklistService 경로만, Phase 1.5 QC 경로는 503
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'legacy.sqlite')
+        DBSchema(db_path).add_checklist_item('Heater Temp', 'Temp*', severity_level='HIGH')
+        with _Running(db_path) as running:
+            status, health = _request(running.base, '/health')
+            assert health == {'status': 'ok', 'checklist_items': None, 'qc_specs': None}
+            status, result = _request(running.base, '/checklist')
+            assert status == 200 and [row[1] for row in result['items']] == ['Heater Temp']
+            status, result = _request(running.base, '/checklist?type_id=1')
+            assert status == 200 and result['equipment_type_id'] == 1 and isinstance(result['items'], list)
+            assert _request(running.base, '/qc', {'file_data': {}})[0] == 503
+            assert _request(running.base, '/qc/spec', {'file_data': {}})[0] == 503
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_concurrency_and_metrics():
+    """동시 실행 제한 / 지연 히스토그램 / 연결 풀"""
+    print("\n=== 테스트 2: 동시 실행 제한 / /metrics ===")
+
+    histogram = LatencyHistogram((10, 100))
+    for elapsed in (1, 5, 50, 500):
+        histogram.observe(elapsed)
+    stats = histogram.to_dict()
+    assert stats['buckets'] == {'le_10': 2, 'le_100': 3, 'le_inf': 4}
+    assert stats['p50_ms'] == 10 and stats['max_ms'] == 500 and stats['p99_ms'] == 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'server.sqlite')
+        _create_db(db_path)
+        with _Running(db_path, max_concurrency=1, queue_timeout=0.3) as running:
+            active, peak = [0], [0]
+            lock = threading.Lock()
+
+            def slow(query, body):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.5)
+                with lock:
+                    active[0] -= 1
+                return {'ok': True}
+
+            running.app.routes[('POST', '/slow')] = slow
+            statuses = []
+            threads = [threading.Thread(target=lambda: statuses.append(_request(running.base, '/slow', {})[0]))
+                       for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            # 제한 중에도 /health는 바로 응답
+            assert _request(running.base, '/health')[0] == 200
+            for thread in threads:
+                thread.join()
+            assert peak[0] == 1
+            assert sorted(statuses) == [200, 503, 503], statuses
+
+            for _ in range(5):
+                _request(running.base, '/qc', {'file_data': {'Temp': '15'}})
+                _request(running.base, '/defaultdb/types')
+            status, metrics = _request(running.base, '/metrics')
+            assert status == 200 and metrics['rejected'] == 2 and metrics['max_concurrency'] == 1
+            qc = metrics['routes']['/qc']
+            assert qc['count'] == 5 and qc['status'] == {'200': 5} and qc['buckets']['le_inf'] == 5
+            assert metrics['routes']['/slow']['status'] == {'200': 1, '503': 2}
+            assert metrics['queue_wait']['count'] == 11
+            # 검수는 DB 조회 없음, 조회 요청은 연결 재사용
+            assert metrics['db_pool']['created'] <= 2 and metrics['db_pool']['reused'] >= 5
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_shared_rule_cache():
+    """미리 컴파일한 규칙 = 검수마다 컴파일, /reload 갱신"""
+    print("\n=== 테스트 3: 공유 규칙 캐시 ===")
+
+    from app.qc.qc_inspection_v2 import compile_checklist_rules, get_active_checklist_items, qc_inspection_v2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'rules.sqlite')
+        _create_db(db_path)
+        schema = DBSchema(db_path)
+        with schema.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO QC_Checklist_Items (item_name, spec_min, spec_max, expected_value) VALUES (?, ?, ?, ?)",
+                [(f"Range{i}", str(i), str(i + 10), None) for i in range(200)] +
+                [(f"Enum{i}", None, None, '["A", "B"]') for i in range(50)])
+            conn.commit()
+        items = get_active_checklist_items(schema)
+        rules = compile_checklist_rules(items)
+        file_data = {f"Range{i}": str(i * 2) for i in range(0, 200, 3)}
+        file_data.update({f"Enum{i}": 'AB'[i % 2] if i % 3 else 'C' for i in range(50)}, Temp='9', Mode='auto')
+        cold = qc_inspection_v2(file_data, 7, checklist_items=items, exception_item_ids=[1])
+        warm = qc_inspection_v2(file_data, 7, checklist_items=items, exception_item_ids=[1], compiled_rules=rules)
+        assert warm == cold and cold['failed_count'] > 0
+
+        # QCSpecService: 캐시 전 / 후 결과 동일, 캐시 후 DB 조회 없음
+        spec_service = QCSpecService(schema)
+        for i in range(30):
+            spec_service.add_spec(f"Range{i}", str(i), str(i + 10), severity='HIGH')
+        spec_service.add_spec('Mode', expected_value='AUTO')
+        cold = spec_service.perform_qc_inspection(file_data)
+        assert spec_service.warm_cache() == 31
+        original = schema.execute_query
+        schema.execute_query = lambda *a, **k: (_ for _ in ()).throw(AssertionError("DB 조회"))
+        try:
+            assert spec_service.perform_qc_inspection(file_data) == cold
+        finally:
+            schema.execute_query = original
+        spec_service.update_spec('Mode', expected_value='MANUAL')
+        assert spec_service.get_spec_by_item_name('Mode')['expected_value'] == 'MANUAL'
+
+        with _Running(db_path) as running:
+            compiled = running.app._checklist_rules[1]
+            _request(running.base, '/qc', {'file_data': file_data})
+            assert running.app._checklist_rules[1] is compiled
+            with schema.get_connection() as conn:
+                conn.execute("UPDATE QC_Checklist_Items SET is_active = 0 WHERE item_name = 'Temp'")
+                conn.commit()
+            status, result = _request(running.base, '/reload', {})
+            assert status == 200 and result == {'checklist_items': 251, 'qc_specs': 31}
+            status, result = _request(running.base, '/qc', {'file_data': {'Temp': '99'}})
+            assert result['is_pass'] is True and result['total_count'] == 0
+
+    # serve 명령 등록, 서버 모듈은 tkinter 미사용
+    script = ("import sys; from app import cli, server; "
+              "args = cli.build_parser().parse_args(['serve', '--port', '0', '--max-concurrency', '2']); "
+              "print(args.func is cli.run_serve, args.max_concurrency, 'tkinter' in sys.modules)")
+    output = subprocess.run([sys.executable, '-c', script], cwd=SRC_DIR, capture_output=True, text=True)
+    assert output.stdout.strip() == 'True 2 False', output.stdout + output.stderr
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("로컬 HTTP/JSON 서비스 테스트 시작\n")
+    print("=" * 60)
+
+    test_routes()
+    test_concurrency_and_metrics()
+    test_shared_rule_cache()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+출고 장비 페이지 조회 테스트
+
+ShippedEquipmentService keyset 페이지네이션 테스트
+- 출고 장비 페이지: 출고일 최신순, after_id로 이어 읽기, 필터 / 검색 SQL 처리
+- 개수 조회가 페이지 조건과 일치
+- 파라미터 페이지: 이름 순, after_name으로 이어 읽기, 검색
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _ShippedSchema:
+    """출고 장비 조회에 필요한 테이블만 가진 테스트용 스키마"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE Equipment_Models (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_name TEXT);
+                CREATE TABLE Equipment_Types (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, model_id INTEGER, type_name TEXT);
+                CREATE TABLE Equipment_Configurations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER, configuration_name TEXT);
+                CREATE TABLE Shipped_Equipment (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER,
+                    configuration_id INTEGER, serial_number TEXT UNIQUE, customer_name TEXT,
+                    ship_date DATE, is_refit INTEGER DEFAULT 0, original_serial_number TEXT,
+                    notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE Shipped_Equipment_Parameters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, shipped_equipment_id INTEGER,
+                    parameter_name TEXT, parameter_value TEXT, module TEXT, part TEXT, data_type TEXT,
+                    UNIQUE (shipped_equipment_id, parameter_name));
+                CREATE INDEX idx_shipped_equipment_ship_date
+                    ON Shipped_Equipment(COALESCE(ship_date, ''), id);
+            """)
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _populate(db_schema, count):
+    """모델 2 / 타입 2 / Configuration 2 + 출고 장비 count대 (일부는 출고일 없음, 같은 날짜 다수)"""
+    with db_schema.get_connection() as conn:
+        conn.executemany("INSERT INTO Equipment_Models (model_name) VALUES (?)", [('SX-100',), ('NX-200',)])
+        conn.executemany("INSERT INTO Equipment_Types (model_id, type_name) VALUES (?, ?)",
+                         [(1, '분리형'), (2, '일체형')])
+        conn.executemany("INSERT INTO Equipment_Configurations (type_id, configuration_name) VALUES (?, ?)",
+                         [(1, 'Standard 2P'), (2, 'Custom 4P')])
+        base = date(2024, 1, 1)
+        rows = []
+        for i in range(count):
+            type_id = 1 + i % 2
+            ship_date = None if i % 17 == 0 else (base + timedelta(days=i // 5)).isoformat()
+            customer = ['Samsung Electronics', 'SK Hynix', 'Samsung Display'][i % 3]
+            rows.append((type_id, type_id, f"SN{i:05d}", customer, ship_date))
+        conn.executemany(
+            "INSERT INTO Shipped_Equipment (equipment_type_id, configuration_id, serial_number, "
+            "customer_name, ship_date) VALUES (?, ?, ?, ?, ?)", rows)
+        conn.commit()
+
+
+def _newest_first(equipments):
+    """페이지 정렬 기준: 출고일 최신순, 같은 날짜는 ID 역순"""
+    return sorted(equipments, key=lambda e: (e.ship_date.isoformat() if e.ship_date else '', e.id), reverse=True)
+
+
+def _read_all_pages(service, limit, **filters):
+    result = []
+    after_id = None
+    while True:
+        page = service.get_shipped_equipment_page(after_id=after_id, limit=limit, **filters)
+        result.extend(page)
+        if len(page) < limit:
+            return result
+        after_id = page[-1].id
+
+
+def test_equipment_pages():
+    """출고 장비 페이지 = 전체 목록 (순서 동일)"""
+    print("\n=== 테스트 1: 출고 장비 keyset 페이지 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, 1000)
+        service = ShippedEquipmentService(db_schema)
+
+        everything = _newest_first(service.get_all_shipped_equipment())
+        paged = _read_all_pages(service, 64)
+        assert [e.id for e in paged] == [e.id for e in everything], "출고일 최신순 (출고일 없음은 마지막)"
+        assert len({e.id for e in paged}) == 1000
+        assert paged[-1].ship_date is None and paged[0].ship_date == date(2024, 1, 1) + timedelta(days=199)
+        assert service.count_shipped_equipment() == 1000
+
+        first = service.get_shipped_equipment_page(limit=10)
+        assert len(first) == 10 and first[0].model_name and first[0].configuration_name
+
+        # keyset 페이지는 OFFSET 없이 정렬 인덱스를 사용
+        with db_schema.get_connection() as conn:
+            plan = " ".join(str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM Shipped_Equipment se "
+                "WHERE (COALESCE(se.ship_date, ''), se.id) < ('2024-03-01', 500) "
+                "ORDER BY COALESCE(se.ship_date, '') DESC, se.id DESC LIMIT 10"))
+        assert "idx_shipped_equipment_ship_date" in plan and "TEMP B-TREE" not in plan, plan
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_equipment_filters():
+    """필터 / 검색이 SQL에서 처리되고 개수와 일치"""
+    print("\n=== 테스트 2: 출고 장비 필터 / 검색 / 개수 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, 600)
+        service = ShippedEquipmentService(db_schema)
+        everything = _newest_first(service.get_all_shipped_equipment())
+
+        cases = [
+            ({'configuration_id': 2}, lambda e: e.configuration_id == 2),
+            ({'customer_name': 'Samsung Display'}, lambda e: e.customer_name == 'Samsung Display'),
+            ({'customer_name': 'Samsung'}, lambda e: False),
+            # 출고일 필터는 출고일이 없는 장비를 제외하지 않음 (기존 목록 화면과 동일)
+            ({'start_date': date(2024, 2, 1), 'end_date': date(2024, 2, 10)},
+             lambda e: e.ship_date is None or date(2024, 2, 1) <= e.ship_date <= date(2024, 2, 10)),
+            ({'start_date': date(2024, 3, 1)}, lambda e: e.ship_date is None or e.ship_date >= date(2024, 3, 1)),
+            ({'end_date': date(2024, 1, 5)}, lambda e: e.ship_date is None or e.ship_date <= date(2024, 1, 5)),
+            ({'search_text': 'sn0012'}, lambda e: 'sn0012' in e.serial_number.lower()),
+            ({'search_text': 'hynix'}, lambda e: 'hynix' in e.customer_name.lower()),
+            ({'search_text': 'NX-'}, lambda e: e.model_name == 'NX-200'),
+            ({'search_text': '분리'}, lambda e: e.type_name == '분리형'),
+            ({'search_text': '4p', 'customer_name': 'SK Hynix'},
+             lambda e: e.configuration_name == 'Custom 4P' and e.customer_name == 'SK Hynix'),
+        ]
+        for filters, predicate in cases:
+            expected = [e.id for e in everything if predicate(e)]
+            paged = [e.id for e in _read_all_pages(service, 25, **filters)]
+            assert paged == expected, filters
+            assert service.count_shipped_equipment(**filters) == len(expected), filters
+
+        undated = {e.id for e in everything if e.ship_date is None}
+        filtered = _read_all_pages(service, 25, start_date=date(2024, 2, 1), end_date=date(2024, 2, 10))
+        assert undated and undated <= {e.id for e in filtered}
+
+        assert service.get_customer_names() == ['SK Hynix', 'Samsung Display', 'Samsung Electronics']
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_parameter_pages():
+    """파라미터 페이지 / 검색 / 개수"""
+    print("\n=== 테스트 3: 파라미터 keyset 페이지 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = _ShippedSchema(os.path.join(tmp, 'test.sqlite'))
+        _populate(db_schema, 2)
+        service = ShippedEquipmentService(db_schema)
+
+        for equipment_id in (1, 2):
+            service.add_parameters_bulk(equipment_id, [
+                {'parameter_name': f"P{i:04d}_{'Temp' if i % 3 else 'Press'}",
+                 'parameter_value': str(i * equipment_id),
+                 'module': f"PM{i % 4}", 'part': 'Heater' if i % 5 == 0 else 'Chamber'}
+                for i in range(1234)])
+
+        everything = service.get_parameters_by_equipment(1)
+        assert service.count_parameters(1) == 1234
+
+        paged = []
+        after_name = None
+        while True:
+            page = service.get_parameters_page(1, after_name=after_name, limit=100)
+            paged.extend(page)
+            if len(page) < 100:
+                break
+            after_name = page[-1].parameter_name
+        assert [p.parameter_name for p in paged] == [p.parameter_name for p in everything]
+        assert all(p.shipped_equipment_id == 1 for p in paged)
+
+        for search in ('press', 'heater', 'pm3', '999'):
+            expected = [p.parameter_name for p in everything
+                        if any(search in (v or '').lower()
+                               for v in (p.parameter_name, p.parameter_value, p.module, p.part))]
+            page = service.get_parameters_page(1, limit=5000, search_text=search)
+            assert [p.parameter_name for p in page] == expected, search
+            assert service.count_parameters(1, search) == len(expected), search
+
+        assert service.get_parameters_page(1, after_name=everything[-1].parameter_name) == []
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("출고 장비 페이지 조회 테스트 시작\n")
+    print("=" * 60)
+
+    test_equipment_pages()
+    test_equipment_filters()
+    test_parameter_pages()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+시작 모듈 지연 import 테스트
+
+- app.manager import 시 무거운 라이브러리(pandas, numpy, matplotlib, openpyxl)를 로드하지 않음
+- app.qc 공개 이름은 처음 접근할 때 하위 모듈을 import
+- 시작 시간 리포트(tools/startup_report.py) 측정 결과 형식
+"""
+
+import sys
+import os
+import subprocess
+
+# src 디렉토리를 Python 경로에 추가
+SRC_PATH = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_PATH)
+sys.path.insert(0, os.path.dirname(__file__))
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'openpyxl']
+
+
+def _loaded_after_import(code):
+    """새 프로세스에서 code 실행 후 로드된 무거운 모듈 목록"""
+    script = code + "\nimport sys\nprint(','.join(m for m in %r if m in sys.modules))" % HEAVY_MODULES
+    result = subprocess.run([sys.executable, '-c', script], cwd=SRC_PATH,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+    output = result.stdout.strip().splitlines()
+    return [m for m in output[-1].split(',') if m] if output else []
+
+
+def test_manager_import_is_light():
+    """app.manager import 시 무거운 라이브러리 미로드"""
+    print("\n=== 테스트 1: app.manager 지연 import ===")
+
+    loaded = _loaded_after_import("import app.manager")
+    assert loaded == [], f"시작 시 로드됨: {loaded}"
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_qc_lazy_exports():
+    """app.qc 공개 이름 지연 로드"""
+    print("\n=== 테스트 2: app.qc 지연 export ===")
+
+    loaded = _loaded_after_import("import app.qc")
+    assert 'pandas' not in loaded and 'matplotlib' not in loaded, loaded
+
+    loaded = _loaded_after_import("from app.qc import ChecklistValidator")
+    assert 'pandas' in loaded, "ChecklistValidator 접근 시 checklist_validator 로드"
+
+    import app.qc
+    assert callable(app.qc.qc_inspection_v2), "qc_inspection_v2는 함수로 export"
+    assert app.qc.QCValidator.__name__ == 'QCValidator'
+    assert 'add_qc_check_functions_to_class' in dir(app.qc)
+    try:
+        app.qc.not_exported_name
+        assert False, "정의되지 않은 이름은 AttributeError"
+    except AttributeError:
+        pass
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_startup_report():
+    """시작 시간 리포트 측정"""
+    print("\n=== 테스트 3: 시작 시간 리포트 ===")
+
+    from startup_report import measure_imports
+
+    entries = measure_imports('app.qc.qc_kernel')
+    names = [name for name, _, _, _ in entries]
+    assert 'app.qc.qc_kernel' in names
+    assert 'numpy' in names
+    assert all(self_us >= 0 and cumulative_us >= self_us for _, self_us, cumulative_us, _ in entries)
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("시작 모듈 지연 import 테스트 시작\n")
+    print("=" * 60)
+
+    test_manager_import_is_light()
+    test_qc_lazy_exports()
+    test_startup_report()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Typed Shadow 테스트
+
+값 컬럼 타입 변환 캐시(app.qc.typed_shadow) 및 데이터셋 연동 테스트
+- 숫자/대문자/Boolean 토큰 컬럼 지연 계산
+- DataFrame 컬럼 Shadow 공유
+- 데이터셋 해제 시 메모리 반환
+- 값 범위 고급 분석: 쉼표 값은 숫자로 보지 않음 (float() 변환과 동일)
+"""
+
+import sys
+import os
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import gc
+
+import numpy as np
+import pandas as pd
+
+from app.qc.typed_shadow import TypedShadow, column_shadow, shadow_memory_usage
+from app.qc.qc_kernel import QCRule, compile_rules, evaluate, KIND_BOOLEAN, KIND_RANGE
+from app.dataset import ComparisonDataset
+
+
+def test_lazy_columns():
+    """파생 컬럼 지연 계산"""
+    print("\n=== 테스트 1: 파생 컬럼 지연 계산 ===")
+
+    shadow = TypedShadow(['1.5', 'on', 'abc', None, '1,000'], strip_commas=True)
+    assert shadow.nbytes == 0, "접근 전에는 계산하지 않음"
+
+    assert np.allclose(shadow.numeric[[0, 4]], [1.5, 1000.0])
+    assert shadow.nan_mask.tolist() == [False, True, True, True, False]
+    assert shadow.upper.tolist() == ['1.5', 'ON', 'ABC', 'NONE', '1,000']
+    assert shadow.bool_tokens.tolist() == [-1, 1, -1, -1, -1]
+    assert shadow.nbytes > 0
+
+    subset = shadow.take([1, 0])
+    assert subset.values == ['on', '1.5']
+    assert subset.bool_tokens.tolist() == [1, -1]
+    assert subset.upper[0] is shadow.upper[1], "원본 변환 결과를 공유해야 합니다"
+
+    shadow.release()
+    assert shadow.nbytes == 0
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_kernel_uses_shadow():
+    """QC 커널이 Shadow 변환 결과를 재사용"""
+    print("\n=== 테스트 2: 커널 Shadow 재사용 ===")
+
+    rules = compile_rules([
+        QCRule(key='Temp', kind=KIND_RANGE, min_value=0, max_value=10),
+        QCRule(key='Fan', kind=KIND_BOOLEAN, expected='OFF'),
+    ])
+    shadow = TypedShadow(['5', 'disabled'])
+    result = evaluate(['Temp', 'Fan'], shadow.values, rules, shadow=shadow)
+
+    assert result.is_valid.tolist() == [True, True]
+    assert result.numeric is shadow.numeric, "변환 결과를 공유해야 합니다"
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_column_shadow_shared():
+    """동일 DataFrame 컬럼 Shadow 공유 및 자동 해제"""
+    print("\n=== 테스트 3: DataFrame 컬럼 Shadow 공유 ===")
+
+    df = pd.DataFrame({'default_value': ['1', '2', 'x']})
+    first = column_shadow(df, 'default_value')
+    second = column_shadow(df, 'default_value')
+    assert first is second
+    first.numeric
+    assert shadow_memory_usage() >= first.nbytes > 0
+
+    del df, first, second
+    gc.collect()
+    assert shadow_memory_usage() == 0, "DataFrame 해제 시 Shadow도 해제"
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_dataset_memory():
+    """데이터셋 메모리 집계 및 해제"""
+    print("\n=== 테스트 4: 데이터셋 메모리 ===")
+
+    dataset = ComparisonDataset()
+    for name in ('A', 'B'):
+        frame = pd.DataFrame({
+            'Module': ['M', 'M'], 'Part': ['P', 'P'],
+            'ItemName': ['Gain', 'Mode'], 'ItemValue': ['1.0', 'ON']
+        })
+        dataset.add_file(name, frame)
+
+    assert dataset.file_names == ['A', 'B']
+    assert len(dataset.merged_df) == 4
+    assert set(dataset.merged_df['Model']) == {'A', 'B'}
+
+    file_data, shadow = dataset.get_file('A').file_data_with_shadow()
+    assert file_data == {'Gain': '1.0', 'Mode': 'ON'}
+    assert shadow.numeric[0] == 1.0
+
+    usage = dataset.memory_usage()
+    assert usage['shadows'] > 0
+    assert usage['total'] == usage['frames'] + usage['shadows'] + usage['merged']
+
+    dataset.clear()
+    assert len(dataset) == 0
+    assert dataset.memory_usage()['total'] == 0
+
+    print("[OK] 테스트 4 통과")
+
+
+def test_value_ranges_skip_comma_values():
+    """값 범위 고급 분석은 '1,000' 같은 쉼표 값을 건너뜀"""
+    print("\n=== 테스트 5: 값 범위 분석 쉼표 값 ===")
+
+    from app.enhanced_qc import EnhancedQCValidator
+
+    df = pd.DataFrame({
+        'parameter_name': ['Comma.Default', 'Comma.Max', 'Plain'],
+        'min_spec': ['0', '0', '0'],
+        'max_spec': ['100', '1,000', '1000'],
+        'default_value': ['1,000', '50', '1'],
+    })
+    # 다른 검사가 쉼표를 제거한 Shadow를 먼저 만들어도 영향 없음
+    assert column_shadow(df, 'default_value', strip_commas=True).numeric[0] == 1000.0
+
+    results = EnhancedQCValidator.check_value_ranges(df, 'Test')
+    assert {r['parameter'] for r in results} == {'Plain'}, results
+    assert {r['issue_type'] for r in results} == {'범위 과도', '기본값 위치 부적절'}
+
+    print("[OK] 테스트 5 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("Typed Shadow 테스트 시작\n")
+    print("=" * 60)
+
+    test_lazy_columns()
+    test_kernel_uses_shadow()
+    test_column_shadow_shared()
+    test_dataset_memory()
+    test_value_ranges_skip_comma_values()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (5/5)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+뷰 데이터 모델 테스트
+
+app.view_model.TableModel / ComparisonPivot.table_model 테스트
+- 컬럼 배열 / DataFrame + 표시 행(필터 마스크) 추출
+- Pivot 모델: 정렬 순서, 뷰 표시 행 키, 모델 생성 후 Pivot 변경과 독립
+- 비교 뷰 view_model(): 트리 위젯 없이 표시 행으로 모델 구성 → 내보내기
+"""
+
+import sys
+import os
+import tempfile
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from app.view_model import TableModel
+from app.dataset import ComparisonDataset
+from app.comparison_incremental import add_incremental_comparison_functions_to_class
+from app.services.common.export_service import write_export
+
+
+def _frame(rows):
+    """(Module, Part, ItemName, ItemValue) 목록 → DataFrame"""
+    return pd.DataFrame(rows, columns=['Module', 'Part', 'ItemName', 'ItemValue'])
+
+
+def test_table_model():
+    """컬럼 배열 / DataFrame 모델과 필터"""
+    print("\n=== 테스트 1: TableModel ===")
+
+    columns = {'name': ['a', 'b', 'c', 'd'], 'value': np.array([1.5, 2.0, np.nan, 4.0])}
+    model = TableModel(columns)
+    assert len(model) == model.row_count == 4
+    assert model.column_names == ['name', 'value']
+
+    filtered = TableModel.from_mask(columns, np.array([True, False, True, True]))
+    assert len(filtered) == 3 and filtered.row_count == 4
+    visible = filtered.visible_columns()
+    assert visible['name'] == ['a', 'c', 'd']
+    assert visible['value'].tolist()[0] == 1.5
+
+    # 표시 행 순서 = 정렬 순서
+    reordered = model.with_rows([3, 0])
+    assert reordered.records() == [{'name': 'd', 'value': 4.0}, {'name': 'a', 'value': 1.5}]
+    assert reordered.select(['value']).column_names == ['value']
+    assert TableModel.from_mask(columns, [False, True, False, False]).records() == [{'name': 'b', 'value': 2.0}]
+
+    frame = pd.DataFrame(columns)
+    frame_model = TableModel.from_mask(frame, (frame['value'] > 1.8).to_numpy())
+    assert len(frame_model) == 2
+    assert frame_model.visible_columns()['name'].tolist() == ['b', 'd']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.csv')
+        write_export(path, [filtered.export_sheet()])
+        with open(path, encoding='utf-8-sig') as handle:
+            assert handle.read().splitlines() == ['name,value', 'a,1.5', 'c,', 'd,4.0']
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_pivot_table_model():
+    """Pivot 모델: 정렬 순서 / 표시 행 키 / 스냅샷"""
+    print("\n=== 테스트 2: Pivot 표 모델 ===")
+
+    dataset = ComparisonDataset()
+    dataset.append_file('A', _frame([('M', 'Q', 'z', '1'), ('M', 'P', 'b', '2')]))
+    dataset.append_file('B', _frame([('M', 'P', 'b', '3'), ('L', 'P', 'a', '9')]))
+    pivot = dataset.pivot
+
+    model = pivot.table_model(['B', 'A'])
+    assert model.column_names == ['Module', 'Part', 'ItemName', 'B', 'A']
+    records = model.records()
+    assert [(r['Module'], r['Part'], r['ItemName']) for r in records] == pivot.sorted_keys()
+    assert records[0] == {'Module': 'L', 'Part': 'P', 'ItemName': 'a', 'B': '9', 'A': None}
+
+    # 뷰에 표시 중인 키만 (차이점 분석 뷰처럼)
+    diff_keys = {key for key in pivot.sorted_keys() if pivot.has_difference(key)}
+    diff_model = pivot.table_model(visible_keys=diff_keys)
+    assert diff_model.records() == [{'Module': 'M', 'Part': 'P', 'ItemName': 'b', 'A': '2', 'B': '3'}]
+
+    # 모델을 만든 뒤 파일이 추가/제거되어도 모델 값은 그대로
+    dataset.append_file('C', _frame([('K', 'P', 'new', '5')]))
+    dataset.remove_file('A')
+    assert len(model) == 3 and model.records()[2]['A'] == '1'
+    assert [r['ItemName'] for r in pivot.table_model().records()] == ['new', 'a', 'b']
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_view_model_without_tk():
+    """비교 뷰 view_model(): 트리 위젯을 읽지 않음"""
+    print("\n=== 테스트 3: 비교 뷰 모델 ===")
+
+    class _Manager:
+        """비교 뷰 상태만 가진 DBManager 대용 (트리 위젯 없음)"""
+
+    add_incremental_comparison_functions_to_class(_Manager)
+    manager = _Manager()
+    manager.dataset = ComparisonDataset()
+    rows = [('M', f"P{i % 7}", f"Item{i:05d}", str(i)) for i in range(100000)]
+    manager.dataset.append_file('A', _frame(rows))
+    manager.dataset.append_file('B', _frame([(m, p, n, v if i % 10 else 'x') for i, (m, p, n, v) in enumerate(rows)]))
+    manager.file_names = ['A', 'B']
+
+    # 뷰가 아직 없으면 전체 행
+    assert len(manager.view_model('report')) == 100000
+
+    # 뷰의 표시 행 키 (트리 항목 ID는 사용하지 않음)
+    pivot = manager.dataset.pivot
+    manager._diff_only_rows = {key: None for key in pivot.sorted_keys() if pivot.has_difference(key)}
+    model = manager.view_model('diff_only')
+    assert len(model) == 10000
+    assert all(record['B'] == 'x' for record in model.records())
+
+    # 메인 비교 탭 고급 필터 결과가 있으면 그 모델
+    frame = manager.dataset.merged_df
+    manager._grid_filter_model = TableModel.from_mask(frame, (frame['Part'] == 'P0').to_numpy())
+    assert len(manager.view_model('grid')) == len(frame[frame['Part'] == 'P0'])
+
+    # 고급 필터 결과를 표시 중이면 파일 추가 / 제거는 전체 갱신 (필터 트리에는 증분 행 맵이 없음)
+    refreshed = []
+    manager.update_all_tabs = lambda: refreshed.append(True)
+    manager._grid_rows = {}
+    manager._apply_pivot_delta(manager.dataset.append_file('C', _frame(rows[:10])))
+    assert refreshed == [True]
+    manager.dataset.remove_file('C')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'diff.xlsx')
+        write_export(path, [model.export_sheet('차이점')])
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        rows = list(workbook['차이점'].values)
+        workbook.close()
+        assert len(rows) == 10001 and rows[0] == ('Module', 'Part', 'ItemName', 'A', 'B')
+
+    print("[OK] 테스트 3 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("뷰 데이터 모델 테스트 시작\n")
+    print("=" * 60)
+
+    test_table_model()
+    test_pivot_table_model()
+    test_view_model_without_tk()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (3/3)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+백그라운드 쓰기 큐 테스트
+
+app.services.common.write_queue 테스트
+- 그룹 커밋: 대기 중인 작업을 한 트랜잭션으로 묶고 결과는 커밋 후 전달
+- 작업 안의 서비스 호출은 쓰기 연결 사용 (commit 무시, 실패 시 작업만 롤백)
+- 같은 key 작업 병합, Tk 콜백 전달 (after 폴링), 쓰기 중 WAL 스냅샷 읽기
+- 변경 + 감사 로그 작업의 원자성, 쓰기 큐가 없을 때 동기 실행 (run_write_now)
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from db_schema import DBSchema
+from app.services.common.write_queue import DatabaseWriter, run_write_now, writer_connection
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+
+class _FakeRoot:
+    """root.after()만 흉내 내는 Tk 대용 (폴링 함수를 직접 실행)"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for func in scheduled:
+            func()
+
+
+def _count(db_schema, table):
+    with db_schema.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _add_type(db_schema, name):
+    with db_schema.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO Equipment_Types (type_name) VALUES (?)", (name,))
+        conn.commit()
+        return cursor.lastrowid
+
+
+def _add_configuration(db_schema):
+    with db_schema.get_connection() as conn:
+        conn.execute("INSERT INTO Equipment_Configurations (type_id, configuration_name) VALUES (1, 'Standard')")
+        conn.commit()
+
+
+def test_group_commit():
+    """그룹 커밋 + 작업 안의 서비스 호출"""
+    print("\n=== 테스트 1: 그룹 커밋 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        _add_configuration(db_schema)
+        writer = DatabaseWriter(db_schema.db_path, max_batch_seconds=5)
+        try:
+            gate = threading.Event()
+            writer.submit(gate.wait)
+            futures = [writer.submit(_add_type, db_schema, f"Type{i}") for i in range(50)]
+            assert writer.pending_count >= 49
+            gate.set()
+            ids = [future.result(10) for future in futures]
+            assert sorted(ids) == list(range(1, 51)), ids
+
+            stats = writer.get_stats()
+            assert stats['jobs'] == 51 and stats['failed'] == 0
+            assert stats['commits'] <= 3, stats
+            assert _count(db_schema, 'Equipment_Types') == 50
+
+            # 장비 생성 + 파라미터 삽입을 한 작업으로 (서비스 코드 변경 없이 쓰기 연결 사용)
+            def import_equipment():
+                assert writer_connection(db_schema.db_path) is not None
+                equipment_id = service.create_shipped_equipment(
+                    equipment_type_id=1, configuration_id=1, serial_number='SN001', customer_name='Samsung')
+                return equipment_id, service.add_parameters_bulk(equipment_id, [
+                    {'parameter_name': f"PM1.Part.Item{i}", 'parameter_value': str(i)} for i in range(100)])
+
+            equipment_id, count = writer.submit(import_equipment).result(10)
+            assert count == 100
+            assert len(service.get_parameters_by_equipment(equipment_id)) == 100
+            assert writer_connection(db_schema.db_path) is None, "메인 스레드는 새 연결 사용"
+
+            with db_schema.get_connection() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        finally:
+            writer.close()
+
+        try:
+            writer.submit(lambda: None)
+            assert False, "종료 후 submit은 RuntimeError"
+        except RuntimeError:
+            pass
+
+    print("[OK] 테스트 1 통과")
+
+
+def test_job_failure_isolation():
+    """실패한 작업만 롤백 (같은 그룹의 다른 작업은 커밋)"""
+    print("\n=== 테스트 2: 작업 실패 격리 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        service = ShippedEquipmentService(db_schema)
+        _add_configuration(db_schema)
+        writer = DatabaseWriter(db_schema.db_path, max_batch_seconds=5)
+        errors = []
+        try:
+            def failing_job():
+                _add_type(db_schema, "Rolled.Back")
+                raise ValueError("작업 오류")
+
+            def swallowed_rollback():
+                # 작업 안의 rollback()은 작업 시작 지점까지만 (앞선 작업은 유지)
+                with db_schema.get_connection() as conn:
+                    conn.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Undone')")
+                    conn.rollback()
+                return 'ok'
+
+            gate = threading.Event()
+            writer.submit(gate.wait)
+            first = writer.submit(_add_type, db_schema, "Kept.1")
+            failed = writer.submit(failing_job, error_callback=errors.append)
+            undone = writer.submit(swallowed_rollback)
+            last = writer.submit(_add_type, db_schema, "Kept.2")
+            gate.set()
+
+            assert first.result(10) and last.result(10) and undone.result(10) == 'ok'
+            try:
+                failed.result(10)
+                assert False, "실패한 작업의 Future는 예외"
+            except ValueError:
+                pass
+            assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+            with db_schema.get_connection() as conn:
+                names = [row[0] for row in conn.execute("SELECT type_name FROM Equipment_Types ORDER BY id")]
+            assert names == ["Kept.1", "Kept.2"], names
+            assert writer.get_stats()['failed'] == 1
+
+            # 서비스의 중복 키 오류 → 장비 생성까지 함께 취소
+            def import_duplicate():
+                equipment_id = service.create_shipped_equipment(
+                    equipment_type_id=1, configuration_id=1, serial_number='SN-DUP', customer_name='Hynix')
+                parameter = {'parameter_name': 'PM1.Item', 'parameter_value': '1'}
+                service.add_parameters_bulk(equipment_id, [parameter])
+                service.add_parameters_bulk(equipment_id, [parameter])
+
+            try:
+                writer.submit(import_duplicate).result(10)
+                assert False, "중복 키는 IntegrityError"
+            except sqlite3.IntegrityError:
+                pass
+            assert _count(db_schema, 'Shipped_Equipment') == 0
+            assert _count(db_schema, 'Shipped_Equipment_Parameters') == 0
+
+            # 작업 안에서 다시 submit → 같은 트랜잭션에서 바로 실행
+            nested = writer.submit(lambda: writer.submit(_add_type, db_schema, "Nested").result(0)).result(10)
+            with db_schema.get_connection() as conn:
+                assert conn.execute("SELECT type_name FROM Equipment_Types WHERE id = ?", (nested,)).fetchone()[0] == "Nested"
+        finally:
+            writer.close()
+
+    print("[OK] 테스트 2 통과")
+
+
+def test_coalescing_callbacks_and_wal_reads():
+    """같은 key 병합, Tk 콜백 전달, 쓰기 중 읽기"""
+    print("\n=== 테스트 3: 병합 / Tk 콜백 / WAL 읽기 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        type_id = _add_type(db_schema, "Type")
+        writer = DatabaseWriter(db_schema.db_path)
+        root = _FakeRoot()
+        writer.attach_tk(root)
+        try:
+            calls = []
+
+            def set_description(text):
+                calls.append(text)
+                with db_schema.get_connection() as conn:
+                    conn.execute("UPDATE Equipment_Types SET description = ? WHERE id = ?", (text, type_id))
+                    conn.commit()
+                return text
+
+            received = []
+            ui_threads = []
+
+            def on_done(result):
+                received.append(result)
+                ui_threads.append(threading.current_thread())
+
+            gate = threading.Event()
+            writer.submit(gate.wait)
+            futures = [writer.submit(set_description, f"v{i}", key=('type', type_id), callback=on_done)
+                       for i in range(5)]
+            gate.set()
+            assert [future.result(10) for future in futures] == ["v4"] * 5
+            assert calls == ["v4"], "병합된 작업은 마지막 내용으로 한 번만 실행"
+            assert writer.get_stats()['coalesced'] == 4
+
+            # 콜백은 폴링(Tk 메인 스레드)에서 실행
+            assert received == []
+            root.run_pending()
+            assert received == ["v4"] * 5 and set(ui_threads) == {threading.current_thread()}
+
+            # 쓰기 작업이 진행 중이어도 읽기는 마지막 커밋 스냅샷을 바로 읽음
+            inserted = threading.Event()
+            release = threading.Event()
+
+            def long_import():
+                _add_type(db_schema, "Importing")
+                inserted.set()
+                release.wait(10)
+
+            future = writer.submit(long_import)
+            assert inserted.wait(10)
+            assert _count(db_schema, 'Equipment_Types') == 1, "커밋 전 행은 보이지 않음"
+            release.set()
+            future.result(10)
+            assert _count(db_schema, 'Equipment_Types') == 2
+        finally:
+            writer.close()
+
+    print("[OK] 테스트 3 통과")
+
+
+def test_audit_log_jobs_and_sync_fallback():
+    """변경 + 감사 로그를 한 작업으로, 쓰기 큐가 없을 때 바로 실행"""
+    print("\n=== 테스트 4: 감사 로그 작업 / 동기 실행 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_schema = DBSchema(os.path.join(tmp, 'test.sqlite'))
+        type_id = _add_type(db_schema, "Type")
+
+        def delete_with_audit(action):
+            # 다이얼로그 작업과 같은 형태: 변경 + Checklist_Audit_Log 기록 후 commit
+            with db_schema.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM Equipment_Types WHERE id = ?", (type_id,))
+                cursor.execute("""
+                    INSERT INTO Checklist_Audit_Log
+                    (action, target_table, target_id, reason, user, timestamp)
+                    VALUES (?, ?, ?, ?, ?, datetime('now'))
+                """, (action, "Equipment_Types", type_id, "삭제", "Admin"))
+                conn.commit()
+            return action
+
+        writer = DatabaseWriter(db_schema.db_path)
+        root = _FakeRoot()
+        writer.attach_tk(root)
+        try:
+            results, errors = [], []
+
+            # 감사 로그 기록이 실패하면 변경도 함께 취소
+            future = writer.submit(delete_with_audit, "BAD", callback=results.append,
+                                   error_callback=errors.append)
+            try:
+                future.result(10)
+                assert False, "CHECK 제약 위반은 작업 실패"
+            except sqlite3.IntegrityError:
+                pass
+            assert _count(db_schema, 'Equipment_Types') == 1
+            assert _count(db_schema, 'Checklist_Audit_Log') == 0
+
+            writer.submit(delete_with_audit, "REMOVE", callback=results.append,
+                          error_callback=errors.append).result(10)
+            assert _count(db_schema, 'Equipment_Types') == 0
+            assert _count(db_schema, 'Checklist_Audit_Log') == 1
+
+            root.run_pending()
+            assert results == ["REMOVE"] and len(errors) == 1
+        finally:
+            writer.close()
+
+        # 쓰기 큐 없이: 결과 / 예외를 콜백으로 바로 전달, error_callback이 없으면 예외 전파
+        results, errors = [], []
+        assert run_write_now(lambda x: x * 2, 21, callback=results.append) == 42 and results == [42]
+        assert run_write_now(lambda: 1 / 0, error_callback=errors.append) is None
+        assert isinstance(errors[0], ZeroDivisionError)
+        try:
+            run_write_now(lambda: 1 / 0)
+            assert False, "error_callback이 없으면 예외 전파"
+        except ZeroDivisionError:
+            pass
+
+    print("[OK] 테스트 4 통과")
+
+
+def main():
+    """메인 테스트 실행"""
+    print("백그라운드 쓰기 큐 테스트 시작\n")
+    print("=" * 60)
+
+    test_group_commit()
+    test_job_failure_isolation()
+    test_coalescing_callbacks_and_wal_reads()
+    test_audit_log_jobs_and_sync_fallback()
+
+    print("\n" + "=" * 60)
+    print("[SUCCESS] 모든 테스트 통과 (4/4)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()